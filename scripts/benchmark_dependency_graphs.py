@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark visualising synthetic dependency graphs.
+
+Graphs of 100 to 5000 nodes are generated, where each package depends on
+a few packages generated before it, so that many dependencies are shared.
+
+Timed are converting the graph into a GraphViz Digraph, the built-in
+layered layout (from scratch, and relaid out from a previous layout), and
+laying out with GraphViz's dot, if it can be found on the PATH.
+"""
+
+import argparse
+import functools
+import random
+import shutil
+import subprocess
+import timeit
+import typing
+
+from cruiz.svggraph import DependenciesToDigraph
+
+from cruizlib.graph.layout import LayeredLayout
+from cruizlib.graph.traversal import DepthFirstTraversal
+from cruizlib.interop.dependencygraph import DependencyGraph, DependencyGraphBuilder
+
+# approximate size of a drawn node
+NODE_SIZE = (160.0, 40.0)
+
+
+def make_synthetic_graph(node_count: int, seed: int = 0) -> DependencyGraph:
+    """Make a synthetic DAG rooted at node 0."""
+    rng = random.Random(seed)
+    builder = DependencyGraphBuilder()
+    for index in range(node_count):
+        builder.add_node(
+            f"pkg{index}",
+            f"pkg{index}/1.0@user/channel",
+            f"{index:040x}",
+            f"{index:032x}",
+            False,
+            None,
+            rng.random() > 0.1,
+            "build",
+        )
+    for index in range(1, node_count):
+        for parent in {rng.randrange(index) for _ in range(3)}:
+            builder.add_edge(parent, index)
+    return builder.build(0)
+
+
+def builtin_layout(
+    graph: DependencyGraph, previous: typing.Optional[LayeredLayout] = None
+) -> LayeredLayout:
+    """Lay out the graph with the built-in layered layout."""
+    traversal = DepthFirstTraversal(graph)
+    layout = LayeredLayout(
+        graph.node_count,
+        traversal.edges,
+        [node.reference for node in graph.nodes],
+        previous,
+    )
+    layout.coordinates([NODE_SIZE] * graph.node_count)
+    return layout
+
+
+def dot_layout(graph: DependencyGraph, dot: str) -> None:
+    """Lay out the graph with GraphViz's dot."""
+    source = DependenciesToDigraph(graph, "TB").digraph.source
+    subprocess.run(
+        [dot, "-Tsvg"], input=source.encode("utf-8"), capture_output=True, check=True
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 500, 1000, 2500, 5000],
+        help="Number of nodes in each synthetic graph",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    parser.add_argument(
+        "--no-dot", action="store_true", help="Do not time GraphViz's dot"
+    )
+    args = parser.parse_args()
+    dot = None if args.no_dot else shutil.which("dot")
+    print(
+        f"{'nodes':>8} {'edges':>8} {'digraph':>10} {'built-in':>10} "
+        f"{'relayout':>10} {'dot':>10}"
+    )
+
+    def _best(function: typing.Callable[[], typing.Any]) -> float:
+        return min(timeit.repeat(function, number=1, repeat=args.repeat))
+
+    for size in args.sizes:
+        graph = make_synthetic_graph(size)
+        edge_count = sum(1 for _ in graph.edges())
+        digraph_seconds = _best(functools.partial(DependenciesToDigraph, graph, "TB"))
+        builtin_seconds = _best(functools.partial(builtin_layout, graph))
+        relayout_seconds = _best(
+            functools.partial(builtin_layout, graph, builtin_layout(graph))
+        )
+        dot_seconds = (
+            f"{_best(functools.partial(dot_layout, graph, dot)):>10.4f}"
+            if dot
+            else f"{'n/a':>10}"
+        )
+        print(
+            f"{size:>8} {edge_count:>8} {digraph_seconds:>10.4f} "
+            f"{builtin_seconds:>10.4f} {relayout_seconds:>10.4f} {dot_seconds}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""Generated file containing the version number."""
+
+__version__ = "0.0.0"
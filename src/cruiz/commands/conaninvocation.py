@@ -65,10 +65,21 @@ class ConanInvocation(QtCore.QObject):
         self._thread.finished.connect(self.finished)
         self._process: typing.Optional[multiprocessing.context.SpawnProcess] = None
         self._last_command_running: bool = False  # TODO: remove this
+        self._continuation: typing.Optional[
+            typing.Callable[[typing.Any, typing.Any], None]
+        ] = None
+        self._partial_continuation: typing.Optional[
+            typing.Callable[[typing.Any], None]
+        ] = None
         self._cleanup_thread: typing.Optional[threading.Thread] = None
 
         self._thread.start()
 
+    @property
+    def running(self) -> bool:
+        """Is a child process running, and not yet closed?."""
+        return self._process is not None
+
     def close(self) -> None:
         """Tidy up any resources on the context that need closing."""
         if self._process:
@@ -78,6 +89,17 @@ class ConanInvocation(QtCore.QObject):
         self._queue_processor.stop()
         self._thread.wait()
 
+    # continuations are called from slots of this object, so that they are run on the
+    # thread owning it, as callables such as functools.partial, which are not
+    # slots of a QObject, would otherwise be run on the message processing thread
+    def _call_continuation(self, result: typing.Any, exception: typing.Any) -> None:
+        assert self._continuation
+        self._continuation(result, exception)
+
+    def _call_partial_continuation(self, result: typing.Any) -> None:
+        assert self._partial_continuation
+        self._partial_continuation(result)
+
     def _disconnect_signal(self, result: typing.Any, exception: typing.Any) -> None:
         # pylint: disable=unused-argument
         self._queue_processor.completed.disconnect()
@@ -105,17 +127,33 @@ class ConanInvocation(QtCore.QObject):
         ],
         log_details: LogDetails,
         continuation: typing.Optional[typing.Callable[[typing.Any, typing.Any], None]],
+        partial_continuation: typing.Optional[
+            typing.Callable[[typing.Any], None]
+        ] = None,
     ) -> None:
-        """Invoke a command, with optional continuation."""
+        """
+        Invoke a command, with optional continuation.
+
+        An optional partial continuation receives any intermediate results, before
+        the continuation.
+        """
         assert self._process is None
 
         if continuation:
-            self._queue_processor.completed.connect(continuation)
+            self._continuation = continuation
+            self._queue_processor.completed.connect(self._call_continuation)
+        if partial_continuation:
+            self._partial_continuation = partial_continuation
+            self._queue_processor.partial_result.connect(
+                self._call_partial_continuation
+            )
         self._queue_processor.completed.connect(self._disconnect_signal)
 
         self._queue_processor.stdout_message.connect(log_details.stdout)
         self._queue_processor.stderr_message.connect(log_details.stderr)
         self._queue_processor.conan_log_message.connect(log_details.conan_log)
+        self._queue_processor.diagnostics.connect(log_details.diagnostics)
+        self._queue_processor.build_progress.connect(log_details.progress)
         self._queue_processor.critical_failure.connect(self._critical_failure)
         with GeneralSettingsReader() as settings:
             clear_panes = settings.clear_panes.resolve()
@@ -123,6 +161,8 @@ class ConanInvocation(QtCore.QObject):
             log_details.output.clear()
             if log_details.error:
                 log_details.error.clear()
+            if log_details.problems is not None:
+                log_details.problems.clear()
 
         process = self._mp_context.Process(
             target=parameters.worker,
@@ -28,9 +28,9 @@ from .conaninvocation import ConanInvocation
 
 if typing.TYPE_CHECKING:
     from cruizlib.commands.conanconf import ConanConfigBoolean
+    from cruizlib.interop.dependencygraph import PackageNodeLike
     from cruizlib.interop.packagebinaryparameters import PackageBinaryParameters
     from cruizlib.interop.packageidparameters import PackageIdParameters
-    from cruizlib.interop.packagenode import PackageNode
     from cruizlib.interop.packagerevisionsparameters import PackageRevisionsParameters
     from cruizlib.interop.pod import ConanHook, ConanRemote
     from cruizlib.interop.reciperevisionsparameters import RecipeRevisionsParameters
@@ -113,7 +113,10 @@ class ConanContext(QtCore.QObject):
         command_toolbar: typing.Optional[QtWidgets.QWidget],
         continuation: typing.Optional[typing.Callable[[typing.Any, typing.Any], None]],
         enable_history: bool = True,
-    ) -> None:
+        partial_continuation: typing.Optional[
+            typing.Callable[[typing.Any], None]
+        ] = None,
+    ) -> ConanInvocation:
         added_environment, removed_environment = get_conan_env(self.cache_name)
         parameters.added_environment.update(added_environment)
         parameters.removed_environment.extend(removed_environment)
@@ -122,7 +125,9 @@ class ConanContext(QtCore.QObject):
         instance.finished.connect(self._finished_invocation)
         if command_toolbar:
             instance.finished.connect(command_toolbar.command_ended)  # type: ignore[attr-defined] # noqa: E501
-        instance.invoke(parameters, self._log_details, continuation)
+        instance.invoke(
+            parameters, self._log_details, continuation, partial_continuation
+        )
         self._invocations.append(instance)
         if self.command_history_widget is not None and enable_history:
             # TODO: prefer adding to a model?
@@ -135,6 +140,7 @@ class ConanContext(QtCore.QObject):
                 != self.command_history_widget.item(history_count - 1).text()
             ):
                 self.command_history_widget.addItem(item)
+        return instance
 
     def _completed_invocation(self, success: typing.Any, exception: typing.Any) -> None:
         # pylint: disable=unused-argument
@@ -159,13 +165,22 @@ class ConanContext(QtCore.QObject):
         continuation: typing.Optional[
             typing.Callable[[typing.Any, typing.Any], None]
         ] = None,
+        partial_continuation: typing.Optional[
+            typing.Callable[[typing.Any], None]
+        ] = None,
     ) -> None:
         """
         Run a conan command.
 
         Use parameters as provided, and a continuation if further processing is needed.
+        A partial continuation receives any intermediate results before then.
         """
-        self._start_invocation(params, command_toolbar, continuation)
+        self._start_invocation(
+            params,
+            command_toolbar,
+            continuation,
+            partial_continuation=partial_continuation,
+        )
 
     def cmakebuildcommand(
         self,
@@ -311,11 +326,20 @@ class ConanContext(QtCore.QObject):
             PackageBinaryParameters,
         ],
         continuation: typing.Optional[typing.Callable[[typing.Any, typing.Any], None]],
-    ) -> None:
-        """Perform one of the actions to get package details from a remote."""
-        self._start_invocation(params, None, continuation)
+        partial_continuation: typing.Optional[
+            typing.Callable[[typing.Any], None]
+        ] = None,
+    ) -> ConanInvocation:
+        """
+        Perform one of the actions to get package details from a remote.
 
-    def get_package_directory(self, pkgdata: PackageNode) -> pathlib.Path:
+        The invocation is returned, so that it can be cancelled individually.
+        """
+        return self._start_invocation(
+            params, None, continuation, partial_continuation=partial_continuation
+        )
+
+    def get_package_directory(self, pkgdata: PackageNodeLike) -> pathlib.Path:
         """Get the package directory for the specified package."""
         package_dir, exception = self._meta_invocation.request_data(
             "package_dir",
@@ -339,6 +363,12 @@ class ConanContext(QtCore.QObject):
                 invocation.close()
             self.cancelled.emit()
 
+    def cancel_invocation(self, invocation: ConanInvocation) -> None:
+        """Cancel a single running worker thread, leaving any others running."""
+        if invocation in self._invocations and invocation.running:
+            invocation.cancel()
+            invocation.close()
+
     def conan_version(self) -> str:
         """Get the Conan version."""
         version, exception = self._meta_invocation.request_data("version")
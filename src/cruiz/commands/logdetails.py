@@ -2,17 +2,26 @@
 
 """Logging details."""
 
+from __future__ import annotations
+
 import typing
 
 from PySide6 import QtCore, QtWidgets
 
 from .guardedlisttoflush import GuardedListToFlush
 
+if typing.TYPE_CHECKING:
+    from cruiz.model.problemsmodel import ProblemsModel
+
+    from cruizlib.commands.buildprogress import BuildProgress
+    from cruizlib.commands.diagnostics import Diagnostic
+
 
 class LogDetails(QtCore.QObject):
     """Representation of how and where to perform logging during commands."""
 
     logging = QtCore.Signal()
+    build_progress = QtCore.Signal(object)
 
     def __init__(
         self,
@@ -21,6 +30,7 @@ class LogDetails(QtCore.QObject):
         combined: bool,
         batched: bool,
         conan_log: typing.Optional[QtWidgets.QPlainTextEdit],
+        problems: typing.Optional[ProblemsModel] = None,
     ) -> None:
         """Initialise a LogDetails."""
         super().__init__()
@@ -34,6 +44,7 @@ class LogDetails(QtCore.QObject):
             self._stdout_list = GuardedListToFlush() if batched else None
             self._stderr_list = GuardedListToFlush() if batched else None
         self._conan_log = conan_log
+        self.problems = problems
 
     def start(self) -> None:
         """Start logging."""
@@ -72,3 +83,12 @@ class LogDetails(QtCore.QObject):
         """Append a Conan log message."""
         if self._conan_log:
             self._conan_log.appendPlainText(text)
+
+    def diagnostics(self, found: typing.List[Diagnostic]) -> None:
+        """Record diagnostics extracted from the output."""
+        if self.problems is not None:
+            self.problems.append(found)
+
+    def progress(self, progress: BuildProgress) -> None:
+        """Record the progress of a build."""
+        self.build_progress.emit(progress)
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+
+"""Utilities for drawing Conan dependency graphs with the built-in layout."""
+
+from __future__ import annotations
+
+import math
+import threading
+import typing
+from dataclasses import dataclass
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from cruizlib.graph.cache import LRUCache, dependency_graph_hash
+from cruizlib.graph.layout import LayeredLayout
+from cruizlib.graph.traversal import DepthFirstTraversal
+
+if typing.TYPE_CHECKING:
+    from cruizlib.graph.layout import LayoutEdge, Point
+    from cruizlib.interop.dependencygraph import DependencyGraph
+
+NODE_PADDING = 8.0
+ARROW_SIZE = 8.0
+BACKGROUND_COLOUR = QtGui.QColor("lightsteelblue")
+NODE_OUTLINE_COLOUR = QtGui.QColor("blue")
+RUNTIME_FILL_COLOUR = QtGui.QColor("white")
+BUILD_FILL_COLOUR = QtGui.QColor("gray")
+EDGE_COLOUR = QtGui.QColor("red")
+HIGHLIGHT_COLOUR = QtGui.QColor("darkorange")
+HIGHLIGHT_WIDTH = 3.0
+BADGE_COLOUR = QtGui.QColor("gold")
+BADGE_SIZE = 24.0
+# level of detail (scale) below which labels, and arrowheads, are not drawn
+TEXT_DETAIL = 0.4
+ARROW_DETAIL = 0.25
+
+
+def node_label(reference: str) -> str:
+    """Get the label of a node, as drawn."""
+    return reference.replace("@", "@\n")
+
+
+@dataclass
+class GraphDrawing:
+    """A dependency graph, laid out ready to draw."""
+
+    depgraph: DependencyGraph
+    graph_hash: str
+    node_ids: typing.List[int]
+    sizes: typing.List[typing.Tuple[float, float]]
+    centres: typing.List[Point]
+    edges: typing.List[LayoutEdge]
+    layout: LayeredLayout
+
+
+class LayoutGenerator(QtCore.QObject):
+    """
+    Lay out dependency graphs on a background thread.
+
+    The layering and ordering of the last graph is reused when only the rank
+    direction changes, and seeds the ordering when the graph changes, so that
+    relayouts are quicker and nodes tend to keep their relative positions.
+    """
+
+    generated = QtCore.Signal(object)
+    _finished = QtCore.Signal(int, str, object)
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = None) -> None:
+        """Initialise a LayoutGenerator."""
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._request = 0
+        self._previous: typing.Optional[GraphDrawing] = None
+        self._cache: LRUCache[GraphDrawing] = LRUCache(capacity=4)
+        self._finished.connect(self._on_finished)
+
+    def generate(
+        self,
+        depgraph: DependencyGraph,
+        rankdir: str,
+        flipped_edges: bool = False,
+        font: typing.Optional[QtGui.QFont] = None,
+    ) -> None:
+        """Request the layout of the dependency graph; emits generated."""
+        self.cancel()
+        font = font or QtGui.QFont()
+        graph_hash = f"{dependency_graph_hash(depgraph)}:{flipped_edges}"
+        # the sizes of nodes depend upon the font
+        key = f"{graph_hash}:{rankdir}:{font.key()}"
+        drawing = self._cache.get(key)
+        if drawing is not None:
+            self._previous = drawing
+            self.generated.emit(drawing)
+            return
+        # font metrics are measured here, as they are not safe on another thread
+        metrics = QtGui.QFontMetricsF(font)
+        sizes = []
+        for node in depgraph.nodes:
+            rect = metrics.boundingRect(
+                QtCore.QRectF(),
+                QtCore.Qt.AlignmentFlag.AlignCenter,
+                node_label(node.reference),
+            )
+            sizes.append(
+                (rect.width() + 2 * NODE_PADDING, rect.height() + 2 * NODE_PADDING)
+            )
+        with self._lock:
+            request = self._request
+        threading.Thread(
+            target=self._run,
+            args=(
+                request,
+                key,
+                graph_hash,
+                depgraph,
+                rankdir,
+                flipped_edges,
+                sizes,
+                self._previous,
+            ),
+            daemon=True,
+        ).start()
+
+    def cancel(self) -> None:
+        """Discard the result of any layout in progress."""
+        with self._lock:
+            self._request += 1
+
+    def _run(
+        self,
+        request: int,
+        key: str,
+        graph_hash: str,
+        depgraph: DependencyGraph,
+        rankdir: str,
+        flipped_edges: bool,
+        sizes: typing.List[typing.Tuple[float, float]],
+        previous: typing.Optional[GraphDrawing],
+    ) -> None:
+        traversal = DepthFirstTraversal(depgraph)
+        vertex_of = {node_id: index for index, node_id in enumerate(traversal.node_ids)}
+        edges = [
+            (
+                (vertex_of[parent], vertex_of[child])
+                if flipped_edges
+                else (vertex_of[child], vertex_of[parent])
+            )
+            for child, parent in traversal.edges
+        ]
+        if previous is not None and previous.graph_hash == graph_hash:
+            # only the rank direction has changed
+            layout = previous.layout
+        else:
+            layout = LayeredLayout(
+                len(traversal.node_ids),
+                edges,
+                [depgraph.node(node_id).reference for node_id in traversal.node_ids],
+                previous.layout if previous is not None else None,
+            )
+        vertex_sizes = [sizes[node_id] for node_id in traversal.node_ids]
+        with self._lock:
+            if request != self._request:
+                return
+        centres, routes = layout.coordinates(vertex_sizes, rankdir)
+        drawing = GraphDrawing(
+            depgraph,
+            graph_hash,
+            traversal.node_ids,
+            vertex_sizes,
+            centres,
+            routes,
+            layout,
+        )
+        self._finished.emit(request, key, drawing)
+
+    def _on_finished(self, request: int, key: str, drawing: GraphDrawing) -> None:
+        self._previous = drawing
+        self._cache.put(key, drawing)
+        if request != self._request:
+            # superseded
+            return
+        self.generated.emit(drawing)
+
+
+def _clip_to_rect(inside: Point, outside: Point, rect: QtCore.QRectF) -> Point:
+    # point where the line from the centre of the rect to outside leaves the rect
+    dx = outside[0] - inside[0]
+    dy = outside[1] - inside[1]
+    scales = []
+    if dx:
+        scales.append(abs(rect.width() / 2 / dx))
+    if dy:
+        scales.append(abs(rect.height() / 2 / dy))
+    scale = min(min(scales, default=0.0), 1.0)
+    return (inside[0] + dx * scale, inside[1] + dy * scale)
+
+
+class _NodeItem(QtWidgets.QGraphicsRectItem):
+    # label and any count of hidden nodes are only drawn when legible
+    def __init__(self, rect: QtCore.QRectF, label: str, hidden_count: int) -> None:
+        super().__init__(rect)
+        self._label = label
+        self._badge = f"+{hidden_count}" if hidden_count else ""
+        pen_margin = HIGHLIGHT_WIDTH / 2
+        self._bounds = rect.adjusted(-pen_margin, -pen_margin, pen_margin, pen_margin)
+        if self._badge:
+            self._bounds.adjust(0, -BADGE_SIZE / 2, BADGE_SIZE / 2, 0)
+
+    def boundingRect(self) -> QtCore.QRectF:
+        """Override the bounding rect, to include any badge."""
+        return self._bounds
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionGraphicsItem,
+        widget: typing.Optional[QtWidgets.QWidget] = None,
+    ) -> None:
+        """Override the paint, to reduce the detail when zoomed out."""
+        super().paint(painter, option, widget)
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < TEXT_DETAIL:
+            return
+        painter.setFont(self.scene().font())
+        painter.drawText(self.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, self._label)
+        if self._badge:
+            corner = self.rect().topRight()
+            badge = QtCore.QRectF(
+                corner.x() - BADGE_SIZE / 2,
+                corner.y() - BADGE_SIZE / 2,
+                BADGE_SIZE,
+                BADGE_SIZE,
+            )
+            painter.setBrush(BADGE_COLOUR)
+            painter.drawEllipse(badge)
+            painter.drawText(badge, QtCore.Qt.AlignmentFlag.AlignCenter, self._badge)
+
+
+class _EdgeItem(QtWidgets.QGraphicsPathItem):
+    # arrowheads are only drawn when legible
+    def __init__(self, path: QtGui.QPainterPath, arrow: QtGui.QPolygonF) -> None:
+        super().__init__(path)
+        self._arrow = arrow
+        pen_margin = HIGHLIGHT_WIDTH / 2
+        self._bounds = (
+            path.boundingRect()
+            .united(arrow.boundingRect())
+            .adjusted(-pen_margin, -pen_margin, pen_margin, pen_margin)
+        )
+
+    def boundingRect(self) -> QtCore.QRectF:
+        """Override the bounding rect, to include the arrowhead."""
+        return self._bounds
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionGraphicsItem,
+        widget: typing.Optional[QtWidgets.QWidget] = None,
+    ) -> None:
+        """Override the paint, to reduce the detail when zoomed out."""
+        super().paint(painter, option, widget)
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < ARROW_DETAIL:
+            return
+        painter.setBrush(EDGE_COLOUR)
+        painter.drawPolygon(self._arrow)
+
+
+class LayeredGraphScene(QtWidgets.QGraphicsScene):
+    """
+    Scene drawing a dependency graph from its built-in layout.
+
+    Node labels and arrowheads are omitted when zoomed out too far to read.
+    Nodes and edges may be highlighted, for example to show paths, and nodes
+    filled with other colours, for example to show changes.
+    """
+
+    node_activated = QtCore.Signal(int)
+
+    def __init__(
+        self,
+        drawing: GraphDrawing,
+        hidden_counts: typing.Optional[typing.Dict[int, int]] = None,
+    ) -> None:
+        """Initialise a LayeredGraphScene."""
+        super().__init__()
+        self.setBackgroundBrush(BACKGROUND_COLOUR)
+        self.node_items: typing.Dict[int, QtWidgets.QGraphicsRectItem] = {}
+        self._default_fills: typing.Dict[int, QtGui.QColor] = {}
+        # keyed by the ids of the nodes the edge is drawn between
+        self.edge_items: typing.Dict[
+            typing.Tuple[int, int], QtWidgets.QGraphicsPathItem
+        ] = {}
+        hidden_counts = hidden_counts or {}
+        rects = []
+        for vertex, node_id in enumerate(drawing.node_ids):
+            node = drawing.depgraph.node(node_id)
+            (x, y), (width, height) = drawing.centres[vertex], drawing.sizes[vertex]
+            rect = QtCore.QRectF(x - width / 2, y - height / 2, width, height)
+            rects.append(rect)
+            item = _NodeItem(
+                rect, node_label(node.reference), hidden_counts.get(node_id, 0)
+            )
+            item.setPen(QtGui.QPen(NODE_OUTLINE_COLOUR))
+            self._default_fills[node_id] = (
+                RUNTIME_FILL_COLOUR if node.is_runtime else BUILD_FILL_COLOUR
+            )
+            item.setBrush(self._default_fills[node_id])
+            tooltip = (
+                f"Package reference: {node.reference}\n"
+                f"Package Id: {node.package_id}"
+            )
+            if node_id in hidden_counts:
+                tooltip += f"\n{hidden_counts[node_id]} dependencies collapsed"
+            item.setToolTip(tooltip)
+            item.setData(0, node_id)
+            item.setZValue(1)
+            self.addItem(item)
+            self.node_items[node_id] = item
+        pen = QtGui.QPen(EDGE_COLOUR)
+        for edge in drawing.edges:
+            self.edge_items[
+                (drawing.node_ids[edge.source], drawing.node_ids[edge.target])
+            ] = self._add_edge(edge, rects, pen)
+
+    def highlight(
+        self,
+        node_ids: typing.AbstractSet[int],
+        edges: typing.AbstractSet[typing.Tuple[int, int]],
+    ) -> None:
+        """Highlight the nodes, and the edges between pairs of nodes."""
+        highlight_pen = QtGui.QPen(HIGHLIGHT_COLOUR, HIGHLIGHT_WIDTH)
+        for node_id, node_item in self.node_items.items():
+            node_item.setPen(
+                highlight_pen
+                if node_id in node_ids
+                else QtGui.QPen(NODE_OUTLINE_COLOUR)
+            )
+        for (source, target), edge_item in self.edge_items.items():
+            edge_item.setPen(
+                highlight_pen
+                if (source, target) in edges or (target, source) in edges
+                else QtGui.QPen(EDGE_COLOUR)
+            )
+
+    def fill(self, colours: typing.Mapping[int, QtGui.QColor]) -> None:
+        """Fill nodes with the colours, and any other nodes as usual."""
+        for node_id, node_item in self.node_items.items():
+            node_item.setBrush(colours.get(node_id, self._default_fills[node_id]))
+
+    def _add_edge(
+        self,
+        edge: LayoutEdge,
+        rects: typing.List[QtCore.QRectF],
+        pen: QtGui.QPen,
+    ) -> QtWidgets.QGraphicsPathItem:
+        points = list(edge.points)
+        points[0] = _clip_to_rect(points[0], points[1], rects[edge.source])
+        points[-1] = _clip_to_rect(points[-1], points[-2], rects[edge.target])
+        path = QtGui.QPainterPath(QtCore.QPointF(*points[0]))
+        for point in points[1:]:
+            path.lineTo(*point)
+        # arrowhead at the target
+        (x1, y1), (x2, y2) = points[-2], points[-1]
+        angle = math.atan2(y2 - y1, x2 - x1)
+        arrow = QtGui.QPolygonF(
+            [
+                QtCore.QPointF(x2, y2),
+                QtCore.QPointF(
+                    x2 - ARROW_SIZE * math.cos(angle - math.pi / 6),
+                    y2 - ARROW_SIZE * math.sin(angle - math.pi / 6),
+                ),
+                QtCore.QPointF(
+                    x2 - ARROW_SIZE * math.cos(angle + math.pi / 6),
+                    y2 - ARROW_SIZE * math.sin(angle + math.pi / 6),
+                ),
+            ]
+        )
+        item = _EdgeItem(path, arrow)
+        item.setPen(pen)
+        self.addItem(item)
+        return item
+
+    def activate(self, position: QtCore.QPointF) -> bool:
+        """Activate the node at the position, if there is one."""
+        for item in self.items(position):
+            if isinstance(item, _NodeItem):
+                self.node_activated.emit(item.data(0))
+                return True
+        return False
+
+    def mouseDoubleClickEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
+        """Override the default mouseDoubleClickEvent to activate nodes."""
+        if self.activate(event.scenePos()):
+            event.setAccepted(True)
+            return
+        super().mouseDoubleClickEvent(event)
@@ -9,66 +9,217 @@ import typing
 from PySide6 import QtCore, QtGui
 
 if typing.TYPE_CHECKING:
-    from cruizlib.interop.dependencygraph import DependencyGraph
+    from cruizlib.interop.dependencygraph import DependencyGraph, PackageNodeView
 
 
-class DependenciesListModel(QtGui.QStandardItemModel):
-    """Qt model representing the list of dependencies to a recipe."""
+# delay after the filter text changes, before filtering
+FILTER_DELAY_MS = 150
+# number of children added to the tree at a time
+FETCH_BATCH_SIZE = 256
 
-    def __init__(self, graph: DependencyGraph) -> None:
+
+def _tooltip(node: PackageNodeView) -> str:
+    node_info = f"Conan info:\n{node.info}" if node.info else ""
+    return (
+        f"Package reference: {node.reference}\n"
+        f"Package Id: {node.package_id}\n"
+        f"Recipe revision: {node.recipe_revision}\n"
+        f"{node_info}"
+    )
+
+
+class DependenciesListModel(QtCore.QAbstractListModel):
+    """
+    Qt model representing the list of dependencies to a recipe.
+
+    Display, font and tooltip data are computed when requested.
+    """
+
+    def __init__(
+        self, graph: DependencyGraph, parent: typing.Optional[QtCore.QObject] = None
+    ) -> None:
         """Initialise a DependenciesListModel."""
-        super().__init__(len(graph.nodes), 1)
-        for row, node in enumerate(graph.nodes):
-            item = QtGui.QStandardItem()
-            item.setText(node.reference)
-            item.setData(node, QtCore.Qt.ItemDataRole.UserRole)
-            if node == graph.root:
-                font = QtGui.QFont()
-                font.setBold(True)
-                font.setUnderline(True)
-                item.setData(font, QtCore.Qt.ItemDataRole.FontRole)
-            else:
-                if not node.is_runtime:
-                    font = QtGui.QFont()
-                    font.setItalic(True)
-                    item.setData(font, QtCore.Qt.ItemDataRole.FontRole)
-            node_info = f"Conan info:\n{node.info}" if node.info else ""
-            item.setData(
-                f"Package reference: {node.reference}\n"
-                f"Package Id: {node.package_id}\n"
-                f"Recipe revision: {node.recipe_revision}\n"
-                f"{node_info}",
-                QtCore.Qt.ItemDataRole.ToolTipRole,
+        super().__init__(parent)
+        self._graph = graph
+        self._highlighted: typing.AbstractSet[int] = frozenset()
+        self._root_font = QtGui.QFont()
+        self._root_font.setBold(True)
+        self._root_font.setUnderline(True)
+        self._build_font = QtGui.QFont()
+        self._build_font.setItalic(True)
+
+    def highlight(self, node_ids: typing.AbstractSet[int]) -> None:
+        """Highlight the rows of the nodes with the given ids."""
+        self._highlighted = frozenset(node_ids)
+        if self._graph.node_count:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._graph.node_count - 1, 0),
+                [QtCore.Qt.ItemDataRole.BackgroundRole],
             )
-            self.setItem(row, 0, item)
+
+    def rowCount(self, parent) -> int:  # type: ignore
+        """Get the number of rows in the model."""
+        if parent.isValid():
+            return 0
+        return self._graph.node_count
+
+    def data(self, index, role) -> typing.Any:  # type: ignore
+        """Get the data from the model."""
+        if not index.isValid():
+            return None
+        node = self._graph.node(index.row())
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return node.reference
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return node
+        if role == QtCore.Qt.ItemDataRole.FontRole:
+            if node.node_id == self._graph.root_id:
+                return self._root_font
+            if not node.is_runtime:
+                return self._build_font
+            return None
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return _tooltip(node)
+        if role == QtCore.Qt.ItemDataRole.BackgroundRole:
+            if node.node_id in self._highlighted:
+                return QtGui.QColor(QtCore.Qt.GlobalColor.yellow)
+        return None
+
+
+class DependenciesFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """
+    Qt proxy model filtering dependencies by their reference.
+
+    Filtering is case insensitive, and is delayed until the filter text has
+    stopped changing, so that typing stays responsive on large graphs.
+    """
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = None) -> None:
+        """Initialise a DependenciesFilterProxyModel."""
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+        self._pending_text = ""
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FILTER_DELAY_MS)
+        self._timer.timeout.connect(self._apply_filter)
+
+    def set_filter_text(self, text: str) -> None:
+        """Set the text that references must contain, after a delay."""
+        self._pending_text = text
+        self._timer.start()
+
+    def _apply_filter(self) -> None:
+        self.setFilterFixedString(self._pending_text)
 
 
-class DependenciesTreeModel(QtGui.QStandardItemModel):
-    """Qt model representing the tree of dependencies to a recipe."""
+class _TreeItem:
+    # an occurrence of a node in the tree; shared nodes occur once per path
+    __slots__ = ("node_id", "parent", "row", "children", "child_ids")
 
-    def __init__(self, graph: DependencyGraph) -> None:
+    def __init__(
+        self,
+        graph: DependencyGraph,
+        node_id: int,
+        parent: typing.Optional[_TreeItem],
+        row: int,
+    ) -> None:
+        self.node_id = node_id
+        self.parent = parent
+        self.row = row
+        self.children: typing.List[_TreeItem] = []
+        self.child_ids = list(dict.fromkeys(graph.child_ids(node_id)))
+
+
+class DependenciesTreeModel(QtCore.QAbstractItemModel):
+    """
+    Qt model representing the tree of dependencies to a recipe.
+
+    Children are only added when their parent is expanded, as a package
+    shared by many others appears beneath each of them, and the full tree
+    can be far larger than the graph.
+    """
+
+    def __init__(
+        self, graph: DependencyGraph, parent: typing.Optional[QtCore.QObject] = None
+    ) -> None:
         """Initialise a DependenciesTreeModel."""
-        super().__init__()
-        parent_item = self.invisibleRootItem()
-        # TODO: revisit this algorithm
-        for node in graph.nodes:
-            item = QtGui.QStandardItem()
-            item.setText(node.reference)
-            if node == graph.root:
-                item.setData(
-                    QtGui.QColor(QtCore.Qt.GlobalColor.red),
-                    QtCore.Qt.ItemDataRole.ForegroundRole,
-                )
-            else:
-                if node.is_runtime:
-                    item.setData(
-                        QtGui.QColor(QtCore.Qt.GlobalColor.black),
-                        QtCore.Qt.ItemDataRole.ForegroundRole,
-                    )
-                else:
-                    item.setData(
-                        QtGui.QColor(QtCore.Qt.GlobalColor.gray),
-                        QtCore.Qt.ItemDataRole.ForegroundRole,
-                    )
-            parent_item.appendRow(item)
-            parent_item = item
+        super().__init__(parent)
+        self._graph = graph
+        self._root = _TreeItem(graph, graph.root_id, None, 0)
+
+    def _item(self, index: QtCore.QModelIndex) -> _TreeItem:
+        return typing.cast("_TreeItem", index.internalPointer())
+
+    def rowCount(self, parent) -> int:  # type: ignore
+        """Get the number of rows in the model."""
+        if not parent.isValid():
+            return 1
+        if parent.column():
+            return 0
+        return len(self._item(parent).children)
+
+    def columnCount(self, parent) -> int:  # type: ignore
+        """Get the number of columns in the model."""
+        # pylint: disable=unused-argument
+        return 1
+
+    def hasChildren(self, parent) -> bool:  # type: ignore
+        """Get whether the index has children, whether fetched or not."""
+        if not parent.isValid():
+            return True
+        return bool(self._item(parent).child_ids)
+
+    def canFetchMore(self, parent) -> bool:  # type: ignore
+        """Get whether the index has children not yet fetched."""
+        if not parent.isValid():
+            return False
+        item = self._item(parent)
+        return len(item.children) < len(item.child_ids)
+
+    def fetchMore(self, parent) -> None:  # type: ignore
+        """Fetch the next batch of children of the index."""
+        item = self._item(parent)
+        first = len(item.children)
+        last = min(first + FETCH_BATCH_SIZE, len(item.child_ids)) - 1
+        self.beginInsertRows(parent, first, last)
+        for row in range(first, last + 1):
+            item.children.append(_TreeItem(self._graph, item.child_ids[row], item, row))
+        self.endInsertRows()
+
+    def index(self, row, column, parent):  # type: ignore
+        """Get the model index given the coordinates."""
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, self._root)
+        return self.createIndex(row, column, self._item(parent).children[row])
+
+    def parent(self, index) -> QtCore.QModelIndex:  # type: ignore
+        """Get the index's parent."""
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent_item = self._item(index).parent
+        if parent_item is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(parent_item.row, 0, parent_item)
+
+    def data(self, index, role) -> typing.Any:  # type: ignore
+        """Get the data from the model."""
+        if not index.isValid():
+            return None
+        node = self._graph.node(self._item(index).node_id)
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return node.reference
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return node
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return _tooltip(node)
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole:
+            if node.node_id == self._graph.root_id:
+                return QtGui.QColor(QtCore.Qt.GlobalColor.red)
+            if node.is_runtime:
+                return QtGui.QColor(QtCore.Qt.GlobalColor.black)
+            return QtGui.QColor(QtCore.Qt.GlobalColor.gray)
+        return None
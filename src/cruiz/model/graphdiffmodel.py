@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+"""Conan dependency graph differences Qt model."""
+
+from __future__ import annotations
+
+import typing
+
+from PySide6 import QtCore, QtGui
+
+from cruizlib.graph.diff import ChangeKind
+
+if typing.TYPE_CHECKING:
+    from cruizlib.graph.diff import DependencyGraphDiff
+
+CHANGE_COLOURS = {
+    ChangeKind.ADDED: QtGui.QColor("palegreen"),
+    ChangeKind.REMOVED: QtGui.QColor("lightpink"),
+    ChangeKind.VERSION_CHANGED: QtGui.QColor("orange"),
+    ChangeKind.PACKAGE_ID_CHANGED: QtGui.QColor("khaki"),
+}
+
+
+class DependencyGraphDiffModel(QtGui.QStandardItemModel):
+    """Qt model representing the changes to the dependencies of a recipe."""
+
+    def __init__(self, diff: DependencyGraphDiff) -> None:
+        """Initialise a DependencyGraphDiffModel."""
+        super().__init__(len(diff.changes), 4)
+        self.setHorizontalHeaderLabels(["Change", "Package", "Before", "After"])
+        for row, change in enumerate(diff.changes):
+            texts = (
+                change.kind.value,
+                change.name,
+                diff.before(change),
+                diff.after(change),
+            )
+            for column, text in enumerate(texts):
+                item = QtGui.QStandardItem(text)
+                item.setData(
+                    CHANGE_COLOURS[change.kind], QtCore.Qt.ItemDataRole.BackgroundRole
+                )
+                self.setItem(row, column, item)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+"""Qt model of diagnostics extracted from command output."""
+
+from __future__ import annotations
+
+import typing
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from cruizlib.commands.diagnostics import DiagnosticSeverity
+
+if typing.TYPE_CHECKING:
+    from cruizlib.commands.diagnostics import Diagnostic
+
+
+class ProblemsModel(QtCore.QAbstractTableModel):
+    """Qt model representing the problems found in command output."""
+
+    _HEADERS = ("Severity", "Tool", "File", "Line", "Message")
+    _SEVERITY_COLUMN = 0
+    _TOOL_COLUMN = 1
+    _FILE_COLUMN = 2
+    _LINE_COLUMN = 3
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = None) -> None:
+        """Initialise a ProblemsModel."""
+        super().__init__(parent)
+        self._diagnostics: typing.List[Diagnostic] = []
+        # the number of identical lines preceding each diagnostic in the log
+        self._occurrences: typing.List[int] = []
+        self._occurrence_count: typing.Dict[typing.Tuple[str, bool], int] = {}
+        self._severity_count = {severity: 0 for severity in DiagnosticSeverity}
+        style = QtWidgets.QApplication.style()
+        self._icons = {
+            DiagnosticSeverity.ERROR: style.standardIcon(
+                QtWidgets.QStyle.StandardPixmap.SP_MessageBoxCritical
+            ),
+            DiagnosticSeverity.WARNING: style.standardIcon(
+                QtWidgets.QStyle.StandardPixmap.SP_MessageBoxWarning
+            ),
+            DiagnosticSeverity.NOTE: style.standardIcon(
+                QtWidgets.QStyle.StandardPixmap.SP_MessageBoxInformation
+            ),
+        }
+
+    def append(self, diagnostics: typing.List[Diagnostic]) -> None:
+        """Append a batch of diagnostics."""
+        first = len(self._diagnostics)
+        self.beginInsertRows(
+            QtCore.QModelIndex(), first, first + len(diagnostics) - 1
+        )
+        for diagnostic in diagnostics:
+            key = (diagnostic.text, diagnostic.is_stderr)
+            occurrence = self._occurrence_count.get(key, 0)
+            self._occurrence_count[key] = occurrence + 1
+            self._diagnostics.append(diagnostic)
+            self._occurrences.append(occurrence)
+            self._severity_count[diagnostic.severity] += 1
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove all diagnostics."""
+        self.beginResetModel()
+        self._diagnostics.clear()
+        self._occurrences.clear()
+        self._occurrence_count.clear()
+        self._severity_count = {severity: 0 for severity in DiagnosticSeverity}
+        self.endResetModel()
+
+    def diagnostic(self, row: int) -> typing.Tuple[Diagnostic, int]:
+        """Get the diagnostic at a row, and its occurrence in the log."""
+        return self._diagnostics[row], self._occurrences[row]
+
+    def count(self, severity: DiagnosticSeverity) -> int:
+        """Get the number of diagnostics of the given severity."""
+        return self._severity_count[severity]
+
+    def rowCount(self, parent) -> int:  # type: ignore
+        """Get the number of rows in the model."""
+        if parent.isValid():
+            return 0
+        return len(self._diagnostics)
+
+    def columnCount(self, parent) -> int:  # type: ignore
+        """Get the number of columns in the model."""
+        # pylint: disable=unused-argument
+        return len(self._HEADERS)
+
+    def data(self, index, role) -> typing.Any:  # type: ignore
+        """Get the data from the model."""
+        if not index.isValid():
+            return None
+        diagnostic = self._diagnostics[index.row()]
+        column = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            if column == self._SEVERITY_COLUMN:
+                return diagnostic.severity.value
+            if column == self._TOOL_COLUMN:
+                return diagnostic.tool
+            if column == self._FILE_COLUMN:
+                return diagnostic.file
+            if column == self._LINE_COLUMN:
+                if diagnostic.line is None:
+                    return None
+                if diagnostic.column is None:
+                    return str(diagnostic.line)
+                return f"{diagnostic.line}:{diagnostic.column}"
+            return diagnostic.message
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return diagnostic.text
+        if column != self._SEVERITY_COLUMN:
+            return None
+        if role == QtCore.Qt.ItemDataRole.DecorationRole:
+            return self._icons[diagnostic.severity]
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole:
+            if diagnostic.severity == DiagnosticSeverity.ERROR:
+                return QtGui.QColor(QtCore.Qt.GlobalColor.red)
+        return None
+
+    def headerData(self, section, orientation, role) -> typing.Any:  # type: ignore
+        """Get the header data."""
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+        ):
+            return self._HEADERS[section]
+        return None
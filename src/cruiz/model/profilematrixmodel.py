@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+"""Conan dependency graphs across a matrix of configurations Qt model."""
+
+from __future__ import annotations
+
+import typing
+
+from PySide6 import QtCore, QtGui
+
+if typing.TYPE_CHECKING:
+    from cruizlib.graph.matrix import ProfileMatrix
+
+MISSING_BINARY_COLOUR = QtGui.QColor("lightpink")
+
+
+class ProfileMatrixModel(QtGui.QStandardItemModel):
+    """Qt model representing the dependency graph of each configuration."""
+
+    def __init__(self, matrix: ProfileMatrix) -> None:
+        """Initialise a ProfileMatrixModel."""
+        super().__init__(len(matrix), 5)
+        self._matrix = matrix
+        self.setHorizontalHeaderLabels(
+            ["Configuration", "Status", "Package Id", "Missing binaries", "Changes"]
+        )
+        for row, configuration in enumerate(matrix.configurations):
+            self.setItem(row, 0, QtGui.QStandardItem(str(configuration)))
+            self.set_status(row, "Pending")
+
+    def set_status(self, row: int, status: str) -> None:
+        """Set the status of a configuration, before its graph is computed."""
+        for column, text in enumerate((status, "", "", "")):
+            self.setItem(row, column + 1, QtGui.QStandardItem(text))
+
+    def update_rows(self) -> None:
+        """Update every configuration with a computed graph, or an error."""
+        for row in range(len(self._matrix)):
+            error = self._matrix.errors[row]
+            if error is not None:
+                item = QtGui.QStandardItem("Failed")
+                item.setToolTip(error)
+                self.setItem(row, 1, item)
+                continue
+            package_id = self._matrix.package_id(row)
+            if package_id is None:
+                continue
+            missing = self._matrix.missing_binaries(row)
+            diff = self._matrix.diff(row)
+            if not row:
+                changes = "(baseline)"
+            elif diff is None:
+                changes = ""
+            else:
+                changes = str(len(diff.changes))
+            self.setItem(row, 1, QtGui.QStandardItem("Computed"))
+            self.setItem(row, 2, QtGui.QStandardItem(package_id))
+            missing_item = QtGui.QStandardItem(str(len(missing)))
+            if missing:
+                missing_item.setToolTip("\n".join(missing))
+                missing_item.setData(
+                    MISSING_BINARY_COLOUR, QtCore.Qt.ItemDataRole.BackgroundRole
+                )
+            self.setItem(row, 3, missing_item)
+            self.setItem(row, 4, QtGui.QStandardItem(changes))
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'about_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QLocale,
+    QMetaObject,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QTime,
+    QUrl,
+    Qt,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QConicalGradient,
+    QCursor,
+    QFont,
+    QFontDatabase,
+    QGradient,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
+from PySide6.QtWidgets import (
+    QApplication,
+    QDialog,
+    QGridLayout,
+    QLabel,
+    QLayout,
+    QSizePolicy,
+    QWidget,
+)
+
+
+class Ui_AboutCruiz(object):
+    def setupUi(self, AboutCruiz):
+        if not AboutCruiz.objectName():
+            AboutCruiz.setObjectName("AboutCruiz")
+        AboutCruiz.resize(246, 160)
+        AboutCruiz.setModal(True)
+        self.gridLayout = QGridLayout(AboutCruiz)
+        self.gridLayout.setObjectName("gridLayout")
+        self.gridLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+        self.label_4 = QLabel(AboutCruiz)
+        self.label_4.setObjectName("label_4")
+
+        self.gridLayout.addWidget(self.label_4, 2, 1, 1, 1)
+
+        self.label_2 = QLabel(AboutCruiz)
+        self.label_2.setObjectName("label_2")
+
+        self.gridLayout.addWidget(self.label_2, 0, 1, 1, 1)
+
+        self.python = QLabel(AboutCruiz)
+        self.python.setObjectName("python")
+
+        self.gridLayout.addWidget(self.python, 3, 1, 1, 1)
+
+        self.version = QLabel(AboutCruiz)
+        self.version.setObjectName("version")
+
+        self.gridLayout.addWidget(self.version, 1, 1, 1, 1)
+
+        self.python_version = QLabel(AboutCruiz)
+        self.python_version.setObjectName("python_version")
+
+        self.gridLayout.addWidget(self.python_version, 4, 1, 1, 1)
+
+        self.pyside_version = QLabel(AboutCruiz)
+        self.pyside_version.setObjectName("pyside_version")
+
+        self.gridLayout.addWidget(self.pyside_version, 5, 1, 1, 1)
+
+        self.cruiz = QLabel(AboutCruiz)
+        self.cruiz.setObjectName("cruiz")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(100)
+        sizePolicy.setVerticalStretch(100)
+        sizePolicy.setHeightForWidth(self.cruiz.sizePolicy().hasHeightForWidth())
+        self.cruiz.setSizePolicy(sizePolicy)
+        self.cruiz.setMaximumSize(QSize(100, 100))
+
+        self.gridLayout.addWidget(self.cruiz, 0, 0, 6, 1)
+
+        self.retranslateUi(AboutCruiz)
+
+        QMetaObject.connectSlotsByName(AboutCruiz)
+
+    # setupUi
+
+    def retranslateUi(self, AboutCruiz):
+        AboutCruiz.setWindowTitle(
+            QCoreApplication.translate("AboutCruiz", "About cruiz", None)
+        )
+        self.label_4.setText(
+            QCoreApplication.translate(
+                "AboutCruiz", "Author: Mark Final (c) 2020-2026", None
+            )
+        )
+        self.label_2.setText(
+            QCoreApplication.translate(
+                "AboutCruiz", "cruiz: Conan recipe user interface", None
+            )
+        )
+        self.python.setText(
+            QCoreApplication.translate("AboutCruiz", "Python executable: unknown", None)
+        )
+        self.version.setText(
+            QCoreApplication.translate("AboutCruiz", "Version: unknown", None)
+        )
+        self.python_version.setText(
+            QCoreApplication.translate("AboutCruiz", "Python version: unknown", None)
+        )
+        self.pyside_version.setText(
+            QCoreApplication.translate("AboutCruiz", "PySide version: unknown", None)
+        )
+
+    # retranslateUi
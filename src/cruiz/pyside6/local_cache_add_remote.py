@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'local_cache_add_remote.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QLocale,
+    QMetaObject,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QTime,
+    QUrl,
+    Qt,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QConicalGradient,
+    QCursor,
+    QFont,
+    QFontDatabase,
+    QGradient,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
+from PySide6.QtWidgets import (
+    QAbstractButton,
+    QApplication,
+    QDialog,
+    QDialogButtonBox,
+    QFrame,
+    QGridLayout,
+    QLabel,
+    QLineEdit,
+    QSizePolicy,
+    QVBoxLayout,
+    QWidget,
+)
+
+from cruiz.manage_local_cache.widgets.configpathorurl import (
+    LineEditWithCustomContextMenu,
+)
+
+
+class Ui_AddRemoteDialog(object):
+    def setupUi(self, AddRemoteDialog):
+        if not AddRemoteDialog.objectName():
+            AddRemoteDialog.setObjectName("AddRemoteDialog")
+        AddRemoteDialog.resize(447, 195)
+        self.verticalLayout = QVBoxLayout(AddRemoteDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_3 = QLabel(AddRemoteDialog)
+        self.label_3.setObjectName("label_3")
+        self.label_3.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label_3.setWordWrap(True)
+
+        self.verticalLayout_2.addWidget(self.label_3)
+
+        self.line = QFrame(AddRemoteDialog)
+        self.line.setObjectName("line")
+        self.line.setFrameShape(QFrame.Shape.HLine)
+        self.line.setFrameShadow(QFrame.Shadow.Sunken)
+
+        self.verticalLayout_2.addWidget(self.line)
+
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_2 = QLabel(AddRemoteDialog)
+        self.label_2.setObjectName("label_2")
+
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+
+        self.name = QLineEdit(AddRemoteDialog)
+        self.name.setObjectName("name")
+
+        self.gridLayout.addWidget(self.name, 0, 1, 1, 1)
+
+        self.url = LineEditWithCustomContextMenu(AddRemoteDialog)
+        self.url.setObjectName("url")
+
+        self.gridLayout.addWidget(self.url, 1, 1, 1, 1)
+
+        self.label = QLabel(AddRemoteDialog)
+        self.label.setObjectName("label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.verticalLayout_2.addLayout(self.gridLayout)
+
+        self.buttonBox = QDialogButtonBox(AddRemoteDialog)
+        self.buttonBox.setObjectName("buttonBox")
+        self.buttonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(
+            QDialogButtonBox.StandardButton.Cancel | QDialogButtonBox.StandardButton.Ok
+        )
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+        self.verticalLayout.addLayout(self.verticalLayout_2)
+
+        self.retranslateUi(AddRemoteDialog)
+        self.buttonBox.accepted.connect(AddRemoteDialog.accept)
+        self.buttonBox.rejected.connect(AddRemoteDialog.reject)
+
+        QMetaObject.connectSlotsByName(AddRemoteDialog)
+
+    # setupUi
+
+    def retranslateUi(self, AddRemoteDialog):
+        AddRemoteDialog.setWindowTitle(
+            QCoreApplication.translate("AddRemoteDialog", "Add remote", None)
+        )
+        self.label_3.setText(
+            QCoreApplication.translate(
+                "AddRemoteDialog",
+                "Adding additional remotes allows Conan to search in additional servers for published recipes and binaries.",
+                None,
+            )
+        )
+        self.label_2.setText(QCoreApplication.translate("AddRemoteDialog", "URL", None))
+        self.name.setText("")
+        self.name.setPlaceholderText(
+            QCoreApplication.translate("AddRemoteDialog", "Name of the remote", None)
+        )
+        self.url.setPlaceholderText(
+            QCoreApplication.translate("AddRemoteDialog", "URL of the remote", None)
+        )
+        self.label.setText(QCoreApplication.translate("AddRemoteDialog", "Name", None))
+
+    # retranslateUi
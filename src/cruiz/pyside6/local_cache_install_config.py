@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'local_cache_install_config.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QLocale,
+    QMetaObject,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QTime,
+    QUrl,
+    Qt,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QConicalGradient,
+    QCursor,
+    QFont,
+    QFontDatabase,
+    QGradient,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
+from PySide6.QtWidgets import (
+    QAbstractButton,
+    QApplication,
+    QDialog,
+    QDialogButtonBox,
+    QFrame,
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QProgressBar,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from cruiz.manage_local_cache.widgets.configpathorurl import (
+    LineEditWithCustomContextMenu,
+)
+
+
+class Ui_InstallConfigDialog(object):
+    def setupUi(self, InstallConfigDialog):
+        if not InstallConfigDialog.objectName():
+            InstallConfigDialog.setObjectName("InstallConfigDialog")
+        InstallConfigDialog.resize(632, 409)
+        self.verticalLayout = QVBoxLayout(InstallConfigDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_3 = QLabel(InstallConfigDialog)
+        self.label_3.setObjectName("label_3")
+        self.label_3.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label_3.setWordWrap(True)
+
+        self.verticalLayout_2.addWidget(self.label_3)
+
+        self.verticalSpacer_3 = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_3)
+
+        self.line = QFrame(InstallConfigDialog)
+        self.line.setObjectName("line")
+        self.line.setFrameShape(QFrame.Shape.HLine)
+        self.line.setFrameShadow(QFrame.Shadow.Sunken)
+
+        self.verticalLayout_2.addWidget(self.line)
+
+        self.verticalSpacer_4 = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_4)
+
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_4 = QLabel(InstallConfigDialog)
+        self.label_4.setObjectName("label_4")
+
+        self.gridLayout.addWidget(self.label_4, 2, 0, 1, 1)
+
+        self.label = QLabel(InstallConfigDialog)
+        self.label.setObjectName("label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.label_2 = QLabel(InstallConfigDialog)
+        self.label_2.setObjectName("label_2")
+
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+
+        self.pathOrUrl = LineEditWithCustomContextMenu(InstallConfigDialog)
+        self.pathOrUrl.setObjectName("pathOrUrl")
+
+        self.gridLayout.addWidget(self.pathOrUrl, 0, 1, 1, 1)
+
+        self.gitBranch = QLineEdit(InstallConfigDialog)
+        self.gitBranch.setObjectName("gitBranch")
+
+        self.gridLayout.addWidget(self.gitBranch, 1, 1, 1, 1)
+
+        self.sourceFolder = QLineEdit(InstallConfigDialog)
+        self.sourceFolder.setObjectName("sourceFolder")
+
+        self.gridLayout.addWidget(self.sourceFolder, 2, 1, 1, 1)
+
+        self.label_5 = QLabel(InstallConfigDialog)
+        self.label_5.setObjectName("label_5")
+
+        self.gridLayout.addWidget(self.label_5, 3, 0, 1, 1)
+
+        self.targetFolder = QLineEdit(InstallConfigDialog)
+        self.targetFolder.setObjectName("targetFolder")
+
+        self.gridLayout.addWidget(self.targetFolder, 3, 1, 1, 1)
+
+        self.verticalLayout_2.addLayout(self.gridLayout)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(
+            40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
+        )
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.installButton = QPushButton(InstallConfigDialog)
+        self.installButton.setObjectName("installButton")
+
+        self.horizontalLayout.addWidget(self.installButton)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.verticalSpacer = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.line_2 = QFrame(InstallConfigDialog)
+        self.line_2.setObjectName("line_2")
+        self.line_2.setFrameShape(QFrame.Shape.HLine)
+        self.line_2.setFrameShadow(QFrame.Shadow.Sunken)
+
+        self.verticalLayout_2.addWidget(self.line_2)
+
+        self.verticalSpacer_5 = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_5)
+
+        self.progressBar = QProgressBar(InstallConfigDialog)
+        self.progressBar.setObjectName("progressBar")
+        self.progressBar.setMaximum(1)
+        self.progressBar.setValue(0)
+
+        self.verticalLayout_2.addWidget(self.progressBar)
+
+        self.verticalSpacer_2 = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_2)
+
+        self.buttonBox = QDialogButtonBox(InstallConfigDialog)
+        self.buttonBox.setObjectName("buttonBox")
+        self.buttonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Cancel)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+        self.verticalLayout.addLayout(self.verticalLayout_2)
+
+        self.retranslateUi(InstallConfigDialog)
+        self.buttonBox.accepted.connect(InstallConfigDialog.accept)
+        self.buttonBox.rejected.connect(InstallConfigDialog.reject)
+
+        QMetaObject.connectSlotsByName(InstallConfigDialog)
+
+    # setupUi
+
+    def retranslateUi(self, InstallConfigDialog):
+        InstallConfigDialog.setWindowTitle(
+            QCoreApplication.translate("InstallConfigDialog", "Install config", None)
+        )
+        self.label_3.setText(
+            QCoreApplication.translate(
+                "InstallConfigDialog",
+                "Installing a Conan configuration to the local cache copies the archive files to the local cache.\n"
+                "WARNING: will overwrite existing files.\n"
+                "Configurations can be stored in zip files or as git repositories.\n"
+                "Optionally specify source and target folders to install only a portion of the configuration.",
+                None,
+            )
+        )
+        self.label_4.setText(
+            QCoreApplication.translate("InstallConfigDialog", "Source folder", None)
+        )
+        self.label.setText(
+            QCoreApplication.translate("InstallConfigDialog", "Path or URL", None)
+        )
+        self.label_2.setText(
+            QCoreApplication.translate("InstallConfigDialog", "git branch", None)
+        )
+        self.pathOrUrl.setPlaceholderText(
+            QCoreApplication.translate(
+                "InstallConfigDialog",
+                "Local path or remote archive or git repository URL",
+                None,
+            )
+        )
+        self.gitBranch.setPlaceholderText(
+            QCoreApplication.translate("InstallConfigDialog", "<default branch>", None)
+        )
+        self.sourceFolder.setPlaceholderText(
+            QCoreApplication.translate(
+                "InstallConfigDialog", "Optional source folder in the archive", None
+            )
+        )
+        self.label_5.setText(
+            QCoreApplication.translate("InstallConfigDialog", "Target folder", None)
+        )
+        self.targetFolder.setPlaceholderText(
+            QCoreApplication.translate(
+                "InstallConfigDialog", "Optional target folder in the local cache", None
+            )
+        )
+        self.installButton.setText(
+            QCoreApplication.translate("InstallConfigDialog", "Install", None)
+        )
+
+    # retranslateUi
@@ -0,0 +1,788 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'local_cache_manage.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QLocale,
+    QMetaObject,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QTime,
+    QUrl,
+    Qt,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QConicalGradient,
+    QCursor,
+    QFont,
+    QFontDatabase,
+    QGradient,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
+from PySide6.QtWidgets import (
+    QAbstractButton,
+    QAbstractItemView,
+    QAbstractScrollArea,
+    QApplication,
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QGridLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QPlainTextEdit,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QTabWidget,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from cruiz.manage_local_cache.widgets.keyvaluetable import KeyValueTable
+from cruiz.manage_local_cache.widgets.remotestable import RemotesTable
+
+
+class Ui_ManageLocalCaches(object):
+    def setupUi(self, ManageLocalCaches):
+        if not ManageLocalCaches.objectName():
+            ManageLocalCaches.setObjectName("ManageLocalCaches")
+        ManageLocalCaches.resize(561, 652)
+        self.verticalLayout = QVBoxLayout(ManageLocalCaches)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.verticalLayout_5 = QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.cacheNameLayout = QHBoxLayout()
+        self.cacheNameLayout.setObjectName("cacheNameLayout")
+        self.local_cache_names = QComboBox(ManageLocalCaches)
+        self.local_cache_names.setObjectName("local_cache_names")
+
+        self.cacheNameLayout.addWidget(self.local_cache_names)
+
+        self.new_local_cache_button = QPushButton(ManageLocalCaches)
+        self.new_local_cache_button.setObjectName("new_local_cache_button")
+        self.new_local_cache_button.setMaximumSize(QSize(75, 16777215))
+
+        self.cacheNameLayout.addWidget(self.new_local_cache_button)
+
+        self.verticalLayout_5.addLayout(self.cacheNameLayout)
+
+        self.verticalSpacer_2 = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_5.addItem(self.verticalSpacer_2)
+
+        self.localCacheInfo = QTabWidget(ManageLocalCaches)
+        self.localCacheInfo.setObjectName("localCacheInfo")
+        self.locationsTab = QWidget()
+        self.locationsTab.setObjectName("locationsTab")
+        self.gridLayout = QGridLayout(self.locationsTab)
+        self.gridLayout.setObjectName("gridLayout")
+        self.verticalSpacer_5 = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.gridLayout.addItem(self.verticalSpacer_5, 2, 0, 1, 1)
+
+        self.locationsLayout = QGridLayout()
+        self.locationsLayout.setObjectName("locationsLayout")
+        self.loc_conan_user_home_short_label = QLabel(self.locationsTab)
+        self.loc_conan_user_home_short_label.setObjectName(
+            "loc_conan_user_home_short_label"
+        )
+        self.loc_conan_user_home_short_label.setEnabled(False)
+
+        self.locationsLayout.addWidget(self.loc_conan_user_home_short_label, 1, 0, 1, 1)
+
+        self.label_5 = QLabel(self.locationsTab)
+        self.label_5.setObjectName("label_5")
+        self.label_5.setEnabled(False)
+
+        self.locationsLayout.addWidget(self.label_5, 0, 0, 1, 1)
+
+        self.conan_user_home = QLineEdit(self.locationsTab)
+        self.conan_user_home.setObjectName("conan_user_home")
+
+        self.locationsLayout.addWidget(self.conan_user_home, 0, 1, 1, 1)
+
+        self.conan_user_home_short = QLineEdit(self.locationsTab)
+        self.conan_user_home_short.setObjectName("conan_user_home_short")
+
+        self.locationsLayout.addWidget(self.conan_user_home_short, 1, 1, 1, 1)
+
+        self.gridLayout.addLayout(self.locationsLayout, 0, 0, 1, 1)
+
+        self.localCacheRecipeCount = QLabel(self.locationsTab)
+        self.localCacheRecipeCount.setObjectName("localCacheRecipeCount")
+        self.localCacheRecipeCount.setAlignment(
+            Qt.AlignmentFlag.AlignRight
+            | Qt.AlignmentFlag.AlignTrailing
+            | Qt.AlignmentFlag.AlignVCenter
+        )
+
+        self.gridLayout.addWidget(self.localCacheRecipeCount, 1, 0, 1, 1)
+
+        self.localCacheInfo.addTab(self.locationsTab, "")
+        self.profilesTab = QWidget()
+        self.profilesTab.setObjectName("profilesTab")
+        self.verticalLayout_7 = QVBoxLayout(self.profilesTab)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.verticalLayout_6 = QVBoxLayout()
+        self.verticalLayout_6.setSpacing(0)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.groupBox_2 = QGroupBox(self.profilesTab)
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.verticalLayout_3 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.profilesList = QListWidget(self.groupBox_2)
+        self.profilesList.setObjectName("profilesList")
+        self.profilesList.setSizeAdjustPolicy(
+            QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents
+        )
+
+        self.horizontalLayout_7.addWidget(self.profilesList)
+
+        self.profilesCreateDefault = QPushButton(self.groupBox_2)
+        self.profilesCreateDefault.setObjectName("profilesCreateDefault")
+
+        self.horizontalLayout_7.addWidget(self.profilesCreateDefault)
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_7)
+
+        self.verticalLayout_6.addWidget(self.groupBox_2)
+
+        self.groupBox = QGroupBox(self.profilesTab)
+        self.groupBox.setObjectName("groupBox")
+        self.verticalLayout_4 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_4.setSpacing(0)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setSpacing(0)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.profilesTable = KeyValueTable(self.groupBox)
+        if self.profilesTable.columnCount() < 2:
+            self.profilesTable.setColumnCount(2)
+        __qtablewidgetitem = QTableWidgetItem()
+        self.profilesTable.setHorizontalHeaderItem(0, __qtablewidgetitem)
+        __qtablewidgetitem1 = QTableWidgetItem()
+        self.profilesTable.setHorizontalHeaderItem(1, __qtablewidgetitem1)
+        self.profilesTable.setObjectName("profilesTable")
+        self.profilesTable.setSizeAdjustPolicy(
+            QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents
+        )
+        self.profilesTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.profilesTable.setAlternatingRowColors(True)
+        self.profilesTable.setSelectionMode(
+            QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self.profilesTable.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.profilesTable.horizontalHeader().setStretchLastSection(True)
+        self.profilesTable.verticalHeader().setVisible(False)
+
+        self.horizontalLayout_5.addWidget(self.profilesTable)
+
+        self.profilesTableButtons = QDialogButtonBox(self.groupBox)
+        self.profilesTableButtons.setObjectName("profilesTableButtons")
+        self.profilesTableButtons.setOrientation(Qt.Orientation.Vertical)
+        self.profilesTableButtons.setStandardButtons(
+            QDialogButtonBox.StandardButton.Close | QDialogButtonBox.StandardButton.Open
+        )
+
+        self.horizontalLayout_5.addWidget(self.profilesTableButtons)
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_5)
+
+        self.verticalLayout_6.addWidget(self.groupBox)
+
+        self.verticalLayout_7.addLayout(self.verticalLayout_6)
+
+        self.localCacheInfo.addTab(self.profilesTab, "")
+        self.configTab = QWidget()
+        self.configTab.setObjectName("configTab")
+        self.verticalLayout_9 = QVBoxLayout(self.configTab)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.configPrintRunCommands = QCheckBox(self.configTab)
+        self.configPrintRunCommands.setObjectName("configPrintRunCommands")
+
+        self.verticalLayout_9.addWidget(self.configPrintRunCommands)
+
+        self.configRevisions = QCheckBox(self.configTab)
+        self.configRevisions.setObjectName("configRevisions")
+
+        self.verticalLayout_9.addWidget(self.configRevisions)
+
+        self.verticalSpacer_8 = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_9.addItem(self.verticalSpacer_8)
+
+        self.localCacheInfo.addTab(self.configTab, "")
+        self.remotesTab = QWidget()
+        self.remotesTab.setObjectName("remotesTab")
+        self.verticalLayout_10 = QVBoxLayout(self.remotesTab)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setSpacing(0)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.remotesTable = RemotesTable(self.remotesTab)
+        if self.remotesTable.columnCount() < 3:
+            self.remotesTable.setColumnCount(3)
+        __qtablewidgetitem2 = QTableWidgetItem()
+        self.remotesTable.setHorizontalHeaderItem(0, __qtablewidgetitem2)
+        __qtablewidgetitem3 = QTableWidgetItem()
+        self.remotesTable.setHorizontalHeaderItem(1, __qtablewidgetitem3)
+        __qtablewidgetitem4 = QTableWidgetItem()
+        self.remotesTable.setHorizontalHeaderItem(2, __qtablewidgetitem4)
+        self.remotesTable.setObjectName("remotesTable")
+        self.remotesTable.setSizeAdjustPolicy(
+            QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents
+        )
+        self.remotesTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.remotesTable.setDragDropOverwriteMode(False)
+        self.remotesTable.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self.remotesTable.setDefaultDropAction(Qt.DropAction.MoveAction)
+        self.remotesTable.setAlternatingRowColors(True)
+        self.remotesTable.setSelectionMode(
+            QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self.remotesTable.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.remotesTable.horizontalHeader().setStretchLastSection(True)
+        self.remotesTable.verticalHeader().setVisible(False)
+        self.remotesTable.verticalHeader().setStretchLastSection(False)
+
+        self.horizontalLayout_3.addWidget(self.remotesTable)
+
+        self.remotesTableButtons = QDialogButtonBox(self.remotesTab)
+        self.remotesTableButtons.setObjectName("remotesTableButtons")
+        self.remotesTableButtons.setOrientation(Qt.Orientation.Vertical)
+        self.remotesTableButtons.setStandardButtons(
+            QDialogButtonBox.StandardButton.Close | QDialogButtonBox.StandardButton.Open
+        )
+
+        self.horizontalLayout_3.addWidget(self.remotesTableButtons)
+
+        self.verticalLayout_10.addLayout(self.horizontalLayout_3)
+
+        self.localCacheInfo.addTab(self.remotesTab, "")
+        self.hooksTab = QWidget()
+        self.hooksTab.setObjectName("hooksTab")
+        self.verticalLayout_11 = QVBoxLayout(self.hooksTab)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.hooksLayout = QVBoxLayout()
+        self.hooksLayout.setSpacing(0)
+        self.hooksLayout.setObjectName("hooksLayout")
+        self.hooksTable = QTableWidget(self.hooksTab)
+        if self.hooksTable.columnCount() < 2:
+            self.hooksTable.setColumnCount(2)
+        __qtablewidgetitem5 = QTableWidgetItem()
+        self.hooksTable.setHorizontalHeaderItem(0, __qtablewidgetitem5)
+        __qtablewidgetitem6 = QTableWidgetItem()
+        self.hooksTable.setHorizontalHeaderItem(1, __qtablewidgetitem6)
+        self.hooksTable.setObjectName("hooksTable")
+        self.hooksTable.setSizeAdjustPolicy(
+            QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents
+        )
+        self.hooksTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.hooksTable.setAlternatingRowColors(True)
+        self.hooksTable.setSelectionMode(
+            QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self.hooksTable.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.hooksTable.horizontalHeader().setStretchLastSection(True)
+        self.hooksTable.verticalHeader().setVisible(False)
+        self.hooksTable.verticalHeader().setStretchLastSection(False)
+
+        self.hooksLayout.addWidget(self.hooksTable)
+
+        self.verticalLayout_11.addLayout(self.hooksLayout)
+
+        self.localCacheInfo.addTab(self.hooksTab, "")
+        self.environmentTab = QWidget()
+        self.environmentTab.setObjectName("environmentTab")
+        self.verticalLayout_12 = QVBoxLayout(self.environmentTab)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.groupBox_3 = QGroupBox(self.environmentTab)
+        self.groupBox_3.setObjectName("groupBox_3")
+        self.horizontalLayout_4 = QHBoxLayout(self.groupBox_3)
+        self.horizontalLayout_4.setSpacing(0)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.envTable = KeyValueTable(self.groupBox_3)
+        if self.envTable.columnCount() < 2:
+            self.envTable.setColumnCount(2)
+        __qtablewidgetitem7 = QTableWidgetItem()
+        self.envTable.setHorizontalHeaderItem(0, __qtablewidgetitem7)
+        __qtablewidgetitem8 = QTableWidgetItem()
+        self.envTable.setHorizontalHeaderItem(1, __qtablewidgetitem8)
+        self.envTable.setObjectName("envTable")
+        self.envTable.setSizeAdjustPolicy(
+            QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents
+        )
+        self.envTable.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked)
+        self.envTable.setAlternatingRowColors(True)
+        self.envTable.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.envTable.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.envTable.horizontalHeader().setStretchLastSection(True)
+        self.envTable.verticalHeader().setVisible(False)
+
+        self.horizontalLayout_4.addWidget(self.envTable)
+
+        self.envTableButtons = QDialogButtonBox(self.groupBox_3)
+        self.envTableButtons.setObjectName("envTableButtons")
+        self.envTableButtons.setOrientation(Qt.Orientation.Vertical)
+        self.envTableButtons.setStandardButtons(
+            QDialogButtonBox.StandardButton.Close | QDialogButtonBox.StandardButton.Open
+        )
+
+        self.horizontalLayout_4.addWidget(self.envTableButtons)
+
+        self.verticalLayout_12.addWidget(self.groupBox_3)
+
+        self.groupBox_4 = QGroupBox(self.environmentTab)
+        self.groupBox_4.setObjectName("groupBox_4")
+        self.horizontalLayout_6 = QHBoxLayout(self.groupBox_4)
+        self.horizontalLayout_6.setSpacing(0)
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.envRemoveList = QListWidget(self.groupBox_4)
+        self.envRemoveList.setObjectName("envRemoveList")
+        self.envRemoveList.setSizeAdjustPolicy(
+            QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents
+        )
+        self.envRemoveList.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked)
+        self.envRemoveList.setAlternatingRowColors(True)
+        self.envRemoveList.setSelectionMode(
+            QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self.envRemoveList.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+
+        self.horizontalLayout_6.addWidget(self.envRemoveList)
+
+        self.envRemoveButtons = QDialogButtonBox(self.groupBox_4)
+        self.envRemoveButtons.setObjectName("envRemoveButtons")
+        self.envRemoveButtons.setOrientation(Qt.Orientation.Vertical)
+        self.envRemoveButtons.setStandardButtons(
+            QDialogButtonBox.StandardButton.Close | QDialogButtonBox.StandardButton.Open
+        )
+
+        self.horizontalLayout_6.addWidget(self.envRemoveButtons)
+
+        self.verticalLayout_12.addWidget(self.groupBox_4)
+
+        self.verticalSpacer = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_12.addItem(self.verticalSpacer)
+
+        self.localCacheInfo.addTab(self.environmentTab, "")
+
+        self.verticalLayout_5.addWidget(self.localCacheInfo)
+
+        self.verticalSpacer_3 = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        )
+
+        self.verticalLayout_5.addItem(self.verticalSpacer_3)
+
+        self.operationsBox = QGroupBox(ManageLocalCaches)
+        self.operationsBox.setObjectName("operationsBox")
+        self.operationsBox.setFlat(False)
+        self.verticalLayout_2 = QVBoxLayout(self.operationsBox)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.horizontalSpacer_3 = QSpacerItem(
+            40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
+        )
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_3)
+
+        self.operations_installConfigButton = QPushButton(self.operationsBox)
+        self.operations_installConfigButton.setObjectName(
+            "operations_installConfigButton"
+        )
+
+        self.horizontalLayout_2.addWidget(self.operations_installConfigButton)
+
+        self.operations_removeLocksButton = QPushButton(self.operationsBox)
+        self.operations_removeLocksButton.setObjectName("operations_removeLocksButton")
+
+        self.horizontalLayout_2.addWidget(self.operations_removeLocksButton)
+
+        self.operations_removeAllPackagesButton = QPushButton(self.operationsBox)
+        self.operations_removeAllPackagesButton.setObjectName(
+            "operations_removeAllPackagesButton"
+        )
+
+        self.horizontalLayout_2.addWidget(self.operations_removeAllPackagesButton)
+
+        self.horizontalSpacer_2 = QSpacerItem(
+            40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
+        )
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.horizontalSpacer_4 = QSpacerItem(
+            40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
+        )
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_4)
+
+        self.moveCacheButton = QPushButton(self.operationsBox)
+        self.moveCacheButton.setObjectName("moveCacheButton")
+
+        self.horizontalLayout.addWidget(self.moveCacheButton)
+
+        self.deleteCacheButton = QPushButton(self.operationsBox)
+        self.deleteCacheButton.setObjectName("deleteCacheButton")
+
+        self.horizontalLayout.addWidget(self.deleteCacheButton)
+
+        self.runConanCommandButton = QPushButton(self.operationsBox)
+        self.runConanCommandButton.setObjectName("runConanCommandButton")
+
+        self.horizontalLayout.addWidget(self.runConanCommandButton)
+
+        self.horizontalSpacer_5 = QSpacerItem(
+            40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
+        )
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_5)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.verticalLayout_5.addWidget(self.operationsBox)
+
+        self.localCacheLog = QPlainTextEdit(ManageLocalCaches)
+        self.localCacheLog.setObjectName("localCacheLog")
+        self.localCacheLog.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.localCacheLog.setSizeAdjustPolicy(
+            QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents
+        )
+        self.localCacheLog.setUndoRedoEnabled(False)
+        self.localCacheLog.setReadOnly(True)
+
+        self.verticalLayout_5.addWidget(self.localCacheLog)
+
+        self.buttonBox = QDialogButtonBox(ManageLocalCaches)
+        self.buttonBox.setObjectName("buttonBox")
+        self.buttonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(
+            QDialogButtonBox.StandardButton.Apply
+            | QDialogButtonBox.StandardButton.Cancel
+            | QDialogButtonBox.StandardButton.Ok
+        )
+
+        self.verticalLayout_5.addWidget(self.buttonBox)
+
+        self.verticalLayout.addLayout(self.verticalLayout_5)
+
+        self.retranslateUi(ManageLocalCaches)
+        self.buttonBox.accepted.connect(ManageLocalCaches.accept)
+        self.buttonBox.rejected.connect(ManageLocalCaches.reject)
+
+        self.localCacheInfo.setCurrentIndex(0)
+
+        QMetaObject.connectSlotsByName(ManageLocalCaches)
+
+    # setupUi
+
+    def retranslateUi(self, ManageLocalCaches):
+        ManageLocalCaches.setWindowTitle(
+            QCoreApplication.translate("ManageLocalCaches", "Manage Local Caches", None)
+        )
+        # if QT_CONFIG(tooltip)
+        self.local_cache_names.setToolTip(
+            QCoreApplication.translate(
+                "ManageLocalCaches", "List of all local caches cruiz is aware of", None
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        # if QT_CONFIG(tooltip)
+        self.new_local_cache_button.setToolTip(
+            QCoreApplication.translate(
+                "ManageLocalCaches", "Create a new local cache", None
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.new_local_cache_button.setText(
+            QCoreApplication.translate("ManageLocalCaches", "New...", None)
+        )
+        self.loc_conan_user_home_short_label.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Cache short home", None)
+        )
+        self.label_5.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Cache home", None)
+        )
+        # if QT_CONFIG(tooltip)
+        self.localCacheRecipeCount.setToolTip(
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Number of recipes in cruiz associated with this cache.  A cache can only be deleted when there are no recipe associations.",
+                None,
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.localCacheRecipeCount.setText(
+            QCoreApplication.translate("ManageLocalCaches", "TextLabel", None)
+        )
+        self.localCacheInfo.setTabText(
+            self.localCacheInfo.indexOf(self.locationsTab),
+            QCoreApplication.translate("ManageLocalCaches", "Locations", None),
+        )
+        # if QT_CONFIG(tooltip)
+        self.localCacheInfo.setTabToolTip(
+            self.localCacheInfo.indexOf(self.locationsTab),
+            QCoreApplication.translate(
+                "ManageLocalCaches", "Locations of relevance to the local cache", None
+            ),
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.groupBox_2.setTitle(
+            QCoreApplication.translate("ManageLocalCaches", "Available profiles", None)
+        )
+        self.profilesCreateDefault.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Create Default", None)
+        )
+        self.groupBox.setTitle(
+            QCoreApplication.translate(
+                "ManageLocalCaches", "Extra profile directories", None
+            )
+        )
+        ___qtablewidgetitem = self.profilesTable.horizontalHeaderItem(0)
+        ___qtablewidgetitem.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Name", None)
+        )
+        ___qtablewidgetitem1 = self.profilesTable.horizontalHeaderItem(1)
+        ___qtablewidgetitem1.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Directory", None)
+        )
+        self.localCacheInfo.setTabText(
+            self.localCacheInfo.indexOf(self.profilesTab),
+            QCoreApplication.translate("ManageLocalCaches", "Profiles", None),
+        )
+        # if QT_CONFIG(tooltip)
+        self.localCacheInfo.setTabToolTip(
+            self.localCacheInfo.indexOf(self.profilesTab),
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Extra directories to search for profiles (other than in the cache itself), and filenames of profiles that are visible to the cache.",
+                None,
+            ),
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.configPrintRunCommands.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Print run commands", None)
+        )
+        self.configRevisions.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Revisions", None)
+        )
+        self.localCacheInfo.setTabText(
+            self.localCacheInfo.indexOf(self.configTab),
+            QCoreApplication.translate("ManageLocalCaches", "Config", None),
+        )
+        # if QT_CONFIG(tooltip)
+        self.localCacheInfo.setTabToolTip(
+            self.localCacheInfo.indexOf(self.configTab),
+            QCoreApplication.translate(
+                "ManageLocalCaches", "Current cache configuration state", None
+            ),
+        )
+        # endif // QT_CONFIG(tooltip)
+        ___qtablewidgetitem2 = self.remotesTable.horizontalHeaderItem(0)
+        ___qtablewidgetitem2.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Enabled", None)
+        )
+        ___qtablewidgetitem3 = self.remotesTable.horizontalHeaderItem(1)
+        ___qtablewidgetitem3.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Name", None)
+        )
+        ___qtablewidgetitem4 = self.remotesTable.horizontalHeaderItem(2)
+        ___qtablewidgetitem4.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Url", None)
+        )
+        self.localCacheInfo.setTabText(
+            self.localCacheInfo.indexOf(self.remotesTab),
+            QCoreApplication.translate("ManageLocalCaches", "Remotes", None),
+        )
+        # if QT_CONFIG(tooltip)
+        self.localCacheInfo.setTabToolTip(
+            self.localCacheInfo.indexOf(self.remotesTab),
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Remotes used to search for package installs by this cache",
+                None,
+            ),
+        )
+        # endif // QT_CONFIG(tooltip)
+        ___qtablewidgetitem5 = self.hooksTable.horizontalHeaderItem(0)
+        ___qtablewidgetitem5.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Enabled", None)
+        )
+        ___qtablewidgetitem6 = self.hooksTable.horizontalHeaderItem(1)
+        ___qtablewidgetitem6.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Path", None)
+        )
+        self.localCacheInfo.setTabText(
+            self.localCacheInfo.indexOf(self.hooksTab),
+            QCoreApplication.translate("ManageLocalCaches", "Hooks", None),
+        )
+        # if QT_CONFIG(tooltip)
+        self.localCacheInfo.setTabToolTip(
+            self.localCacheInfo.indexOf(self.hooksTab),
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Hooks and their status used by commands in this cache",
+                None,
+            ),
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.groupBox_3.setTitle(
+            QCoreApplication.translate("ManageLocalCaches", "Additions", None)
+        )
+        ___qtablewidgetitem7 = self.envTable.horizontalHeaderItem(0)
+        ___qtablewidgetitem7.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Name", None)
+        )
+        ___qtablewidgetitem8 = self.envTable.horizontalHeaderItem(1)
+        ___qtablewidgetitem8.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Value", None)
+        )
+        self.groupBox_4.setTitle(
+            QCoreApplication.translate("ManageLocalCaches", "Removals", None)
+        )
+        self.localCacheInfo.setTabText(
+            self.localCacheInfo.indexOf(self.environmentTab),
+            QCoreApplication.translate("ManageLocalCaches", "Environment", None),
+        )
+        # if QT_CONFIG(tooltip)
+        self.localCacheInfo.setTabToolTip(
+            self.localCacheInfo.indexOf(self.environmentTab),
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Environment variables applied to conan commands in this cache",
+                None,
+            ),
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.operationsBox.setTitle(
+            QCoreApplication.translate("ManageLocalCaches", "Operations", None)
+        )
+        # if QT_CONFIG(tooltip)
+        self.operations_installConfigButton.setToolTip(
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Install an external configuration onto the local cache",
+                None,
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.operations_installConfigButton.setText(
+            QCoreApplication.translate(
+                "ManageLocalCaches", "Install configuration...", None
+            )
+        )
+        # if QT_CONFIG(tooltip)
+        self.operations_removeLocksButton.setToolTip(
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Remove all locks from within the local cache which may otherwise block some commands",
+                None,
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.operations_removeLocksButton.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Remove locks", None)
+        )
+        # if QT_CONFIG(tooltip)
+        self.operations_removeAllPackagesButton.setToolTip(
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Remove all installed packages from the local cache",
+                None,
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.operations_removeAllPackagesButton.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Remove all packages", None)
+        )
+        # if QT_CONFIG(tooltip)
+        self.moveCacheButton.setToolTip(
+            QCoreApplication.translate(
+                "ManageLocalCaches", "Move the location of the local cache", None
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.moveCacheButton.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Move...", None)
+        )
+        # if QT_CONFIG(tooltip)
+        self.deleteCacheButton.setToolTip(
+            QCoreApplication.translate(
+                "ManageLocalCaches",
+                "Delete the local cache, from disk and from cruiz",
+                None,
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.deleteCacheButton.setText(
+            QCoreApplication.translate("ManageLocalCaches", "Delete...", None)
+        )
+        self.runConanCommandButton.setText(
+            QCoreApplication.translate(
+                "ManageLocalCaches", "Run Conan command...", None
+            )
+        )
+
+    # retranslateUi
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'local_cache_remove_environment.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QLocale,
+    QMetaObject,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QTime,
+    QUrl,
+    Qt,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QConicalGradient,
+    QCursor,
+    QFont,
+    QFontDatabase,
+    QGradient,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
+from PySide6.QtWidgets import (
+    QAbstractButton,
+    QApplication,
+    QDialog,
+    QDialogButtonBox,
+    QFrame,
+    QGridLayout,
+    QLabel,
+    QSizePolicy,
+    QVBoxLayout,
+    QWidget,
+)
+
+from cruiz.manage_local_cache.widgets.configpathorurl import (
+    LineEditWithCustomContextMenu,
+)
+
+
+class Ui_RemoveEnvironmentDialog(object):
+    def setupUi(self, RemoveEnvironmentDialog):
+        if not RemoveEnvironmentDialog.objectName():
+            RemoveEnvironmentDialog.setObjectName("RemoveEnvironmentDialog")
+        RemoveEnvironmentDialog.resize(447, 181)
+        self.verticalLayout = QVBoxLayout(RemoveEnvironmentDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_3 = QLabel(RemoveEnvironmentDialog)
+        self.label_3.setObjectName("label_3")
+        self.label_3.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label_3.setWordWrap(True)
+
+        self.verticalLayout_2.addWidget(self.label_3)
+
+        self.line = QFrame(RemoveEnvironmentDialog)
+        self.line.setObjectName("line")
+        self.line.setFrameShape(QFrame.Shape.HLine)
+        self.line.setFrameShadow(QFrame.Shadow.Sunken)
+
+        self.verticalLayout_2.addWidget(self.line)
+
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.label = QLabel(RemoveEnvironmentDialog)
+        self.label.setObjectName("label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.name = LineEditWithCustomContextMenu(RemoveEnvironmentDialog)
+        self.name.setObjectName("name")
+
+        self.gridLayout.addWidget(self.name, 0, 1, 1, 1)
+
+        self.verticalLayout_2.addLayout(self.gridLayout)
+
+        self.buttonBox = QDialogButtonBox(RemoveEnvironmentDialog)
+        self.buttonBox.setObjectName("buttonBox")
+        self.buttonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(
+            QDialogButtonBox.StandardButton.Cancel | QDialogButtonBox.StandardButton.Ok
+        )
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+        self.verticalLayout.addLayout(self.verticalLayout_2)
+
+        self.retranslateUi(RemoveEnvironmentDialog)
+        self.buttonBox.accepted.connect(RemoveEnvironmentDialog.accept)
+        self.buttonBox.rejected.connect(RemoveEnvironmentDialog.reject)
+
+        QMetaObject.connectSlotsByName(RemoveEnvironmentDialog)
+
+    # setupUi
+
+    def retranslateUi(self, RemoveEnvironmentDialog):
+        RemoveEnvironmentDialog.setWindowTitle(
+            QCoreApplication.translate(
+                "RemoveEnvironmentDialog", "Remove from environment", None
+            )
+        )
+        self.label_3.setText(
+            QCoreApplication.translate(
+                "RemoveEnvironmentDialog",
+                "Remove environment variable for all commands run through this local cache.",
+                None,
+            )
+        )
+        self.label.setText(
+            QCoreApplication.translate("RemoveEnvironmentDialog", "Name", None)
+        )
+        self.name.setText("")
+        self.name.setPlaceholderText(
+            QCoreApplication.translate(
+                "RemoveEnvironmentDialog", "Name of the variable", None
+            )
+        )
+
+    # retranslateUi
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'local_cache_run_command_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QLocale,
+    QMetaObject,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QTime,
+    QUrl,
+    Qt,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QConicalGradient,
+    QCursor,
+    QFont,
+    QFontDatabase,
+    QGradient,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
+from PySide6.QtWidgets import (
+    QAbstractScrollArea,
+    QApplication,
+    QDialog,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPlainTextEdit,
+    QPushButton,
+    QSizePolicy,
+    QVBoxLayout,
+    QWidget,
+)
+
+
+class Ui_RunConanCommandDialog(object):
+    def setupUi(self, RunConanCommandDialog):
+        if not RunConanCommandDialog.objectName():
+            RunConanCommandDialog.setObjectName("RunConanCommandDialog")
+        RunConanCommandDialog.resize(597, 259)
+        self.verticalLayout = QVBoxLayout(RunConanCommandDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label_2 = QLabel(RunConanCommandDialog)
+        self.label_2.setObjectName("label_2")
+
+        self.verticalLayout.addWidget(self.label_2)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label = QLabel(RunConanCommandDialog)
+        self.label.setObjectName("label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.arguments = QLineEdit(RunConanCommandDialog)
+        self.arguments.setObjectName("arguments")
+
+        self.horizontalLayout.addWidget(self.arguments)
+
+        self.run = QPushButton(RunConanCommandDialog)
+        self.run.setObjectName("run")
+
+        self.horizontalLayout.addWidget(self.run)
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.log = QPlainTextEdit(RunConanCommandDialog)
+        self.log.setObjectName("log")
+        self.log.setSizeAdjustPolicy(
+            QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents
+        )
+        self.log.setUndoRedoEnabled(False)
+        self.log.setReadOnly(True)
+
+        self.verticalLayout.addWidget(self.log)
+
+        self.retranslateUi(RunConanCommandDialog)
+
+        QMetaObject.connectSlotsByName(RunConanCommandDialog)
+
+    # setupUi
+
+    def retranslateUi(self, RunConanCommandDialog):
+        RunConanCommandDialog.setWindowTitle(
+            QCoreApplication.translate(
+                "RunConanCommandDialog", "Run Conan command in local cache", None
+            )
+        )
+        self.label_2.setText(
+            QCoreApplication.translate(
+                "RunConanCommandDialog",
+                "Enter the arguments to Conan to run the command in the selected local cache.",
+                None,
+            )
+        )
+        self.label.setText(
+            QCoreApplication.translate("RunConanCommandDialog", "conan", None)
+        )
+        self.arguments.setPlaceholderText(
+            QCoreApplication.translate("RunConanCommandDialog", "<arguments>", None)
+        )
+        self.run.setText(
+            QCoreApplication.translate("RunConanCommandDialog", "Run", None)
+        )
+
+    # retranslateUi
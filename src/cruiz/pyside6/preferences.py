@@ -0,0 +1,1000 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'preferences.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QAbstractItemView, QAbstractScrollArea, QApplication,
+    QCheckBox, QComboBox, QDialog, QDialogButtonBox,
+    QGridLayout, QGroupBox, QHeaderView, QLabel,
+    QLineEdit, QListView, QPushButton, QSizePolicy,
+    QSpacerItem, QTableView, QToolBox, QVBoxLayout,
+    QWidget)
+
+from cruiz.widgets.shortcutlineedit import ShortcutLineEdit
+
+class Ui_PreferencesDialog(object):
+    def setupUi(self, PreferencesDialog):
+        if not PreferencesDialog.objectName():
+            PreferencesDialog.setObjectName(u"PreferencesDialog")
+        PreferencesDialog.resize(678, 670)
+        self.actionForget_recipe = QAction(PreferencesDialog)
+        self.actionForget_recipe.setObjectName(u"actionForget_recipe")
+        self.actionForget_config = QAction(PreferencesDialog)
+        self.actionForget_config.setObjectName(u"actionForget_config")
+        self.actionForget_remote = QAction(PreferencesDialog)
+        self.actionForget_remote.setObjectName(u"actionForget_remote")
+        self.verticalLayout = QVBoxLayout(PreferencesDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.prefs_toolbox = QToolBox(PreferencesDialog)
+        self.prefs_toolbox.setObjectName(u"prefs_toolbox")
+        self.prefs_general = QWidget()
+        self.prefs_general.setObjectName(u"prefs_general")
+        self.prefs_general.setGeometry(QRect(0, 0, 654, 252))
+        self.gridLayout = QGridLayout(self.prefs_general)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout.addItem(self.verticalSpacer, 15, 2, 1, 1)
+
+        self.prefs_general_enable_compact = QCheckBox(self.prefs_general)
+        self.prefs_general_enable_compact.setObjectName(u"prefs_general_enable_compact")
+        self.prefs_general_enable_compact.setVisible(False)
+
+        self.gridLayout.addWidget(self.prefs_general_enable_compact, 4, 2, 1, 1)
+
+        self.prefs_general_found_text_background_colour = QPushButton(self.prefs_general)
+        self.prefs_general_found_text_background_colour.setObjectName(u"prefs_general_found_text_background_colour")
+
+        self.gridLayout.addWidget(self.prefs_general_found_text_background_colour, 7, 2, 1, 1)
+
+        self.prefs_general_default_recipe_dir = QLineEdit(self.prefs_general)
+        self.prefs_general_default_recipe_dir.setObjectName(u"prefs_general_default_recipe_dir")
+
+        self.gridLayout.addWidget(self.prefs_general_default_recipe_dir, 5, 2, 1, 1)
+
+        self.prefs_general_recipe_editor = QLineEdit(self.prefs_general)
+        self.prefs_general_recipe_editor.setObjectName(u"prefs_general_recipe_editor")
+
+        self.gridLayout.addWidget(self.prefs_general_recipe_editor, 14, 2, 1, 1)
+
+        self.label = QLabel(self.prefs_general)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 5, 0, 1, 1)
+
+        self.label_30 = QLabel(self.prefs_general)
+        self.label_30.setObjectName(u"label_30")
+
+        self.gridLayout.addWidget(self.label_30, 7, 0, 1, 1)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout.addItem(self.verticalSpacer_3, 15, 0, 1, 1)
+
+        self.prefs_general_clearpanes = QCheckBox(self.prefs_general)
+        self.prefs_general_clearpanes.setObjectName(u"prefs_general_clearpanes")
+
+        self.gridLayout.addWidget(self.prefs_general_clearpanes, 0, 2, 1, 1)
+
+        self.prefs_general_busy_colour = QPushButton(self.prefs_general)
+        self.prefs_general_busy_colour.setObjectName(u"prefs_general_busy_colour")
+
+        self.gridLayout.addWidget(self.prefs_general_busy_colour, 6, 2, 1, 1)
+
+        self.prefs_general_combine_panes = QCheckBox(self.prefs_general)
+        self.prefs_general_combine_panes.setObjectName(u"prefs_general_combine_panes")
+
+        self.gridLayout.addWidget(self.prefs_general_combine_panes, 1, 2, 1, 1)
+
+        self.prefs_general_usebatching = QCheckBox(self.prefs_general)
+        self.prefs_general_usebatching.setObjectName(u"prefs_general_usebatching")
+
+        self.gridLayout.addWidget(self.prefs_general_usebatching, 2, 2, 1, 1)
+
+        self.prefs_general_enable_wallclock = QCheckBox(self.prefs_general)
+        self.prefs_general_enable_wallclock.setObjectName(u"prefs_general_enable_wallclock")
+
+        self.gridLayout.addWidget(self.prefs_general_enable_wallclock, 3, 2, 1, 1)
+
+        self.label_2 = QLabel(self.prefs_general)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 6, 0, 1, 1)
+
+        self.prefs_general_new_recipe_load = QCheckBox(self.prefs_general)
+        self.prefs_general_new_recipe_load.setObjectName(u"prefs_general_new_recipe_load")
+        self.prefs_general_new_recipe_load.setVisible(False)
+
+        self.gridLayout.addWidget(self.prefs_general_new_recipe_load, 8, 2, 1, 1)
+
+        self.label_33 = QLabel(self.prefs_general)
+        self.label_33.setObjectName(u"label_33")
+
+        self.gridLayout.addWidget(self.label_33, 9, 0, 1, 1)
+
+        self.prefs_general_graph_resolution = QComboBox(self.prefs_general)
+        self.prefs_general_graph_resolution.addItem("")
+        self.prefs_general_graph_resolution.addItem("")
+        self.prefs_general_graph_resolution.addItem("")
+        self.prefs_general_graph_resolution.setObjectName(u"prefs_general_graph_resolution")
+
+        self.gridLayout.addWidget(self.prefs_general_graph_resolution, 9, 2, 1, 1)
+
+        self.label_31 = QLabel(self.prefs_general)
+        self.label_31.setObjectName(u"label_31")
+
+        self.gridLayout.addWidget(self.label_31, 14, 0, 1, 1)
+
+        self.prefs_toolbox.addItem(self.prefs_general, u"General")
+        self.prefs_fonts = QWidget()
+        self.prefs_fonts.setObjectName(u"prefs_fonts")
+        self.prefs_fonts.setGeometry(QRect(0, 0, 426, 233))
+        self.verticalLayout_2 = QVBoxLayout(self.prefs_fonts)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(self.prefs_fonts)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout_2 = QGridLayout(self.groupBox)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.prefs_font_ui_label = QLabel(self.groupBox)
+        self.prefs_font_ui_label.setObjectName(u"prefs_font_ui_label")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.prefs_font_ui_label.sizePolicy().hasHeightForWidth())
+        self.prefs_font_ui_label.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.prefs_font_ui_label, 0, 0, 1, 1)
+
+        self.prefs_font_ui_preview = QLabel(self.groupBox)
+        self.prefs_font_ui_preview.setObjectName(u"prefs_font_ui_preview")
+        sizePolicy.setHeightForWidth(self.prefs_font_ui_preview.sizePolicy().hasHeightForWidth())
+        self.prefs_font_ui_preview.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.prefs_font_ui_preview, 1, 0, 1, 1)
+
+        self.prefs_font_ui_reset = QPushButton(self.groupBox)
+        self.prefs_font_ui_reset.setObjectName(u"prefs_font_ui_reset")
+
+        self.gridLayout_2.addWidget(self.prefs_font_ui_reset, 1, 1, 1, 1)
+
+        self.prefs_font_ui_change = QPushButton(self.groupBox)
+        self.prefs_font_ui_change.setObjectName(u"prefs_font_ui_change")
+
+        self.gridLayout_2.addWidget(self.prefs_font_ui_change, 0, 1, 1, 1)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(self.prefs_fonts)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout_3 = QGridLayout(self.groupBox_2)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.prefs_font_output_label = QLabel(self.groupBox_2)
+        self.prefs_font_output_label.setObjectName(u"prefs_font_output_label")
+        sizePolicy.setHeightForWidth(self.prefs_font_output_label.sizePolicy().hasHeightForWidth())
+        self.prefs_font_output_label.setSizePolicy(sizePolicy)
+
+        self.gridLayout_3.addWidget(self.prefs_font_output_label, 0, 0, 1, 1)
+
+        self.prefs_font_output_preview = QLabel(self.groupBox_2)
+        self.prefs_font_output_preview.setObjectName(u"prefs_font_output_preview")
+        sizePolicy.setHeightForWidth(self.prefs_font_output_preview.sizePolicy().hasHeightForWidth())
+        self.prefs_font_output_preview.setSizePolicy(sizePolicy)
+
+        self.gridLayout_3.addWidget(self.prefs_font_output_preview, 1, 0, 1, 1)
+
+        self.prefs_font_output_reset = QPushButton(self.groupBox_2)
+        self.prefs_font_output_reset.setObjectName(u"prefs_font_output_reset")
+
+        self.gridLayout_3.addWidget(self.prefs_font_output_reset, 1, 1, 1, 1)
+
+        self.prefs_font_output_change = QPushButton(self.groupBox_2)
+        self.prefs_font_output_change.setObjectName(u"prefs_font_output_change")
+
+        self.gridLayout_3.addWidget(self.prefs_font_output_change, 0, 1, 1, 1)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_2)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_2)
+
+        self.prefs_toolbox.addItem(self.prefs_fonts, u"Fonts")
+        self.prefs_conan = QWidget()
+        self.prefs_conan.setObjectName(u"prefs_conan")
+        self.prefs_conan.setGeometry(QRect(0, 0, 339, 172))
+        self.verticalLayout_3 = QVBoxLayout(self.prefs_conan)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.groupBox_3 = QGroupBox(self.prefs_conan)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout_4 = QGridLayout(self.groupBox_3)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.label_7 = QLabel(self.groupBox_3)
+        self.label_7.setObjectName(u"label_7")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.label_7.sizePolicy().hasHeightForWidth())
+        self.label_7.setSizePolicy(sizePolicy1)
+
+        self.gridLayout_4.addWidget(self.label_7, 0, 0, 1, 1)
+
+        self.prefs_conan_log_level = QComboBox(self.groupBox_3)
+        self.prefs_conan_log_level.addItem("")
+        self.prefs_conan_log_level.addItem("")
+        self.prefs_conan_log_level.addItem("")
+        self.prefs_conan_log_level.addItem("")
+        self.prefs_conan_log_level.addItem("")
+        self.prefs_conan_log_level.addItem("")
+        self.prefs_conan_log_level.setObjectName(u"prefs_conan_log_level")
+
+        self.gridLayout_4.addWidget(self.prefs_conan_log_level, 0, 1, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_3)
+
+        self.groupBox_4 = QGroupBox(self.prefs_conan)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.gridLayout_5 = QGridLayout(self.groupBox_4)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.label_8 = QLabel(self.groupBox_4)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout_5.addWidget(self.label_8, 0, 0, 1, 1)
+
+        self.prefs_conan_version_list_path_segment = QLineEdit(self.groupBox_4)
+        self.prefs_conan_version_list_path_segment.setObjectName(u"prefs_conan_version_list_path_segment")
+
+        self.gridLayout_5.addWidget(self.prefs_conan_version_list_path_segment, 0, 1, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_4)
+
+        self.verticalSpacer_4 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer_4)
+
+        self.prefs_toolbox.addItem(self.prefs_conan, u"Conan")
+        self.prefs_localcache = QWidget()
+        self.prefs_localcache.setObjectName(u"prefs_localcache")
+        self.prefs_localcache.setGeometry(QRect(0, 0, 295, 203))
+        self.verticalLayout_4 = QVBoxLayout(self.prefs_localcache)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.groupBox_5 = QGroupBox(self.prefs_localcache)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.gridLayout_6 = QGridLayout(self.groupBox_5)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.label_9 = QLabel(self.groupBox_5)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout_6.addWidget(self.label_9, 0, 0, 1, 1)
+
+        self.prefs_localcache_config_to_install = QLineEdit(self.groupBox_5)
+        self.prefs_localcache_config_to_install.setObjectName(u"prefs_localcache_config_to_install")
+
+        self.gridLayout_6.addWidget(self.prefs_localcache_config_to_install, 0, 1, 1, 1)
+
+        self.label_10 = QLabel(self.groupBox_5)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout_6.addWidget(self.label_10, 1, 0, 1, 1)
+
+        self.prefs_localcache_config_git_branch = QLineEdit(self.groupBox_5)
+        self.prefs_localcache_config_git_branch.setObjectName(u"prefs_localcache_config_git_branch")
+
+        self.gridLayout_6.addWidget(self.prefs_localcache_config_git_branch, 1, 1, 1, 1)
+
+
+        self.verticalLayout_4.addWidget(self.groupBox_5)
+
+        self.groupBox_6 = QGroupBox(self.prefs_localcache)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.gridLayout_7 = QGridLayout(self.groupBox_6)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.prefs_localcache_do_forget = QPushButton(self.groupBox_6)
+        self.prefs_localcache_do_forget.setObjectName(u"prefs_localcache_do_forget")
+
+        self.gridLayout_7.addWidget(self.prefs_localcache_do_forget, 0, 1, 1, 1)
+
+        self.prefs_localcache_forget_cache = QComboBox(self.groupBox_6)
+        self.prefs_localcache_forget_cache.setObjectName(u"prefs_localcache_forget_cache")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        sizePolicy2.setHorizontalStretch(1)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.prefs_localcache_forget_cache.sizePolicy().hasHeightForWidth())
+        self.prefs_localcache_forget_cache.setSizePolicy(sizePolicy2)
+
+        self.gridLayout_7.addWidget(self.prefs_localcache_forget_cache, 0, 0, 1, 1)
+
+
+        self.verticalLayout_4.addWidget(self.groupBox_6)
+
+        self.verticalSpacer_5 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer_5)
+
+        self.prefs_toolbox.addItem(self.prefs_localcache, u"Local cache")
+        self.prefs_graphviz = QWidget()
+        self.prefs_graphviz.setObjectName(u"prefs_graphviz")
+        self.prefs_graphviz.setGeometry(QRect(0, 0, 302, 79))
+        self.gridLayout_8 = QGridLayout(self.prefs_graphviz)
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.prefs_graphviz_use_graphviz = QCheckBox(self.prefs_graphviz)
+        self.prefs_graphviz_use_graphviz.setObjectName(u"prefs_graphviz_use_graphviz")
+
+        self.gridLayout_8.addWidget(self.prefs_graphviz_use_graphviz, 2, 0, 1, 2)
+
+        self.verticalSpacer_8 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout_8.addItem(self.verticalSpacer_8, 3, 1, 1, 1)
+
+        self.prefs_graphviz_bin_directory = QLineEdit(self.prefs_graphviz)
+        self.prefs_graphviz_bin_directory.setObjectName(u"prefs_graphviz_bin_directory")
+
+        self.gridLayout_8.addWidget(self.prefs_graphviz_bin_directory, 1, 1, 1, 1)
+
+        self.label_11 = QLabel(self.prefs_graphviz)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout_8.addWidget(self.label_11, 1, 0, 1, 1)
+
+        self.label_29 = QLabel(self.prefs_graphviz)
+        self.label_29.setObjectName(u"label_29")
+        self.label_29.setOpenExternalLinks(True)
+
+        self.gridLayout_8.addWidget(self.label_29, 0, 0, 1, 2)
+
+        self.prefs_toolbox.addItem(self.prefs_graphviz, u"GraphViz")
+        self.prefs_cmake = QWidget()
+        self.prefs_cmake.setObjectName(u"prefs_cmake")
+        self.prefs_cmake.setGeometry(QRect(0, 0, 174, 86))
+        self.gridLayout_9 = QGridLayout(self.prefs_cmake)
+        self.gridLayout_9.setObjectName(u"gridLayout_9")
+        self.label_12 = QLabel(self.prefs_cmake)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout_9.addWidget(self.label_12, 0, 0, 1, 1)
+
+        self.prefs_cmake_cmake_bin_directory = QLineEdit(self.prefs_cmake)
+        self.prefs_cmake_cmake_bin_directory.setObjectName(u"prefs_cmake_cmake_bin_directory")
+
+        self.gridLayout_9.addWidget(self.prefs_cmake_cmake_bin_directory, 0, 1, 1, 1)
+
+        self.label_13 = QLabel(self.prefs_cmake)
+        self.label_13.setObjectName(u"label_13")
+
+        self.gridLayout_9.addWidget(self.label_13, 1, 0, 1, 1)
+
+        self.prefs_cmake_ninja_bin_directory = QLineEdit(self.prefs_cmake)
+        self.prefs_cmake_ninja_bin_directory.setObjectName(u"prefs_cmake_ninja_bin_directory")
+
+        self.gridLayout_9.addWidget(self.prefs_cmake_ninja_bin_directory, 1, 1, 1, 1)
+
+        self.verticalSpacer_6 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout_9.addItem(self.verticalSpacer_6, 2, 0, 1, 1)
+
+        self.verticalSpacer_7 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout_9.addItem(self.verticalSpacer_7, 2, 1, 1, 1)
+
+        self.prefs_toolbox.addItem(self.prefs_cmake, u"CMake")
+        self.prefs_compilercache = QWidget()
+        self.prefs_compilercache.setObjectName(u"prefs_compilercache")
+        self.prefs_compilercache.setGeometry(QRect(0, 0, 401, 384))
+        self.verticalLayout_5 = QVBoxLayout(self.prefs_compilercache)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.groupBox_7 = QGroupBox(self.prefs_compilercache)
+        self.groupBox_7.setObjectName(u"groupBox_7")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_7)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.prefs_compilercache_default = QComboBox(self.groupBox_7)
+        self.prefs_compilercache_default.addItem("")
+        self.prefs_compilercache_default.addItem("")
+        self.prefs_compilercache_default.addItem("")
+        self.prefs_compilercache_default.addItem("")
+        self.prefs_compilercache_default.setObjectName(u"prefs_compilercache_default")
+
+        self.verticalLayout_6.addWidget(self.prefs_compilercache_default)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox_7)
+
+        self.groupBox_8 = QGroupBox(self.prefs_compilercache)
+        self.groupBox_8.setObjectName(u"groupBox_8")
+        self.gridLayout_10 = QGridLayout(self.groupBox_8)
+        self.gridLayout_10.setObjectName(u"gridLayout_10")
+        self.label_15 = QLabel(self.groupBox_8)
+        self.label_15.setObjectName(u"label_15")
+
+        self.gridLayout_10.addWidget(self.label_15, 1, 0, 1, 1)
+
+        self.prefs_compilercache_ccache_location = QLineEdit(self.groupBox_8)
+        self.prefs_compilercache_ccache_location.setObjectName(u"prefs_compilercache_ccache_location")
+
+        self.gridLayout_10.addWidget(self.prefs_compilercache_ccache_location, 1, 1, 1, 1)
+
+        self.label_14 = QLabel(self.groupBox_8)
+        self.label_14.setObjectName(u"label_14")
+        self.label_14.setOpenExternalLinks(True)
+
+        self.gridLayout_10.addWidget(self.label_14, 0, 0, 1, 2)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox_8)
+
+        self.groupBox_9 = QGroupBox(self.prefs_compilercache)
+        self.groupBox_9.setObjectName(u"groupBox_9")
+        self.gridLayout_11 = QGridLayout(self.groupBox_9)
+        self.gridLayout_11.setObjectName(u"gridLayout_11")
+        self.label_17 = QLabel(self.groupBox_9)
+        self.label_17.setObjectName(u"label_17")
+
+        self.gridLayout_11.addWidget(self.label_17, 1, 0, 1, 1)
+
+        self.prefs_compilercache_sccache_location = QLineEdit(self.groupBox_9)
+        self.prefs_compilercache_sccache_location.setObjectName(u"prefs_compilercache_sccache_location")
+
+        self.gridLayout_11.addWidget(self.prefs_compilercache_sccache_location, 1, 1, 1, 1)
+
+        self.label_16 = QLabel(self.groupBox_9)
+        self.label_16.setObjectName(u"label_16")
+        self.label_16.setOpenExternalLinks(True)
+
+        self.gridLayout_11.addWidget(self.label_16, 0, 0, 1, 2)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox_9)
+
+        self.groupBox_10 = QGroupBox(self.prefs_compilercache)
+        self.groupBox_10.setObjectName(u"groupBox_10")
+        self.gridLayout_12 = QGridLayout(self.groupBox_10)
+        self.gridLayout_12.setObjectName(u"gridLayout_12")
+        self.label_19 = QLabel(self.groupBox_10)
+        self.label_19.setObjectName(u"label_19")
+
+        self.gridLayout_12.addWidget(self.label_19, 1, 0, 1, 1)
+
+        self.prefs_compilercache_buildcache_location = QLineEdit(self.groupBox_10)
+        self.prefs_compilercache_buildcache_location.setObjectName(u"prefs_compilercache_buildcache_location")
+
+        self.gridLayout_12.addWidget(self.prefs_compilercache_buildcache_location, 1, 1, 1, 1)
+
+        self.label_18 = QLabel(self.groupBox_10)
+        self.label_18.setObjectName(u"label_18")
+        self.label_18.setOpenExternalLinks(True)
+
+        self.gridLayout_12.addWidget(self.label_18, 0, 0, 1, 2)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox_10)
+
+        self.verticalSpacer_13 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_5.addItem(self.verticalSpacer_13)
+
+        self.prefs_toolbox.addItem(self.prefs_compilercache, u"Compiler cache")
+        self.prefs_shortcuts = QWidget()
+        self.prefs_shortcuts.setObjectName(u"prefs_shortcuts")
+        self.prefs_shortcuts.setGeometry(QRect(0, 0, 305, 489))
+        self.gridLayout_13 = QGridLayout(self.prefs_shortcuts)
+        self.gridLayout_13.setObjectName(u"gridLayout_13")
+        self.prefs_shortcuts_build_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_build_edit.setObjectName(u"prefs_shortcuts_build_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_build_edit, 6, 3, 1, 1)
+
+        self.verticalSpacer_12 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout_13.addItem(self.verticalSpacer_12, 15, 3, 1, 1)
+
+        self.prefs_shortcuts_remove_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_remove_edit.setObjectName(u"prefs_shortcuts_remove_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_remove_edit, 10, 3, 1, 1)
+
+        self.label_25 = QLabel(self.prefs_shortcuts)
+        self.label_25.setObjectName(u"label_25")
+        self.label_25.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_25.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_25, 11, 1, 1, 1)
+
+        self.prefs_shortcuts_install_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_install_edit.setObjectName(u"prefs_shortcuts_install_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_install_edit, 3, 3, 1, 1)
+
+        self.label_5 = QLabel(self.prefs_shortcuts)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_5.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_5, 4, 1, 1, 1)
+
+        self.prefs_shortcuts_deletecmakecache_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_deletecmakecache_edit.setObjectName(u"prefs_shortcuts_deletecmakecache_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_deletecmakecache_edit, 14, 3, 1, 1)
+
+        self.prefs_shortcuts_imports_label = QLabel(self.prefs_shortcuts)
+        self.prefs_shortcuts_imports_label.setObjectName(u"prefs_shortcuts_imports_label")
+        self.prefs_shortcuts_imports_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.prefs_shortcuts_imports_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_imports_label, 2, 1, 1, 1)
+
+        self.prefs_shortcuts_exportpackage_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_exportpackage_edit.setObjectName(u"prefs_shortcuts_exportpackage_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_exportpackage_edit, 8, 3, 1, 1)
+
+        self.prefs_shortcuts_package_label = QLabel(self.prefs_shortcuts)
+        self.prefs_shortcuts_package_label.setObjectName(u"prefs_shortcuts_package_label")
+        self.prefs_shortcuts_package_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.prefs_shortcuts_package_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_package_label, 7, 1, 1, 1)
+
+        self.label_20 = QLabel(self.prefs_shortcuts)
+        self.label_20.setObjectName(u"label_20")
+        self.label_20.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_20.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_20, 6, 1, 1, 1)
+
+        self.prefs_shortcuts_cancel_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_cancel_edit.setObjectName(u"prefs_shortcuts_cancel_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_cancel_edit, 11, 3, 1, 1)
+
+        self.label_23 = QLabel(self.prefs_shortcuts)
+        self.label_23.setObjectName(u"label_23")
+        self.label_23.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_23.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_23, 9, 1, 1, 1)
+
+        self.label_6 = QLabel(self.prefs_shortcuts)
+        self.label_6.setObjectName(u"label_6")
+        self.label_6.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_6.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_6, 5, 1, 1, 1)
+
+        self.prefs_shortcuts_cmakebuildtoolverbose_label = QLabel(self.prefs_shortcuts)
+        self.prefs_shortcuts_cmakebuildtoolverbose_label.setObjectName(u"prefs_shortcuts_cmakebuildtoolverbose_label")
+        self.prefs_shortcuts_cmakebuildtoolverbose_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.prefs_shortcuts_cmakebuildtoolverbose_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_cmakebuildtoolverbose_label, 13, 1, 1, 1)
+
+        self.prefs_shortcuts_source_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_source_edit.setObjectName(u"prefs_shortcuts_source_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_source_edit, 5, 3, 1, 1)
+
+        self.label_24 = QLabel(self.prefs_shortcuts)
+        self.label_24.setObjectName(u"label_24")
+        self.label_24.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_24.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_24, 10, 1, 1, 1)
+
+        self.prefs_shortcuts_test_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_test_edit.setObjectName(u"prefs_shortcuts_test_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_test_edit, 9, 3, 1, 1)
+
+        self.prefs_shortcuts_cmakebuildtool_label = QLabel(self.prefs_shortcuts)
+        self.prefs_shortcuts_cmakebuildtool_label.setObjectName(u"prefs_shortcuts_cmakebuildtool_label")
+        self.prefs_shortcuts_cmakebuildtool_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.prefs_shortcuts_cmakebuildtool_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_cmakebuildtool_label, 12, 1, 1, 1)
+
+        self.label_1 = QLabel(self.prefs_shortcuts)
+        self.label_1.setObjectName(u"label_1")
+        self.label_1.setTextFormat(Qt.TextFormat.RichText)
+
+        self.gridLayout_13.addWidget(self.label_1, 0, 1, 1, 1)
+
+        self.prefs_shortcuts_deletecmakecache_label = QLabel(self.prefs_shortcuts)
+        self.prefs_shortcuts_deletecmakecache_label.setObjectName(u"prefs_shortcuts_deletecmakecache_label")
+        self.prefs_shortcuts_deletecmakecache_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.prefs_shortcuts_deletecmakecache_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_deletecmakecache_label, 14, 1, 1, 1)
+
+        self.prefs_shortcuts_installupdates_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_installupdates_edit.setObjectName(u"prefs_shortcuts_installupdates_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_installupdates_edit, 4, 3, 1, 1)
+
+        self.prefs_shortcuts_cmakebuildtool_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_cmakebuildtool_edit.setObjectName(u"prefs_shortcuts_cmakebuildtool_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_cmakebuildtool_edit, 12, 3, 1, 1)
+
+        self.prefs_shortcuts_imports_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_imports_edit.setObjectName(u"prefs_shortcuts_imports_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_imports_edit, 2, 3, 1, 1)
+
+        self.label_4 = QLabel(self.prefs_shortcuts)
+        self.label_4.setObjectName(u"label_4")
+        self.label_4.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_4.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_4, 3, 1, 1, 1)
+
+        self.prefs_shortcuts_create_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_create_edit.setObjectName(u"prefs_shortcuts_create_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_create_edit, 0, 3, 1, 1)
+
+        self.prefs_shortcuts_createupdates_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_createupdates_edit.setObjectName(u"prefs_shortcuts_createupdates_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_createupdates_edit, 1, 3, 1, 1)
+
+        self.label_32 = QLabel(self.prefs_shortcuts)
+        self.label_32.setObjectName(u"label_32")
+        self.label_32.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_32.setAlignment(Qt.AlignmentFlag.AlignLeading|Qt.AlignmentFlag.AlignLeft|Qt.AlignmentFlag.AlignVCenter)
+        self.label_32.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_32, 1, 1, 1, 1)
+
+        self.prefs_shortcuts_cmakebuildtoolverbose_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_cmakebuildtoolverbose_edit.setObjectName(u"prefs_shortcuts_cmakebuildtoolverbose_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_cmakebuildtoolverbose_edit, 13, 3, 1, 1)
+
+        self.prefs_shortcuts_package_edit = ShortcutLineEdit(self.prefs_shortcuts)
+        self.prefs_shortcuts_package_edit.setObjectName(u"prefs_shortcuts_package_edit")
+
+        self.gridLayout_13.addWidget(self.prefs_shortcuts_package_edit, 7, 3, 1, 1)
+
+        self.label_22 = QLabel(self.prefs_shortcuts)
+        self.label_22.setObjectName(u"label_22")
+        self.label_22.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_22.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.label_22, 8, 1, 1, 1)
+
+        self.shortcut_conan_create = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_create.setObjectName(u"shortcut_conan_create")
+        self.shortcut_conan_create.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_create, 0, 0, 1, 1)
+
+        self.shortcut_conan_create_update = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_create_update.setObjectName(u"shortcut_conan_create_update")
+        self.shortcut_conan_create_update.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_create_update, 1, 0, 1, 1)
+
+        self.shortcut_conan_imports = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_imports.setObjectName(u"shortcut_conan_imports")
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_imports, 2, 0, 1, 1)
+
+        self.shortcut_conan_install = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_install.setObjectName(u"shortcut_conan_install")
+        self.shortcut_conan_install.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_conan_install.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_install, 3, 0, 1, 1)
+
+        self.shortcut_conan_install_update = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_install_update.setObjectName(u"shortcut_conan_install_update")
+        self.shortcut_conan_install_update.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_conan_install_update.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_install_update, 4, 0, 1, 1)
+
+        self.shortcut_conan_source = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_source.setObjectName(u"shortcut_conan_source")
+        self.shortcut_conan_source.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_conan_source.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_source, 5, 0, 1, 1)
+
+        self.shortcut_conan_build = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_build.setObjectName(u"shortcut_conan_build")
+        self.shortcut_conan_build.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_conan_build.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_build, 6, 0, 1, 1)
+
+        self.shortcut_conan_package = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_package.setObjectName(u"shortcut_conan_package")
+        self.shortcut_conan_package.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_conan_package.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_package, 7, 0, 1, 1)
+
+        self.shortcut_conan_export_package = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_export_package.setObjectName(u"shortcut_conan_export_package")
+        self.shortcut_conan_export_package.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_conan_export_package.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_export_package, 8, 0, 1, 1)
+
+        self.shortcut_conan_test = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_test.setObjectName(u"shortcut_conan_test")
+        self.shortcut_conan_test.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_conan_test.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_test, 9, 0, 1, 1)
+
+        self.shortcut_conan_remove = QLabel(self.prefs_shortcuts)
+        self.shortcut_conan_remove.setObjectName(u"shortcut_conan_remove")
+        self.shortcut_conan_remove.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_conan_remove.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_conan_remove, 10, 0, 1, 1)
+
+        self.shortcut_cancel_command = QLabel(self.prefs_shortcuts)
+        self.shortcut_cancel_command.setObjectName(u"shortcut_cancel_command")
+        self.shortcut_cancel_command.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_cancel_command.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_cancel_command, 11, 0, 1, 1)
+
+        self.shortcut_cmake_build_tool = QLabel(self.prefs_shortcuts)
+        self.shortcut_cmake_build_tool.setObjectName(u"shortcut_cmake_build_tool")
+        self.shortcut_cmake_build_tool.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_cmake_build_tool.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_cmake_build_tool, 12, 0, 1, 1)
+
+        self.shortcut_cmake_verbose_build_tool = QLabel(self.prefs_shortcuts)
+        self.shortcut_cmake_verbose_build_tool.setObjectName(u"shortcut_cmake_verbose_build_tool")
+        self.shortcut_cmake_verbose_build_tool.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_cmake_verbose_build_tool.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_cmake_verbose_build_tool, 13, 0, 1, 1)
+
+        self.shortcut_delete_cmake_cache = QLabel(self.prefs_shortcuts)
+        self.shortcut_delete_cmake_cache.setObjectName(u"shortcut_delete_cmake_cache")
+        self.shortcut_delete_cmake_cache.setTextFormat(Qt.TextFormat.PlainText)
+        self.shortcut_delete_cmake_cache.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+        self.gridLayout_13.addWidget(self.shortcut_delete_cmake_cache, 14, 0, 1, 1)
+
+        self.prefs_toolbox.addItem(self.prefs_shortcuts, u"Shortcuts")
+        self.prefs_recipes = QWidget()
+        self.prefs_recipes.setObjectName(u"prefs_recipes")
+        self.prefs_recipes.setGeometry(QRect(0, 0, 98, 108))
+        self.verticalLayout_7 = QVBoxLayout(self.prefs_recipes)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.prefs_recipes_table = QTableView(self.prefs_recipes)
+        self.prefs_recipes_table.setObjectName(u"prefs_recipes_table")
+        self.prefs_recipes_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.prefs_recipes_table.setSizeAdjustPolicy(QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
+        self.prefs_recipes_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.prefs_recipes_table.setAlternatingRowColors(True)
+        self.prefs_recipes_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.prefs_recipes_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.prefs_recipes_table.horizontalHeader().setStretchLastSection(True)
+        self.prefs_recipes_table.verticalHeader().setVisible(False)
+
+        self.verticalLayout_7.addWidget(self.prefs_recipes_table)
+
+        self.verticalSpacer_9 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer_9)
+
+        self.prefs_toolbox.addItem(self.prefs_recipes, u"Recipes")
+        self.prefs_recentconfigs = QWidget()
+        self.prefs_recentconfigs.setObjectName(u"prefs_recentconfigs")
+        self.prefs_recentconfigs.setGeometry(QRect(0, 0, 98, 108))
+        self.verticalLayout_8 = QVBoxLayout(self.prefs_recentconfigs)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.prefs_recentconfigs_list = QListView(self.prefs_recentconfigs)
+        self.prefs_recentconfigs_list.setObjectName(u"prefs_recentconfigs_list")
+        self.prefs_recentconfigs_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.prefs_recentconfigs_list.setSizeAdjustPolicy(QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
+        self.prefs_recentconfigs_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.prefs_recentconfigs_list.setAlternatingRowColors(True)
+        self.prefs_recentconfigs_list.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+
+        self.verticalLayout_8.addWidget(self.prefs_recentconfigs_list)
+
+        self.verticalSpacer_10 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_8.addItem(self.verticalSpacer_10)
+
+        self.prefs_toolbox.addItem(self.prefs_recentconfigs, u"Recent configs")
+        self.prefs_recentremotes = QWidget()
+        self.prefs_recentremotes.setObjectName(u"prefs_recentremotes")
+        self.prefs_recentremotes.setGeometry(QRect(0, 0, 98, 108))
+        self.verticalLayout_9 = QVBoxLayout(self.prefs_recentremotes)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.prefs_recentremotes_list = QListView(self.prefs_recentremotes)
+        self.prefs_recentremotes_list.setObjectName(u"prefs_recentremotes_list")
+        self.prefs_recentremotes_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.prefs_recentremotes_list.setSizeAdjustPolicy(QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
+        self.prefs_recentremotes_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.prefs_recentremotes_list.setAlternatingRowColors(True)
+        self.prefs_recentremotes_list.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+
+        self.verticalLayout_9.addWidget(self.prefs_recentremotes_list)
+
+        self.verticalSpacer_11 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_9.addItem(self.verticalSpacer_11)
+
+        self.prefs_toolbox.addItem(self.prefs_recentremotes, u"Recent remotes")
+
+        self.verticalLayout.addWidget(self.prefs_toolbox)
+
+        self.prefs_buttons = QDialogButtonBox(PreferencesDialog)
+        self.prefs_buttons.setObjectName(u"prefs_buttons")
+        self.prefs_buttons.setOrientation(Qt.Orientation.Horizontal)
+        self.prefs_buttons.setStandardButtons(QDialogButtonBox.StandardButton.Apply|QDialogButtonBox.StandardButton.Cancel|QDialogButtonBox.StandardButton.Ok)
+
+        self.verticalLayout.addWidget(self.prefs_buttons)
+
+
+        self.retranslateUi(PreferencesDialog)
+        self.prefs_buttons.accepted.connect(PreferencesDialog.accept)
+        self.prefs_buttons.rejected.connect(PreferencesDialog.reject)
+
+        self.prefs_toolbox.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(PreferencesDialog)
+    # setupUi
+
+    def retranslateUi(self, PreferencesDialog):
+        PreferencesDialog.setWindowTitle(QCoreApplication.translate("PreferencesDialog", u"Preferences", None))
+        self.actionForget_recipe.setText(QCoreApplication.translate("PreferencesDialog", u"Forget recipe", None))
+        self.actionForget_config.setText(QCoreApplication.translate("PreferencesDialog", u"Forget config", None))
+        self.actionForget_remote.setText(QCoreApplication.translate("PreferencesDialog", u"Forget remote", None))
+        self.prefs_general_enable_compact.setText(QCoreApplication.translate("PreferencesDialog", u"Enable compact look", None))
+        self.prefs_general_found_text_background_colour.setText("")
+        self.label.setText(QCoreApplication.translate("PreferencesDialog", u"Default recipe browsing directory", None))
+        self.label_30.setText(QCoreApplication.translate("PreferencesDialog", u"Found text background colour", None))
+        self.prefs_general_clearpanes.setText(QCoreApplication.translate("PreferencesDialog", u"Clear panes before running each command", None))
+        self.prefs_general_busy_colour.setText("")
+        self.prefs_general_combine_panes.setText(QCoreApplication.translate("PreferencesDialog", u"Combine output and error panes", None))
+        self.prefs_general_usebatching.setText(QCoreApplication.translate("PreferencesDialog", u"Use batching for standard output", None))
+        self.prefs_general_enable_wallclock.setText(QCoreApplication.translate("PreferencesDialog", u"Enable wall clock command timing", None))
+        self.label_2.setText(QCoreApplication.translate("PreferencesDialog", u"Busy icon colour", None))
+#if QT_CONFIG(tooltip)
+        self.prefs_general_new_recipe_load.setToolTip(QCoreApplication.translate("PreferencesDialog", u"Enable new recipe loading behaviour.\n"
+"May help loading recipes that query version information during requirements() methods.\n"
+"However, help stop loading recipes if they have mixed versions of dependent packages in their dependency graph or mixed case names of dependent packages on case insensitive file systems.\n"
+"", None))
+#endif // QT_CONFIG(tooltip)
+        self.prefs_general_new_recipe_load.setText(QCoreApplication.translate("PreferencesDialog", u"New recipe loading behaviour", None))
+        self.label_33.setText(QCoreApplication.translate("PreferencesDialog", u"Dependency graph resolution", None))
+        self.prefs_general_graph_resolution.setItemText(0, QCoreApplication.translate("PreferencesDialog", u"offline", None))
+        self.prefs_general_graph_resolution.setItemText(1, QCoreApplication.translate("PreferencesDialog", u"cache-first", None))
+        self.prefs_general_graph_resolution.setItemText(2, QCoreApplication.translate("PreferencesDialog", u"always-update", None))
+
+#if QT_CONFIG(tooltip)
+        self.prefs_general_graph_resolution.setToolTip(QCoreApplication.translate("PreferencesDialog", u"How remotes are used when computing dependency graphs in Conan 2.\n"
+"offline: only use the local cache, failing on any package not in it\n"
+"cache-first: use the local cache, only contacting remotes for packages not in it\n"
+"always-update: check remotes for newer versions and revisions of every package", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_31.setText(QCoreApplication.translate("PreferencesDialog", u"Recipe editor", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_general), QCoreApplication.translate("PreferencesDialog", u"General", None))
+        self.groupBox.setTitle(QCoreApplication.translate("PreferencesDialog", u"UI font", None))
+        self.prefs_font_ui_label.setText(QCoreApplication.translate("PreferencesDialog", u"The font", None))
+        self.prefs_font_ui_preview.setText(QCoreApplication.translate("PreferencesDialog", u"The quick brown fox jumps over the lazy dog", None))
+        self.prefs_font_ui_reset.setText(QCoreApplication.translate("PreferencesDialog", u"Reset", None))
+        self.prefs_font_ui_change.setText(QCoreApplication.translate("PreferencesDialog", u"Change ...", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("PreferencesDialog", u"Output panes font", None))
+        self.prefs_font_output_label.setText(QCoreApplication.translate("PreferencesDialog", u"The font", None))
+        self.prefs_font_output_preview.setText(QCoreApplication.translate("PreferencesDialog", u"The quick brown fox jumps over the lazy dog", None))
+        self.prefs_font_output_reset.setText(QCoreApplication.translate("PreferencesDialog", u"Reset", None))
+        self.prefs_font_output_change.setText(QCoreApplication.translate("PreferencesDialog", u"Change ...", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_fonts), QCoreApplication.translate("PreferencesDialog", u"Fonts", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("PreferencesDialog", u"Logging", None))
+        self.label_7.setText(QCoreApplication.translate("PreferencesDialog", u"Conan logging level", None))
+        self.prefs_conan_log_level.setItemText(0, QCoreApplication.translate("PreferencesDialog", u"CRITICAL", None))
+        self.prefs_conan_log_level.setItemText(1, QCoreApplication.translate("PreferencesDialog", u"ERROR", None))
+        self.prefs_conan_log_level.setItemText(2, QCoreApplication.translate("PreferencesDialog", u"WARNING", None))
+        self.prefs_conan_log_level.setItemText(3, QCoreApplication.translate("PreferencesDialog", u"INFO", None))
+        self.prefs_conan_log_level.setItemText(4, QCoreApplication.translate("PreferencesDialog", u"DEBUG", None))
+        self.prefs_conan_log_level.setItemText(5, QCoreApplication.translate("PreferencesDialog", u"NOTSET", None))
+
+#if QT_CONFIG(tooltip)
+        self.prefs_conan_log_level.setToolTip(QCoreApplication.translate("PreferencesDialog", u"Log Conan commands. Only works when a single recipe has commands run on it", None))
+#endif // QT_CONFIG(tooltip)
+        self.groupBox_4.setTitle(QCoreApplication.translate("PreferencesDialog", u"Parsing conandata", None))
+        self.label_8.setText(QCoreApplication.translate("PreferencesDialog", u"YAML path segments to identify version list", None))
+#if QT_CONFIG(tooltip)
+        self.prefs_conan_version_list_path_segment.setToolTip(QCoreApplication.translate("PreferencesDialog", u"<html><head/><body><p>For example, if your conandata.yml is formatted as</p><p><br/></p><p>  sources:</p><p>    1.2.3:</p><p>    ... </p><p>    4.5.6:</p><p>    ... </p><p><br/></p><p>then specify 'sources' in order to extract the version list</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_conan), QCoreApplication.translate("PreferencesDialog", u"Conan", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("PreferencesDialog", u"New cache options", None))
+        self.label_9.setText(QCoreApplication.translate("PreferencesDialog", u"Config to install", None))
+        self.label_10.setText(QCoreApplication.translate("PreferencesDialog", u"Git branch", None))
+        self.groupBox_6.setTitle(QCoreApplication.translate("PreferencesDialog", u"Forget caches without recipe associations", None))
+        self.prefs_localcache_do_forget.setText(QCoreApplication.translate("PreferencesDialog", u"Forget", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_localcache), QCoreApplication.translate("PreferencesDialog", u"Local cache", None))
+#if QT_CONFIG(tooltip)
+        self.prefs_graphviz_use_graphviz.setToolTip(QCoreApplication.translate("PreferencesDialog", u"When unchecked, dependency graphs are drawn with the built-in layout, which does not require GraphViz", None))
+#endif // QT_CONFIG(tooltip)
+        self.prefs_graphviz_use_graphviz.setText(QCoreApplication.translate("PreferencesDialog", u"Use GraphViz to draw dependency graphs", None))
+        self.label_11.setText(QCoreApplication.translate("PreferencesDialog", u"GraphViz bin directory", None))
+        self.label_29.setText(QCoreApplication.translate("PreferencesDialog", u"<html><head/><body><p>Download from <a href=\"https://graphviz.org/download/\"><span style=\" text-decoration: underline; color:#0068da;\">https://graphviz.org/download/</span></a></p></body></html>", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_graphviz), QCoreApplication.translate("PreferencesDialog", u"GraphViz", None))
+        self.label_12.setText(QCoreApplication.translate("PreferencesDialog", u"CMake bin directory", None))
+        self.label_13.setText(QCoreApplication.translate("PreferencesDialog", u"Ninja bin directory", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_cmake), QCoreApplication.translate("PreferencesDialog", u"CMake", None))
+        self.groupBox_7.setTitle(QCoreApplication.translate("PreferencesDialog", u"Default compiler cache", None))
+        self.prefs_compilercache_default.setItemText(0, QCoreApplication.translate("PreferencesDialog", u"None", None))
+        self.prefs_compilercache_default.setItemText(1, QCoreApplication.translate("PreferencesDialog", u"ccache", None))
+        self.prefs_compilercache_default.setItemText(2, QCoreApplication.translate("PreferencesDialog", u"sccache", None))
+        self.prefs_compilercache_default.setItemText(3, QCoreApplication.translate("PreferencesDialog", u"buildcache", None))
+
+#if QT_CONFIG(tooltip)
+        self.prefs_compilercache_default.setToolTip(QCoreApplication.translate("PreferencesDialog", u"The default compiler cache that attempts to integrate with Conan's CMake and Autotools helpers. YMMV.", None))
+#endif // QT_CONFIG(tooltip)
+        self.groupBox_8.setTitle(QCoreApplication.translate("PreferencesDialog", u"ccache", None))
+        self.label_15.setText(QCoreApplication.translate("PreferencesDialog", u"Location", None))
+        self.label_14.setText(QCoreApplication.translate("PreferencesDialog", u"<html><head/><body><p>Download from <a href=\"https://ccache.dev\"><span style=\" text-decoration: underline; color:#0068da;\">https://ccache.dev</span></a></p></body></html>", None))
+        self.groupBox_9.setTitle(QCoreApplication.translate("PreferencesDialog", u"sccache", None))
+        self.label_17.setText(QCoreApplication.translate("PreferencesDialog", u"Location", None))
+        self.label_16.setText(QCoreApplication.translate("PreferencesDialog", u"<html><head/><body><p>Download from <a href=\"https://github.com/mozilla/sccache\"><span style=\" text-decoration: underline; color:#0068da;\">https://github.com/mozilla/sccache</span></a></p></body></html>", None))
+        self.groupBox_10.setTitle(QCoreApplication.translate("PreferencesDialog", u"buildcache", None))
+        self.label_19.setText(QCoreApplication.translate("PreferencesDialog", u"Location", None))
+        self.label_18.setText(QCoreApplication.translate("PreferencesDialog", u"<html><head/><body><p>Download from <a href=\"https://github.com/mbitsnbites/buildcache\"><span style=\" text-decoration: underline; color:#0068da;\">https://github.com/mbitsnbites/buildcache</span></a></p></body></html>", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_compilercache), QCoreApplication.translate("PreferencesDialog", u"Compiler cache", None))
+        self.label_25.setText(QCoreApplication.translate("PreferencesDialog", u"Cancel current command", None))
+        self.label_5.setText(QCoreApplication.translate("PreferencesDialog", u"conan install (update binaries)", None))
+        self.prefs_shortcuts_imports_label.setText(QCoreApplication.translate("PreferencesDialog", u"conan imports", None))
+        self.prefs_shortcuts_package_label.setText(QCoreApplication.translate("PreferencesDialog", u"conan package", None))
+        self.label_20.setText(QCoreApplication.translate("PreferencesDialog", u"conan build", None))
+        self.label_23.setText(QCoreApplication.translate("PreferencesDialog", u"conan test", None))
+        self.label_6.setText(QCoreApplication.translate("PreferencesDialog", u"conan source", None))
+        self.prefs_shortcuts_cmakebuildtoolverbose_label.setText(QCoreApplication.translate("PreferencesDialog", u"CMake Build Tool (verbose)", None))
+        self.label_24.setText(QCoreApplication.translate("PreferencesDialog", u"conan remove", None))
+        self.prefs_shortcuts_cmakebuildtool_label.setText(QCoreApplication.translate("PreferencesDialog", u"CMake Build Tool", None))
+        self.label_1.setText(QCoreApplication.translate("PreferencesDialog", u"<html><head/><body><p>conan create</p></body></html>", None))
+        self.prefs_shortcuts_deletecmakecache_label.setText(QCoreApplication.translate("PreferencesDialog", u"Delete CMakeCache", None))
+        self.label_4.setText(QCoreApplication.translate("PreferencesDialog", u"conan install", None))
+        self.label_32.setText(QCoreApplication.translate("PreferencesDialog", u"conan create (update binaries)", None))
+        self.label_22.setText(QCoreApplication.translate("PreferencesDialog", u"conan export-pkg", None))
+        self.shortcut_conan_create.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_create_update.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_imports.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_install.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_install_update.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_source.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_build.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_package.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_export_package.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_test.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_conan_remove.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_cancel_command.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_cmake_build_tool.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_cmake_verbose_build_tool.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.shortcut_delete_cmake_cache.setText(QCoreApplication.translate("PreferencesDialog", u"TextLabel", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_shortcuts), QCoreApplication.translate("PreferencesDialog", u"Shortcuts", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_recipes), QCoreApplication.translate("PreferencesDialog", u"Recipes", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_recentconfigs), QCoreApplication.translate("PreferencesDialog", u"Recent configs", None))
+        self.prefs_toolbox.setItemText(self.prefs_toolbox.indexOf(self.prefs_recentremotes), QCoreApplication.translate("PreferencesDialog", u"Recent remotes", None))
+    # retranslateUi
+
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'recipe_compilercache_features_frame.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QLocale,
+    QMetaObject,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QTime,
+    QUrl,
+    Qt,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QConicalGradient,
+    QCursor,
+    QFont,
+    QFontDatabase,
+    QGradient,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
+from PySide6.QtWidgets import (
+    QApplication,
+    QCheckBox,
+    QComboBox,
+    QFrame,
+    QHBoxLayout,
+    QPushButton,
+    QSizePolicy,
+    QWidget,
+)
+
+
+class Ui_compilerCacheFrame(object):
+    def setupUi(self, compilerCacheFrame):
+        if not compilerCacheFrame.objectName():
+            compilerCacheFrame.setObjectName("compilerCacheFrame")
+        compilerCacheFrame.resize(358, 50)
+        self.horizontalLayout = QHBoxLayout(compilerCacheFrame)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.useCache = QCheckBox(compilerCacheFrame)
+        self.useCache.setObjectName("useCache")
+
+        self.horizontalLayout.addWidget(self.useCache)
+
+        self.chooseCache = QComboBox(compilerCacheFrame)
+        self.chooseCache.addItem("")
+        self.chooseCache.addItem("")
+        self.chooseCache.addItem("")
+        self.chooseCache.addItem("")
+        self.chooseCache.setObjectName("chooseCache")
+
+        self.horizontalLayout.addWidget(self.chooseCache)
+
+        self.configureCache = QPushButton(compilerCacheFrame)
+        self.configureCache.setObjectName("configureCache")
+
+        self.horizontalLayout.addWidget(self.configureCache)
+
+        self.retranslateUi(compilerCacheFrame)
+
+        QMetaObject.connectSlotsByName(compilerCacheFrame)
+
+    # setupUi
+
+    def retranslateUi(self, compilerCacheFrame):
+        compilerCacheFrame.setWindowTitle(
+            QCoreApplication.translate("compilerCacheFrame", "Frame", None)
+        )
+        # if QT_CONFIG(tooltip)
+        self.useCache.setToolTip(
+            QCoreApplication.translate(
+                "compilerCacheFrame",
+                "Enable specifying the compiler cache for just this recipe.",
+                None,
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.useCache.setText(
+            QCoreApplication.translate("compilerCacheFrame", "Compiler cache", None)
+        )
+        self.chooseCache.setItemText(
+            0, QCoreApplication.translate("compilerCacheFrame", "None", None)
+        )
+        self.chooseCache.setItemText(
+            1, QCoreApplication.translate("compilerCacheFrame", "ccache", None)
+        )
+        self.chooseCache.setItemText(
+            2, QCoreApplication.translate("compilerCacheFrame", "sccache", None)
+        )
+        self.chooseCache.setItemText(
+            3, QCoreApplication.translate("compilerCacheFrame", "buildcache", None)
+        )
+
+        # if QT_CONFIG(tooltip)
+        self.chooseCache.setToolTip(
+            QCoreApplication.translate(
+                "compilerCacheFrame",
+                "The recipe specific compiler cache that attempts to integrate with Conan's CMake and Autotools helpers.  The cruiz icon is shown beside the preferences default.  YMMV.",
+                None,
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        # if QT_CONFIG(tooltip)
+        self.configureCache.setToolTip(
+            QCoreApplication.translate(
+                "compilerCacheFrame", "Configure compiler caches for this recipe.", None
+            )
+        )
+        # endif // QT_CONFIG(tooltip)
+        self.configureCache.setText(
+            QCoreApplication.translate("compilerCacheFrame", "Configure...", None)
+        )
+
+    # retranslateUi
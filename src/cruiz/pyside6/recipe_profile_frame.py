@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'recipe_profile_frame.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QLocale,
+    QMetaObject,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QTime,
+    QUrl,
+    Qt,
+)
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QConicalGradient,
+    QCursor,
+    QFont,
+    QFontDatabase,
+    QGradient,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QRadialGradient,
+    QTransform,
+)
+from PySide6.QtWidgets import (
+    QApplication,
+    QComboBox,
+    QFrame,
+    QHBoxLayout,
+    QLabel,
+    QSizePolicy,
+    QWidget,
+)
+
+
+class Ui_profileFrame(object):
+    def setupUi(self, profileFrame):
+        if not profileFrame.objectName():
+            profileFrame.setObjectName("profileFrame")
+        profileFrame.resize(142, 32)
+        self.horizontalLayout = QHBoxLayout(profileFrame)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.profileLabel = QLabel(profileFrame)
+        self.profileLabel.setObjectName("profileLabel")
+
+        self.horizontalLayout.addWidget(self.profileLabel)
+
+        self.profileCombo = QComboBox(profileFrame)
+        self.profileCombo.setObjectName("profileCombo")
+        self.profileCombo.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToContents
+        )
+
+        self.horizontalLayout.addWidget(self.profileCombo)
+
+        self.retranslateUi(profileFrame)
+
+        QMetaObject.connectSlotsByName(profileFrame)
+
+    # setupUi
+
+    def retranslateUi(self, profileFrame):
+        profileFrame.setWindowTitle(
+            QCoreApplication.translate("profileFrame", "Frame", None)
+        )
+        self.profileLabel.setText(
+            QCoreApplication.translate("profileFrame", "Profile:", None)
+        )
+
+    # retranslateUi
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'recipe_profile_matrix_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QAbstractItemView, QApplication, QDialog,
+    QDialogButtonBox, QFormLayout, QHeaderView, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QPlainTextEdit,
+    QSizePolicy, QSpinBox, QTableView, QTreeView,
+    QVBoxLayout, QWidget)
+
+class Ui_ProfileMatrixDialog(object):
+    def setupUi(self, ProfileMatrixDialog):
+        if not ProfileMatrixDialog.objectName():
+            ProfileMatrixDialog.setObjectName(u"ProfileMatrixDialog")
+        ProfileMatrixDialog.resize(800, 600)
+        self.verticalLayout = QVBoxLayout(ProfileMatrixDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.formLayout = QFormLayout()
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(ProfileMatrixDialog)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.profileMatrixProfiles = QListWidget(ProfileMatrixDialog)
+        self.profileMatrixProfiles.setObjectName(u"profileMatrixProfiles")
+        self.profileMatrixProfiles.setMaximumSize(QSize(16777215, 120))
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.profileMatrixProfiles)
+
+        self.label_2 = QLabel(ProfileMatrixDialog)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.profileMatrixOptions = QLineEdit(ProfileMatrixDialog)
+        self.profileMatrixOptions.setObjectName(u"profileMatrixOptions")
+        self.profileMatrixOptions.setClearButtonEnabled(True)
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.profileMatrixOptions)
+
+        self.label_3 = QLabel(ProfileMatrixDialog)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.profileMatrixJobs = QSpinBox(ProfileMatrixDialog)
+        self.profileMatrixJobs.setObjectName(u"profileMatrixJobs")
+        self.profileMatrixJobs.setMinimum(1)
+        self.profileMatrixJobs.setMaximum(64)
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.profileMatrixJobs)
+
+
+        self.verticalLayout.addLayout(self.formLayout)
+
+        self.profileMatrixTable = QTableView(ProfileMatrixDialog)
+        self.profileMatrixTable.setObjectName(u"profileMatrixTable")
+        self.profileMatrixTable.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.profileMatrixTable.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+
+        self.verticalLayout.addWidget(self.profileMatrixTable)
+
+        self.profileMatrixDiffSummary = QLabel(ProfileMatrixDialog)
+        self.profileMatrixDiffSummary.setObjectName(u"profileMatrixDiffSummary")
+
+        self.verticalLayout.addWidget(self.profileMatrixDiffSummary)
+
+        self.profileMatrixDiffView = QTreeView(ProfileMatrixDialog)
+        self.profileMatrixDiffView.setObjectName(u"profileMatrixDiffView")
+        self.profileMatrixDiffView.setRootIsDecorated(False)
+
+        self.verticalLayout.addWidget(self.profileMatrixDiffView)
+
+        self.profileMatrixLog = QPlainTextEdit(ProfileMatrixDialog)
+        self.profileMatrixLog.setObjectName(u"profileMatrixLog")
+        self.profileMatrixLog.setReadOnly(True)
+
+        self.verticalLayout.addWidget(self.profileMatrixLog)
+
+        self.profileMatrixButtonBox = QDialogButtonBox(ProfileMatrixDialog)
+        self.profileMatrixButtonBox.setObjectName(u"profileMatrixButtonBox")
+        self.profileMatrixButtonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.profileMatrixButtonBox.setStandardButtons(QDialogButtonBox.StandardButton.Close)
+
+        self.verticalLayout.addWidget(self.profileMatrixButtonBox)
+
+
+        self.retranslateUi(ProfileMatrixDialog)
+        self.profileMatrixButtonBox.rejected.connect(ProfileMatrixDialog.reject)
+
+        QMetaObject.connectSlotsByName(ProfileMatrixDialog)
+    # setupUi
+
+    def retranslateUi(self, ProfileMatrixDialog):
+        ProfileMatrixDialog.setWindowTitle(QCoreApplication.translate("ProfileMatrixDialog", u"Dependency graph profile matrix", None))
+        self.label.setText(QCoreApplication.translate("ProfileMatrixDialog", u"Profiles", None))
+#if QT_CONFIG(tooltip)
+        self.profileMatrixProfiles.setToolTip(QCoreApplication.translate("ProfileMatrixDialog", u"Check the profiles to compute the dependency graph with", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_2.setText(QCoreApplication.translate("ProfileMatrixDialog", u"Options", None))
+#if QT_CONFIG(tooltip)
+        self.profileMatrixOptions.setToolTip(QCoreApplication.translate("ProfileMatrixDialog", u"Values of each option to combine with every profile, e.g. shared=True,False; fPIC=True", None))
+#endif // QT_CONFIG(tooltip)
+        self.profileMatrixOptions.setPlaceholderText(QCoreApplication.translate("ProfileMatrixDialog", u"shared=True,False; fPIC=True", None))
+        self.label_3.setText(QCoreApplication.translate("ProfileMatrixDialog", u"Parallel jobs", None))
+#if QT_CONFIG(tooltip)
+        self.profileMatrixJobs.setToolTip(QCoreApplication.translate("ProfileMatrixDialog", u"Maximum number of dependency graphs to compute at the same time", None))
+#endif // QT_CONFIG(tooltip)
+        self.profileMatrixDiffSummary.setText(QCoreApplication.translate("ProfileMatrixDialog", u"Select a configuration to show its differences from the first configuration", None))
+    # retranslateUi
+
@@ -0,0 +1,12853 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.8.3
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x01z_\
+%\
+PDF-1.4\x0a1 0 obj\x0a\
+<<\x0a/Title (\xfe\xff\x00L\x00\
+i\x00c\x00e\x00n\x00s\x00e)\x0a/Cr\
+eator (\xfe\xff\x00w\x00k\x00h\x00\
+t\x00m\x00l\x00t\x00o\x00p\x00d\x00f\x00\
+ \x000\x00.\x001\x002\x00.\x005)\x0a/\
+Producer (\xfe\xff\x00Q\x00t\
+\x00 \x004\x00.\x008\x00.\x007)\x0a/C\
+reationDate (D:2\
+0200601100658Z)\x0a\
+>>\x0aendobj\x0a3 0 ob\
+j\x0a<<\x0a/Type /ExtG\
+State\x0a/SA true\x0a/\
+SM 0.02\x0a/ca 1.0\x0a\
+/CA 1.0\x0a/AIS fal\
+se\x0a/SMask /None>\
+>\x0aendobj\x0a4 0 obj\
+\x0a[/Pattern /Devi\
+ceRGB]\x0aendobj\x0a6 \
+0 obj\x0a<<\x0a/Type /\
+XObject\x0a/Subtype\
+ /Image\x0a/Width 1\
+588\x0a/Height 234\x0a\
+/BitsPerComponen\
+t 8\x0a/ColorSpace \
+/DeviceRGB\x0a/Leng\
+th 7 0 R\x0a/Filter\
+ /DCTDecode\x0a>>\x0as\
+tream\x0a\xff\xd8\xff\xe0\x00\x10JFIF\
+\x00\x01\x01\x01\x00K\x00K\x00\x00\xff\xdb\x00C\x00\x02\
+\x01\x01\x02\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\x03\x05\x03\
+\x03\x03\x03\x03\x06\x04\x04\x03\x05\x07\x06\x07\x07\x07\x06\x07\
+\x07\x08\x09\x0b\x09\x08\x08\x0a\x08\x07\x07\x0a\x0d\x0a\x0a\x0b\
+\x0c\x0c\x0c\x0c\x07\x09\x0e\x0f\x0d\x0c\x0e\x0b\x0c\x0c\x0c\xff\
+\xdb\x00C\x01\x02\x02\x02\x03\x03\x03\x06\x03\x03\x06\x0c\x08\
+\x07\x08\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
+\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
+\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
+\x0c\x0c\x0c\x0c\xff\xc0\x00\x11\x08\x00\xea\x064\x03\x01\x22\
+\x00\x02\x11\x01\x03\x11\x01\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\
+\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\
+\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\
+\x03\x03\x02\x04\x03\x05\x05\x04\x04\x00\x00\x01}\x01\x02\x03\
+\x00\x04\x11\x05\x12!1A\x06\x13Qa\x07\x22q\x14\
+2\x81\x91\xa1\x08#B\xb1\xc1\x15R\xd1\xf0$3b\
+r\x82\x09\x0a\x16\x17\x18\x19\x1a%&'()*4\
+56789:CDEFGHIJST\
+UVWXYZcdefghijst\
+uvwxyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\
+\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\
+\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\
+\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\
+\xe6\xe7\xe8\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\
+\xc4\x00\x1f\x01\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\
+\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\
+\xff\xc4\x00\xb5\x11\x00\x02\x01\x02\x04\x04\x03\x04\x07\x05\x04\
+\x04\x00\x01\x02w\x00\x01\x02\x03\x11\x04\x05!1\x06\x12\
+AQ\x07aq\x13\x222\x81\x08\x14B\x91\xa1\xb1\xc1\
+\x09#3R\xf0\x15br\xd1\x0a\x16$4\xe1%\xf1\
+\x17\x18\x19\x1a&'()*56789:C\
+DEFGHIJSTUVWXYZc\
+defghijstuvwxyz\x82\
+\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\
+\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\
+\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\
+\xd6\xd7\xd8\xd9\xda\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\
+\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xda\x00\x0c\x03\x01\x00\x02\x11\
+\x03\x11\x00?\x00\xfcu\xeeq\x93I\xd7\xd2\x97\xb9\xf6\
+\xa2>\xf5\xf7\x11\x8a\xb6\xdf\xd6\x87\xc5\xb6\xee\x18>\x82\
+\x8c\x1fAN\xa2\xaf\x96=\x82\xef\xb8\xdc\x1fAGN\
+\xdf\xad:\x8a\x5c\xab\xb0]\xf7\x11x\xf4\xfcE\x1b\x8f\
+\xbf\xe5KE>U\xd8.\xc4\xcf\xb1\xa5\xa2\x8av]\
+\x82\xef\xb8\x99\xf64\xa0\xe78\x1d(\xa4\x00\x9c\xe0\xd1\
+e\xd8M\xb1y<\x81G<q\xfaQ\x92\xb8\xe8E\
+.\xf3MEv%\xb6\x19 q\x9a\x00\xef\x9aJ)\
+\xf2\xae\xc2\xbb\xee<7\xa1\xfc\xc5/\xe3\x9f\xc2\x9a\x9c\
+sK\xbb&\x8eH\xf6\x0b\xcb\xb8\xbc\xe7\xb5\x18\xc9\xed\
+E\x14r\xae\xc1w\xdc\x5c\x01\xdf4`\xfa\x8f\xce\x92\
+\x8aj+\xb0\x9c\xa4\xba\x86}\x85;\xafzm\x15\x5c\
+\xa8\x5c\xd2\xee/N\x9d=\xc5/\x1e\xbf^)\xb4S\
+\xe5]\x83\x99\xf7\x1eH\xa4\xcf\xb3Q\x1fzu'\x14\
+\xba\x13w\xdcL\xe0\xf4?\x9d\x19\xc9\xe8ih\xa5e\
+\xd8.\xfb\x89\x81\x8e\x94\xa3\x93\x8a(\xe9E\x97`\xbc\
+\xbb\x8a\x01\xedF\x0f\xa5.z{\x8f\xca\x9dO\xdd\xec\
+\x17}\xc4\xdb\xefI\xd3\xaei\xd4R\xb2\xec\x17\x97q\
+\xbc\xfa\x1f\xce\x97w\xb1\xa5\xa2\x8b.\xc1w\xdcL\xf1\
+\xdf4\xa3\x95\xcf\xa5\x00d})W\xfa\xd1e\xd8.\
+\xfb\x80\x1e\xd4(\xf6\x03\xf1\xa7\xd1F\x9d\x82\xf2\xee7\
+g\xd2\x82\x07sN\xa4\xd8+E\x14O3\xee\x03\x0b\
+\xff\x00\xeb\xa3x\xa3`\xa3`\xa7\xca\xbf\xa4\x1c\xef\xb8\
+d{\xd2\xe1_\x8ei6\x0ar/?J9W\xf5\
+`\xe7}\xc4\xf2\xc1\xf5\xa5\x0as\xea)q\xcfJ^\
+:\xd0\xa2\xba\x89\xb6&\x0f\xbf\xe7K\xf8\x1f\xce\x96\x8a\
+|\xab\xb0\xae\xc2\x91s\x9cR\xd1G*\xec\x17`9\
+\xe3\x03\xf2\xa9\xf4\xd9M\xb5\xfc\x12\x1e6H\x0f\xebU\
+\xd4\xe3\x07\x14\xe7=\xc7\xd6\xaa)&\x98\x9d\xda\xb3=\
+\x09\x86\x0e9\xa6\xf3\xeb\xfa\xd3,\xa7\xfbM\xacR\x83\
+\x91\x22\x06\xfd*j\xfa\x15k\x5c\xf0\x1bi\xd8g>\
+\xbf\xad\x1c\xfa\xfe\xb4\xfa)\xf2\xae\xc2\xe6}\xc6s\xeb\
+\xfa\xd3\x87\xa78\xebKE\x16]\x83\x99\xf7\x00\xd9\xed\
+\x9a_\xc0RG\xfc\xb8\xa9*\x94W`\xe6}\xc6\xab\
+\x1fJ^}\xa9h\xa7\xca\xbb\x0b\x99\xf7\x13\x9fj9\
+\xf6\xa5\xa2\x8eU\xd89\x9fq9\xf6\xa3\x9fjZ(\
+\xe5]\x83\x99\xf7\x13\x9fj9\xf6\xa5\xa2\x8eU\xd89\
+\x9fq9\xf6\xa4\xcbz\x0aZ\xa9\xaak\xb0i#\x12\
+6\xe9\x0fH\xd7\x05\xbf\xfa\xdf\x8dL\x9cb\xaf\x22\xa3\
+\xcc\xdd\xa2Z'\xd4t\xe7\x8a\x0e\x07^>\xb5\xcb\xdf\
+x\xc2\xea\xec\x91\x1e\xdbt\xff\x00g\x96?\x8dg\xcd\
+p\xf7\x04\x99$y\x09\xe4\xeel\xe6\xb8\xe7\x8d\xa6\x9d\
+\xa2\xaeuG\x0b7\xac\x99\xdb\x09\xd1\x8f\x0e\x9f\x98\xa7\
+\xed\xdd\xd3\x91\xed\x5c\x118\xff\x00\x1a\x92+\xc9 \xc6\
+\xc7\x911\xcf\xca\xc4T,j\xeb\x12\xde\x15\xf4\x91\xdc\
+\x94\x02\x81\x81\xc7\x1f\x9dr\xb6^0\xba\x81\xb0\xec'\
+A\xd9\xc7?\x98\xad\x9d;\xc56\xd7\xad\xb5\x8f\x91'\
+`\xfd\x0f\xd0\xd7E:\xf4\xa5\xb6\x86\x13\xa1R>f\
+\x8f>\xd4s\xedG\xbe\x0e)k\xa7\x95v0\xbb\x13\
+\x9fj9\xf6\xa5\xa2\x8eU\xd89\x9fq9\xf6\xa3\x9f\
+jZ(\xe5]\x85\xcc\xfb\x89\xcf\xb5\x1c\xfbR\xd1G\
+*\xec\x1c\xcf\xb8\x9c\xfbQ\xcf\xb5-\x14r\xae\xc1\xcc\
+\xfb\x89\xcf\xb5\x1c\xfbR\xd1G*\xec\x1c\xcf\xb8\x9b\xfd\
+\xbfZ7\x10ih\xa3\x95v\x0eg\xdc@\xdcs\xc5\
+\x19\xfc\x7f\x1aZ(\xe5]\x87\xcc\xfb\x89\x9fqQ\xdf\
+F$\xb4\x98z\xa1\xfeU-Ev\xc1me'\x1c\
+#\x7f*R\x8a\xb3\xb8\xd4\x9d\xd1\xc7g\x8fz]\xd8\
+\xeci6\xe4\x0e\xc6\x8f/\xde\xbc;#\xd8\xe6b\x86\
+\xce:\xd1\x8cv\xc5(\x8f\xbe\xe1J9\xef\xdb\xf2\xa3\
+\x96?\xd5\x85\xcc\xff\x00\xab\x8d\xda}\x1a\x8d\xa7\xd1\xa9\
+\xf8\xe7\x19\xfd(\xd9\xee?*9c\xfdX9\x9f\xf5\
+p\xe78\xedH:\xd2\xf9~\xf4y~\xf4r\xaf\xea\
+\xc1\xcc\xff\x00\xa6\x19\x1f\xe4\xd2\x86\xe8)<\xbfz]\
+\x82\x8eX\xff\x00V\x15\xdb\x01\x8c\xf7\xcd.\xc29\xc7\
+\xe9H\x8aA\x1c\xd3\x9dN:\x9e)\xf2\xc7\xfa\xb07\
+.\xe2\x11\xb4s[\x9e\x1f\xd3\xbe\xcdo\xbd\xc6$\x97\
+\x07\x1e\x82\xa8h\xba_\xda\xe4\xde\xf91Fy\xe7\xef\
+\x1fJ\xde5\xd9\x86\xa2\xbe&\x8eZ\xd5\x1f\xc2\x98\x9f\
+\x86}\xe9x\xf7\xa5\xa6\xed>\xa6\xbb9Wc\x9a\xec\
+^=\xe8\xe3\xde\x93i\xf54m>\xa6\x8eU\xd8/\
+.\xe2\xf1\xefG\x1e\xf4\x9bO\xa9\xa3i\xf54r\xae\
+\xc1yw\x17\x8fz8\xf7\xa4\xda}M\x1bO\xa9\xa3\
+\x95v\x0b\xcb\xb8\xbc{\xd1\xc7\xbd&\xd3\xeah\xda}\
+M\x1c\xab\xb0^]\xc5\xe3\xde\x8e=\xe96\x9fSF\
+\xd3\xeah\xe5]\x82\xf2\xee/\x1e\xf4q\xefI\xb4\xfa\
+\x9a6\x9fSG*\xec\x17\x97qx\xf7\xa3\x8fzM\
+\xa7\xd4\xd1\xb4\xfa\x9a9W`\xbc\xbb\x8b\xc7\xbd\x1c{\
+\xd2m>\xa6\x8d\xa7\xd4\xd1\xca\xbb\x05\xe5\xdc^=\xe8\
+\xe3\xde\x93i\xf54m>\xa6\x8eU\xd8/.\xe2\xf1\
+\xefG\x1e\xf4\x9bO\xa9\xa3i\xf54r\xae\xc1yw\
+\x17\x8fz8\xf7\xa4\xda}M\x1bO\xa9\xa3\x95v\x0b\
+\xcb\xb8\xbc{\xd1\xc7\xbd&\xd3\xeah\xda}M\x1c\xab\
+\xb0^]\xc5\xe3\xde\x8e=\xe96\x9fSF\xd3\xeah\
+\xe5]\x82\xf2\xee/\x1e\xf4c\xda\x93i\xf54\xea9\
+W`\xbc\xbb\x95\xb5E\xddlN:\x1c\xd6w\x97\xef\
+Z\xb7k\xba\xdeN\xe7\x19\xac\x9d\xdf_\xce\xb9\xabE\
+sltR\x93\xb0\xbe_\xbd&\xcfs\xf9RS\xbc\
+\xcfj\xc9$iw\xfd0\x0b\xf5\xa5\xc7\xd7\xf3\xa5\xa4\
+\x07\x07\xd6\xab\x95\x05\xdfq\xc0c\xb1\xfcM*\xfdq\
+H\x17 \x9a_/\xde\x8eT\x1c\xcc2}E\x18\xff\
+\x00j\x8f/\xde\x8f/\xde\x8eU\xd89\x98\x9f\xf0#\
+F\x0f\xa9\xa7\xd1G*\xec\x0d\xb0\xa2\x9b\xe5\xfb\xd2\xaa\
+\xed\xa3\x95v\x13\x93\xb6\xe20\xc7\xff\x00\xaa\xb1\xbcF\
+A\xbd\x03\x9e\x10\x7fZ\xda\xc7\xd6\xb1|H1|\x0f\
+\xaa\x0a\xc7\x10\x97&\xc6\x98v\xf9\xca;\x05\x1b\x05-\
+\x15\xc1\xca\x8e\xeb\xbe\xe2l\x14l\x14\xb4Q\xca\x82\xef\
+\xb8\x9b\x05\x1b\x05-\x14r\xa0\xbb\xee&\xc1F\xc1K\
+E\x1c\xa8.\xfb\x89\xb0Q\xb0R\xd1G*\x0b\xbe\xe2\
+l\x14l\x14\xb4Q\xca\x82\xef\xb8\x9b\x05\x1b\x05-\x14\
+r\xa0\xbb\xee&\xc1F\xc1KE\x1c\xa8.\xfb\x89\xc7\
+\xf7M*F]\x82\x80K\x1e\x82\x84C#\x85\x03,\
+\xdd\x05jYX\x8bD9\x00\xb9\xeakJtT\x9d\
+\x88\x9dG\x1dnEg\xa5\x08Hi0\xcf\xd7\x07\xa2\
+\xd5\xbc\x00;R\xf1\xf8Ry~\xf5\xd9\x18F:$\
+s9\xc9\xea\xd8\xbb~\x9f\x95\x1b~\x9f\x95-\x14\xf9\
+Was\xbf\xea\xe2m\xfa~Tm\xfa~T\xb4Q\
+\xca\xbb\x07;\xfe\xae&\xdf\xa7\xe5F\xdf\xa7\xe5KE\
+\x1c\xab\xb0s\xbf\xea\xe2m\xfa~Tm\xfa~T\xb4\
+Q\xca\xbb\x07;\xfe\xae&\xdf\xa7\xe5Hx\x1d\x05:\
+\x8a9W`\xe7\x7f\xd5\xc6\x91\xb8\x10@\xc1\xebY\xf7\
+\xfa_\x96\x0b\xc7\xf7{\xaf\xa5iRv\xa9\x958\xc9\
+j\x87\x1a\x92Os\x0fh\x07=\xa8\xd8*\xe6\xa7`\
+#\xcc\x880\xbf\xc5\xedT\xf3\xf4\x22\xb8\xa7ME\xda\
+\xc7T'ut\xc3`\xa3`\xa5\xa2\xa7\x95\x15w\xdc\
+M\x82\x8d\x82\x96\x8a9P]\xf7\x13`\xa3\x81\xea)\
+i\x0fCME\x03o\xb8\xc6$\x1e?\x9e(\xa5'\
+\x1e\xbf\x9d\x15\xa2J\xc5);nbw?J#\xef\
+Wc\xf0\xfd\xcb\xf5D_\xabri\xe3\xc3\x12\x9e\xb2\
+\xc6\xbe\xc3&\xbc\xf8Q\x9bKO\xebCiU\x82z\
+\xb2\x8d\x15\xa2\xbe\x19\x1d\xe7\xfc\x85;\xfe\x11\xd8\xd0s\
+#\x1f\xca\xb4T'\xd8\x97^\x1d\xcc\xca+H\xe8P\
+\xff\x00zJ?\xb1\x22\xfe\xfc\x94{\x19\x87\xb7\x89\x9b\
+Eh\x1d\x0d1\xf2\xbb\x8ach\x98\x1f,\xbf\x9a\xd2\
+\xf6R\x1f\xb6\x81J\x8a\xb0\xfaL\x89\xd0\xa3~\x95\x14\
+\x96rD9B>\x9c\xd4\xb84Z\x9ac(\x0e\x14\
+\x7f*O\xbc1\xde\x85\x19\x04\x13\xd6\xa4.\x0ar\xb4\
+\xb4uPq\x81EZw$(\xcf\x1d(\xa3\x1cf\
+\x98\x0a\x9c\xf1\xda\x9c\x00\x14\x8ax\xcfqN^y\xe4\
+g\xb5\x17\x00\xa4\xc7\xd6\x9d\x83H$\x04\x91\xdf\xf9R\
+\xb8\xaf\xdc(\xa5FV'\x188\xa5\xdb\xcd4&6\
+\x8a(\xad\x09\x0a(\xa2\x80\x15>\xf0\xa7\xd3\x13\xef\x0a\
+}C\xdc\x02\x8a(\xa4\x01B\xaep\x0d\x14\x8b\x9cw\
+\xcd\x00I\xb4m\xa5\xa6s\x80y\xe3\xf5\xa7\xd0\x01E\
+\x14P\x01E\x14P\x02\x13\x8f\xc6\x95{\xfa\xe6\x90c\
+'\xe9\xc5*q\xf9\xe6\x80$\xa2\x8aN\xe7\xad\x00-\
+\x14QZ#6\x14QE\x00\x14\xa9\xd6\x92\x95:\xd0\
+\x03\xf1\xcei\x1f\xee\x9a?\x8b\xf0\xa1\xfe\xe9\xaa\x88\x0b\
+E\x14U\x00SW\x19\xf6\xa7Q@\x04k\x86\x1e\xb4\
+\xe20:b\x98\xa0\x92\x008\xf7\xa7u \xe0\xfaS\
+^@u\xde\x0e\xbb\xfbN\x8c\xaaO\xcd\x0b\x14\xfe\xa3\
+\xf9\xd6\x9ds>\x04\xbe\xf2\xaf\xa5\x80\x9e&]\xc3\xea\
+:\xfe\x95\xd3r8=\xab\xdb\xc2\xcf\x9a\x92g\x87\x8a\
+\x87-F\x87QE\x15\xd0s\x857\xbd:\x8a\x00T\
+\xf4\xedO\xa8\xe3\xa9*\xe3\xb0\x05\x14QL\x02\x8a(\
+\xa0\x02\x8a(\xa0\x02\x92\x96\xaa\xeb:\x98\xd2l\x1en\
+\xeb\xc2\xfb\x93\xd3\xfc\xfbT\xcaI+\xb2\xa2\x9bvE\
+/\x12\xf8\x90i\xa0\xc3\x09\xddpG'\xfey\xff\x00\
+\xf5\xeb\x9af.\xc4\xb3\x16f9$\x9c\xe6\x86f\x95\
+\x8b9\xdc\xeerO\xad\x15\xe1V\xad*\x92\xbb=\x9a\
+TU8\xe8!\x1c\xfe\xb4\xb4QY$6\x14Sv\
+\x9fSF\xd3\xeah\x00'\x0d\xc7\xd2\x9c\xbf0=q\
+L^\xbc\xd3\xc5\x05\xd8\xbf\xa5\xf8\x8e}-\x82\xe7\xcd\
+\x8b\xfb\x8cz}\x0fj\xe94\xddR-V\x1d\xf17\
+\xfb\xcaz\xaf\xd6\xb8\xc3\x92O^i\xf6\xb7\x12Y\xca\
+$\x8d\x8a\xba\xf7\x15\xd7C\x15(h\xf69\xaa\xe1\xa3\
+=V\xe7p\x9ftR\xd6f\x87\xe2\x14\xd4\xc0G\x02\
+9\xfb\xaff\xfaV\x9dz\xb0\x9a\x92\xbcO2pq\
+vaE\x22}\xd1KZ\x10\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x07\xa5S\
+\xf1\x0c\xff\x00f\xd2\xe7=\xd8l\x1c\xfa\xd5\xca\xc2\xf1\
+\x8d\xee\xe7\x8a\x10~\xe8\xde\xdf\xd3\xfc\xfb\xd6\x18\x89\xf2\
+\xc1\xb6mB<\xd3FG@>\x94R/\xf4\xa5\xaf\
+\x19\x9e\xa8/QO\x0a\x06}\xe9\xa0\xf6\xc74\xa39\
+\xe7<P1\xd4Rw\xa5\xa0\x02\x8a(\xa0\x02\x81\x9a\
+)\x1b\xa5\x02\xb8&sV\xb4\xdd9\xf59N\x0e#\
+S\xf37o\xa5K\xa5\xe8ozCI\x98\xe2?\xf7\
+\xd3}+j(\x16\xda \x88\xa1Tt\x02\xba\xe8a\
+\xdb\xd6[\x1c\xd5*\xa5\xa4w\x08!Kh\xd5\x14`\
+(\xe2\xa4\xa6\xff\x00\xfa\xe9\xd5\xe8$r\x85\x14QL\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x06J3\x13\x03\xceA\xac\
+c\xd0V\xcb\xfd\xc6\xf5\xc5cW5u\xaa6\xa3\xb0\
+QE\x15\x81\xb1%\x08\xa0\x91\xf4\xa2\x90t\x18\xcf\xe1\
+Z\x01\x22\xae\xdaZjg\x1c\xe74\xea\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x19\x13\x0a\xc7\xf10\xc5\xd4\
+G\xb3.+b\xb3<N\x99\x8e\x16\xf4%k*\xea\
+\xf0.\x8b\xb4\xd1\x94\x0eh\xa2\x8a\xf3\xd6\xc7\xa0\x14Q\
+E0\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\
+\xa2\x80\x0a(\xa2\x80\x0aF\xfe\x5c\xd2\xd4\xbam\xb0\xb8\
+\x9f\x9eU9?\xd2\x84\xae\xec);+\x96\xf4\xbb!\
+\x0c{\xd8\x0d\xed\xfa\x0a\xb9I\xf5\xebK]\xd0\x8aJ\
+\xc8\xe2\x94\xae\xc2\x8a(\xaa$(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00k\x00\xcb\xd39\xed\xd8\xd6U\xf5\xa9\xb4\x9f\x1f\xc2\
+\xdc\xaf\xf8V\xbdA\x7fk\xf6\x98\x08\x18\xdc\xbc\x8f\xad\
+eV\x17W4\xa7+3*\x8aJZ\xe4;\x02\x8a\
+(\xa0\x02\x90\xf7\xfaR\xd2\x1e\xff\x00JLOa\x87\
+\xad\x14\x1e\xb4S\x04^s\x92\x05(\x18\x04z\xd3O\
+_\xce\x9fZGD\x91\x84\xb7dLv\x91Mq\xfb\
+\xbat\x9d\x0d$\xbfr\x81\xa2\x1aT\xfb\xc2\x92\x85\xea\
++2\x99%GRTt\x12\xb7\x18\xc3\x0c}\xe9\xa4\
+\xe0\x1c\xd3\x9f\xef})(\xb1\xb5\x8a\xf3\xdb$\xc7\xe6\
+PsUf\xb01\xe4\xaeXt\xc7z\xbdL\x93\x80\
+\x0f\x00\xd6s\x82h\xa5&\x8c\xf1\xc8\x00v\xe2\x92\xac\
+]\xdb\xe4\x17\x1c\x11\xd7\xde\xa0\xc7\x19\xef\x5c\xedr\xe8\
+\xcd\x93\xb8\x94QE\x03\x1c\x82\x9c\x1b\x1c\xe7\x14\xd5\xe4\
+\x11]?\xc1\xdf\x0d\xa7\x88<_\x10\x99D\x90Y\xa1\
+\xb8\x91OG\xc1\xc2\x83\xed\x92+J4eV\xa4i\
+Gv\xeceZ\xaa\xa7\x07R[#\x7f\xe1\xef\xc15\
+\xbc\x82+\xdd`8YF\xf8\xedA\xc1#\xb1r9\
+\x1fO\xff\x00Uw\xf6^\x1e\xb1\xd3`X\xa0\xb1\xb4\
+\x89\x17\x80\x16%\xff\x00&\xad\x95\xdcy\xc1\xa6\xd7\xde\
+apThEF\x0b^\xe7\xc6b1ukI\xca\
+ON\xc6'\x89\xfe\x19\xe9>)\x88\xf9\x96\xc9mq\
+\x8c,\xf6\xea\x11\x87\xd7\x1c\x11\xf5\xaf!\xf1w\x84\xee\
+\xbc\x1b\xab5\xa5\xce\x18\x91\xba9W\xee\xcc\xbf\xde\x1f\
+\xd4v\xafz^\xfdk\x99\xf8\xc9\xe1\xc5\xd7|\x1d<\
+\xa1A\x9fN\xff\x00HF\xee\x00\xfb\xc3\xf1\x1f\xca\xb8\
+3L\xba\x15)\xba\x94\xd5\xa4\xbf\x1f#\xb3-\xc7\xce\
+\x15\x159\xbb\xc5\xfe\x07\x8cQJ>n\xff\x00\x88\xa3\
+=\xb1\xff\x00\xd6\xaf\x90L\xfa\xab\x09E\x14U\x12*\
+}\xe1O\xa6'\xde\x14\xfa\x87\xb8\x05\x14QH\x02\x91\
+\x1b\x00\x1aZ:\x9a\x00RO\xe7\xd2\x9fM\xc7\x18\xef\
+\xda\x9d@\x05\x14Q@\x05\x14Q@\x08\xa3'\xe9\xcd\
+*s\xf9\xe2\x80q\xf8\xd0\x86\x80$\xa2\x8a(\x00\xa2\
+\x8a+Df\xc2\x8a(\xa0\x02\x95:\xd2R\xa7Z\x00\
+vy\xc5\x0f\xf7M\x18\xf9\xb3C\xfd\xd3U\x10\x16\x8a\
+(\xaa\x00\xa2\x8aA\xc0\xe7\x8a\x00\x14\x81\x8a~\xfei\
+\x91\xaeH\xcd=Wn9\xc9\xa6\xae\xd0\x12Y]5\
+\x8d\xe4s/X\x987\xd4w\xfd+\xbb\x8ae\x9a5\
+e;\x91\x86A\xf6\xae\x07\x1f\xa75\xd2\xf8#S\xfb\
+E\x93[\xb1\xf9\xe0\xe5}\xd4\xff\x00\x81\xfeu\xdd\x83\
+\xa9\xcb.W\xd4\xe1\xc6\xd2\xbcy\x97Cr\x8a(\xaf\
+T\xf2B\x8a(\xa0\x05N\xb4\xfa\x8e>8\xa9*\xe3\
+\xb0\x05\x14QL\x02\x8a(\xa0\x02\x8a(\xa4\xc1!7\
+\x06\x15\xcc\xf8\xd3P7\x17\xcbn\xa7\x0b\x08\xc9\x1f\xed\
+\x1f\xf0\xae\x86\xea\xe1l\xed\xa4\x95\xbe\xecjX\xd7\x13\
+$\xa6\xe6w\x91\x8eZBX\x9fZ\xf3\xf1\xd5-\x15\
+\x05\xd4\xef\xc0\xd3\xbc\xb9\xdfA?\x0e)h\xa4_\xe9\
+^a\xe8\xb6\xac\xc5\xa2\x8a(3\x10\xb6(\xde)i\
+\x19F) \x1a\x06M=F\x051[i\xcd9N\
+\xe1L\xd0\x5c\xed\xe7\xd2\x8a\x08\xc9\xf6\xf4\xa2\x80\x1c\x18\
+\xab\x06RC/ \x83\xc8>\xb5\xd1h\x1e&\xfbV\
+ \xb8!e=\x1b\xa0\x93\xff\x00\xaf\x5c\xd8\xfaf\x9c\
+\xc07\xb1\xfeU\xbd*\xd2\xa7+\xa3\x1a\x94c5f\
+w?\x5c\xfe4\xb5\xcf\xf8\x7f\xc5\x1eXX.X\x11\
+\xd1$\xf4\xf6?\xe3[\xe0\xee\xf7\x07\xbf\xadz\xf4\xab\
+F\xa4n\x8f*\xa5)A\xd9\x8bE5\x9c-\x06_\
+A\x9a\xd6\xe8\xcdE\x8e\xa2\xa3\xf3s\xe8)7\x96\xf5\
+\xfc\xe9s\x14\xa0\xc9h\xa8\xbf\x13\xf9Q\xf8\x9f\xca\x8e\
+`\xe4%\xa2\xa2\xfcO\xe5F\xef\xf6\x8d.p\xe4%\
+\xa4\xcf\xb8\xa8\xfc\xe3\xeb\xfaR\xf9\xa7\xd8\xd1\xcc\x83\x91\
+\x85\xcd\xc2\xda\xc0\xf29\x01\x10d\xd7%ur\xd7\x97\
+\x0f+gs\x9c\xfd+\xa2\xd6t\xf7\xd5!D\x12\xf9\
+H\xbc\x95\xc7\xde5\x9a\xfe\x11\x90\x1e'\x8c\xfdT\x8a\
+\xe3\xc4\xa9\xcd\xd9-\x0e\xbc;\x845oS-[#\
+\x9a7\x8a\xd0o\x0a\x5c\x8e\x86&\xff\x00\x81u\xa67\
+\x86n\x80\xfb\x88~\x8d\xd6\xb9=\x8c\xfb\x1d*p\xb6\
+\xe5ES\xc1\xedN\xdd\x8a\xb2<;w\xc7\xee\xb3\xff\
+\x00\x02\x14\xe5\xf0\xf5\xdf\xfc\xf2\x1c\xff\x00\xb4*U)\
+\xdfa\xfbX\xf7*n\x14\xb5q<3r\xc4|\xb1\
+\xaf\xd5\xaaT\xf0\xac\x99\xc3L\x83\xe83U\xec*>\
+\x80\xea\xc7\xb9\x9b\x9a7\x0fZ\xda\x87\xc2\xf1!\xf9\xe4\
+\x92C\xff\x00|\xd5\xc84\xe8m1\xe5\xc4\xab\xef\x8c\
+\x9f\xce\xb4\x8e\x16]L]x\xad\xb50\xad4Y\xef\
+0Uv'\x5c\xbf\x03\xfckR\xc7@\x8a\xcc\x02\xdf\
+\xbe\x93\xd5\x87\x03\xf0\xab\xe0\xe4~\x9c\xd2WU<<\
+#\xae\xe62\xab)\x0b\xd3=>\xb4\xb4Q[\xa4e\
+`\xa2\x8a)\x8c(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+L\x068\xc27\xa9\x06\xb1\xabfV\xdb\x0b\x1cg\x00\
+\xd61\xe8+\x9a\xb6\xe8\xda\x8a\xd0(\xa2\x8a\xc4\xd8\x92\
+\x91\x0e\x0eO\xa5-\x22|\xc7\x18\xc5h\x04\x81\xb2\xb9\
+\xa5\xa6\x85!H\xa7P\x01E\x14P\x01E\x14P\x01\
+E\x14P\xc8\x98U=v/7On>\xe1\x0fW\
+)\xb2\xc6&\x89\x94\xf0\x1c\x11S5u`\x8b\xb4\x93\
+9\x9a(d1\xb9S\xc1S\x83Ey\x89[C\xd2\
+N\xe1E\x14S\x18QE\x14\x00QE\x14\x00QE\
+\x14\x00QE\x14\x00QE\x140\x13\xf4\xf7\xad=&\
+\x0d\x96\xa1\xbb\xc9\xf3V`M\xe7\x18\xeb\xc6+m\x14\
+\x22\x01\xd8\x0c\x0a\xd6\x84n\xeeaY\xe8\x90\xea(\xa2\
+\xba\xce`\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa4\
+\xfc\xb1KE\x00c\xdfA\xe4\x5c\xb0\xe8\x0f\xcc*:\
+\xb9\xaeG\x9d\x8f\x8c\xf0A\xaau\xc3R6\x93Gd\
+\x1d\xd2\x0a(\xa2\xa4\xd0)\x0f\x7f\xa5-!\xef\xf4\xa4\
+\xc4\xf6\x18z\xd1A\xebE0E\xe3\xd8\xf7\xebJ\xa7\
+\x22\x91\xba~4'J\xd2;#\x9e_\x10\xc9:\x1a\
+I~\xe5,\xbf\xd6\x90\xfd\xd1Lh\x86\x8a(\xac\x8d\
+\x07d\x81\xeb\xedM'\xb9\xa7&1\xdb4\xda\x08[\
+\x91\xc80O\xbd\x14\xe9;S8aA\xb8\xc3\xd7\xd2\
+\x98\xff\x00(\xe9\x91Oc\x92\x7f\xad1\xc7\xc9\xc7\xe9\
+I\xec\x03:\xd5GO,\xb0\xed\xda\xad7\x02\xab\xde\
+\xf1)<c\x15\xcdQ\x17\x07\xa9\x1e\x0e:R\x85\x19\
+\xe7\x15{F\xf0\xcd\xd6\xb1\x86E\x11\xc5\xff\x00=\x1f\
+\xa6=\xbdk\xa3\xd3<!k\xa7\x8d\xcc\xbfh\x93\xfb\
+\xcf\xd0}\x05kK\x0bRz\xec\x88\xa9\x88\x84\x1d\xba\
+\x9c\xc6\x9f\xa3\xdcj'0\xc2\xee\xbf\xde\xe8\xbf\x9dw\
+\xbf\x04\xf4Y4-~\x7f9\xe3-uncUN\
+H \x86\xeb\xf8T-\xf2\x8cq\x81\xd8v\xa7\xd9\xdd\
+=\x85\xccsD@\x92&\xdc\xbfZ\xf50\x98x\xd0\
+\xa9\x1a\xb7\xbbG\x9f\x8a\xab*\xd4\xdd>\x8c\xf4\xcc{\
+\xd3j\xb6\x8b\xad\xc5\xae\xda\x09b`\x1b\xf8\xd3\xba\x1e\
+\xf5f\xbe\xbe2RW\x8e\xc7\xcb\xb4\xd3\xb4\x82\xabx\
+\x8au\x83C\xbcg\x00\xaf\x94\xc3\x07\xbeF1\xfa\xd5\
+\x99\x1db\x8c\xbb\x90\xa8\xbdY\x8e\x00\xfck\x8a\xf1\xbf\
+\x8b\xd7Z\xff\x00F\xb7'\xec\xb1\xb6K\x7f\xcfc\xfe\
+\x02\xb9\xb1U\xe3N\x0e\xefS|5\x19T\x9a\xb6\xc7\
+3>\x9b\x04\xa3\x0fo\x0b}W\xadV\x9f\xc3v\x92\
+\x8e!\xd8O\xf7I\x15\xa3\xc6;Tm\xc1\xe7\x9a\xf9\
+\x99S\x8bZ\xa3\xe8\x94\xe4\x9e\x8c\xc7\xb8\xf0r\xed&\
+)\x98\x11\xdaA\xc7\xe6+>\xefA\xb9\xb3RZ2\
+\xe3\xd5>j\xea\x0bg\x83\xd2\x85n:{W<\xf0\
+\xd0{\x1a\xc7\x115\xe6qc\x8e\xd4\xbeg\xb5uW\
+\xfaT\x17\xc7\xf7\x91\x80\x7f\xbc\xa3\x04V>\xa1\xe1y\
+`\x04\xc4|\xd5\xf4\xfe!\xfe5\xcbS\x0f(\xeb\xb9\
+\xbc+\xc6[\x99\xf4R\x15\xd8pz\x8flb\x96\xb9\
+\xecmp\xa4\x04\x01\x91KH\xbd\xb3\x8cR\x18\xed\xc7\
+\x83\xdb\x14\xfao\x18\xc7\x1c\xf4\xa7P\x01E\x14P\x01\
+E\x14P\x02c9\xf6\x14\xe5\xfe\xb4\xdf\xa5*\xf5\xfa\
+\xf1@\x12Rz\xf3KM\xe3\x9a\x00u\x14QZ#\
+6\x14QE\x00\x14\xa9\xd6\x92\x95:\xd0\x03\xb3\xf3~\
+\x14?\xdd4q\x9e\xd9\xa1\xfe\xe9\xaa\x88\x0bE\x14U\
+\x00QE \x18\x1e\xb4\x00\xa9\x9c\x0fZp$\xb0=\
+\xa9\xb1\xe1[\xa8\xa7\xf1\xedM\x00\xb5.\x99|\xdae\
+\xeaL\xa0\x92\x87$\x0f\xe2\x1d\xc5EM=zq\xde\
+\xae\xed4\xd12I\xab3\xbd\xb6\xb8[\xb8\x12Tm\
+\xc9 \xdc\x0f\xb5K\x5c\xbf\x83\xb5\xdf\xb2\xca-\xa5`\
+\x22\x90\xfc\x84\xf4C\xe9\xf45\xd3co\x1d9\xafj\
+\x8dU8\xf3#\xc3\xafI\xd3\x97+\x1dE\x14V\xc6\
+\x22\xc7\xd3\xde\x9fLO\xd2\x9fW\x1d\x80(\xa2\x8a`\
+\x14QE\x00\x14\x8f\xf7M-2i\xd2\x08\x99\xdc\x85\
+D\x19'\xd0Rli6\xec\x8c_\x1b\xea>]\xb4\
+v\xea~i\x0e\xf6\xff\x00t\x7f\xf5\xff\x00\x95s\xa9\
+\xf7\xb3\xeb\xfaT\xda\x86\xa0\xda\xa5\xf4\x936A\x90\xf0\
+?\xba;\x0a\x8ccw\x15\xe0\xe2*\xfbJ\x8eKc\
+\xdc\xa1K\x92\x0a\x22\xd1E\x22\xff\x00J\xc8\xb6\xf4b\
+\xd1E\x14\x19\x89\xcf\xb5&\x1b\xd4S\xa9\x19\x86) \
+\xb8\x91\x80O4\xe01L\x19\xf7\xc5=3\x81\x9c\xf5\
+\xa6h\x0cy\xc0\xefE\x14P\x01A\xe0\x1e?\x1a1\
+\x901\x9ex\xe9\x9c\xd6\xe6\x8b\xe1q\x85\x96\xe7$\xe3\
+\x22>\xdf\x8dkN\x93\x9b\xb22\xa9R1Wf~\
+\x9b\xa1\xcf\xa9\x90UBG\xdd\xdb\xa7\xff\x00^\xbaM\
+6\xc4\xe9\xb6\xab\x10\x91\xe4\x03\xfb\xdd\xbd\x87\xa0\xa9\x94\
+m\x00\x0c`t\xc0\xe9@\xf9\x86k\xd3\xa5B0\xd5\
+npU\xab)\x8e\xa2\x8a+\xa0\xcc(\xa2\x8a\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00h\xfeT\x0f\xfd\
+\x06\x9dE\x00'<rx\xa4\xe9\xfeqN\xa2\x81X\
+M\xe2\x90s\xdb\x1fJu\x14\x05\x86\xed\xc5\x18\xed\xc7\
+\xad:\x8aV\x0b\x05\x14QLaE\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+R\x02\x1b\xd6\x0bl\xe7\x9c\xe3\x15\x94I\x1czV\x96\
+\xa8qj\xc3#,qY\xa4\x13\xcf\xadr\xd6~\xf1\
+\xbd\x15\xa0\x94QEdjIH\xa4\x81\xc0\xfdih\
+\x8f\x19\x19\xc7J\xd0\x07!\xc8\xc9\xa7R\x0cv\xe9K\
+@\x05\x14Q@\x05\x14Q@\x05\x14QC\x22aA\
+\x19\xa2\x90\xf4\xe2\x82Y\x87\xafZ\xfd\x9e\xf4\xb7\xf0\xca\
+3\xf8\xf7\xaa\x95\xb7\xad\xd9\x1b\xab.9h\xfea\xc7\
+\xe6+\x12\xbc\xfa\xd1\xe5\x91\xdfBw\x88QE\x15\x9a\
+6\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\
+\x80\x0a(\xa2\x80$\xb2B\xd7Q\x8c\x7f\x105\xae\xbd\
+\xfe\xb5\x93\xa6sz\x83\x8e\xf5\xaf]8\x7f\x84\xe5\xac\
+\xf5\x0a(\xa2\xb71\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\
+\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\
+\xa2\x80\x0a(\xa2\x80*\xea\xcb\xba\xd0\xe3\xaa\x90k0\
+u5\xab\xa8\xae\xebI}\x96\xb2\xeb\x92\xbf\xc4uQ\
+\xf8B\x8a(\xac\x8d\x82\x90\xf7\xfaR\xd2\x1e\xff\x00J\
+LOa\x87\xad\x14\x1e\xb4S\x04]=\x7f:}4\
+\x8cs\xe9N\xad\x16\xc6\x12\xdd\x91M\xd6\x91\xbe\xe7\xe1\
+K7ZG\x19Jh\x17B\x1a(#\x06\x8a\xc8\xd0\
+S\xce\x07JLq\xf5\xa7/?CM?7L\xf1\
+A\x98\xd7\x18\x00Si\xcf\xd6\x9bA\xb4^\x83\x1f\xef\
+\x1ad\x83+\xf4\xa7\x1e\xbe\xb4\x04.:}he\x11\
+c<\x0es[\x9e\x17\xf0\xcc3D\xb7S\xaf\x9c\xe5\
+\x88To\xba\xa0{w\xac\x9d\x9b\x10\xe2\xba\xbd\x12\x1f\
+#K\x81z\x12\xb9?\x8f?\xd6\xb5\xc3S\x8c\xa5v\
+s\xe2f\xe3\x1d\x0b\x0e0?\xfa\xd5\x1d>N\x94\xca\
+\xf4\x19\xc4\xb6\x19'\xdf\xa7\xd3$\xfb\xf4\x94!\x93[\
+\xdd\xc9g0\x92)\x1a)\x07\xf1)\xc1\xad!\xe3\xad\
+Ec\x03\xceC\x8e7\x14\x04\x9a\xcaQ\x94\xa0\xae}\
+\xa9\xc6\xac\xa3\xa4[D:q\x7f\x12%\xd4\xf5\xab\x9d\
+Q\xbf\xd2.$\x9b\x1d\x89\xc2\xfeUW\xb9\xea}\xe9\
+\xce\xb8=y\xa2\x93\x93\x96\xad\x9a\xc6\x11\x8e\xc8\x8d\xfa\
+56N\xd4\xf6\xc1@y\xc6i\x92v\xa9{\x144\
+~\xb4/~\xbe\xf9\xa2\x85>\x9fJ\x80\x1b'j9\
+^\xc3=\xa8\x97\xad\x11\xf7\xa0\x0a\xda\x86\x8f\x15\xfa\x9d\
+\xe3k\x8e\x03\xaf_\xfe\xbd`\xea:D\xbaq\xc9\xc3\
+FO\x0e:~5\xd3\xbdF\xe9\xbc\x10@ \x8c`\
+\x8c\xd7=Z\x11\x96\xa8\xd6\x15\x5cNS\x04\xf5\xeb@\
+\x5c\x9cV\xa6\xab\xe1\xfd\xb9x\x01 rc\xcfO\xa5\
+f\x0f\x94g\x9e+\xce\x957\x17fvBjJ\xe8\
+v?Ju7==\xc7\xe5N\xa8,(\xa2\x8a\x00\
+(\xa2\x8a\x00\x01\xc7\xe3\xc5\x0b\xdc\xfb\xd0\x06G\xd2\x95\
+\x7f\xad\x00>\x8a)\xbf\xfa\x0d\x00:\x8a(\xad\x11\x9b\
+\x0a(\xa2\x80\x0aT\xebIJ\x9dh\x01\xdby\xf6\xc5\
+\x0f\xf7M\x19\xe7\x14?\xdd5Q\x01h\xa2\x8a\xa0\x0a\
+@\xb98\xa5\xa2\x80\x11\x06\xecg\xa5=W\xa6z\x8a\
+b\xb6\x08\xc0\xcd?vH\xf4\xa7\x1b\x00\xea(\xa2\xac\
+\x03\xb75\xd2xS\xc4\xa2\xe9R\xdav\xc4\xc3\xe5F\
+'\xfd`\xf4\xfa\xff\x00:\xe6\xe91\x9cU\xd2\xab*\
+r\xba1\xadF5#\xca\xce\xff\x00<\x81\x8eh=\
+k\x03@\xf1\x86\x14Cv\xc7=\x04\xb8\xeb\xfe\xf7\xf8\
+\xd6\xf8\xc1\x1c\x1c\x8221\xc85\xecS\xab\x19\xab\xc5\
+\x9e5ZR\x83\xb3C\x93\x8e=\xeaJ\x8e>O\xd0\
+\xd3\xff\x00/z\xde/M\x0c\xac-\x14QN\xe1`\
+\xa2\x93&\x9b$\xa9\x02\x16vTE\x1c\xb3\x1c\x01E\
+\xf4\xb8\xd2m\xd9\x0e<\xf1\x5c\xcf\x8b\xbc@\xb7nm\
+\xa2 \xc6\x87\xe7`~\xf9\xf4\xfa\x0aw\x88\xbcZn\
+\x95\xa1\xb6\xca\xc7\xd1\xa4\x1d[\xe9\xe8+\x13\xaf\x15\xe5\
+\xe2\xf1w\x5c\x90=,.\x19\xaf~b\xa8\xc9>\xb4\
+\xa0`\xfb\xd2)\xc1\xa7\x03\x96\xae\x03\xd1\x16\x8a(\xa0\
+\x89^\xce\xe1E\x14Pd&\xc1F\xc1F\xefcI\
+\xb8\xfaP\x87\xa8\x8apy\xa7\x83\xdcS\x15w5=\
+S\x03\x19\xa0\xb0<\x9fjQ\xc8\xe3\xaf\xebA<\x9e\
+\xf5\xad\xe1]\x1cL\xe2\xe6A\x94C\xfb\xb0\x7f\x88\xfa\
+\xfd+Jt\xdc\xe5dgRj*\xec\xb5\xe1\xdd\x03\
+\xecj'\x98\x03)\xfb\xaaG\xdc\xf7\xfa\xd6\xae}\xc9\
+=\xe8-\x8f\xc6\x9d^\xc5:j\x0a\xc8\xf3%7'\
+v\x14QEh \xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x02\x96\xb0\xd8H\xc7\xa9$\xd5\x0a\xb5\
+\xaaI\xba\xe0\x008P*\xadqTw\x93:i\xab\
+D(\xa2\x8a\x82\xc9(\x03\x8c\x0a)\x13\xe59\xebZ\
+\x00\xf4\xe0\x0au41*M:\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x86D\xc2\x8a(\xa0A\xf9~5\
+\xcf\xeb\x16?a\xba;~\xe3\xfc\xcb\xfe\x15\xd0U}\
+F\xc8_\xdb\x94<\x11\xca\x9fCYU\xa7\xcd\x1f3\
+JS\xe5\x95\xfa\x1c\xfd\x14:4n\xcaA\x0c\xa7\x04\
+\x1e\xd4W\x01\xde\x82\x8a(\xa0aE\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14Rl\x09t\xcf\xf8\xfdC\
+\xea\x0dk\xd6=\x81\xc5\xdcD\xf78\xad\x8a\xea\xc3\xfc\
+'%e\xa8QE\x15\xb9\x90QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x01\x05\xff\x00\xcbi)\xff\
+\x00f\xb2\xabST8\xb3~y8\x15\x97\x5c\x95\xfe\
+#\xaa\x8a\xd2\xe1E\x14VF\xc1H{\xfd)i\x0f\
+\x7f\xa5&'\xb0\xc3\xd6\x8a\x0fZ)\x82/\x7f\x9f\xd6\
+\x9dLn\xff\x00\xe7\xbd>\xb4[\x18Kv2Q\x9c\
+{\xd3_\xee\x9at\xbd)\xa9\xf7E\x00\xb6 n\xa6\
+\x8at\xbf~\x9bP\xcbC\x87\x03\x83\xff\x00\xd7\xa4n\
+\x1b\xe9NO\xba)\x94\x88\x1a\xfd)\xb4\xe7\xe9H\xab\
+\xb8\xd0m\x07\xa0\xc1\x19v=\x80\xa98U\xa7m\x0b\
+\xd0b\x91\x8e\x14\x9a\x01;\x8c\x8e/:UN\xee\xc1\
+k\xb1\x11\x88\xd4/\xf7F+\x99\xf0\xed\xbf\x9f\xabC\
+\x9e\x88K\x9f\xc2\xbaz\xeb\xc2\xab+\x9cX\xb9{\xc9\
+\x08\xcb\x93\x8e\xb5\x15J\xff\x00x\xd4m\xd4\xd7I\xcf\
+\x0d\x86\xb7C\xeb\x9cS)\xd2\xf54\x9f\xc1\xf8\xd0X\
+\xe4\xfb\xa2\x96\x98\x9di\xf4Z\xc0G'CE\x0f\x8d\
+\xdd9\xa2\x83A\x8e\xa0\x8fzd\x9d\xa9\xf3}\xd3L\
+\x93\xb5'\xb0\x0d#'\x06\x8aV\x1d8\xfaR\x01\xf8\
+\xfd*\x00l\xbd\x05\x11\xf7\xa2N\xd4G\xde\x86 \x93\
+\xeeS\x1f\xee\x9a{p\x08\xeezS\x1f\xee\x9aOa\
+\x8d~\x9f\xe7\x8a\xa1\xaah\xe2\xeco\x8c\x05\x94u\x1d\
+\x03\xd5\xd6\xfb\x86\x9b\xd6\xb2\x94\x14\x95\x99Q\x9b\x8b\xba\
+9\xd7B\xa4\xa9R\x0a\xf0A\xea)k_T\xd3V\
+\xf53\xd2P8>\xbe\xd5\x8eb11V\x18e8\
+\x22\xbc\xea\x94\xdcY\xdbNi\xa1h\xa2\x8a\xc8\xd4(\
+\xa2\x8a\x00Bq\xf8\xd2\xad$\x7f\xd2\x958\xfc\xf3@\
+\x12SG\xfe\x85N\xa6\xf7<}h\x01\xd4QEh\
+\x8c\xd8QE\x14\x00R\xa7ZJT\xeb@\x0f\xc79\
+\xa2\x93\x1f7\xe1C\xfd\xd3U\x10\x16\x8a(\xaa\x00\xa4\
+\x03\x8eFih\xa0\x025\xc3\x0fZx\x00t\xa8\xa3\
+\x1c\x9a\x90rA\xc6*\xa2\x03\xa8\xa2\x8a\xa0\x0a(\xa2\
+\x80\x13\xbfJ\xb9\xa4k\xd7\x1aG\x11\xb0h\x8fX\xdb\
+\xa7\xff\x00Z\xaaQD[\x8b\xbcI\x94\x14\x95\xa4u\
+6>6\xb6\x9c\x01*\xbd\xbbw\xc8\xca\xfeu\xa5\x06\
+\xa7op\x01\x8e\xe6&\x07\xb8q\x5c \xeb\x9a]\xa1\
+\x88%s\xf8Wd1\xd5\x17\xc5\xa9\xc7,\x0c>\xce\
+\x87\x7f\xe7\xa0\x19\xf3P\x0f\xf7\x85As\xaeZ\xda}\
+\xfb\x98\x81\x1d\x83d\xd7\x13\xb0z\x0a0\x00\xec\x05[\
+\xcc\x1b\xd9\x12\xb0\x11\xea\xce\x92\xff\x00\xc7qF\xb8\x82\
+6\x99\xbann\x07\xf8\xd6&\xa3\xac\xdcj\xb2\x034\
+\x9b\x80\xe4(\xe1W\xf0\xaa\xf4W-\x5cEI\xe8\xd9\
+\xd3O\x0f\x08l\x84\xc9\xc7\xd3\xa5-\x14VF\xe2\xa7\
+Zv0x\xa6(\xc9\xfa~\xb4\xe1\xf7\xbd(\x01\xd4\
+\x8b\xfd)h\xa0\xcd\xad\x18QE\x14\x19\x85#\xfd\xd3\
+C.i<\xbfz\x00Eb:S\xd0\x96\xfc\xe9\xb1\
+\x9c5=O\xb8\xe0\xd0hKafu\x0b\xc8\xe2^\
+\xacy>\x83\xb9\xfc\xab\xae\x86\x15\x82\x15\x8d\x00\x0a\x83\
+\x02\xb2\xbc!b\x12)' \x13!\xd8\xbfA[5\
+\xea\xe1)r\xc3\x9b\xb9\xe7b*sJ\xdd\x82\x8a(\
+\xae\xb3\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa6\xf4\xa7TWR\xf9\x16\xee\xde\xd8\xa9\x93\
+\xb2\xb8-\xecf\x5cJ%\x9d\x9b\xdf\x8a\x8e\x95:\x0f\
+\xebI\x5c'ZZ\x05\x14Q@\xc9(E\x04\x8f\xa5\
+\x14\x85A\xe9Z\x01\x22\xae\xdaZj\xf4\x14\xea\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x91>\xe8\xa1\x93!h\
+\xa6\xfe=(\xdc\x17\xbf\xe7J\xe4\x8e\xa4+\x93\xda\x93\
+\xcc\xf6\xa5\xe7\xda\x84\xc0\xa3\xadib\xf1|\xc4\x18\x91\
+G \x7f\x10\xac^G\x18\xc5u\x00\x90A\xe3\xda\xb3\
+\xb5}\x17\xceS$#\xf7\x9f\xc4\xbf\xde\xf7\xfa\xd7=\
+j7\xf7\xa2tQ\xabovFM\x14\xd3\xf2dt\
+#\xb6:R\x8c\xf1\xe9\x5cgX\xb4QE1\x85\x14\
+Q@\x05\x14Q@\x05\x14Q@\x0a\x8eRE9\xc6\
+\x085\xb4\x0eG\x1d\xeb\x0d\xb9\xe2\xb5\xec\xa4\xf3m\xd1\
+\xbdF+l;\xdd\x1c\xf5\xd6\xcc\x9a\x8a(\xae\xa3\x9c\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x92\x80\
++\xea\xd1;\xd9\x96Q\x94\x8d\x81c\xe9Y\x95\xd6i\
+V\xe1\xac\x88u\x0c\xb3u\x07\xb8\xe9\x5c\xd6\xad\xa7\x9d\
+2\xf9\xe29+\xf7\x94\xfa\x8a\xe7\xc4S\xb2\xf6\x86\xd8\
+z\xa9\xb7\x02\x0a(\xa2\xb9\xce\xa0\xa4=\xfe\x94\xb4\x87\
+\xbf\xd2\x93\x13\xd8a\xebE\x07\xad\x14\xc1\x17\xf3\xcd-\
+4\xf3\xf8\xf1N\xad\x16\xc6\x12\xdd\x8c\x95w\x01MO\
+\xba)\xf2sQ\xafS@t#\x97\xef\xd3i\xd2\xfd\
+\xfamK-\x0e\x07*E5\x8fSJ\xbd}\xbb\xd2\
+0\x03#\xb5KD\xbd\xc4a\x9a]\x80R\xa0\xa0\x1c\
+\x8e\xdf\x8d\x06\x90\xd8\x18\xf01\xf9SI\xca\xd2\x90>\
+\xa6\x9as\xb4\xd2b\x8e\xec\xd5\xf0|;\xe6\x9eB>\
+\xea\x85\xfc\xff\x00\xfdU\xb5\x9e\xbe\xf5\x9b\xe1\x18\xf6\xe9\
+\xf2?\xfc\xf4\x90\xfe8\xad\x1a\xf4h+SG\x05w\
+z\x8c)\x8f\xd4\xe7\x19\xf6\xa7\xd3$\xfb\xf5\xabdG\
+a\xae0\xff\x00JO\xe1\xc7\xbe)d9\x7f\xad2\
+\x91C\x91{\xd3\xa9\x13\xee\x8aZ\x00d\xbf\xd2\x92\x96\
+_\xe9IAhc\x1e)\x92v\xa7\xb7\xdd\xe8>\x94\
+\xc9;R{\x0cm*\xe74\x94\x0f\x7f\xd2\xa0\x04\x93\
+\xe5P=\xa9#\xefJ\xfd\xbb\xff\x00JH\xfb\xd0\x00\
+\xfc\x0fzm9\xf9\xfaSi4\x04r\xfd\xc3Q\xd4\
+\x92\xf4\xa8\xea\x00W\x1c\xff\x00\x85T\xd4\xb4\xf5\xbeM\
+\xc3\x89Tp}}\xaa\xd7c\xf4\xa6\x03\x8f\xc7\xadD\
+\xe2\x9e\xe5FM;\xa3\x05\x94\xc6\xc4\x11\x8284\xb5\
+\xa9\xaai\xff\x00j]\xea\x07\x98\xbf\xf8\xf5e0!\
+\x8f^:\x83\xda\xbc\xea\x94\xdcY\xdd\x09&\x85\xa2\x8a\
++3A\x14d\xfd9\xa5N\x7f<R)\xdb\xf8\xf1\
+J\xbdO\xaeh\x02J(\xa2\x80\x0a(\xa2\xb4Fl\
+(\xa2\x8a\x00)S\xad%*u\xa0\x07g\x9cP\xff\
+\x00t\xd1\x8esC\xfd\xd3U\x10\x16\x8a(\xaa\x00\xa2\
+\x8aj\xe3>\xd4\x00\xe4 `\xd3\xf7r=\xe9\x91\xae\
+\x18z\xd3\xc2b\xaa -\x14QT\x01E\x14P\x01\
+E\x14P\x01\x9c\xd3\x81\xc7\x1d\xe9\xa4f\x9c\xa8\x08\x14\
+\x00\xea(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x15\x0f4\
+\xec\xe5\xbe\x94\xd49&\x9c\xa3\x06\x80\x16\x8a)\x17\xfa\
+Pf\xed\xa8\xb4QE\x06b\x16\xc5\x1b\xc5-#\xfd\
+\xd3@\x0d\x03&\x9e\x88K\x009$\xe0\x0fZ`8\
+5\x7f\xc3v\xff\x00j\xd5\xa1\xc8\xe23\xbc\xfe\x15t\
+\xe3y$T\xe5es\xa7\xb4\xb7\x16\x96\xb1\xc4:F\
+\xa1\x7f\xc6\xa5\xa6\x9c\x82s\xd4\xf3\xc5:\xbd\xc8\xab+\
+\x1eM\xef\xa8QE\x14\xc0(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00*\x96\xb1.\xc8\xd5\x01\xeb\
+\xc9\xcd[\x1f\xca\xb2\xef\xe5\xf3\xae[\x9c\x85\xf9k\x1a\
+\xae\xd1\xb1t\xd5\xe5\xa9\x19\xeb\x9f\xe5M\xa2\x8a\xe5\xb1\
+\xd2\x14QE\x00IH\x87\x07'\xd2\x96\x91\x06N\x0d\
+h\x04\x81\xb2\xb9\xa5\xa4\x0b\x85\xc5-\x00\x14QE\x00\
+\x14QE\x00\x14\x89\xf7E-'\xf0\x9aL\x99\x15\xf5\
+K\xb6\xb1\xd3\xee'EVhci\x00=\x09\x03<\
+\xfbW\xf4\x7f\xfb/\x7f\xc1\xbc\x1f\xb2\xbe\x87\xf0\x1b\xc2\
+#_\xf8~\x9e6\xd6\xaet\xbb{\xab\xedgS\xd4\
+\xee\xc4\xf7\xd2\xc9\x18v}\xb0\xca\x91\xa2\xe5\x8e\xd5U\
+\xe0\x002z\x9f\xe7\x1c\x80A\x04\x06\x07\x82=k\xf7\
+\xb3\xfe\x0d\x86\xff\x00\x82\x96\xb7\xed\x15\xf0\x0e\xeb\xe0\x97\
+\x8a\xef\xcc\xbe0\xf8gl\xad\xa3M<\x99\x93U\xd1\
+\xb2\x15G<\x97\xb6b#?\xec<^\xe6\xbe{\x88\
+\x96&4\x15l<\x9aQz\xdbM\xf6=\x9c\x89\xd0\
+u\x9d:\xd1M\xb5\xa5\xcf\xa2\x0f\xfc\x1b\xf1\xfb \xff\
+\x00\xd1\x15\xd1\x7f\xf0i\xa8\x7f\xf1\xfa_\xf8\x87\xdb\xf6\
+A\xff\x00\xa2-\xa2\xff\x00\xe0\xd7P\xff\x00\xe3\xf5\x83\
+\xff\x00\x05\xe4\xf1?\xc7o\x83_\xb2\xe4_\x13\xbe\x07\
+\xf8\xefQ\xf0\xdc\xde\x05w\xb9\xf1&\x97\x05\x85\xad\xda\
+\xea\x1as`5\xca\xf9\xd1H\xca\xf6\xe4n!p\x0a\
+3\x93\xf7E~2\x0f\xf88C\xf6\xad c\xe3-\
+\xd1\x1e\xbf\xd8Zg?\xf9/^\x1e\x03\x0b\x98c)\
+{ZU\xfeNR\xba=\x8cf'\x05\x86\xa9\xec\xea\
+Q\xff\x00\xc9U\x8f\xdb\x86\xff\x00\x83}\x7fd\x11\xcf\
+\xfc)]\x14\xff\x00\xdcWP\xff\x00\xe3\xf5\x85\xf1?\
+\xfe\x08\x8b\xfb\x15|\x1d\xf8}\xaex\xab\xc4?\x08\xfc\
+?\xa5h\x1e\x1b\xb1\x97R\xbe\xbb\x9bV\xd4\x02A\x0c\
+J]\xd8\xff\x00\xa4z/\x03\xbfN\xa6\xbf\x19?\xe2\
+!\x0f\xda\xb7\xfe\x8b%\xd7\xfe\x08\xb4\xcf\xfeG\xaew\
+\xe2\xcf\xfc\x15/\xf6\x90\xfd\xbc\xbc,\xbf\x0b\xfcG\xf1\
+\x0fR\xf1n\x93\xe2\xab\xa8b:LV\x16v\x8b|\
+\xe8\xe2DY\x1a\x18\xa3m\x81\x901\x05\xb6\xfc\xbc\x83\
+\x8a\xeeYFe\x17\xcdW\x11h\xad\xdf4\xb4G\x9f\
+\x88\xce\xf2\xbaT\xa5VT\xd2QM\xdd\xa8\xa4\xb4\xdd\
+\xbe\x8b\xbfb\xef\xec\xcb\xfb5x?\xf6\xce\xfd\xa6\xfc\
+c\xe3{\x1f\x03\xc1\xe1\x1f\x84\xbau\xf4\x9f\xd9\x9e\x1e\
+I\xa5x\x8a\x91\xb6\x0bw\x91\xd8\xbb2\xa0\x12\xc8w\
+}\xe7\xc7\x00\x80\x1b\xff\x00\x05H\xfd\x8b\xfc\x13\xf0G\
+\xc0z'\x8a<)d\x9e\x1f\xb9\xb9\xd4\x06\x9dqc\
+\x14\xac\xd1]\x86B\xc2EV$\xab.\xc3\x9c\x1c\x10\
+\xdd\xb1\xce\xdf\xc3_\x80\xff\x00\xb4\xff\x00\xc1\xff\x00\x0a\
+\xc1\xa0\xf8v];G\xd2-\x1d\xe4Hc\xbc\xb1+\
+\xb9\x8e\xe7b\xcc\x09$\x9e\xa4\x9e\xde\xd5\xf3\x97\xc7\xef\
+\x8d\xbe-\xf8\xeb{\x05\xb7\x8c\xb5\xf7\xd7\x9fA\x92X\
+-\xcayb(\x9b8vC\x1a\xaa\xbev\x0f\x9b\x9c\
+\x80;W\x15\x0c>+\x1b\x9a\xfdk\x0d\x88\x8b\xa5\x1f\
+\xb3\x19I\xe9k+\xabZ\xed\xee\xef\xa7M\x8f\xe7,\
+\xbe9\xf6q\xc6\xab:\xc1\xe6t\xa5\x82\xa7\xa3\xa5J\
+\xa3\x97\xb8\xd3K\x9a**\x1c\xd2\x96\xad\xde\xe9i\x16\
+\xf9Q\xe4\xbb\xa8\xde+\xa7\xf8u\xf0sV\xf8\xab\xf1\
+/\xc3>\x15\xd1\x969\xf5?\x16\xea\xb6\xba-\x91\x95\
+\xb6\xa2\xcd<\xab\x12\x19\x0fe\x0c\xe0\x93\x83\xc05\xfb\
+\x01\xa2\x7f\xc1\x9a6m\xa4[\x1dK\xe3\xfe\xa4\x9a\x89\
+\x8c}\xa0Zxf?!_\xb8M\xd3\xee\xdb\x9e\x99\
+\xe6\xbd\xec^2\x96\x15\xa8\xd7vl\xfe\x85\xc2\xe1j\
+b\x13t\x95\xd2?\x167s\xed\xebB\xb6\xea\xfd\xb1\
+\xff\x00\x883\xf4\x7f\xfa8\x0dw\xff\x00\x09\x98\x7f\xf8\
+\xf5|\xb3\xfbk\x7f\xc1\xba\x1a\xff\x00\xec\xc7\xfb\x5c\xfc\
+\x12\xf8a\xa2|F\xd3\xfcOk\xf1\xbfP\xb8\xd3,\
+u+\xed<\xda\xcf\xa4\xc9l\x8b-\xc3\xcb\x0a\xbb\x09\
+\x10D\xe5\x94\xab.J\xed d1\xc2\x9em\x85\xa9\
+.X\xcb_FmS-\xc4B7q?=h\xaf\
+\xb6?\xe0\xb4\x7f\xf0E9\x7f\xe0\x94\x83\xc0\xda\x8d\x8f\
+\x8ef\xf1\xcf\x86\xfcj\xf3\xd8\xac\xb7\x96+iwe\
+w\x0a+\xb2\x95Veh\xdd\x18\x95#\x04\x14 \xe7\
+ \x9f\x89\x88\xc1>\xa2\xba\xe8W\x85h*\x94\xdd\xd3\
+9\xaa\xd2\x9d9\xb8MY\xa1h\xa6\xaf?\xfe\xaa\xfa\
+3\xfe\x09A\xff\x00\x04\xd3\xd6\xbf\xe0\xa8_\xb4\x98\xf0\
+>\x9d\xaa7\x874]*\xc4\xea\xfa\xf6\xb0 \xf3\xce\
+\x9bl\x1c\x22\xachH\x0d,\xaev\xa0'\x1f+1\
+\xc8R\x0dU\xab\x0aps\x9b\xb2DS\xa7*\x92P\
+\x8e\xad\x9f:\xd5\xfd\x1ab\xf1\xb2\xff\x00s\x9a\xfb\xab\
+\xfe\x0bM\xff\x00\x04\x15\xb9\xff\x00\x82_\xf8\x13\xc3~\
+6\xf0\xdf\x8b\xb5_\x1ex\x1bX\xbe]\x22\xfemJ\
+\xd2(n\xf4{\xa7R\xd1\x16\xf2\xb0\x8f\x14\x81\x19A\
+\xda\x0a\xb0\x00\xe7p\xaeW\xfe\x08\xb5\xff\x00\x04j\xbd\
+\xff\x00\x82\xabj\x9e8\xbb\x7f\x1c\xc5\xe0o\x0fx\x15\
+\xed\xedne\x86\xc7\xed\xb7w\x97\x13\xab:*F]\
+\x15QV2K\x92rH\x00pH\xca\x96cAR\
+\xfa\xcd\xfd\xcf\xeb\xf55\xa9\x80\xac\xea{\x0b{\xc7\xc9\
+\x94W\xed\x0f\xfcA\xd3\xa4c\x9f\x8f\x9a\xe7\xfe\x13P\
+\xff\x00\xf1\xeaV\xff\x00\x83:\xb4\x7f\xfa/\x9a\xe0\xff\
+\x00\xb9j\x1f\xfe?K\xfd`\xc0\xff\x00?\xe0\xc7\xfd\
+\x89\x8b\xfe_\xc5\x1f\x8b\xb4\xdf3\xda\xbe\xc2\xfd\xa0\xbf\
+\xe0\x8dZ\xbf\xec\xff\x00\xfb{^|\x14\xbd\xf1\x9d\x9e\
+\xa7gm\xa2\xc7\xe2e\xd6\xed\xed<\xb9\x1e\xc9\xd9\xa3\
+Uh\x0b0I\xbc\xc4+\x82\xc4c\x0c88\x1e\x15\
+\xfb`\xfe\xccR\xfe\xca\xbf\x14\x97\xc3\xed\xa9\x8df\xd2\
+\xea\xd1/\xadn\x8c~[\xba1*U\xd7\x90\x18\x15\
+=85\xd1K7\xc2T\xc4,,'\xef\xb5\xcc\x95\
+\x9e\xdf\xd7C\xe3\xeaq\x16[O:|=:\xa9b\
+\xb9y\xf95\xf8}v\xbf[^\xf6\xd4\xf3J+\xd5\
+?e\xdf\xd8\xa7\xc5\xbf\xb5%\xc4\x97\x1aTP\xe9\x9e\
+\x1f\xb6\x97\xc9\xb8\xd5\xafr W\xee\x91\x81\xcc\xae\x07\
+P0\x07r+\xe9k\x0f\xf8\x22\xbe\x84,\x87\xda\xbe\
+ x\x85\xae\x08\xe5\xad\xf4\xe8DY\xf6\xdcI\xc7\xe3\
+\x5cx\xfe&\xcbpu\x1d\x1a\xf5m.\xa9&\xed\xeb\
+c\xe6\xb8\x8f\xc5>\x16\xc8\xb1/\x09\x98\xe2\x92\xa8\xad\
+x\xc62\x9b^\xbc\xa9\xd9\xf9=O\x853K_H\
+\xfe\xd3_\xf0K\xaf\x12|\x10\xf0\xd5\xee\xbd\xa2\xea\x91\
+x\xb7C\xd3b7\x17@E\xe4\xdeZ\xc6:\xb9N\
+C\xa8\x1c\x92\xa7\x8fJ\xf0\xdf\x84\x9f\x095\xef\x8d\xfe\
+/\xb5\xd0\xbc5\xa7K\xaaj7#y\x0aq\x1d\xbc\
+c\xac\xb27DA\xea\x7fS\xc5va3l\x1e'\
+\x0e\xf14j'\x05\xbb\xda\xde\xb7\xb1\xee\xe4\xfc]\x92\
+\xe6\x98\x09fx\x1cLeF?\x14\xafe\x1e\xaf\x9a\
+\xf6q\xd3\xbaF\x05\x15\xf6\xb7\x81\x7f\xe0\x8b\xc9q\xa6\
+E'\x88\xbcus\x0d\xf3\xae^\x1d\x1a\xc9^8\x8f\
+\xa6\xf9>\xf7\xd7\x02\xb3\xfe)\x7f\xc1\x1a\xef\xb4\x9d*\
+I\xfc'\xe2\xf1\xab\xdd\xc62\xb6z\xbd\xba\xdb\xb4\xbe\
+\xcb\x22eA\xf6#\x9fQ^\x5cx\xc3(u=\x9f\
+\xb6\xfc\x1d\xbe\xff\x00\xd4\xf8\xfa~5pT\xf1_T\
+X\xe5{\xda\xee\x13Q\xff\x00\xc0\xadky\xdc\xf8\xe6\
+\x8a\xbb\xe2\xdf\x08\xea^\x04\xf1\x1d\xee\x91\xac\xe9\xf7:\
+V\xab\xa6\xc8b\xb9\xb5\xb8M\xb2B\xdfN\xe0\x8c\x10\
+FA\x07\x8c\xd7\xd2\xff\x00\xb3\xff\x00\xfc\x12\xc2\xeb\xe3\
+w\xc1M+\xc5O\xe2\xf8t\x9b\xdf\x10[5\xdd\x85\
+\x9f\xd9w\xc4\x13$'\x9a\xf9\x04\x16\xdaz\x0e\x07\xad\
+z\xb8\xfc\xdb\x09\x83\xa5\x1a\xd8\x89\xda2vO{\xdf\
+\xd0\xfa\xfc\xff\x00\x8b\xb2|\x97\x09O\x1d\x99WP\xa7\
+6\x94]\x9bM\xb5uk'\xa5\xb5\xbe\xd6>Z\xc8\
+\xdd\x8e\xf41\xc0\xad?\x1c\xf8+R\xf8q\xe2\xddK\
+B\xd6l\xe4\xb0\xd5\xb4\x89\xda\xda\xe6\x07\xea\x8c;\x83\
+\xddH\xc1\x07\xb8 \xd7\xab\xfe\xc4\x7f\xb1S\xfe\xd7\x17\
+\x9a\xfbK\xaf\x1d\x03L\xf0\xfa\xc4\xaf4p\x09\xa4\x9a\
+Y3\xb5\x15I\x00\x00\x14\x92k\x5cN?\x0f\x87\xc3\
+\xbcUYZ\x1ak\xbe\xff\x00\xf0\xe7fk\x9f\xe5\xd9\
+n[,\xdb\x1bUF\x84R|\xda\xb4\xd4\x9aI\xab\
+^\xf7\xba\xb5\x97S\xc5\xa8\xae\x8b\xe3W\xc3\x0b\x8f\x83\
+\x1f\x14|E\xe1{\xab\x98\xef'\xf0\xfd\xe3Z\x1b\x88\
+\xd4\xaaN\x07*\xe0\x1eFA\x1cW;]\x14\xaa\xc6\
+\xa4\x15Hj\x9aMz=Q\xe8aq4\xb14!\
+\x89\xa1+\xc2i4\xfb\xa6\xae\x9f\xdc\x14\x89\x19\x95\xc2\
+\xf5,p)j\xde\x8dm\xf3\xb4\xa4\x1c/\x0b[E\
+6\xf45n\xca\xe5\xe5\x8f\xcb@\xa3\x18Q\x8a\xcd\xf1\
+n\x9f\xf6\xab\x012\x8f\x9e\xdb\x93\xee\xa7\xaf\xf8\xd6\xa1\
+\xe4SY\x04\x88\xc8FU\x86\x085\xbdJ|\xd1\xe5\
+9\xe16\xa4\xa4q9\xa5\xa7\xdd[}\x92\xe6H\x98\
+\x10cb9\xf6\xa6W\x8c\xee\x9d\x99\xec'p\xa4=\
+\xfe\x94\xb4\x87\xbf\xd2\x86\x0fa\x87\xad\x14\x1e\xb4S\x04\
+_n\xb4\xb4\xd3\xdf\xda\x9dZ-\x8c%\xbb\x1b'j\
+\x8dz\x9a\x91\xbe\xe1\xa8\xd7\xa9\xa0\x06\xce9\x06\xa3\xa9\
+'\xe8*:\x99\x15\x1d\x85^\xff\x00J\x190i\x01\
+\xcbc\x9a~\xd2\x07\xd2\xa5-B\xc3T\xfc\xc2\x91\x86\
+\x09\xc5\x0b\xd4R\xb69\xfa\xd0\x5cD\xcf\x14\x9dW\xeb\
+Nn\xbd\xb0i\xa4|\xb4\x98\xa2\xb5:\x1f\x0c`i\
+\x08\x07wj\xb9Y\xde\x11\x97~\x9c\xeb\x91\x94\x90\xfe\
+\xb5\xa5\xb0\xd7\xa7OX#\xcd\xa9\xf1\xb1)\x92}\xfa\
+}2O\xbfW`\x8e\xc3[\x9c\xfbS)\xee\xa2\x99\
+H\xa1\xe9\xf7E-\x22}\xd1K@\x86K\xfd))\
+\x5c\xe7\xf9RPh\x86\x93\xc8\xf7\xa8\xe4\xedR:\x86\
+\x1c\x9cTrv\xa4\xf6\x18\xda\x02\x82\x7fZ(\x04\x1e\
+\x9cT\x00\x11\xb1N)\xb1\xf7\xa5\x93\xa55>\xf0\xa0\
+\x070\xe0\xd3)\xed\xd0\xd3(\x029zTu%0\
+\xf55\x98\x08z\x1fzg\xf1sO\xa8\xdb\xa9\xa5-\
+\x80~\xd1\xb6\xb3\xf5{\x0f32\xa0\xe7\xf8\x87\xaf\xbd\
+h\x01\x95\xfa\xd4m\xd7\xe9\xebX8\xa9+3x\xb6\
+\xb5F\x17\x99\xedN\xabZ\x9d\x8f\x92L\x88>By\
+\x1e\x95PW\x14\xe2\xe2\xec\xce\xa8\xc95\xa0c9\xf6\
+\x14\xe5\xfe\xb4\xdd\x82\x95{\x8fz\x82\xc9)\xa3\xbf4\
+\xea(\x00\xa2\x8a+Df\xc2\x8a(\xa0\x02\x95:\xd2\
+R\xa7Z\x00v~o\xc2\x87\xfb\xa6\x96\x91\xfe\xe9\xaa\
+\x88\x0bE\x14U\x00QE 89\xa0\x013\x91\xcf\
+4\xf0r}\xa9\xb1\xe1XsO\xde)\xc4\x05\xa2\x8a\
+*\xc0(\xa2\x8a\x00(\xa2\x8a\x00\x07Zp9>\xd4\
+\xdax\xe8=h\x01h\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00U\xeb\xf4\xa5S\x93\xeci\x13\xad;\xbd\x00-\
+\x14R/\xf4\xa0\xcd\xbd\x18\xb4QE\x06bs\xedI\
+\x86\xf5\x14\xeaM\xe2\x92\x0b\x89\x18\x04\xf3[~\x0c\xb7\
+\xfd\xf4\xf2t\x0a\xa1A\xff\x00?J\xc5\xc6O\x15\xd0\
+\xf8.\x10\x962\xb0\xfe)1\xfaWV\x167\xa8\x88\
+\xc4J\xd4\xd9\xad\xfe4\xea(\xafY\x1ehQE\x14\
+\xc6\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x02\xb8QE\x14\x0c(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x98\x9dh\x01\xb73\x08`f\xee\x06Ed\x7f>\xf5\
+wW\x9f\x05#\x1fS\xfd*\x9f\xe7\xef\x5c\x95\xa5y\
+X\xde\x94t\xb8\x94QEdj\x14QE\x00IH\
+\xa4\x81\xc0\xfdih\x8d\xb6\x9ek@\x1c\x87#&\x9d\
+E\x14\x00QE\x14\x00QE\x14\x08)\x13\xee\x8aZ\
+@@\x1dE\x02\x90b\xbb\xcf\xd9K\xf6\x9b\xf1'\xec\
+w\xf1\xf3\xc2_\x11\xbc'6\xcdo\xc2\x17\x82\xe5b\
+f+\x1d\xfc'\xe5\x9e\xd6Ls\xb2X\x8b!\xf4\xdc\
+\x0fQ\x5c\x1eG\xa8\xa4-\x9eA\xe2\xa2p\x8c\xe2\xe3\
+%t\xf7&\x13q\x92\x94]\x9a?\xafo\xd9\xcb\xe3\
+\xdf\x84\xbfm?\xd9\xd3\xc3\xde6\xd0\x1a\x1dW\xc2\x9e\
+9\xd2\xfc\xef&u\x0f\xb4:\x94\x9a\xdae<nF\
+\xdf\x1b\xa9\xee\xa4W\xc7S\xff\x00\xc1\xaf\xbf\xb2}\xc5\
+\xd4\xd2/\x87\xbcY\x02\xca\xec\xe28\xbcEp\xa9\x1e\
+\xe2N\xd5\x19\xe1G@=\x00\xaf\x83\xff\x00\xe0\xd7\xdf\
+\xf8)\x1a|\x13\xf8\xc1u\xf07\xc5W\xe2/\x0a\xfc\
+G\xba7\x9e\x1c\x92w\xc2i\xda\xbe\xdc4\x03\xb0[\
+\xa4Q\x81\xff\x00=#P?\xd6\x1a\xfd\xb3\xfd\xaf#\
+\xf8\x87\xff\x00\x0c\xed\xe2\xc9>\x12\xdeh\xd6\xbf\x11\xac\
+\xecZ\xe7C]V\xd7\xed6\x97sG\xf3\x8bw]\
+\xc9\x81(S\x18m\xc3ipy\xc6+\xf3|e\x1c\
+F\x03\x13*4\xa6\xe2\x9e\xda\xb5u\xff\x00\x00\xfb\xdc\
+-Z8\xcc:\xabR)\xb5\xbe\x9d\x7f\xe0\x9f\x99_\
+\xf0R\x1f\xf8\x22\xff\x00\xecy\xff\x00\x04\xfe\xfd\x93\xbc\
+K\xf1#Q\xf0\xf7\x8a\xefo\xac\xa3\x16z6\x9a\xfe\
+&\x9d[V\xd4$\x04A\x00\xf6\xc8.\xc7\xb2F\xe7\
+\xb6+\xe2/\xf8$\xff\x00\xec\xca\xda\x0e\x857\xc4M\
+j\xd9\x16\xff\x00UF\xb4\xd1\x90\xaf\xfa\x98\x09\xc4\x93\
+\xaezo?(\xcf\xf0\xa9\xfe\xf5`\xfcS\xfd\xae\xbe\
+2\xff\x00\xc1h\xfe9x;\xc2\xbf\x14n\xec,l\
+<\x0d-\xcc\xf7\x96\x1ae\x89\xb1K\x00\x18-\xcbK\
+\x1b;\x96\x9f\xe4\x11\x02N\x17q\xc62I\xfb\x0f\xc4\
+\xbe\x22\xd1\xbe\x10\xf8\x0a\xefP\xb90\xe9^\x1e\xf0\xd5\
+\x96\xf2\x00\xc2\xc1\x0ck\x85E\x1d\xc9\xc0P;\x92+\
+\x9b\x893\x1cN\x1b\x0a\xb2\xc77*\xb5l\xe5\xad\xed\
+\x1e\x89\x7f\x8b\xf1\xd8\xfeG\xfaFq\xea\x8d(\xf0\xb6\
+N\xadR\xba\x5c\xf6Z\xf2\xb7e\x1d:\xcd\xe9o\xe5\
+M}\xa3\xc3?\xe0\xa6?\xb4\xe1\xf89\xf0\xcb\xfe\x11\
+\x9d2\xe4E\xe2?\x18D\xd0\xee\x8c\xfc\xf6v\x7fv\
+I\x07\xa1|\xec_\xabzW\xe7hE\x8d\x02\xa8\x01\
+W\x00{WW\xf1\xdb\xe3F\xa1\xf1\xf7\xe2\x86\xaf\xe2\
+\x8dOrM\xa9\xc9\x88a\xcf\x16\x90/\x11\xc2?\xdd\
+\x5c~$\x9a\xe5I\xc0\xe0d\xd7\xdb\xf0\xd6K\x1c\xb7\
+\x03\x1a\x0d{\xefY?>\xde\x8be\xf7\xf5>\xe7\xc3\
+>\x0a\xa7\xc39\x1d<\x14\x97\xef\xa5\xefT}\xe6\xd2\
+\xd3\xd2+\xdd]\x1e\xafv\xcfW\xff\x00\x82}\x0f\xf8\
+\xcd\xff\x00\x82\x03\xb1\xf1\xce\x8f\xc7\xfd\xbeE_\xbe\xdf\
+\xf0p\xc7\x8d\xbe.\xf8\x0f\xf6+\xd1\xae\xfe\x0a\xdex\
+\xf2\xcb\xc5\xb2x\xa6\xd2)d\xf0\x9c\x12M{\xf6S\
+\x1c\xc5\xc3\x08\xd5\x9b\xcb\xdc\x13<c8\xe6\xbf\x02\x7f\
+\xe0\x9f\x04\x8f\xdb\x83\xe0\x86F1\xe3\xad\x1f\xff\x00K\
+\x22\xaf\xe9w\xfe\x0a]\xff\x00\x05\x15\xd0?\xe0\x99\x9f\
+\x02\xec|y\xe2?\x0f\xeb^$\xb1\xbf\xd5\xe1\xd1\xd2\
+\xdbLx\xd6eyRF\x0e|\xc2\x17\x00F{\xe7\
+\x91\x5c\x1cA\xcd\xf5\xca<\xb1\xe6z\xe8\xfa\xea~\xcf\
+\x92r\xfdV\xaf4\xb9V\x9a\xf6?\x01\xae\xbfi\xef\
+\xf8(M\xbeJ\xeb\x9f\xb4\xdc\xab\xd7\xe4\xd3.\xf3\xf9\
+yT\xbf\xf0J\xff\x00\xda\x07\xe2W\xed\x01\xff\x00\x05\
+\xa1\xf8\x05w\xf1W\xc5>0\xf17\x89\xf4mn\xe7\
+Oe\xf1$\xb2\x9b\xad1E\x8d\xd9h<\xb9\x001\
+rrWj\x92y\x22\xbfE\x0f\xfc\x1d\xd7\xf0\xa3\xfe\
+\x89G\xc4\x7f\xfb\xff\x00i\x9f\xfd\x0e\xbe=\xfd\x97\xff\
+\x00l\xab\x7f\xdb\xf7\xfe\x0e\x14\xf8c\xf1N\x1f\x0c\xc3\
+\xe1K}{\x5c[kk\x01 \x96T\x8e\x0d2\xe6\
+%\x92W\x00\x06\x95\xc0\xc9\xc0\xc0\xe0s\xb7&aF\
+\xbc\xa9\xd4uh*iE\xeb\xf2\xd8n\xad\x18\xce\x9a\
+\xa7Y\xcd\xddi\xe5\xdc\xfaK\xfe\x0f)\xff\x00\x92\x17\
+\xf0'\xfe\xc6mC\xff\x00I\x16\xbf\x0d\x07z\xfd\xd8\
+\xff\x00\x83\xc3\xf4\xb4\xd4\xbe\x07|\x0cVf\x1b|K\
+\xa8co_\xf8\xf4Z\xfc?o\x08\x86\xfb\xb3\x90;\
+nZ\xdf\x22\xa3)`a$\xbb\xfefY\xcdh\xc7\
+\x17$\xfb#\x1c\xb0E$\x9c*\xf2I\xed_\xd1?\
+\xfc\x1b\x91\xfb*\xe9?\xf0O\xff\x00\xf8&V\xb3\xf1\
+\x7f\xc6h4\x8dC\xe2%\xbb\xf8\xcbU\xb8\xb8]\xaf\
+c\xa3\xc1\x13\x9bT \xf4\xfd\xd0y\xb1\xff\x00M\xc0\
+\xea+\xf1W\xfe\x09\xc1\xfb\x06\xdc\xfe\xdd\x7f\xb5\xf7\x80\
+\xfe\x1d,\x8e\xdaV\xb1z.\xb5\xb9b^m\xf4\xd8\
+q%\xcb\xf3\xc0\xca\x0d\x83?\xc5*\x8e\xf5\xfd4\xff\
+\x00\xc1A\x7fa\xa9?m\x7f\xd9\x07S\xf8=\xa3x\
+\xbe\xe3\xe1\xb6\x8f\xad-\xb5\x9d\xcd\xd5\x85\x82\x5c\xb7\xd8\
+aecj\x88YB\xabyq\xa9 \xfd\xd0F\x08\
+&\xb8\xb3\xea\xca.8Y\xbb'\xab\xf4\xdb\xfa\xf4:\
+\xf2Z\x5c\xcaX\x88\xebm\x17\xa9\xe3\x1f\x05>)x\
+o\xfe\x0e\x03\xff\x00\x82Fk\xcb\x7fem\xa3]x\
+\xda\xd2\xf7G\xbd\xb5\x8c\xef>\x1f\xd5 \x90\xb5\xbb\xe4\
+\xe4\xe5J\xdbM\xee\x1f\x1d\xeb\xf9\xcf\xf8=\xf1\xa7\xe2\
+\xdf\xec7\xf1S\xc4\x96\xde\x11\xf1G\x89\xfe\x1bx\xc7\
+N\x9e]\x07[]6\xe4\xc0L\x90\xc8U\xe1\x95O\
+\xca\xe1dRWp$g#\x19\xaf\xe9\x0b\xfe\x09\x01\
+\xff\x00\x04}\x93\xfe\x09-k\xe3}?N\xf8\x9d\xaa\
+\xf8\xe3@\xf1\x9c\x96\xf7f\xc2\xf3LKacu\x10\
+e3#+\xb7\xdf\x8c\xaa\xb2\xe3\xfeY\xa9\xaf\xcb\xaf\
+\xf8:'\xf6.O\x81\x7f\xb5\xd6\x9d\xf1/H\xb1\xf2\
+|;\xf1z\x06k\xc6\x8d@HukuU\x98\x1f\
+C,>\x5c\x99\xee\xc9-FM<<\xb1S\xc2'\
+xKU\xfeZ\xff\x00Z\x17\x9bB\xb2\xc3\xc7\x13o\
+~;\xff\x00\x9f\xf5\xdc\xfac\xfe\x0dx\xfd\xb6\xbe,\
+\xfe\xd6\x7f\x11>1\xd9|J\xf8\x89\xe2/\x1dA\xa1\
+i\xdaT\xb6)\xa9\xca\xae\xb6\x8d$\x97*\xec\x98Q\
+\x8d\xc1\x17?\xee\x8a\xf0\x8f\xf8/\xf7\xfc\x14\xaf\xe3\x8f\
+\xec\xd9\xff\x00\x05\x1d\xf1o\x85|\x0f\xf1c\xc5\xbe\x13\
+\xf0\xed\x8e\x95\xa6M\x0e\x9f\xa7\xce\xa9\x0cO%\xb0g\
+`\x0a\x93\x96c\x93\xcdu\xbf\xf0g\xe9\xc7\xc5\x0f\x8e\
+\xff\x00\xf6\x0d\xd1\xff\x00\xf4m\xdd|\xd5\xff\x00\x077\
+\x8c\xff\x00\xc1U|m\xff\x00`M#\xff\x00IV\
+\xbaia\xa8\xff\x00l\xd4\xa6\xe2\xb9yU\x95\x95\xb6\
+G4\xb1\x15\x7f\xb2\xe9\xd4\xe6w\xbe\xf7\xf59\x1f\xf8\
+&o\xc5\x8f\x11\xfcm\xfd\xb1\xbcM\xe2_\x16\xf8\x83\
+V\xf1W\x88\xb5m\x02w\xbb\xd4u;\x86\x9e\xe2\xe3\
+\x12\xc0\xa0\x16l\x9c\x00\x00\x00`\x008\xc5'\xfc\x15\
+3\xc1s\xfcC\xfd\xae<\x05\xa0\xdb\x12\x97\x1a\xe6\x9d\
+\x05\x820\xe7f\xfb\x86\x05\xbf\x00I\xfc+\x0b\xfe\x08\
+\xfd\xc7\xed\x1b\xab\x0e\xe7\xc3\xb7\x03\xff\x00#C]\xcf\
+\xed\xef\xe2\xc8<\x09\xfb~\xfc#\xd6/\x19V\xd7L\
+\x8e\xd2i\x99\xba*\x99\xd9K\x1fa\xbb?\x85x\xb8\
+\x97*|M'Ij\xa9;/\xfbu\xdb\xf1\xb1\xfc\
+\x9f\x9b\xd7\xafO\xc5\x8a\xb5\xb0\xea\xf5\x16\x16n+\xbc\
+\x9595\xf7\xbb\x1f@\xfcv\xf8\x8d\xa3\xfe\xc3_\xb3\
+i\x93H\xb0\xb7\x92\x1d\x0a\x18\xf4\xdd&\xc8\xfc\xa9<\
+\xed\xc0/\x8eH$4\x8cz\x9c\x1fZ\xfc\xf2\xf1\x07\
+\xed\xb1\xf1?\xc4\x9a\xeb\xeaS\xf8\xf3^\x86\xe5\x9c\xb8\
+KI\xfc\x98\x22\xe7\xee\xack\x85\x00{\x83\xef\x9a\xfb\
+\x93\xfe\x0a\x9d\xf0\xbfP\xf8\x85\xfb7\xdd\xcb\xa6\xc3%\
+\xe4\xbe\x19\xbf\x8fW\x928\x81f\x96\x00\xac\x8e\xc0\x0e\
+\xa1VM\xdfA_\x99\xea\xe1\xd5J\x90\xc0\x8c\x82\x0e\
+sO\x81\xf0XJ\xd8IbjEN\xa3\x93\xbbv\
+v\xfb\xfb\xf5\xeeW\x80\x196U\x8d\xc9j\xe6\xb8\x98\
+F\xae&u$\xa7)%)%\xa3K[\xd9J\xed\
+\xbf\xe6{\xde\xc7\xd0\xda\xcf\xfc\x157\xe2\x0e\xb7\xf0\x8f\
+P\xf0\xbd\xf4\x1a5\xd5\xce\xa3j\xf62\xebl\x8c\xb7\
+\x8d\x0b\x0d\xac6.\x22,W#v;\x9e3_U\
+\x7f\xc18\xbe\x0ci\xdf\x02?fK\x1dn\xe9#\x83\
+R\xf1%\xa9\xd6\xb5;\x96\x190@\x011\xc7\x9f\xee\
+$k\xbb\x1d\xcb\x13\xd6\xbf6\x17@\xbd\xbe\xd1no\
+\xa1\xb1\xbd\x97O\xb7>\x5c\xb7I\x0b4\x10\xb1\xe8\xae\
+\xe0mRs\xdc\xd7\xea\x8f\xec\xf5}\x0f\xc6\xaf\xd8\xe7\
+\xc3\xf1\xd9J\x885\x9f\x0d\x1d'p8\xf2%\x10\xb5\
+\xbb\x06\xf4 \x8c\x9f\xade\xc6\x18\x5c>\x17\x05\x1aX\
+H\xf2Bs\x5c\xf6\xf2[>\xdd\xed\xe4q\xf8\xd9\x93\
+\xe5\xd96EK\x07\x94\xd2T(b+\xafm\xc9\xb3\
+\xb2m&\xba.\xaa:-\x15\x92\xeb\xf0\xdf\xed\x0d\xff\
+\x00\x05\x16\xf1\xd7\xc5\xdf\x17^K\xa3k\xb7\xfe\x16\xf0\
+\xe4R\x94\xb1\xb2\xd3\xa4\xf2\x9c\xc6\x0f\xca\xf2\xc8>f\
+v\x1c\x9ep:\x01\xc5v\xdf\xb0\xf7\xfc\x14G\xc5:\
+/\xc4\x8d'\xc3\x9e1\xd5\xe6\xf1\x07\x87\xb5\xd9\xd6\xcd\
+.o\x185\xc6\x99+\x1d\xa8\xe1\xf1\x97B\xc4\x06\x0d\
+\x9e\xb9\x04b\xbea\xf1\x1f\x84\xef|\x0b\xaf_\xe8\xba\
+\x9d\xac\xb6Z\x9e\x91)\xb5\xb9\x82Q\x87\x89\xd4\xe3\x07\
+\xf9\x8f\x5c\x82+\xa8\xfd\x99\xfe\x19_\xfc^\xf8\xd9\xe1\
+\x8d\x0fN\x86If\x9e\xfa)\xe6d\x1c[B\x8e\x1e\
+IX\xf6P\x17\xaf\xa9\x03\xbd}.3&\xca\xff\x00\
+\xb3\xa5\x07N*\x0a7\xbf]\xb4w\xde\xfdWs\xf5\
+l\xe3\x82\xb8W\xfdZ\xa9\x82\x96\x1e\x9cp\xf1\xa6\xda\
+\x92J\xf1\xb4t\xa8\xa5k\xb9u\xe6\xbe\xbdn\x99\xf6\
+/\xfc\x15\xf7\xe0U\xae\xb1\xf0\xe7N\xf1\xdd\xbcQ\xa6\
+\xaf\xa1]&\x9b|\xea0\xd76\xd2d&}v8\
+\x18=\x83\x1fj\xf5\xdf\xd8\xa3S\x83E\xfd\x8d~\x1c\
+\xdd\xdc\xc8!\xb5\xb3\xf0\xeaM4\x8d\xd24VrX\
+\xfb\x003\x5c\x97\xfc\x15{\xc5\xd6\xde\x1e\xfd\x965\x0b\
+)d_\xb4\xf8\x83Q\xb7\xb3\xb6C\xd5\xf6\xb7\x98\xec\
+?\xddU\xfdk_\xf6l\x19\xff\x00\x82}xc'\
+\x9f\xf8Ce\xff\x00\xd0%\xaf\xcc\xea\xd4\xa9[\x87\xe8\
+B\xab\xd3\xda\xb4\xbd\x1a\x7f\xad\xcf\xe5\x0cU|N3\
+\xc3|\xba\x8e1\xb7\x15\x8bp\x8b\xfe\xe7#\xdb\xd1\xb9\
+%\xf7t9/\xf8(\xcf\xec\x81\x1f\xed\x03\xe0X|\
+e\xe1\x88R\xeb\xc5\x1aE\xa8\x94\x0b\x7f\x9b\xfbr\xcb\
+\x1b\x82\xa9\x1fy\xd0\x12\xca{\x8c\x8fJ\xe3?\xe0\x8b\
+$>\x83\xf1\x1b\x8f\xf9{\xb3\xff\x00\xd0$\xac\xff\x00\
+\xf8%W\xed\x98mR\xcb\xe1\xbf\x88\xaf\x02\xa6\x07\xfc\
+#\xb7r7\xddld\xd9\xb1\xfc\xca~+\xe9_R\
+\xfc+\xf8\x01\xa4\xfc \xf1\xef\x8d5\x9d\x1e5\xb5\x83\
+\xc6\xd3\xc3{qh\x8b\x84\x82\xe1\x03\x07e\xf4\x0f\xbb\
+8\xecs\xeb]\xb9\x96#\x11\x97\xe0\xea\xe4\x98\xbb\xb5\
+t\xe9\xcb\xba\xbd\xed\xfdl\xee\x8f{\x8a\xf3L\xc3\x86\
+\xf2\x1c\x7f\x00\xe7M\xc9.Ya\xea\x7f4=\xa2n\
+?r\xba\xfeV\x9cv\xe5?7\xff\x00oO\xf9;\
+O\x88^\xfa\x91\xeb\xfe\xe2\xd7\x96W\xa9\xfe\xde\x9f\xf2\
+v\x7f\x10\xbf\xec$\x7f\xf4\x05\xaf,PX\x80\x06I\
+\xe9_\xa9e\x1f\xee\x14?\xc3\x1f\xc9\x1f\xd6\x5c\x1d\xff\
+\x00$\xf6\x07\xfe\xbc\xd3\xff\x00\xd2\x22-\xbc\x0dq*\
+\xa8\x07'\xa9\xf4\xf7\xad\x88\xe2\x10\xc6\x15F\x02\xf0*\
++\x0b!i\x1f#.\xddO\xa7\xb5X\xafZ\x11\xe5\
+\xd4\xf6\xaaN\xfa\x055\xbf?ju4\xfd\xf1V\x96\
+\xa6G5\xe3\x0b\x7f'U\xdc\x07\x12\xa0o\xc7\xa7\xf4\
+\xac\xea\xdb\xf1\xc4y\xfb3\xf7\xf9\x96\xb0\xcfC^V\
+\x226\xa8\xcfW\x0f+\xd3B\xd2\x1e\xff\x00JZC\
+\xdf\xe9Y3g\xb0\xc3\xd6\x8a\x0fZ)\x82/\xb0\xf9\
+\x8f\xbd-#cq\xf5\xa5\xad#\xb20\x96\xecF\xe9\
+Q\x8f\xbcjC\xc85\x1f z\xd0\x03&\x1c\x8fz\
+\x8e\xa4\x94\xee\x1fJ\x8c\x0c\x9a\x99\x17\x11\xc8;\xd2\xb7\
+CJ\x06\x05#\x9d\xbcT\x8ce+u\xa4\xa7\x15\xde\
+:\x9a\x06\x86\xb2\xfa\xf6\xa44\xe6RI\xf4\xa4\xa0Q\
+\xbd\xcb\x9e\x19\xbe\x16\x97\xe5\x18\xe1g\xf9}\x81\xed]\
+\x11\xe3\xf9W\x1a\xfc\x9c\x8a\xdf\xd0u\xe5\xbcE\x86V\
+\x02u\x1c\x13\xff\x00-\x07\xb7\xbdua\xea\xabr3\
+\x9b\x13K\xed\xc4\xd2\xed\xf8Tr}\xfa\x90\xd3d^\
+I\xae\xb6r\xc3b9\x0ey\xa6S\xdf\x91\x8fAL\
+\xa4X\xf4\xfb\xa2\x96\x91F\x05\x194\x00\xd7==\xa9\
+)_\xee5%\x05\xa1\x92p=\xcd5\xbe`i\xe5\
+\x81aL`G|}j[V\x01\x94\xa3\xde\x8d\xbe\
+\xe2\x85\x1e\xe2\xa2\xe1q\xb2t\xa4\x8f\xbd8\x80A\xeb\
+M\x8f\xbd\x0cb\xb7CL\xa7\xb7CL\xa6\x04t\xc3\
+\xd4\xd3\xe9\x87\xa9\xac\xc0Jc\x8c5>\xa3n\xa6\xa6\
+H\x07\xafAQ\xcd\xf7\xaaD\xfb\xa2\x99#mj\xca\
+;\x9b!\xac20@>\xb9\xac\xbdB\xc7\xec\xcd\xb8\
+}\xc3\xfaV\xb51\xe2\x0e\xa4\x1e\x87\x83Q8\xa9\x22\
+\xe1.S\x186\x01\xcd\x0b\xd7\xe9R^\xd9\x9bG\xee\
+Q\x8f\xca\x7f\xa1\xa8\xd3\xa0\xfc+\x8d\xc5\xa7ft\xf3\
+irJo\xf9\x14\xeao\xf9\x15%\x0e\xa2\x8a+D\
+f\xc2\x8a(\xa0\x02\x95:\xd2R\xa7Z\x00v\xde}\
+\xb1C\xfd\xd3FNqC\xfd\xd3U\x10\x16\x8a(\xaa\
+\x00\xa4\x07#\xd2\x96\x8a\x00D\x1b\xb1\x9e\x94\xf5\x1d)\
+\x8a\xc4\x91\xc74\xf5l\x9fjq\x01\xd4QEX\x05\
+\x14Q@\x05\x14Q@\x00\xe0\xd3\x94g\x06\x9a94\
+\xe0y\x03\xb5\x00:\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\
+\xa0\x05Q\x92}i@\xc1\xf7\xa4S\x83J\x0e[\xda\
+\x80\x1dE\x14PD\xafgp\xa2\x8a(2\x13`\xa3\
+`\xa3\x9fjL\xb7\xa0\xa40\x1f)5\xd4xMv\
+\xe9+\xee\xed\x5c\xc0\xcfZ\xe9|\x22\xc1\xb4\xacd\x12\
+\xb25v`\xdf\xbea\x89\xf8\x0dJ(\xa2\xbdS\x81\
+0\xa2\x8a(\x18QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00Ss\xd7\x8f\xae)\xd0\
+\xc0\xd30\x0a\x0b\x1a\xb9\x06\x8b\xdeF\xfc\x16\x9ca)\
+lD\xa6\x96\xe5\x1fn\xd4\xf8m\xdeN\x88\xc7\xf0\xad\
+hl\xe3\x83\xee\xa0\x07\xd4\xf2j^\x95\xaa\xa1\xdc\xcd\
+\xd5}\x0c\x95\xd2fo\xe0\xc0\xf74\xe1\xa2\xcaz\x94\
+\xcf\xd6\xb5(\xaa\xf6Q'\xdaH\xcc\xfe\xc4\x93\xfb\xc9\
+HtiGt\xfc\xebR\x8a=\x94C\xdaH\xc8m\
+*e\xfe\x01\xf4\x074\xc7\xb3\x91\x071\xbf\xe0+k\
+\x14\x0e\x9cc\xf0\xa5\xecP\xd5V`\x95#\xdb\xfa\xd3\
+\xabe\xa2W\x1c\x80\xd9\xf5\xe6\xa2\x93K\x86N\xa9\xb4\
+\xff\x00\xb2qS\xec\x1fB\xbd\xafs$\x0cz~\x14\
+\xea\xb9.\x889\xd8\xff\x00\x81\xa8%\xd3%\x8b\x9d\x85\
+\x87\xa8\xe6\xa1\xc2K\xa1Q\x9cH\xa8\xa4a\xe5\x92\x08\
+\xdaG\xafzZ\x92\xd3\x0a(\xa2\x95\xc6\x14QE0\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0ai \x0c\x93\x80:\xfbS\xaa\xa6\xadq\xe4\xdb\xec\
+\x1fy\xf8\xfc*e++\xb1\xa5wb\x85\xcc\xde|\
+\xcc\xe7=x\xfe\x94\xd0=i\x14\x92)A\xff\x00\xeb\
+W\x0d\xeeu%`\xa2\x8a(\x18QE\x14\x01%\x00\
+q\x81E\x00\xf7\x15\xa0\x0eN\x00\xa7SP\xe4\x0au\
+\x02l(\xa2\x91\x01v\x0a\x06X\xf4\x03\xad\x00\xdd\x84\
+<R\xaa\x978PKz\x0e\xb5\xa9\xa7\xf8U\xe5\xc3\
+\x5c\x13\x18\xfe\xe2\xfd\xef\xfe\xb5kY\xd8Ed\x9bc\
+EO~\xff\x00\x9dtS\xc2\xc9\xeb-\x0ei\xe2b\
+\xb6\xd4\xc1\xb6\xf0\xe5\xcd\xc0\x07`\x8c\x11\xfcG\x9f\xca\
+\xaeE\xe1\x1e\x9b\xe79\xf4U\xc5lc\xe9\x9aM\xa7\
+\xd4\xd7Lp\xb4\xd7\x99\xcd,D\xde\xc6p\xf0\x8c?\
+\xf3\xd6\x5c\xfe\x15\x14\xfe\x10R>I\xceG\xf7\x979\
+\xadm\xa7\xd4\xd2\xec\x15o\x0fM\xaf\x84\x95Z\xa7s\
+\x9d[+\xff\x00\x0e_[\xde\xda\xcdqkwc2\
+\x5c\xdb]Z\xb9Y-eF\x0e\x92!\x1c\xab+\x00\
+\xc0\xf6 W\xf4\xf3\xff\x00\x04b\xff\x00\x82\x8e\xda\x7f\
+\xc1H\xff\x00c\xdd3\xc47\xb3[\xa7\x8e\xfc2W\
+E\xf1]\xa4x]\x97\x88\xa0\xad\xc2\xafh\xe7LH\
+\xbd\xb2]G\xdc5\xfc\xd4s\xd8\xd7\xd1\x9f\xf0H\x9f\
+\xdb\xf6\x7f\xf8'?\xed_\xa7x\x9aS;x#\xc4\
+\xc14\x8f\x16\xd9B\xbb\xcc\x96\xbb\xb2\x97H\xbd\xe4\xb7\
+r\x5c\x01\xc9V\x91G\xde\xaf\x9e\xe2\x0c\x93\xebXw\
+*Z\xca:\xaf\xd5\x1e\xe6I\x9b}^\xba\x8dO\x86\
+Z?\xf3>\xa8\xff\x00\x83\x85?c}O\xf6\x1c\xfd\
+\xad<?\xfbK\xfc?\xb11\xf8o\xc6z\x87\x93\xe2\
+Kx\x94\x88\xad\xb5\x22\xbf9|p#\xbc\x886}\
+%\x8d\x8f\x05\xc5|\x89\xff\x00\x05#\xfd\xb4\xac>1\
+\xe9z'\x85\xfc'zg\xd0&\x86-[R\x91\x7f\
+\xe5\xa4\xcc7Gl}\xe2\xea\xdf\xedc\xd2\xbf]\x7f\
+\xe0\xaf\xff\x00\xf0U\x8f\xd9\xaf\xc4\x1f\xf0Oo\x1a\xe8\
+Qx\xb3\xc2\x7f\x14\xaf<w\xa4\xbd\x96\x8b\xa0i:\
+\x88\x96y\xae\x1b\x06+\x97)\x96\x81`\x90,\xa5\x9b\
+i\x060\x07\xcc@\xaf\xe7z\x04h\xa1Eb\x1d\xf0\
+761\xbc\xf78\xf7\xaf\x9e\xc9\xf2\xdax\xa9\xd2\xc6\
+b\xe0\xfd\xa5+\xa5~\xbd\xbeq\xd6\xc7\x81\xc5|\x11\
+\x93b\xf8\x87\x0d\x9f\xce*Uh\xa7kmw\xb5\xfb\
+\xf2\xbb\xb8\xf6m\xbe\xc3\xbf\xc6\x9f\xf7\xb3\xf9\xd4\x7f\xc7\
+\xf8\xd3\xfbW\xd8#\xd4=\x07\xf6@\xf1\xf6\x9d\xf0\xb3\
+\xf6\xa4\xf8Y\xe2]f\xe0\xdah\xbe\x1c\xf1f\x97\xa9\
+\xdf\xcf\xb4\xb7\xd9\xed\xe2\xba\x8d\xe4\x93\x03\x93\xb5\x14\xb6\
+\x07<z\xd7\xeb\xef\xfc\x1d\x19\xfb]|7\xf8\x8d\xfb\
+\x14x#\xc2\xde\x18\xf1\xb7\x87<K\xad\xeb>'\xb7\
+\xd5\xad\xed\xb4\x9dB+\xc6\x16\x91A.\xe9\xdc\xc6[\
+bfTQ\xbb\x1b\x8bq\x9c\x1c~ \x85\x1c\xfb\xd3\
+-\xac\xa2\xb3-\xe5D\x91\x97\xeb\xb1@\xcf\xe5^v\
+#/\x8dlE<D\x9d\xb9:w;(ceJ\
+\x85J\x09_\x9b\xa9(\xeb\xeb^\xf5\xff\x00\x04\xa0\xf8\
+\xcf\xe1\xff\x00\xd9\xf3\xfe\x0a\x09\xf0s\xc5\xfe+\xd4#\
+\xd2|5\xa1k\x85\xb5\x0b\xc9\x011\xd9\xa4\xb6\xf3@\
+$|tEi\xd4\xb1\xec2{W\x82\xf9\x9e\xd4\x9f\
+\x87\x07\x8a\xed\xadO\xdaS\x957\xd5X\xe5\xa57N\
+jk\xa3\xb9\xfdJ~\xd5Z_\xec\x99\xfbthz\
+\x1d\x9f\xc4\xef\x13|$\xf1\xa5\x86\x81;\xde\xe9\xd1\xdd\
+x\xb2\x08\xc5\xb4\x92&\xd6q\xe5N\x84\xe5p9\xc8\
+\xaf\x1b\x1f\xf0L\xaf\xf8'o\xfd\x01~\x0as\xff\x00\
+S\x91\xff\x00\xe4\xaa\xfeq\xc7\x87\xec\xb3\xff\x00\x1eV\
+\x87<\xff\x00\xaaZ_\xf8G,I\xe6\xca\xd0\xff\x00\
+\xdb%\xff\x00\x0a\xf9\xca|=R\x9a\xe4\xa7\x88\x92]\
+\x97\xfc9\xee\xd4\xcf!7\xcd:)\xbf\xeb\xc8\xfd\xda\
+\xff\x00\x82;i\x1f\xb2\xcf\xec\xbf\xfbx\xfe\xd3\xb7\x1e\
+\x04\xf8\x85\xe1\xdb};Mm?M\xd0\xa4\xd55x\
+\xd2\xde\xde\xc0\xc5\xe7^\xa5\xac\xf2\xb0\xf3\xe1K\xc5(\
+X\x13\x81\x0a\x0c\xb0\xc3\x1f\x83\xbf\xe0\xa6\x9f\xf0Z\xcf\
+\x89\xbf\x1a\xff\x00l?\x1cj_\x0d>*\xf8\xcb\xc3\
+\x1f\x0e\xac.\x86\x95\xa0\xdb\xe8\xba\x9c\xb6\xb6\xf7\x96\xf0\
+\x8d\x86\xefh\xdaI\x99\xf7\xb8$giQ\xd8W\xc3\
+\x93\xe9\xf0\xdcF\x89$1:\xc7\xc2\x86PB\xfd=\
+*a\xc0\xe3\x18\xfe\x95\xe8\xd1\xca)\xc6\xbb\xafU\xf3\
+\xb6\x92\xd7\xcb\xf5g\x9d[4\x9c\xa8\xaa\x10\x5c\x8a\xed\
+\xe9\xe7\xfeG\xbd\xf8_\xfe\x0a\xdd\xfbD\xf8/\xc4\xda\
+V\xaf\x0f\xc6\xcf\x88\x9a\x94\xba=\xdcW\xc2\xce\xfbZ\
+\x96[k\xdf-\xc3\x18eF%Y\x1c\x02\xa4\x11\x8c\
+5~\xb8\x7f\xc1f\xff\x00k_\x80\xff\x00\xb6\xdf\xfc\
+\x11\xda\xe7\xc4Qx\xd3\xc3\xd2j\xf7\x89c\xadxo\
+M\x8e\xfa7\xd4\xeduUuSj\xd0\x03\xe6+*\
+<\xe9&T\x002\xdd\x00\xcf\xe0\x98\xe7\xd7\xde\xa3K\
+\x18R\xe0\xcc!\x88J\xdd_o\xcc\x7f\x1ax\x8c\xa6\
+\x8dJ\xb4\xea\xd3\x5c\x8e\x0e\xfa[_\x22p\xf9\x9dJ\
+t\xa7J~\xf2\x92\xb6\xbd\x0f\xd4\x0f\xf85+\xf6\x85\
+\xf0o\xc1\xef\x8e\x7f\x16t\x8f\x16x\x93H\xf0\xd5\xd7\
+\x8at\x9b\x09t\xb3\xa9\xdd\xa5\xb4W\x86\xdeI\xcc\xa8\
+\xae\xe4.\xf5\x13!\xdb\x9c\x90N3\xb4\xd7\xce\x7f\xf0\
+pO\xc6\x8f\x0c\xfc|\xff\x00\x82\x95x\xfb]\xf0\x86\
+\xb3g\xe2\x1d\x0e\xda\xd6\xc3J\xfbu\x94\x82Ky\xe6\
+\x82\xddR_-\xc7\xca\xea\xaf\x95\xdc\xa4\x82T\xe3#\
+\x9a\xf92{X\xee\xe3\xd9,i*g;Xdg\
+\xb1\xa7$k\x1caUUQF\x02\xa8\xc0\x03\xd0U\
+\xc7-\x84q\x92\xc6_Y+[\xee\xff\x00\x22^c\
+7\x85\x8e\x1a\xdf\x0b\xb9\xee\xdf\xf0J\xcf\x1e\xe9\x1e\x06\
+\xfd\xa3\xa5:\xc6\xa5k\xa6G\xabi\x13\xd8[Ks\
+ \x8e7\x98\xbcn\x10\xb1\xe0\x12#lg\xbf\xd6\xa6\
+\xff\x00\x82\xb1x\xf7H\xf1\xef\xed\x07c\x1e\x93\xa9Z\
+j\xb1\xe9::Y\xddIm \x924\x94\xbb1\x8c\
+0\xe0\x90\xac3\x8c\xe35\xf3\xb5\xe6\x9e\x10\xb6\x06\xf8\
+\xcf^3\x8a\x89c\x11\xa8\x00\x00\x05p\xbc\x96\x0b4\
+\xfe\xd3r\xd5F\xd6\xfdo\xe8|\x22\xe0\x8c#\xe2\xb5\
+\xc5\x9e\xd2^\xd1S\xe4\xe4\xd2\xdd\xaf}\xf6\xd2\xdf3\
+\xee\xbf\xd8\x7f\xfe\x0a]\xa3\xdc\xf8Z\xc7\xc3\x1f\x10\xf5\
+\x14\xd2\xf5-9\x16\xda\xd7X\x9c\x13m}\x10\x18U\
+\x9c\x80v8\x18\x19#k\x0ct9\xcf\xa8k?\xb1\
+\xb7\xc0\x8f\x1d\xea\x8f\xadI\xa4\xf8Z_\xb5\x1f6G\
+\xb3\xd5<\xaby\xc9\xe7%Q\xc2\x8c\xfa\x0d\xbf\x85~\
+b\x10\x0f\xb8\xa6\xad\xba*m\x03\x0b\xe8\x0e\x01\xfc+\
+\xc6\xc5p\x84]yW\xc0\xd6\x95\x17-\xd4v\xf9j\
+\xbf\xc9t>/5\xf0c\x0e\xf3\x0a\x99\x86C\x8d\xab\
+\x82\x95_\x8e4\xdf\xba\xf7\xd9'\x16\xb7z]\xa5\xd1\
+#\xf4W\xf6\xa0\xfd\xb1>\x19\xfc\x08\xf89\xacx#\
+\xc3+\xa2kw\x97\xd62i\xf0\xe9\x1aR\xabY\xd9\
+\xefR\xbed\xce>^3\x9e\x0b1#\xb7Z\xf9\xbf\
+\xf6\x01\xfd\xba\x1f\xf6`\xb8\x97@\xd7c\xb9\xbe\xf0n\
+\xa5(\x9d\x8c#t\xdad\xc4\x00\xd3\x22\x9f\xbc\x8c\x07\
+\xcc\xbdx\x04s\x90~{H\x965\xc2\xa8Q\xe8\x06\
+)q\xces\xcdv\xe1x[\x09K\x07<%K\xcf\
+\x9fY7\xbb}\x1f\x95\xbe\xff\x006{\x99W\x84\xd9\
+\x1e\x17%\xaf\x92\xe2y\xab\xaa\xef\x9as\x9b\xf7\x9c\xba\
+Ivk\xa3\xdf\xbbg\xea?\x89\xfc\x17\xf0O\xf6\xc8\
+\x82\xdbX\xbb\x9b\xc2\xde$\x94(T\xbc\x8a\xf7\xec\xd7\
+H?\xb8\xfc\xa3\x9ct\xc3\x03\x8cq\x8a\x8e\xd3\xc5_\
+\x05?a\xdf\x0e\xdc\xb5\x85\xd7\x87t\x1f\xb5.^+\
+)\xbe\xd7\x7f\xa8\x11\xd1x,\xc7\x91\xd0\x90\xbd\xfd\xeb\
+\xf2\xeb\xc9]\xc5\xb6\xe1\x8fq\xc5*\xc2\x11\x8b\x00\x03\
+\x1e\xa7\x19&\xbc\x95\xc1-\xafc<L\xdd/\xe5\xfe\
+\xb4\xfc\x0f\x90^\x05'M`+f\x95\xe5\x84O\xf8\
+W\xd2\xdd\xb7\xe5\xb7\xfd\xb9\xe6\xac\xf5=_\xf6\xc7\xfd\
+\xadu\x1f\xda\xaf\xc7\xc9}$\x0f\xa7h:R\x98t\
+\xbb\x06`\xc6\x15'\xe6\x96B82>\x06q\xc0\x00\
+\x01\xd3'\xeb\xef\x80?\x1f\xfc#\xa1\xff\x00\xc1>t\
+\xd1s\xe2M\x22\xde\xe3E\xf0\xdc\xdaU\xd5\xac\x97\x0a\
+.\x12\xe7\x0e\xa21\x1ew\xb1%\xd7\x04\x0c\x1d\xdfZ\
+\xfc\xeb\xdb\xd3\xad4\xc0\xa6@\xfbWz\xf48\xe6\xbd\
+\xac\x7f\x0ea\xb18jXX\xfb\xb1\x83M[\xf5\xbf\
+\xa9\xf6\xfcC\xe1\x96S\x99\xe5XL\x9e\x95\xe8\xd2\xc3\
+\xcdJ*6\xd6\xc9\xab;\xae\xb7\xd5\xef}X\xeb9\
+d\xb40\xbcrI\x04\xf0\x95x\xe4\x8c\xe1\xe3a\x82\
+\x18\x1e\xc4\x11\x9f\xc2\xbfJ?a\xbf\xdb\xb3J\xf8\xe7\
+\xe0\x04\xb1\xf1F\xb3\xa5\xe9^1\xd1c\x11\xdd\x9b\xcb\
+\x84\xb7]R1\xc0\xb9B\xc4.OF\x19\xeb\x92\x06\
+\x0d~k\x81\x9aU\xb1\xfe\xd0!v\x07\x1e\xa4p+\
+l\xf7!\xa1\x9aQ\xf6U4\x92\xdaKu\xff\x00\x00\
+\xec\xe3\xee\x00\xcbx\xaf\x04\xb0\xd8\xdb\xc6qw\x8c\xd5\
+\xb9\xa3\xddk\xa3O\xaa\xf2Otz'\xed\x8d\xe2\xdd\
+?\xc7\xbf\xb4\xbf\x8euM\x22\xea;\xfd6\xf7So\
+\xb3\xdcE\xcaN\xa0\x05\xdc\xbe\xa3 \xe0\xf7\xae6\xc3\
+N\x16\xc3s`\xb9\xfd)\xf6V+h2>\xf1\x1c\
+\x9fO\xa5X\xafo\x09\x85\x8d\x0a0\xa4\xb5\xe5I/\
+\x92>\x9b/\xc2C\x05\x82\xa3\x81\xa4\xef\x1aq\x8cS\
+{\xb5\x14\x92o\xee\xd4(\xa2\x8a\xe97\x0ak}\xf1\
+N\xa6\xc9\xda\xaa dx\xddsk\x01\xe8w\x9f\xe5\
+\x5c\xfa\xf7\xfa\xd6\xff\x00\x8e\x08\x10[\x8fWcX\x0b\
+\xdf\xeb^f-\xfe\xf1\x9e\x9e\x17\xf8hZC\xdf\xe9\
+KH{\xfd+\x9d\x9d\x0fa\x87\xad\x14\x1e\xb4S\x04\
+_\x93\x86\xf6\xa5\xa1\xfa\x1a+H\xec\x8c%\xbb\x10\x8c\
+\xd3\x1b\xa9\xa9*\x16\xef\xfe{P\x16\xb8\x92\x8c-6\
+1\xd4\xfaqNn\x9d\xa9\xfbvF0zRj\xe3\
+O\xa1\x1d#\xe3\xbd-#u\xfc1PX\xcay\xcf\
+\x18\xa6S\x89\xc2P8\x86H\xfaz\xfa\xd3i\xe9\xf7\
+E3n\xd2{P/\xb41\xb0:w\xa6\x11\xcez\
+c\xd3\xb5=\xcf\xb6\x054\xf3\xc5\x06\x86\x86\x9f\xe2\xb9\
+\xad\x14,\xa0N\x83\xbf\xf1\x0f\xc6\xb4`\xf1=\xa5\xc6\
+3!\x88\xfa8\xc5sLF\x0fqM|c>\x95\
+\xa4q\x13\x89\x84\xb0\xf0\x91\xd7-\xf42\xfd\xd9\xa1a\
+\xfe\xf8\xa7y\xf1\x85\xfb\xf1\x9f\xf8\x15q\xb8\x1e\x82\x98\
+\xe0\x064\xfe\xbc\xd7B~\xaa\xbb\x9d\x9b^\xc4\x80\xe6\
+h\x86?\xdb\x02\xa1\x97Z\xb5\x84\xfc\xd70\x8f\xc75\
+\xc8\xed\x04r\x051\xc6\x0fAI\xe3]\xae\x90,*\
+\xbe\xac\xea'\xf1m\x92\x02<\xd6|\x7fuMV\x9b\
+\xc6\xd6\xeb\x9d\x91J\xc7\xdf\x02\xb0*9N\x0f\x1d\xeb\
+/\xad\xd4f\xcb\x0f\x05\xb9\xb3?\x8e[?-\xb0\x1f\
+\xef5C'\x8dnX\xf0\x90\xaf\xe0Md7SE\
+d\xf1\x15_\xda5Xzk\xa1\xa9\xff\x00\x09\x8d\xdf\
+\xfd1\xc7\xfb\x95,\x1e4\x9a1\xfb\xc8\xa2a\xdf\x1c\
+\x1a\xc6\xa2\x92\xadQm!\xfb\x18v:\xbd7\xc4\x90\
+j$/1Hx\x0a\xc7\x86\xfa\x1e\xf5n>\xf5\xc4\
+\x9e+\xa7\xf0\xde\xa8u\x1b2\xaes,G\x04\xff\x00\
+xv5\xd7\x87\xc4s>I\x1c\xb5\xa8(\xfb\xd1/\
+\x9e\x9f\x9d6\x9d\xd8\xd3k\xb0\xe6#\xa6\x1e\xa6\x9fL\
+=Mf\x02S\x1f\xa0\xa7\xd3\x1f\xad'\xb0\x0eO\xba\
+*9\xbe\xf5H\x9ftTs}\xea\xc9|F\xb1\x05\
+\xe8)i\x17\xa0\xa5\xa4\xcb\x19$+4e[\xe6\x06\
+\xb2\xee\xac\xcd\xa3w\xda\xc7\x83\xebZ\xf4\xc9\xa3\x13!\
+C\x82\x0fj\xce\xa49\x91P\x9f)\x95M\x1f\xfa\x15\
+Ish\xd6\xac{\xa9\xe8\x7f\xa1\xa6/S\xc6+\x91\
+\xc5\xa7ft\xa7qh\xa2\x8a\xa4C\x0a(\xa2\x80\x0a\
+T\xebIJ\x9dh\x01\xf8\xe74R\x7f\x16h\x7f\xba\
+j\xa2\x02\xd1E\x15@\x14\x80q\xc8\xcd- \x00\x8c\
+\x0a\x00r}\xe1N\x00\x0e\x94\xc5\x5c\xe2\x9c\x07=:\
+qU\x10\x1dE\x14U\x00QE\x14\x00QE\x14\x00\
+S\x94\x0c\x03\xf8\xd3GZp\xc99\xa0\x07QE\x14\
+\x00QE\x14\x00QE\x14\x00\xa9\xd6\x9d\x8c\x1e)\xaa\
+2}\xc5(^y\xef@\x0e\xa4_\xe9KE\x06r\
+[\x85\x14QA\x98QHW4l\x14\x00\x8c\xc7<\
+v\xad\xdf\x04\xdc\xeeK\x88\x89\xc9\xc8q\xfc\xab\x0a2\
+\x01\xe6\xb4<5y\xf6}V>~I>C\xfe~\
+\xb8\xad\xb0\xf2\xe5\x9ad\xd6\x8d\xe0\xd1\xd4\x81\xf5\xa5\xa4\
+\xe8;\x8f\xad-{(\xf3\x10QE\x14\xc6\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x15f\xcf\
+J2\x80\xef\x95^\xc3\xb9\xfa\xfaT\x9af\x9d\x8cH\
+\xe0g\xb0\xfe\xb5~\xb6\x85>\xac\xc2u:!\x91\xc4\
+\x22\x5c*\x85\x02\x9c>\xed-\x15\xba\xecd\x14QE\
+ \x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\
+\x80\x0c\xd1\x9cw4QN\xe05\xe2\x12\x0c2\xa9\x1f\
+J\xaf6\x91\x14\xa7\x8c\xa1\xf6\xabTRi=\xd0&\
+\xd6\xc6d\xba+\x83\xf22\xb7\xb7Bj\x19-\x1e\x1f\
+\xbd\x19\xfeb\xb6h\xac\x9d$\xcbU\x1a0\xe8\xady\
+m#\x93\xef\x22\x92;\x81\xcdW\x93E\x8c\xf2\xac\xeb\
+\xfa\x8a\x97FKcEU\x14(\xab\x12h\xf2\xa7#\
+\x0f\xec:\xd4\x12[\xbc9\xdc\x8c\xb8\xf6\xac\xdcd\xb7\
+E\xa9\xa6%\x14\xd0:\x80h\xfcE\x22\x87QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00\xdf\x5c\xf0\x05d\xdf\x5c}\xa2vl\
+\xf08\x1fJ\xbb\xaa\xdcyPm\x04\xee~>\x82\xb2\
+\xcf\x7f\xeb\x5c\xd5\xa5\xd1\x1a\xd2\x8fV(8\xe3\xf3\xa7\
+\x01\x83\x81M\x1d\xc9\xa7\x01\xdf\xd6\xb07\x0a(\xa2\x80\
+\x0a(\xa2\x80$\xa1\x14\x12>\x94\x9by\xcd!_\x97\
+\xd2\xae\xe2\xb9*\xae\xdaZu\x95\x84\xb7\xe7lHX\
+\xf7=\x87\xe3[:w\x85c\x84\x86\x9c\xf9\xac:/\
+\xf0\x8f\xf1\xadi\xd2\x9c\xf6Fu*\xc6;\x99zn\
+\x8d6\xa4\xd9U\xdb\x18\xea\xed\xd3\xf0\xf55\xbf\xa7i\
+0\xe9\x8b\x84\x5c\xb9\xea\xed\xf7\x8f\xf8U\x80\xb8\x18\x00\
+\x00:\x01\xda\x9d]\xf4\xe8F\x1e\xa7\x0c\xebJ~\x83\
+p?\x1au\x14V\xa6)\x05\x14Q@\xc2\x8a(\xa0\
+\x02\x93\xb0\xc7\x06\x96\x8a\x04\xd5\xcew\xc4z<v\x17\
+Fx\xa2H\xc5\xc7\xdf\xc2\xe3-\xff\x00\xd7\xac\xf3\xcf\
+\xff\x00^\xba\x8dj\xdb\xedZt\xab\xdc\x0d\xe3\xd8\x8e\
+k\x97\xce@<\xd7\x06&-J\xe8\xee\xc3\xca\xf1\xf4\
+\x10t\x15! /5\x18\xe8)\xed\xd4\xd737\x0d\
+\xdb\xbag\x8a(\xa2\x80\x0a(\xa2\x80$N@\xed\xef\
+E\x22\x9c\x00OJZ\x04\xf6\x0a(\xa2\x82\x02\x8a(\
+\xa0\x02\x8a(\xa0\x05\xcf\x18\xaa\xf3\xe9\xe1\x89)\xc7\xfb\
+5=\x14i\xd4\x13kc=\x90\xa1\xc1\x18>\x86\x8a\
+\xd2\x925\x90a\x82\xb0\xf7\xa8_KV\xfb\xbb\x94z\
+u\x15.\x0c\xd1T]JtT\xef\xa5\xba\xf4*s\
+\xcd7\xfb:_\xee\xaf\xe7K\x96]\x8b\xe6DTT\
+\xc3K\x90\xf6\x03\xfe\x05OM!\x8e7:\xaf\xd0Q\
+\xcb.\xc1\xcc\x8a\xd4\x224\xcd\x85R\xdf\x85_M.\
+8\xf1\x9c\xb9\xf7\xa9\xd1\x15\x06\x14*\x8faV\xa9>\
+\xa4:\x89\x14\xed\xb4\x9c\x8c\xc8G\xd0\x1a\xbc\x88\xb1\x80\
+\x14\x05\x1dq\x8a\x5c\x86\xef\xd6\x8d\xa7 \xf4\xabI-\
+\x8c\xa56\xf7\x1fE\x14S (\xa2\x8a\x00)\xa7\xa8\
+\xfa\xd3\xa9\x19NER`s\xfe7\x9fu\xd4\x09\xfd\
+\xd5,}\xb2k\x1d{\xfdj\xe7\x89.~\xd3\xac\xcc\
+A\xc8O\x90~\x15R\xbc\x8a\xd2\xe6\xa8\xd9\xebP\x8d\
+\xa9\xa4\x14\x87\xbf\xd2\x96\x90\xf7\xfaVl\xd5\xec0\xf5\
+\xa2\x83\xd6\x8a`\x8d\x17\x18\xc9\xedM\x07#4\xb2}\
+\xc3\xf5\xa6\xa7J\xd1ls\xcfq\xd5\x0b\x8c\x12*j\
+\x8aNO\xe3@\xc24\xc9\xa7\xc9\xf7M\x11\x8e3\xeb\
+D\xbfr\x81'\xa9\x0d\x0c\xb9\xe2\x8aR1Y\x9a\x91\
+S\x99~_\xa56\x9eO\x1fZ\x07\x10O\xba)\x9d\
+\xe9wm8\xe3\x8aJ\x05\xa2\x90\xc7\xcf\xb7\xd2\x92\x95\
+\xd7\x9c\xe6\x92\x83B\x22\xb8\x04Sd8\xfc*G\xfb\
+\xc6\x99/\xfa\xb3P\xc0mF\xe7\xe65%2O\xbc\
++)\x02\x12\xa3\x97\xad=>\xe8\xa6\xcb\xdb\xd2\x93\xd8\
+}H\xc9 \xe4\xd2K\xd4\x1avFz\xf2)\xae\xa3\
+'9\xc5J(\x8e\x8a(\xa4j\x14QE\x00\x15\xa7\
+\xe1\x09\x8a\xea,\xbd\x9d\x0e\x7f\x0ek2\xb4\xbc&\xb8\
+\xd5\x07\xfb(kJ/\xf7\x912\xaa\xfd\xc6tm\xdf\
+\xfc\xf7\xa4\xa7\xed\xeb\xefL?)\xaf`\xf3\x08\xe9\xac\
+r\xff\x00\x8d:\x99'\xdf\xac\xc0Jk\x9c\x93N\xa4\
+\x90w\xa4\xf6\x00O\xba*9\xbe\xf5H\x9ftSd\
+Z\xc9;3h\x8dV\xddKM^\xa6\x9dJ[\x8c\
+)\xa4\x1c\x93\xdb\x14\xeaF\xe8i\x01\x0c\x91\x87R\x08\
+\x04{\xd5+\xab\x16\x8b\xe6^W\xf9U\xf7\xfb\xa6\x9a\
+x\x07\xa6k9\xc52\xe1+\x19\xaaij\xc4\xf6a\
+\xc6Pa\x87n\xd5]\xd7k`\x82\x0f\xbdb\xe2\xd1\
+\xb2w\x0a(\xa2\xa4\x02\x95:\xd2R\xa7Z\x00vy\
+\xc5\x0f\xf7M\x18\xe74?\xdd5Q\x01h\xa2\x8a\xa0\
+\x0a(\xa6\xae3\xed@\x0a\xa4\x0cT\x9b\xb9\x1e\xf4\xd4\
+\xfb\xc2\x9c\x13\x15Q\x01h\xa2\x8a\xa0\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0c\xe6\x9c\x0e8\xefM#4\xe5@@\xa0\
+\x07QE\x14\x00QE\x14\x00QE\x14\x00\xa8y\xa7\
+g-\xf4\xa6\xa1\xc94\xe5\x184\x00\xb4QH\xbf\xd2\
+\x837k;\x0bE\x14Pf!lQ\xbcR\xd2?\
+\xdd4\x00\xd02i\xca|\xaeG\x04\x1c\x83\xe9M\x07\
+\x06\x9e\xad\x9ai\xd8\xb6\x8e\xc6\xc2\xf0_Y\xc7(\xc7\
+\xcc9\xf6=\xeaz\xc1\xf0}\xfe\xc7\x92\xdd\xb9\xdcw\
+\xa8\xfec\xfc\xfaV\xf5{T'\xcf\x04\xcf.\xa49\
+d\xd0QE\x15\xa9\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01V4\xab13oa\x95^\x83\xfb\xc6\xab\
+G\x1bO\x22\xa8\xe5\x98\xe0V\xd40\x88#\x0a\xbc\x01\
+\xfa\xd6\x94\xa3ws*\x92\xb6\x83\xfbQE\x15\xd0`\
+\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14\x84\x16\xebKE\x00B\
+\xf6q\xcb\x9d\xd1\xa9\xcf|T/\xa2\xc6\xd9\xda\xcc\xb9\
+\xfcj\xe5\x14\x9cb\xfa\x0d6\xb6fd\x9a3\xa7\xdd\
+eon\x95\x0c\x96\x12\xc5\xd63\xf8s[\x18\xfa\xd1\
+\xd7\xb5C\xa5\x1e\x85*\x8d\x18D\x158#\x07\xe9\x8a\
+:{}kq\xe3W\x1c\xa8o\xa8\xa8\xdfO\x86N\
+\xb1\x8e}8\xa9\xf6/\xa1j\xa9\x8f\xd3\xfd\xaauh\
+6\x8b\x19\xe8\xce\xbf\xadE&\x86\x7f\x86E\xfcEC\
+\xa7!\xfbDT\xa2\xa7m\x1eU\xe9\xb5\xbf\x1aci\
+\xd3'X\xcdO,\xbb\x16\xa6\x88\xe8\xa5kv^\xa8\
+\xc3\xf04\xc2\xa4u\x04R\xd4wC\xa9\xa5\x82\x8f@\
+9>\xc2\x94\xf1\xdb\xff\x00\xafT\xf5{\xbd\x91\xf9@\
+\xe0\xb7\x5czTJVW\x1a\xd5\xd9\x14\xefnM\xcc\
+\xec\xd9\xe3\xa0\xfaT;\x0d)8\xf4\x14\x04'\xde\xb8\
+\xb9\xae\xce\xa4\xd2\xd0P\xbb\x87Q\xd6\x9cN\x0e=(\
+H]\x81\x0a\x8c\xd9\xf4\x19\xa9\xe3\xd2\xae$\xc0[y\
+O\xfc\x04\xd0\xa3'\xb2\x13\x92[\x95\xe9\xd8\xc7\xbd^\
+\x83\xc3\x17\x92\x8c\x98\x82\x7f\xbc\xc0U\x98<\x17!\xe6\
+I\x91G\xa2\x8c\x9a\xd1P\xa9-\x91\x12\xad\x05\xd4\xc7\
+S\x9e\xf8\xa7F\xa5\xc8\x0b\x92}\x075\xd1[\xf8J\
+\xda\x1e_\xcc\x94\xff\x00\xb4q\xfc\xaa\xf4\x16\x91Z\xaf\
+\xee\xe2H\xfe\x83\x9a\xe8\x86\x0ao\xe22\x96.?d\
+\xe7,\xfc7svFc\xf2\x94\xf7~?J\xd5\xb1\
+\xf0\xa4\x16\xc0\x19\x0bN\xc3\xd7\x85\xfc\xabK\xee\xfa\xfd\
+ik\xaa\x18zq\xd7s\x9eu\xe7!\xa8\x825\x0a\
+\xaa\x15Ga\xc5(\xc7a\x8aZ+c \xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x01\xac\x9b\x95\x87f\x18\xaeA\xb8'\xb6\x0dv\x07\x80\
+I\xed\xcdq\xeer\xcf\xf5?\xce\xb9q}\x0e\x9c7\
+Q\xa3\xa0\xa9\x0eq\xc7Z\x8ct\x15!\xc69\xe9\x5c\
+'X\x83$\xf5\xcd\x14u\xe9E\x00\x14QE\x00H\
+\xbf(\x1f\x9d\x14\x80p=}\xe9h\x13\xd8(\xa2\x8a\
+\x08\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x1c\xb8\xc8\
+\xebNV\xd8\xde\xc7\xf4\xa6/QNU\x1f\x8fZi\
+\xd8I\x12\xd3|\xbfz#\xefN\xabL\x80\xa2\x8a(\
+\xb8\x05\x14Q@\x00]\xbc\xf6\xf6\xa7\x13\xf3R$\x99\
+\xc5.\xdc\x0e(\x01\xd4QE\x00\x14QE\x00\x15\x15\
+\xe5\xc0\xb4\xb5\x92V<F\xa4\xd3\xcf\xf9\xfdk\x1f\xc6\
+W\xc1 \x8e\xddO.w\xb6=\x07O\xd7\xf9T\xd4\
+\x9f$\x5c\x99\xa5(sI#\x00\x92\xccX\x93\xb9\x8e\
+M-\x14W\x92{\x01H{\xfd)i\x0f\x7f\xa5&\
+'\xb0\xc3\xd6\x8a\x0fZ)\x824d\xfb\x86\x98\x9d)\
+\xf2}\xdaj\x9c\x8a\xd5|'<\xb7\x16\xa3\x93\xa9\xa9\
+)\xb8\x0c\xc3\x9eE!\x8e\x03\x0a\x07qH\xdd\x0d)\
+'\x8fJ(&\xe5zF\xe8i\xcf\xf7\x8d5\xba\x1a\
+\x86l2\x9d\xd4c4\xdap#o\xbd!\xa1\x1b\xbf\
+\x03\x06\x92\x8d\xbc\xe3\xd6\x83\xf9\xd07\xb8\xc7\xfb\xd4\x94\
+\xe7\xe9M\xa0\xa1\x8f\xf7\x8d2_\xf5f\x9e\xff\x00x\
+\xd3%\xff\x00Vjd\x03j9\xba\xd4\x94\xc7\xebY\
+H\x10\xd4\xfb\xa2\x92N\xd4\xa9\xf7E\x0f\xf7M.\x83\
+\xeaE\xb7\x9f\xebM\x97\xa58\x9cu\xe9H\xe7\x1d:\
+\xf5\xac\xca\xeaEE\x0d\xd4\xd1M\xeeh\xb6\x0a(\xa2\
+\x900\xfdkg\xc1v\xf9\x9ay1\x9d\xaa\x10\x1f\xaf\
+\xff\x00\xaa\xb1\xab\xa7\xf0\xcd\x9f\xd9t\xb5$`\xcaw\
+\xff\x00\x85o\x86\x8d\xea/#\x0cD\xad\x03F\xa3\xee\
+~\xb5%G\xdc\xfdk\xd5<\xf2:d\x9f~\x9fL\
+\x93\xef\xd6`%\x12\xfd\xd1\x9e\xb4Se\xebI\x80G\
+\xde\x89;Q\x1fz$\xedX\xbd\xcd\xa3\xb1\x1a\xf54\
+\xeaj\xf54\xear\xdc\xa0\xa4n\x86\x96\x91\xba\x1a\x90\
+#\x7f\xbai\x92u4\xf7\xfb\xa6\x99'SP\xf7\x08\
+\x0c\xddH\xea\xae0@ \xfe\x94QH\xd0\x81\xec\xc8\
+\x1f/ v=j&R\xa7\x04\x10j\xe5\x0c7u\
+\x00\xfdj\x5cnR\x97r\x9d*u\xa9\x9a\x04oU\
+=8\xa6\x9bR:\x1c\xfbVn\x0d\x0dI1\x8d\xd4\
+\xfd)\x7f\x83\xf0\xa5\xf2\xd8\x0c`R\x10B\xe3\xbd\x08\
+b\xd1E\x15@\x14Rm8\xfd(\x04\x01\x91@\x08\
+\x09'\xae\x0d=InrqL\xdc\x07\x1c\xe2\x97\xcc\
+\xdb\xeb\xf8\xd0\x04\xb4T\x0d)\xc7\xf8\xd3Zf\xdd\xcb\
+~T:\x88\x0b4\x86E^\xa7\xf5\xaae\x8bz\x9c\
+\xfa\x9ai\xce8\x14\x9d_\x22\xb9K\xa6T\x1f\xc4\xb8\
+\xfa\xd2}\xa1?\xbc\xbf\x9dQ\xcf\xbd&?\xda\xa5\xed\
+\x1faX\xd1\xf3P\x8e\x18d\xd3\xc3d\x8eA\x1e\xd5\
+\x93K\xb8\x8e\x87\x15^\xd0|\xa6\xbd\x15\x95\x1d\xe4\x91\
+\x11\x878\xf7\xe6\xa6\x8fW#\xef\xa8a\xed\xc5\x1e\xd1\
+\x07+/\xd1P\xdb\xde\xc7?F9=\x88\xa9}\xbb\
+\xd5\xa6\x99\x22\xd1E\x14\xc0\x17\xae})\xc0e\xb3\xda\
+\x91\x0e\x0d;?7\xd2\x80\x16\x8a)\x17\xfaPf\xde\
+\x8cZ(\xa2\x831\xa5I\xefF\xd3\xeaiw\x8a7\
+\x8a\x15\xc6$c-N\x07\x1d)\x8a\xa4\xf4\xa7\xa0+\
+\xf9\xd0X\xebk\x96\xb4\xb8I\x10\xe1\xa3!\x87\xbdv\
+\x16\xd7+wl\x92\xa1%d\x19\x1e\xd5\xc7\x03\x8e}\
+:\xd6\xbf\x84\xf5O.F\xb6c\xf2\xbf\xcc\x9e\xc7\xb8\
+\xfck\xb3\x09[\x96\x5c\xaf\xa9\xcb\x89\xa7x\xf3v:\
+\x0a(\xa2\xbd4p\x85\x14QL\x02\x8a(\xa0\x02\x8a\
+(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x9b\
+\x8f\x97\xe9\xcd:\x9b\xedR\xd0\x17tXr\xec\xe4}\
+\xd1\xb4}kF\xab\xe9\x91yVk\xea\xdc\xd5\x8a\xed\
+\x82\xb4R9d\xee\xee\x14QE2B\x8a(\xa0\x02\
+\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\
+\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\
+\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\
+\x8a(\xa7p\x0aO^{R\xd1H\x04\xc7\x14\x05\x0b\
+\xd0R\xd1@\x06s\xc6M!\x19\xf4\xa5\xa2\x80\x1b\xb0\
+\x1f\xe1_\xc4SM\xb4m\x9c\xc6\x9c\xfa\xa8\xa9(\xa3\
+@#6\x91\x8e\x91\xc6\x0f\xfb\xa2\x94B\xa88U\x18\
+\xf6\xa7\xd1F\x83\xbb\xee\x18\xc5\x19\xcfz(\xa0V\x0a\
+L})h\xaa\xe6\x15\x82\x8a(\xa9c\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x9b@Ey0\x86\xd6V\xec\
+\xaaMrY8\xeb\xcfz\xe8\xbcOp\x22\xd3\x8a\xf7\
+\x94\xed\xff\x00\x1a\xe7[\xadp\xe2\xa5y%\xd8\xeb\xc3\
+G\xdd\xb8\x83\xa0\xa7\xf6\xa6\x0e\x82\xa4$\xa8\x18\xaeC\
+\xa4B1\xdb\x14P3\x9e\x98\xa2\x80\x0a(\xa2\x80\x1e\
+\xbft~4\xb4!\xc8\x00\xf4\xa2\x81=\x82\x8a(\xa0\
+\x80\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00^\xa2\xa4\
+\xceH#\x81L^\x9c\xf4\xa7\xa9\xdaq\xda\x80\x1d\x1f\
+zu6>\xf4\xea\xd1\x19\xb0\xa2\x8a(\x00\xa2\x8a(\
+\x01\xcc\xbcv\xfa\xd2g'\x8f\xa5 \x05\x0f\xa0\x14\xe2\
+y\xc7z\x00u\x14Q@\x05\x14Sw\xfd(\xb0\x09\
+4\xcb\x04.\xee\xc0\x22\x0d\xc4\xfbW\x1f\xa8_6\xa1\
+u$\xcc1\xbc\xf0?\xba;\x0a\xd4\xf1v\xaa\x1c\x8b\
+T`B\x9c\xc8G\xafe\xacQ\x929\xae\x0cU[\
+\xbeE\xb2=\x0c5+.g\xb8\xb4QEs\x1d\x81\
+H{\xfd)i\x0f\x7f\xa5&'\xb0\xc3\xd6\x8a\x0fZ\
+)\x824\x9c|\xbf\xa5F\x83\x03\x1e\xf5#}\xc3L\
+^\xff\x00Z\xd1|'+\xde\xe2\xd0\xa3\x96\xf7\x14R\
+\x81\xf2\x1a\x0b\x12\x91\xba\x1cu\xa5\xa2\x812\x07\xfb\xc6\
+\x9a\xdd\x0d9\xfe\xf1\xa4\xcej\x1e\xe6\xa4t\xa3\xa1\xe9\
+J\xcb\x81\x91B\xf2\xa4R\x05\xb8\xd2pF3\xcd\x0d\
+\xd7\x07\x1cPz\x8e\xb8\xa0\x9c\x9a\x06\xf7CJ\xf5\xef\
+M\xa7\xb7C\xe9Ln\x9f\xe3Ac\x1c\xfc\xd5\x1f\xf0\
+T\x8e23\xde\x98G\x07\x1852\x01\x89\xf7E$\
+\x834\xa0\xf3\xcf\x06\x92_\xb9Y\xbd\xc0m#\xfd\xd3\
+KH\xff\x00t\xd4E\x95\x226\xfc)\x8e\x98\x22\x9e\
+\xdf\x850\x90\xfe\xbf\x8fJ\x82\x860\x19\xe0\xd2R\xbf\
+\x0dIM\x96\x82\x8a)@\xcdK\x06Kajon\
+\xa2\x88uv\xc7\xe1\xde\xbb\x00\xab\x1a\x05\x03\x00\x0c\x01\
+\xe8+\x1f\xc1\xban\xc5{\x96\x03\xe6\xf9\x13>\x9d\xcd\
+l\x16\xc5z8J|\xb0\xe6\xeey\xf8\x89\xf3J\xcb\
+\xa0\xea\x8f\xb9\xfa\xd4\x95\x1fs\xf5\xae\xb4`GL\x93\
+\xef\xd4\xb2v\xa8\xa4\xfb\xf5\x00%6^\xb4\xeal\xbd\
+i0\x08\xfb\xd1'j#\xefD\x9d\xab\x1e\xa6\xd1\xd8\
+\x8d~^\xb4\xeao\xdfojuT\xca\x0aF\xe8i\
+i\x1b\xa1\xa8\x027\xfb\xa6\x9a\xe3$\xd3\xe9\x8e1\x93\
+Q!\xc7B6\x5c\x1aJW\xfb\xc6\x92\x91aA4\
+PGc@\x11\xafQRS\x13\xef\x0a}\x04Hk\
+\x12\xbe\xe2\x9bN~\x13\xe9M\xa0\xdcB\xa0\xd3\x06;\
+T\x95\x1d+\x00\x8d\xc7\xaf>\x94\x8c>~\xbcS\xa9\
+;\xd2q\x01\xa1w{\x11C\x1c\x9a\x09\xeex\xa0\x8c\
+\x0f\xf3\x9a\xce@%2^\x94\xfad\xbd*$TD\
+\xa4n\x86\x96\x91\xba\x1a\x82\x86QE\x14\x09\x91\xd1E\
+\x15\xa0\xc6\xc9\xcd6\x9f\x22\xf1\xf4\xa6T\xcba\xc4U\
+\xe0\xff\x00\x9e*{]Y\xed\xdf\x0f\xf3\xa8\xfc\xea\xbd\
+1\xfe\xf1\xf5\xa9M\xa6S\x8af\xdd\xbd\xca]&\xe4\
+l\x8e\xfe\xd5%`\xc53B\xe1\x94\x95a\xdcV\x9d\
+\x86\xa8\xb7\x1f+\x8d\xb2\x1e\x9e\x86\xb7\x85K\xe8\xcc\xa5\
+\x1b\x16\xd4d\x9ar\x8c\x1fz@\x08'\xda\x94\x1c\xb7\
+\xb7j\xd6\xe4\x8e\xa2\x8a(3w\xb3\xb8QE\x14\x19\
+\x85#(\xc5\x1c\xfbRe\xbd\x05$\x16\x11N\x0f4\
+\xf0{\x8ab\x8ey\xa7\x81\xd8S4\x022}\xa9\xc0\
+\xb2\xb6A\xc1S\x90\x7f\xbbM'\x9e)\xdb\xb21\xeb\
+M\x5cM\x1d^\x8d\xa8\x8dN\xcc?G^\x1cz\x1f\
+\xfe\xbdY\xff\x00&\xb9M\x17S:]\xd8bO\x96\
+\xff\x00+\x8foZ\xea\xd6EtV\x1c\x822\x0f\xa8\
+\xaf_\x0f[\x9e:\xeey\xb5\xa9\xf2=6\x1dE\x14\
+WA\x90QE\x14\x00QE\x14\x00QE\x14\x00Q\
+E\x14\x00QE\x14\x00SG\xb7\x5cS\xa9#<\x81\
+\xeaqA,\xdb\x89v\xc6\xa0p\x00\x14\xeaA\x8e\xd4\
+\xb5\xd9\xd0\xe5\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0aF\xc7zZ\x86\xfe\xed\
+l-d\x95\xb9\x08?3\xe9E\xd2Wak\xe8b\
+x\xa6\xf3\xce\xbd\x08\x0eDC\x04{\xd6ku\xa7J\
+\xcd#\x17c\x92\xc4\x92s\xd6\x99^UIsJ\xe7\
+\xa5\x08\xf2\xc5!GAR\x13\xcf\xe3Q\x8e\x82\xa4s\
+\xbb\x8fz\x82\x84\xa2\x8d\xbbzg\x9a(\x00\xa2\x8a(\
+\x02D\xe0\x0e\xf4R/\xdd\x1f\x8d-\x02{\x05\x14Q\
+A\x01E\x14\xbb\x0d\x00%\x14Q@\xae\x14S\x80\xc9\
+\xc7>\x94\xbe^:\xd3\xb0\x0c^\xa2\x9e\x01 \x1e\xf9\
+\xa5X\xf2F9>\xc6\x8e\x8d\x9e\xe7\x83E\x82\xe3\xa3\
+\xefN\xa8\xe9\xd1\xf7\xabH\x96:\x8a(\xa0AE\x14\
+P\x02\xabo\x18\xc1\xe6\x80\x0a\xe3\xb9\xa5\xd9\x8eG&\
+\x939#\x14\x00\xfa(\xa2\x80\x12\xa8k\xda\xd2\xe90\
+aNg\x90a\x07\xf7\x7f\xda\xa7\xea\xfa\xbczL@\
+\xb6\x19\xdb\xee\xa0<\x93\xeb\xf4\xaeZ\xe6\xe9\xee\xe6y\
+$;\x99\xcf9\xed\xed\xf4\xaez\xf5\xb9\x15\xa3\xb9\xd5\
+B\x8f3\xbb\xd8fK\x12I%\x8f$\xfa\x9aZA\
+\xf5\xcd-y\xe7\xa2\x95\xb6\x0a(\xa2\x81\x85!\xef\xf4\
+\xa5\xa4=\xfe\x94\x98\x9e\xc3\x0fZ(=h\xa6\x08\xd2\
+o\xb8i\x8b\xdf\xebO~\xadM\xad#\xf0\xa3\x99\xa0\
+\xa7\xe0\x01\xcfjb\xfd\xe1RPQ\x1bu4S\x9c\
+\x8e\x94\xda\x00\x86_\xf5\x86\x9bN\x93\xef\xf4\xa6\xd4\xb2\
+\xa3\xb0\xd7\xe9D}\xe9\x5c\x8c{\xd2(\xca\x91RR\
+\xdcN\xcbC\xf0OjQ\xd7#\x93M\xe2\x81\xcd\xd9\
+\xa6#t4\xca\x92\xa3#\x14\x165\xfaTg\xbe:\
+\xd4\x8f\xd2\xa3<v\xcdL\x80`\xceNi\x1f\xf4\xa7\
+\x1e\xbf\xd3\xd2\x9a\xfd?\xaf\xa5d\xf7\x01\xb4\x8f\xf7M\
+\x04|\xbdsC\x0c\xadDJ\x91\x16\xdc\xf5\xa4n\xb4\
+\xac>^\x94\xd2\xa3o$\x9e\xe2\xa4\xa1\x8d\xf7\x8d%\
+9\xfbzShe\xc7`\xa9\xf4\xfb\x16\xd4.\x12%\
+8,y?\xdd\x1d\xcd@>\xb8\xae\x9f\xc3\x1a?\xd8\
+-|\xd7P%\x98g\x9f\xe1\x1e\x9f\x8diF\x9b\x9c\
+\xacgZ\xa7,n_\x8a\x05\xb7\x81\x125\xda\xb1\x80\
+\xa2\x86\xfb\xff\x00JxlsL\x7f\xbc\xb5\xec%e\
+c\xcc\xf3\x1dLu\xc5>\x99/J\x00d\x9d\xa9\x8c\
+3\x92)\xf2v\xa8\xe5\xebP\xf7\x01\xb4\x8f\xf2\xfb\xe7\
+\xa5-+ci\xc5&\x03#\xefD\x9d\xa8\x8f\xbd\x0f\
+\xd0\xfd\x0dc\xd4\xda;\x10\xd3\xd3\xee\x8ae=z\x0a\
+\xba\x83b\xd27CKEd2:a\xfb\xa2\xa5\x93\
+\xb5D\xff\x00x\xd4\xc8\x11\x1b\xfd\xe3IJ\xff\x00x\
+\xd2T\x9a\x05#\x9c\x0e)h\xa0\x05\x1c\x83\xc0\xa4\xa3\
+8\xa2\x9b!\xa1\x1f\xee\x9ae=\xfe\xe9\xa6R7\x0a\
+\x8e\x9eN\x053\x18\xa0\x02\x9b\x8c\x1f\xa74\xeaN\xf4\
+\x00\xd1\x800i\x08\xcf=\xa9O?\x8d\x0d\xcf9\xcd\
+c \x12\x99'\xdc?\xe7\xbd>\x9b'\xdc\xa8\x91Q\
+\x1bH\xdd\x0d-#t5\x05\x0c\xa2\x8a(\x13#\xa2\
+\x8a+A\x89'\x19\xf7\xa6S\xdf\xee\x9aeL\x86\xb7\
+\x0ac\x8c\x1f\xad>\x98\xff\x00x\xd4\x96%)99\
+\xefIE+\x01\xa5\xa6\xea{\xb1\x14\x87\x9e\x81\xbf\xa1\
+\xad\x05\xeb\xf4\xaexr=\xff\x00\x9di\xe9:\x8f\x9b\
+\xfb\xa79a\xc2\x93\xde\xb6\xa7S\xa31\x9cz\xa3B\
+\x91\x7f\xa5\x0b\xd2\x96\xb72\x92\xd1\xb0\xa2\x8a(2\x0a\
+G\xfb\xa6\x82\xb9\xa3`\xa0\x06\x03\x8e\x94\xf49\x1c\xd2\
+F@<\xd3\x81\xcd\x06\x82\xe3\x8c\xe6\x92\x823\xf4\xa2\
+\x80\x178\x07>\xe2\xb6|+\xad\x85\x22\xd6Bp~\
+\xe1=\xbd\xab\x16\x97\xa1\xc88\xc7\xa5kJ\xa3\x84\xb9\
+\x91\x9dHs+\x1d\xaf>\x80S\xab;@\xd6\x7f\xb4\
+\xe0\xda\xdcO\x10\xf9\xbf\xda\x1e\xa2\xb4\x08\xdb^\xc4&\
+\xa5\x1b\xa3\xcc\x92\xe5|\xacZ(\xa2\xacAE\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01I\x9d\x84\
+~t\xb4\xde\xa3\xf0\xa0Ok\x1b\x91\xf2\xb9\xf5\xe9N\
+\xa8\xac\xa4\xf3-\xa3=\xca\x8a\x96\xbb\x16\xc7 QE\
+\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\
+\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\
+\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\
+\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\
+\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\
+\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\
+\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\
+&\x7f<P\x01\x90\x06?\x0a\xc1\xf1>\xa3\xe7\xdc,\
+(r\x91r\xd8\xfe\xf5i\xeb:\x98\xd3mI\x18\xf3\
+$\xe1?\xc6\xb9\xac\x9eI<\x9f\xd6\xb9qU-\xee\
+#\xa3\x0fN\xef\x9d\x888\xa6\xd1Eq\x1d\x82\x8e\x82\
+\x9ezd\xd3\x07AOn\xa6\x90\x06\xed\xdd3\xc5\x14\
+Q@\x05\x14Q@\x0f\x0b\x90\x06\x7f*ZE8\x00\
+\x9e\x94\xb4\x09\xec\x14QK\xdf\xfc\x9a\x08\x12\x9d\xce*\
+\x1b\xfdB-:0\xd263\xd1GV\xac=C_\
+\x96\xf7*\xa4\xc5\x1f\xa2\x9eO\xd4\xd4N\xaca\xb9\xa5\
+:R\x9e\xdb\x1b\x17\x9a\xcc\x169\x0f&\xe6\xfe\xear\
+k:\xeb\xc5\x92;b8\xd61\xea\xdc\x9a\xcb\xe1q\
+K\x5c\x92\xc4N[hvC\x0d\x05\xb9<\xda\xb5\xc4\
+\xff\x00zy0{\x03\x8f\xe5P\x17c\x9c\xbb\x9f\xf8\
+\x11\xa2\x8a\xcb\x99\xbd\xd9\xb2\x84V\xc8\x0c\xac\xbf\xc6\xe0\
+\xff\x00\xbcjx5k\x98\x00\xdb<\x98\x1d\x89\xc8\xa8\
+(\xa16\xb6`\xe1\x17\xba5-<]\x22`M\x12\
+\xc8;\x94\xe0\xd6\xa5\x96\xb3\x05\xf7\x09(\x0c?\x85\xf8\
+&\xb9zN\xfcu\xad\xa3\x89\x9cL'\x86\x83\xdbC\
+\xb4'\x1e\xd4\xb5\xcb\xd8\xf8\x86\xe2\xc7\x8d\xc2X\xc7\xf0\
+\xbf$~5\xabg\xe2\x9bk\x8f\xbeL\x0c\x7f\xbd\xd3\
+\xf3\xae\xcaX\x88K\xc8\xe4\x9e\x1eq4\xe8\xa6B\xeb\
+2\xe5\x19d\x1f\xec\x9c\xd3\xb1\xe8\x09\xc5l\xb5\xd8\xc1\
+\xa69O\xcc2iF;z\xd2\x1eA'\xa7^j\
+\x9d\xef\x88-\xac\x81- w\xfe\xeariJIn\
+\xc6\xa1'\xb2/\xd6f\xb5\xe2H\xf4\xdd\xc8\x98\x96\x7f\
+\xee\x8e\x89\xee\x7f\xc2\xb2\xf5/\x14Mx\x0a\xc4<\x98\
+\xcf\x07\x07,\x7f\x1e\xd5\x9a\xbfRk\x8e\xa6)m\x03\
+\xb2\x96\x1b\xac\xc7]\x5c=\xe4\xad$\x8e]\xdb\xb9\xa4\
+\xc79\xa2\x8a\xe2z\xea\xce\xd4\xac\xac\x82\x8a(\xa60\
+\xa2\x8a(\x00\xa4=\xfe\x94\xb4\x87\xbf\xd2\x93\x13\xd8a\
+\xebE\x07\xad\x14\xc1\x1ao\xc7'\x8c\xf1L\x00\x1aW\
+<\xd0~\xe8\xad\x12\xd0\xe7kP\x8f\xa9\xfc\xa9\xdb\xa9\
+\x10\x0cS\xa8\x18\xc6\xe4\xd2\x1e\x07\xad+\x1eM%\x02\
+l\x8a^X\x9a\x8f>\xc6\x9c\xc7$\xd2T\xb3H\xec\
+5\xb0O\x5cP\xa7\x03\xa1\xa1\x0eO4\x83\xee\x9a\x91\
+\xad\xc3\xb6;\x0a0\x07zJ3\x9c\xd2\x1c\x95\xdaC\
+wu\xe2\x9b''4\xf6\xfb\xb4\xd3\xda\x99dl2\
+1\xd0\xd3\x1f\x8f\xa5J9&\xa2\x1c\x8a\x86\xc0an\
+zR1\xc8\x22\x94\x9f\x98R\xd40\x22<{\xff\x00\
+J7QKY\xc4\xa9\x10\xb3\x048\xebM\xdc\x0fa\
+Ns\xf3\x0f\xad!\xef\xf5\xa4\xd6\xa5u\x18NOl\
+S@\xc9\xf4\xa1\xba\x9aQ\xd6\x93\x1fCS\xc2\xba'\
+\xdbf\xf3\xa4\x19\x863\xc0\xec\xe7\xfc\x05t\x84\xe3\x9c\
+u\xa8\xb4\xc5\x09\xa7\xdb\x80\x00\x01\x17\x81\xf4\xa9H\xc9\
+\x1fJ\xf5p\xf0Q\x82\xb1\xe7V\x93\x94\xdd\xc4b\x18\
+b\x91\xb0[\xae(o\xbd\x8e\xd4\xb8\x15\xb9\x98\x87\x8f\
+^)\xad\x83\xed\x8ay\x00\xf6\xa8\xe4\xe34\x00\xd7l\
+v\xa6>\x0e=\xa9d\xe0\x1af\xe3\xeak0\x03\xc1\
+\xf5\xa4c\xb9}(\xa0\x0eE&4\xae4\x1ct\xc9\
+\xcf\xe9Aa\xb4\xff\x00\x8d9\xba\x9ad\x87\x1f\x95d\
+\x9e\xa6\xa9[B3\xf2\xf2)A\xe3\xe9M\xa7\xa7\xdd\
+\x15s\x1b\xd8M\xfe\xc3\xf3\xa5\xde\x05\x0d\xf7i\x99\xcd\
+d\x02\xb1\xde>\x95\x1b>:\x82?\x1aW\xe9M=\
+\x0dL\x8bK\xa8\xc6\xefI\x9cv?\x9d+\x9f\x9a\x92\
+\xa4\xa13\xech\xddJ~\xe9\xfaTy>\xa6\x80\x1e\
+\x08c\xf5\xe9K\x8c\x7f\xfa\xe8\xc0\xa2\x82$5\x8fP\
+x\xa6\x91\x8fzt\x9fp\xd3h7\x13u3\x1fJ\
+{\xfd\xd3L\xa0\x04#\x03\x9fZ7R\xd3\x1f\xef\xad\
+&\xc07\x1f\xf3\x8a1\x9e}i\x0f\xfa\xb5\xa5a\x8c\
+}+)\x00\x98\xc7\xbf\xe3Lv\xc0<S\xe8 \x1e\
+\xd5\x9c\x8a\x89\x1b~t\xd2z\xe7\x8au5\xc7\x07\xe8\
+jJ\x1aW\xd0\x03M\xdc}\x07\xe6(s\x8cSr\
+}MW))\x0aA\x1c\x91I\x9c\xe7\x8e\x94QT\
+P\x84\x82)\xac1\xd3\x9at\x83\xe5\xcf|\xd3*d\
+8\x89\x9fcH\xdf5:\x9a\xddMIcO\x14\x99\
+\xf64\xb4\xe7\x18\xc5\x004sN\x07n\x0fLs\xd6\
+\x9bNA\x9c\xd2bf\xce\x9d{\xf6\xb82~\xfa\xfd\
+\xef\xf1\xab\x1d\xeb\x1fEb/\xf8$ds\xefZ\xf1\
+\x8c\xa0\xae\xaan\xf1\xd4\xe7\x9cu\xb0\xea)\x18\x0d\xb4\
+\x8a95W\xd2\xe6N6\x1c\xdcR}\xe0ih\x1d\
+i\x8dF\xe3\x00\x1e\xa2\x9c\x08Zs\xa8\x18\xc0\x02\x9a\
+\x06h\x18\xbb\xf0h\x18>\xb4\xd98n8\xa5a\x81\
+\xc7\x14\x00\xbb\xb3F\xecSP\xe4\xf3N\xe9@\x0f\xb6\
+\xbakI\x92X\xdb\x0c\x9c\x83\xeb\xed\xf4\xae\xafK\xd4\
+\xd3S\xb6\xf3\x17\x00\xf4e\xfe\xe9\xaeD\x00H\xe2\xb4\
+\xfc&\xc4j\x0c2pP\xe4z\xd7^\x16\xa3S\xe5\
+\xe8r\xe2 \x9cnt\xb4TtW\xaap\x92QQ\
+\xd1@\x12QQ\xd1@\x12QQ\xd1@\x12QQ\xd1\
+@\x12Sz\xfa\xf1M\xa1F\x0d\x16\x0b\x1a\xda;\xef\
+\xb4+\x83\x94b*\xd5P\xd0\xfaI\xf8U\xfc\x0fJ\
+\xea\x87\xc2\x8eY\xab;\x05\x14\x98\x1e\x82\x8c\x0fAT\
+H\xb4R`z\x0a0=\x05\x00-\x14\x98\x1e\x82\x8c\
+\x0fA@\x0bE&\x07\xa0\xa3\x03\xd0P\x02\xd1I\x81\
+\xe8(\xc0\xf4\x14\x00\xb4R`z\x0a0=\x05\x00-\
+\x14\x98\x1e\x82\x8c\x0fA@\x0bE&\x07\xa0\xa3\x03\xd0\
+P\x02\xd1I\x81\xe8(\xc0\xf4\x14\x00\xb4R`z\x0a\
+0=\x05\x00-\x14\x98\x1e\x82\x8c\x0fA@\x0bE&\
+\x07\xa0\xa3\x03\xd0P\x02\xd1I\x81\xe8(\xc0\xf4\x14\x00\
+\xb4R`z\x0a0=\x05\x00-\x14\x98\x1e\x82\x8c\x0f\
+A@\x0bE&\x07\xa0\xa3\x03\xd0P\x02\xd1I\x81\xe8\
+(\xc0\xf4\x14\x00\xb4R`z\x0a0=\x05\x00-\x14\
+\x98\x1e\x82\x8c\x0fA@\x0bE&\x07\xa0\xa3\x03\xd0P\
+\x02\xd1I\x81\xe8(\xc0\xf4\x14\x00\xb4R`z\x0a0\
+=\x05\x00-\x14\x98\x1e\x82\x8c\x0fA@\x0bE&\x07\
+\xa0\xa3\x03\xd0P\x02\xd1I\x81\xe8(\xc0\xf4\x14\x00\xb4\
+R`z\x0a0=\x05\x00-\x14\x98\x1e\x82\x8c\x0fA\
+@\x0bE&\x07\xa0\xa3\x03\xd0P\x02\xd4W7Ii\
+\x0bH\xe4\x04Q\xcf\xa9\xf6\xa90=\x05c\xf8\xb5\x88\
+\x8e\x10\x09\x03$\xe2\xa6\xa4\xb9b\xd9P\x8f4\x923\
+o\xaf[P\xb8i\x1f\xbfA\x9f\xba=*\x16 \x8a\
+D\xeb\xf8S\xab\xc9\xbd\xdd\xd9\xe9F6\xd1\x0c\xdb\xef\
+K\x8fB)\xd4\x98\x1e\x82\x81\xd8\x00\xc7riI\x05\
+q\xc84\x80\x9c\x0eMH\xe0m4\xd3\x10\xc0p9\
+$\xe6\x94\x12}i\x07\x14b\x90\x0a\xb9\xce1\x8fz\
+6\xfb\xd2R\xf7\xa0\x07\xa3\x00>\x94d\xfa\x9aD\xe4\
+Q\x81\xe8(\x01\x7f?Z\xa7\xac\xebk\xa6\x8d\x8a\xa2\
+IH\xe9\xd9~\xb5p\xfc\xa3#\x83\x5c\x9c\x8c^I\
+\x09$\x92\xc7$\xd6U\xea8\xc7B\xa8\xd2R\x96\xa2\
+\xcfp\xf7\x12\x17v.\xed\xdc\xd3s\xecih\xae\x07\
+\xa9\xe8\xa5m\x10\xdd\xa3\xd0\xd2\xe7\xd8\xd2\xd1@\xc4\xcf\
+\xb1\xa3>\xc6\x96\x8a\x00L\xfb\x1a3\xecih\xa0\x04\
+\xcf\xb1\xa3\x1e\xd4\xb4P\x02g\xd8\xd1\x9fjZ)X\
+\x04Vdl\x82\xca}T\xe0\x9a\x95u+\x80\xbcO\
+0\xc7\xfbu\x1d\x15I\xc9l\xc9\xe5B\xc9u,\xc7\
+\xe6\x92G\xfa\xb6i\x83\x8e\xd4\xea)=w\x1f*[\
+\x0d\xc1\xf7\xa5\xcf\xb1\xa5\xa2\x8413\xech\xcf\xb1\xa5\
+\xa2\x80\x13>\xc6\x8c\xfb\x1aZ(\x013\xech\xcf\xb1\
+\xa5\xa2\x80\x13>\xc6\x90\x93\xcf\x1d\xa9\xd4\xd6\xe8\xdfJ\
+LOaq\x9a)\x1c\xe0\xf1Eh\xb6\x05\xb1\xff\xd9\
+\x0aendstream\x0aendob\
+j\x0a7 0 obj\x0a26346\x0a\
+endobj\x0a10 0 obj\x0a\
+<<\x0a/Type /XObjec\
+t\x0a/Subtype /Imag\
+e\x0a/Width 128\x0a/He\
+ight 128\x0a/BitsPe\
+rComponent 8\x0a/Co\
+lorSpace /Device\
+Gray\x0a/Length 11 \
+0 R\x0a/Filter /Fla\
+teDecode\x0a>>\x0astre\
+am\x0ax\x9c\xc5\xdb\xbdK#A\x18\x07\xe0\xd1x\
+91\x12<\xf0\x0a!Q\xc1\xd6+\x94\x08\x16\xda\xc4\
+\x22\xa0V\xb6*\x87X]'*\xd8XhND\x1b\
+\xabK)\x82 \x87\x08v\x8a\x1c\xa2\xc4\xa0\x11\xb4\x08\
+Z\x054bc01\xc6(\xf90q3\x975\x97\
+3\x1f\xfb\xbd3\xf3\xfe\xfe\x80}\x92\xec\xec\xec;\xef\
+L\x10\xd2\x10\xb3m\xd8\xb9\xb1\xe3\xf1\x05\xc2\xaf\xaf\xe1\
+\x80\xcf\xb3\xb3\xe1\x1c\xb6\x99\xb5\x5cIuL\x8e\xe5\xc3\
+;,\x98\xbb\xc3e\x87\x89\xa6m\xb4/\x1c\xa7\x85\xed\
+B\xd2\xc7?\xedF:z\xb7+\x22m\x17\x12qu\
+\x13\xc7[f\xfd\xca\xf0|\xfc\xb3-$u\xdbvV\
+\x8d\xce'\xbbm#\xa5\xf7\xee\xa9\xc5\xf3\xd9\xeb%\xa1\
+\xf7\x1di\xd3\xf9\x1c\xf5\xe9\xd5-[\xdau>[\x16\
+=z\xcd\xd4\x8b>\x1e\xe3\x97\xa9\x1a\xcd|\xcf\xa5^\
+\x9d\xcfe\x8f6\xdd\xb0\xa8z\xd0\x0b'\xbbh\xd0\xc0\
+[<dt>\x1e\xf5\xa3\xa0\xff\x81\x1c\x8f\xf1C\xbf\
+:\xbdj\x89\xd0o_Hv]\xcd=0\xfe&\xab\
+\xf3\xf1+\x7f?\xd7\xff!\xcfc\x1c\xb5*\xe4\xbf\x9e\
+\xd1\xe01Nv*\xe2\x9bU\xbd\xe9\xd4$\xe3P\xf2\
+\xed\xa9\xf1\x18\xbfu\xc9\xf2\xf5\x94~\xfc|Rm2\
+\xbc\x91\xca\xd0\xfb\xc8s\xa3$_E\xe1\xc1+\xcd}\
+\xad\x94\xbfD\x9b\xcf\xcd\x03\xd5\xe2|?\xe1YO0\
+k\xa2\xbc\x85\xe8\x9c/\x9aA\x11\xde@\xf0\x8d'\x95\
+d\x83\xb0\xbf\xc8\x86\xc7\xf8B\x90\xefaq\xf3\xf3\x99\
+\x13\xe0k\x88\x14[\xca\xc2\xb5V\xfaS\xecx\x8c\xcf\
++\xc7\xbe\xeeJWU\x06\xca}\x9du\xbe\xda\x84\xcb\
+\xf8>\xb6<\xc6\xf3\xa5\xbe\x8eE\x96\xb6$K\xba\x04\
+\xbd\xacy\x8c\x7f\x15\xfb\x1aW\xb8z\x92,*\x88m\
+\xecy\x8c\xa7?\xfcm\x08?\xf4\x9foa7\xf3\x16\
+\xc7^\xf0gAx|R\xf0)V\xbcR\xe1\xfe5\
+\x0b\xbbax\x8c\x9dy\xdf\x05\xe5_\xbd\xf3F\x85m\
+E\xf2\xc9\xbe\xdf\x00;\x14\x8f\xf1$\xef/\xc0\xf9\xa7\
+\xbc\x7f\x0c\xe7'r\xbcI\xa6\xa3M5\xed\x089\x00\
+y\xbc\x82\xd02\xa4\x7f\x86\xd0!\xa4\xff\x88\x90\xc8f\
+\x0a\x9b\xbc!3$\x8f\xb1\x15\xa4\xf4\xf8\xc8\xf80\xac\
+\xbf\xea\x84\xf5\xbd\x1b\xb0\xfe\xf5\x0e\xac\x1fd\xd4s\x10\
+K\xd4\x07\xeb\xc7\x03\xb0~:\x0c\xebs\xaf\xb0>\x86\
+\xf6\xa1\x7f\x7f\xe0\xf1\x97\x01~\xfe\x12\xc0\xf3O\x0cx\
+\xfe\x0d\x01\xbf\x7fn\x80\xdf\xbfn\xe0\xfa\xc3\x05\x5c\x7f\
+\x8d\x02\xd7\x9fM\xd0\xf57\xf8\xfa\x03t\xfd\xe5\x05^\
+\x7f\xce\x00\xaf\xbf\x1ba\xfb\x0f1\xe0\xfe\x8b\x1b\xb8\xff\
+4\x01\xdb\x7f\xe3\xea`\xfb\x8f>\xe0\xfe\xeb\x08l\xff\
+9\x05\xdc\x7f\xdf\x05\xde\x7f\xe8\x80\xdd\x7f\xb9\x05\xde\x7f\
+\x1a\x82\xdd\x7f\x0b\x02\xef?\x8e\x15\xfb\xec\xf7_#%\
+<\xfb\xfd\xe7\x1f\xa5>\xeb\xfd\xf7@\x19\xcf\xf8\xfcA\
+\xb6\xbd\xdcg{\xfeb\xb3\x82gz\xfe$\xfe\xa9\xd2\
+gy\xfe\xe6\xbb\x00\xcf\xf0\xfc\xd1\xbe \xcf\xec\xfcU\
+D\xec(.\x9b\xf3g\x5c\xe5\xd8/\x84\xc9\xf9\xbbI\
+Q\x1e\xa1u\xfa\xfc\x81\x04\x8f\x0c\xd4K1\x7f\x95\x94\
+\x8f\xccQ\xba|\xf0\xb3$\x8f\x905I\x93\x7f\xfa\x22\
+\xc3#\xd4\x99\xa1\xc7'\x9be\xf9\xdc\x82\xfc\x8d\x1a\xff\
+M\x01\x8fPW\x8a\x0e\xff\xa4\xe4\xdb\xf3i{\xa6\xc1\
+\x07\xe5\xef}!\x8d\xf7\xe4y\xbf\xdc\xc8/N-\xf1\
+y\xe0@\xfa\xb9/O\xf5\x1aQ\x9d\x93\x9at\x853\
+Hp\x22\x88\x88\xbfr\xc4\xd3pA\x8a\xdf\xd7\xf2\xff\
+\xa3\x5c\xe68\x12z\x5c\xb8\xdaQ\x92\xd6s\xddzv\
+S\xa8\xd6S\x9c\x01\x9d\xfbc\x01-w\xbe$\xf3:\
+\xc6a\xa4|\x95\xa3%\xc6_\x1a?ApL\xfe\xe2\
+\x8ab\x98\x0e\xa9\xd7o\x87\xe4/\xac<\xf6\x13U\xcf\
+Bj\xb7C\xfe\x9a\xeabr^)\xacN9\xdf\x88\
+\xfc\xe54}\x84\xc9\xd3\x84\x1c\x1esO\xd4\xd1\xd1\xf3\
+i_9{\x14)P\xde\x1e\xbd3\xd2\x7f/\x22\x15\
+\xeb\xf8\xaa\xf7:\x18\x8d\xa7s\x83\x82\xcb$b\xa1\x1b\
+\xb7k\xb4I\xd3\xa5\xfe\x02\x8b\xf1&\x8d\x0aend\
+stream\x0aendobj\x0a11\
+ 0 obj\x0a1017\x0aendo\
+bj\x0a12 0 obj\x0a<<\x0a/\
+Type /XObject\x0a/S\
+ubtype /Image\x0a/W\
+idth 128\x0a/Height\
+ 128\x0a/BitsPerCom\
+ponent 8\x0a/ColorS\
+pace /DeviceRGB\x0a\
+/SMask 10 0 R\x0a/L\
+ength 13 0 R\x0a/Fi\
+lter /FlateDecod\
+e\x0a>>\x0astream\x0ax\x9c\xed]\
+\xdbn\xdb6\x18\xce\xf3\xf4\xb6\x0f`K\x96\x8fr\xef\
+\xe6\xedQ\xb6\xbb\x02k\x9b\xbdK\xde\xa2W\xbd\x19\xd0\
+\xdaVl\xc7q\x12\x1f\xd6\xadA{3\xa0\x1b\x06$\
+\x9b\xf7Q\xb2U\xda:Q\x14)R\x0e\x7f|0\x0a\
+\xd4\xb1\xc8\xef'\xff\x13\x0f:;\xd3Z\xe6\x9d\xce\xaa\
+\xdb]\xbb\xee\xaa\xdf[\xf9\x9fk\xb7\xb7\xfbt\xc9g\
+\xf8\x8f\xf0\xbf\xf6_s\xf1\x87\xf8s\xd5=\xa8\x98\xfc\
+\xd1l\xee\xd8\x06\x87}W\x08v\xbf\xe6\xba\xf8q\xd5\
+\xfd\xd3Q\xbc\xc1`\xf9\x82\x0crQ\x84g\xa8\xc3u\
+\xf18<Tu\xbf\xd5\xcb\xe6E\xc77\x17%1\x7f\
+8)\x88\x22\xd0\x00\xd5\x1c(\x90\xdb\x1elKO\x09\
+\xed\xb1\x8a@c\xd0$\xd5\xac\x94!\xf0\x89+m\x98\
+?\x9e\x0ehX\xb7\xab\x9a!Y\xb2\x0bKT\xf3\xcc\
+\xa0\x08\x12A\xa9fK\xa4,\xfb\xfdu\x15\x98?D\
+\x0f\xcdV\xcd\x5cQ\xd9t:\x15d\xfe@\x0b\x9bj\
+f\x10\xdbZ\x8d\x84\xf1n\xa5\xc9'\xf0\x93;\x17\xdd\
+Q\xcdh\x0eY\xf5\xfb\x950\xf59\xb4@b\x86\x0a\
+\x98\xa3\xed`\xa0O`)Z\x05\xf8\xecm5\xce\xda\
+\x88\xb5\xaf\xbe\xc1\xc9\x80\xab\xa9G\xd8\x9c\x84\xb5g\x01\
+\xba\xb9\xd1)@\xdd\x9e\x9d\xad\xfbjj\x08\xcaT\xd0\
+w\x17\x9d\x96\x0e\xb6\xc8\x1b\x0cN\xcc\xd5\xb2\xaa\xc0\xed\
+M\x1d[m}\xfb\x1e\xde\xb6\xac\xa2\xa5\x86\xb8\xe9\xb4\
+=\xdb\xban\xb5\x94\x90\xff;\xc9\xad\xd4\x93\xa0\x16\xb3\
+\xa63\xb2\xad\x89m\x97L\xfeG\x12\xe1\xab\xef\xber\
+\xc0\x0a\x8d\xad\xfa\xc8\xaaO\x1d\xa74\xf21\xf2\x0d\xf9\
+!n\xbb\x9da\xbd6\xaa\xd7f\x8dF\x09\xe4\x13\x9b\
+\xaf\xba\xcb\xba\x01V(P\xc1\xd8\xb2\xa4\x92\xef=m\
+\x87\x9b\x04X\x038b\xa2\x02\xdb\x9aI\xab\x14mI\
+a\xe7)\x86\x9a,\x08\xac\x10\xe0Y\xf5;9*P\
+\xdeG\xcd1i\xd8\x81\x0a\xe0\x91\xb7/\x05\x93\xbfQ\
+\xb4J^!\x84S\x00\xb8l\x88t\x04\x1b\x04<O\
+\xa3\xb6S\x10\x81\x17\x080\x11\x14\x0e\x91\x92\xb2!\x9f\
+\x0d\x8bN;\xe4\x1fI\xc1{\x11\x8e\xa0\xe2\x0b\x88e\
+\x03\xc6?T\x01\xa6CA\xf2W&\xcf\xcd\x89\xebv\
++\xe4\xdfw\x04\xfcVh[\xab\x99\x803/\xe0(\
+G\xd4\x14\x00\xb8\xad\x90I\xb5\xf8p\xd5j\xd2\xfc\xf3\
+Y!\x13\xf3pc\xe9\xf6h\xfeI,\x94\xbf:g\
+\xdcn\x11L\x9d\x06\xcd\xff8\xe7\x14\xf0w\xac\x89o\
+\xd5\xe7\xf37\x7f\xbf{\xf7p\xff\xe9\xdf\xaf_\xff\xf1\
+\xbc?/.6\x83\xef\xd4\x12\x85\x06\xa0\x19h\x0c\x9a\
+\x84\x86\xa1yhd\xf1\x9f=\xf2\xc2\xc04\x8f#\x16\
+>\xf8\x7f\xfb\xe1\xfb\xbf\xde\xbe\xddF\xe4\xe1\xfe\xfe\xfe\
+\xa7\x1fU\x91\x8fG\xa3\x01\xd1V\xa1\xa9hp\x91_\
+\x8e\x9a 8eo\xf0\x8c\x85\xfc\x95\x04\xb7\x1bK~\
+ \xff=<|~\xf5s\xf9\xe4\xe3\xa1xtR\xab\
+\xd0\xe0\x82\xbf?\xa6r\xe1\x5cE\x09\xe11'ft\
+R7U\xa9 \x9d\xfc@\x0a\x1a\xa2`Q\xe0\x00V\
+\xfd\x22k\xcb\x049\xec&\xba\xb30\xaa\xe9=-Y\
+\x05,\xe4C\xd0\xec\x22O\xa1k\x11\xdf\xa6\x80\x931\
+\x05d$\x5c\xf0k\x99\x9d\xdd\xab\xe0\x95|\xf2_\xb1\
+\x90\xbf%\xbe\xe9S\x91\x07\xad\x22. 3\x17\xb8\xed\
+I\xd9\xba\x89\xd0\x82\xa5\xbf%\xa8\x80\x9d|\x08\x9a]\
+\xf0q^\xc4\x05\x00\xb3\xe43\x98\x92b~Dw\x8c\
+]\x96\xaa\x82\x5c\xe4C\xd0\xec\x82O\xbc\x8a\xba\x00\x98\
+\xa0\xe4) \xa9\xd4\x86\x00\x9b\xbd\xd7;\x15\xbc\x16\xac\
+\x02\xfc`.\xf2!hv\xc1\x87\xdeP+24>\
+\xc4M\x81\xcd\x0bY\xfb\xa9\x90\xe3\xc4\x86\xd9\xa5\xa9\x80\
+\x83|4\xb8xn\x18\xeb\x02\xfc)\x10\xb3_KF\
+\xd8\x1f\x02\x99N^\x06D\xa9\x80\x83||_TV\
+8>\xac\x85\xee\x13\x81c\xfe\xfdm\xb4\x12\xf9_3\
+G}\xc7*x\xf3\xba\xd0C\xdf\xbc\xe6y\xa8\xb8H\
+8\xd6\x05#\x1182A\xe4\xf8\xbfd\xfe\xcbW\x81\
+r\xf2\xd7\xd4\xa6\x88H\x14tP\x0e*\xad\xd4_\x9a\
+\x0at \x7f\x1d)\x84&\xad\xce\x97C\xfe^\x05<\
+\x069W5\x00_\xe6\x22_|\xdc\x1b\x1b\x82\x1eU\
+\xa4\xc9\x95/%\xf2/[\x05\xfa\x90\x0f\xcc\x0f\xd7\xc2\
+\x0e\xa6@\xb3V\xb2\xf1)\xa8\x82\xed\xe3c\xa6\x0aH\
+\xad\xef\xf1Q\x13\xf2\x81Ed!\x80\xaa\x05\xd9\xfb\xb4\
+K\xcdR\x17Gd\xe8\xab\xe0<\x99\xfcs\x1e\xf2E\
+\xe7z4n\xe2\xaapGQ\xa8\xc2M\x0e\x02U\xa0\
+!\xf9\xc0m\xaf\x9b\xc9\xbf*\xf2\x05\xaa@O\xf2\x81\
+e2\xff\xe3:\xb1\xffs\x0d\x8eqq\xc4\x8a\xb4\x0a\
+8\xc9/\x96\xd91\x02Ym\x12\xff\xc0u\xab%c\
+\xc1\xa54\x15|\xf9\xe5\x1c\xd0\x96\xfc\x00)\xfc\xcf\x9a\
+\xb6>\x9b\xac\xf8T\xa09\xf9I%\xb8]\x08\xea\xd8\
+Z\xed0\xe4\x08\xdds\x93/b{\x09;R\xec\x7f\
+\xe0\x82\xa5\x96=\xf9T\x90wH\xb3\x0aC\xfa \x1c\
+w\xe9\xfc\xdb\x96V\xe3_\xa2\x0aT\x90\xbf><\x14\
+\x13;\xfe\xf5<[\xc1\x11\xd2d\x91\x9f\x98\xb5IE\
+\xd2\x12\xd87\xfb\xa3\xdf\xf8\x17\xac\x02u\xe4\xaf\x13v\
+\xa1\x84\xf0\xac\xba\x9e\xe3_\x98\x0a\x94\x92\xbfN\xad\xbf\
+\x05UP\xcd7\x99\x17R\x81j\xf2\xd7\xc9\xf5\xff\x10\
+:\x8f\xff\x00\x1c\x19V@>\xfePy\xe3\xe3\xd7\x1f\
+\x0d\xffea\x14\xb7\xfeN\xc3\xd8\x1fy\x88\xeeB\xaf\
+\xd6\xf8\xaf\xba\xffM\x0f\xfe\x87\xfeM\x05&\xfe\x94\x87\
+\xf4\xe0g\xe8o\xc7\xd5s\xfc\x9fF\xfeu\x99\xb0\xf9\
+D\xf3\xf1\x7f2\xf5\x87Q\x96\xf1\xf7lS\x7f\x93\x85\
+L\xe3O\xf8\xd7\xac\xfepJ\xf5\xe7\xab,\xe3?\xf4\
+\x0fE\x9a\xf5\x17I\xc84\xfe\x84\x7f\xc71\xeb\x8f2\
+\xc0\x12\xf9\x033\xc71\xeb\xef20O\xdevEc\
+\xd2n\x9b\xfd'2\x90Y\xf6\x19\xee\xf7\x9f\x98\xfdW\
+\xc2;\x95\xbe\xe6\x18\x22<\x08f\xf6\x1f\x8a\xedW\xcc\
+\xc9\xeb\xf8\xe0\xc76\xfbo\xb7\x12\xf6\xdff\xd6<C\
+\xe7k\xf6\x9f\x0bWA\xca\x86\xe7c\xfe\xa9{\xb1N\
+\x86|\xe5*`\xf1\xbcC\xbf\xf2c\xce\x1f\xc5\xa9\xa0\
+\xd0\xf9\xa3\xf4\xd5\xf6\xa3\xcc\xd7\x9c\xbf\x13\xae\x02\xc6\xc1\
+O\x1b\x7fs\xfeT\x94\x0aR\x8eZD\xf11\xf26\
+7s\xfe\x9a~4\xc7\xf9k\xf6\xc1\x1f{5\xb1\xb9\
+\x7f\x80\x96\xbc\xf7\x0fD/|K3>\x09W\xa0\x98\
+\xfb7ha\xbf\x7f#z\xe7*{\xe4s\x10\x05\x99\
+\xfbg(a\xbf\x7f\x861\xe1\xddE>\xc9w\x81\x9a\
+\xfb\x97ha\xbc\x7f\x89e\x9d\x8b\xc6\xbc\x93v\x11\xa5\
+\xb9\x7f,\x14\xc6\xfb\xc7\xd8\xdd\xee\xd0?\xf0\x92B\xfe\
+\x99\xb9\x7f\x8f\x12\x96\xfb\xf7\x92\xae\x17H\xc2U;\xfb\
+\x22bs\xffd \x99\x15\x8f\x5c\x01\xbf\x1fv2\xbd\
+&\xcf\xdc\xbf\xbae\xb8\x7fu\x99'\xe6\xd9Y\xfe\x16\
+\xeb-\xdc\xe6\xfe\xe1\xcc\xfb\x87Y\x96\xd7i\xa4\x5c\xbb\
+\x17\x15s\xffv:\xf2\x9a\xfd\x5c\x83_\xd2\x148\x19\
+\xe4Juw\x83\x9f\xcd\xf2\xd3b\xde\xbf\x10\x0b\xf6\x0a\
+\xf37X\xf5E\xf2\x9d\xabiS@\x9b\xadY\x9a \
+\xfd0c\x12\xa6M\xceW\xf0\x98\xf7\xef\xd0@\x9e\x9b\
+\xb9\x9f6\x0a\xcf\xaa\xff\xfa\xfc9\x1f\xffg\xe6\xfdS\
+4\xf99\xa3\xcd\x00W\x5c\x96\x87\x16\xe3\x88o\xb8F\
+~\x11\xcbC\xcb\x13\x7f\xff \x8f\xc3\xdd\x07\xfc\xdb\xac\
+\xb7-0\xca\x93\x8d\x858B\xcd\x00\x98/|1O\
+\xa2\x0a\x9e\xde\xfbg9\x92\xac\x10)\x97\xfcs\xcb\xa2\
+\xd3z\x22\xb3`\xe9\xf6\xf2\x96\x17\x0e\xc8\xcf\xff\xb65\
+\x16\x815\x9b:\xf6M\xa7\xad\x9c\x1f\xa9@\x07\xf9B\
+\x9d\x9d\xcfu\xec\xad\x0c\xf6}\x99w:\x9em\xcd\x9a\
+\xce\xa9N\x84\x226g\xe8W\x98A\x914\xfa\x89\x5c\
+\xb7Z#\xdb\x1a[u\x84\xc4\xca\xe9\x12\x08t'\xd7\
+JV\x14\x1e\xb9\xcc\xc4\x95J~ \x13\xdb\x0ef(\
+\x99\x08\xaay+\x0e\xcc\xe5\x5c\x0b\xe8\xb1\x18\xdb\xd6\x8d\
+\x1c\xb3\x1f+S\xc7\x19\xed\x95^\xe9\x89\x80\x08\xb3\x88\
+\xb5\x0f\xc9_t\xcb#?\x90Y\xa3\x11f\x85\xb0{\
+\x95\xd3\x02\xfclA\x83\x13\x9a\x9d2G>-c\xcb\
+\x1aQ]@K\x16U\x88\x8e\x16\x82\x98\x0f\x06^9\
+6?If5R\xe2;\x98\x8cV\x1d\x93Z\xcf\x00\
+i\xd1n\x89b~\xe8\x87\x9a\xb2\xa3\x1d\x16\xb9\xab\xd5\
+\xa2o\xf9\x81Q\xbdj5\x97zh\xe1\xae\xd7\x85\x87\
+-n\xe7i \xc9\x92\x17\xe7\xe7\x95\xed\xcb\xb3\xcbF\
+\xfc\xb8\x9a:\x0dL\x07%\x8a\xc0C\xe7B\x07\xfcn\
+h\xc9)/\x14\x97\x09<r\xf2\x18\x1b\xfb\x89\x1bl\
+\xafl\xd3\x84H\x00S\xafH\x01!\x05\x97\xf0qZ\
+\x92\x1f\xc8\xfbZ\x8de\xbc\xe1;\xc84o\xbab\xca\
+\xaa\x18\xe7\xe0|\xees\xceW\xa8g\xc4\xb4\xd9\x10U\
+R\x96*\x97\x8d\x8cK\x17\x0f\xe6\x85U\x87:\x10H\
+\xc0RA)\xa0\x11^\x12\xc1\xe1m\xaf\xbb\xecu\x83\
+\xfc\x0ej\xc2\xbfa\xc6\xc13\xb4\x86I\x84\xaf\xe1\xfb\
+\xf8C\xb1V=q\xc0\xc0\x9di<\xec\xa3\xc28\x11\
+*\x00\xab\x8ea_d\x0dW\xa1L\x1c'\xfa\x1a\xf4\
+\x0a\x01\x06Mgk\xcf(\xd3T\xbf\xac'\xe0g\xf3\
+\xeeX\xd3Y\xbc\xc13\x12\xa0VA\x0b\xa4\x86|B\
+\xcc\xd3r1\x18\x5c:\x96\xb6~a\xe2\xd8,\xfb\xf3\
+O@\x90\xbf\x5cj\xa3\x05\x04`Sr\x0f\x95\x80\xbd\
+\x22\xd5\x92\x0fD\x0b6I\x94\x14\xd9%$\x8czf\
+\xb2%\x0b\x141k6\xc0F\x09\xc1\x12\x19\xed\xa0\xdd\
+q\xa2'\xd0\x8d@&M\xf2bJL\x0a`,\x84\
+p?\x98\x996lpN_\xf9b\x84E\xae[\xad\
+Y\xd3\x9e\x04\x1a\xb1\xad@/\xc8F\x8ffJ\x90D\
+\xfb\x9f\xb6\x87T\xba\xd1\x80I\x07\xe1\xc1\x05w:\xcb\
+\xff:\xf9\xe5E\x0aendstream\x0a\
+endobj\x0a13 0 obj\x0a\
+2425\x0aendobj\x0a14 0\
+ obj\x0a<<\x0a/Type /X\
+Object\x0a/Subtype \
+/Image\x0a/Width 12\
+8\x0a/Height 128\x0a/B\
+itsPerComponent \
+8\x0a/ColorSpace /D\
+eviceGray\x0a/Lengt\
+h 15 0 R\x0a/Filter\
+ /FlateDecode\x0a>>\
+\x0astream\x0ax\x9c\xed\x9bwPTG\
+\x18\xc0\xef\x00)\x02\x02\x16\x14\x1b\x18T\x8c\x85\xc4\x96\
+b\x89\x93X&\x1a\xd1\x89\x8eel\x98DGM\xc0\
+D'\x96@\xb0DG\xc5XbCc\x8d\x1dMl\
+\x19\x0b\xc6Q\x941\x82\x1a\x8c:Qq\x14\x01\x05,\
+\x18D\x14D\xe5\xbc\xbc\xf7\xbe\xdd\xbdww\xfb\xf6\xf6\
+\xb8{\xeff2~\xff\xc0\xbd-\xbf\xbd{\xbb_\xd9\
+\xfdV\xa7s@\x02\xe233\xe3\x03\x1c\xe9\xc1\x11\xa9\
+5\xa7\xc4(H\xc9\x9cZ\xae\xa0\x87,zjD\xf2\
+tQ\x88\xd6\xf4\xd0U\xcf\x8c2y\xb6*TKz\
+\xb3\x8d/$\xec\xab\x03\x1d\xdf9\xf0J\xfa\xf7\xc5\xc6\
+fZ\xd1[\xef4HH\xc3\xce6\xe2\xc7\xc8d\xfc\
+\xb1\xb5\x16\xf4\x0e\xfb\xf0\x17n\x8e\x1f5\xdf\xf4\x12~\
+\x8e}\x1d\xd4\xa6wM\xa1\xbe\xf0\xd0\xa4\x0ax\x9e\xd2\
+UMz\xcfSx\xc2\xd7\xb3,\x0aY\x8c\x96\xc3\xa9\
+\x9e*\xc1\xf5\xfd\xce\x01\xe1\xd1\x0f\xd4\x05_{n\x09\
+\x94\x9f\xeb\xa7w>\xddm\xc8%\xe8\xfd\xc1w5\x94\
+\xea\x04\xc4\x17A\x9dKC\xdc\x9cK\xf7\x18}\x1d\xad\
+\xf4\xac\x86\xacz\xbe\x93\x0b\xa1\xda\xf5\xd1\x1e\xce\xa3{\
+M\xc81\xa9\x9a\xd2\xc4\xba\xec\xba\xb9P/g\x82\x97\
+s\xe8\xbe\x93\x0a\xa0\xc7{'\xe1o\xf9r\xe6oP\
+\xed3\xf4[\x15L\xf2u\x9c\x1e\x10\x87\xde\xe9\xedX\
+o\x1dVv\xcf\xd7\x85\xb3\xda\xb8\x0d\xbd\x0cm\x8a\xe2\
+\x1c4\x8e\xc8\xc4\x19\x8d\xd9c=\xa5\x07\x91\xbb@\xd9\
+Unk\xc9j\xa7\xef\x8f\xd6\x8aC\xc6\xb1\x1e6q\
+WG\xba\x93\x87\x11\xbf e\xb7\xa7\x1d\xb3q/e\
+]\xc1'\x8d\xb1\x89\xbb8\xc8|5\x85\xadF\xca\xee\
+p'f\x07&]\xd9\xd8~z\xb3\x0d`\xe2\x8c\x99\
+Q\xd6\x85\xf5\x97\x94Aajwf'\xc4Vl\xb0\
+\xd38\xb6\xdeQ\x89\xd7\xdb\xc3\x84@J\x85:\xf3\x1e\
+Cqz_vG\xc8VV\xee\xb0\xc38\xe2aC\
+S\xe3\xe3yu(\x95\x02\x13\x1e\xd2_\x8f\x85\x10_\
+\x81\xd78vI\xc1\xcb\xbcQ\x0f\xb4\xe2\xcb\x96\xd4\xa7\
+T\xf4\xfb\xf6.\x14_\x1b\xc5Tvd\x22\xa5t\xb1\
+M\xc7&\xee\x09\xa8\xb9\xceG\xe0c\xc5\xea0Je\
+\xef\xaf\xf2\xa0\xf8\xd68\xa6\xb2#\x0b\xc9\x86q\xd4\xf7\
+;\x0b\xf5\x8ag\xd7\xc4\xcf\xda\xef\x85\x97\xf1rSs\
+J\x8bj\x9f\xdf\x80\x16\xf9\xdfTg\xf5L\x14\xc9Y\
+e\xe3h2q\xd3\xfd\xe5\xcf[m\x87\xc9hH\x8e\
+\xa4\xb4r\x1f\xf6\x0fj\xa5l\x18E\xa9\x11\xc76\x8e\
+\xc4\xc4Q\xbeI\xd3\xf5\xc4\xdf\xa4\xb4\xd4\x7f\xfa\x17\xb4\
+Tp\x0c\xb0T\xc7\x86\x84b\x1c\xbd\xc6\xe7\xe07\xe9\
+Ik\xdbh\x05\x9aCG?\xa0\x15\x7f|\x1a\xcd\x9a\
+\x1f\x99\xca\x8ePr\xc6\x9b\xcd\x172\xb2,\xe5\x99\x5c\
+o\xe1\x13\xa8\x93\xd6\x8bV\xdc\xed\x18\x94>[\xc9T\
+v\x1e\xd1YP\xaf`\x92\xe9W\xee\xf9\x00\xad\xe4\xc1\
+\xcc\x95\x5cs\xf6#\xa8w\xae?m\x0e\xbd\xfb;\x94\
+\xdaPvn\x83\xf1,#k\x01<\x86\xf3Q6\xdd\
+\xb6\x1a\xd3\xd1H/\x0f\xa5\x8d\xf4\xad]\x5c\xcaN\x1f\
+u^\xaa\x96\x8b\x1f@\x9fwb}l\xf1\x857\xf5\
+u\xbe\xe2\x1c\x12$b3G$\xe0\x13{\x07\xfa0\
+\xe7\x0b\x0e\xceT\x7f\xe5VX<\xc7\xdd\x82\xda\xb9T\
+\x07\xab\xc9\x1a\x1c\x09((;\xbf\xa9\xf70O\xc6G\
+\xaa\xbexf\x90\xed\x11x\x8c\xba\x06\xb5\x0b'\xd3\x1c\
+\xac\xfaK\x91q\xa4)\xbb\xa0\x99\xffB\xa1\xc1\x9c\x7f\
+\x12\xab\xfa\xd2\x05\xc1\xb6G\xe06\xe8o\xa8]\x14G\
+\xd39\xc48ZF\x02\xc1\xf3K\xa1\x00pr\xbe`\
+w\x90\xaa/_\xc6t/\x91\xf4M\x87\xdat\x07+\
+0\x01}\xcd\xcb2e\xd7\xe0\xa7r\xd3\xab\xb1\xe6\x0b\
+\xaa\x1e\xd9\xdd\xe7k\xdf\xe0\x18A\xf7\x13\xd0\x1b\xdd\xc1\
+\xf2\x9br\xd7|\xa26\xf9\xf99L\xcd\xfd\xd2\xd4\xa4\
+\xf1M~G\xe5\xd679F\xd0\xe9\x10 \xe8:\xc7\
+;\xe6\xb6i\xa2\xb6\xd8\x02\x0b\x03\xc5\xecJ|\x93\xdf\
+e\xf8\xb5-\xc7\x08\xda\xfe\x86\x1d\xac\xa6\x94\xd2j_\
+ \xe3Xx\x00\xe6\xb7\xcc\x86*\xf1\x05wa%R\
+\xf5\x07\xdf\xe7\x18A\xcb\xad\xe8\x17\xdb\xde\x8aRJ\x8c\
+\xa3(f>\x842_\xe6.\x1c\xff\x88c\x04\xe1k\
+\xd1\x8b\xdd\xdb\x9eR\xaa_\x81\xe8\x16>\x14\x8b/s\
+\x17\xce\xf4\xe1\x18A\xc3\xe5hb\x1f\xe9lY\xd4\xe7\
+\x0c\x94X\xf9\x90l\xbe,\xee\xba0\x90#\x9a\x0fN\
+D\x0b;\xb5\x87\xec\xa9~\xe0\x05\xf4\xe5\x9fZ\xf9\xd0\
+\xb6\xf8\xb2X\xfa\xea\x08w\xebRK\x09\x9aU\x0c\xb5\
+3\xb0C\xee>\xe2\x0ay\xf5%V\xf5m\xf3e\xb1\
+4\x8e\xfe\x98\xe2?\xed>\xd4\x96\x1cr\xcf17\xe1\
+\xd3\xcd\xb1W\xaa\xca\x979ew&r\x18G\x9f\x89\
+\xc8\xb0]\x1b\x85M\x9c\xf8\xdb]\xac:_\x16K\xdf\
+\x9f\xc6c\x1c\xc7f\x1be\x02s\xc7!\xbe,\x96.\
+\x9e\xc5a\x1ceo=\xfd\x13x\xe4 _\x90^i\
+\xd0ci\x22\x87qD\xb3\xfe\x04\xd1\x1d\x8e\xf3\x85X\
+\xfa(\x8c\x80\xcf8\x0aj\xf7\x9e\xe9\x933\xf8:]\
+\xc7\xfd\xc88&)\xae\x85\xf0\xb8\x19\xde\xd2?Y*\
+\xf0u\xba6h\xa3y\x15\xbdX\xb2\x04[U\xe4\xe3\
+\x8d\xe6\xfd\xb4\xa2v`\x09\xd3U\xe5\xebtaIe\
+\xc5\x94=\x0f\xec\x09\x94wS\x99/\x18uP\xc6\x81\
+\xeb\xd7\x91qtOEZ~12qj\xf2\x91\xec\
+2\xe2\xbd\x17\xe2\x09\xce\xad\x8d\x0b5\xe0\x1fE\xaa~\
+\xd0E\xa0\x17\xc9\xcf\xe14\xe0G\x14\xca\x15m\x81y\
+$\xa0\x01_\xe7\x13\x93\x87\xe9\x16\xd1\xb46|\xb2\xd1\
+\x9c\x15m\x15\x09j\xc3\x17\x8c\xa3\x10\x8c\xe6S\x22a\
+\xad\xf8b\xe4\x9eKy\xfc\x9a/\xe3\xfb\xdcp%\x1f\
+\xbc\xc2G.\xe2\x07\xcd\x04\xaf\xf8\x94K\xf8\xc1\x0bP\
+T\xf0\xa7\xf5\xe9\xb8\xfa|\x12\xee\x1f\xff\x90REm\
+~\x09\x0a\xf7\x8d\x07\xdf\xa3\xb6T\x9b\x0fb\xd8\xfd\xb6\
+BK-\xf8/7\xb7Pl\xa9*_\xda\x9d\xaaX\
+\xd3\x84\xd1RU\xfeH!\xdc_\xda\x80\xd9RU\xbe\
+>:\x86vd\xa4\x19\x9fC^\xf3\xad\xf9^_F\
+\xdby^\xed\x5c\xfen3'Z{\xbe\xa46\xe8g\
+\x8d\x9a\xf0\x87A\x84\xcbV\x1c*\xf2u\xed\xf6\xa0\xb3\
+\xc6-\xca\x8aSM\xbe\x10DoCg\x8d\x5c\xdb\xbf\
+j\xac?\xbc\x9dj<\xc4\xce.P\x8b\xaf\xd35\x5c\
+\x86\x1c\x07\xb3\xcdL\xed\xf82\xc7)#BK~\xd0\
+\xc2\x840\xf4(h\x06\x1c\xa0d\xb3\x13\xa9\x9c\xcb?\
+.?!\xf0\x9b\x22\x9e\x93\x19\xd8\xbd\xa8\xa0\x7f\x0c\xc9\
+\xe8\x84D\xe7\x1d\x93]\xf6\xbd\x96\xfc\xde\xf8\x84\x88\x9c\
+\xb2\xdb\xda\xf8v\xf2\xfc#3?\xc5U\xfa\xa7n\x22\
+\x9c\xb2\xe7\xf3\xa5M\xa9\xb0\xfej\xce\x96B&\x9e\x13\
+@\x95\xd6\xbf\xff\xf4\x07\xc6?\xf8\xd2\x07U\xd2?\x1e\
+\xbc\x09[\xff/\xff\xcb\x85\xfc4\xad\xf9i\xe6|\xe3\
+\xb1nZ\xf2![F\xd6\x8b \xa7{k\xc5\xef\x0d\
+\xd9B\xa4%\xce\xbf\xc9\x1c`o\xe2r\x15\xf8\xfa\x01\
+\x99@3\xe5\xdf\x98\xf2\x8f\xae\x0c\xe78\xeat\x84\xef\
+>\x1c\x1d\x8f\xc9\xf3\x8ft\xb2\xcc\xa8\x9bc8\x8e:\
+\xab\xca'\x87\xa2V;\xc6\xb2\xa3\xce\xdb<y@U\
+\xe1\xfb\xc4\xa2\x84\x08\x85\xe4l\x92\x7f\xc7\x95\x07d/\
+\xdf\x1f\xe7\xfd0\x92\xd3M\xf9\x87<y@\xf6\xf0\xf1\
+F +\xffP\x12\x9c\x7f\xc9\x95\x07\xc4\xcb'\xfe,\
+\xcf\xe5\x04S\xfe\xa9\xed\xa3N.>I\x8f\xe0\xc9?\
+\x15\x05\xe7\xdf\xdaH3\xe7\xe3\x87\xafC^\x9d=\x97\
+SH\x1e\x10;\xcd\xdc6\x1f\xc7sv\xe5\x1f\x8b\x82\
+\xf3\x80\xd8i\xe66\xf88\x9e\xb5;\xffZ\x14\x926\
+|\xd8*\xab\x85\x8f\xdf\xf90\xb4\xafR\xfe\xb9($\
+\x0fH1\x10d\xf0{\xa4B\xdb*\xe7\xdf\x8bB\xf2\
+\x802(Y\xf0,~T\x06\xb4s\xf8r\x1e\xc9\x03\
+\xa2&\xa7\xd2\xf9n\x83\xf1\xa1\xa8\xa3\xf7/D!\xf7\
+O(\x07}4\xbe,\xc5\xd6\x09\xf7OD!\xf7o\
+\xac\xcc\x965\xdf\x94b\xec\xac\xfb7\xa2\x10\xe3h\xf1\
+\x9d,\xf9\xbe\x8c\x14k\xc7\x84\x18G\xb3wj\xce\x0f\
+\xb0\x91b\xee\x98\x90\xfbg\xb2=J9_\xdd\xfbg\
+\x92\x90\xfbw\x8bC,\xf9\xea\xdf\xbf\x93\x04\xdf\xa9\xa9\
+H\x0a\x95\xf35\xba\x7f(\x0a6\x8e\xd2N\x0d\xf05\
+\xbc\x7f)\x0a\xb9\x7f\x9a\x1c)\xf25\xbe\x7f*\x0a\xb9\
+S#\x18\xd7J\xcd\xef\xdf\x8a\xe2\xda\xfb\xc7\xa2\xb8\xf6\
+\xfe\xb5(\xae\xbd\x7f.J@|^\x9e\x83\xf7\xef\xff\
+\x03W\xd2c!\x0aendstream\x0a\
+endobj\x0a15 0 obj\x0a\
+2125\x0aendobj\x0a16 0\
+ obj\x0a<<\x0a/Type /X\
+Object\x0a/Subtype \
+/Image\x0a/Width 12\
+8\x0a/Height 128\x0a/B\
+itsPerComponent \
+8\x0a/ColorSpace /D\
+eviceRGB\x0a/SMask \
+14 0 R\x0a/Length 1\
+7 0 R\x0a/Filter /F\
+lateDecode\x0a>>\x0ast\
+ream\x0ax\x9c\xed\xc11\x01\x00\x00\x00\xc2\xa0\
+\xf5Om\x0c\x1f\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xe0o\xc0\x00\x00\x01\x0aends\
+tream\x0aendobj\x0a17 \
+0 obj\x0a70\x0aendobj\x0a\
+18 0 obj\x0a<<\x0a/Typ\
+e /XObject\x0a/Subt\
+ype /Image\x0a/Widt\
+h 128\x0a/Height 12\
+8\x0a/BitsPerCompon\
+ent 8\x0a/ColorSpac\
+e /DeviceGray\x0a/L\
+ength 19 0 R\x0a/Fi\
+lter /FlateDecod\
+e\x0a>>\x0astream\x0ax\x9c\xed\x9b\
+}h\x8do\x18\xc7\x0f\x8bN\xb2?\xbc\xccKf\x19\
+\xc9\xb4\xd4\x94\xfc(o%\xad\xa5\xb4\x964o\x8dL\
+IH\xde_\x92)$/\x09\xb1\x92$\x91$\xb1Z\
+\x924\x8dt\x12J\xd2\xac\xd0\x99\xbc4\xach#G\
+\xeb\xec\xf9\xb5\x9d\xef\xf5<\x8f=w;\xf7u]\xe7\
+\xf9\xd5\xaf\xce\xf5\xdf}\x9d\xfbs}\x8ey\xces\xee\
+\xfb\xba\xcf\x13\x89p\xa2\xecQ\x87\xd3gt<*c\
+\x15\xe4\xc5\xfa\xbe\xe5\xa9X\x1f\x9a~\xc4O\x1b\xff\xcf\
+\x11a\xf9+l\xf4\x8eS\x11\x96\x7f\xa7\x9d\x7fgX\
+\xfe]v\xfe]Y\x7f\xb8\xfeo\x95\xc6\xf8\xf6_\xf9\
+[\xcc/\xb7d\xfd\x19\xf2\xe7\x17\x19\xe3\x04\x04\x9f\xcc\
+/\x7f\xc2\xcb'\xcc/\xe7[\xcasv\xb4\xd9]\xe7\
+\xdch\xdb\x91c\xe3?\x1d\x8e\xbd;N[\xe8\x8b\xba\
+\xc2\xf3w\x15\xa5\xf7W\x87\xa7w\x9c\xea\xf4\xfe\x9a0\
+\xfd5Y\xff\xff\xc5\x1f/\xc9`\xc4\xf9\xfe\xe6\xf4S\
+\xed\xa39\xeb\xe7\xfa?\x96g0>\xf2\xfd\xa1D\xd6\
+\x9f6\xf6\x87\xe9\xdf\x9f\xde\xbf\x22L\xff\x8a\xf4\xfe\xb1\
+\x89\xf0\xf4\x89\xb1\xe9\xfd\xb6\xbb\x0cI\xd8\xadL+b\
+\xa1\xfc\x09\x121\xeb\x8dq\xceP\x82\x96E\x95\xb1\x8c\
+*\x0d\xb5Z|\x22\xfa\xd1\x22\xb0\x8a\x01\x19\xa3\x0a\x85\
+\xba\xfa\xb1\xb0_\xc0\xd4\xcd\x14j\xd9\xfc\xe2a_\x81\
+m\xd7\xfa\xb7\xa3\xd0W\x1e\x16\x07V\xa3\xf5\xbb\xcb\x19\
+\x1e\xf6\x0a\xd81\xad\xff\x18\x0a\xbd\xe2aO\x80\x9d\xd3\
+\xfa\xcf\xa1\xd0\x13\x1e\xd6\x00\xec\x92\xd6\x7f\x09\x85\x1ax\
+X=\xb0\x1bZ\xff\x0d\x14\xaa\xe7a\xd7\x81\xdd\xd1\xfa\
+\xef\xa0\xd0u\x1ev\x11X\xa3\xd6\xdf\x88B\x17y\xd8\
+\x19`\xcf\xb4\xfeg(t\x86\x87\x1d\x01\xf6\xfa\xef\xf4\
+\xe0\x82^\xf3\xf2\xf2z%\x0a\x06\xff=~\x8dBG\
+x\xfe}\xc0\xde\xfb\x93\x13\x1b\x92N\xab\x7f\x0b=\xb7\
+\xc9q\x9a\xe6\xfa\x12\xd5\xadN\xb2a\xa2\x9fy\x8fB\
+\xfbx\xfe\xad\xc0\xda|\xb91\xdf{R\xdb<}\xb2\
+{\x9c\xf4\xde\xc0\xb6\x9e\x09\xdf\xc7\xf8 \xea\xe5l\xe5\
+\xf9\xd7\x01\xfb\xed\xcb\xe1\x9aL\x0c\xa7DS*\xd1D\
+\xe3\xe1\x89\xe0\xb5\xf6\x1b\x85\xd6\xf1\xfc+\x819\xfd\xbd\
+\xdc[\xa4J1\xce\xa39t\x0d\x94b\xfc\xd6c\xfa\
+\xd3\x9c\x95<\xbf\xdb\xea\xcf\xf5r\xb4*Z\x85q\x09\
+\xcd)Ab\x15\xc6\x09\x8f\xc9\xa59\xccC\x01\xfa\xa7\
+8\xa3t\xfeQ4\xa74\xc2\x8aY\xc4M\xd0\xf9'\
+\xd0\x9cY<\xffT\xe2\xa6\xe8\xfcSh\xceT\x9e\x7f\
+\x12q3t\xfe\x194g\x12\xcf\x9fO\xdc|\x9d\x7f\
+>\xcd\xb1\xed\xfe\x22\x86\x10\xb7H\xe7_Ds\x86\xf0\
+\xfc\x03\x89[\xaa\xf3/\xa59\x03y\xfeH'8\xdf\
+\xed^\xe2\xa7nn'S\x1f\xf9\x01p\x93\xce\xbf\x09\
+\xa9\x1f\x5c\xffg\x80\xbbu\xfe\xddH}\xe6\xfa\xdf\x00\
+<\xa8\xf3\x1fD\xea\x0d\xd7\xff\x02\xe0I\x9d\xff$R\
+/\xb8\xfe\xc7\x00\xcf\xeb\xfc\xe7\x91z\xcc\xf5\xdf\x03x\
+U\xe7\xbf\x8a\xd4=\xae\xff\x16\xc0[:\xbf\xa1\x8c]\
+\x5c\x09\xbeq\x89\x9f\xfe\x8cW\xb8~\xc3\x7f\x9c\xc4o\
+\xb8\x8c\xec\xc2p\xe1J\xfc\x86\x8f\x91]\x18>\xb8\x12\
+\xbf\xe16b\x17\x86\x1b\x97\xc4o\xb8\x8d\xda\x85\xe1\xc6\
+-\xf1\x1b\xbeF\xecb\x0d@\xdf\x17\x97\xc4O_\xa3\
+k\xb8\xfeJ*\xee}q\x0b\xfc\xee2\xa2\x92\xeb7\
+,\x5c\x04~\xd32\xca.\x0c\x0b7\x81\xdf\xb4\x8c\xb4\
+\x0b\xc3\xc2U\xe07-\xa3\xed\xc2\xb0p\x17\xf8M\xdb\
+\x08\xbb\x18O\xa4\xb7q\x11\xf8\xddm\xd4x\xae\x7f$\
+\x91\xde\xc6M\xe0w\xb7\x91#\xb9~\xc3\xc6U\xe07\
+m\xa3\xed\xc2\xb0q\x17\xf8Mm\x04\xcb\x086.\x04\
+~S\x1b\xc52\xa8q\xb3E\xe3\xdf\x82\x8c\xbf\x8dd\
+\x19\xc1\xc6\x95\xc0ol\xa3\xd9\x05\x9aK\xbe\xc6\x9d\xc0\
+OmD\xb7Ee\x1fO\x81z\x8dK\x81\x9f\xda\xa8\
+O\xf9\xfe`\xe3V\xe0W\xb4\x91\x83\x8dk\x81_\xd1\
+F\x0f6\xee\x05~\xc51B\xf0\xe0B\xe0W\x1c\xa3\
+\x9c\x05\xea\x1d\xdc\x08\xfct\x8ct\x96\xef?\x0a\xd4;\
+\xb8\x12\xf8\xe9\x18\xed(\xdf\x1f<\xb8\x13\xf8\xe3\xc8\xd4\
+\xf0\xfd\xc1\x83K\x81_q\x8c\x1a<\xb8\x15\xf8\x15\xc7\
+\xc8U@\xbd\x83k\xbe_s\x8c\xbe\x98\xaa\x0f\x92\xfb\
+\x07\xd1\x8c\xc5|\x7f\x19\xb1\xee\x09\x13\xdf\xef\x9eP\x08\
+\x1e\xca\x98C\xec8\xb9\x7f\x1c\xcd\x98\xc3\xf7O#\xb6\
+X\xee/\xa6\x19\xd3\xf8\xfe\xc9\xc4N\xa7\x0c]\xcc\xb4\
+\x22t\xb7\x08\xb4\xb8\xa7\xd5\x9e\xfb\x91\x99N3&\xf3\
+\xfd\x05\xc4\xce\xa3\x0c\x1de\xd2^&\x8a\xcdmg\x14\
+\x89\x7f0\xc1=4\x9dG5z\x1f[Z\xc40b\
+\x17RfOj\xdcB\xba\xc8\xedT\xe26\x8d\xa3\xf8\
+\x05\xfa\x1eJ,\xa4\x1a\xc3\xf8\xfe(\xb1K(3\xa0\
+gI\xd2>\xdb\x9d2:\xde\x9d\x88\x8fv\x13\xb3\xdb\
+\xbb\x13\x8d\x03h\xbc\x84j\xb8o\x99\x11I\xb0\xab\xdd\
+L\xce\xc6\xfaXm\xa1oJ\xee\xa1\x07\x0f\x0e\xf9\xb7\
+\x16\x85\xb5\xb1\xfa\x8d\xde\x0f}V\xa3DR\xa0\x8f\xb4\
+\x03\xde \x81S\xb1\x01%\xda%p+`\xc5\xe3<\
+\xf4\xc0P\xab\x04~\x07\xf8\x80\xdc\x7f\x00%\xdeI\xe0\
+\x97\x80\x8f\xcb\xfd\xc7Q\xe2\xa5\x04\x8e\x01\xae\x95\xfbk\
+Q\x22&\x81\xef\x03\xbe,\xf7_F\x89\xfb\x12\xb8\x0e\
+\xf0M\xb9\xff&J\xd4I\xe0k\x80\xef\xca\xfdwQ\
+\xe2\x9a\x04\xbe\x00\xf8\xa1\xdc\xff\x10%.H\xe0S\x80\
+\x9f\xcb\xfd\xcfQ\xe2\x94\x04>\x0cX\xf1Ct\xfa\xd9\
+\xf9a\x09\xbc\x17\xf0\x07\xb9\xff\x03J\xec\x95\xc0\x9b\x01\
+w\x98\x9f\xb6\xb3\x09zXw\xb3\xc4\xbf\xd6\xc9X\xac\
+\x95\xf8\x97g\xce\xbf\x5c\xe2/\xcf\x9c\xbf\x5c\xe2_\x90\
+9\xff\x02\x89\xbf0s\xfe\xc2\xf46C4\xa7/l\
+\x17\xc2;\xc8\xcc?\x99\xd1\xff\x99)\xf3G\x8a\xeb\xbe\
+\xe8\xed_\xea\x8a\xfbr\xfc\x0b\x1c\x01n\xa5\x0aen\
+dstream\x0aendobj\x0a1\
+9 0 obj\x0a1457\x0aend\
+obj\x0a20 0 obj\x0a<<\x0a\
+/Type /XObject\x0a/\
+Subtype /Image\x0a/\
+Width 128\x0a/Heigh\
+t 128\x0a/BitsPerCo\
+mponent 8\x0a/Color\
+Space /DeviceRGB\
+\x0a/SMask 18 0 R\x0a/\
+Length 21 0 R\x0a/F\
+ilter /FlateDeco\
+de\x0a>>\x0astream\x0ax\x9c\xed\
+\xc11\x01\x00\x00\x00\xc2\xa0\xf5Om\x0c\x1f\xa0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0o\xc0\
+\x00\x00\x01\x0aendstream\x0aen\
+dobj\x0a21 0 obj\x0a70\
+\x0aendobj\x0a22 0 obj\
+\x0a<<\x0a/Type /XObje\
+ct\x0a/Subtype /Ima\
+ge\x0a/Width 128\x0a/H\
+eight 128\x0a/BitsP\
+erComponent 8\x0a/C\
+olorSpace /Devic\
+eGray\x0a/Length 23\
+ 0 R\x0a/Filter /Fl\
+ateDecode\x0a>>\x0astr\
+eam\x0ax\x9c\xed\xda_HSQ\x1c\x07\xf0\xb3\
+RQs\x11\x9bf=\x08=\xe4\xb2\xa0\xbd\x05\xe1t\
+.\x0ar\xad$\x8a\x11\xbd\x04E\x8f\x05\xf5PP\xd1\
+CR\xbdH\xf6PP\x81/I\x11n{\x88 \x88\
+\xb0\x17%0\x08\x9b$d\x81=T\x0fQ\xb4\xb5\x96\
+\xd3\xa5\xdd\x93\xf7\xdc\xdd\xdd\xbb\xdd\xb3\xed\x9c{\x8f\xbb\
+\x04\xbf\xef\x8b\xd3\xf3\xe7\xf3;\xe7\xfe\xd9\x1f\x87\x10\x04\
+\x02\x81@ \x10\x88\xb9\xb4>\x9e\x9f\xea\xe1\x1b\xe2\x8f\
+\xa7\xa2\xcd\x82\xf8\x0d\xef0\xc6)\x17\xcf\x10Wry\
+HD \x8f\xf1~\x9e1!yDZ\x08\xdf:M\
+x\x1c\xe6\x19t\x8a\x0c\x11\xc9\xf3\xf9\xd7D\xf9\xb9\xcd\
+\xe7\xf5#\x82\xfc\xfc\xea\xf9\xfc\xda\xa4\x18_[=\x9f\
+\xdf\x8b\x85\xf8\xba\xd5\xf3\xf9\xa3d\xc4\x82E^]\xfd\
+=^\x7f\x9f2\xee\xbb \xde\xc1\xe9\xbbg\x95\x81\x1f\
+-\xf1\xea\xe6\x0f\xadB|~\xcd\x8b\xdc\x11\x1b\xb7\xc2\
+k\xabG|\xbe\xf3\x89z\xc6\x0c\x09\xe2\xb9\xfc\xad\xda\
+9{N\x10\xcf\xe1o\xbc\xb3\xa8]1~A<\x9b\
+_\xd7\xd6yzT\xa7\xe3\xb9:A<\xc2\xa6\xf2L\
+\x14\xcf\xebK3\xe4\xc7qQ<Z\xe2\xe2?\x04\xe2\
+\xf2\x8f\xb9\xb5\xa2x\xf4\x86C\x9f>Y\x7f\x84<\xb8\
+/\x8cG\xdd\x096{\xe9\xf5\xc0n\x07\xaa\x7f/?\
+\xfe\xbb\x8d2\xf9j\xff\xa5\xdb\x11}\x1e]tV\xe6\
+\x97_\xce\x05\xc3\x15s\xd0\xe7YC:\xdf\x22\x13D\
+\x8dz\xc3\xf9o\xc6\x9a_\xd5\xe8\xbb\xe8n\xbaf\xd3\
++\xc9\x13d\xb7\x18\x1a\xb6\xcfR7\xcdWq\xf5\x5c\
+\xf1(k\xbcjh\x08\xa4\xe9\x07\xadS\xeb\xb2\xde:\
+\xbf\xe9\x13\x99a\xa6\xa1\xb8a\xf3\x0f:?\xa1\xdb\xff\
+\x98e\xbeM\xd9\xe3\x8c\xd7\xd02\xae\xcc\x9d\x19+<\
+\xff.4\xe9\xfa\xfc\x22]\x9e\x9a\xe7{\xbe*\xca\x09\
+CK\x9fr\x81\xf4;)\xa3\xf2\x99\x22\x9d\x16B&\
+u\xc7\xd9\xdc\xed\xbf\xdf\xd8F\x9e\x94\xa5\xa3\xe5'\x08\
+d\xad\x14\xb0\xe3e\xee\x90\xde5\xb65f\xe4\x86\x07\
+\x95\xa68`\xbe\x80\x8ea)\xc7\x0fP\x8e\x9f\x97\xb4\
+tW\x9c\xc5d\x01\x8d\xc7\xc6\xd4\xf3y\xf1\x0c\xadC\
+\x90\xb45\xd1\x9a\xac\x15\xb0\xae}g\xf8\xe6\xc4\x9f\xfc\
+\xe5\xf4\x85\xfe\xa2#L\x1aY&\xa4\x15\xd0\x12\xfbM\
+\xbfx\x0dy\xd8B\x9f\x95\xdd\xa7\x15\x10c\xd4\xdf\xee\
+*5)\x87O)\x80m\xf5\x93\x87K?i\xf0\xf8\
+(8Ozg\xfb\xd4?0\xe0\xc9\xe1=\xe5n[\
+\x5c\xbea\x07*\xd8\x9f\x9f_\xf6\xd5\x96\x9f\x91\xcf/\
+.\x80\xfcr\x83\xfa\xac\x1f\xec\xf2\x96\xbd\xa5\x9a\xf3\x8b\
+\x0e\x01y\xcc\xf5\xf9\x83U\xbf\xb0\x00\x1b\xfc\x82\x02\xec\
+\xf0\xf5\x05\xd8\xe2\xeb\x0a`\xf6\xdd{=\xe2|\xad\x00\
+V\xdf\x9f\xc4\xd2\x15q~\xfe2d\xf5\xe5\xf7=R\
+\xbb8_\xdd\x01V\x9f\xbcO;$\xd0\xd7\x17\xc0\xe0\
+\x97\xeeg\xd6\xd7\x15`\x8f\xaf\x15`\x93\x9f/\xc0.\
+_\xbd\x0a\xa8\xe7U5|\xa5\x00\xa9\xc36\x1f\x85\x12\
+X\xba\xce\xd0o\xa5|\xe4*u_\xad\x92\xcf\x18\xf0\
+\xc1\x07\x1f|\xf0\xc1\x07\x1f|\xf0\xc1\x07\x1f|\xf0\xc1\
+\x07\x1f|\xf0\xab\xec\xbb\xd5\xef\x8d\x0c*M+\x1c\x82\
+\x0c\xaa\xff\x99r\xc9\x9f\xc7\xdb\x98DW\xdcN\x1e\xe3\
+\xc9\x94\xbd\xfe\xcf\xa8\xbd\xfeHs\xb4\xc4wn\xaa\x91\
+\xf4\x88\xa8\xef\xdfC \x10\x08\x04\x02\xf9\x8f\xf2\x0f\x99\
+\xa3\xf4\x1a\x0aendstream\x0aen\
+dobj\x0a23 0 obj\x0a84\
+7\x0aendobj\x0a24 0 ob\
+j\x0a<<\x0a/Type /XObj\
+ect\x0a/Subtype /Im\
+age\x0a/Width 128\x0a/\
+Height 128\x0a/Bits\
+PerComponent 8\x0a/\
+ColorSpace /Devi\
+ceRGB\x0a/SMask 22 \
+0 R\x0a/Length 25 0\
+ R\x0a/Filter /Flat\
+eDecode\x0a>>\x0astrea\
+m\x0ax\x9c\xed\xc11\x01\x00\x00\x00\xc2\xa0\xf5Om\
+\x0c\x1f\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\xe0o\xc0\x00\x00\x01\x0aendstre\
+am\x0aendobj\x0a25 0 o\
+bj\x0a70\x0aendobj\x0a26 \
+0 obj\x0a<<\x0a/Type /\
+XObject\x0a/Subtype\
+ /Image\x0a/Width 1\
+28\x0a/Height 128\x0a/\
+BitsPerComponent\
+ 8\x0a/ColorSpace /\
+DeviceGray\x0a/Leng\
+th 27 0 R\x0a/Filte\
+r /FlateDecode\x0a>\
+>\x0astream\x0ax\x9c\xc5\x9b{XU\
+U\x16\xc07\x97\x8b\xa6\x96\xe9\xe8\xe4+\x94\x89\xc7\xa7\
+Mi\x22:\x8e\xa1\x98\xa36>\x86\x14\x19'\xc3\x08\
+L\x18\x8d\x8f\xd4O\x8d\x18\x1d\x8d\xacF,\x1f\x05\x15\
+N\xf3pJ\x92\xd1Lm\x08\xd1\x19?A\xa7Q\x8a\
+\x86I\xc5,J\x13\xcc\xe1\xa1\xc8\x80\xc0U\xe0\x9e\xb9\
+{\xed}\xee9\xe7\x9e}^\xf7\x9esY\x7f\xc0=\
+{\xaf\xbd~\xfb\x9e{\xf6k\xadu\x102G\x02F\
+&\xef,:]u\xfd\xf6\x95\xb2\x0fs2\xe2\xee6\
+\xc9\xac>\xb9s\xc9\xc7\xd79\x89\xdc>\xb62\xd4_\
+\xf4)\x7f\xbe\xc9\xb1\xe4\xfc\xb2 \x7f\xd0?g\xc2A\
+\xbe}\xd2f1=t\xbf2\x1dKe\x9c\x95\xf4\x80\
+\xf5\xb7D\xac\x0b\xfb\xf3^LO\x5c\xb3\xe3\x83\xd3\xd7\
+D\xa5\xfb\xfbZ\x86\xef\xff\xb1\x9br9\xef\xf1\xc1B\
+\x85m\xe2\xcb_\xb8\xab\xaa\xc6X\x84\x8f\xbc\xc4#N\
+.\x08\x94\xd5\x0e\xcfn\xa5\xb5\xedO[\x82\x9f\xdeN\
+\xed\x17\x8ec+\x0c\xda\xcek\xe4Z\x80\x9fL\xbf^\
+\xc3\x13\xca:C\xf7\xd1\x0e\xbcd:~B3\xb1\x5c\
+0PUm\xc5m\xa2\x96f2>\xac\x91\xd8\xdd\xa0\
+\xa58\xb1\x1a\xf4\xba\xe2M\xc5\xdb\xcb\x88\xd5e\xda\xaa\
+\x03\xcf\x82\xaa\xe3\xa7f\xf27\x81\xcdN]_j(\
+\x19&\xe7{x\x03\xea=m\xc3\xfb\x05\x05\x05{^\
+Y\x18!\x9aJ\xa3;\xc1\xe4s\xfal\x84\xd7\x81\xf6\
+:\xa3\xec\xbe\xf3\xb7\x96u\x08\x13Y\xcb\xe18;\xa9\
+\xb0}If6\xbd\x86\x22a\xa8\xb4\x1b[\x10\x03\x97\
+7\xc8f\xf3\xab\x9b\x82q\xd5\xe3d\xba\xbdK\xb7\xad\
+\xb5\xd0\xe0\x88\x11\xfc\xa3\xe7dt,m\x19v\x14@\
+\x9e\xa8\x18\xfd\xc6\xec\xff\x81\x16st7\x18U\xc4\xa4\
+c\xa9\x18\x17\x07\xff\x8b\x8c|\x9b\x09]\xb8\xc9!\xbd\
+\xeasE\xcbZS\xf1\xfe\xc2\xbf\x9f\xf8Z(\xe8\x84\
+\xc7\xc9\xf9\x90\x11>\xca\xc3m:\x06k+b\x99\xc5\
+\xe3\xaf\xe5/\x1fM\x1f\xfb{\x93v\xd7\x89o\xc3\x1e\
+Cxt\xbf\x81\x01\xf3\xa8\x83 \x1c\xd9\xd2\xa5\xbb\xe7\
+\xeaF\x81?\xd3\x18\x1f\x9d\x86GV\x8f&\xbf\xae\xfd\
+\xf5G\xb2\xaa~[\xf8\x15\xad\xd1\xe8\xd6\xee\xd7\xd0\xec\
+'\xda\x8a\x93\xda@\xb3e:\xb36\xb2\x9e\xf0w\x19\
+\xc4\xa3\xbb\xc1\xac\xf62d#C\xe5\xe6\x14\x85\xfa\x88\
+\xcbP?\xd7(\x1f\x95\xe2f\xda\x1b\x81\xa7\xc0|\xab\
+\xf2\xe0\xbe\xf7<\x1e\x03w\x1a\xe6\xbf\x85\xed\x1e\xd3\xd2\
+\xba\xa3\x06\xab\xb5?\xa2\xa22\xe4\x8ak\x120\x8cG\
+i\xd8\xf0U-\xad\xe7\xe1\xeb\xffNUgl+\xf7\
+\xa6q\xfeT\xb0\xdcO]i`\x13Vj\xd08\xbd\
+\xcdw&\x18\xe7\x0f\x01\xfe\x03\xeaJY\xa0\xf4\xac\x96\
+\xad\xe7C\x8c\xf3\x83\xc1t\x84\xba\x12<\xa4U\x96\x1c\
+\xdb\x1e\x00\xfe\x08U\x9d\xa06]_\xdf+y\x18\xf8\
+\xea+\xc0\x04\xd01u\xa7\xe6\x96\xd9:\x9e\xbf\x95\xb0\
+\xbe\xf5\xb6\x84\xff\x04\xf0{\xaa\xea\xec\xc5*\xe7,\xc1\
+\xa35\xd8\xf6\xd7\xea:'\xb1\xce\xbb\xd6\xf0Kt\xd8\
+>\x82u\xb2,\xc1\x0f\x84-\xf33\xeaJ\x07\xb0\xce\
+;\x96\xf0\x93\xe1\xe7\x8fTW\xca\xc7:G-\xe1\x1f\
+\xc2\xa6\xdb\xec\xeaJ\xef`\xa5\xaf\xac\xc0\xf7!\x1b\x97\
+s\x9b\xc6\xaai\x15\xc0\xe2\x17`\x01?\xc5\xbdq\xfb\
+&E\xe9&\x8c8J4\x82\xcd\xc7\x07\x9c\x17v\x8e\
+\xdc7\x89ro\x89K%\xad\x85\xd6'\x99\xcf\x9f\xc3\
+I\xe4\xc40\x99Fx\xa9\xbb\xf6}\xf3\xf91\xebr\
+\xf6\x96\xb7\x0b\x1dh\x98\xe5\xd9\xc16\xbe\xea\xe4R\x8d\
+=\x82\xd7\x128*\xf1\xa8\x93R\x9c\xab%Ucy\
+\x0fj\xd94\x8b\xe0TFl\xe2I\xe9\xa2\xd2\xe0\xab\
+\xa4\xacr\xbe\xb5t`Q\x8f\xa93\xc5]\xd4\xf7\x0c\
+\x94t\xa5Y\xed\xad%2\x9f\xdc\x82\xaehzm?\
+B\xae\x13\xfdBw\xc9xr\x92\xfc\xb6\x0f\xb9\xcc \
+\xf7c\x89\xbf\xf0\x08\x85\xd6\x02\xf2m\xb8\xe8\x09\x17\xce\
+T\xff\xe1]\xe3\x91\xf8u\xa2\xf0gr2\xdc\xecO\
+<B\xab\x01\xba\xd7\xf5\xc9V\x85?\xdd\xb0j\xd0+\
+\xc9g\x98\xda\x19\x8a\xd0/\xa1'\xeb\xfd\x8cG3\x00\
+\xfb\x06B\xe5\xf8\xff5\xfd\xbe,\xb3\xe48\xe6^F\
+\xc3\xa0\x1fk\xfd\x8e\xa7\xfb\xe1\xb0G\xe0\xdf \xff\xf3\
+\xfb\xc3\x10X\xb6\x0c\xff\xbd\xee\x7f<\xdd\x10\xe7o\x83\
+5\xaf;\xf8\xafa\xf2q\x08!\xed\xec\x0e>8e\
++a\xf4\xaf\xe8\x0e\xfe\x93\xb0\x11\x01_\xdfc\xdd\xc1\
+\x9f\x87\xc9\x8e\xef\xf1_?.=\x82<\x8b\xc9U\x10\
+\xbd\xfdMw\xf0_\xc7\xe4#\x85t\x1a4*w=\
+\xb6\xea\xd5\xfc\xe3_\xb54_8\xf6^\xf6\x8a\xb9^\
+\x9c\xd9\x81\x9c\x07G\x9e\x7f\x19l:8\xb5\xc8\xc1I\
+\xa4\xfdoK\x0d\xcea6\xf8\xe5\x9fK\x85\xc5\x7f\xa8\
+\x81\x86\xbdV\x9err\x0cq\x9eJW\xf7.H\x85\
+\xf8Cf\x0d\x05[\x1a\xe7bq\xb7\x93kXp\x22\
+\x97\x12\xf4\x9f\xdd>\xc4\x0d\xea\xecd!.\xd7\xdbn\
+\xceYe:\x96\xcf\x7f\xa6\xd3\xd0 \x08\x8cnEh\
+\x03\xb4[\xac\xab\xd1\x88\x12\x11\xaa\xa6t\xcf\xb6\xb5\x09\
+\x89\x99\xb9\x07>\x15\xc5\x05\xb8\xc3\xfa\x82\x1c\xebA\xf9\
+A\x84\x86\xc3\xb1\xa8F\xcf\x03\x1c]\xef\xa6Tl\x14\
+G\xf5m\xd1[.\x08\xfd\xd2p2\x80\x84AH\xae\
+\x1c\x7f\xcc\x86V\x7f\xd4n\x93\xcc\x87e\x1a3\x19n\
+\xc4\x88,\x1a\x91\xe6\xda\x16j\x9a\xb2\x81\xa7\x89\x84\x03\
+\xfa\x91l\x89\x8dZM\xb6R\xf3\x8e\xd7\xfa\xb35\xee\
+\xc9\xa5\xc1ng\x96\xd6\xe3\x04\x8e>\xeeK2^\xd2\
+I\xabt\xd5\x16\x81\x07)\xfe=\x15\x17j\xf8\x07T\
+I\xc3\xcf\x15\x0ew\xbfk\x12\xb9\x0a\xa0Y\x02\x05j\
+n\xef\xedD\xa7U\xe3\xde\xa6\xd0[\xa0\x1a\x97\xbf\xef\
+\x22\xe8\xbc\xce_\xf7\xfa\x944\xba\xa4\x1c\xa0|\x9ah\
+T\xab\xbao\xb0L%\xbf\xa6s\x81\xb2\xca(\x98\xf9\
+\xb8\x8b}\xdc%C\xaa\xe9}\xfbb\x11\xcb5\x82\xd0\
+d\xf2\xb5\xfey\x8f\xb48y\xb3K\xe6I\xcbB\x89\
+\xab\xa5U\xb1\xa7\x914\xae,\x9e)B\xfe\xcd\x8f\x9e\
+\xda=\xa9\x11\xb2\xa7'\x84\x0c\xbc\x13\x9e!\xfcb\x5c\
+\x9a\xe7Q\xd8\x8fD\xc7\xab\x15\xd6\x83\x98&\x02zA\
+R\xda\xeb]N\x90\x8e\xbas%\xc5\xc5QB\xed\x09\
+(\xfe\xee\x87\x9e\xb6\x98|\x14N\xa6\xa3\x03,\xfa\x80\
+\x9d]\x84!\x0b\x85\xa6\xfd\x8f\x93\x8a\x10\xde\x8f\x85\xeb\
+\x96\xd12kl>\x9aN\xd2\x13&\xc9*l\xa94\
+3\x8a\x95\xb8\xf1\x83\xcd\xad\xd2\x0e\xf0?l`%<\
+Q\xf3\xe4M\x14\xf8tD\x9f\x95\x06Pm\xd1\xdb\xbe\
+\xe3o0;~4x\xfb\x7f\xc5\xfc\x1b!\xa4x\x09\
+\x5c\xb1\xdc\xc2J|t\x98Xh*\xdd\x914&\xa8\
+\xc7\xa0\x91\x13g%\xe4\xd5\xba\x0d;\x14\xf7\x9b\x01\xe3\
+_\xac\x10\x16\xf7J\x98\xe3{\xc1\x82\xdb&w\xd9\xa9\
+\xf0Gw\x09_C\xf4\x91\xc8'\xea\x09awD\xcc\
+H\xd9L\xb67\xb7\x7f\x1b\x84\xd0*\xf8\xc8\xf4\x0f(\
+\xf2\xd1.O\xa8[\xea\x93\xf4\xac\xf5\xf1\xb4\xd7\xf5\xdb\
+\xc6\xc0\xe4\xd4\xc8\xf4\x0f(\xf3\x83\xdb\xd9tG\xaeN\
+GC\xba\xb4]&SI\x99\x8f\xb6\xb2\xe0\x87\x16\xeb\
+O\x06\xcc\xe8\x107e/:*\xfcHh\xd6(<\
+L\x0d\x07\x13\x8ce\x22>T!\xe0\x15\xe2\xcd*|\
+\x04q\xfa\xfc\x1e\xf7MMH\x5c\xbchA\xa4\x17\x09\
+\xb9\xf6L\xf7pT\xd8\x1c\xa8\xf1\xdf\xc0uM\xbe\x85\
+R\xed\xb1\x1f\x91\xa9La\xc4\xa8\xf1\xa7AC\x03I\
+BlY\x87\xad\xd4(T\xaa\xf1\xed0\x9f'\xfb\xca\
+\x87S\xdaq/\xf8\x082P\x0d'\x9dy\x0a\xec\x8d\
+v{\xc3\x87J/\x12\x15\xa4\xf2\x09\xb6\xb2ER\xf4\
+0\xef\xb8\xf6\xe0\xcf\x91&\x17\xfc\x09W2\x17a#\
+\x02K\x96\xc4?2\xb1\xb9e2\x8b\x1f{\xab\xfe\xc7\
+b\xbd\x97qe\x99\xaf|\xd8\xf3\x8b\xf3\x1c\xc7\xbb\xf6\
+/|\x07\xc4\xfcX\x97f\xdd\xfd\x22\xc54\xb5'W\
+\xaf\x04\xc0\xc6O\xb4\xe9\x1dw\x03\x17\xd0\xf4 \x11?\
+\x16:Z;R\xd0\x84\x19\xbc\xdaG>\x99\xc6V\x09\
+\xd7qdZ&\x1d\x10\xf8\x04\xcf9f\x08\x9a\xaf\xe0\
+\x82\xd3\xbe\xf2Oa+\xaf\x8a\x0a\xe2E\x1dp\xf3y\
+\xfc\xcfE\x8a\xb0\x04\xeb\xce\xd1T\x12\x88\x16I\x22\x82\
+|\x07b\x04>\x0bO\x82\xf99\xbe\xf2s\xb0\x95R\
+I\x91\xd0\x01\xcag\xe2\x11\x04\xb5\xd8\xeb\xb6\x01\xc9\xc4\
+V<\xd2\xa6h\x07Z\xa7\x12>\x1b\x1f\x04\xc7\xe1\xa7\
+|\xe5\xff\x0alGI\x0b\xf9\x0e\xc0\xd6\xa8\x98\x89G\
+\xd3\xa14\x1a\xf9(\xc4M\xee\x99\xbfN;\x00\x8bc\
+\x17\x13\x8frq\xe9u\xf6q\xce\x88\x1c\xc3vd9\
+1\xf1\x92\xdd\x11\x03\x8f`\xd7\xfc\x17\x9f\xf1t#\x18\
+\xa6\xde\x019>\x0a\xcaM\x88\xe7\x0e\x07C/\xc8\xca\
+\xc5\x1d\x90\xe3\xc9\xba\xdd\xdeGVn\x5c\xc0C\xdc,\
+;{\x8a:\xc0\xc0\x87\xc0\x01\xe2#\x13\xf04y{\
+\x87\xbc\x82\xef\x00\x03\x8fvC\xcd\x223\xf8\xbd!8\
+\x7fK\x9e\x8dK;\xc0\xc2\x8f\x85}\xf7\x19s\xe2\xe9\
+$@\xcb\xda\x03\xe1\x0e\xb0\xf0\xe8\x1f\xd0d\xb6)x\
+d'\xbeE\x96\x8b4\xbe\x83\x89\x87\x5c3\xae\xc4\x1c\
+\xbck\xcd\x05s\xed\xac\xe4\xe5x\x16~6\x99\x92&\
+\x98\xc5'\x8b0w\x95u\x04g\xc8(\xe2I\xd9g\
+\x1a\x1e\x85\x91\xb7\x0b\xcbu\x0d\xe7\x01\x10R\xe3.\xaa\
+\xbf\x18dL\xa6\x91\xa1V\xa1#5j$\xc17k\
+d\xda\x1a\x94g\xc8P\xaf\xd5\xcc\x0d\x9d\x09\xfbC\xae\
+\xeb\x17\xa6\xe2i\xfa\xb6k\xb4i,\xe8\xe9\xe4\xbc\xc8\
+e\x98\x8cGv\xfe\x8d\x90}*)\xc4\x0f\x16R%\
+\x0br\x18\xed9\xd4vG\xde\x10\xb6\xc6\xf0]\xd4i\
+\xe3\xb4&\x9e\xc8\xfb\xb6\xb9\xd6l\xf9y< j\x07\
+\x1f\x92\xbbi\xd5;\x9fS\x84\xf8\xcb\xa5\xed1\xa2\xad\
+M\xd0\xcc7\xaf\xb8\xabj4}\xe4^K\x888\xfe\
+\xd4TQ\xf8\xfb\x8dKS\xb3\xfep\xf8L\x8b\xa8\xb8\
+H\xe7K6\xde\xc9\xdcJNU>S{s\xc1\x0c\
+\x09\x5c\xfa\xbd2\xbdj\xa1\x15\xb9\xa3\x1e\xd2{M9\
+\x13\xdeY\x92\xea\x8f\xf7\xad\xb1\x0c[^|K\x0ao\
+;\x984\xc0Op\x22\xbe\xc7\xdf\x89\xfc\x1f-\x009\
+\xb6\x0aendstream\x0aendo\
+bj\x0a27 0 obj\x0a2536\
+\x0aendobj\x0a28 0 obj\
+\x0a<<\x0a/Type /XObje\
+ct\x0a/Subtype /Ima\
+ge\x0a/Width 128\x0a/H\
+eight 128\x0a/BitsP\
+erComponent 8\x0a/C\
+olorSpace /Devic\
+eRGB\x0a/SMask 26 0\
+ R\x0a/Length 29 0 \
+R\x0a/Filter /Flate\
+Decode\x0a>>\x0astream\
+\x0ax\x9c\xed\xc11\x01\x00\x00\x00\xc2\xa0\xf5Om\x0c\
+\x1f\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xe0o\xc0\x00\x00\x01\x0aendstrea\
+m\x0aendobj\x0a29 0 ob\
+j\x0a70\x0aendobj\x0a30 0\
+ obj\x0a<<\x0a/Type /X\
+Object\x0a/Subtype \
+/Image\x0a/Width 12\
+8\x0a/Height 128\x0a/B\
+itsPerComponent \
+8\x0a/ColorSpace /D\
+eviceGray\x0a/Lengt\
+h 31 0 R\x0a/Filter\
+ /FlateDecode\x0a>>\
+\x0astream\x0ax\x9c\xb5[w`\x14\xc5\
+\x1a\xbf\xcb%!\x97\x10\x10$\x0a\xa1<\xa4\x04\x14\xc1\
+\x0a\x02\x8a\x14\x11Q\x0cJ\x90\x8eR,\xe8S\xf0)\
+%\x22RE\xc0\xc2\xb3P\x14\x15\x05\x02>Q@1\
+@\x80\xd0D\xf1\x81\x88\xa0\x18\xa4\x05#\x10\xa5\xb7K\
+!!\xc98\xbfow\xeffwg\xefn\x93\xbb\xef\
+\x8fd\xe7\x9b\xf6\xdb\xd9\xf9\xe6+\xf3\x9d\xc3\x11\x0ar\
+\xdf\xdecDjj\xea\xb0^\xb7]U\xc1\x91\xe2;\
+OX\xbe\xed\xc8\x89\xecC\x99\xb3\x865\x0e\xaaGD\
+\x877w_a^:\xb0\xe8\xd1\xab\xcb={\xf4{\
+\x97\x99@\x87\xde\xb8.P\x8fj\xe3r\x98\x91J\xd6\
+\xf5\x8e.\xdf\xfc3\x8cC\x95~}\x93_\xbcc\xcf\
+\x9bf'\xca}!\xae<\xf3\x9f\xa6\xce\xf9\xb9\xfb\xb3\
+\xcf\x95i/3\xa7\xbae\xf3\x16\xbf\xa8(\xf7|4\
+\xba\xff\xfd\xc9}\x9e\x1a\x93\x96U\xa2!\x18\xe8\xb4=\
+\xbd\xb3\x88w\xfc\xba!u\xacr\xe7\xc8-\xcaX\xc7\
+\xdaZ4o|\x81\xea7\x0d\xa9&0\xe3\xee\xfd\xf4\
+\xa2\x82`s=\xdb\x00\xd6\xa2\xdf\xac(\xad\x988\xed\
+,\x18\xc5#\xe4\xad\xdfG\xe5\x9a[L|w\xef\xef\
+\x08\xc0\x85G\xec\xce\xdf(\x17\xfd\xb6$x\x19W\xcd\
+\xa25\x98(m\x9d\xc9kNMM\xbeFR\xd5\xf1\
+gt+\x9bh\xf7\x1b\xd4\xde\x8e~9\xc2;\xb5>\
+\x0a\xce\xcb\xb2\xc6\xef\xa9\x9f\xfa\xc8\x92Gk\x18\xeb\x5c\
+\xc3\x0bP\xb50J\xd6\xd1\x0f\xc5|J;\xb0\xaf\x8f\
+\x93\xb0\x15;\xac\xbb\xa4m\xfd\xb3>\x91\xfbvh\xbc\
+\xa1\xb6\xe9^T\xac\xb6-\x07\xcf\xe30)\x9b\xe1\xf2\
+2\xe26q\xc6\xc5\x7fI\x9a6Z|\xd2'ry\
+\x1f\x18\x0e\x8b\xf8U`o\xb7}\x1a\xb5\xa3A\xd7\xfa\
+6u\xe5\xdf\xb0\xcf\xe4\x8dk'O\xf8\xe6\x92\x8a\xe0\
+\xca\xc2Z\xba\xba\xc8\x8f\xc1\xfd]\x86\xdc/]Gb\
+}\xe0z/\xa3i>/'[\xb6\x8f\xea0}\xbf\
+\x82\xe0\xdcP\xdd\x86sN\x05\xf3xs\xbb\x00b\xd2\
+\xd0\xcf\xd3\xc3\xcb\x18\xcb\x8b\xbb\xfc\xee\xe5\xb6\x1f\xe6\x13\
+\x82E\xfa\x0d\xf7\x5c)\xe7\x9dog\x17\x80\xf3e\xf4\
++M\xd5\xcaQ\xd9\xbc\xd8\xd9\x7f\x9f\x9ao\x17\x02@\
+F\xac\x8e\xdb\x1b\x0a\xa5\xf0a\xbb\x00\x1c\x0f\xd2\xd96\
+V+\x0e\xe3\x85\xc5\x81\xfa$}\x8f>\x9f\xeb\x99\x9d\
+p\x1a\x96<e\x1b@S|\xd2+\xb7\xab\xa5\x18\x0e\
+\xc7\x13\xeb\xb7\x03'\xd7,\x00\xe8\xabg\xde\xf27\x98\
+\x13l\x03\xa8\x8a\xb7Y\xa1\x95\x16\xf0\xc2\xfd\x81;\xbd\
+\xcb\x9b\xfdf\xe058\x04\x00s]\xd2\x0e~(\xe1\
+\x1ccE\x95\xd4BO>\xc4\xab\x81\xfbDBtZ\
+\x1b\x98\xd7\xfc\x04\x00\xcb*I{\xf4\xd8qf\x95\x85\
+\x8e\x87\x14\xdc\xac>\xd7\xe2\xcf\x99A\x80~R\xdc5\
+\x1a\xc5e\x90Z\xa9*i\x9f\x02=_\xf8\xa8t,\
+|\xcd;\xb4\x02\xff\x8aG\x82\x98\xbf)\xef3\xcf\xc4\
+\x8d\xfe\x0c\x00\xf6\xd61\xb7\xdf\xa9\x1c\x1c3#%c\
+A\x17\xd5\x11\x0a\xc5\x11\x81\xe7O\xe4}>3\xb3#\
+\xde!E\x95d\xaa\xb8\xa0\x9e\x9d\x99f+\x07\x9f\xdc\
+\xf7\xca_\xf3R\x10\xc6\xed\x9d\xbc\xd9\x1b\xb2\x8aT,\
+\xf4\xa9\x96Fv\x1ec\xfbw\x01@\xb6\xf1\x94l\x0a\
+hc\xbc\xc5/x\xc9\xa4e\xcd4\x897\x93\x0b\xfb\
+`\xe85\x8fq\xab\xf13\xeb\xc7X\xfa:\x9e\x14]\
+EU\xc8\x7f\x96o\xcf.\xe1\xc5\x9a\x81\xe7?\xc8\x8f\
+\xcdDyU7\x9c\xd0;\x0cL\xae\xeb\xb2\x1c\x8e\xd1\
+\xb0r\xca\xa6\x08\xdf7\x02\xca\xf3\xe2\x0d>\x06\x8c\xad\
+\xc0\x0eA\x03\xdej\x9bUe\x1b\x0f\x9f\xc4`&\xf0\
+\xb5/\xe0\xd3v=\x87%XY\xc5\xcb\x7f\xcdht\
+\xcc\x90\x08\xb6|\xfe\xcb\xbd-*\x1f\xe7[\xa0\xd0\xb0\
+\x87\xbf\xe2\x1d`74\xce\x02\x80,\xed\x0d{a\xb7\
+\x8c\x17\x1b>\xcd\x19\xa3\x02\xce\xef<\x0e\xdc\xcfK\xeb\
+\x92\xb1\x01f\x19\x98/s\xdecx\x88\xc7\x06g\xe7\
+\xbb\x12\xf7&\xbe-\xd9r\x9d\xc2m\xe4oe\xbd4\
+U\x91\xa6\xd7%\xba\xba-\x0c\xc2\xddF+\xad=g\
+\xa6)\xd0'\xe3\x9dK\xa6Tv8\xba\xc0\x0f\xf9\xb5\
+\xb2\xbe%N\xf1{\x02L\xff\xacf\x8c-2\xd9\x9d\
+7\x90\xb1\xf8\xf7-\x8e\xe8\xc7\xe6\x7f\xf1j\x13\x8d\x1d\
+\xc3\xd5\xe3%u\xa6\x1e\x1e4\xb9\xb0\xe3\x0f\xfc;\xdb\
+\xc00\xc03\x9cy\xa8\x9a\xc3\x1f\xf5\x82\xd5\x90\xb1\x0d\
+\xdd\xd7\x1a\xd0\xd7=\xaa\x00\xbb8\x94L\xa5\x92W\xb4\
+\x15\xfa\x84\x97\x9eT\x9fo<\xac\xe1g\xf9\xed\x8d\x83\
+G\xc3\xd1\xdc\x10\xe3g\xfa\x8e\xb05\xb6\xc7\xb9\xe9K\
+\xee\xbcV\xac\xaa\x0e\x13\xd2S\xc0|4_=q;\
+\xe0\xec\xd1\xdc\xd5\xea\xcb\xd4\xda\x9c\xbb\xcc\xc3w\xc6\xfe\
+Yk\x0d\xa09|\xd1C\xdc\x1bq\xbdo<l\xdd\
+p\x88\x8a\xefk}F\x00\x90\xae\x98\x13\xce\x1f\xf9\xf3\
+po\xcb{\x96\x1eg\xf9\xdf\x0f\xafl\x1c\x1c\xf4\x22\
+\xf3\x07\xe0\xba\xbfxm\xaeb\xec\xe2\x14d'n\xd3\
+\xaa\x22WB*\xfa;\x1c\xad\xb0\xc5\x8a\xfa6X\x8d\
+\xfam\xca\x91\xdf\x0d+c\xfc\xd8rz\xcb\x0f\x80\x1a\
+\xf8\xae\x175uM\x87m\x9ej\xb08\xc9\x0e\x7f\x91\
+/\x0c\xa4\xbd\x8c+[\xd7\x87\xe0\xecS\x1c\xd4\x8d\xc0\
+\x227\x0e\x82\x07P\x19\xcbX\xe8\xdb4\xdd\xf1\xad\x8b\
+\x15\xbdNB\xc9\x95\x92\x13{\x8d\x913\xeb\x9c\x86\xc7\
+\xa3u\xf1\x5c\x1f\xfe\xc3\xd2 t+'\xea\xb6\xcem\
+\xe2G\xc1s.\x115H[\xc8[\x19\xf4\x17\x09\xe5\
+B\xa7\xday\x9aZ?\x02\xb2\xb2\x99\x1e\x9f\x00\xff\xe3\
+\xe0\xec3\xf9\x0a8\x17\x83\xfd\xb4\xc8\xaa\x99M\xbb\xec\
+\x9d\x08\x12\xca\xf5\xfc<\x18\x8e\xf2'\xde\x93\xa9\x0f\x82\
+\x0d\x8a:$\xe3`\xa5\xcc<\x0a\x12\xc0L0'\x8b\
+\x9c*?\xab\xdb|=E\x94r[8\xfa\x00G\xba\
+`\xe7\xbc\xc4\xcb\x8f\xd3\x93k9\x09\xcc\xdd\xfe\xe6M\
+\xbc\xd5i\x09`\x14X:\xab+z\x03\xe7\x5c\xd9\xed\
+\x93\xb6\xf3c\x80\xe3\x87XC\xaf'\x94\xc7\xc8O\xa9\
+\xd12kO\xed\xde\xcblE\xb4\x05\x80\x81\x90\xaa\xaf\
+\xc4\xef\x17\xf19>\xfe\xe3\x95\xbe\xa4aOjA\xb5\
+}\xa2/\xdc\x0a:F\x0b48\xa7\x94R\x8b-\xc3\
+,\x8c\x87EX\xbcJR\x00]\x8byq\xabnO\
+Rdb\x1c\xc7\xf1\x067,r\x9auT\xac\xbc\xe3\
+b@\xa8\x09t\xccw\xberG\xf5\x80f9+g\
+MH\x1d7\xfb\x9b]\xd9\xd9[g?\xac\x9d\x8cO\
+1\x13\x00\xb5\xd0\x0aZc\xaf\xce4\x84\xbb\xaaj\xda\
+\xa4A]\xf9\x9aw\x01\xe3\xdc\x8dB\x93\xc4?8\xe7\
+tC\x81\x1371\x8f\x99\xe9\xf4X\xf5\x98\xa4=\x9a\
+\x11#\x00P\xbc\xd3\xa4S\xfc\xf1\xcf\xda\xe2\xf4C\xf0\
+=\xbe\x10\x04\xda\x0d\x07\xa4@<\xd2\xab\xc2O\xc9\xbb\
+\xc3\xa1\xa3\x1a/\x99c\x99\x8c\x1dle\x01\x80^\xb0\
+\x16\xde\xe3LSq\x98\x07q\xf6m\x14\x0f4\xd8N\
+%\x0f\x09\x8c\x98-\x9cS\xfc\x80\xc3H\xce\x96\xafn\
+<\xa7\xce[p6W}\xe8!\x010\xe9\xf2~,\
+^\xd5=\x9c\x97\xaf\xb3\xcb\xda\xc0\xcc\xdc]E\xe0\xb8\
+\xa0\x98\x9e\x14\x19\x90\xb7\xb2A\xa6\xe9\x15\xba\xb6y\xa7\
+\xce\x9d[`\xab&\xa4 \xf6\xc4\xae\xf4\x96\x00\xa0\xed\
+^i3\xaa\xbb\x89\xbd\xaf\x87\x8e\xcb\xd6Y\xca0\x0a\
+\xd3E\xc6\x5c\xdf\xe7\x0bD\xc9\xe7\x05\x00\xef\x8a\x00\x80\
+\x01\xf2U6Xl_\xe7O\x08\x9c\xdeP\xae\x8b\x9d\
+.Xd\x130\xcc\xdbAM\xcf\xed\xbelk\x00s\
+P|Il]\x0dA7\xcf\xed\xfa!\x22`\x94\xfa\
+,2\x12\xa5\xcf\x82\xd37@\x0f\xa3\xa8d\x80\x00 \
+]=j\xc6\xa3\xf0\xae\xd8\x96\xec\x8c\xa2.\xc6!\xc8\
+p\xc8P#\x81\x0f\xc3\xd7\xc8\xb4\x11\xa0\xd7\x01\xa0\x93\
+\xa5\x1f=\xc3\xd5f\xff\x13\xdf\xc3\x05\xcb\xab\xac\xbfi\
+\x04\x17\x9c7\xb6\x83\xdc\xb7v\x88\x12\xfdd4\x83\xed\
+\x01\xa0G2\xe77\x89b\xe6\xfc\x08\xd3\xbc(\x19\xc1\
+\xf5\x01j\x0e7r8\x9aA\xbc\x0e_+i\x13,\
+\x80q\xfb\xe6A\x89\xdd\x05\x03c\x97\xee=\xa6`\x12\
+\xa9\xf3\xab\xd6\xfdu_'l\x85\x13\x0d\xe5m\x82\x03\
+\xa0P\xb3\xb3&1\x83\x87\xc4\x96XE\x09\x87z\xef\
+\x88.\xddjwz\x87\xa3\x1eI\x81/\x04Z\xef\x98\
+\xe9=zb_\xad\xb1\x8ew\xf7T\xb5`Q '\
+\xc6\x1a@\x96V\xaa\xbe\xcf\xf4\x1e\x1d\xb0\xafv\xf8\x8b\
+v\xb7\xc3\xda\xb3\x13\xf7\x96gz\x05\xc0\x16\xf59\xf6\
+\x07\xbc\x87.\x1ez\x13T\xec~\xff\x01\x8a\xd8!\xb3\
+\xe7>Q\xc5o\x13?\x948\x7f\xb1j\xa5\xbbV0\
+\xc5\x8c\xf6\x91b\xfc\xd7/\xef\xd8\xb6H1\xe7_\x10\
+Yz\xe3?\xccDf\xf4t\x91#\xf9\x1e\xe1\xa1\xd8\
+\x07:\xc5\x93\x19\xbd@\x14\xb3(\x84\x17KR,{\
+\x85\x8c\xfarO%\x1f\x86\xe2j1\x5c\xe8\xa4\xdb\x82\
+g\xc2?\xfd\x00\xedNT/fd\x8cM\xc2S\xa3\
+;\xed\xdfy\x06O\xf7\x17k\x96\x91\xceF\x1e\x09\x16\
+\x19\xff\xdd\xaf\xb0\xd5\xfe\xe2\x03\x15\xa3f0O\xf7\xc2\
+pc\x1b\x05!\x1e\xe03\xfe\x11F\x5c\x176\x00p\
+\x93s\x12+-\x05\x80\x9f\xbd\x07\xff}\x82\xf1O\x0a\
+9\x5c\x00\xdc\x5c\x7f\x9ci\xc2\x8d\x19\xba\xe3\xc8V-\
+\xac\x96d\xfckQ!\x92\xcc\xf5f\xef8\x14\x14\xcd\
+\xf7\xfdi\x8ah\x8c\xc3\x8a\x9f$\x1b\xab\xb1\xc1\xf8\x0f\
+'\x00\x98\xba\x97Hy\x90*\xf5p+\xab\xd6\x11\xfe\
+p\xe6z\xa1Q\xf8\x00\xb8\xc9\x97,\x22\xd3+\x19&\
+~Q\x7f\x9f\xf1\x1f\xd9\xaf\x8f+\xbc\x00n\xceRd\
+\xaf\xf4?()\xc1\x0d\xba!#\xe3\x7f\x8e\xcf7\x0c\
+\x0b\x80\x88\xd1\x08V0:\x7f(\xb6z\x83\xea\xad\xaa\
+\xc6?\xc0\xad\x0a\x1f\x80\x9at\x7f\xc4\x16%\xd1\xc5p\
+\x1al\x9cD%\xf5Cub\x10E\x0e\x1f\x80^\xe4\
+\x12\x9e\xe2\x0edu\x8a\xad\xae\xc1\xf1[\x9d.;\xd5\
++b\xbdc\x12Z\x00\xf1\x0b\xe8M\xd7\xd2\xdd\xba\xfb\
+\x1b<o\x87\x9d\xe3FPQ\xbbl\x0d\x1f\x80\x86\x88\
+\xdc\xb2\xc2\x11\xaafQ\xee\xf4\xf7\xd7\xe7\x8fm\xf9\xc3\
+\x06\xadY\xb8\x00t\xa2\x90\xed/\xbe\xd0\x85r\xa7\x9f\
+\xdbB\x09<\xcc\xf0\xf1\xc3\x02\xe09J\xc6\x98\xa9\x8b\
+\x8e>Kw\xfa}\xff\xc0\x9e\x10\x12\x1e\xc2\x00@q\
+\x9b\xf2z\x1a\xd8\xa3T=\xac\x9c=-\x0f\x1e{H\
+\x02\xe0\xad\x8a+#\xd7B\x8cq\xec6#\x7f\xbd:\
+}\x09\xa5\x15l\xb0p\xcf+\x0c\xc0\x85\x98\x1b\xdb\x9a\
+`\xe4wW\xa7\xbf\xac\xb8\xc1P\xc8\xd6\x00\xfc\xdc\x17\
+\x04\xa0\x08z\xfb\xc5&G=\x0a\xc7\xee+\xcf\xcc\x19\
+\xafz_u,\x03\x14\x15\x02\x10Ab\x9ff\x8eJ\
+?\xcf\xd9\x07D7\xcf\x1c\xa0\x08\xc5&\xfc/\xfa.\
+5_\x8bW\x83@\xea\xb3\xa1\xc2\x01`\xac\xc5\xf4\x94\
+a\xb1\xc9\xc0\x0b=\x80\xc1Pu\xcb$W\x02I\xdc\
+\xde+59Z\xa1\x06\xd0\x0d\xc7\xce\x16\xd9\xce\xc1\xf9\
+\xff\x91\x99\x1d\x00\x80\xe4\xc6\xc4\x1f\xb5\x86}\xb3Gv\
+\x1f\xd1\x99WxjI*B\x09\xa01\x12\xd0\x94\xbb\
+!\x03\xc5a\x96q\xd2N\xd6\x00^\xb3\x09\xa06B\
+\x98\xa7\xcc\xa9\x1a\x0e%\xe0\x98m1R\xa8\x00(V\
+e\x1bYUG\xbe+\xcb,\xdd\xec\xd0\x00p#\xe4\
+\x5c,Mu\xa2\xd57^\xe0\x87\x18\x80\xf7\x8aRB\
+\xf0\xb3\x8fHofC\x07\x80\xbc\xab\x91\xd2\xaa\xd1@\
+\xe6?zUa\x00\x93\xd1l\xa6\xb4\xaak\x89eU\
+\xc8\x00 \xcd\xcf\x224\x9e\x84\x8b\x80LY\x9aT\xe8\
+\x00\xa4\xe0\x15\xd7JC\x98WC\xeb\x1e\xb6N\x05\x0f\
+\x05\x80\xf6\x08a\xee\x94n07\xac}\xcf\x8d\xb2\xaa\
+\x90\x01h\x81\x10\xe6A\x93\xb9\x03\x8aL\xe7U\xa5\x0f\
+\xc9\xaaB\x06\x802DNJS\x9c\x9c\xf3\xd1\xf1\x05\
+YU\xc8\x00\xd4\xf8\x9dW]4'\xb3\x83\xa6\xa3\xdb\
+4iU\xa8\x00\xc4\xc2\xb3+\x92K\xf7\xbf\xd1)\xcd\
+Nh\xcd6\x80\xa85\xf8\xc0\xbd\xa4\x83\xd1\xc5\xfd\xaa\
+\x80\x92W\x11\x00Jf\x86<m\x8b\xb2z\xfc\x06\xf6\
++\x0e\xe0M\xf0\xa6H\x07j\x81s\xe7\xa0\xec7\x06\
+6\x00\xd0\xadYz\xb4\x15\x00\xca\x10Y$\xfd\xc0\x0d\
+\x90=\x9ck;\x85]\x0a@\xfb\x11\x83\x11@?c\
+f\x86\x8f\x12\x0e\xf0\xaa\x0b~\x7f\x83\x13<\x80\x05Z\
+\x8d\x1e@'\xc4v\xbe\x97\x0ae<]\xdc\xdbN_\
+\x97\x01\x98^z\xc2g6\x8b\x00\xae\xc1\xd5I\x96\xf4\
+dW\xb2z\x8c\xeeo\xf0TOp\xcd\x1c\x95\xc5\x05\
+\xa6\x0d\x97A\x9a\x06\x92wT\x92\x19\xcc]0\xcaK\
+\xb5\x9f\xba\xee#\xf3\xbd\xa1F\xb4\x02\xb3\xf9Ck\xfe\
+\xbfP~s\xf36\xda\xd8O\x5c\x17I\xb7\x02:\xa2\
+\x15\xe8\xe1p \xe3n\xb4\xb4o*Z\xcc\xad\xd0\xf4\
+\xfe\x00 \x05\xedwW\xa4\x87\xb13\xd2\xc3e\x10\x5c\
+\xb0\xe5\xb6\xb3\xe6\x83\x06\x10\x8dT\x81\xe4V\xfc\xcfB\
+Y\xbf\x07\x10\xd8\x97\xba`\xa1\x02\xf0\x08\xe7\xcf\xeb\xc7\
+\xe4WG\xadq\xdb\xf1Kp)a\x01\xa8\xae\x05\x00\
+w\x01c\xbf!\xf7\xad\xaf\xb9O#K\x17\xac<\x00\
+,\xa4\xe0W\xc6\xce\x0eaZ\x12\x9aH\xb5\x91\x08t\
+\xba\x89\x89_^\x00\xf2\x15\xf8?\x97\xbc\xbby\xcd\x9b\
+\xc6\x8a\xab82\x96\xd7*T\xd3[\x018\xc6XN\
+\x02?\xfb\x0f\x18\xf81\xdf2+\x17,\x94\x00\x92\x18\
+\xe2\xb7\xb8P\xd3O%\xb9\xde\x0e\x01\x00\xf3\x1e\x80\xab\
+5\x92\x92/\x0f\xea\xd28(\xe8)?\x92*\x02\xc0\
+\xb8\x02m\xb8\xda+\xae\xef\x88\x86c\x91\xe9\x93s'\
+\x05\xbe\x02\xf9Y\xe5\x06\xe0\xd5&-\xffVO\xd7.\
+8\xe7\xf6h\xaeEm\xf8\xbflq8\xeeq\x09\x00\
+\xfb\x92fJx\x0d\xbe\xce12\xab\xc6\x80]\xba|\
+`\x93\x1a\x0d\xba\xcd\xa7\x14\xf4\x8cr\xfe|8(\x00\
+\xecP\xfa\x8a\x9d\xf4\xab\xd2B\xf5\xd7(\xa4\x0b\x05Z\
+\x1a\x5c2\xb2}\xaa\xb1Y\x9c\xe6\x947[9E\xfc\
+\x15s\xc1\xf8\xa0S\xc3lS\xf4$\xed\xb7\x92\xact\
+\x89\x903y\xf5T\xedw@\x9e\x05\xc1\xa5\x82\x97\x97\
+\x12Fm\xce\xe7\xfb~\xef\xeb\x86T\xdb\xa8\x0e\x13\xe6\
+-O\x1b\x9f\x12\xf07v!\xa0x\xc1\x9a\xff\x07?\
+\xa6*c\x0aendstream\x0aen\
+dobj\x0a31 0 obj\x0a35\
+15\x0aendobj\x0a32 0 o\
+bj\x0a<<\x0a/Type /XOb\
+ject\x0a/Subtype /I\
+mage\x0a/Width 128\x0a\
+/Height 128\x0a/Bit\
+sPerComponent 8\x0a\
+/ColorSpace /Dev\
+iceRGB\x0a/SMask 30\
+ 0 R\x0a/Length 33 \
+0 R\x0a/Filter /Fla\
+teDecode\x0a>>\x0astre\
+am\x0ax\x9c\xed\xc11\x01\x00\x00\x00\xc2\xa0\xf5O\
+m\x0c\x1f\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xe0o\xc0\x00\x00\x01\x0aendstr\
+eam\x0aendobj\x0a33 0 \
+obj\x0a70\x0aendobj\x0a34\
+ 0 obj\x0a<<\x0a/Type \
+/Annot\x0a/Subtype \
+/Link\x0a/Rect [437\
+.250000  550.250\
+000  519  566 ]\x0a\
+/Border [0 0 0]\x0a\
+/A <<\x0a/Type /Act\
+ion\x0a/S /URI\x0a/URI\
+ (https://www.fl\
+aticon.com/profi\
+le/license/pdf/7\
+53345)\x0a>>\x0a>>\x0aend\
+obj\x0a35 0 obj\x0a<<\x0a\
+/Type /Annot\x0a/Su\
+btype /Link\x0a/Rec\
+t [437.250000  4\
+95.500000  519  \
+511.250000 ]\x0a/Bo\
+rder [0 0 0]\x0a/A \
+<<\x0a/Type /Action\
+\x0a/S /URI\x0a/URI (h\
+ttps://www.flati\
+con.com/profile/\
+license/pdf/6797\
+20)\x0a>>\x0a>>\x0aendobj\
+\x0a36 0 obj\x0a<<\x0a/Ty\
+pe /Annot\x0a/Subty\
+pe /Link\x0a/Rect [\
+437.250000  440.\
+750000  519  456\
+.500000 ]\x0a/Borde\
+r [0 0 0]\x0a/A <<\x0a\
+/Type /Action\x0a/S\
+ /URI\x0a/URI (http\
+s://www.flaticon\
+.com/profile/lic\
+ense/pdf/446046)\
+\x0a>>\x0a>>\x0aendobj\x0a37\
+ 0 obj\x0a<<\x0a/Type \
+/Annot\x0a/Subtype \
+/Link\x0a/Rect [437\
+.250000  386  51\
+9  401.750000 ]\x0a\
+/Border [0 0 0]\x0a\
+/A <<\x0a/Type /Act\
+ion\x0a/S /URI\x0a/URI\
+ (https://www.fl\
+aticon.com/profi\
+le/license/pdf/2\
+883367)\x0a>>\x0a>>\x0aen\
+dobj\x0a38 0 obj\x0a<<\
+\x0a/Type /Annot\x0a/S\
+ubtype /Link\x0a/Re\
+ct [437.250000  \
+331.250000  519 \
+ 347 ]\x0a/Border [\
+0 0 0]\x0a/A <<\x0a/Ty\
+pe /Action\x0a/S /U\
+RI\x0a/URI (https:/\
+/www.flaticon.co\
+m/profile/licens\
+e/pdf/453841)\x0a>>\
+\x0a>>\x0aendobj\x0a39 0 \
+obj\x0a<<\x0a/Type /An\
+not\x0a/Subtype /Li\
+nk\x0a/Rect [437.25\
+0000  276.500000\
+  519  292.25000\
+0 ]\x0a/Border [0 0\
+ 0]\x0a/A <<\x0a/Type \
+/Action\x0a/S /URI\x0a\
+/URI (https://ww\
+w.flaticon.com/p\
+rofile/license/p\
+df/1685562)\x0a>>\x0a>\
+>\x0aendobj\x0a40 0 ob\
+j\x0a<<\x0a/Type /Anno\
+t\x0a/Subtype /Link\
+\x0a/Rect [226.5000\
+00  149  368.250\
+000  167 ]\x0a/Bord\
+er [0 0 0]\x0a/A <<\
+\x0a/Type /Action\x0a/\
+S /URI\x0a/URI (htt\
+ps://www.flatico\
+n.com/contact)\x0a>\
+>\x0a>>\x0aendobj\x0a5 0 \
+obj\x0a<<\x0a/Type /Pa\
+ge\x0a/Parent 2 0 R\
+\x0a/Contents 41 0 \
+R\x0a/Resources 43 \
+0 R\x0a/Annots 44 0\
+ R\x0a/MediaBox [0 \
+0 595 842]\x0a>>\x0aen\
+dobj\x0a43 0 obj\x0a<<\
+\x0a/ColorSpace <<\x0a\
+/PCSp 4 0 R\x0a/CSp\
+ /DeviceRGB\x0a/CSp\
+g /DeviceGray\x0a>>\
+\x0a/ExtGState <<\x0a/\
+GSa 3 0 R\x0a>>\x0a/Pa\
+ttern <<\x0a>>\x0a/Fon\
+t <<\x0a/F8 8 0 R\x0a/\
+F9 9 0 R\x0a>>\x0a/XOb\
+ject <<\x0a/Im6 6 0\
+ R\x0a/Im12 12 0 R\x0a\
+/Im16 16 0 R\x0a/Im\
+20 20 0 R\x0a/Im24 \
+24 0 R\x0a/Im28 28 \
+0 R\x0a/Im32 32 0 R\
+\x0a>>\x0a>>\x0aendobj\x0a44\
+ 0 obj\x0a[ 34 0 R \
+35 0 R 36 0 R 37\
+ 0 R 38 0 R 39 0\
+ R 40 0 R ]\x0aendo\
+bj\x0a41 0 obj\x0a<<\x0a/\
+Length 42 0 R\x0a/F\
+ilter /FlateDeco\
+de\x0a>>\x0astream\x0ax\x9c\xed\
+]Ko\xe4\xb8\x11\xbe\xf7\xaf\xd09\x80\xdb|\x8a$\
+\xb0X`\xdam\x07\xc9!\x801\x06r\x08r\x08f\
+\xb3\x09\x16\xf1&\x9b=\xe4\xef\x87\x92HI\xad\xe2\xc7\
+\xa6h\xd9\xab\xf1x\x8d\xb5\xdb&U,V}\xf5 \
+Y\xd4\xdc\xfe\xfe\xf3\xdf\x9a\x7f\xfc\xda\xdc\xde}\xfeO\
+\xf3%\xfc\xbc\xfb|`G\xa3\xd9\xf0_\xd3}\xdd\x5c\
+\xfe\xc1*\xd1|y>\xfc\xd2\xfcrx<<\xfa\xef\
+\xf1g\xd7\xf8|0N\xfa\x9f\xff\xea\x7fr.\xa4\xff\
+\xc8\xa6\x0f]\xcb?\x0f\x7f\xfe]\xf3\xf3\xa1{\xf0v\
+`\xc1\x0f\xa9\x9c\x93\x86\x09c\xfa!\xbb\xdf\xb5\x11\xad\
+\xff\xde\xff\xee\xc7\xe3\xda\xda\x81\x1d!\x95\xff\xd1}\xff\
+\xf2\xdc\xdc\xfe\xe1\xb9m\x9a\xf3\xbf=\x0fq\x1e\xech\
+\x1d\xe3\xaee\xc6?pt\x5c\x1a\xa1\x95\xeb\x88:\xe1\
+\x14\xe7\xa6U\xcd\xaf_~\x1e\x07\x97\x9e??'#\
+=\xc3Z6\xff\xfd\xfb\xe1\xc79\xad\xfe\x01\xc3t\xf7\
+Y3g\x99t\xa2\xfbl\xac\x92\x1d\xed\x14-\xee\xbb\
+h\xf6rR.\x90\xe2/&%\x94L\x92\xe2\xfd\x17\
+\x19\x97\xf7\x9d\xc5\xb5\xbeB\x88\xbe\xb3V\xfcz\xe75\
+\x84{\x8e\xc5+0\xd1u\xee(\x97r\x5c\xccE\xd7\
+\xd7\xc9r\x8e\x8b\x99\xe8;{\xca\x89\xce\x15H\x97\x82\
+\xf7HW-+\x98Q\xd7\x9bK\xdd\x88\xab\xa8\xe1\xad\
+\x1ez\xbb\x92\xde\xb2\x1dh\x0b&\x0az\xebV\x84\xde\
+\xbc\x84\xb6'\xdd)\xcd\xb3mdAg\xc5\xf5\x8a\xce\
+\xde\x09\x15w\xd6-/\xef\xdcz\x7fV\xdc\xd90\x93\
+\xec\x5c\x03\x88 +\xeab\xea(\xb5\x1bP\x1aT\xb2\
+\x05\xa5\x9e\xa7\xc6\xa8\x97\x11\xea\xc1\xbd3J\x9b\x8ai\
+\x80\xf5f\xaa\xdbDL{\xa3\xb4\xa9\x98\x06\xd7\xb0\x99\
+\xea\xb6\x11\xd3\xce(m*\xa6\xc1\xbdn\xa6\xbaM\xc4\
+\xb47J\x9b\x8ai\x08Q\x9b\xa9n\x131\xed\x8d\xd2\
+\xa6b2\x96m\xa9\xbaM\xc4\xf4\xda\x94\xd2yh\xef\
+\xef\x1d\x91\x04HC\x93\xd18\xdd\xb7#,\x98\xdc\x96\
+p\x9f\xdd\xae\xe8;0!\xae3\xb1\x86\xb0ieq\
+\xdfU\x22\x1e\xc3A\xa9>\xd2\xc1z\x03}t\x5c\x94\
+w.\xe4\x22*\xe4U\x947p\x5c\xda\xb9\x90\x8bN\
+\xd3\xa5}W)o\x8cC\xc5\x9aNf\x09\x1b(\xaf\
+\xe3b\x15,\x8a\xb5\xb7\xb2o\xb1\xf2\x06\x8eW\xc0\xa2\
+X\xd3\x85}W)o\x0c\x80\xa5\x9aN\xa7'\x1b(\
+\xaf\xe3b\x15,J\xb5\xb7\xb6o\xb1\xf2\x06\x8eW\xc0\
+\xa2T\xd3\xa5}W)o\x8c\xbc\xa5\x9aN\xe7E\x1b\
+(\xaf\xe3b\x15,J\xb5\xb7\xb6o\xb1\xf2\x06\x8eW\
+\xc0\xa2T\xd3\xa5}W)\xaf\xef\xdce\x90\xa5\x9a.\
+M\xc8V+\xaf\xe3b\x15,J\xb5\xb7\xb6o\xb9\xa6\
+{\x8eW\xc0\xa2T\xd3\xdb\xa4\xcf^\xa9L\xda\xa6;\
+\x90\xb1\x81\xd4cw\xf6\x82\xb1\xd0\xff\xe5\xf3\xdd\x9f\xfc\
+\xa3\xffkD\xf3G\xff\xffO\xcd_\xfe\xda\xb0\xe6\x87\
+\xec\x83\xa7\xa7\xc3\xed\x83\x0f8\xb6y\xfa\xd17\xf5\xa7\
+5\xc3\x8f\xa7\xe7naq\xe39{\xfa\xa1\xf9\x8e1\
+\xc6\xbfo\x9e~:\xb8\xa3b\xad\xd0\xc3\xc1Rh\x11\
+}\x8b:j\xd5\xda\xee\xdcij\x91}\x8b=\xba\xa1\
+a\xd6\xa2\x025'\x87\x93\xaa\xa9E\xf7-\x9c\xc5\x81\
+\xa6\x966P\xd3\xc6\xf2\xcb\x16L\xcdD\xdeB\xd3\xd4\
+b\x87q\xc4Q*i\x0a\xa9\xb9\xbe\xa5=*2\x9f\
+O\xa1\x85\x11\xde\xb0tN\xe3L\x05\xef\x9aJ\xe4v\
+\x17x3\xad^H\x07s0\xcc\xe7\xfe\xe9\xe2\xc4M\
+p\xdd\xdaVx\xa8\xfa\xcf\xfd\x07\xcd\x9c\xff,U8\
+\xa8\xbaDdA\xff\xab\xf0[;h\x0fN\xd7p\x95\
+\x02\xa7\xee~1\xe2\x12\x9d\xe6\xd8O=\x81Ny\xe4\
+\x04O2H\xcc\x0d\xe2'\x123Gk\x96\xd4th\
+1L\xf2\x14:\xdb\xe3\xec\xe0\xf5*5\xdcb&\x9d\
+\xfdv\xb2\xb7@\xf6\xddI\xd8\x5c\xf8\xe7\x00WF\x8c\
+,\x0a\xa55H\xc4\x86\x98\xdf`d\xfa\x18$<k\
+\xb9\x0f\xe3H\xb7T\xe5Ch!\xe3p\x16\x9d\xc6R\
+-\x9c\xc3\x16\x01[d\xe0\x8dr\x0dy\xe3j\x0f\xaa\
+\xcc\x99\x91\x10\xf2\xd2)z\xf7b\x97\xb2\x1f\xb4b\x97\
+\xfe\xc6{/1\xb8\xa2\x12\x1b9A[$\xe4\xef\x02\
+\x11ILcD\x1b\xc0\x87<\xb6\x01\x88%\xcf\xe0q\
+\x1e\x82\xe3\xe6\x84\xda\xce\xcd\x16\xe9\xba7\xdbI\xd9\x93\
+i\x0c\x01\x9d\x98\x86\x820O\x888\x18\x8d7\xf5\xa5\
+n\x83\xd1\xa4\xf0\x80\x91\x82\xc7Q\x81\xeb\xe0\xb4S\xa6\
+N\xe6s\xed\x99\x9d*\xac7N\xb3\xc8\xc0\xbe\xb6\x18\
+\x87\x8d\x12\x1a\x18\xd7a\x1c\xab\x16\x01\x85\xb7\xd0\x90w\
+n\x94\xd9X:)\x99G\xe1;[\x1e\x17q,\xc5\
+-&\xa8\x85$\xd3A\xc4*aF\x06\x0a\x1f\xf3\x06\
+\xc7\x99\xa0\xb9Lr\xf18<$\xed<\xe2\xb9\xa0\xa5\
+*\xd3\x80\xbc\x8d\xa6\xa6a$!K\x0d\xee\xe03X\
+:\xdb\xe6TX\xdb\x9f\xe22h\x897\x1e\x83\xb5\x15\
+\xcbg\xee\x02o\xc4\xdd\xf0\xf3\x98\x14,y\xc3\x1c\xc4\
+\xcc\x89\xe2\x0d\x8f\x83[b&H\xec\x07\xcfG\xb0\x90\
+\xf5\x88\xe5\xa2J\xf08\x1fn\x16x\xc3\x1c\xe0qD\
+\xa4\x16<\xeb\xd4\x22\xc7q\x96x\xc3r\xc3\xa8\xc2\x18\
+\xc5\xb8\xc6\xd8\xd1o\x83D\xb1\x8b<\x19\xb9inu\
+s#\xa5\x89\xcc\x8e\xbb\x14lX\xd6\x97L\x1d\x8b\x0b\
+\xab\x05\xbb(\xa8d\x11cd\xc0\x12\xd9#\xf0y\x1d\
+\x81\x19\xa4\x96q\xfaz\xcf\x0a\x93\x96\xcd\x156&O\
+a\x16{\xb2\x96\x9a\xb8*\xa2\x1d\xd1\x94\x0f\xc3\xec\x9a\
+\x0fv\xd4\x07g\xe2\x10\x04\x93\xb0\x11\x80$\xb1\xbb6\
+\xd3\x9d\x82I[\xf1\xb5\x80\xa9*\x09\xa8\x09%\x907\
+1S\xe5\xe3\x0b4rq\xd9\xa0\x9d|\x99\xff\x9a\xfd\
+\xde\xdaF*\xd7\xdd7\xa8\x1d\x87\x8bpMa\xf8\xd0\
+}\x1f\xae)p\x11\xee)\xbcd\x16\xfb[Ur\xdb\
+z0[ui\x93\xee\xa8\xf4r\xb9\x87\xf7F\xf0\x12\
+\xb1f\xc1y\xda\x83\xed#qI\xcb/\xc4\x15\x9d\x9b\
+ S\xc7\x13\xc4B\xc1\x9bL\xcb\x1d\xb1`\xa4*\xb1\
+\x90\xc6\xcbr\xbc\x8d\xf2)\xae\x97\xcaw\xc40\x07!\
+\xe75\x89\x94\x03\x0b\xe5\xe1\x8d\xdd\x84\x12\xe2u\xdcD\
+\xfb~\xdd\x84\xd21\xe6\x8d\x0b\x1e\xe3\x96\xe7X\x04\xa9\
+\xe7\xdd\xdb\xf3l^\xf7\x01\xa0\xed\x12\xba\x19\x83\xab8\
+\xd1\xc9\xec\x5c\xc1\xdd;~zk\x13q\xfaULD\
+\xb0\xf7k\x22Z\x92\xbd\x07\xe2\x87\xf1\x16\xb8`\x08\x16\
+\xb8%\xb3\xdd\x0b#A\xd8\xc9\xd8\xb3M\xce\x04\xf9a\
+\x93\x93Mz\xa2\xafc\x93\xea\xfd\xdad\xcb\xe2!\x97\
+\x88\xc7Rt\x97\x19C\xa9&\xef\xc5\x96'\x03\x94\x1c\
+\xc9\xaf10w\xb1\x1a\xceZ\xebL\xc4\xe3\xe9\x1a\x11\
+\x0a\xb6\xa2s\x10\x17\xcd&\xae-\x13Rn\x0f\xa7\xb9\
+\x15\xe7E\x18\x185\xaa\xbc\x9a\xfb\xbf\x9d'i\x15\x7f\
+\x1dOb\xdf\xb1'1\xed\xf5uryYC\xe6,\
+\xbc\xa6\xac\x01ck9p\xdc\xb0\xe6G\xe1.7\xac\
+\xb1\x89d\x98\xc5\xcbV\x9c\x9b@\xdf\x196\xacw\xed\
+\xedF\x18dJd*\xa6N\xeb^\xf0Z\x9e\xa8\x14\
+{#\xac\x1e\x5cC\x00\x83^&\x11m\xdf\xd8\x83\x19\
+\xae^\xc5\x83\xc9w\xbc\xd3g\x94\xbb<3p\x09\xc0\
+`\xe5C\xbf\x81[\xbe\xea\xbcf\x12\xd7\xd7\xb2\x0a\x99\
+d\x11\xea\xcay7\x7f5\xab8\xd7\xe1\x153z\x81\
+\xd7\xeb\xfd\x0b\x14\xb0n\xd0\xa8\x00\x9e\xac\x85\x91\xb6\xb9\
+\xb1]\xdb\xfc\x1c)\xa0ew\xccv\x85;\x13\xb3!\
+J\x0bz\xec\x1f\x8cK'\x22F\x1bZ\xa8\x9f\xc6\xd4\
+b\xe6L\xcf\x9eTh!\x9b\xb0\x22\x1e#\xd2*\xf8\
+Xi\xc5Hu:\xa4\x96\xe1\x00s-B\x0b\xad\x9c\
+\xc7\x1c`j\x0f\xc1.H=_\xd8\xe6\xf0\xd4\xc8A\
+&\x9e\x0f\x1e\x07\xeb\x07r\x90\xd16\x9e)\x96(\xa4\
+6\x9e\xd9\xb5$\x92\xd7\xe8\x07\xcf\x07\xca\x0ds \xe2\
+\xd9 \xf5\x825\x88\xdfV\xa2x\x9cX\xdc\xad\xe0\xbd\
+\x0f\xb1\x09\x07\xd8\x16\xb0\x16\xf035\xbc\xd5h\xa1f\
+\x1cH-\xc4\xd6\xd43'8S\x8c\x83\x1a\xb9m\xaa\
+m\xf1)\x8c\xa3\xf9\xf2^N\xc58\xd8~\xc28\xbf\
+}HlS!\xd1I\x1f\x11\x9d\xba\xd41>1r\
+\x89\xbc&F*R\x8a\x17\xb0\xa4\xe0\xca\xc5\xc6kT\
+D_^\x8eK\x1b\x1c\xcbl)\xce\xe18\xe2\x14\xb9\
+&\x05<\x12\x8d\x13\xef\x92\x95Lp,\xb5 Az\
+I$\xd8\xafI`\x0ar\x9f\x19\x98\x90?AN\xb0\
+\xa8\xe3\x92\x93.q\x09\xf9s\x94#\x88\xc4)\x1dc\
+\xf2\x10K5\xd4D\xbc\x14\x842\x98\x94P*\xb4\x91\
+\x91\x01\x9eO\xdc\x8eq\xcb\x1b\x98\x18\x7fq\x91&P\
+Y\xf4L-\xd0X2\xc2\xc7\x13\xdc\xd6\xc41\x22\xb1\
+Z\xa0\xb8\xd6L\x1d\xeb\x96\x10\xc1\xa6\xd7\x22\xc7\x91\x99\
+\x17!\x8fMo\x0b\x1e3\xd2\xc2\x80\xacA\x0c\x9e\x06\
+\xe6\xa0\x02\x7f\x99\xe0\xb3\xadw\xab\xc1_\x8dDqX\
+\x8aW\x82i\xbd\x0et\x0b\x18\x91\x19\xac\xd6Xt\x85\
+\xe6\xc4\x19\x86f,k\xac\xb9\xfb=$L\xa8\xaeT\
+\x19\xff\x0b3\xe3\x8e\xd3\x1b]\xfe\xc9T\x88\xe3\xaar\
+\x17\xbd\x0c\xe1\x0d_b\x89{\xe5\xf4\x5c\xae\xe2\x8aO\
+\x86kx\xf5&S\xa5\x1a\xef\xcb\x13\xa0\x8b\x13\x9c\x0f\
+\xbe\xbc\x10\x01H\xae\xff\x068\xa7\xa8\xf1=@\x13\xef\
+\x1d\xeb\x0blf\xceX\xf1\xc1X\xf9)\xd4\x0bv\x93\
+S\xdb\xb0\xf8`\x0c\x1f\xd2\xe0S\xff\x9a\x83gX\x0b\
+\x84\xe7#*6\x823\xe7E\xf8z%\xae\xe3\x84\x17\
+/3\x87\x90+\xce\xa5*\xcaQ\xc5}\x85Z\xf0q\
+\x06\x161~\x06\xef.\xc0\xf9\x883\x14$9\xf1\x83\
+\xd3\xc8T\x8dUX\x0bfV\xb28\xce2W\x92q\
+9D\x22{\xa6\x05R\xab\x11\xe4\xd5\x8a6\x93\xb8\xcc\
+T\xf3\xc2\x0d|dZs\x15\x1d^\xa0\x97\xb1\x1e\x89\
+\x14\xcb\xd4H'stTc\x025\x97\xb8\xe1\xd1v\
+\x0dz3G\xcd5Q\xa0\xc2\xddH\x19\x82\x19\xd1\x8f\
+T\x11!d#\x1cj;\x83\x83Qndc\x1f\xbe\
+\xc6@F\xcd\x85\x94\xb9\xc4\x1a\xabl\x0e\xbf\xda\x03\xc7\
+!h?\x19;\xc5\xee\x13V\xeden'\x5cT\x9d\
+\xef-\x9dr:z0\xffG\xceF\xc5\xc5\xdc\xc9\x92\
+\xd7\xc6\xec\xd9|\xe0]\x00l$\x99\x80\x81M\x01\x9b\
+\xcfx\xc5p\xb9|\xc4\xd42-\x0e\xf2\x06[2\xe6\
+SS>ZQ\xfdUS\x85\xf0V)f\x15\xdep\
+\xf8\xa9\xa9\x8d[\xe6Yr\xf4\xf9\xe1\x0di%\xab\x85\
+\x9a\x88X\xf3F!\xac\xe4\x8a\x08Ru\xeb\xab<-\
+\xad\xaas\xc3B\xc1\x82\xac\xa8U\xcb\xa0\x0bsM\xa6\
+\x8e\xe3Rt|\xb4\xd4\xb9b\xb5\xb5m\x9eZ\x13\xe9\
+qF\xb1m<\x97\xe3\xfd\xc0\xabf\x8a\xee=\xa6\xb4\
+Q\x931\xc3\x9c\x1d\x07\xa8\x9a\x17ee$\xfb\xed,\
+\x82\xa1\xb5\xd4\xac[\xaa*\x8bg\xc7\xe5\xb3\x92\xc1Y\
+*g\x85\xd4\xfd;X3er\xd7\xfb\x97\xd4)\xae\
+\x1a4\xffZ0+\xe77\x92\xdf\xedK\xfbj\x22\xd0\
+\xdb\xbe\xef,\x16\xb2\xee\x11 \xd3\x15\xd7\x0f\x80|\x00\
+$\x01\x90\xe9\xbe\xe5\x07@>\x00\x92\x00\xc8t\xc5\xef\
+\x03 \x1f\x00I\x01\xa4\xe4V\xd4\x07@\xbe]\x80L\
+\x97i>\x00\xf2\xad\x02\xc4\x82ba\xc9D`\xb9\xb9\
+q\xdd?@1_\xe9rA7\xb7\xaf\xb6$6\xc4\
+\xcfa}N\xcb?\x1e\x02\x1e\xe9\xc6n\x5c\xb5\x92k\
+_\x01\x98:\xf3O`\xd0r\xf6\xb1\x0a\x0c\xbc\xe56\
+Ui\xa5#o\xcb\xbd\x03<\x9f\x9aqb\xa9\xcdx\
+\x83cl\x09g\xb8:\xb1{\xb1\xe9|2\x12\xc5Z\
+\x80\x1c\xb0\xd9j?\xfeC\xf7\xac\x87\x1b@\xf6c\xf3\
+x\xf8?\xf6\xb9J7\x0aendstrea\
+m\x0aendobj\x0a42 0 ob\
+j\x0a2874\x0aendobj\x0a46\
+ 0 obj\x0a<<\x0a/Type \
+/XObject\x0a/Subtyp\
+e /Image\x0a/Width \
+128\x0a/Height 128\x0a\
+/BitsPerComponen\
+t 8\x0a/ColorSpace \
+/DeviceGray\x0a/Len\
+gth 47 0 R\x0a/Filt\
+er /FlateDecode\x0a\
+>>\x0astream\x0ax\x9c\xc5\x9bYP\
+\x14G\x1c\xc6\x87\x80\x89\x17\xc8z\x80((\x100J\
+4\x1a\x88\x07\xe0A<\xb14j\xbc5\x0aJPc\
+\xd4\xb24\xc6\xb2ba\x04\x8f\xa8\x0fy\x8c1G\xf9\
+\x90*5)\xb5RI\xac\x1c\x16\x96&\x1aO\xc4@\
+<\xe3\x0d\x82\xca\xb5\x80\x08\x0a\xec\x04\xa6\xbf\xd9\x9d\xdd\
+\xe9\xed\xed9v\xfd\x9e\xe8\x83\xff\xef\xebaz\xe6\xdf\
+=\x8d xS1\xe9\x9f\xe7\x96\x17\x1f\xd9>\xa7\x87\
+W1n\xd4vG\x93\x08=Y\xe9\xe7s|\xd25\
+Q\xa1\x131>\xc6ol\x16\x9dT7\xc3\xa7\xf8,\
+\xd1U\x8d3}\x88\xff\xc4\x8e\xad\xa9\x7f\x01\x066\x00\
+Y\xbd*\xca\xcf?\xee\xb3F\x1f\x1b\xf8\x18\xf8S\x11\
+\xa4\x1c\x7f\xd7\xa7\x06>\x92\xf1\x1d\xe5\x9aH_\x1aX\
+\x03\xfc\xe9@G\x9d\x0f\x0d\xac\x06\xfeL\x90\xb2\xd6g\
+\x06V\x02\x7f\xae\x93s\xbd\x8f\x0c|\x08\xfc\x85`\xd7\
+\x16\x9f\x18\xf8\xc0F y\x16u\x9b\x0f\x0c,\x05>\
+\xbf3\xad\xd5\xeb\x06\xde\x07\xfeR\x17z\xbb\x97\x0d,\
+\x06\xbe\xa0\xab\xbb\x1e^5\x90\x8e7^a7\xf7}\
+\xbch`!\xf0\x97CX\xbd\xbcf\xe0=\xe0\xaf\x84\
+\xb2\xfby\xc9\xc0<9\xd7J\xf3\xd4\xd3n`\xba\x89\
+\xf89\xf6T\xaf!\x95\xd7@m\xa4i\xf8Y\x8d\xa2\
+\xa8\xdd@\xaeYI\xe9\x0c\x05^\x8b\x81\xe5\xe6\xe0\xdf\
+\x05\xfe\xe6\x7f\x1a\x0d\xd42f*\xbf\xa6>'\xd8[\
+\xe1\xe1\xdc\x06\xde$\x96\xa7\x9a\x80\x7f\x07\xf8\xdb\xbd\x04\
+\x81\xdf@\xb6\xd4/\xdb8~\xd23\x82\xbc\xd3\xbb\xb5\
+\xc4m R\xea\xf6\x8ba\xfc\xc4\x06\x02\xbc\x17I\xca\
+\xdc\x06*Z{\x95\x18\xc5\xa7\x02\x7f?J\xae\xe15\
+Pl\x06\x7f<\x16\x17E\xd1\x8e:>\x03\xa1f\x5c\
+\xff\xb1\xc0\x17;-.\xb9\x0c,\x91\xba\xe4\x18\xc2\x8f\
+~J@\x0fb\x9d\xeb9\x0c\xf4\xac\x92zL3\x82\
+O\xa9#\x98\x92>\xae-\x1e\x0d\x04\x9e\x92\xda\xeb<\
+\xbc+\x99\x1a\x05|i_u\x9b\x07\x03\xc0\x8b\xab\x0d\
+\xe0G<!1\x1e\xf6\xa34\xfa\xed\x15\x19\x06\x82N\
+\x93\xc6\x13\x06\xde?\xc9\xb5$\xc6\xa38\x1a\xfe\x0bQ\
+to\xa0\xd3\x19\xd2T\xf7\xaa~|R\x0d\x89\xf1\xb8\
+?\x1bO1\x10|\x8e44\xcd\xd5\x8f\x1fVMb\
+\x94\x0d\xf0\x84W\x19\xb0\x5c\x00~\x9e~\xfc\x10\xe0\xcb\
+\x07\xb2\xf0{q\x13\xd6OP\xb4v\xce#\x95\x8ds\
+\xf4\xe3\x07[I\x8c\x8aA,\xfcn?\xca,\xe8\x92\
+\x0f\xfc,\xfd\xf8\x04\xf2\xec\x10+\xe3\xd9x\xca4\xec\
+z\x09x\x03\x9ba\xf1\x95$FU\x82'\xbc\xca@\
+\xb7\x02R|n \xf5\x1dTAbX\x07{\xc6\xbb\
+\x18\x08)\x04\xde\xc0cw`9\x89Q=\x84\x07\xef\
+d \xf42\xf9\xf1\xd9\x14\xfd\xf8\x01e\xc0\x0f\xe3\xc3\
++\x0c\xa4]\x01~\xb2~|\xff\xc7$FM\x22/\
+\xdea\x00j\x98\xa4\x1f\x1f\xf7\x88\xc4\xa8M\xe6\xc7\xbb\
+\x18h\x98\xa8\x1f\xdf\xef!\x89\xf1d\x04\x0b\xff\xa5\xea\
+\xad\xa20P\xef11v\xaf\xbe\xa5\xc0\x8f\xd4\x86W\
+\x18\xa8\x1f\xaf\x1f\xdf\xa7\x84\xc4\xa8K\xd1\x8a\x17\xc2o\
+\x92\xc6\xa7c\xf5\xe3c\x1f \xc6h\xcd\xf8^\xb7\xf0\
+\xabc\xf4\xe3c\x8a\x191\xd8\xf8\xde\xb7q\xe1\xde\xd6\
+\x8f\x8f.\xc2\x1fp\x9cf|\xe4\x1d\xdc6)\xfa\xf1\
+Q\xf71{&P\x1a\xd9\xf8\xa8{\x8c\xbb\x96S\xf2\
+z\x9d:y\xd9\xf8h8\xaf\xa5\xcdYN\xf5\xc6\x15\
+|F{t\xd9\xf1{h\xf8\x18\xfc\xddjhO,\
+NE\xe0\xfe\xa1>\xb8\xd9\xf8X\xdc\xb55I\xfa\xf1\
+\xe1\x98=\xcfi\xaf-6\xbe\x0f\xe6,\xf5m\xc5\xa9\
+\x9exvQ_\xdal|_<\xb1\xacC\xf5\xe3{\
+\xdc 1\xa8\xbbul|?<\xaf\xabh\xa9\x02\xa7\
+\xc2\xae\x03O\xdb\xadd\xe3\xe3\xf0\xb6\xaazK?\xbe\
+\xfbU\x12\xa3i\xb6f|\x7f\xbc\xab+ii\x22\xa7\
+B\x91\xb2P\x97*l\xfc\x00d*\x15\xb4$\x99S\
+!H\xd8\x9a\xe6\xb3\xf0_\xd1\xf0\x03\x91\xa7\x95\xd3\x96\
+\x08\x9c\xea\x86t\xb5y\x81f\xfc d\xa9e\xb4\x05\
+\x12\xa7\xba\x22Yo\xa6\xedh\xb3\xf1\xf1\xc8\xd1\xcb\xde\
+\xd0\x8f\xef\x82\xa5J\xf3\x22\xcd\xf8\x04\xacP\xa8\x8bc\
+Nu\xc6B\xcd\x96\xa1\x19?\x18\xeb\xb3G\xaf\xeb\xc7\
+[\xb0L\xb5ej\xc6\x0f\xc1\xea\xf4!mg\x82S\
+\xc1X\xa4\xdb\x96i\xc6\xcb[\x03\xa5\xb4}\x19Nu\
+\xc2\x16\x85\x8d\xb6Ao\xc7\x7fM\xc3'\x02_\xf2\x9a\
+~|\xd0Y\x10Vh\xc6'c_\xe6\x81jO\x8e\
+_\x81\xd8\x9e\x12Wi\xc6\x8f\xc0\xaeTq,\xa5\x91\
+\x17\x8f\xcd9\xea\xee\x1c\x1b?\x12{rE\x06\x0e\xfb\
+t<\x09\xc2Z\xcd\xf8\x14\xe0\xef\x1b\xd8X\xeb\xf0'\
+\x08\xeb4\xe3GcC\xf4^4\xa5\x91S\xed\x8f\x83\
+\xb0^3~\x0cv\xa3\xefFQ\x1ay\xf1\xc7@\xd8\
+\xa0\x19?\x0ex\xf2\x1dF\x9f\xda\xe5\x82\xb0\x91\x85\xff\
+\x86\x86\x9f\x80O\x01\xad_\xa1\xf4\xaa\xedQ\x10\xb24\
+\xe3\xe5\xcf@\xb7\x22\x0c\xe0\x7f\x07\xa1hG\x8b\xd68\
+?\xbe\xd9\xf8I\xc0\xdf\x0c\xd7\x8f\x17\xbe\x13\x9d\xd4\xa8\
+\x5c\xed\xb0\xf1\x93\xf1\x0d\xeeFO\x03\xf8\x04\xd1EU\
+\x8e#4l\xfc\x14\xe0\xaf\x1b:f\xb9\xdd\x95/n\
+\xe6\xc3O\xc3\x07\xd0kaF\xf0B\xbe\x8ao\x0d\xe6\
+\xc1O\x07\xfejwC\xf80\x15^\xfe<\xcb\xc6\xcf\
+\xc4\xc7\xef+\xc6\xf0\xc2b)\xca\xb1T\xa2=R\xa9\
+\xda\xa2\xc4\x7fK\xc3\xcf\x06\xfe\xb2\x91OY\xad\xfaA\
+\x0a\xb3\x14%\x0bI#r<\xe1\xe7\xe2\xdcE!\xf3\
+\xd0\x0b\x87\x02H\xd2h\x7f|l\xc1\x05`\xe3\xe7\x03\
+_`\xf8 \xc1p\x12\xc7^\xc6\x05\xd8\xca\xc4/\x00\
+\xfe\x1f\xb7\x07\x9e\xb8\xb5M\x0a\xb4\xd3Q\x91#U\xd8\
+X\xf84\x1c\xf9\xc9ws\xdcK\x8b.J\x91F9\
+*,V\xc5D\xa0\xe2\x17\x01\x7f\x91z\xd8M\x9b\xc2\
+\xa4\x81V\x07(\xaa\xb2=\xe03\x80\xa7\x1d\xf5\xd3,\
+2\xfb\x0e*\xab\x82\xadL|&\xfe4\xe7\xcd\xc0c\
+\xf69\xaf\xb56\x03o\xdb\x14\xa4\xfe\x85e\xc0\x9fS\
+\x9d\xb3\xd4#\x7f2\xfb\x9c\xdf\x1f\x8e\x0bP\x99\xe5\xea\
+`9\xf0g]N\x99\xea\x14\x99}\xf9.\xb5\x19\xf2\
+\xdd\xdf\xe2`\x93\x13h\x05ZNS\xae\x8c\x1e\x91\xd9\
+\xb7\xcd\xb5:C1\x07\xaa>u8X\x85\xba\xbfM\
+\xc2c\xf6\x0dW\xd5\x07oV:\x90\x13\x12\xf9\x84\xf1\
+\xc9@\xd5/\xe8Sw\xe9rV\xfaS\x9a\x82\xb3\x1d\
+\x0e\x1aIJ\xb6\x16\xc5\xbf:R\xfa\xeb\xd2\x22)^\
+\x05\xe5 E\x8b,9\xd5\xb2\x815\xad\xe5u(\x9c\
+0\x0d/|O\x22\xd2NrH\x0e\xb6\xc0\xc1\x8e\x96\
+\xc2z\xe0\x8fw0\x0d\xef\x8f\xfd\x1a\xb7\x06\x04\xcb\x1e\
+\x99/\xffg\xc1\xb1\xf6\xa6\xe1\x85d\xfb_\xd8\xad\x81\
+T\xf07\xa2c\xae\x89xa\xab\xe8\xd1\x00\xf8\xf2\x7f\
+\x95\x1cmg\x22^\xc8\x13=\x1a ||\xcc\x10\xff\
+0\x15\x1f*\xcd\xbeZ+\xcb@\xaa\xc2\xa2\xf8[[\
+3\xf1B\xba\x14\xf4\xd0P\x96\x01%\xff\xd7WL\xc5\
+\x0b\x07\xa4\xa8\x99\x02\xcb\x80\x82\x7f\xc4d<f_\xcb\
+\xca\x91a\xc0\xc1\xff\xf9es\xf1B\x92\x14V\xca<\
+\xdd\x19\x88X*\xefK\x88?\x99\x8dG\xa6M2O\
+\x8a\x81\x80Q;\x0b\x1c\x17\xff\xc76f\xe3\x05\xb2\xd5\
+\x9a\x22\xd0\x0c\xf4\xc88X-*t\xd8|<\x99}\
+5r`\x87\x01\xff\xe1\xdb\x5c\x97\xa4\x87\xcc\xc7\x0bi\
+d`\xf6\xb2l\xa0\xa2\xd2\x05.\xdav\x070\xe2\xe8\
+\xd5~)\xf6\x12G\xc5P\xab+X\x82\xe7m5\xf0\
+)\xc7\xbd\xfc+\xe4\xd9G\x14\x9ey\xa8V\x05\xaf<\
+\x90npu\xedV\x89\x12\xa0P\xfa\xb9M\x8a\xf2V\
+w\x0c<\x99\x96\x18\x99$\xb2\xcc\xdb\xd52\xf0%\x87\
+kh\x037\xba\xae\xf7\xa0\xf3\x12'kW\xa1z\xe0\
+\x17\xb6$yq\xe0D!6\x15\x97\xdc\xfd\x07\xd2\xbc\
+<p\xa2\x85\xb4[\xdd\x17\x03\x87\xf6\xa9\x06\xbe\xdf7\
+\x03\x87n;\x0f<'\xd1W\x03\x87\x8a\x94\x037\xba\
+\x87\xa4Cd\xe1g;\x9f\x93\xf8\x92\xef\xe1-j\xb7\
+\xf2\xdf\xd2}\x0b_\xc0\xc0\xa1\xff\x01;\xed\x03\xfd\x0a\
+endstream\x0aendobj\
+\x0a47 0 obj\x0a2021\x0ae\
+ndobj\x0a48 0 obj\x0a<\
+<\x0a/Type /XObject\
+\x0a/Subtype /Image\
+\x0a/Width 128\x0a/Hei\
+ght 128\x0a/BitsPer\
+Component 8\x0a/Col\
+orSpace /DeviceR\
+GB\x0a/SMask 46 0 R\
+\x0a/Length 49 0 R\x0a\
+/Filter /FlateDe\
+code\x0a>>\x0astream\x0ax\
+\x9c\xed\xc11\x01\x00\x00\x00\xc2\xa0\xf5Om\x0c\x1f\xa0\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\
+o\xc0\x00\x00\x01\x0aendstream\x0a\
+endobj\x0a49 0 obj\x0a\
+70\x0aendobj\x0a50 0 o\
+bj\x0a<<\x0a/Type /XOb\
+ject\x0a/Subtype /I\
+mage\x0a/Width 128\x0a\
+/Height 128\x0a/Bit\
+sPerComponent 8\x0a\
+/ColorSpace /Dev\
+iceGray\x0a/Length \
+51 0 R\x0a/Filter /\
+FlateDecode\x0a>>\x0as\
+tream\x0ax\x9c\xed\xda1n\x83@\x10\x85\
+\xe1\xedCn\x10j\x97\x96\xd2\xe4j.)s\x15[\
+\x96|\x84\x14\xceqb\xcbp\x81\x89c\x1b\xd8\x9d\x1d\
+\xb2\x8a\xd8\x99E\xd1\x9bj\x85\x16\xbe\x1f\x84\xa8pn\
+\xd64\xef\xf3\xce\x9f9\x0dQ\xc9\x80+_2\xe0\xc6\
+\x97\x0bx\xf0\xa5\x02\x06\xbeL\x80\xc7\x97\x08\x08x\xfb\
+\x00\xc6[\x07D\xbcm\x80\xc0[\x06\x88\xbc]\xc0\x04\
+o\x150\xc9\xdb\x04\xfc\xc2[\x04x\xfc1Z\x105\
+v\xfc\xe7s\xbfz\xfa\xb0z\x02\x01\xef\xfa\xa5\xb3\x0a\
+\x08\xf9\xd17\x0a`\xbc\xe7\x9b\x04p\xde\xf7\x0d\x02\x22\
+>\xf0\xd5\x03b>\xf4\x95\x03\x04\x9e\xf9\xaa\x01\x12\xcf\
+}\xc5\x00\x91\x8f|\xb5\x80\xcdx\xd9c5\x1e\x8e|\
+Wy\x9f\xe2M>\xff\xf5$\xdc\xbd\xe4{O\xe0\xf2\
+\x96\xcf\x1f\x02\x02^\xf2\x87\x80\xac|\x1f\x10\xf2\xa2\xff\
+\x08\xc8\xcc\xdf\x03\x18/\xfb\xb7\x80\xec\xfcO\x00\xe7'\
+\xfck\x80\x02\xef\xdc\xba\xe2G&|W\xad\x15xa\
+\xa6|\xab\x81\x0f\xff\xdf\xf9\xf5\xbe#o\xe6\xfa\xfe\xb5\
+\xba\xc3*\xcd\x9f\x88\xb4|\xa2s\x9d\xf2\xf7\xa4\xe9\xd3\
+.\xe5w\xba~\x9b\xf2\xd9\xfe\xdc~\xf2]\x85\xbf\x0c\
+?\xb5Ok/|\xf8\xf0\xe1\xc3\x87\x0f\x1f>|\xf8\
+\xf0\x97\xe9\xffe\xe0\xc3\x87\x0f\x1f>|\xf8\xf0\xe1\xc3\
+\x87\x0f\x1f>|\xf8\xf0\xe1\xc3\x87\x0f\x1f>|\xf8\xe5\
+}\xad\x81\xbfl\x9f\xff\x7f\x98y.)\xff\xa0\xebo\
+S\xfe\xea\xac\xc9\x7f\xbd\xa4|W\xefZ-\xbd\xdd\xc6\
+\xfc7i\x93Z\xfe\x0aendstream\
+\x0aendobj\x0a51 0 obj\
+\x0a384\x0aendobj\x0a52 0\
+ obj\x0a<<\x0a/Type /X\
+Object\x0a/Subtype \
+/Image\x0a/Width 12\
+8\x0a/Height 128\x0a/B\
+itsPerComponent \
+8\x0a/ColorSpace /D\
+eviceRGB\x0a/SMask \
+50 0 R\x0a/Length 5\
+3 0 R\x0a/Filter /F\
+lateDecode\x0a>>\x0ast\
+ream\x0ax\x9c\xed\xc11\x01\x00\x00\x00\xc2\xa0\
+\xf5Om\x0c\x1f\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xe0o\xc0\x00\x00\x01\x0aends\
+tream\x0aendobj\x0a53 \
+0 obj\x0a70\x0aendobj\x0a\
+54 0 obj\x0a<<\x0a/Typ\
+e /XObject\x0a/Subt\
+ype /Image\x0a/Widt\
+h 128\x0a/Height 12\
+8\x0a/BitsPerCompon\
+ent 8\x0a/ColorSpac\
+e /DeviceGray\x0a/L\
+ength 55 0 R\x0a/Fi\
+lter /FlateDecod\
+e\x0a>>\x0astream\x0ax\x9c\xed\x9a\
+}P\x14e\x1c\xc7\x977\xd1Py\x13%\xb33\x02\
+I\x1c\xde\x9a\x92x\xb5i\x0cPb\x10\xd0! O\
+\x08\x05$\x8e\x84\x04\x81&\x86\xb7\x10\xb0\xb8`0\x1c\
+\xeb.E\x0b\xc2\x1c\x91x9\x10\x13F\xe3L \x98\
+\x11\x92\x97!\x09A%\x88\xb7\x03\xe1\x0ey\x89\xdb{\
+\xdb=\x9f\xdb[X\xa4nn?\x7f\x80\xbb\xcf\xf3\xfd\
+}\x96\xdd\xe7\x1ed\xf6\x07A$$$$$$$\
+$J\x8f\x8a\xe9\xfe\xd0\xd8\xf43\x85\xac\xdbm}\x1d\
+\xf5\xd5\x97\x99\xf4D\x9a\xfd\xea\xc5\xd5X\xb53$>\
+\xf3lQ\xd5\x9d\x8e\xde{\xec\x8a\x82\xbc\x93'B\xbc\
+\x8cU\xe4\xc6\xd4-\x03snq\xe6\x01L7\x9c\xa6\
+\x9a\xca/\xc0\xc7\xc87\xfb6\x17Tc\xb4&\xeb\xe0\
+\x0e5\x999\x8d\xc4\x06`L\xc2\x10+z3\xb6\xdb\
+0\xaat\x00\xbb\xc6\x13\xf6qUp\xb6\x04;(`\
+\xa6\xd2\x7f\x8d,\xf9j\xdf\x8a\x19<5\xce\x03\xd3:\
+O\xf1d\x17\x18I\xd2\x01\xe6\x93Fp\x16\x98\xd0\x04\
+\xe5\xb7\x8b\xc7g;\x8bsR\x8e\x1f9\xe0lcn\
+\xe7\xf6\x01-\x81~\x9e\xcdC\x15\x18}\xf6\x0at\x92\
+FQS\xa6\xef\xfc\x90\x9b|\x8c\xfa\x9e\x9d\xb9\xad\xab\
+Optjn\xd9\xfd9\xf1\xa0\xa1L?\xe7j\x9a\
+\xbf5`\xadk:\xc4\x14\xf7#\xefA(jX%\
+\x0ci\x1f,\x89u\x02<$\xad7\x0fe\x96NI\
+\xfb\xd5v{\x0a\x08\xe7\x8f\xd4\x82\xaeL\x841\xb5P\
+\xb2@\xab)\x92\x01\xcau\xf1ina\xe06\xac\x1a\
+\xed\xfcI~{\x048\xaaBN=\xa8\xdb\x86\xe9_\
+@7\xbcQ4\x95\x13,:yxLt\xee\xee\xc7\
+zr\x0a\xb4\xa3t\xddN,\xf4\xd2\x90\xe7_\xc0\xe1\
+\x96hr\xbe:\xffX#_t\xcc~[~\x1a\xed\
+\x9f/\x9fC\x1f\xe3\xf0C\x90{\x8bpv\xc5\x0b\x10\
+\xb4\xee\x9a\xf0\xe0\x0fO<Y)\xff,\xfa\x10\x9f\x1f\
+R\x8d\x14~\x1e~\xd37l\x12>\xf7c\xb276\
+\x0c\xbf\xe0\x22\xae\xf2a\xe1\xf7C\xd0\xeb\xc2:\xed\xdd\
+\x82\xef\xad\x168\x83p\xae\x06\x16N\x8a\xfc\x5cx\xc4\
+p1~H\xeb;\xe4O\x90'sO\x04\xfa\xad\xe1\
+\x7f\xfeE\xc4\x0fA\x9f\x8a\xeds\xe1\xf8S\xcb\xe7\x87\
+\xa2\x84\xf1\x99\xc0E\x84\x10\xfe\x1e\x82~(\x0c\xfe\xf0\
+L\xfb,&\xb3\x9c~\x88\xc1\x8f\xa4-*\x82\xf0?\
+ \xec\xff\x8a\x1f\x89#\xfdK\xf3\xf7\x12\xf6\xd3\x15\xda\
+\xdf\xa7\xe4\xfe\x87\x84\xfdY\x0a\xed\x7fD\xfa\x09\xfa\xbf\
+$\xe4\x7f\xac\xe4\xfe~\x85\xf7\x7fA\xc8\xff\xb7\x92\xfb\
+\x07\x14\xde\x7fJ\xa1\xfd\x83\x0a\xef\xcf$\xe4\xffG\xc9\
+\xfdC\x0a\xef\xcfPh\xff\xb0\x92\xfbG\x08\xfb\xd3\x15\
+\xda?\xaa\xe4\xfe1\xc2\xfe\x93\xa4\x9f\x80\x9f\xa3\xf0\xfe\
+4B\xfeq%\xf7O(\xbc\xffsB\xfe'\xa4\xff\
+?\xf5\x13z\xff\x02\x93\xaa\xd0\xfe)%\xf7s\x09\xfb\
+SH?\x01?\x0f\xe8\xd700\xb5q}\xffh|\
+\xe67\x97\xaao\x96^\xc8I\x8e\x0c\xf0\xd8e\xb1E\
+\x0bT,Y\xa6_\xcfd\xa7\x8bOh\x5c\xe6\xd9K\
+\xd5\xf57K\xce\xd1\x13h\xfe{m_3\xd0\x90\xe7\
+\x9f\x16\xffR\x90\xe6\xfe\x8fQ\xf6\xd2oY\x81\xfe\xb5\
+\xef\xc4^y(\xab\xca\xf8\x8c\xc4?\x0d\xf0c\xf3\xf4\
+\xf7\xbc\x80\xedX~\xcb\x10F\x8b\xf4+u\x00@\xff\
+&\xf99\x98{'6\x83\xfd\x94\xcf:q\x96\xb0\x82\
+\xe7\x8b\xfbm\x04~\x95.\x9c\xe9\xf9\x99J_A\x8b\
+J\x92\xc4\xafE\xfdeN^N\xc4\xa8.\xc8\x0f\x85\
+\xc2\x0bb\xb2\xa3\x9a\x99\x1c\x1dF\xf5vu\xb0\xb6p\
+\xf2\x08\x88L\xc9\xfd\xbe\x9c\xdd\xc6\x95*q\xe6e\xa4\
+\xdf\x881.5\xdet\xe3\x0a3+\x81v\xd0\xdd\xc1\
+\xdc\xca\xfe]\x0f\xdf\xa0\x88\xf8\xdc\x92f\xf8O~\xd1\
+\xebrq\xaf\x92\xd0\x0f\x19\x04z\xbda\x00Z\xcd\x0b\
+h:\xc6\x95\xa3\xfa\x8b\xa6\xd2\xb5E~}:\xaa=\
+\xe8Q\x11\xcdJF\x8b\x15\xa4e\xe6\xe2)R<\xe3\
+\x07\xa3\xa6\xbf\xed\xad\xbd.\xb6f/\xadU\xb3\xf8\xa8\
+\xa0W\xe2\x19\x8c\x80\xff\xff\x95\x14\x8b\xe8\xfd\xe9d\x06\
+\x1a\xab\xac\xdf\xb2\xc3\xceu\x8f\x8d\x89\x9e\xac\xab\xc0\xe3\
+\x7f\xd5'\xf9\xeb\xc2\xaa\x86?G$\x8fuv\xa4\xe7\
+\xee\xaf\xad\x886-\xb8\x02b\xbds\x9b\xebZ\x1f\x8c\
+IN\xcc\x0ew\xd5W\x16\x9cN\xf4\xde\x0a2\x88\xe7\
+I\xfb\x8d\x0edT\x0f\xcf/+\x83\x95i^\x14\x1c\
+\xfe\x0d\xfbO^\x1b\xc2*D\x84\x01V\xaa'\xa2q\
+L|cE~\xfd#Ux{\xe0\x96\x0c\xaf,@\
+\x07\xe8\xd7\x0b\xaa\x04\xcbgG\xba\x9bkJo4v\
+\xf6O\x02\xc7\xa5\x99\xe3\xf4\xb6\xd6\xb1~\xaa\xa8k\xed\
+\xe5\x00\xb7\x04^\xd9!m\xbeQ|\x82\x0b\xe9~\xc8\
+\x9a\x96\x9a5\xd1p.z\x9f\x93%e=\xa2\xe9R\
+]\xef\x15KG7\xda\xb7\xf5\x80+\x99jdD\xb8\
+9XP\xb4\x91\x8b^Ug\xab\xe5\xae\xc3\xf4\xaa>\
+\xa9\xc9\xbcR\xaa\xb6\xc4?S\x8e\x96\xb7^\x8cs7\
+\xc2\xec\xf5T3\xf3\xcd`\x89\xdf\x1f>\xae\xcc\xf0\xc3\
+\xe8\xeb\xe4\xa3m\x1f\x9c]\x8b\xda\xc3x?\x03\xef^\
+\x0f\xd3o\x13f%\x04\x1b\x9dc\x18\x8c\x18\xe7\x8dx\
+\xe7\xafq9\xd5\x84\xb5Is\x8b\x8f\x9a\xe0\xad\xb5T\
+6\xf80\xc1\x1f\xed\xd9\xebA\xda\xcf[.`\xd5\xbe\
+\x22\xc9\xfa\x11\xee\xe9]\x9f\xbc\xb82r\x01\xeb\x02\x84\
+ms\x13\xd9\xfc\xaflo\xec\x9d\xfay\xe0Z\xcb7\
+_\xd6Oi\xc9\xb7[q9\x8c\xdd\xc5\xb6\x0b+\xf4\
+\xc8IHHHHHHH\xfe?\xfc\x0bC\xdb\x97\
+\xdf\x0aendstream\x0aendo\
+bj\x0a55 0 obj\x0a1397\
+\x0aendobj\x0a56 0 obj\
+\x0a<<\x0a/Type /XObje\
+ct\x0a/Subtype /Ima\
+ge\x0a/Width 128\x0a/H\
+eight 128\x0a/BitsP\
+erComponent 8\x0a/C\
+olorSpace /Devic\
+eRGB\x0a/SMask 54 0\
+ R\x0a/Length 57 0 \
+R\x0a/Filter /Flate\
+Decode\x0a>>\x0astream\
+\x0ax\x9c\xed\xc11\x01\x00\x00\x00\xc2\xa0\xf5Om\x0c\
+\x1f\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xe0o\xc0\x00\x00\x01\x0aendstrea\
+m\x0aendobj\x0a57 0 ob\
+j\x0a70\x0aendobj\x0a58 0\
+ obj\x0a<<\x0a/Type /X\
+Object\x0a/Subtype \
+/Image\x0a/Width 12\
+8\x0a/Height 128\x0a/B\
+itsPerComponent \
+8\x0a/ColorSpace /D\
+eviceGray\x0a/Lengt\
+h 59 0 R\x0a/Filter\
+ /FlateDecode\x0a>>\
+\x0astream\x0ax\x9c\xed\x9byPUU\
+\x18\xc0\xdf\xe3![\xa0\xa0FJ\x82\xb8\xa5\xe62\x94\
++F\x08\x86\x90\xdb\xe4\x82f9\x0e4\x8a\x7f\xb8\x92\
+N\xber\x89HR\xc4J\xd2\xd2\xb1\xb4\x19\xa3L\x91\
+EMMmt2S\x0bw\x13G\x11\x5c\x90\x80D\
+\x0d\x17\x18@\xde\xfb\xfa\xce\x83\xf7\xb8\xdcw\x97s\xdf\
+;\x17\xff\xe8~\xff\xf08\xdf\xf7\x9d\xdf=\xfb\xf9\xce\
+=W\xa7s@\xf4\x11\xe9\xe7\xca\xcd`\x13s\xf9\xd9\
+\xb5\xc3\x1d\xc9\xc81\x09;\x09\x02rbX\x0b\xe1\x17\
+\xd4\x0b\xe1\x01\xea\x8d-\x82_AX\xa6\xe3\xeb\x97\x1b\
+m\xb2|\xfd\x09\x13IMn\x01\xfc\x9b\xa4\xdd\xb7\x05\
+\xf3\x93\xbbl'\xfd`\x92\xeax\xefr\xc4\xcc\x15\xd2\
+\xcc\xc7\x07+}Fm\xfe\x07X\xccTaU\x1a\xaa\
+\x16\xab\xcd\xbf\x08p\xdbSX\xe5U\x02pNe|\
+\x10\x96q\x85\x98\xf2\x13T>\xaf.?\x02\x11\x91b\
+\xca\xd7P\x19\xae.\xff-D\xf4\x14S\xf6D\xe5T\
+u\xf9\xf1\x88\x08\x16S\x06\xa32^\xe3k|\x8d\xaf\
+\x8a\x04\x0c\x8a\x22s\xfc\xb4(\x11\x99\x86\xca\xb4\xa8\xc1\
+\x01\xaa\xc0[']\x13\xdev\xd8\xcb\xb5$\x1f\xe6\xf8\
+\xb0rZ:\x91\xb20\xc6\xf8\xc8Z%x\x80\xda\x08\
+\xa6\xf8g\xefb\x9e\xb7\x96\x8c\x15ky\xae\x8cYt\
+\x09\x8d+\xda\xb3\xe4\x7f\x819\xe6x\xd1Z\x1b6\xa0\
+\xf9Z\x86\xf8V\xf7\x01.{\xd0\xdb\x1bN\x03\xdcs\
+e\xc7\x1f\x82\xe5\x99\xa9\xc4\x81L\x13\x83\xd8\xf1'a\
+v\xfd\x948\xf4E\x87\x89l\xf9}\x9f\x22\x9f\xd4\xff\
+\x0c%\x0eql\xeb\x9f\xf4\xbf|wz{\xc3)\xb6\
+\xfd\xcf2\xfe\xb2D\xb6\xdd\x02\xf8/\x19\x8f?\x9d?\
+\x99\x7fn\xbe?\x9af\xfe\x19\x95x\x91\xf9\xfc\xa3\x1b\
+\xf1t\xe7_\x9d.\xfc\xe9\xae?\xb8\xfe&\x17\xd1\xd2\
+\xd5X\x7f\x89t\x0a\xa5\xd9\x7f\x0cUg\xff\xd1 \xff\
+\xeb\xfd\x9f\xc6\xd7\xf8\x1a_\xe3k|\x8d\xaf\xf15\xbe\
+\xc6\xd7\xf8\x1a_\xe3\xb7 \xffC9~\x92\xaa\xf8\x8e\
+\x0f\x00\xaaD\xcfA<\xab\x00\x1e\xaa\x19}\xea\xb6b\
+\x09\xe7\x89\xab\xe7\xa1\xfa;\x15\xf1\xa1f\x80K\x12\xe7\
+J\x86\xf3\x00\xe6WU\xc3\xbb\xfc\x89\xe5\x8b\x90\xb2\x08\
+\xc3\x07<kP\x8b\x9f\x80\xf8\xed\xd2&;\xd0$A\
+%\xbc\xdf\x1d\x80\xea\xce\xd26\x9d\x1e\x03\xdcm\xa7\x0e\
+\x9f\x1c\x02.\x933Z\x8eF\xe9\xaa\xe0_\xac\x03(\
+\x92=\x84w/\x00x\xd2_\x0d\xfeA,\xd9\x1b\xf2\
+f\xe3\xd1\xec\xb0\x0a\xf8\xc9\x98\xef/4\x86?\xa3a\
+,s\xbc\xe7\x0d\xacW\xaa3\xf8\xde\xd8N\xc5\xcc\xef\
+\xa1$c\xa9>\xa53\xfd\x0cM?b\x8c\x0f\xc2\xa9\
+\xbd\xbc\x0d\x9d\xadO)\x8e\xd3.l\xf99J\x96\xd6\
+w\xd08\x8b)\x9e\xdc,9\xedBk\xad\xff\x03\xcd\
+c\x18\xe2]/\x02\x98\x86\xd0\xdb\x0f0\x01\xe4\xb7b\
+\xc7_\x88\xe5\xd9\xac\xc4\xe1[tHd\x86\xf7\xff\x17\
+\xe0AG\xc5\x1e\x1dX\xf1\x1d(\x0d\xa9\xb1o\x18\xe1\
+Ik^V\xd8\x9a\x96\x1e3\x98\x09\xde\xb2\xeb\x88\x92\
+\xb3\xf2\xe8\x15>e\xd6{\xc6$\xe3\xa2Y\xb1a=\
+\xdcu#\xd1\xe9\xa4\x9e\x05\x9f\x8c\xe6l)\x83\x0e\xe3\
+S\xf7_75{\x03S_\x90[\x89\x7f\xe2\x18\xe0\
+\xdb\x94K\xcdf\x1e1\xeb$\xaee\x94\xb6v\x9eO\
+fs\x91{\x9d\xdd\xe7\xec\xad\x12\x87\x13Y\xe34\x9e\
+\xacf\xf0\xcf\xbe\xe4\xf1}\xb8\xdb~\xf7\xde\xe3\x96\xee\
+.\xb3a\xccWw\xac\x9c\x11\xd9?\x88\xbc\xf6j\x1d\
+\x18\x12=3-\xb7\xc0\xa2\xa8\x15\xbd+G+\x878\
+\xb5y\xe1\xe8\xee\xcc\xcc\xcc\xac#\x17J8\xadm\xca\
+K\x1e\xe9+\xe0\xd8~\xecW\xa8=\xe0$~\x82t\
+\xfdVl\x9b\xee/\xee|\x04\xa8vL\x12\xe2q\x1d\
+w\x1d\xb1\x0b\xb6\x17\x0b\xb0\x8b\xb3\x16\x0f\x96^\x92\xfa\
+=\x01(Tpm\xc3^\xc8nv\x1d\xf9\xe174\
+n\xc5\xe6]\xc7\xce\x14\x15\x15\xfd\xf5\xdb\x9e\xad\x1f\xc7\
+\x87K\x94\xdb&\xeb\xd0}\xa9\x13x\xb2\x9b\xbf\xe7\xc4\
+n\x9eD\x0cU2\x11\x83\x94d\x82\x93\xd1\xcc,\xcc\
+\xe0G\x87\xbd\x95Ds\xfe\x03C\x03\xed#S\x97<\
+\x90\x89\x18%\xc4p\x816\x9a\x0dH)$=\xf2~\
+\x86\xdd\x15|\xb9\x88YJh\xa3y}\xe2#\xdb\xa0\
+\xd8\xe9\xc7Sf`\xe2\x1c\x87\xf0m\xef\xd2\x9df\x18\
+2\xb8\xa3\xb2\xa0ks\xeds\x0f\xb0^\x1c\xba\x8b\xb1\
+\x09\xe8\xae\x93\x93\xb0\x14\xae\xa7L\x1e\xb5\xf0\x00\xb9\x9a\
+\x7f\x99\xb7K7b\xdaF\x07\xf0/\xd5\x03\x5c\xb3\xbb\
+s3p\xdb\xd5\x9a\xd2\x9d#9)\xd1\x08\xad_\xd6\
+0\x11\x0d'k\xe1\x96\xe6\x1enWp\x8e\x1e\xa8\x18\
+\xaf?\x8aY\x8d\xe6%Z.\xd6\x10\xf9\xa1i1:\
+\x8d\xffN\xb7\xfe\x13t\x1b\x1f\xa6Os\xa7h48\
+\xaex'2\x1d\xbd\xf6\xf0\x13\xb7\xd8\x9a9\xc7\x9a\xe1\
+\x80\xe6\x9d4\x06\xec\xc3\xb4\x9f0m\x9aB\xbc\xf7\xdf\
+\xb8x\xbe\xc0K\x1cA\x96\xbb]\xa99\xe4\xfb\x93\xb7\
+\x1b\xd3\xc8\x81\xe0\xcb\x1c\x9b\xb3\x00Wxn\xddj\x00\
+\xca\x14\xeeDR1\xdb\x95\xfcD\x8c\xac\xeb\xc7\xe1\xdf\
+\x88j\x80\xbc\xc64\x9c\x22osm>G\x1b\xfe\x94\
+\xb5\x0a3[\xa5\x08\xdf\x1d\x1f\xb9\xc4\x9b\x97\xd8\xea\x91\
+\xb5sa\x9777v\xf3C\xbco\x1ef#\x8b\x1f\
+*x\xdd\x12\xa8LI\xd9\xc7\xa9a\x9b\xb4\xb3\xad\x06\
+\xe4\xa2M\xaf\x86Dl\xdc|\xae\xd1bT\xd9mG\
+\x88\xfdA\x05\xf8\xb1h\xff\xbb]\x97u\xc3\xd4\x14\xcb\
+\xafeM\x10R\x15\xdc\xe9%\x1bWL;O\xfd\xaf\
+\xe80\x86\x1a\xefvUx\xc8\x9e\x01\xb8C\xea\xb6=\
+\xee\xfc\x8a\x1b\xd3&b\xce\x8b\x9aL\x02\xaa\x05\x86\x8d\
+N\x17\x82]\xb6\x90\xfa\x02\x1f\xf9\xc6f\x83@z\x22\
+\xa6\xdfHx%\x01\x9b\x13\xac\xdfZy\xdd\xc3H\xaf\
+\x93\xd5B\x9f\x85\xaa\xc9\x02\xae\x1b9.r\xd2Al\
+\xcav\xcb\xb3\x8d\xff+\xb6\xf1D\xda\xa2\xa8{\xc3o\
+W\xb2\xe5\x14\x5c\xee\xdaV\x00<\xa2\xfc6\xe6{\xcc\
+d\xb6\xa0&\xb8\xd0\xba\xf7\x0b\xb6\xa5\xb9\x93\xdb~\x0f\
+W\xf70\xe8|\xa6\x92\x9fu\xc2W\xdf\xe6\xa0*\x83\
+\x0a?\x08'\xf4\xf3\x22\xbb\x0e\xdf5\xe4\x1a^\xe5F\
+n\xedt.\xb1<RM\x99\xe5\x83@\x93\xc8=Q\
+\xcb\xd18\xd52\x90\x8b\x86\xe2_\xf1\x18B\x22Bx\
+\x0f\x17x\xaai\xf9\xad\x14j|\x8b\x84\x9be\xc2\xc8\
+F\xf1\xabU|~\xe9:\xffV\x03\xbdfs\xa0\xb8\
+\xd5a\xd4S\x9c\xa0\x8d\x16\xe9\xc1\x92b\x18f\x5c\xbf\
+)e\x92\xe4$?\x053\x8e\x96\xcf\x8a\x0c\xb2\xae\xf2\
+f\xca\xa5\x1bH\xbe\xbb\xb1\x0a\x19ON\xc5,b\xe2\
+\x89\x19/\x917{\x17$\xde\xb09#]\xe9\xcaO\
+\xda_\x95\xcf(c1\xe3\xd7\xe5\xcd\xda\xd69\x1f5\
+\x0b\xcaA\x5c\x84\x85\x02u\xbe\xec\xc1\xf1?\x81=~\
+\x02\x8e\xff\x5c\x1aC\x12\xb2T\x86\xb2\xc6\x87Vb\xb1\
+\x86R\x99~\x8d\x0dU\xbb\x84\xa6\xaa\xa8\xc5wi\x1d\
+}\x18\xe0y\x9c\xcce\x8f\xf7\xa6\x1b\x19I\xfa\xde\xc7\
+$\xc7c\xb4\xc3\xda\xe7\x00\xa8 \xfb\xe9/e\xbb\xcc\
+\xab`M\xbf3WQ\x08\xe2\x1d\x9f}\xb3\x9a\x15\xbb\
+\xfafv\x9c\xd8\x0b\xa9\xff\x00\xb8I\xf9|\x0aen\
+dstream\x0aendobj\x0a5\
+9 0 obj\x0a1797\x0aend\
+obj\x0a60 0 obj\x0a<<\x0a\
+/Type /XObject\x0a/\
+Subtype /Image\x0a/\
+Width 128\x0a/Heigh\
+t 128\x0a/BitsPerCo\
+mponent 8\x0a/Color\
+Space /DeviceRGB\
+\x0a/SMask 58 0 R\x0a/\
+Length 61 0 R\x0a/F\
+ilter /FlateDeco\
+de\x0a>>\x0astream\x0ax\x9c\xed\
+\xc11\x01\x00\x00\x00\xc2\xa0\xf5Om\x0c\x1f\xa0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0o\xc0\
+\x00\x00\x01\x0aendstream\x0aen\
+dobj\x0a61 0 obj\x0a70\
+\x0aendobj\x0a62 0 obj\
+\x0a<<\x0a/Type /XObje\
+ct\x0a/Subtype /Ima\
+ge\x0a/Width 128\x0a/H\
+eight 128\x0a/BitsP\
+erComponent 8\x0a/C\
+olorSpace /Devic\
+eGray\x0a/Length 63\
+ 0 R\x0a/Filter /Fl\
+ateDecode\x0a>>\x0astr\
+eam\x0ax\x9c\xed\x9bklTE\x14\xc7g\xbb\
+\xb4\xb4\x9b\xda\xda\xc4\x80U\x0b\xe5!5\x81v\x8b-\
+\xb1E\xd3j\x5cC@\x08B\xdc\x0fH\xa1\xa9\x09\x8f\
+\x90\xd0\x84\x88\xb5\x1fJ\x13AM\x0d\x1a\xbe\xf8\x08\x9a\
+\x12!\x11\x81\x14I\x88\x84\x10\x91\x00\xf2\xe8\x07\x88I\
+)\xe1Q\x88\xc4XR\xbaKi\xd5HA\xf0p\xe6\
+>vg\xf7\xce\xba\xb3\xf7\xde\xd9E\x9d\x7f\xd2\xce\xf4\
+\xcc\x9d\xf9\xfd\xbb;\xf7\xdcso\xb7\x84()))\
+))\xfd\xa3\xbc\xdb\x07\x87\x044\xf8\x95W\x0e\x7f\x1e\
+\x08j\xae\x1c~\x83(\xbfA\x1e\x7fkG\x12m\x95\
+\xcb\x9f\x9a\xec\xa0\xa9\x8a/\x9b\xefk\xe6\xbf\xf5\xcd\xbe\
+\xf4\xf0\xb7%\xda\xf7\x9d\xe9\xe1\x9fK\xc4?\x97\x1e~\
+o\x22~o\xda\xf8{\xac\xa3{\x14_\xf1\xff\xa5\xfc\
+iM+\x05\xd4\x89K\xb7a\xdb\x0fp\xc6:z\x06\
+\xa0\x1f\x9b6\x9a\x87DVkz:\x82/\x1fM~\
+Mw_\xa3\xd3M\xfe\xdaL\xe0\x01\xd6\x9a\xfcu\x99\
+\xe1\xafc\xf9\xfe\xc9i\x95?\x9e_\x98\xea\x9eu\xa6\
+B\xc5W|\xc5W\xfc\x87\x8d_\xf0\x86\xf5R9G\
+\x1fz\x99^5'J\xe6\x1fKx\xa5X\xa5u\x87\
+\x8a\xe4\xf2\xff\xe0\xf1\xb5r\xe7K\xbd_-\x97\xbf\xe9\
+\xbe\x15\x7f\xab\x8e\x8e\xd4\xdc\xa4\xfd\xef\xc7\xc8\xe5\x93\xbc\
+\x22\x8b\x0c\xa4\x17\xbb\x8f\xb8B\x7f\x88\xf7\xff\xff\x95\x9f\
+\xe9\xfa+\x03R|\x86\xdf\x18dDo\xa26\x05\x83\
+\x1d\xd8\xb4\x06\x1d\xe9\x1d\x5c\xa2#\x18\xdc\x88\xcd\x066\
+\xbe<\x9e\x1f\xb3\xff\x9f\xc7\xc0+\x84,\x00\xc7\xe9\xb6\
+\x0a\x97X@H\x00\x9b\x17\xd8x\x81\xe2+\xbe\x8b\xfc\
+\xac\xb2\xc0\xebuOe\x8a_\xd5yK;\xa3\xfb\xde\
+}<\x03\xfc\xa2\x9d\x7fGrJ\xa8\xc4-~K \
+\xd0\x16\xcb\xcf\xae\xe5\xd6~eW\xd9\xa4\xb6\xd4\xcao\
+\x0b\x04ZR\xe7\x1b\x8a\xf2=\x87a\xa0\xd2\x8a/\xfd\
+\x95\x1ev\xbce\xf6\xa2\x10\xb6\x83\xe3\xac|C)\xf0\
+\xab\xa3\xb3\xca#\xc1\xf1\xf8S\xd8b`\xcc)\x0c_\
+\x9d\x87W\xf4n\x8a\xaf \x9e\x99\x8f2\xc33\xa2+\
+\xcd\x12\xe7\x8f=kN:\x15-7=?\xf0\x0c\xac\
+\xc6\xe0\x95b\x03\x1f\xaa \xbeC\x10\x9e\xcc\xd8;m\
+\xaet6G\x9cOr\xfcU\x9a\xfc\xd9\xec\x9c\xd3V\
+\x03\xde_\x00\xfe\x9c\xc2\xe0\x8f`\xfb\x19s@\xb6\xb9\
+R\x0c>\x19\x9f/\x8e\x81z\x8c|DH.\x1d\x09\
+\xf9u<\xfc\x96\x93h\x05g|\x8e\x81\xf700\x81\
+\x90%,\x1e\xa0V\x12\x9f\x14\xc6\x1b\xd8\x07p\x1d\x9b\
+\xf5\x18~V\xc7\xdf\xc6\xaf\x15\xb2\xf8\x16\x03H<\x81\
+\xcd\x07\x00w=\x1a~d>~k\x95\xc6\x8f7p\
+\x18\xa0\x07\x9b\xcf\x01\xee\xfdt\x83\xe2k\xc6\xb1+\xbb\
+\xcf\x8f3\xb0\x0d\xef\x88\xf1\x1c\xd9m\x9cd#5Z\
+\xaa]\x22\x91\x1fk`\x0d\xf6_%\xe4\x8b\x08\x9e|\
+\x8c\xed$\x99\xfc\x18\x03\xe5\xd8\xddA\xc8\x84\x03\xbd?\
+\xee\xdf\xbe\xf9\x19B\x8aG\x00\xce'_\xc3\x09\x9f1\
+\xa0\xa5\x9d}\xccP\xd6^\x0c4K\xe6G\x0ch\xf8\
+\xf0\xf4\xe8@\xf6N\x0c\x5c\xce\x95\xcd7\x0c\xd4w\xeb\
+i'o\xc3\xfb3i\xd4\xb3\xa8\x07\x03w\xea\x04\x16\
+p\xc8\xd7\x0d\x00\x93\xf5.~\xdby0L\x03\xf7\x1b\
+E\xe6;\xe5\x9b\x06\x98\xa4k\x9c\x02\xaf\x09Mw\xcc\
+'%\xda\x1f\xad\x96\x92\xc7X\xfc\xbdo85\xa8\x14\
+\xbe\xb6\xf5p\x0f\x1c\xd4\x9eWm\xec8\xda?\xd4w\
+`}\xa9\xe8t\xc7\xef\x7f7\xfb\xa2c\xd6Om\xba\
+\xe3\xfd\xaf\x9dxuQ\x13w\x16\xa6\x93\xaf\xe3+\xc9\
+\xa7\xd8|\x17\x98s,u\x03\xce\xf2\x9f\x81\xf7a\xc5\
+{4\x0b\x8b\xb0\xafS6\xe0(\xff\x9bxZ\x90\xbe\
+I#\xa9\x1bpr\xfdc\xf1\xf06\xb1e\xc0\xc1\xf5\
+?\x06\x0f\x83O\xd82`\xbf\xfea\xf1\xf4\xbe\xefB\
+\xb1\x1d\x03\xb6\xeb?\x8a\x1f\xaa&>,\xbc`\xb8\x9e\
+\xde\xa7\x5c2^\x81\x1d\xd8\xbf+\x96}\xed\xd7\xbf\xec\
+o?\xfc\x1c\x99x\xcd\xe6+`\x8f\x1f\x8f\xc7\xbbO\
+\x8b\x01\xb1Lh\x8b\xaf\xe3\xfd\x0c\x9ec\xe0\xf72Y\
+\xfc\x02\x0e\x9ec\xa0K\x16\x7f7\x0fO\xc8$\xd6\xc0\
+I\x80\xd1|9\xfc\x19|\xbci@\x7f\xf2\xb3\x18\xbb\
+\x9c\x87\x14n\xf0W\xe0Q\xb39\xf8\x18\x03A\xecU\
+\xc8\xe1\xd3G\xc6/\xe6s\xf0\xa6\x01\xcc\x03cq\x8b\
+\xdc\xf6\xc9\xe1\x97\xfc\x85\xf5\xd50\x0fo\x18\x08\xb5\xbf\
+E?\x9a\xb8K\x00ok\xff\xb5\xeb\xa5\x06\x07o\x18\
+\xd0\x87\xa7\xc8\xe2{?\xa4\xb5\xde\xcfU\xdc\xc1R\xe3\
+S\x997_\x12\xc1\xdb\xcc\x7f\xfe\xf6\xcd\xcb\x12\xdd\xdc\
+\xf8Z/\x02\x0c|\xf2\xa4\x10\xde\x85\xfa\x9b\xa3\x5c\x91\
+3_\x22?\x05)\xbe\xe2\xc7\xf0\xb7$\xfb\xc7\x02w\
+\xb5%\x9e\x9f\x01E\xf8\x8d\x99\xe1/7\xf9y]a\
+\x91\x7f\xacqW\xe1.\x81\xc7DJJJJJ\xff\
+U=\x00a\xb4[\xbd\x0aendstrea\
+m\x0aendobj\x0a63 0 ob\
+j\x0a1219\x0aendobj\x0a64\
+ 0 obj\x0a<<\x0a/Type \
+/XObject\x0a/Subtyp\
+e /Image\x0a/Width \
+128\x0a/Height 128\x0a\
+/BitsPerComponen\
+t 8\x0a/ColorSpace \
+/DeviceRGB\x0a/SMas\
+k 62 0 R\x0a/Length\
+ 65 0 R\x0a/Filter \
+/FlateDecode\x0a>>\x0a\
+stream\x0ax\x9c\xed\xc11\x01\x00\x00\x00\
+\xc2\xa0\xf5Om\x0c\x1f\xa0\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\xe0o\xc0\x00\x00\x01\x0aen\
+dstream\x0aendobj\x0a6\
+5 0 obj\x0a70\x0aendob\
+j\x0a66 0 obj\x0a<<\x0a/T\
+ype /XObject\x0a/Su\
+btype /Image\x0a/Wi\
+dth 128\x0a/Height \
+128\x0a/BitsPerComp\
+onent 8\x0a/ColorSp\
+ace /DeviceGray\x0a\
+/Length 67 0 R\x0a/\
+Filter /FlateDec\
+ode\x0a>>\x0astream\x0ax\x9c\
+\xed\xdbKHTQ\x18\x07\xf0\xd3\x80\x8f\xc9L\xc2\xa2\
+\x08J\xa4\x10\xdb\x0d\x11\x19\xaet\x11$\xa6i`e\
+n\xb5lg\xab\xc2\xa8\x09\x22\x10\xc4j\x19TP\xbb\
+\xc2W\x9b\xa0\x95\xf4\x82\xa0\x85!m*_4\xe3#\
+tF\xa3|\x84c\xde\x9c\xa6\xeb\xdc3\xf7|\xdf9\
+\xf7\xce\xb9s(\xce\xb7\xd2{\xff~\xbf\xa3\xf7u\xe6\
+\x8cC\x88.]N\xaaz\xc2\x00*\x5c\x95\x09?\x0c\
+\xf1\x86\x11\xca\x84\x0f\xf3\x86\xa1}\xed\xff\xcb~\xdd\xf4\
+t\xadB\xdf?k\x18\xb3~u~K\xbcG\xb3:\
+\x7f(\xde\xe3\xc3&U~e\xa2I\x85*\xbf/\xd1\
+\xa4W\x91\xbf7\x96h\xb2Z\xac\xc6\xef0\xbbt(\
+\xf1\xfd\x11\xb3\xcb\x5c\x9e\x0a\xbf%\xd9\x06\xbd\x04\xbd\xf2\
+\x87\x92m\xd0K\xd0#\xbf\xd2\xda\xa7\x22\xf3~\xaf\xb5\
+\x0fv\x09:\xf6\xb7\xb5>\x0d--\x8eu\x9f\xcbG\
+\xba\x16\xadZ\xfb\xac\x16I\xf3\xf3n\xfe0\xf7~\xbb\
+\x01?[:\xe8F\xc8%\xe8\xcc/\x1b\xb1\xee\x1f>\
+\x04u\x9d\xa6\x1bMI\xf2\x1b\x96\xe9\xc0\xe2I\xa0\xeb\
+\x0c\x9d\x9b\x91\xe37\xc4R\x13\xb1:v\xd7~:\xd6\
+/\xc5/\xffi\x8f,\x973\xbb\xb6\xd1\xa96\x19~\
+\xe1\x14+\x13\xde\xce\xea\x1a\xa0C\x01\x19\xfeCv\xa8\
+\x8f\xd5\xd5\x17\xb5F\xa2>\x09\xfe\xd15 \xc5\x9cb\
+R'\x00r\xf8\x85\xfd\x9cQ(5\x9e\xcdhK\x9d\
+\x00\xc8\xe1\x17\xf6\x9b\xe1\xd8\x05F[\xea\x04@\x0e\xbf\
+\xa8\xef\xfb\x08\xc7\xc2Y\xf6\xb6>\xcb\x1dh\x0a9\xfc\
+\xa2~=\x96;\xcd\xe8[\xb3\xb1\xae0Q\x8d\xf0\xa2\
+\xfek,\xf7\x0a\xe9\x8d\xd9\xf1\x12[\x7f\xd8\x03\x9d\xfc\
+\x89\xda\xef\xde\xaf\x02\x07\x10:\x96L]Dy\xa3\xdd\
+\xbd/Vop\xff\xbd\xc7\xfe\xee_\xb8\xbf\xb6\x0b\xf4\
+\xcd\x1am\xc7\xe6+\x9cj\xc4y\xc3h\xe2\xfa\x86\x11\
+q?\x82;<\xff\x81\x80o\x1bAI'\xb8\xf6g\
+\xd6\xe4\xad\xd2x\xf2-/7$\xe4\xaf\x8f\xe0\x8a9\
+\x82\x9c3\x03\xf85e\xd6\xcb\xa6\xdc\x1c\xc6\x83\x9f\xae\
+\xd8f1\xdf\x1cAI\xe7\xac\x10\x9e\xf8\x91\xc7\xfc\xcc\
+aQ?>\x82F\xc1_\xddA1O@\xd9\x08R\
+A\xc5\xfe#\xc5\xfes\xc5\xfe\xa0b?\xac\xd8\x8f*\
+\xf6\x17\x14\xfb1\xc8\xff\xfb\xe5\xd6\xabQ^\x0bO\xfd\
+\xf8\x08\xe6<\xf4\xc1\xbf\xbf\xe5\xdb\x82k\xf4\x08\x84n\
+\xc2\x82wj\xf0\xfc\xa36XG\x10\xe9*\x15i\x5c\
+\xda\x15\xe1\x87\x18\xef\x95%\xdf\xd7\xa3\xde\xc7+\x08\xce\
+\xff\xd9\xb8\xfeT\x15;?\xd7\x9f\xd4g\xbf\xf2c\xb6\
+\xfb\x8feZK\x8f\xad \x18\x9e\xbc}`\xe3\xef\xc3\
+\xf7\x09y\xc6\x8f\xd9\xee\xbf\xa9=\xa0\xe3#\xe2\xdf\xe3\
+\xc7l\xcf\x1f\x99~\x90\x1f\xb3=\x7fe\xfa\xdc\xe9/\
+c\xfe!\xd3\x0f\xf0c\xb6\xf9\x97L\xdfo[\xf7J\
+\xad\x98m)R\xa6O\x06y)\xfb\xfc[\xaa\x7f\x97\
+\x97\xba\xef\xad\xef\xe2\xf5\x97T\x7f\x07\xef\xf5\xe7No\
+}\xf2\x0e\x0f1f\x7fr\xfdKx\xe8\xb2\xd7~1\
+\xfe\x18\xde\xe7\xb5O\x06\xb0\xcc\x0bNo\x09~\x03\x96\
+9\xe5\xbd\x9f5\x0eGB\x8c\xf5G\xd9>9\x0fG\
+ZY\xbd\xc1\xf9\x87K?{\x18J0\xd7\x9f-\xeb\
+z\xd6u<\xf7>9\x0e%j\xa0\xf6\xdcr\xe4\x93\
+nv\xa0\xc75\xef\xd0/d\xaeV})\xcc\x94O\
+\xca\x96\xec\xbb\x97\x8f\xb8\xe7\x9d\xfa\xa4~%u\xef\x8a\
+\xfb\x83\xef\xc2'\xb5)\xef?.\x9cH\x87w\xee\x93\
+\xc0g\xeb\xbeO\x07\xd3\xe2]\xf8\xc4\x1f\xfcn\xee\x99\
+\xbf\x9e\x9b\x1e\xef\xc6'$\xbf\xa5glqa\xe4I\
+\xf3\x964u\x97\xbe\xc4\xd2\xbe\xf6\xb5\xaf}\xedk_\
+\xfb\xea}h\x9b\xf6\xb5\xaf\xfd\xff\xcbg}\xee\x8b\xe5\
+{\xf590\xd6\xbf=\xb1}o>\x07\xc6p \xdf\
+\x93c\xa0}\xedk_\x9d\xcf\xb8\xff\x84\xb0\xed\xb2\xcb\
+\xfe\x7f\x9f\x89ubh\xbb.]\xfc\xfa\x0d\x09:b\
+4\x0aendstream\x0aendo\
+bj\x0a67 0 obj\x0a979\x0a\
+endobj\x0a68 0 obj\x0a\
+<<\x0a/Type /XObjec\
+t\x0a/Subtype /Imag\
+e\x0a/Width 128\x0a/He\
+ight 128\x0a/BitsPe\
+rComponent 8\x0a/Co\
+lorSpace /Device\
+RGB\x0a/SMask 66 0 \
+R\x0a/Length 69 0 R\
+\x0a/Filter /FlateD\
+ecode\x0a>>\x0astream\x0a\
+x\x9c\xed\x9d[p\x1b\xd5\x19\x80-\xc9\x92e[\xb6\
+l\xc9W\xc9\xb2\xe4\x9b|\x91\xecX\x96\xe3\xc8v\x1c\
++v\x9cd\x08&qb\x91\x98\x5c\x5c\x92\x18B\xec\
+\x86&\x0d\x04\x9a\xb6\x06\x03\x0d\xc9\x84\x94\xcb@b\x12\
+f\x80v\x18 e\x08i\x13\x0a\xa5\x05\xa64\x94\xa4\
+i\x01\x97\xa6\x86\xd0\xe9C\x99\x96\xe9C\xa7O\x9dv\
+\xca\xa4\x7f\xd9\xf6\xe8hW\xbbZ]v\x8f-\xff\xdf\
+\xfc3\xb1v\xcf\xeeY}+\x9d\xfb*\x19\x19\x08\x82\
+ \x08\x82 \x08\x82 s\x85\xce\xc1-\x09\x07\xebk\
+O\x07\xd0?[\xd0?[\xd0?\x82 \x08\x82\xa8\xcf\
+\xb5+S\x09\x07\xebkO\x07\xd0?[\xd0?\xc1\xea\
+rC\xa8\x9c)\xfa'\x04'\xa6\x82\x13\xf7\xaa\x9c\xa9\
+\x98\xcfx\xb7\xcfw\xb2L\xf9c/^\x1e;}\xd9\
+\x98W\xa0f\xbe\xe8\x9f\xc3\xb7a\xe7m\xaf|\x04\xe1\
+\xdb\xb0C\xcd|\xd1?\xa0\xd1\xea\xb6\x9c|\x9d\xf3\xbf\
+\xf5\xd4\x1bZ\x9dN\xb5\xac\xd1?P\xdd\xb9\x82\x93\xcf\
+\x05\xbcT-k\xac\x7f\x81\xb5\x0f<M\xfb\x87\x97\xaa\
+e\x8d\xfe\xa1\xcdI\xcb\xe7B\xb5\x86\xe8\x83\xc3]\x17\
+O\xdc\xfc\xc5\xcc\xbd\xf2\xb5Cb8\x04\x0eT\xe7\x0a\
+\x95\x06\xda\x9cB\xff*7Ds33{\xec\xa5\x93\
+\x83\x1d\x17\x1e\xdb&v/f\x9f\xdf\xfd\xc8\x96\xe0\xa0\
+\xbb\xb2PoP\xf3\xda\x94f\xf8\xd8i\xa1\x7f\xd8\xc8\
+\xeaz\xa6w\xae\x10\xca\x87\x8dJ\xe7[d0\xecu\
+\xd5\x9em\x0b\xcct\xf7C\xc0\x1f_s\xd6X\x95\xbf\
+\xd7\xdd;\x0e\x08\xfd\xc3F\xa5\xf3\x15\xe3\xea\x0f&\x84\
+\xfe?9=\xae\x5c\x8e\x9a\x8c\x8cQ{%8\xfft\
+\xd9J^\xc0\xc6m\xb6J\xe5\xb2\x06\xaa\x02\xfdB\xff\
+\xb0Q\xd1L\x09\xabk*\x0a\xf4z\xf2\xb2\x22'G\
+\xac\xd8\x87]$\x19\x1c\xb2\xcaeO\xc9\x05\xe84\x9a\
+\x87\x1a\x9a\x85\xe6\xe98Z\xef\x85d)\xc9NH\x96\
+\xc9\xbc\xeb\xcc\x0c-\x1f^\xc2F\x85\xb2\xe3\xf1\xbf\xfa\
+\xf4\xf8\x7f\xeb\xd3\xd5\xd5\x15\xb7\x06\x9a\xc4\xfc\xc3\xae\xd5\
+\xd5v\xba\xbeN>wp\xfaHc\x8b\xb4|.\xe0\
+\x1e)u\x0322B\x0f\xbfD\xfb\x87\x97\x8ae\xc5\
+\x87m\xfbs\xbc\xb2Z\x8e|.v9\xaa\x92\xcf1\
+*\xbc*@\xcd\xc2\x9f\xa1\xff\xd6<\xf3\xc7=\x03\xf2\
+\xfdC\xe2\xe6\xbc\xfc\x94\xbc\xeb\xb9\x03+\xffP\x9e\xbf\
+\xd6\xde%_>\x17\xe7\xfd]\xcaU\x04L`\xe5\xff\
+\xa6rG\xbc\xf2\xb9\xd8T^\x91\xaa\xf7\xbe`\xc9\xd2\
+j\xdf\x0d\xf4\xf2\xc4\xce\xf6\x0c<P\xd7\xe4\xcb7\xe7\
+\xe8t\x10\xbe\xfc\x02x9+(\xa0.\x04z\x0dZ\
+-\xebw0\xbf\x81\xcf0\xcf*\xdc\x8e\xa8e{K\
+\x9e\xf9\x97\x82;\x15*KM\xd3w\xc1\xf2\xe3\xc8\x92\
+\xff7]}M\xa6<\xb1\xc4\xf5\xb9\xa6\xcb\x9d\xcby\
+\xb5\x80\x9aW\x9bf@\xb3\x87\x96\xf9\xc9\xb2\x81vs\
+\x8c)\xbf%\xe6\xc2\xab\x91_\x01\xaf)\xdd\x1aB\xaa\
+1Y\xdb@\x9b\x84B\x9e\xde\xeb\xb5\xdb\xee\x1b\xbaa\
+jh\xd0c+\xa7\xb7\x1fr{\xe8\xa3\xbeU\xd3\xa0\
+\xeeU\xa7\x0fo.^J4^\xeeZN\x8f~4\
+\x94\x97\x1d\xdfv\xd3\xf4\xe8f\x08\xf8\xa3\xbe\xac\x94\xec\
+\x82d\x90\x98\x1c\xf8\xc6\xe2\xa5,\xae}\xdeS\x99\x9d\
+C\x7f\x8c\x0fT\x85\xa79\x8cz\xfd\x91\x1b\xd7s\xf2\
+\xb98\x1cZo\xa4\xee\xce]\xd5n\xfa\xd8\x0ac6\
+\x8bw0\xbf\xd9l\x0b7\xfb\xa1Hwe\x87\xc7\xf4\
+\xae_\xd4L\xcb\xe7\xe2\xba\x16/I\x00\xf7\x0e*\x0b\
+\xec\x08$\xc3\x09O+\x11\xf8L\xb3\x9fl\xd7\xebt\
+\xdf\x1d\x09\x09\xfd\xc3F=\xb5\x1a\xe1{-\xed\xe4\xf0\
+'\x9a\x16\xb1x\x07\xf3\x1b\xba%9j\x0f\x0f\xec\xb7\
+\xbb\x9cB\xf9\x5c\xb49\xc3\xc9\xb6\xdb\x9d\xe4\xf0K\x9d\
+A\x85.\xf2\xaf\xe7\xb6\xf3B\xa1\x8cT\xc6\xaa7\xd0\
+\x05x]\x8e\x89\xec\xda\xdd\xd7+\xe6\x7f\xd7\xf2e$\
+\x19\xf4\x05\xe83\x14R\xb5C\x0a\x91\xf6\x7f\xdf\x9e~\
+\x8by^V=\xd0\x8c'\xea\xde\x0b\x04\xc98\x9aV\
+\xa3yx\xe4F1\xff\xb0K\xfb\xff17\xf8\x87\xee\
+\x0e/6\x17*q\x9d\xd2\xfe\xaf]\x99\xfa\xfb\xa5\x83\
+q\xdd\x05\xde\x90a\x02Cm\xff\xfe\xed=]\xbep\
+9\xe00f\xffn\xe9\x0a\xe2aeQ\x89Dv\x04\
+z\xccm\xda\xe3#\xdb\x9dV\x8b\x98|.\x1c\x96\xb0\
+\xe7'=>\xa5\xab\xe0\x98\xfe\xb9\x90s\x17,yY\
+\xb7\x0dy/Lo\x88z\x06\xf9qh\xdf\x00}\x86\
+\xe3M\xe1jt\xb6g\xc0\xa4\xcb\xa4\xf7Bv\x90)\
+d\xcd\xbb\x18\xe84\x91\xa3\xa01I\xb6\x07\x1b\xdc\xd2\
+\xfe{\xeb\xebH\xe2\xbb\xa9V\xe8\xc1\x9azyF\xe3\
+C\xa6\x7f\xe9\xbb\xd0\xd5\x5cv\xe2\x8e\xde\xcf\xce\x8c\xc6\
+<C\xcc\xf8\xe0\xccx\x96!l\xb8\xdfZL\x17\xc2\
+\xd0&\x89z\xfd\x7fzy\xf4\xf8\xfe\xdeRK\xb8\x85\
+\xf9\x94\xb7\x8d\x1c\xb5\x91\x1aC\xdb\xd8\xd1.\xed?\xb4\
+8\xdcR\x1a\xa1\xc6\xeeNz}\x19\x0a\x10\x97\x7fr\
+\x17\xe84\xf0\x09\x8c\xf7\x0cb\xf1\xcf\x0f'[\x1b\xca\
+\xc8\xb1\xf0Q\xff\xc5\x92e\xb4\xff\x0d\xa56\x89\xebo\
+o\x08\x17M/\xb6v\x90\xa3\x96PE\xf7D\x7fP\
+\xda\xffx_\x90$\x0e\x14X\xc8I^X\xd4\x91\xb0\
+\xe4\x84\x01\xd51gC\xe4\xdfA\xb1\xed$\xf6o\xef\
+\xa6\xd3\xdc_\xd7D\xcb\x9f\xe9\xee\xcf\x8d,|x\xb9\
+7:\xc3\x9e\xcf\xf9;\xc9\x81\xb59\xb9d\xfb=k\
+\xaf\x97\xf6?\xb9v\x0dI\x0c\xad&r\x92\x1f\xf9;\
+\x13\xb5\x988\xf9\xa6\xac\x03;{\xfev\xf1\x1b*\xf8\
+\x7f\xe9\xd1M\x1a\xaa6\xed\xb3\x14\xf3\xc6!\xbf\x19\xad\
+\x04\xa6\xf3u\x94\x84\x1b\x99ow\xf4\x90\x03\xcb\xb3\x8c\
+d\xfb\xe1\xd0\x90\xb4\xffC\xc3\xebHb\xbb1\x9b\x9c\
+\xe4\xad\x8e\x9eD-&\x0b\x14\xf8P\xec\xd3\xdf\x05z\
+/O\xbeD\xfd+\xb6\x1d\xe2\xfd\x97w\xe7f\x87\x97\
+\x9f\xd9\xb2\x8c\xf4\x08\xd8\xa7_N\x88\xdb\xa3\x0d\xc2\xd0\
+\xa5\x1f]\x0b\xff\x8a\xea|\x993\xc3M\xf7\xa8=_\
+:\x8em\x0a\x91\xc4\x05z=9\x09\x9c0Q\x7f\xa9\
+\x81\xbe\x0b\xf4v\xee\xbdC\xe5\x0bU0T\xc4\xbc\xa3\
+\xe4\xf8\xff\xc3O\xf6\xdaJ\xc2s\x22\x99\x1a\x0d]z\
+s1U\xdb\x18\xf5\xaa\xe0\x1bCj\x7fCfx\xae\
+\xf0\x0a\xd5d\xcd\xa4\xbeVOl\x1d\x91\xf6\xff\xf8\xd6\
+\x11\x92X\xaf\xd1\x92\x93\xc0\x09\xe3w\x96z\xb8\xbb@\
+o\x11k\x01r\xc4\xacs\xff\xf2\xce\x9d\xb5\x95\x16\xfa\
+\x10\xde\xf0;\xc4\x07\xdd}1\x17gZ\xf2\x8d\xf4\xcb\
+t\xf5/Dz\x8d\x86\xb4\xfc\xcf\xde\xbe\xa3\xd9]J\
+\xa7\xbf\xc5\xe1\xe2\xc9\x87\xa0\x97e\x96Xs\x05\x99D\
+!\xfd\xca\x9f\xc4\x90\x90\xff\xfb\xf3{\x5c\xf6\x88\xd9\xc0\
+UE\xa5\xf4\xa8/\x17\xcf\xb5\xb4k3\xc2\xf7\xf8\xd4\
+\xfd\xeb\x04\x99D\xe1\xad4\xaa\x7f\x93AL\xfe\x9b\xcf\
+\xdc\x5cT\x98C\xa7\x84\xae\x16]h\x90O\x9d\x8d\xb2\
+\xd7\xee\xb5\x7f\xf1\x91\xac\xa7\x15\xd2\xa3\xfd\x99<B\xf3\
+\xff\x9a\x99\xbck\xacG\xab\x8d(\xb6\xd6\x14\x97\x09\x97\
+\xdf@\x9b\xa7\xbb\xd0J\xd2@\xbfx\xe6\xec\xc45y\
+k\xb1\xd2\xa3\xff\x95<<\xf9\x97N\xdf\x0a\x9fa^\
+\x9a\xf5\xa5\xb6\xa8\x8b3yC^G\xf6\xaf\x14\xb6\xa3\
+\xc48\xe5\x8d>t\x96\xf0\xf8\xc3\x93\x1eE\xc6\x1f\x94\
+\x86\x98\x7f\xef\x85[\x86Wy4\x91\xb55\x14\xec\xb7\
+;k\xae\x0a\xccC\x8cWV\xd3)o\xe8k\x80\x92\
+G\xbe\xff\xf92\xfe\xa64\xe7\xa6\xb7\x1c\xdc\xd5\xeb\xa9\
+-\x11\xee\xb2\xe8\x0d'\xa9O)\x09\xb8\x1dc\x15.\
+:eSM\xb1X\xefO\x0c\xfa\xa3K\x8f?W\xce\
+\x81\xf1gz\xfdy\xaa\xce\x19/\xd0\xd4\xb9\xd8\x19\x14\
+\xca\x87*\x98\xb7\xe4\xcfQf\xfe\xe3O\xf7\x89\xf5\xe3\
+\xc4\x98\xcb\xf3/l\xfd7\x99\xf2\xe8\xa9m:.,\
+\xe9\xf5\xe5G<\x8cSj5A3Ub\xf4I\x0c\
+\xde\xfc\xa3;W\xde\xfccP\x8d\xf9G&\xfeu\x1a\
+M\xd0R\xf4t\xb3?ji\x0f\xf1hcKAf\
+\xc4{\xac\xaa(\x9c}\xf5v\xe9\xd1W\x09\xe8\xf9\xf7\
+\xaf\xc4?\xff\xbe\xa3B\xa9\xf9w5\xfd\xfb\xf2\x0b6\
+\xdb\x1c\x0f54\xf3\xc6\xd3\xe8\x80\xae\xcd\x80\x95_A\
+@3\xe9\xcf?\xbf3j\xdfAf\xd6\xf4\xc4\xd9\xb3\
+2\xd6\x9f@\xcf\x97^\x7f\xf2}\xeaK\xfa\xf8\xbc]\
+\x7f\x22\xe6\x9c\x94\xcc;+\x5c\xc25\xf6c!\xff?\
+\xde\xff\xb6X\xdfMf\xd6\xf4\x14\xf0\x82]\x7f%f\
+\xfe\x87m\x9d\xf0\xbd0\x0a\xccC\xa7\xf8\xb9\xa3!\xe9\
+Q#\x99Y;\xa8\xd1\x03^+\xd4\xa8\xd7\x1f\x0e\xf1\
+\xd6\x1f\x0e\xd1\xeb\x0f\xefN\x97\xf5\x87<\xed\xe7\xfd]\
+_w\xd5E]\x81\x0f]\x83\x915\xcd\x9f\xbfs \
+\xe6\x90\xa9\xfc\xdc\x7f&\xbe\xfe\xb6\xbe\xac\x94^\x7f\xeb\
+\xa6\xd6\xdfBU\xfb\xebtY\x7f{\xb6-\x00\x15\xeb\
+>W\xed\x0akq\xb1!\xfa\x185\xb0\xd4\xef|\xf7\
+\xf9\xb1\x98\xe6\xe3\xf5?Y\x13\xb1\xfe\xfc;n\x0f\xbd\
+\xd7c+\x9f\x1a\x1a\x9cZ7\xd8\x18\xb9\xfe\xfc\xc1\xc8\
+\x01\xf0\xa8\xf3n\xc9\xb0p~\xd7z\x91\xe0\xf9\x8b\x8e\
+X\xcd\xf8@\x81\x85\xd7B\xf3\xa4\xfa\xf9\x8b\x85\xe3\x1f\
+x\xd5\x1f\xe7\xf3G\x91\xed4%\x86=\x17\x94\xff\x8d\
+ev^\x1d\x04\xbdZ\xf8^\x08S\xb6\xe6\x99\xa1=\
+\xc6K<\xac\xc0\xf3w\x0b\xca\xbf!\xda\xf3\xa7\x1f\xf7\
+\x0c@]\xe0\xcf/\xe0\x9e?\x85?\x0e\xb9=\xc21\
+\xd84x\xfeT\xba\xfd\x9fX\xc4{\x0d#\x82GP\
+e\xc6\xfcm\xf6\x13\xe6\x82\x7f\x9dF\xc3\xab\x05\xe4\x04\
+\x94\xfci\xf0\xfb\x03s\xc1\x7f\xc6\x97\xcfV\xc7\xfb\xfb\
+\x1b)o\xf60a\x8e\xf8\x07vWV\xc9\xcf\x827\
+\x01\x81$\x0f\x14%\xc7b\xfd\xf8\x15\x17G\xea\xbd\xb1\
+O\x87\xc4\x0f\x94\xe7G\xeb\xbd1\xe5\xa7A\xb1?\x97\
+\xd9f\x8b\xfe\xfb{\x1fv\xf7m\xb69X_\xdd\x82\
+\xc0\xaa7\xecq\xd6\xbc\xd2\x16\x00\xe7\x10\xf0\xc7W\x9d\
+5\x96\xf4\xfa\xadQ\x0e\xb1\x99&:\xcd\xe7{}$\
+\xe2=\x16\x91\x06\xfd\xb3\x05\xfd\xb3\x05\xfd\xcf}\xc4\xfc\
+#\xea\x80\xfe\xd9\x82\xfe\xd9\x82\xfe\x95C\xce\x1c\xba\x98\
+\xff\xe4\xe7\xdf\x11\xf4\xcf\x16\xf4\xcf\x16\xf4\xcf\x16\xf4\xcf\
+\x16\xf4\xcf\x16\xf4\xcf\x16\xf4\xcf\x96d\x1c\xa2\xff\xe4A\
+\xfflA\xfflA\xfflA\xfflA\xfflA\xff\
+lA\xfflA\xfflA\xfflA\xfflA\xff\x08\
+\x82 \x08\xa2\x0e\xc2_\xa4O\xec\x7fYJ\xd5y\x16\
+\x1a\xe8\x9f-\xe8\x9f-\xe8\x1fA\x10\x04A\x10\x04A\
+\x90\xf4\xe6?\xdaA\x00\x8b\x0aendstre\
+am\x0aendobj\x0a69 0 o\
+bj\x0a2632\x0aendobj\x0a7\
+0 0 obj\x0a<<\x0a/Type\
+ /XObject\x0a/Subty\
+pe /Image\x0a/Width\
+ 128\x0a/Height 128\
+\x0a/BitsPerCompone\
+nt 8\x0a/ColorSpace\
+ /DeviceGray\x0a/Le\
+ngth 71 0 R\x0a/Fil\
+ter /FlateDecode\
+\x0a>>\x0astream\x0ax\x9c\xed\xdbO\
+HTA\x1c\x07\xf0\xe7\x96[D\x05\x09JfEQ\
+R\xfe)\x84\x88\xa2K\xd7(\x0fB\x81P\x97\x88j\
+\xa3\xc0\xfe\x1c\xa2:\xee\xa1\xa8\x88\xe8&\x1e\xaaC\x99\
+Z\x09I]b\xb7\x8b\x97$\x82N\xd1!=D\xac\
+\xba\xb1\x18\xb5\x87Hsz\xbf\xb7\xca\xee\xce\x9b\xd97\
+\xef\xedof<\xfc~\xc7\xef<\xf8|\xdf8\xfeA\
+G\xc71=;\xbb\x8c\x93e\xfc\xe4\xec1\xab<c\
+\x16\x0b\x00o\xb1@\x81\xb7V\xa0e\x81\xb7T\xa0\xc8\
+[)\xd02\xc5\x98\xc5\x02\xe5\xbc\xf1\x02<o\xb8\x80\
+\x9f7Z@\xc4\x1b, \xe6\x8d\x15\x90\xf1\x8c\xf5\x9b\
+\xe0[\xa5\xfc\xf3\xe5K\x86\x8f\x1d\xb89<\xf6m*\
+\xead\x1eo\x0b\xcd\x0f\x15\xf95\xc9i\xd9S\xaa3\
+R\x05\x7f:[\xad\xceX&2_\xdbW\xbd\xce\xd8\
+u!/\xdd\xd6\x22\x1fO-\xbe\xc1H\xf2Z\xd4\xb9\
+\xda\x11\x95w\x1ey\xc1\xcc\x99\x0d\xe2\x0f`\x15\xa3\xc4\
+_\xf0\x827\xf8\xba\x1a_7\x03\xc1%|\xddi\x93\
+\xf2\x83%\x9f\xf7\xf7 xi\x8d_\x99w\x83l\xbd\
+-\xde9\x02I\xb75\xde\xe9u\x93\xbf+\xac\xf1\xce\
+\xa8\x1b}2\xc9/+\x7fr\xc2\xcd\x1e\x9a\xe3\x078\
+\xde\xf9\xe3\x86=\xf6x\x07\xd2\x93\xc8\xbc\xf4\x9b\x99\x9f\
+\xd7\xe0\xb7\x87\xe1\xf1\xfdp<\xba\x1f\x92\xc7\xf6\xe5\xfc\
+3!\x8f\xec\x87\xe6q\xfd\xf0<\xaa\x1f\x81\xc7\xf4\xa3\
+\xf0\x88~$\x1e\xcf\xdf.\xe5\xfb+\xf0x~\xfcU\
+\x14\x1eq\xff%\x05*\xf3\x98\xe7OX \x80\xc7\xf2\
+c\x92\x02A<\x96?\xb0KX \x90G\xf2\x1b\xe6\
+\xb2\xa2\x02\xc1<\x92\x9fp\x7f\x86\xf7\x17x\x1a\xcc#\
+\xf9i&(\xa0\xc2\xe3\xf8\x0ds\xcc_@\x89\xc7\xf1\
+\x13\x05\xb1\xac\x80\x1a\x8f\xe3\xa7\x99\xaf\x80\x22\x8f\xe2\x17\
+\xb6\xbf\xac\x80\x90\xdfr\xf7\xf6F\x1d~\xa2x\xe4\x17\
+\x0a\x5c\x14\xbe\xfd\x07\xc6\xc6t\xf8i\xc6\x17\x10N3\
+\xac7\xe3\xfb\xc5\xed\x87\x99\xf6m\xf1\xe2t\xc02\xff\
+k\x22\x04\xbfd\xfb\xe7\xdf_\xd9,}N\x97\x9fV\
+\xc1\xf5\xf9\x85\xed\x0f\xc2\xf5\xf9\x09%\x5c\x9f\x9fR\xc2\
+\xf5\xf9M\xaa\x0f\xea:\x7f\xe4\x93O>\xf9\xe4\x93O\
+>\xf9\xe4\x93O>\xf9\xe4\x93O>\xf9\xe4\x93O>\
+\xf9\xe4\x93O>\xf9K\xca\x9fw\xb3Sf\xfc=\xe0\
+\xef\xe6B\xb8\xaay\xc7\x8c\x7f\x02\xfcF.\xfc\xe8f\
+)3\xfe}\x97\x9a\x8dq\xe1\xb0\x1b\xe6\xcc\xf8p\xd5\
+x\x82\x0f\xcf\xc1\xa6\xec0\xc1\xaf\x82\x9b\xe6\xbd|\xda\
+\x04\x07\xf0m\x8d\x01\xff\x01\xbc\xe9a_\xfc\x0e\xe2\xf3\
+\xfa\xf9\x83\xf0\xa2\x93\xfe\x9b\xe6\xfb\xc0\xcf\xf3\xd7\x02\xd0\
+g5\x5c\xf4fg\x05+C\xb0\xf0\xe3\xa8^~\xff\
+\x17P>\x8b\xaee\xd4\x8d\xc3\x12{\xb2N\x9f\x1e\xbf\
+\xe5\xfd\x8d\xfeW\x9bp\xb5\xfd\xb7W \xf7:\xd9\xb5\
+u=\xfal:t\xe3\xc5w\x0f\xf8\xd7)\xa9\xb7\xb7\
+\xb0\xaey\xf2\xf2\xff\xfbn\x1c\xd5\xcf\x7f\xe5\xbf\xf2\x97\
+NM\xf7\xb8^=w9^\xf9\x88\xd4v\xf6et\
+\xe1?\x07\x8f\xaf\x95\xb9\xff\x01\xea*fK\x0aen\
+dstream\x0aendobj\x0a7\
+1 0 obj\x0a770\x0aendo\
+bj\x0a72 0 obj\x0a<<\x0a/\
+Type /XObject\x0a/S\
+ubtype /Image\x0a/W\
+idth 128\x0a/Height\
+ 128\x0a/BitsPerCom\
+ponent 8\x0a/ColorS\
+pace /DeviceRGB\x0a\
+/SMask 70 0 R\x0a/L\
+ength 73 0 R\x0a/Fi\
+lter /FlateDecod\
+e\x0a>>\x0astream\x0ax\x9c\xed\xc1\
+1\x01\x00\x00\x00\xc2\xa0\xf5Om\x0c\x1f\xa0\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0o\xc0\x00\
+\x00\x01\x0aendstream\x0aend\
+obj\x0a73 0 obj\x0a70\x0a\
+endobj\x0a74 0 obj\x0a\
+<<\x0a/Type /XObjec\
+t\x0a/Subtype /Imag\
+e\x0a/Width 128\x0a/He\
+ight 128\x0a/BitsPe\
+rComponent 8\x0a/Co\
+lorSpace /Device\
+Gray\x0a/Length 75 \
+0 R\x0a/Filter /Fla\
+teDecode\x0a>>\x0astre\
+am\x0ax\x9c\xed\x9bML\x13Q\x10\xc7\x97ZM\
+Ll%Q\x89\x82\xc6\x83\x89A\xc0\x83\x175\xc6H\
+\xfd\x887\xa31\xd1\x82G\x81\x83\x1f1B\xc0\xc6\x9b\
+\x1f\x17\xa2x\x05jL *z\x10\x13(Q\xd1\xa2\
+\xc4\xbb\x17I\x14\xd4\x80\x06?\x8eR\x84\x13\x08\xcfe\
+\xf75\xddyofw\xdf\x16L\x8c\xef\x7fi\xdf\xcc\
+\x7f\xe6WZ\xba\xec\xec>\x0c\xc3Terd\x9a-\
+hz\xb8}\x9f!\xa9\xa8\xeb\x17\xb357\x1c\x97\xd3\
+>-$\xa8\xe49s\xeaY\xb1P\x14\x19s\xa6\xcf\
+b}}XH\xd0\xf6\x1f\x0c\xea{\x05,\xbb\x0e\xb2\
+\xd3\x11\xa4\xb3\x0f\x0b\x05*\xfa\xc2D\x8d\xad\x05u\xfd\
+0\xbb\x1bi\xed\xc3B\x81\xeeHQ\xc6\xdaA\xe1\x03\
+\x98\x8c!\xbd}X\x08\xd0\xa6\xdfHxv\xa3\xb3\xf0\
+\xc0\xbcgs\x1f\x16\x02t\x01\x892v\x0e\x946\xcd\
+x\xfep\xde\x16\x02\xd4\xc9\x9f<j^\xd0#\xbe\xea\
+\x80\xb5\xa5\x17\xcd\x5c\xf6=F\xf9\xde\x16\x02\xc4\x7fs\
+\x86\xb8k\xc8^\xf6#\x0db\xae|O\x0b\x01\x1a\xb4\
+\x1f\x07yXX.\x22\x9f\x00i\xbe\xe6k\xbe\xe6k\
+\xbe\xe6k\xbe\xe6\xff\xa7\xfc\xd7<\xfc\xda^\xbeZ2\
+\xbe\x08zl?f\xca\xadhy\xc6^v/>\x9f\
+\x00\xddb\x98n\x82\xd2\xdcp\x9b\xd5\xe4\xfd\x22C\xd1\
+B\x80\x0e\xa1\xe1\xfd\xceJ8\xdcr\x8dF\x14-\x04\
+(\xfc\x11\x89\x8e\x84\x9d\x95\xd7\x11\x07cW\x15-\x14\
+\xe8\x18\x12>\x02\xde\xb9~\xc4aN\xef\x8a\x16\x12t\
+C\x8a6\xc3\xcf\xf6\x01R\xc8X\x97\xa2\x85\x04\x15$\
+\xe6@p\xbe9\x04\xeb\x84\xe1\x96\xbbb\x8a\x16\x17\xd0\
+\xae\x81\x5cb.\xbd\xd3\x10\x05\x87[K3\x8d\xca\x16\
+7\xd0\x86x\xbd5\x96\xd6\xc7\xd7KE\x06\x1fn\x9d\
+\xbaX\x1a\xc0\xe2\x03\xa4\xa5\xa5\xf5W\x15\xaaK\xa5\xb9\
+\xda\xb6\xd0\xb6hu\xb2\xcf2\xf5%\xab\xa2\x81,8\
+(\xd4\xe78dMW\x12\xf4\xe5\x973\x0e\xdbD\x22\
+\xacn!@u\xe0\x98\xf9\x19il\xaa\xf0\xa5pl\
+M\x17*[\x08P\x0aV\xed\xc0\xf0\xe1\x01\xe9\xe0\x9e\
+\x0e\xabZ\x08\x90\x10\x8ea\xfc\xcbRo\xc6\x9aT-\
+\x04\xa8\xd6\x9b\x1f\xcd0Y\x13\x11E\x0b\x01\x0a\xa5\xd0\
+\xb0S\xa7\x90\xde\x8c\xc5\x15-\x14\xa8\xa0\xa6\xc7\xfcF\
+\xbcq\xe1'yn\xdc\xfa\xee\x8c\xf3U\x9b\xa2\xc5\x1d\
+\xe4v\xe6\xce\xbf8\xe3+\xad\xd5J\xde=\xa5hq\
+\x07\x05\x98\x9c\x14-\x9a\xaf\xf9\x9a\xaf\xf9\x9a\xaf\xf9\x9a\
+\xaf\xf9\x9a\xff\xaf\xf0\x97\xf6\xfc\xd3\x1eK\xb3\xa7\xc5o\
+\xcc\xe7\xbd\xb5\x05\xa0\xa4\x9d\xe7\xe0\xc9u\xab\xa2\x85\x00\
+\x81\xb14\xab\x14\xb8\x02Y\x858\x18;\xa1h!@\
+uH\x94\xb1\x1aget\x02q\xfc\x8c(Z\x08P\
+\x0a\x0d\xf7\x82w.\x818\x84\x8b\x9b\xde\x16\x02\x84\x87\
+{@\xe9\xb2\xa7\x92\xe1\x850\x7f{[\x08P-\x1a\
+>\x0d\xbb\x17\xa6\x85\xfc\xf3\xd5\x86\xa1h!@!\xec\
+u\xf5\x16\x08\xdd\xc3M\xce\x0f\xf8g\xe32\x11\xefm\
+\xa1@\xf6X\xeaTO\x8d\x887\x15\x89\xb7\xdb\x97\x8f\
+Rm'\xf1\xed}^\x16\x9f --\xad\xbf\xa8\xb2\
+\x86\x04W\xf5\x0a\x17[I\xb5\xedk\xa8\x12\xf7'\xe7\
+\xd7\xe5\xd2l\xeep\xf4v3U\xb7g0w\x87o\
+\xfe\x95\xbc\xbf7p\x17x\xe7\x10;c2\x94oQ\
+\xaaty\x08\x0f\xc8[\xd1\xca\x16\xe9\xc0}\x03\x1a\x82\
+w\x11\xee\x1c\xa37\x00\x8eK\x85\x8c\x1d\x05\x8e\xe0]\
+\xae\xc1@\x0c)\x5c\xfe\x09\xa9\xfc\x00\xfe\xba\x07\xef\x12\
+\x19\xf5\xac<\x8c\x142v\xd0i\xc9\xa3K\xd1\xbdI\
+\x8fJ|\xe7D\x0b\xf0\xe4\xdb\xc5\xcf\xce\x912k\x15\
+t\x8b\x8a{\x97\x00;g\x14\xf9\xee]\xf2\x9c\xbf\xf2\
+\xee\xa2\xf9\x9a\xaf\xf9\x9a\xaf\xf9\x9a\xaf\xf9\x9a\xaf\xf99\
+-\xce\xbf\xe8\x91]\xac\xc95\xbb\x81#i>\xaf\xdf\
+\x06+;y\xae\xdb\x9a\x5c\xbb\xf9\xaa\x03\x9a\x02wq\
+N\xae\x5c3p\xe7\xcey\xc9\xb0\xa03\xc0\x13\xb8\x0b\
+\xbes\x16\xec\xbf\xde$\xf7fl\xb6\xc4i\x09\xde\xe5\
+!\x12\x15w\x0e\xdfF\x1c\xf0\xda~\xf0.~vN\
+\xaf\xfb,\x19F\xd7\x00G\xf0.\xd7\xe42SW@\
+\xa5Q\xf1M\xc8\x7f-\x83\x86\xe0]\x84\xc9\x95\xbf\xae\
+U\xb0\xd2(~\x02\xf2}\x1b\x84|\x1e]\xe0\xe4\xba\
+\xa0\xcc\xddu\x86\xa4\xbdm\xef\xa7\xac\xec\xd4\xbb\xd6\xbd\
+r:p\x97?\xe4\x085\x0b\x0aendstr\
+eam\x0aendobj\x0a75 0 \
+obj\x0a1094\x0aendobj\x0a\
+76 0 obj\x0a<<\x0a/Typ\
+e /XObject\x0a/Subt\
+ype /Image\x0a/Widt\
+h 128\x0a/Height 12\
+8\x0a/BitsPerCompon\
+ent 8\x0a/ColorSpac\
+e /DeviceRGB\x0a/SM\
+ask 74 0 R\x0a/Leng\
+th 77 0 R\x0a/Filte\
+r /FlateDecode\x0a>\
+>\x0astream\x0ax\x9c\xed\xc11\x01\x00\
+\x00\x00\xc2\xa0\xf5Om\x0c\x1f\xa0\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0o\xc0\x00\x00\x01\x0a\
+endstream\x0aendobj\
+\x0a77 0 obj\x0a70\x0aend\
+obj\x0a78 0 obj\x0a<<\x0a\
+/Type /Annot\x0a/Su\
+btype /Link\x0a/Rec\
+t [427.500000  6\
+84.500000  509.2\
+50000  700.25000\
+0 ]\x0a/Border [0 0\
+ 0]\x0a/A <<\x0a/Type \
+/Action\x0a/S /URI\x0a\
+/URI (https://ww\
+w.flaticon.com/p\
+rofile/license/p\
+df/481874)\x0a>>\x0a>>\
+\x0aendobj\x0a79 0 obj\
+\x0a<<\x0a/Type /Annot\
+\x0a/Subtype /Link\x0a\
+/Rect [427.50000\
+0  629.750000  5\
+09.250000  645.5\
+00000 ]\x0a/Border \
+[0 0 0]\x0a/A <<\x0a/T\
+ype /Action\x0a/S /\
+URI\x0a/URI (https:\
+//www.flaticon.c\
+om/profile/licen\
+se/pdf/2089736)\x0a\
+>>\x0a>>\x0aendobj\x0a80 \
+0 obj\x0a<<\x0a/Type /\
+Annot\x0a/Subtype /\
+Link\x0a/Rect [427.\
+500000  575  509\
+.250000  590.750\
+000 ]\x0a/Border [0\
+ 0 0]\x0a/A <<\x0a/Typ\
+e /Action\x0a/S /UR\
+I\x0a/URI (https://\
+www.flaticon.com\
+/profile/license\
+/pdf/864685)\x0a>>\x0a\
+>>\x0aendobj\x0a81 0 o\
+bj\x0a<<\x0a/Type /Ann\
+ot\x0a/Subtype /Lin\
+k\x0a/Rect [427.500\
+000  520.250000 \
+ 509.250000  536\
+ ]\x0a/Border [0 0 \
+0]\x0a/A <<\x0a/Type /\
+Action\x0a/S /URI\x0a/\
+URI (https://www\
+.flaticon.com/pr\
+ofile/license/pd\
+f/2928162)\x0a>>\x0a>>\
+\x0aendobj\x0a82 0 obj\
+\x0a<<\x0a/Type /Annot\
+\x0a/Subtype /Link\x0a\
+/Rect [427.50000\
+0  465.500000  5\
+09.250000  481.2\
+50000 ]\x0a/Border \
+[0 0 0]\x0a/A <<\x0a/T\
+ype /Action\x0a/S /\
+URI\x0a/URI (https:\
+//www.flaticon.c\
+om/profile/licen\
+se/pdf/2933683)\x0a\
+>>\x0a>>\x0aendobj\x0a83 \
+0 obj\x0a<<\x0a/Type /\
+Annot\x0a/Subtype /\
+Link\x0a/Rect [427.\
+500000  410.7500\
+00  509.250000  \
+426.500000 ]\x0a/Bo\
+rder [0 0 0]\x0a/A \
+<<\x0a/Type /Action\
+\x0a/S /URI\x0a/URI (h\
+ttps://www.flati\
+con.com/profile/\
+license/pdf/1499\
+417)\x0a>>\x0a>>\x0aendob\
+j\x0a84 0 obj\x0a<<\x0a/T\
+ype /Annot\x0a/Subt\
+ype /Link\x0a/Rect \
+[427.500000  356\
+  509.250000  37\
+1.750000 ]\x0a/Bord\
+er [0 0 0]\x0a/A <<\
+\x0a/Type /Action\x0a/\
+S /URI\x0a/URI (htt\
+ps://www.flatico\
+n.com/profile/li\
+cense/pdf/125092\
+6)\x0a>>\x0a>>\x0aendobj\x0a\
+85 0 obj\x0a<<\x0a/Typ\
+e /Annot\x0a/Subtyp\
+e /Link\x0a/Rect [4\
+27.500000  301.2\
+50000  509.25000\
+0  317 ]\x0a/Border\
+ [0 0 0]\x0a/A <<\x0a/\
+Type /Action\x0a/S \
+/URI\x0a/URI (https\
+://www.flaticon.\
+com/profile/lice\
+nse/pdf/1822940)\
+\x0a>>\x0a>>\x0aendobj\x0a86\
+ 0 obj\x0a<<\x0a/Type \
+/Annot\x0a/Subtype \
+/Link\x0a/Rect [226\
+.500000  173.750\
+000  368.250000 \
+ 191.750000 ]\x0a/B\
+order [0 0 0]\x0a/A\
+ <<\x0a/Type /Actio\
+n\x0a/S /URI\x0a/URI (\
+https://www.flat\
+icon.com/contact\
+)\x0a>>\x0a>>\x0aendobj\x0a4\
+5 0 obj\x0a<<\x0a/Type\
+ /Page\x0a/Parent 2\
+ 0 R\x0a/Contents 8\
+7 0 R\x0a/Resources\
+ 89 0 R\x0a/Annots \
+90 0 R\x0a/MediaBox\
+ [0 0 595 842]\x0a>\
+>\x0aendobj\x0a89 0 ob\
+j\x0a<<\x0a/ColorSpace\
+ <<\x0a/PCSp 4 0 R\x0a\
+/CSp /DeviceRGB\x0a\
+/CSpg /DeviceGra\
+y\x0a>>\x0a/ExtGState \
+<<\x0a/GSa 3 0 R\x0a>>\
+\x0a/Pattern <<\x0a>>\x0a\
+/Font <<\x0a/F8 8 0\
+ R\x0a/F9 9 0 R\x0a>>\x0a\
+/XObject <<\x0a/Im6\
+ 6 0 R\x0a/Im48 48 \
+0 R\x0a/Im52 52 0 R\
+\x0a/Im56 56 0 R\x0a/I\
+m60 60 0 R\x0a/Im64\
+ 64 0 R\x0a/Im68 68\
+ 0 R\x0a/Im72 72 0 \
+R\x0a/Im76 76 0 R\x0a>\
+>\x0a>>\x0aendobj\x0a90 0\
+ obj\x0a[ 78 0 R 79\
+ 0 R 80 0 R 81 0\
+ R 82 0 R 83 0 R\
+ 84 0 R 85 0 R 8\
+6 0 R ]\x0aendobj\x0a8\
+7 0 obj\x0a<<\x0a/Leng\
+th 88 0 R\x0a/Filte\
+r /FlateDecode\x0a>\
+>\x0astream\x0ax\x9c\xed\x5cK\x8f\xe3\
+\xb8\x11\xbe\xfbW\xe8\x1c\xa0\xd5\xe2[\x02\x16\x0bL\xbf\
+\x82\xe4\x10\xa01\x0d\xe4\x10\xe4\x10\xccf\xb3X\xecl\
+\xd2\xbb\x87\xfd\xfb\xa1DR\xb2U\xfah\x9b\xa446\
+\xda\xd3\x98nw\xd3\xaabU}\xc5*\x16\x8b\xbe\xff\
+\xf3\xe7\x7fU\xff\xf9\xbd\xba\x7f\xfc\xfc\xbf\xea\x8b\xff\xf9\
+\xf8y\xd7\xd4F5\xee_\xd5\x7f\xdd\x1d\xfe\xa1\x95\xbc\
+\xfa\xf2u\xf7^\xbd\xef^w\xaf\xf6\xfb\xfb\xce\xbd\xef\
+\xf3\xe3\xdf\xec\xab?*^\xfd\xd5\xfe\xff\xb9\xfa\xc7?\
+\xed\x1f\x7f\xf0o\xea\xdf\xf0ug:a\x7f\xfe2\xfc\
+d\x8c\x0b\xfb\xb2\x99^\xf4#?\xed\xfe\xfe\xa7\xeaW\
+K\x93\x0d4\xfb\xefw\xc3\x1b,\xcb(\x9b\xf7\xdd\xbd\
+\x93\xc7\xce_v\x9d0\x0d7fx\xa0\xff]\x19\xae\
+\xed\xf7\xcas\xb3\xc4\x82\xd4\x8e\xe8\xef_~\x1d\x9fg\
+\xaam\x9d\xe0\x5cH\xfb\xa3\xff\xfe\xe5ku\xff\x97\xaf\
+\xba\xaa\x9e\xfe\xdb\x0b\xd4s\x0b\xcf\xd7m\xd7\xb0N7\
+\xc6>TwL\x18\xaed\xd7s\xedx'\x193Z\
+\x1eP_\x94L\xd8\xdf\xb9V\x95\x11\xa2\xd2\x8d\xae~\
+\xfb\xf7\xeeG\xcb%\xf0`\xc3\xd7\xc9T\x98\x14\x15g\
+\x89D\x98\x11\x9e\x8af\xe9T\x84\xd5\xd9@\x853\x95\
+N\xc5*2P\x91\x19s\xe9\xd5\xd2\xeaA-V\xb8\
+t\x22Bu\xf9D\xa4\xe0\xf9DT\xa3\x0a\x10\xb1\x88\
+\xcd&\xa2\x15\xcb'b\xb8,@\xa43\x80H9\x17\
+\xf5(\x22H,\xccA\xae\xc8\xc1\x81xM\x0e\x83\x0c\
+\x95\x91\xab0p\xcb\xd3us\xd8\xc6\x0cn\xa1Y\x1d\
+J\xab\x9a\xe1\xca9lc\x06\x17\x0cV\x87\xd2\xaaf\
+\xb8r\x0e\xdb\x98\xc1\x05\xec\xd5\xa1\xb4\xaa\x19\xae\x9c\xc3\
+6fpI\xd5\xeaPZ\xd7\x0c\xd7\xcda\x1b3\xb8\
+\xc4wu(\xadj\x86+\xe7\xb0\x8d\x19\xdc\xe6du\
+(\xadj\x86+\xe7\xb0\x8d\x19Z\xd3l\x01\xa5u\xcd\
+\xf0\xcd8\x9cS\xa3\x1a2w\xcd\xa9\xa6\xcf*Q\x81\
+}\xde94\xfa\x89p\xa6\xbf\xe9D\x5c\xa5\xac\x00\x0d\
+'\x8cJ\x16\xa6\xc4D\x8c\x8e\xec\xc0\xb7\x84\xc8\xb4q\
+\xc8\xc5\x19\xdafn\x8e\xb3^\x9al\x22\x99\xd2\x8c@\
+\xbb\x08\xb0:\x8dd\x12\xc9\x94f@|&\x8d\x22`\
+\x9dvP\xb9\x88G\xfb\xed\xcd\xc1\xdaKS\xc4mr\
+\xd1Z\x8aF6X\x9dF\x0a\xb8M.\xe23i\x14\
+\x01\xeb\xb4\x95\xccE<*<l\x0e\xd6^\x9a\x22n\
+\x93\x8b\xd6R4\xf2\x11?h\xa4\x80\xdb\xe4\x22>\x93\
+F\x11\xb0N{\xeal\xc4\x83\x0a\xcc\xe6`\xed\xa5)\
+\xe26\xd9h-D#\x1b\xacN#\x05\xdc&\x1b\xf1\
+y4\x8a\x80u*.\xe4\x22\x1e\x95\xa26\x07k/\
+M\x11\xb7\xc9Ek)\x1a\xd9`u\x1a)\xe06\xb9\
+\x88\xcf\xa4Q\x04\xacS\x95%\x17\xf1\xa8&\xb79X\
+{i\x8a\xb8M.ZK\xd1\xc8G\xfc\xa0\x91\x02n\
+\x93\x8b\xf8L\x1aE\xc0:\x10\x19\xaa\xaf\xd9\x88\xcf+\
+N\x96\x03k/M\x11\xb7\xc9Fk!\x1a\xd9`u\
+\x1a)\xe06\xd9\x88_\xb3D>X\xddR\xefD\xd5\
+\x8e\x1c^\x97\xdf\x8b'\xef\xfe\x82\xbbe\xe1\x83\x0fo\
+\xbb\xfb\x17\x9b\xb4\xb5\xd5\xdb\x8f\x95cy\xe7~\xbc\x0d\
+'\x10\x96wk\xaa\xb7\x1f\xaa\xef\x9a\xa6a\xdfWo\
+?\xef\xbaZ6\x9a+\xd7 \xecG\xf80\x22k%\
+u\xdb\xf7\x0fO#b\x18i\xeb\xce\x0d\xec\x8dHO\
+\xad\x13\xae\xe3x\x1aQ\xc3\x08k\x02\xa3iD{j\
+6\xd1d\x87#\x98\x9a\x09s\xf3C\xd3H\xeb\xf8\xf0\
+ZHaN\xa4\xd6\x0d#\xba\x96D\x9eO~\xa4!\
+s\xc3\xday\x18%\xe5\xac\x1f:Eo\x8f~nF\
+\xab\x99v\xf0\x0c\x9c<\xcfo\x07\xe8\xb5\xce\xa5[\xcd\
+-\xb0\xed\xeb\xe1\x85j:\xfbZ8\xec\x9a\xc3N\xe9\
+S\xde\x7f\x14\x80\xe72\x0d\xf0\x94K\xf0d\xd6g\xee\
+\x18o\x99\x97\x92\x8f\xb8i\x9c\xa2\xe7\xf2\x9b\xda\x10K\
+k\xaf3m\xd8\x22r\xf5\x82\x05\x1c\x06T\xdd\x08\xb6\
+\xe8\x07\xa2V\xf3\x11\x1e\x90\xeb\xb8P\xab\xc9\xdaO\xe0\
+\x14j\xccxjt\x06j\xb2\xf4\xe5YL(y`\
+1\xbf\xa2\x98\xda\x8bq\x8a\xec\x11\xbb`+\xab\xa0/\
+\xb2\x06@\xfbGt\x0c\xed\xcf\x8d\x9f5\x03+\xd7\x12\
+\xce\xc23dMc\xcf\xde\xd3\x9d\x9f\xef?\xf3\x04\xe5\
+\x81h\xe2m@\xa0\x7f\xe8tI/\x14MJwW\
+\x83\xa6\x085l\xff\x0e\xce\x1a\xcb\x03\xe7\xc6\xf7l\xf9\
+\x9aa\x92\xf7\xbd\x88\x10\x82`3\x98d\xffwc\xf3\
+r\xfb\xe0^\xd2r.\x1fkXo\xef\xe1E\xff\xdd\
+]\xcc\x91\xed\xde\xcd\x9cH\x96t=\x01\xae\x83\x01\xae\
+_.\x85\x95\xdc\x9bPz\xe3r\xef\xa9\x14^^\xff\
+\x04\x10\x16x\xe4\x99\x11\xfa|\x0eV\x0e\x97\xb1\x87K\
+X\x10\x90\xbe\x84R\x87\xfa\xe2^v\xe2\xdc<,\x15\
+4\xe8:7i\xa9O\xef]\x8b;\xaa\xf4g\xaf@\
+=_k\xc5\xa3\x1f\xb1\xb3<\xd9\x1cdJ\xd8\xa6z\
+c'\xe72\xcb\xe7\xa0\x93+\xfe\xb1\x9c\x5c6!\x8a\
+\x89\xa7\x00Z53.{\xf2\x081\xddl\x1f\xc1B\
+v\x89\x22\xf8\x84\x1d\x1fT$\x85f\xf3r\xf9\xbe=\
+\xa9\xe9\xe6\xdb\xab\xfb\xb6`z\x1d\xdf\xd6\x1f\xcc\xb7-\
+)\xef|\x8f\xdeO\x89\x07S\x1c\x10\xc7\xbd\x82\xd0;\
+I*\xc2\xde\x05\xed\x9e#\x92N\xbb\x1b\xb2\x9aa\xdf\
+s\x8b\x17c\xb5pu\x9e\xe9\x99\xc7\xb0+\x98{r\
+d)\x94[\xbbZ\xdb\xad\xe2j\xba\xf9X\xae\xa6d\
+(V\xfa\xcd\xb3\xa95)\xb8<\xc0\xec\x16B\x05\x07\
+\x8akp\xcbI+7\xb7<\xcb-\xa5\xe6\xeb\xb8\xa5\
+\xfcXn\xa9\xf9\x98\x9cq_;K\x01 t\x5c\xde\
+\x9c\x9e\xff>]\xbe\xbfN\xea\xba\xf9\xebY\xfe\xaa\x84\
+Z\xc7_?X\xc9Iw\xe2x\xc6\x9a\x00\x88\x88\x9f\
+\xa6\xc0\x0b\x97\xa9p \xbf\x88\xf3\x91#\xee?j\x1f\
+\xa7\x1d\xe1\xac\x8b\xd5\xbc\x9b\x9dua\xd9q\xe2\x932\
+\x02\xb5\xefS\x22\xb3p\xd6\x85w\xd5)\xf6\x7f\xd9x\
+y\xd1M\xbb\xca\xf2b>X\xb1\xcbh\x9d_\xd1\xbe\
+h\x17\x9e$\x5c\xb9(\xc4q\xe5\x0f+\x10\x8e`\xcf\
+e\xa3\xa1\xe6E5\xb1\xf5\xb9\x92n\xd9:^\xf8\xc1\
+\xcaR\xad\xe8\x8e\x07y\x1cbq\x9d2a)gW\
+\xe0\xd3{\xfa\x82\xb5\x85\xa3\xb9\xf0y\xee\x88\x9d\xfbX\
+\xf0\x9d\xb5\xfa\xf8\xd64\xd6+@\xee5\xad\xa9V\x8a\
+\xa1om\x86\xd8\xe3\xef?\xc1\x02\xe71\x0d\x16`K\
+\x16\xe0\xa2\xb5\xbfuS\xf5\xbf\xdd\xc7\xcb\xc5\xcdV\xf2\
+\x83\xd9\xfa\xfd\x16\xaf[\x12\x03\x1e\xfdv\xd8\x9f\xfd\x93\
+\x8a\x93\xa2\xed\x1a\x11j\xe1\x80\x886@H?B\x16\
+v\x1e\x9aYh{\x9c\xf2\xcf4\xa4m\x0dR\x8b\xcc\
+\x00\xcf\x9a\xfb\x11\xdaR\x87g\x80\xa9\xbdx\xcf \x81\
+\xca\x9f\x0bYj\xa4\x9d\x06\xcb\x83\xf9`\xfb\xc0\x19D\
+\xac\x8d%\xc5\x1a\x85\xd4\xc6\xc6\x11/h\xa6}\xb0<\
+Pox\x06<4\xa8\xd0u0\x05\xf1e5\x8a\xf9\
+\x08\xcfG\xc2\x86P^d\x06\xd8\x17\xb0\x15\xf03)\
+sK\xb1B\x0a\x1fH\xcdG\xd7\xa5g\x1e\xa0\xa4\x18\
+\x07)z+jm\xfe\xc9\xf3Ql\xde\xb0\x9b\xc0\x07\
+\xfb\x8f\xe7\xf3\xedc\xa2^\x8a\x89C\xafn\xd7\xcaC\
+#\xe3\x93\xd0n!\xb5\x09\xa1\x8a\x93\xce\xe7g\x9fv\
+1\xb2\xe0\x85\xd4V\x92M\xd6\xa8\xc8\xb9\x13\xb2\x90\xda\
+R\xa0C>\xfc!\xcc\x9a\xf4\x91\x0a\xc4't\x99\x9f\
+\x22\xe0\xd8\xf0G\xa2\xf4\x9c\x88w`\xb3\x00*8\xfb\
+\x08cB\xfe\x01\xce\x04\xab\xfa\xc53\xa6{\x05B\xfe\
+)\xe8\x11\x84\xe2%\x1bc\xf2\x10K)\xd4|\x02\xd1\
+\xc2\x14fI)\x09\xd6\x88\xe8\x00\xcb#<\x9fn~\
+7\x03\xe3/\xd4\x10y\xa8@D\xcc\x02\x9d%\xa2|\
+,`Y\x17\xc7\x88\xc4f\x81\xea:Gtl[B\
+\x04\xbb\x9eF\x0bGD.B\x1e\xbb^\x899F\xb4\
+\x85\x01\x99\x82\x18,\x06\x9eA\x02\xfe\x22\xc1\xa7\xec\xea\
+\x96\x82\xbf\x14\x8d\xe2\xb0\x14.\x0b\xd1Z\x0c\x5c\x160\
+\x22#XM\xf1\xe8\x04\xcb\xf1\xd0\x1cy\xce\x12\x8c-\
+\xf7|\x09\x19\x13\xba\xde Mu\xc7y\xc3\xe7Y\x89\
+M\xa2\xc4\x92\xf2\x97\xee#\xe1[\x07p$rS\x09\
+\xdfn\xea\xc2*C\xe6\x06o7\xf8\xdbw\xddB1\
+\x10\xdeGa\xfe\xc6\x1e#\x11+2\xebP\x8eD\x05\
+\x8e\xa5\xbb\x12\xe1&\x1d\x01:\x7f\x80\xf2@Iy\x00\
+\xa0\xe8\xe6}\x0bO\x90\x1a\xbb\x04h\xc2\x02r\xab\x0e\
+\xb0\x89\x1b\x0a\xbc-\xbbZ\xce\xbb\x99\xc9!\x07>\xd2\
+\x8c\x1cv\xe2\xda)\xae\xc4\xa6\xdc{H9T\xc5J\
+y\xf1\x80p\xb4\x96\xdc\x92\xee\xee\x12j\xc1\x91\xf6\xe6\
+\xb0\xf6\xd2\xcb`\xc7j\xf4\xba\xf6>~\x8a\xa4\xd4\xc8\
+\xc2\xbf\x95t\xb7G\xd4\xf5)\x98\x9f\xac;\xcf\x09f\
+\x81\xa6\x8c\xa8\x18?\x83\xcb\x0bP\x1e\xfe\x04\x15yz\
+\xcb\x13\x0b\x19\x04\xdd\xa6$xK\xa4#\xa8\x09|\xe6\
+\xb9\x92\x08\xdb!\x12\xd9##\x90Z\x8a\x22#\xed\x11\
+\xf8\x0e@\xc29\x0c\xf6\x96\x08h\xe1\x81)c!\xef\
+\x99\x87^\xc1\xbd<\xe44<E;\x91\xd3\xa3\x14\x17\
+H\xc0\x0e>#LAo\xa4y(%\x0a$,7\
+B\xf8`F\xec#d@\x08\xa9\x84CkGp0\
+\xea\x8dT\xf6\x83\x0e\xc8\x95`\x11,\xe7S\xe6S\xbc\
+1\xc9\xe7\xbcv\x9a@\xee\x948\x04\xfd'\xe2\xa7x\
+\xf9\x0c^\x82>\x1aa\xe9\xe4\xf9\xa0\xeb\xf3\xd2\xd2\xa9\
+N\x85\x15\xac\xcf\xaax\xe8\xfe\x12!wj\xe7y\xe3\
+E\xbb\x0fl&\xc0N\x12\x09\x18\xd8\x15\xb0\xfb\x8c7\
+\xdd\xe7\xdbGL-2\xd2\xc1\xb9\xc1\x91\x88\xfb\x1c\xeb\
+L\x5cj\xa8Hh\xe4MiD\xd8*\xc5L\xc2\x1b\
+\x0e?\x09\xda!y\x96\x18\xd7|\xff\xd9)\xa7\xec\x16\
+R\x22\x226\x7fJ\x8e\x91\x10AR\xe2\xde\x19ii\
+\xd9\x86\xa1\x88\x22C\xe0@'>\xa5:\x89\x89\xe88\
+.\x85\x85\x8f\xf62&\xec\xb6\xca\xe6\xa9)\x91\x1eg\
+\x14e\xe3\xb9\x18\x9b\x0e\x8f\xba)\xba\xcd\xbcd\x8d\x94\
+\x8c\x1979\xc2\x00\x853\xb2\x88wb\xcd~\x9cM\
+0\xf4\x96\x94}K\xca\xb2\xb3\x7f^\xbe\xd76\xb8\x97\
+\xca\xb5\x5c\xa8\xe1\x93\xdc\x22\x9dr\xc7\xdf\x7fJ\xaf\xe2\
+YL\xa3\xb9\xa42\xcd\xc1g`\x8ceV\x1a\x09\x88\
+w\xe1\xd4\x1e\xaf\xdd\x18b\x84<\xb6^J\x08O\x09\
+A)\xb1\xfc\xd8}|\xfc\xe1\x01\xa1\x9b\xf5\x22\x112\
+}\x92\xc2\x0d!7\x84,\x22d\xbc\xcc\x7fC\xc8\x0d\
+!K\x08\x99\xee\x95\xdf\x10rC\xc8\x12B\xa6\x9b\xcc\
+7\x84\xdc\x10\xb2\x88\x90\xe9\xb2\xeb\x0d!7\x84, \
+d\xbaKyC\xc8\x0d!K\x08\x99n\xe6\xdd\x10\xf2\
+Q\x11\xd2\x82{\x07\xa2\xe1~\xca\xd5\x1d\xb7\xf8\xf0\x93\
+\xf6E3\xc6\xe99\xd9\xd1\x91\x85\xb35gR\xb9\xd0\
+I\xf6\xe2\x01I\xcf\x88B\x01\x8c~@\x95C\xa6\x8a\
+|\xce>\xbd\x1a36\x94\xce\x0fE\xc7\x0e,\xda\xb4\
+\xa9\xc2\xdc\xe6eH,O\x0a\x9f\xd0\xb57\xde\x06\x1b\
+G|;\x88Z(\x84\x16\x95'\xa2Ql\x058\x83\
+f\xafph\xbf\xaaw\x8b\xddf\xc0\x1b\x80\xf6k\xf5\
+\xba\xfb?a\xe7\x19\xe4\x0aendstrea\
+m\x0aendobj\x0a88 0 ob\
+j\x0a2750\x0aendobj\x0a92\
+ 0 obj\x0a<<\x0a/Type \
+/XObject\x0a/Subtyp\
+e /Image\x0a/Width \
+24\x0a/Height 22\x0a/B\
+itsPerComponent \
+8\x0a/ColorSpace /D\
+eviceGray\x0a/Lengt\
+h 93 0 R\x0a/Filter\
+ /FlateDecode\x0a>>\
+\x0astream\x0ax\x9cc````\x96\
+@\x02\x22\x0cP\xc0\xd4\xf3\xed?2x\xe2\x07\x11\xcf\
+\xf9\x8f\x06\xbe+\x82\xc5w\xfe\x9f/'\x8b\x00\xea\xf7\
+\xff\xa7\x81\xc5O\xfe\xcfc@\x06\x07\xfe\x97\x0d1\xf1\
+mu\xc8\xe0>D\x9c\xe5\x11z8\xfc\x9f\x02\x12O\
+\x87\xb0\xdf\xef\xdc\xb1c\xc7\xe1\xbf\x90\x00\x92a`\xe0\
+|\x0a\x11\xd7\x02\x9bY\x0b\xe1\xcca`(\x87\xea\xcd\
+\x13\x14\x10\x10\x90\xde\x08\xe1\xfc\xd1`x\x85a:\x08\
+Lg\xc0*\xfc\x7f-\xc3\x0d\xac\xe2\xad\x0c\xbc\x8eX\
+\x809#\x03.\x00\x00\x95\x8b\xe2>\x0aends\
+tream\x0aendobj\x0a93 \
+0 obj\x0a147\x0aendobj\
+\x0a94 0 obj\x0a<<\x0a/Ty\
+pe /XObject\x0a/Sub\
+type /Image\x0a/Wid\
+th 24\x0a/Height 22\
+\x0a/BitsPerCompone\
+nt 8\x0a/ColorSpace\
+ /DeviceRGB\x0a/SMa\
+sk 92 0 R\x0a/Lengt\
+h 95 0 R\x0a/Filter\
+ /FlateDecode\x0a>>\
+\x0astream\x0ax\x9c\xed\x94\xd1\x0a\xc20\
+\x0cE\xf7\xff\x9f\xd4U\xcbP$\x99\x83\x81\xcd\xa8\xfa\
+\x22\xeeG\xeaH;\xc5\xae\xd5n\xecq\xe1>\xb5\xe1\
+$\xbd\xa4)\x8aOXk\x15\xd2\x7f5\xd7\x22\x11\x03\
+\xa1\x04-f\xa9\xa6)G\x00\xcd\x83\xb0*\x08\x1b\x13\
+\xe89eCU\xad\x7fkW\x1b\x9f\x0caK\xfe\x1c\
+\xbb\xd4\xc3\x83p&H\xd0\x1bg\xe3\xbc9,\xcaS\
+\x84\xa3\xac]\xf6/\x04~qd\x0a\x824L\xfe\xa8\
+8J\xc1\xddAN}\x1f\xcd\x91\x93\xbfSb\xac\x1c\
+\xfa4\x11\xbde\xcf\x0f\x97\xa7j\x1fN\xb2\xbd%[\
+\xe2u\xb4\xc4\x96\xa0\x22\xbb\xbd\x06\x87\xd6\xe1\xb0EG\
+c$O\xc22\xed\xcf\xdd\xb0\x933\xa77'^W\
+\x17\xd7\xd6\x0aendstream\x0aen\
+dobj\x0a95 0 obj\x0a18\
+7\x0aendobj\x0a96 0 ob\
+j\x0a<<\x0a/Type /XObj\
+ect\x0a/Subtype /Im\
+age\x0a/Width 22\x0a/H\
+eight 22\x0a/BitsPe\
+rComponent 8\x0a/Co\
+lorSpace /Device\
+Gray\x0a/Length 97 \
+0 R\x0a/Filter /Fla\
+teDecode\x0a>>\x0astre\
+am\x0ax\x9cc``\xe0UA\x01J,\x0c\x0c\
+\x0c\xdc\xab\xfe\xfdG\x05_r\x18\x18z\xffc\x02\x1b\
+\x86k\xff\xeb\x85P\x80\xf8\xf1\xff\xcd\x0cO\xfe\x071\
+\xa0\x82%\xff'\x12%\xaa\xda \x85)\xaa\xfd\xea\x7f\
+\x15\x86\xa8\xd6\xcb\xffO\xe5\xd1EA\x82j\x08s\xad\
+\xf3\xd9\x81\x82\x9a/\xfe?SC\xb2\xed\xec\xff-l\
+`Aud7\xc4\xff\xfb\xbfE\xff\xf9\xff\xe7\xea\xa8\
+.K\xff\xf7\xff\xef\xff\xe7\x1a\xe8\xee\xcd\xf8\xf7\xff\x85\
+&\xa6/\xa2Vi\x90\xeac\x98\xe8\x9d\xff\xa9h\xa2\
+\xdb\xffw2,\xfc\xff\xe7)\x0ax\xf5\xff\xbf?\x83\
+\xe4E\x8c\xa8\x98\x01\xd4\xc0j\x11\x88\x02\xfcU\x19\x18\
+\x00\x18\xa6\xbc\xf0\x0aendstream\x0a\
+endobj\x0a97 0 obj\x0a\
+178\x0aendobj\x0a98 0 \
+obj\x0a<<\x0a/Type /XO\
+bject\x0a/Subtype /\
+Image\x0a/Width 22\x0a\
+/Height 22\x0a/Bits\
+PerComponent 8\x0a/\
+ColorSpace /Devi\
+ceRGB\x0a/SMask 96 \
+0 R\x0a/Length 99 0\
+ R\x0a/Filter /Flat\
+eDecode\x0a>>\x0astrea\
+m\x0ax\x9c\xbd\x94K\x0e\x820\x10\x86{>\xa6%\
+\xba`\xe7\xda\x9dg\xf0\x14\xb4)\xb8r\xe9\x01\xdcz\
+\x87> \xf1\x02\x1e\x03\x87G\x11Q\xa04\xd1\xc9\xac\
+H\xffof\xfe)%\xa4\x8b\xb8<1\x93{&(\
+~\xacnNJv\x8f3~\x89T\xba6A\x89\x96\
+\x10\xe9\x10y\x9b\xd4H$\xb8\x06xbr\xcfd*\
+wm\xa4u\x0f-P\xa7dM\xe0\xf9\x9a\xa0\xffM\
+\x00+P\x82[\x0b#0\x9bu\xb3k\x1e@\x88\x8d\
+x\xad\xc0\xae\xeea(\xdf\x14\xd9\xbc\x0fL\xd7\x93\x1e\
+\xee\xd77\xc7\xf4X>C\xe8'M\xcce$\x8fK\
+>ll\x8a\x00\x86\xf7\x10\xc0~\xdc\xb5\x19\xc9\xe7}\
+\x88\xd4\xc0\xb4FN\x95\xfc4g\xdeI\xda\x13\xf4\xa4\
+\xc3\x8b\xbb\xa0\x86\xe3\xff\xf2\xb5\xba'a1~A\x00\
+#V\x11\xa0\xf3\xaa\xb9\xe1A\x0f\x94\xbb\xe1u\xddm\
+!\xc3\x9e)\x18\x0c\xbe\xaf$+\xd0|\xe1\x99X\x1a\
+l7\xf5\x13\xc2\x8d\xe8X\x0aendstre\
+am\x0aendobj\x0a99 0 o\
+bj\x0a246\x0aendobj\x0a10\
+0 0 obj\x0a<<\x0a/Type\
+ /XObject\x0a/Subty\
+pe /Image\x0a/Width\
+ 24\x0a/Height 24\x0a/\
+BitsPerComponent\
+ 8\x0a/ColorSpace /\
+DeviceGray\x0a/Leng\
+th 101 0 R\x0a/Filt\
+er /FlateDecode\x0a\
+>>\x0astream\x0ax\x9c\x85\xd11k\
+\xc2@\x1c\x05\xf0'R\xdb\xc1\xcd\xc9\xc5\x16\xbb*B\
+\xc7\x82\xab\x8b\x0e\x0eB\xc1\xcd@7]\x5c\x05\xab\x1f\
+@\x9aM\xa5\x1dm\xfc\x02\xd6\xd5)\xbbi\xbb)\x08\
+qk\x1dT\x1cL\x85\xbc\x9eM\xd3$\xb7\xf8\x86\xbb\
+\xc7\x8f\xe3\x9f\xe3\x02\x1cs\x96\xef\x1b\x9f\x96\xa9?d\
+\xe0\xcf\xdd\x8cnF\xa9\x7f\xbd\xd0Hk\x5c+d\x8b\
+mC4\xc5e\x9d\x1c$\x9c\x1e*/\xc8\x86\xd3_\
+\xf8\xadx#\xab\xa4]\xfa\x9dM\xfa\xf8\xde\xe6\x9a\x9b\
+\x98\xb8\xc9\x8c\x83\x00\x8f\xafv\xec\x00yZ\x89\x00\x9f\
+\xa3\xc5m\x04}\xbeJ\x8c\xe8\x9e9\xbc\xb1&10\
+a\x13_,\xc8\x8cg\xf6`1+3TjX\xb2\
+(3\x86|\x84\xce\xb6\xcc\xf8`]\x5c\xca\x08I|\
+M\xa6\x91!\xcbAF\x97s\xb1\x8e\xb8\xa8\x06\xf8\xe6\
+\xc0\x8a\xd8R\x96xu\x1f\xc7MN\xc3\xc7\xa2\x90\xeb\
+K\xef\xb4\xc9U\xd2\xa9\x0d\x9b\xbbV\xd4\xf9d\xf7\xc0\
+\xd5\xad{\xa6\xb4!\xf7\x93'u\xf8.FN\x93\xde\
+\xf3\xc6:\xdb\xbf\xdf;\xaf\x84\xe1O$\xd7\xecij\
+=\x8dS\xf9\x01\xa2z\xb5\xc9\x0aendstr\
+eam\x0aendobj\x0a101 0\
+ obj\x0a287\x0aendobj\x0a\
+102 0 obj\x0a<<\x0a/Ty\
+pe /XObject\x0a/Sub\
+type /Image\x0a/Wid\
+th 24\x0a/Height 24\
+\x0a/BitsPerCompone\
+nt 8\x0a/ColorSpace\
+ /DeviceRGB\x0a/SMa\
+sk 100 0 R\x0a/Leng\
+th 103 0 R\x0a/Filt\
+er /FlateDecode\x0a\
+>>\x0astream\x0ax\x9c\xb5\x94\xb9\x12\
+\x85 \x0cE\xf9E@\x86\x8a\xb1\xb3\xf3\xff\xbb\xe4\x89\
+\x82\xb2\x5c\x09\x16/C\xc1@8!\xabR\xad\xf0\xb6\
+\xb1\xd6`\x19CZw\xeaX\x0ee\x0c\xc9\x8bN\x85\
+\x11a]+\xfdkc-Y\x0b\xe0\xd6\x8a\x90h\xd1\
+9\xa0\xc3L%\xd0\x18\xa0#\x19zs\x1c_\x89\x90\
+\xc3\xc7\xc6\xc1\x10\xd2U\xce\x0e\xa1\x7fBH\x0c\x9d\xf7\
+\x94\xf7\xadG(&\x18\xb2\xef\xfdC\xae\xb1\x93\x90x\
+\xe8\x5c:<\xa3\x01#&B.\xa1\x22qB=\xbc\
+C\x9e\xb7\x05\x87\x10g\x0ci|II\xef\x92%B\
+\x9a\xb7\xb8\xa2& \x0a\xc6\xe7X\xcc\xdf \xde'\xb5\
+ey\x98\xb9\x0e'!\x0a\x15\xcc\xd3}y#Bn\
+\xebe@\xda\x093\x0f\xe9&C\xd5\x80\xc3F+\x7f\
+\x82GG\xe9\x14j\xb7;\xb0\xe2p\x00\x0e\xe6\x0a\xe1\
+z\x82\x8d\xff\x1cQ!PMk\xc9\xd2d\xa8h\xce\
+\xa5\xb1\x5c\xa4\xf2\xaa\x93\x7f\xcb\x0f\xba\x17\xbe\x98\x0ae\
+ndstream\x0aendobj\x0a\
+103 0 obj\x0a244\x0aen\
+dobj\x0a104 0 obj\x0a[\
+2 /XYZ 22.500000\
+0  \x0a735.500000  \
+0]\x0aendobj\x0a105 0 \
+obj\x0a[2 /XYZ 22.5\
+000000  \x0a665  0]\
+\x0aendobj\x0a106 0 ob\
+j\x0a[2 /XYZ 37.500\
+0000  \x0a525.50000\
+0  0]\x0aendobj\x0a107\
+ 0 obj\x0a[2 /XYZ 3\
+7.5000000  \x0a290.\
+750000  0]\x0aendob\
+j\x0a108 0 obj\x0a[2 /\
+XYZ 37.5000000  \
+\x0a400.250000  0]\x0a\
+endobj\x0a109 0 obj\
+\x0a<<\x0a/Type /Annot\
+\x0a/Subtype /Link\x0a\
+/Rect [22.500000\
+0  139.250000  1\
+70.250000  155 ]\
+\x0a/Border [0 0 0]\
+\x0a/A <<\x0a/Type /Ac\
+tion\x0a/S /URI\x0a/UR\
+I (https://www.f\
+laticon.com/term\
+s-of-use)\x0a>>\x0a>>\x0a\
+endobj\x0a110 0 obj\
+\x0a<<\x0a/__WKANCHOR_\
+2 104 0 R\x0a/__WKA\
+NCHOR_4 105 0 R\x0a\
+/__WKANCHOR_6 10\
+6 0 R\x0a/__WKANCHO\
+R_a 107 0 R\x0a/__W\
+KANCHOR_8 108 0 \
+R\x0a>>\x0aendobj\x0a112 \
+0 obj\x0a<</Title (\
+\xfe\xff\x00F\x00R\x00E\x00E\x00 \x00L\x00I\
+\x00C\x00E\x00N\x00S\x00E\x00 \x00\x5c(\x00\
+W\x00I\x00T\x00H\x00 \x00A\x00T\x00T\x00\
+R\x00I\x00B\x00U\x00T\x00I\x00O\x00N\x00\
+\x5c))\x0a  /Parent 11\
+1 0 R\x0a  /Dest /_\
+_WKANCHOR_2\x0a  /C\
+ount 0\x0a  /Next 1\
+13 0 R\x0a>>\x0aendobj\
+\x0a113 0 obj\x0a<</Ti\
+tle (\xfe\xff\x00H\x00o\x00w\x00 \x00\
+t\x00o\x00 \x00a\x00t\x00t\x00r\x00i\x00\
+b\x00u\x00t\x00e\x00 \x00c\x00o\x00n\x00\
+t\x00e\x00n\x00t\x00s\x00?)\x0a  /\
+Parent 111 0 R\x0a \
+ /Dest /__WKANCH\
+OR_4\x0a  /Count 0\x0a\
+  /Next 114 0 R\x0a\
+  /Prev 112 0 R\x0a\
+>>\x0aendobj\x0a114 0 \
+obj\x0a<</Title (\xfe\xff\
+\x00W\x00h\x00e\x00r\x00e\x00 \x00y\x00o\
+\x00u\x00 \x00c\x00a\x00n\x00 \x00u\x00s\
+\x00e\x00 \x00F\x00l\x00a\x00t\x00i\x00c\
+\x00o\x00n\x00'\x00s\x00 \x00c\x00o\x00n\
+\x00t\x00e\x00n\x00t\x00*\x00:)\x0a  \
+/Parent 111 0 R\x0a\
+  /Dest /__WKANC\
+HOR_6\x0a  /Count 0\
+\x0a  /Next 115 0 R\
+\x0a  /Prev 113 0 R\
+\x0a>>\x0aendobj\x0a115 0\
+ obj\x0a<</Title (\xfe\
+\xff\x00W\x00h\x00a\x00t\x00 \x00y\x00o\x00\
+u\x00 \x00C\x00A\x00N\x00 \x00D\x00O\x00\
+:)\x0a  /Parent 111\
+ 0 R\x0a  /Dest /__\
+WKANCHOR_8\x0a  /Co\
+unt 0\x0a  /Next 11\
+6 0 R\x0a  /Prev 11\
+4 0 R\x0a>>\x0aendobj\x0a\
+116 0 obj\x0a<</Tit\
+le (\xfe\xff\x00W\x00h\x00a\x00t\x00 \
+\x00y\x00o\x00u\x00 \x00C\x00A\x00N\x00N\
+\x00O\x00T\x00 \x00D\x00O\x00:)\x0a  \
+/Parent 111 0 R\x0a\
+  /Dest /__WKANC\
+HOR_a\x0a  /Count 0\
+\x0a  /Prev 115 0 R\
+\x0a>>\x0aendobj\x0a111 0\
+ obj\x0a<</Type /Ou\
+tlines /First 11\
+2 0 R\x0a/Last 116 \
+0 R>>\x0aendobj\x0a117\
+ 0 obj\x0a<<\x0a/Type \
+/Catalog\x0a/Pages \
+2 0 R\x0a/Outlines \
+111 0 R\x0a/PageMod\
+e /UseOutlines\x0a/\
+Dests 110 0 R\x0a>>\
+\x0aendobj\x0a91 0 obj\
+\x0a<<\x0a/Type /Page\x0a\
+/Parent 2 0 R\x0a/C\
+ontents 118 0 R\x0a\
+/Resources 120 0\
+ R\x0a/Annots 121 0\
+ R\x0a/MediaBox [0 \
+0 595 842]\x0a>>\x0aen\
+dobj\x0a120 0 obj\x0a<\
+<\x0a/ColorSpace <<\
+\x0a/PCSp 4 0 R\x0a/CS\
+p /DeviceRGB\x0a/CS\
+pg /DeviceGray\x0a>\
+>\x0a/ExtGState <<\x0a\
+/GSa 3 0 R\x0a>>\x0a/P\
+attern <<\x0a>>\x0a/Fo\
+nt <<\x0a/F8 8 0 R\x0a\
+/F9 9 0 R\x0a>>\x0a/XO\
+bject <<\x0a/Im6 6 \
+0 R\x0a/Im94 94 0 R\
+\x0a/Im98 98 0 R\x0a/I\
+m102 102 0 R\x0a>>\x0a\
+>>\x0aendobj\x0a121 0 \
+obj\x0a[ 109 0 R ]\x0a\
+endobj\x0a118 0 obj\
+\x0a<<\x0a/Length 119 \
+0 R\x0a/Filter /Fla\
+teDecode\x0a>>\x0astre\
+am\x0ax\x9c\xed]K\x8f\xdc\xb8\x11\xbe\xf7\xaf\xd0\
+y\x81m\x8b/\x89\x04\x16\x01\xec\xb1\x1d$\x87\x00\x86\
+\x0d\xec!\xc8!\xf0f\xb3Xd6q\xf6\x90\xbf\x1f\
+J$\xd5\x22\xa9\x8f\xdd*\xb3%\xcdx<\xf0L\xab\
+)\x16_\xc5z\xb1\xaa\xf8\xea\x8f\x1f\xff\xde\xfc\xf3\xf7\
+\xe6\xd5\xc3\xc7\xff4\x9f\xfd\xdf\x87\x8f\xa7\xf6\xdc\xab\xd6\
+\xfdk\x86\x9f\xef\xe3/\xb4\xe4\xcd\xe7\xc7\xd3\x97\xe6\xcb\
+\xe9\xc3\xe9\x83\xfd\xfd\xe5\xe4\xde\xfb\xf8\xf0\x17\xfb\xe9\x7f\
+\x0do\xfel\xff\xff\xda\xfc\xf5o\xf6\xcb\x9f\xfcK\xc3\
+\x0b\x8f\xa7\xde\x08\xfb\xf7_\xe3_\xc6\xb8\xb0\x1f\xdb\xcb\
+\x87\xa1\xe4\x97\xd3\x8f\xdf5\xbfY\x98l\x849\xfc\xfe\
+\x9es\xd9\x0dM\x16\x9b\xf9rz\xe5\xc6c\xfb/\x8d\
+\x11}\xcb\xfb~\xac0<\xab\x9ew\xf6\xb7}\x0a\xc0\
+\xc2\xa8\x1d\xd0\xdf?\xff6\xd5gJk7p.\xe4\
+P\xc3\xfe\xfe\xfc\xd8\xbc\xfa\xd3c\xd74o\xff=\x0c\
+hh-\xd4?\x9b\x9e+iZf\x86\xcf\xba\x15\x86\
+3\xd5\x8d\x9f\xa5`\xc2\x16F\xd0\xc1\xc8\xb8\xe8D3\
+L\x0b\xd7m\xf3\xdf\x7f\x9c~\xb6\x8d\x5c\x9a\xd0\x03\xf8\
+\xae\xed\xf5\x00v\x84i\x1b\x1c>s#\x19\xeb;y\
+K\x13\x82k96a\xff\xf8\x16>,\xbf\x1b\x1af\
+\xe3O47\xe37x\x09`\xc57\x9fN\xaf\xde\xeb\
+\x86\xe9\xe6\xd3\xcf\x8dk\xf2{\xf7\xe7\xd3\xe3I\x8cs\
+\xcd\xec\xe7\x9f\x9a\x1f,\x96\xb1?4\x9f~=\x99\xb3\
+l;\xae\x1c\xd6\xf9\x12>\x96\xc8\xb3\x92\x9d\x1e\x90\xf2\
+R\x22\xc6\x12}6\xae`V\x22=4\x8b\x13\xaa\x8d\
+J\xd4X\xc2\xda\xd0\xd0\xa5\xa4\xf3\xd0T\xafY\x5c\x82\
+\xa1\xf5\xa1o\xbe\xe8R\xa2];\xfc,\xa4\xe8o\x84\
+f\xc6\x92\xee,\xb3\xf1\xbc\xf6%m\xd67<;o\
+\xa6\x91r6\x14\xdd2o\x0f\xbeo}\xa7\x92\xd9\xc1\
+=p\xe3y\xf7)\xc2^>\xc3^\xcd\x85\x1a\x91\xd6\
+~V\x8b\x1b\xe4\x96\xf7\xaf\x22\xe0\xdaF\x03zv\x10\
+=-\x8a\xf8A2\xe5'f\x1c\xfb|\xca\xd8\xfb0\
+\xcd<\x99\x18\x11PZ\xf8J7\x94L\x08\xd5f\x08\
+\xc5\xfc\xa2\x09\x8fk\x97\x1e\xbc\xf1u<>\xe5H\xe8\
+\xe8\xd2\x1c\x05p\x0f\xb8C\x0e\xc6\xce)\x0a\xf0\x80\x1c\
+\x19\xb2S\xc6#\x02\xe2\x06>s\x19\x8fC5&\xcf\
+)z\xe2\x91\xb2\xd07n\x92m\xc0\xdeN\xe3I\x91\
+\x1d\xf6\x8d\xbdC[\xb4\xd0\x0e.\x81\x18\x82\xc7\xc3\xdb\
+P']m\xce\xa6\xf18\x0avK\x0fp;<\x90\
+).b\x0c\xc1x \xc4\xd2\x86\x173\x8e(g\xfb\
+\x10m\xf8\xeb\xef\xdf\xb0\xe1\xd75:nx\xd30\x89\
+7\xbc\x95s\xa2\x89\xe9s\x1a\xe9\x17\xa0?\xf7,E\
+(WG\x9c\x19\xe0-\xddy&S\xf9\x92w\xbeN\
+\xd7&\x0b\xed\xe9\xf7\x124\xdc\x8e\xf0\xed\x18G\xf23\
+*\xdd\x9fuF$T\x18O+\xd8\xad\xbd\xc6\xd0\xf0\
+x\x1e|\x9d\x9cL\xe1\x91\xe2\x12\xc7+u\xca\xa0\x86\
+]\xe6\x10\xf6\xab&\xdf\xd3\xfb\xee\xec\xe8f\xa9a&\
+\xe0\xfc\xe1\xb9x\xef7$\xcbJ\xb2q\xe1>\xe2\x86\
+\xab.\x9c\xa7\x04\xe2lT\xdaN6\x17\xc6\x8f+\x1f\
+1\x01|\x01\x1a\x1eF]\xcc\x84{\xa3\x80 \xb8\x9d\
+t\xba\x0a3\x8bW\xfd\x9d\xef\x92\xa7K7m\x16<\
+@\x8c\x88\x14\x22\x93!/\xa6-x\x96\xaa\x80\xc7\xe3\
+\xa2\x10B\x0c\x8d@[\xee\xbc\x9f\xaa\x90.R\xc3A\
+\x81\xf2\xc0n\x82\x96vI\xb6\x10\xed\xf0\xc2a\x8c\xa9\
+\xbap\x85mT\x97\xbf\xdf\x8e\xe7\x1c\xce\xf9f\xc3\x80\
+S\x5c\x10\x94\xe0R\x92\xc8*\x1c\x0f\x89\x81P\xe6\x0d\
+\xa3\x19,)\xf4\x0dR^\xaf\x15,\xed0,\x0bP\
+(\xe1[\x02V\xd5\x10i\xea\x22\x13\x9eH?\xf9\xa3\
+\x0asTU\xa4\x13\xd7\xf1\x9b\xb0\xea\x85\x89\xac\xc1}\
+\x0ab\x03E\x16\xa8\x8b\x0f\xb8\x1d\x8c\xf0\x10\x1a7\xbe\
+$Gx<R<;\x04A\x8c\xbf\x85\xc4\x920\x07\
+O\x8a}\xf3\xd7G\xd8\xc0E\xe3\xe1\xd0]?\x7f\xd0\
+\x04\xc5\x9c\x09\xca\x9cY\x9f\x0c\x9d\xbbu\x1a\x0c3\xce\
+\x02q\x99\x14l\x22t\x93\xa2r\x1b:n\xa7\x00\xed\
+\xc1\xe3C\xaeh\xc0v\x0a%\xc6\x97d\xe6\xbe\xc9\x82\
+\xdd\xa6\x16l\x11,\xe59\xc3}\xebKx\x06\x0d\xf7\
+@\xfa\xf1\xe4\xbb\x05\xcfA \xb0\x99\x15\xa80\xa3\xaa\
+j\xdf(\xd0\x82\x18\xd7\xa5\xc6j\xa1.\xdb\xe6\xde\xa6\
+;\x96o7\xa5\x1bnu\x1e'^6\x8f\xfe\x99\x9f\
+\xb5n{\xd6\xa8\xce}`\xe3\xb7\xb2Q*\xc8\xa1\xee\
+\xf9\xf3IYJ\xc0\x0c\xd7\x9a\xf97DT_\xcc\xa1\
+\xdb\xb7\xc7\xe7\xd6Ui\xa2\xba\xdc\xc4\xd0\xed\xb3}\x7f\
+\xde\xfe\xf0\x86\x8e\xea\xeb\x18\xfa/\xa77\xdf\xedKz\
+\x16e\x87~$=\x229\xb7\xe8\xc3\x01@\x86\xc0K\
+,/l\xd5\xbc\xa4\xf7\xd4=;\x22\x0b\xe4j:6\
+\xce\xe9~\x9f\x1e\x84\x89\x80\xf4<c\x93\xb0\x9d\x0b\xa3\
+\xce\xb6\xea\x84\xf4\xd9\x86\x0c\xf2S~n\x11X\x1e\xcb\
+H\x1c\xeeu\x7f\x04\xce\x83DG\xd6\xe9h\xfd\x0b\xec\
+>\x90\xf7>;- \xe8`Xx Y\xa5\xb0D\
+@\x10/+\xeb\xc8u\x0d\xf6\xd8\xc0\xf8&\x88\x97\x19\
+n\xe2\x1e`\x1b8A\xf0,\x88\xd8\xfb\x0b\xec\x04\xad\
+\x96\x05q9\xc3\xf8\x024\xd8\x03\xc9|\x9d\x1c\x1aA\
+\x99(X^\xb0\xf8\x8f\xf1\x1a+ Uu\xfe\x82=\
+\x82@Cd\x18i.\xb6\x88 \x04e\xbbd/\x0d\
+X\xba\x86\xf9\xd9s\xa8\x9b\x96\x12\x0e]\x04iR\x9b\
+\x9b\x89$WA\xab\xc84\x04\xb8\xc8R\xa2)\xae|\
+>\x93\x9dt\xe0\xce>\xf7\x93\x8e\x02\xa1\xd8\xca\x8aB\
+`f\x05\xdb\x02\xe5\x94\x9b`\xd2,,2\x85a\xc0\
+\xbe\x15D\x97l\x911My\xef\x1b\xe6+x%\x9e\
+\xaeM,\xa6\x07\x15a\x9d\x06\xa3\xfa\xab\xc8\xfbLh\
+\xff\x01\x07\x88\x87Aq~)l0\x0a\x01\xa4L1\
+&\x9a\xb7o\xf1\xca^7\x98\xaf\xd3)\xe2\xaev\x9d\
+^\xc4v\x9d^.\xd9u\xfa.\xb6\xbc\xd8\xe7\xc4\xae\
+3\xbc!\xa2\xfab\x0e\xdd\xdbuz\xbed\xd7\x19\xde\
+\x8e\xa0\xb3\xd4\xae3\xbc\xa1\xa3\xfa:\x86~h\xbb\x8e\
+\xad\x1d\xedC\xab\xe9y\xfbc\xbe?r;\x08\xb4i\
+\x14\xea@K\x8c\xd0\x1eMs\xebM\xd8(*\xd3\x0a\
+:\xbf\xb9T\x97\xf8\x89\xe2\x92B\xaf\xb1\x9d\x0a\xd7Q\
+as\x01\xe3\xb9\x5c\xa0l\xd8\x1a\x05\xeb\x14\xack\x1b\
+\xd9\xd0\x8em\xa7\xe2,\xc6\xe7\x82j\xf4\xe0KD\xea\
+=K\xf2\x9eZ!\xecaF\xb3\xbb\x9cK\x127_\
+L3/\xa6\x99\x1f^L3/\xa6\x99x\x22_L\
+3\xabL3x\xbaH\xfe\xd8\x04\xf2V`%\x14r\
+\x0d\xcf\x0c(\x1ej\x14O8\x92G.E\xd7\xdb\x88\
+\xfd\x5c\xf5\x84;\xa8L\xe6T\x0cc\x9e\xd7\x1e/\x10\
+\xb1@\xd9\xe5U?\xec#;\x9a\x93dA,\xb9\x10\
+\x84j\x0a9\xa8lC\xabb\xe0y\xd1\x1av\xd4\x1a\
+\x9e\x9bs5\xde\x135h\xd7s\x93B6\xf3\x1f\xa9\
+\xeb\xf3\xfe4\x9d\x9d\xe1\xec\x90\xe2%\xf0\xbcQ\xa4D\
+\x0a\xf1\xaf\xe2\xb7N@\xa6\x82\x8b\xce\x0a~\x84}v\
+(\x07\xa0p5\x0a&\x09\xcc0\x08z\xecVQt\
+\xa4\x18WJ\xa0\xd8jB\xbeJ\xbc_8M\x99g\
+\xb5\xe9\xc2\xbfQH\xb7\xcf\xc2\xff4\xa2mx\xd7\xf3\
+(\xad\xcdJm\x80K\xa7\x01p\xde\x0c9r|\xc2\
+\x1b#}\xc6\x9b\xe3i(\xb2\xb3\x9d\xedt\xe2\xdc\x98\
+f\x1ea\xca\xbe\xc2{9|\x1e?\xa8vh[\xb8\
+\xac9}\x9bf\x1e\xb9\xfa\xfe-\x99GV5Z\x0c\
+\x1ePm4H\x9c\x0d\x83k\xaf\xbf\xf0,Y\x0bv\
+'\xc7n\xf8\x04\xf7x\x1f\x85\xb1p\xfaPp\x8f\xc7\
+\xae\xfb\x047\xfcB\x90\x02v\x9c\xc7\xed\xe0\xbeu\xbe\
+\x07\xb9u\x8e0o\x85l2\x81ue\xc1\x10\xa4p\
+\x0c\x18ZQ7\xb0\x81OgZ\xc0+{i\xde\x9e\
+Y\xd0\x05\x97\xbe\x04Y\x90\xf7<\x9c\xefy\x1f\x1d\xce\
+\xf7\x5c/\x1c\xce\xf7\x96\xa7\xcc\x8f\xcf\x87\xe7\xf8p~\
+|CD\xf5\xc5\x1c\xba;\x9c\xefy\xb7p8?t\
+1\x82n\x9f\xe3\xc3\xf9\xf1\x0d\x1d\xd5\xd71\xf4\x9d\x0f\
+\xe7\x8b\x96\xb3^\x84\xdc1\xe2}\x10\x9b|\xae\xa6[\
+D-\xacN\x11\xec\x06\x14\xab\xd4<\xa4n/4\x95\
+:FSi\x96\xd0T\xc5^\x1e\xc3s\x82\xa6\xca#\
+\xe6\xa5\xbe\x98C\xf7h*\xfb%4\x95\xb1\x87\xca\xf0\
+\x9c\xa0\xe9\xf0\x86\x8e\xea\xeb\x18\xfa\xa1\xd1T\x85\xb8b\
+\x1e8J\xee\xc1\xb1\x22Q\x09\xc64\xac\xd8T\x0d\xd8\
+'Y\xb5p\x0fp\x14,\xc5DA\xb1m\xd7\xb5\xa1\
+\xaf\xb06U51\x17t\xc7\x0c\xbb0\xed\xc3\xe3\xda\
+\xc8\xfe\x19\xc4ov^a\x15\xc4}\xa3DyS\x94\
+p\x8aQ\x06\x1fg\x1f\x803t&\xe6\x0c}\xbb\xc4\
+\x19\xac>\x1c\xd1\xeeA?\x8e9\xc3\xf0\x86\x88\xea\x8b\
+9t\xcf\x19:\xbd\xc4\x19\xba>\x86n\x9f\x13\xce0\
+\xbc\xa1\xa3\xfa:\x86~h\xce`\xb5\xd7H\x96]\xd2\
+\xeb(g\xc2u\x0f\xcf(vZB\x82/R;\x84\
+mW\xb0\xcbQ\xc4;J\x92=\x0a\x0d\xdf\x88\xf4\x14\
+\x5c\x92\x94/\xc9No\x0b\xbd\xc6$\x0e\xaf\x02\xac#\
+'~\x99i\xb0\x94\xbd@p@#\x89>\x94\x1e\x10\
+r+\x16\xc4%\x82\xf0U\xf0\xdd\xa0D1P\xe4\x19\
+,\xa4d\x22Vv \x81\x0f\x0a\xea\xae-A\xa8,\
+\xcc\x1f\xde\xc9u{M8\xe1#\x9d>\xe2v\xaa\x8e\
+\xa7\xe0W\x12,\xb6\x99\xd3C\xdd\xa3y\xd2\x1c`\xb1\
+y\xa3P\xc05i\xef(\x1b\x982\x0c\x8a\xbfp\xa6\
+\xdeP\xd6\x16\x82\xf7\x1e\xff2\xa7%\x14\xbeGQ\xb0\
+d\xb0\xf6\xe6\x9c\xf7\x00\x8a\x82icE\xc1\xb0%E\
+\xc1\x88X\x94\xb7\xcf\x89\xa20\xbc!\xa2\xfab\x0e\xdd\
++\x0a\xda,)\x0aZ\xc7\xd0\xeds\xa2(h\xaf\x1a\
+\x5c\xea\xeb\x18\xfa\xa1\x15\x05\xa3\x022B\xef\xef\xc2A\
+4!kY\x81IQl\x22\x84\xa3\xe3\xcd\x8e\xc2w\
+Wb\xaa\xe4\x81[a\xfd\xb9\xb7U\xab\xaaFT\xd9\
+\xe4\x8eg\x09K$\xfb\xd3X\xcd\xe2\x14^V\x98Y\
+\xa0\xb1\x9a\xc5)\xbc\x86\xe7\x98\xc6\x8eo\x88\xa8\xbe\x98\
+Cw4V\xb3\xa5\x14^\xba\x8dSx\x0d\xcf1\x8d\
+\x1d\xdf\xd0Q}\x1dC?2\x8d\xd5,8\x00\x90\x8c\
+1\x94h\xa6\xbatl7+\xf6\x9d\xd3\xaf\xd7\xa0\x8e\
+\x98,\x17\x8c\xca\xfb'\xb9\xde\x8a\xcd\xc09 \xb9C\
+S\x8e`\x08r9)\x19k\xdd@\x00BN\xd4+\
+\xeeg=\xf7?#m\x9a?\x0f\xeegZ\xf4_\xe5\
+~\xc6\x1d\xe1K\xdc\xcf\xf4\xb1\xdd\xcf\xf4t~\xfa\x8c\
+\xdd\xcf.\x83$\xb9\x9fQ\x5c\x95\xf6w2\x83\x97e\
+\xb1)0?\xeb\x1b\xbc$\xa90\x9eI\xe8\x93I;\
+\xf82\xa6\x03\xb8\x10i#c\xa1\xcf\xa8%\xa1\xcf\xc4\
+gd\xc3s\x22\xf4\x0do\x88\xa8\xbe\x98C\xf7B\x9f\
+\x11KB\x9f\xe1\x09t\x9e\x0a}\xc3\x1b:\xaa\xafc\
+\xe8\x87\x16\xfa\xa6\xe0;\xa9=\x95\xef3\x04\xaeq\xff\
+P!\xa0\x00\x9b\x5c\xabf\x1b\xdf,\xd8a\x85'>\
+|\x15\xdb\xdcH1\xa5X\xee\x80R\x0c)\xaa\xa7j\
+\xe2\xf8\xcagMU&\x9f\x12\xffE\x11o\xb1\xc8\x85\
+5\x08\x8a-\xeb\x1e9\xa1\x9e\xc8R\xe2s\xc4\xfd\xb5\
+\x81\xbaW\xe7m\xb4\xc8\x05\xcd\x8b\x12\x1c\x09\xb5\xb5\x02\
+\xb9\xbeG\xec\xfc\x91.\xc6\xdb\x8c\x87\x1d\x19\x9d\xebf\
+\xad\xa1\x1caQ\xf2\x0dQ\xdc\x98\xea\x1a\x92)|\x88\
+\x82\xf1\x18\x1a\x01\xab\x0a\xebS\xd50\xeeq\xe7\xc8\x89\
+2\x0c\xbf>\xc5\x05\xde\x05'\x92\xe2\xd9@\x0ax\xad\
+a\x0d\xdd\xcc\x9f\x95b\xc8\xdc*\x87r\xdd;B\xb7\
+rU\xac{\x1b\xef\x93t!\xbc\xf3E\x9c\xfb\xc7\xf3\
+\xaf8\x96\xa5\xacSaR(\x17x\xd4\xe5\xafU\xae\
+R\xdd\xc8\x1fq\xb7\xe3l\xca!\x0c\x1e`\x9d49\
+u\x99\x00Et\xa6\xe4I\xd9\xc8_}\x85\x17*\xc9\
+\xc8\xb3\xbfs\x81\x11]dg\xb6S\xb3`g6\x22\
+>\xfe\x1f\x9ec;\xf3\xf8\x86\x88\xea\x8b9tgg\
+6B-\xd8\x99Mr\xfb\x98q\xb7\x8fE\xed\xcb\xc6\
+\xf5N\xcd\xec\xccs\xe8G\xb63\x1b\xc9\xfc\x82\xdf\xdb\
+\xceL\xd0\xe7*KM\x94X\xac\xba\x82\xf6V\x12]\
+\xdd\xb4>U\xf5\xed\xba7\xaf\x92\x0cX\x98\x1aV\xf5\
+T\xa9|J\x82\x03/n\x97oH\xd1\x07\x07`\x04\
+*\xceY`\xd4R\xce\x02\x0b2&\xd5]\x9a\xb3`\
+|CD\xf5\xc5\x1c\xbag\x04j)g\x81Qq\xce\
+\x82\xe19a\x04\xca\xe5,\x98\xd5\xd71\xf4C3\x82\
+.\xe4,\xb83# \x85;\xd75\x84U5\xfd>\
+\x93\xe4\xa8u\xb3p>\x93\x84\xaa\x14fEQ\x976\
+\xbb\xcbr#;\xc4\x01\xce\x95(H[W\xc7_\xe1\
+\xc2J\x91\xf1j\xc8\x03\x05\x0aU\xb7Ku\xc3\xaa\xb0\
+o\x84\xdb-*\x17\xb9\xee\xe0\x11\x99%\xe4\x9b\x9e\x07\
+\x8fH\xa3E\x95\x84|\xc3_\xfb\xcbyD\xb2\x96\x1f\
+\xdb%\xd2LnK\xcf\xd8%\xf22\xc8\x17\x97H\x9a\
+Kd\xa1\x04:>\xfa[\xaaM\xb0\x1f\xdc4;O\
+\xd2\xc1R\xb42\x8a\x5c\xb4\xcf\x0b\x91\x8b\xf6\xdb(r\
+q|\x8e\xf4\x1d\xf7\x86\x88\xea\x8b9\xf4Q\xdf\x11\xad\
+X\x88\x5c\xb4\xdf\xea\x18\xbaH\x22\x17\xdd\x1b:\xaa\xaf\
+c\xe8\x07\xd6wl?C\xe4\x22N~\xf5\xec\x1c\x8e\
+\xea\xfa\x81Q\xd4\xa8\xaa'\x8auNv(&\xb1\xdd\
+\xc39I\xa6\xd1*\x97h\x1cX)\xc3\x89`\xee\x9d\
+\x18\xbcF\xee3R\xca \xe3\xbbt\xe7c\xa8\xca\x91\
+\xda\xf7M\x09\xb1\x9b\xa7\x0bE\x89\xc6\x08\x22\x0f \x88\
+t,\x16D\xba\x85\xf0^\xfb\xad\x8cE\x85N\xa6\x82\
+H'\x9d\xe8\xd1\xf1\xb9 \xd2\xb1X\x10\xe9\x16\xc2{\
+E\xabL\x0c]\x99T\x10Q\xc6\x89\x1e];\x17D\
+\xba'\x11\xdek\xfb9%1\x879a\xea\x9eP\x1f\
+\xe0J\x94o\xd7\xce\xfa\x0d\xdbL+\xbb\xa6R\xbcC\
+\xea:\x0fR\xee\xca!\x84[QzM\xca\x8aU\xf7\
+\xf6=B<\x14)\xa4\xbe.\x1e\x5c\xb3-VrF\
+\xd8\xedJT\x8c\xce\x85$\x86\x07\xbe\x8f\xf6)\xb2\x85\
+]E:\xcdc\x91N\x8b%\x91N\xabX\xe8\xd2*\
+\x15\xe9\x867DT_\xcc\xa1{\x91N\xb3%\x91N\
+\xb7\x09\xf46\x15\xe9\x867tT_\xc7\xd0\x0f-\xd2\
+\xe9>\xec)\x87\x01\xc3E\xee\x0e\xdbo\xd0<*G\
+\x12nt\xb4\xf8\x14\xf7\xe1\x8bx\x16\xd59\xf2\x8d\xe8\
+\xc7\xb3\x06=\x13\xcb\xce\xcb\xbe}\xea\xfb\xf6i\xd9\xe6\
+ x\x9cKt\xbf\xb0\x1d\xbc\x9fV\xdc\xddH\xd1m\
+3\xf0x\xc7\x1d:>R\x0c\xe2\x10\xe3\xc1\xb5\xd0\x9f\
+\x8a\xcb\x05\xd7B\xbc\xc6\xdc\x0f=\xbb\x03\xec\x80\xb1S\
+\xa4\x9bapg\xeb\xfaW?\xa9\xe3\x9f;\xdb\xf0\x9f\
+\xe4)-I\xaa\xdb\xc8\xdd\xb6\xee%\xd0up\x95\x90\
+I\xa4n\x90\xc8\xb7s\x93\xb4\xa7\xd2j\xe1^N\x82\
+\x10B\xc9\x86{g\x8a!_{1r\x8d\x7ft]\
+\x7f\x0b\xcaRR$\xf5\xba\x0e\x9eU=>\xea\x1a\x88\
+I\x91@\x94\x91\xae@\xcd\xba\xc2\xfc\xeet\xe1E\xe8\
+\xf8\xca9\xbfv\xf2{h\xc1_N\x09RWhR\
+8x\x91\x90C\xa5.\x82P\xbc\xc8\xeb\xcf\xb9F\x1e\
+\xd8\xbd\x9ds\xc1\x83_#\x0b\x03\xf4\x1e\xbb\xd9\x9c\xab\
+\x82\xac\xd6\x8b\xb4\x0e,\x99\xecyyPa@^\x95\
+\x85t\x04\xeb\x96\xcc\xfa6] \xed\x19\xed\xa5$\xb8\
+G \x13\xcf\x12W\xd0\x011<6\xdd\xd2\xeb@\xfb\
+\xf3s0\x15\xda\x01n\xd8]\xeel\xcd\xdf\xc0\xf1\xc0\
+\x91N\x1e\xa9\xc2,\xc7\x94.AcG@MD\x0e\
+\x98V\x11nV1\xd7};)L\xd8{\x8f\x10k\
+DL\xcam\x82U\xbd\x89H'\xe6U2\xf3\xc3\x9b\
+Z\xf9;\xc2\xb2T\xbd*\xb0\xf2}U\x19\xf7$\xe4\
+\x8d%qO\xd8Y\xd1\x86vR\xef\x0e\xc1\xfcte\
+11\x85\x12\x08\xad\xae\xcb:I\xea\xa5\x18\xee0\xd2\
+N\x97{\xa4=`\xccC\xcbX\xaf\xe0~<Y\xe8\
+\x02\xe9\xb6:\x0a:\x13b&)\xa9e\x8f\x9c?\x0f\
+\x93\x1b|)\x16\xce\x7f\x8bW\xbb\x80\x07\xd3\xbc\xa5\xc6\
+\x09\x16\xe6\xc0\xed\xaby\x9d\xb0r\x5c%{\x01\xefF\
+\xd2\x9e\xa3\x18\x0d(\x9a\xd25\xdbT\xb7`\x9b\xc2\xfe\
+Y\x87>V1\x17\xe7\x19+U\xc9\xe0@,\x82\xec\
+\xa4S\xb9\xf1\xd0\xdb'H\xbb9\xc3\x80\x9b\xa4\xc00\
+\xf0V\xc0\xdbG\x07]\x80'\xe3\xc1\xd0\x0a%\x06\xf6\
+\x0d\x96\xec\x9f3\x88d?\xdbH\xc4$\xe1[]\xa3\
+|*g\x89\x89\xe6\xb7\x0e\x01n\xd1\x16(\x1c\xb1\xaa\
+\x01\x97\xc2A(|o\x85XJ:\xee \x04b\xb5\
+\x81qd{\x9ct!\xf2\x0a_\x08\xcc\x97`\xe0)\
+)v\xa3\xaa\x9cJ\xe1\xf4X\xa2\xa8\xcb\xcf\xc5\x94\xc5\
+\xea\xea6En K\xabA\x91\x98\xa1\xcc\x8e\x19\x14\
+\x96\xc8\x0a\xbb\x13\xcf\xec\xb7\xa3\x04\xe30mB\x0fH\
+n\xb1\x8b\x99\xd0\xf8L\x94\xd3\x5c\xa8!\xa5\x22+x\
+o_\x7f\xff\x96\x94\x16\xab\x1a-Z\x8d\x9d\xa5\xdeB\
+\x8a\x90c\xf0XN\x17\xedZ\x89\xc9\xddz\xb0\xbd\x92\
+\x07\x93\x16\xbe/2\xb7\xbf\xbe\x0e\x1b\x04\x1e\x93d\x96\
+\xe6\x0b;N\x85\x7fl5.\xd8y\xb1\xfd\x95\xd0\x0e\
+\xb6N{\xb3\x87\x5c5\x07\xd8v\x0f\xed\xfd\xb8\x07\x93\
+\x9c\xd6\xa5\x16m\x11XP\xae\xba\xe2\x91va<\x99\
+\x1a\x0a\xa1]\xe4\xb4l\x0e`\xdf\xfc\x1c\x8c[\xd4\xfe\
+4_\xec\xaeiGL\x07\x9b\xeaC\xf3\xe1\xf4\x7f\x99\
+\x1b\x9f\xc8\x0aendstream\x0aen\
+dobj\x0a119 0 obj\x0a4\
+320\x0aendobj\x0a122 0\
+ obj\x0a<< /Type /F\
+ontDescriptor\x0a/F\
+ontName /QSEAAA+\
+ProximaNova-Bold\
+\x0a/Flags 4 \x0a/Font\
+BBox [-80.078125\
+0 -199.218750 10\
+41.01562 909.179\
+687 ]\x0a/ItalicAng\
+le 0 \x0a/Ascent 10\
+79.10156 \x0a/Desce\
+nt -387.695312 \x0a\
+/CapHeight 1079.\
+10156 \x0a/StemV 87\
+.8906250 \x0a/FontF\
+ile2 123 0 R\x0a>>\x0a\
+endobj\x0a123 0 obj\
+\x0a<<\x0a/Length1 775\
+2 \x0a/Length 126 0\
+ R\x0a/Filter /Flat\
+eDecode\x0a>>\x0astrea\
+m\x0ax\x9c\xcd9it\x13\xd7\xb9\xf7\xceh\xf1n\
+\xcb\xb2$\xdb2\xb6d\xd9\x92,[\x92\xb5{\xc1\x96\
+\xbc\xc9\x961X\xd8\xc6\x18ox\xc7\xc6\x8b\xbc\xaf!\
+\xc6\x8d\xc1\x09\x10Z \x10\x02\x81\x10 4q{8\
+\xbc>\xd2\x94&\xa1\x0fh\x1em\x966m\x9a\x93r\
+Z\xbf\x1cJ\x03IKi\xd6\x868h\xfc\xbe\x19\x8d\
+\xb0\xb3\xf5\x9c\xf7\xef\xcd=W\xf3\xdd\x99{\xbf\xfb\xed\
+\xdfwG\x08#\x84\x02\xd0vD\x22T^\xa97\x1e\
+y\xff\x95\x0b\xf0d\x0f\xf4\xa6-=\x13\x1d\xbfxc\
+\xf6<\xc0\xb7\x11\x12\xe7v\xb67\xb7u4\xb8\x02\x11\
+\x92\xa4\xc13k'<\x08\x7f\x84+\x87q\x1b\x8c\x93\
+:{\x87\xc7?\xda,8\x02\xe3\x87a\xfc~\x8f\xa7\
+\xb5\xf9G\x7f\xfb\xe1\x09\x84\xa2\xfba<\xda\xdb<\xde\
+\x8frQ=\x8c\xdf\x87\xb1\xac\xaf\xb9\xb7]\x18y\xb7\
+\x05\xa1\x98\x00\x84\xb8\x0eDrT\xc4K\x88\x8b8\x5c\
+\x13\xe7\x0d\x98q\xc4w'\xde@\xe7\x097\xdc\x11\x97\
+G\xd27\x8e\x0c\x11s\xf0\x9e\xa6\x9d\xb9z{\x86\x86\
+\x90\x0c\x85~\xc9\xe1UP\x15\xc0\xd0I2V\x86\xf0\
+S\xf4;|\x838J\xef\x868\xb0\xb2\x10\x96\xb7q\
+7\x00\xb7|\x84L\x02\xb9 Y.\x90\x17\x122*\
+\x09\x1f\xa6:\xb9\x1b\x16\x7fT\x08;b\x04\xd8\xc9\xdb\
+\xdcj\xa0\x85\x99%\x17\xcca\x05\x91\xcf\xad\xfer~\
+\x09\xd1\x14t\x00\xde\xe3\xdc3(\x1c\x09\x01\xe2\xa9\x94\
+\x16\xb3\xcdj2J\xc4\xa2(>\x8f\x84\xf9\x98\xb0\xeb\
+\xf4z\x9d\xdd\xae\xd7i\xf5\x970\x87\xe3\xc1\xfa\xb4<\
+\x18\xe9\xf4\xf6\xbc4\xfd\x97\xfb\xc9\x85{\x0a\x9a\x83\xbc\
+\xa5[\xe4\xdb\xe4\xbf\x90\x14!\xa1\x12p\xc8$|\xa5\
+\x22\x91\xcf\x13EI\xc4&\xb1M\xc2\xe3\xf3\x14\x89*\
+e>>\xb8\xff&&g\xe7\x8bw\x8d\xbb\xd6\xacq\
+\x8d\xef(\x9b\xcfln\xd9}s\xffA\xfc\xe1_\x0e\
+\xec\xfb\xc9\x89\xad\xe5\xee\xe9\xef\x95\xbbq\xf71\xb7\xd1\
+t`\x1fMe\xfe\xd2-\x8e\x01p\xc7!-`\x07\
+\x0a}4JDr1 7\xc2\xd8\x8f\x1e\xc3\x9di\
+r\xa5\x8ai\xf9y\xf6\xb1\xd1\x03\x7f\xde\xf50\xf6\xca\
+C\xd6\x96N:K]\xfa\xc1\x92\x9e\xbe\x91\x9b\x8f\x1d\
+\x22P\xb6V\x1f\xb7*\x5c\xc0\xc1\xb7\xc8\xd0p\xe9*\
+}:\xfep\xef\xd8Hq\xd1\xe3\x87?\xcels\xe4\
+K\xa5\xdag\xf3\x93\x92~\xb0\x97H\xc4\xc2(\xb9<\
+Y\xa9LV*\x14r\x11-,4\x83\x10G\x0eT\
+I\x10\x92\x0b`+\x9a[>-d\x11\xd0g\x03\xca\
+D\x02r\x15\xd6\xa5\xd7\x94de'Q\xf70\xc7Z\
+\xbbi\xe0x\xe5z\xa2\xba9-U\xaeH\xf7v\x90\
+\x0b3\x0e]*\xc6\x15\x1b\x1e\xf3:\x01c*\xc8p\
+\x1f`,G\xc8f\xf3\xb3\xc62\xf2\xcdfQ2b\
+\xe0\xb3[\x8bx \x91o\xb6(\x9f`R\x072[\
+\x9b7U\xa4\xaa1\x0e\x0d\x8b\x8fO\x90\xa5\xa7DF\
+\xaaS\x84\x22\xb9B\x10%\x8e\x09\x0a\xe5\x07\xe2\xbe\x9e\
+\x97\xde\xfbQ\x97\xbe\xdc\xbd\xb1X\xa3\xc1z]\x93J\
+$T'G\x8b\xe5\xf2(a\x8c8,$\x90\x8f\x07\
+\x87\xae\xce\x8c\x8c\xcd\xfc\xd4\xaaN\x91\xc6\xa4GG\x09\
+\xc3B\x03\xf9\xc1|.\x11\x1c\x14\xc0\x0f\x0f\x8d\x08\x97\
+\x88b\xa3\x15r\xe5\xf7\xeak\xe7\xfe\xd3 \x97G\xc7\
+j4\xe2ha\x00\xc9\x0d\x0c\xe6\x07\x86\x87G\x08\xc4\
+11\xd2D\x85zOMm\x8a\x9a\x96\xa2s\xe9&\
+\xb7\x86\xdb\x8bR\xc1sx,c\x8c\x86Y\x1d\xd3\xed\
+>\x8bQ~u\x13d\xe4\xc1\x87f\x9b\x9am\x19\x19\
+\xb6\xe6\xa6\xd9\x87\x0e\xf675\x16;\x8d\x06\xf5\xa2\xb6\
+\xa6\xb6\xf7\xfc\xe8\xd8\xd8\xe8\xf9\xde\xda\x1a\xed\xe2\xe5\x18\
+l1\xd7\xd7\xee\x9c=\xfa\xc4\xce\x1d\xf5\xb5\x16\xb3t\
+U\xba\xd1\x96Q4\xb51\xc36\xbd\xfd\xd2\xe5\xe9\xed\
+\x19\xd6M\x13\xd49\x9f>\x89K\xe4\xa7\xe0\x0b\xb4\xaf\
+0J\x14)U\x8cRg0\xc7V\xbd\xa16))\
+\xdfU\x9a@.\xcc\x15iS1\xc5\xc7r\x85\xd6;\
+\x04+#\x96n\x12g8\xb7Q\x8c\x8f\x07\x8b@a\
+\xa1\xbd\xcd$\x02\xd9J\xc46\x9f\x81\xe27\x1e))\
+9}\x1a\xf3~\xfd\xeb\xe8hM\x5clL\x88\xad$\
+\x06\x17\x17\xcd\x12\x9c\x1b8\x9c\xfa\xe8\x06\x95\xa7\x8f\x97\
+\xe1\xc0\xc0\xe0W\xf2\xc0\xaf\xc1\xaa8\xd9\x8cg\xaaQ\
+\xda7}\x13\xd3{0\x822\xfa\x1dMD\xef'\xa7\
+\x9d\x9c<\xe1wZ\xadV\x7f\xefO\xa7N5\xd4\x1d\
+\x1a\x5ccMJ\xcf\x90\xcb\x7f\xf5+\xea\x0b\xa2}\x85\
+#k\xf5\x0e\xc6\x91\x89\xc5\x1b\x96\xa7\x1a\xea\xb0\xfa\xe5\
+\x98$e\xbe\xe5\x86\x97\xc7\xb86\x01\x9e}\x93|\x07\
+\xac2\x0d\xe5\x80\xa5[\xc0\xbbT\x89>E\xd9\x94>\
+E\xd9hEY|JR-\xabM\x90lY\xa98\
+\xb1\xcdJ\xbce\xaa\xa8l\xce\xcdZm2%\xc80\
+\x96\xc5[\x8c\xd9Y\xf6\xd6\xca\xf5F\x9c\x95\xd3|z\
+[\xcbO\xa8\x9a5.GNR\x22\xa6\xee\xc9lY\
+\x8e\xf5f\x8b\xd5\xecvd\xd9:V\xcb\x15X$R\
+\xa9\xf2\xec\xee\x0a\x87=)Q\x18\x81\xe3eY\x8f\x94\
+\xea\xb5#g\x9f\x14F\xa5h\xd6\xac\xd9\xe2\x9d\xb93\
+\x99\x22\x11\xabR\x8a\x0a\x95*,\x113^\xbat\x13\
+\xbct\x81\xf1R\x86vFAr\x81\xdf\x94hq\xad\
+\xca\xdeX\xdb\x7f\xa2|=\xe6\xe8u\x9b\x9c\xd9Y*\
+\xcc\xd9\x96\xa7I\xc3\xb8r\xfdA\xe2\xa2\xf7\xd9\x16\x8d\
+F\x96` \x8e\xfb\x22]>h\xa6\x8d\xbb\x15%\x82\
+\x9dX\xac6\x7f\xf3\xb3\xcf\x8a\x83\xd1\x12W.h\xfa\
+i_oC\x8365F\x8c\xb1#\xaf\xe1\x9dC\xcf\
+4\xed\xd9\xfd\xf8>\x882\xce\xb99\xea]\x22\xf3\xbd\
+\xb9\xaaJw\xb9\xd5j2\x987\xe8u\xc7\xfe\xcb\x93\
+a\xc3&Kk\xfb\xecs'N\xbd\xea\x8b\xd2E\xc0\
+\xc39\xd81\x81\xd6\x80\x90\xf8\xaaw\xd0\xfb\xf8\x9a\x8a\
+\xf1\x1fl\xf6)\x87\x09G<\x9f\xec\xe9f\x13\xd3\xab\
+:!|\x15\x16x<\x8f>\xea\xe9-,P$\x8a\
+D\xb4\xfe\x1b\x9b\xfa\x1f\xf5x\x0a\x0a\x09*<<^\
+f\xb6:]fK\x82,,<<L\x96`1\xbb\
+\x1assbc\xf0\x0f\xf1\xae\x07\xa6\xda\xdbrV\xaf\
+\xceik\x9f\x9az\xb8\xb7\xad\xbd\xae>\xbfP\x9d\x82\
+q\xee\xea\x8e6\xbc\xbd\xd9\xbd.7G!\x97+r\
+r\xd7\xb9\x9b[\xca\xdd9\xf6D\x05\xbc\xccii\xa6\
+\xb9\xc8Yz\x9fs\x08<]\x8b\xf2V\xc67\xab\xc5\
+\xc2\x06o\xbf\xef\xdf7 \xb1\x88\xe5\x0b\xfb\x83\x1e\x1b\
+\xe7h[zd&3\xcf\xb1\xb1\xcb]\xaeRY\x9a\
+Z\xb66Vlp\x14$+\x0f\x1c\xb85\xd1\xda\x5c\
+T\xa0\xd7\x89D\xd8U\xbao\xff/?!\x8ay\x11\
+\x91\x092\xab\xd5\xe9q\xe4\xe1\xd2\x92\xee2\x97s\xec\
+\x9a5&6\xc3V[\xd3\x15Wj2\xad\x8a\xb3Y\
+\xab\xab\xba_\xdd\xb9#Ii\xcf\xdbT\xb7\xa5s\xf4\
+\xcdcO\xd5\xd6cLn5\x1b\xf4i\xa9\xc0\xbd\xdd\
+^\xdei\xb6`\x85\x1c,\xa0\x0d\xf4q\x08\xb2j\x22\
+\xc3\x87\x8d\x8d\xd2\x0a\x1e_\x05qC.\xb8o\x02L\
+V\xe2\xb4\x9d\xf8\xc1\xc2ha\x01\xa8?\x7f\xe8\xb9\xd1\
+\xd7\xc8y\xefP\x96\xbb\xbcv\xa4\xb557\x07\xe3\xc7\
+\x0e~A\x9d=\xff\xcaA\x9c\x9d\xb9\xa91+\x13\xf7\
+g\x90!\x8b\xd4\xbcI\x96\x80\xcd\x96\x8e\xce\xd9?N\
+o\xc7\xb4\xf4\x9c\x90\x03\x8f\x83\x0dh\xa0\xf2X\xce\x81\
++\x22\xe3\xf2\xaeb\xc9\x0a\x81ris\xa0\xc5\xc8\x8a\
+\x94\xa6\xd6\xb9\xc6\xb5\x7f\xdf\x7f\xdfy\xe6\xa1l\xbb}\
+\xe3\x13\x8d\x9b\x09CsSOceE\xbeC\x99\x8c\
+\xf1\xbe\xfd\xb7\x0e\x0f\x0e\x17\x15%*H\x83\xab\xb4{\
+\x8d\xb3\xc4\xc0\x89\x8c\x90'X\xcdNO\xbe\x83x\xf6\
+\xcd\xa7\x8e\xd5\xd7>\xfa'\x9bT:8|F\xc4w\
+\x99\x0c8n\x95\xd5\xba\xa1\xba\xeb\xb5\xd9\x9d\x19\xb6\x96\
+\xe6\x07\x1fh\xddb3c\x9c\xa8\xc8\xb1\xea\xf4\xa9i\
+\xd1\xb1`\x03\xb4\xe7\x80\x0f\x12W@n<:c\xf2\
+U\xd8$\xc0'\xfe\xfa\x0c>K\x91\xef\xde:\x8b\xcf\
+-\xceC\xdc+\x06>\xf7\x01\x9f\xa9\xe0g\xb5\xbeZ\
+\xc2\x96\xe4\x0f4\xcb6\xcfes\xdb2\xa3>\xcb\xf7\
+G\x1b\xa6\xf9\x1cS\xc8:\x84\x8au\x13\xbf\x01\x95\xe0\
+\xca\x8a\x19\xeaC\x0c\x99nmY}]ks}\xdd\
+\xda2\xbd\x8e\xfa\xe7Le\x05^\xe7\x1e\x9f|\xac\xa6\
+\xdc\xed,6Z\xe2\xe2\xc9 G^[\xa7=/Z\
+\xacJV&%\x19\x0c\xe9\x1a5\x8e\x96\xc6\xa95j\
+Mb\x12\xfd+\x95\xe2\xd2\xe2\xbe\xad\xa5.\xdc2\x0e\
+\xee\xdex\xa3\xce\xe5LU\x8bE\x22\xb1:\xd5\xe9\xaa\
+\xbb\xd1\xa8mh\x18\x9f\xac\xd9\xa4J\x09\x0f\x95%\xa4\
+\xa5:r\x88_8\xd34\x9a4\xa72^&\x8c\x0a\
+\x0a\xe5\xf0\x05\x11\xaad\xa3\xf7\x9c&)Q\x12\x15\x16\
+\xc2\xe5\x86\x84EI\x12\x934\xa5Z-Dj_-\
+\xc7Y\x07\xd2\x0b\xf4\xe5'9\xd3\xe7\xc8\xab\xdez\xe2\
+\xa0\xb7\x9b[\xbdH\xbd\xb3\xe8\xbd\xea\x97\xf3+ C\
+\x09=\xf3\xdb\xf3\xc4\xcf\xfdIAa\xc8J\x80\xa4p\
+?\xfa_\x10%+\x8b\x0c\x10\xfd\xd9\xba\xab\x06\x22\x7f\
+\x0cRAfK\x5c\x91\x9b\xbf\x12y 9\xfa\xc3\x1f\
+\xc8\x9e(;>>\xb9:7w\xf5\xe4\xf8\xf1\xe3\x93\
+\x13\xb99IJG~[;\xf5;\xac-\x02'(\
+(\x1a\x19)(\x8c)q\x8e\x8d|\x7f\xef\xc8\x90\xcb\
+\x89\xb1\xd354\xb2\xb7\xbb\xa1\xc9\xe9Rk\xf0\xea\xaa\
+\xaa\x8a\xa9\x89\xca\x8a\x8a\xca\x89)\xb6\xca\xe2U\x00\x0d\
+j\xdaf\xcc\xcbU\x96\xf9\x1b\xe5\x96\xdf\x03D\x02n\
+YRR\x99\xdd\x9a\x91@}q \xd7\x96!\xa3\x8b\
+\xaf\xe4\xfa\xba\xce\xad\xc5\x85\xab\xb4\x9b\x1b\xbaw\xad-\
+#\x06\x5c\x1aM\x22\xe4\xef6b\xe0Xb\x92\x8e)\
+\xc6\xacF\x03\x86\x82m\x83\xcbj\xc6k\xca\x1e\xf3Z\
+|\xfb\xe3\x1d u\xd2WAC%\x00\x92\x9e\xa7)\
+#\x10\xe2W\xc3\x9b\x10\xa0\x8c$\xe5X.\xc4&,\
+\x94c\xce\x93\x1f\xde\xa1^\xa3&\xb0\xf3\x9f\x98\xf3W\
+L\xfc\x03\x97PS\xe4\xfc=\x98{/\x99\xfc\x13\xdd\
+\x01\x01\xa3O<\xbf\x8c\x19*s?f\x13hz\x04\
+\xde\xf0i\x9e}\x0d_\xa1\xfa9\xf9\xd4 \xa7\x1a\xa3\
+%\xf4%\xbb\x9e[\x05\xb3\x82\x97g\xd1\x8d\xa3\xf7N\
+Q\x0bP\xe6\xef\xc0\xc9D\x8e\x17\xfc\xcd{\x8b\x88\x01\
+\xc4\xc4\xd2\xbf`\xc5\x0c\x837\x08\xd6\xa8\xe4| \x1a\
+b\x9c\x9cSX\xed=VM]\x22\x22p/\x11\xe6\
+\xcd\xbe\x81_\xb9}\x9b&\x86S\xeb}\x14\xf8\xa4-\
+\xef\x1a\xac\x13B\x05\x8e\xe4XA\xefc\x5c\x91y0\
+\xb6\x82b\xe0\xa1\x98\xdcM}\xfa6\xb5@L\xff~\
+\xdb\x031\xb1\xa9i&K&6Q\x07\xb3\xb2\xb2k\
+\xa8\xdfbC\x0d\xfe\x80\x92p\xab\xa7\x1e\xb8\xb4\xd1U\
+\xaa7\xc6\xcbB\xbdwI\xc9\x82\xc5D\xcda\x90\x03\
+\xbd\xcf\x22\xec#\x86\xc8\xaae\xa4\xb22\xc7\xb1\xf9@\
+\x81\xe5\xe0\xbc\x163\xb3#\xcc\x00\xa53\xf0\x1c\xf1\xdb\
+\xc6\xb5e\xe9:iLAa[\xef\xda2\xbce\xeb\
+\x8bT\x0e\xee-IKMM+\xa1\x0e\xe0\xb1\x0a\xbd\
+\x0e\xb4[A=\xc2\xad\x8e[e0\xe6\xe4\x16m\xab\
+\xac\x12\x09\x9a\x9a\xa6On\xe9$\x0d8-\xa5\xd0\x9e\
+\xa6\xa1\xde\xf2^MK]S\xa0\xd7\xd22\x86\xea\xb4\
+\x0c(\x12A$\x02\xaeyl\x1a\x050\x82\xcfK\xe6\
+\xa8\x94sX\x05U\xc2\xd1\xc7+\xca1V=q\x94\
+\xfa\x03\xf5\xe6\x91\xa3\x84\x9c\xb4\xdc{\xfb\xc0\xc6M\x18\
+o\xdax\x80L\xbd\xf7\x06u\xf7\xc8Q\x8c\x8f>\xc1\
+Fr\xee5\xc8\x831(e9\x9b/'\x0c\x7fD\
+[\x19\xcd\xe8D\xf9\x80\xd5j\xde\xdc\xb0s\xf6\xf0\xeb\
+\xa7O\xd5\xd7a\x5cW\x7f\xea\xf4\xeb\x87gw6l\
+&\xa9\xa1\xe1\x0b/\xf6\x0f\x0e\xf6\xbfxax\x08\xef\
+\xc5\xe7gg\x1b\xea\xc0\x86kkO\x9ez\xf5\xb5\x93\
+'k\xa1\xeem\xac\xc3O_\xde\xfe\xe0\x83\xdb/C\
+\xcd\xbb}\x9a\xb5\x1f6\x9e\xc81\xadR\xfa\x87c\xf1\
+\x8e\x80\xf5\xa4\x12\x13XA\x1e\xba\xb7\x15lv79\
+\xc2\xd8\xab\x89\xb8C<\x09QE\x00&j\xe3\xabl\
+*\x9bDe\xe2\xdb$|\x09_%\xc1\xaa\xa0\x8b\x8e\
+\xabW\x1d\x17\x83f\x82^\xca\xbfz5\xff\xa5 \xe2\
+\xce\xf5\x09OG\xc7\xc0\xc4\xf5\xeb\x13\x03\x1d\x1d\x9e\x89\
+\xeb\xc8gK\xdc1\xd85\x8c\xae\x96\xfd\x1a\xf6Y\x92\
+\x824\xb1\xdaT)\xe6\x08\xe9[g\x9e\xa9\xaf\xab\xab\
+\x7f\xe6\xcc[w\xef\xfe\x12\xf8\xea\x1fx\xed.\xb7\xba\
+\xaa\xfa\xe8\xb1W_?\xf2dU\x15FSS\xe7_\
+\x1e\x1f\xa5=q\x86\x9a\xe3\xf4B\x94\x88@p\x8a\xc7\
+LP`r\x85O\x9a\x8c(i\xd1\x0a\xd8\xa2\x03\xef\
+\xa0C\xc2\xe8\x8bW&'0\x9e\x98\xbc\xf2\xe2(\xbe\
+VT\xd4ow\xe4%\xc8\xf2\x1c\xb9\xfdEE\xd4\x1c\
+\xb7z\xdb\xa1]\xbb?\xfax\xf7\x9e\xc3x`\xda]\
+\x8e\x13\x12u\xd4\xd3\xe9\x09rw9\xed\xa3\xb5$\xc2\
+# \x8dpZ\x87LT\xf4\xf3\xc1?[\x95\xa2^\
+\x9d\x91\xa6\x11\xc1\x05\xb3~\xaa\xca\x82l\x81\xd5\x9a\xac\
+\xc8\xd1qO\x1f{r\x04g\xbf\x7frT\xf9C\x99\
+\x80\xcdqprL\x00S\xad-\xce\x5c\x9dLSj\
+\xae\xaf\x1b8\xb1~=Q\xdb\x0c\x98\x98\xa3#\xb7\x9a\
+\xe29\xb4\xda\x8a\xca\x03\xde|\x16c\x09\x1b\x0b0_\
+\xc4D\x0c\xda\xb5\x09jq\x8cF\x80\xc7\xb0\x1d\x22\xd2\
+cx\xdb4\x05*\xfd-\xfe\x19\xe5\xf0\xde\x00>\x96\
+>\xa5<\x1c\x15\xd4\xc7\xa0U\xa68\xb0\xd1\xeb\xe4\xcc\
+9:Q\xb5#Y\xdb\xa1H\xa6<X\x8c\x09h1\
+\x94\xdeRW\xbf\xbb8\xeb\x88\x00\x97T\x91\x7f\xf7\xba\
+\x89s_\xce<d\xb6\x90a@C\x13u\x0b\xff\x0c\
+[\xc0{\x91\x90)\x83\x19Cf\x0a:V4\xef\xf5\
+\x9b\xf5\xba\x10\xa10[\x9d\x92\xae\xcb/\xb3Z33\
+\xa9[\x0d\xd2\x0c\xab\x85\xa7\xd1\xe4\xe5\x1b\xd3\xb1-\xb3\
+i\xa0\xa5\x9d\x96o\x0a\xe4\x9e\xef\x83|\xd7\xb0\xb5\x22\
+\xe3w_;\x01\xdb\xfc\x1f\x1a|\xc9\xfd~\xde\xff\xf6\
+\x06\x04\xc8e)'\xca=};\xfb\xedPy\x85\x86\
+\x8b$\xca\x94D\x85\xed\xe5\xaa\xdfH\xb9\x18\x7f\x7f\xcf\
+m\x5c\xfc\x9b\x93\xee-][\x9a\xcc\x96\x00\xbeX\x18\
+%T&\xc7\xc6\x98\x0c\xab\xa4F\xbd,^\xa3\x96\xc6\
+$\xc4\x09\x22\x82\x83\xf0\xee=\xd4g\xd4\xc1K\x0b\x95\
+F\x0b\x94\x0fZ{|t\xb4 \x5c\x10\x16\x1c\x10\xa6\
+Q\xd6]\x88\x97\x9d\x1d\x1b\xbd\xf8\xb6K\x05\xc5T\xb2\
+\xca.\x89\x14\x86\x86\x07\x85\x04\x85\xf0\x02\x82\x83\xf9\x01\
+\xa1a!\xa1\xc2(\x91(>^\xae\xd0\xa4\x19^\x19\
+\x9f\x04n7/}\x80\x7f\x0c\xb2\x0b\x05n\x95\xcb\xa7\
+<E\xe2>\xa3\xd1PX`4\x18\x8c\x05\x85\xd2\x17\
+|\xf7t\xa3\xef\x8b\x11\x8f\xd6\xdbr\xf6\x11\x9a\x84\x90\
+}\xc8\xf7~\xf7&\xf5\x01\xf5\x16\x0e\xbbp\xed\xd6\xb5\
+\x0b8\x8cz\x8b8\xe9m$\x17\xbc[\x88'\xe8\xce\
+\x9c\xe9$\x8c\x05\xd2\x15\x82\xf4\xbbk\x04\xda\x8a~\xfe\
+\xb5\xc3#n\xc4\x9co\x9e\x14\x99\xc4\x054-\xbdC\
+\x9c\xe4N\xd3\x19M\x04\xb9\x10\xbf\xf72\x15\x9b\xc2}\
+v\xb1fE\xf5\x12\xbc\xb2z\x91\x8b\xee\xd7/\xc4i\
+_\x05C]\xb9\x07\xb3+\xa9N\x22\x9b;\xc5\xc4\x1a\
+\xffAS\xe2W1>|\xd0\x17Z\x0f\x9e\xea6\x80\
+|\xba\xa9\xce3\x9f\x7f\xfa\xc5\xe7\x9f}2?u\xe5\
+\xf9\x17\xde\xbd\xfe\xfc\x0b\x17\x01\x87\x02p\x84\x01\x0e\xf0\
+P[$X\xc8}\x07UY/\x83\x1c{O\x1f\xda\
+TS\xb3\xe9\xd0\xe9\x9e:b\xec\x85\xe7/O\xcd\x7f\
+\xf2\xd9\xe7_|\xfa\xf9\x99\xe9\x97\xe98E\x9f\x1b{\
+\x81\xdeH\xa4\xf0\xe5g\xeb\xb2\x1d\xc3\xf9W\xc4\x84\x12\
+\x7f\x22\xa2\xbd\x05*\x83Lw\xf9\xa6KSp]\xba\
+0\x9e\x90\xe7\xb0\x0f\x16\xc15HG\x15p\xd7\x00\x97\
+Z\x85w\xef\xbd\xf3\xf1\xae=\xf8\xf04\xce\xd1\xc3\x09\
+\xd8]>3CG\x16\xb9\x01v\x8c\x5c\xfa\x80\xdc\x06\
+:1\xd1\xe7#l\xb6YW6z\x1b\x95\xefxi\
+\xba\x7f0Zn\x12\x1ehN\xf8\x15\xcb\xc1)!!\
+\xe1\xa1\x09q\x91\x11\x0a\xb5\x08LY\x9dR~\xa0\xeb\
+\x8c{lx\xe7\x15\x08\xa6\x11\x82DE\x5c\xbcN\x19\
+.\x10G\x07\x06c\xac|\xb7\xd0h4\xa6\xfbM\x8d\
+\xa8V+\x93\xa2\xc5\xf1\xd2\xb0\xe0\xd8\xb8\xc8\xf0U\xd2\
+U&y\x02\x9e~\xb1\xd1b\xc25\xb5?\xc8M7\
+\xaaS$1\x09\xd2\xd00q\x8c8Zj\x91\xe7\xb9\
+\xa8\xf4e\xf3\xa4kG\xaa\x8f\xa3e\xea\xb6L\x88,\
+6\xf6\xac\xc7\x9c\xf6V\x84\x05\x0b\xe4T?\x0f\x0a8\
+\xbeb\xc1\xf2\x81\x869\xaa\xf4\x0e\xf7\xfd\xca\xa4\xd5\xa6\
+\xa8c\xa3\xb7\x9d\xbf<>99~\xf9\x85I\xcc\x03\
+\x91\x99-\xc5.gq\xf9\x8e\xb6\x0eb\xb3\xcc\xeep\
+\x0c\x14\x16\x15\x15\x0e8\xecv\xea\xa5\xc9\x90\x10\xa9\xd4\
+d(n\x7frv\xf6\xc3\x7f\xec\xdc\x81\x1f\x9f\xbe\xb7\
+\xa5\xaf\xb2\xcad\x92\xcbCB\xe0\x0cG\xfc\x18;\x0c\
+\xb2\x04W\xe9\xb6\x07]\xa5X\x96\x00\xf42\x1eH\xde\
+\x06\x0f\xf4\x7f\xc1d%\xa9\xe2\x91\xdf\xe9\x91\x86\x150\
+\xf1\xbb\x9f\xf9\x1fb\xec}`Y\x18t\x1d}\x93\xa3\
+\xf7\xdb\x92\xdc\xc2p\xca\xfa\x9bXB\x87j?\xd7\x12\
+\x9e/?\x91)\x93/\x5c\x9e\x98\x9a\x9a\xb8\x5c\xe3^\
+\x97\x8dy\xd4\xa2\xcc\x9e\x97\xe7)*\xc6\xb8\xd8\xd9\x97\
+\x97g\x9f>\x8c\xf7\xec\xfa\xf8\xce\xde\xddX\xa5v\xe1\
+\xbb\x8b\xf3\xd8\x8e7\x03G\xe5\xee\x99\xed\xe5nY<\
+\x1dAs\xf0\x0c\x91B4\xd2\xde(\xb4\xc8E9\xf8\
+6\x9eYX@\xec\xf7f\xe8c\x019\xdd\x9b\xc3W\
+\x7fF\x7f8\xff\xfa\x05y\xa1\x13\xaa\xdb30\x8fw\
+\xff!\xa6\xbfH\xdf\xbb\x09\xbf\x7f]\xda\xbb\x14\xc7\xaf\
+^\xfer\xcd^Y\xc4mT\xc8\xd1\xa39\x82\x87:\
+H/\xca\xe7\xf4@\x7f\x1a\xcd\x90o\xa2T\x02b\x15\
+\xf7A\xe4$\xae\xa3\x19\xe2<\x8a\xe0\x9cB\x12N\x8d\
+\xef=\xe7u\xb8\x7f\x86\x9c\x9c\x05\x94\x03\xbd\x0d\xba\x93\
+t\xc1\xfbk\xa8\x84\xb3\x0f\xf0\x1d\x03\xf8q\x94\xcf{\
+\x13\xd6\xf2\xd0\x0c\xbf\x06\x11\x84\x01\xcdq~\x88L\xdc\
+kh\x8e;\xbe\xf4/n\x12\xdc\xd7B\xff=\x9a\xe3\
+\xc5#'\xf7\x0f\xb0\xee7\xf0\xfe\x22\xcc;\x8bf\xf0\
+\xeb\xa8\x16\xf6\x9c\xe1\x14C\x8f]\xfa\x14\xe8i\x82}\
+S\xe8;O\x09\xf1\x09\xe8!\x9e\x86\xfbs\xb0\xae\x09\
+UAWp\xce\x01\xed\xcf\xa0HX\x9fO\x100\xff\
+\x1c\xdc;\xe8\xef0(\x0a%!\x17\x1aC\x97\xd1\xdf\
+q;\xb4y|\x15\x7fDX\x89\x83\xc4E\xe2s\xb2\
+\x96\xfc\x05\xf9\x05\xa7\x8e\xd3\x0b\x15m8\xd7\xc4\x1d\xe1\
+>\xcf\xbd\xcc\xfd\x0b\xf7\x9f<\x82'\xe5\xd9x\xdd\xbc\
+\xf3\xbc\xff\xe1'\xf2\xb3\xf8\x0d\xfc\x87\xf9\x97\xf8\xef\x06\
+\x04\x04$\x07\x94\x06\x0c\x04\xbc\x1f\x88\x03e\x81k\x02\
+7\x05\xf6\x07\xee\x0f\xfc\x8f\xc0\xbf\x05\xad\x0fz.\xe8\
+\x9d\xe0\xc8\xe0\x04VwY\xa8\x8e\xd6\xea\xca\x7f\x0eV\
+\x5cp\xda\xbe\xff<\x02*i\xcc\xce\x0cAkY\x98\
+@\x1c\xd4\xc6\xc2$\xd8\xfb\xd3,\xcc\x81x{\x9d\x85\
+\xb9h5\xeeea\x1e\x8a\x00\xd9\xf9`>\xd2\x12\x99\
+,\x1c\x80\xa2\x89'X8\x10\x85\x82\xac}p0\x92\
+\x92Q,\x1c\x02p'\x0b\x87\xa1\x14\xf2\x8f\xb0#\xe6\
+\x042\xffd \x16\xc6(\x1a\xa2\x9e\x0f&\x00k-\
+\x0b\x93\xc8\x8a\xbaX\x98\x03\x9c\xbc\xcc\xc2\x5c4\x8e>\
+aa\x1e\x92\xe1y\x16\xe6\xa3Z\xbc\xc0\xc2\x01(\x9d\
+\xd8\xc2\xc2\x81(\x96\xf8\x09\x0b\x07#+\xf1g\x16\x0e\
+AV2\x9d\x85\xc3P\x059\x8b*Q+\xeaD\x1e\
+h=\xa8\x85\xb9w\x03\x9d\x95h\x18M\xc0\x13(L\
+*[;=\x9e\x9e\x16\x8f\xa7[V9<\xd1\x03O\
+\xdch\x10\xa6\x8d\x03\xa1\xbd\xa8\x19&\xaf\x83\xd1(@\
+\xc8=\xe8\x19\xef\xeam\x96\xad\xf3\x8c\xc2(\x9f\xc1\xd9\
+\x06\x80\xa7\x07~MH\x87\xd2\x91\x01\x18\xcc\x86u=\
+h\x08Z\xf6\xd7p\xf91i\x97\x17\x9bt\xe9\x06k\
+6\xfd7Q6\x8b\x9e\xc6\xae\xf5\xe1\xfc.Jd\xcb\
+\xebW\xd2$\xf3\xad\xaa\x06\xb6\x06a\xf7.\x98\xd3\x07\
+sWR\xe6\x06\xd6e0J\xff\xcaSZ@\xc3 \
+(z\xfe(\xbc70\xeft(\x03Z6\xb3w7\
+\xe0\xa4\xe7t\xc0\xd3\x1e\xc0\xdc\x82\x8c\x00Y\xa0[\x91\
+\x19\xd9\xa0Y`\xe3\xf6\xc1\xa1.O\x9f\xcc\xc7\x93\xbb\
+R\x96\x9e\xee\x03;=\xc3\xad\x9e\xbeQ\x99A\x97\xae\
+\xcb\xc8\xc8\xeem\xeen\xf7\x0cw\xe8z\xbaZ\x8c:\
+\x8b\xcej\xb6\xd9,_g\xf6[D\xf5\x7f\x91O\x17\
+\xa2\xffv\xa3\xa1a\x98\xd3\x0c\xcb\xdb\x999\x83\x8c\xfa\
+=\xc0\x87\x0c\x9c\xc7?\xaed0\xd0\xdc\x0f1\xbf\xba\
+\xaf\xc9\xb5kH\xd6,\x1b\x1elnk\xefm\x1e\xec\
+\x96y:dk\xe9{eW\xaf\xa7o\xc8\xd3\x07\xd3\
+\xbf\x1b\x97\xcf\xd8F\x80\x02Z\x1f2T\x06\xad\x00\x16\
+\xacD\x00\x967\xd2\xd6\xe5\x91\x95\x95\x15\xfc;T_\
+]\x84@m\xc3\xd0\xfa!z\xe8\xa1\x8d1Mw\x9f\
+\xcd\xa1o0E+\xb8\x17\x96\x0d\x0f\xf7g\xe9\xf5c\
+cc:\x9a\x9d!?\x17\xad\x9e\xde\xffO8\xf5\xf0\
+\xbc\x0f\x14\xe5\x01\x886\xb9VP!=\xa7\x1d\xfa\xbf\
+\xdbO\xdf\xd5\xd7\xe1\xd1\xf7t\xb5\xb6\xf7\x0d\xb5\x0f\xa1\
+\xff\x05\x95t\xfd\xbc\x0aendstream\
+\x0aendobj\x0a126 0 ob\
+j\x0a5332\x0aendobj\x0a12\
+4 0 obj\x0a<< /Type\
+ /Font\x0a/Subtype \
+/CIDFontType2\x0a/B\
+aseFont /Proxima\
+Nova-Bold\x0a/CIDSy\
+stemInfo << /Reg\
+istry (Adobe) /O\
+rdering (Identit\
+y) /Supplement 0\
+ >>\x0a/FontDescrip\
+tor 122 0 R\x0a/CID\
+ToGIDMap /Identi\
+ty\x0a/W [0 [362 51\
+9 251 495 548 57\
+4 473 254 681 35\
+7 335 575 539 57\
+4 595 615 603 60\
+3 603 407 601 56\
+6 324 569 845 25\
+1 911 272 577 72\
+5 678 637 657 72\
+2 759 723 348 71\
+2 580 223 575 53\
+0 509 254 595 25\
+4 762 575 326 57\
+8 295 295 581 45\
+2 580 249 581 29\
+7 ]\x0a]\x0a>>\x0aendobj\x0a\
+125 0 obj\x0a<< /Le\
+ngth 763 >>\x0astre\
+am\x0a/CIDInit /Pro\
+cSet findresourc\
+e begin\x0a12 dict \
+begin\x0abegincmap\x0a\
+/CIDSystemInfo <\
+< /Registry (Ado\
+be) /Ordering (U\
+CS) /Supplement \
+0 >> def\x0a/CMapNa\
+me /Adobe-Identi\
+ty-UCS def\x0a/CMap\
+Type 2 def\x0a1 beg\
+incodespacerange\
+\x0a<0000> <FFFF>\x0ae\
+ndcodespacerange\
+\x0a2 beginbfrange\x0a\
+<0000> <0000> <0\
+000>\x0a<0001> <003\
+9> [<004C> <0069\
+> <0063> <0065> \
+<006E> <0073> <0\
+020> <0043> <007\
+2> <0074> <FB01>\
+ <0061> <0075> <\
+0032> <0030> <00\
+39> <0035> <0036\
+> <0031> <0038> \
+<0046> <0066> <0\
+06F> <006D> <006\
+C> <0057> <0049>\
+ <0054> <0048> <\
+0041> <0052> <00\
+42> <0055> <004F\
+> <004E> <002A> \
+<0044> <0070> <0\
+027> <0068> <006\
+B> <0079> <002C>\
+ <0053> <002E> <\
+0077> <FB02> <00\
+2F> <0045> <0028\
+> <0029> <0062> \
+<003F> <0067> <0\
+03A> <0064> <002\
+D> ]\x0aendbfrange\x0a\
+endcmap\x0aCMapName\
+ currentdict /CM\
+ap defineresourc\
+e pop\x0aend\x0aend\x0a\x0ae\
+ndstream\x0aendobj\x0a\
+8 0 obj\x0a<< /Type\
+ /Font\x0a/Subtype \
+/Type0\x0a/BaseFont\
+ /ProximaNova-Bo\
+ld\x0a/Encoding /Id\
+entity-H\x0a/Descen\
+dantFonts [124 0\
+ R]\x0a/ToUnicode 1\
+25 0 R>>\x0aendobj\x0a\
+127 0 obj\x0a<< /Ty\
+pe /FontDescript\
+or\x0a/FontName /QX\
+EAAA+ProximaNova\
+-Regular\x0a/Flags \
+4 \x0a/FontBBox [-8\
+4.9609375 -199.2\
+18750 1050.78125\
+ 907.226562 ]\x0a/I\
+talicAngle 0 \x0a/A\
+scent 1079.10156\
+ \x0a/Descent -344.\
+726562 \x0a/CapHeig\
+ht 1079.10156 \x0a/\
+StemV 53.7109375\
+ \x0a/FontFile2 128\
+ 0 R\x0a>>\x0aendobj\x0a1\
+28 0 obj\x0a<<\x0a/Len\
+gth1 9680 \x0a/Leng\
+th 131 0 R\x0a/Filt\
+er /FlateDecode\x0a\
+>>\x0astream\x0ax\x9c\xcdZyT\
+\x1b\xd7\xb9\xbfwf$\xb1c\x01Bf\x97\x10\x92\xd8\
+$\x01B\x08\x10\x126\xbbA\xec cVc@\x08\
+\x10\x08\xccfL\xbc%vh\xbc\xc4\xbbcd'!\
+\x8e\x9384I}r\xd2\xd6\xcdK\xec8\xb1\x93\xb8\
+M\xda\xba99>}}iN^\xb6&q[\xc7\
+m\xf3rb4~\xdf\x1dI\x80\x1d\xa7\xaf\xfd\xef\xcd\
+\xf5\xa0of\xee\xdc{\xbf\xfd\xf7\xdd1\xc2\x08!\x1f\
+\xb4\x1d\xd1\x08U\xd7k2f\xbb/\xdb\xe1\xce^8\
+\xd7\xf7\xda\xa7\xac\xda\x13\x0f\xf8\x02}\x1d\xa1\x98&[\
+Ogw\xcf3e.\x84b\x8b\xe0^\x96\x0dn\x04\
+?\xc2\xfc\x0f\x5c\xdf\x07\xd7\x09\xb6\xc1\xb1Mi!\x91\
+\xdf\xc2\xf5\x1cB8\xd5\xee\xe8\xea\x0c\xb8\x10\xf6k\x84\
+\xe2\xde\x81\xe7\xc7\x07;7\x0d\xa3\x1adCH\xd2\x0d\
+\xd7\x92\xa1\xce\xc1\x1e\x85\xe0\x9a\x08\xc8\x9d\x08\xf1\xcc\x88\
+\xa6o\xe3\x03\x88\x87\x18\x9e\x96y\x17z8\xdd\xbf\xd4\
+\xbb\xc8A\xd5\xc0/\xe2\xf1i\xf2\xc3H\x105\x03\xcf\
+\xc9\xda\xb9c\xd0>:\x8aV\xa1\xc0[\x0c\xbf\x8e\xad\
+\x03\x86NQ\xafK\x10~\x9c<\xc3\x1fS'\xc8l\
+\x88\x817a\xddT7\xaf\x11\xb8\x15 \xa4\x15J\x85\
+r\xa9PZDI\xd8\x04|\x9c\xb5\xf1\x1a\xbf\xfbq\
+\x11\xcc\x88\x11\xac\x9f\xbe\xcc\xb3\xc0Z\xa0\x17\xf4\x13\xcd\
+\xcdS\xd3<\xcb\xad\x82\xe3d\xfe\xad0j\x15\xaf\x0e\
+\x05\xa3P\x84B\xf9J\x85>S\x9f\xa5\xcd\x10\x87\x8b\
+\xc2\x04|\x1a\xfa\x7f\x9a\x14+\xc1\xb1\xb1\xc9\xc9\x92\xb8\
+8\xc9\xf8,\xf3\x00\x96\xc4\xa6&\xc7\xc2\x91\x9c\x1a+\
+\xb9\xb5\x95\xfe`A\x06\xb3\xac\xbf\xfd\x19}\x8e\xfe\x06\
+\xc5\xc0(0\x02\xb4\x0c\xb1@!\xe3\x0b\xf8\xa20q\
+\xb86C/\xe6+\xe3\x95\x0a\xa5b\xbd\xc982|\
+\xe8\x93\x07\xad\x1d\x8f\x9el\x83\xe3\xa4s\x83\xf5\xc1O\
+\x0e\x0d\x8f\x18M\xf8\xc6\xc1\xc9\xf1\xe2B\xfc\x5c\xfb\x0e\
+\xdco\x7f\xfa\x19\xbb}G\xc7\xf3\xb8\xb8p\xd3\x04Y\
+i\xc7\xed\xcf\x18\x19\xcc\x10\x8dT\xde9\xb4\xe1bh\
+\x22\x914\x9c\x9b\x22\x0b&\x91\x01\x0b8^\xc0\xe7\x9a\
+T\xa1\xe4\xda\xfa|\xe3\x88c\xef\xc1\xa1\xc1l\xfd\xc2\
+\x87>\x1b:N4\xd6\xd5\x18\xd6\x1c\xff\xfa\x83}\xfb\
+\xf1\xe7\x95\xc6|\xb92\x5cLQ\x0fQ!\x22\xb9b\
+\xd5j|\xe3\xe1\xc9\xf1\xd2b\x5cR6\xb1\xe9\x98\xf2\
+Pg\x97Tj\xe8>\x8e\x0f\x1d\xa4\x86bc\xd32\
+\xb2sss\xb3\xf5\xda4I,\xd1\x9a\x13\xa4\xfb\x1b\
+X\x15h^*\xcc\x84\xc9\xc8\xdcB\x99P+\x22\xeb\
+c\x84BZ\x97\x93\xdb\xbf\xb6\xbaV=;\x9b\xbb\xbe\
+\xdd\x86\xf3\xa8\x99\xfbt\x99X\xa5Z\xe5R\xd1\x1f\xec\
+/\xceH\xc7\xecEW9\x19\xab\x08d\xd8\x04cU\
+\x22\xa4\xd7{X\xd2e*\x15\xf7j:\xb7\x9a\x04@\
+z\x85|\xafF\xb4\xa8\x8c/\xaa\xce\x5c\xb7v\x83\xc3\
+d\x0c^\x11*\x92+\xa3c\xd3\xd3#\xa2RR#\
+\x22c\xa5+\x84\x01\x01]]?\xfe\xe3\x81RMe\
+MKOn^P`XhB|Lt\x9a:6\
+:5%:J\x12\x17*\x0c\x0a\xb0\xf6\x9e[x\xc0\
+aLLR\xa9\xca\xe3\xa2\x22\x84\xc1\xc2`_A\xa0\
+\x9f\x0f?(08P,\x8a\x8cH\x90\xa5n\xaa\xaf\
+;\xd0\xafO\x88\xc7\x89\xc9\x851\xa2\x95\x81+\x02\x83\
+\x04>\x01\xfe\x02\x1f\xa0\x82W\xae\x8c\x8a\x96+\xd5\x0f\
+\xd4[0\xe8r\xf3\xed\xeb\xb8\x95\xbe\x8e\x02Q\x14\xe8\
+R\xb1dqJ>\xbd\xecJ\x16\xff\xa8L&\xd1\xa8\
+\xa5p\xa85\x92e4\x9dz\x9fL*\x95\xa9\xe0&\
+\xc6.\xc6{!\x85\xb1\xe7n\xdf\xe6i\xc0\xdeW\xa0\
+8\xce/289\xb8\x0d\x82\xaf\x94K\x89\x9dd\xe9\
+8!\xca\xa4s\xf8\xbd\xdf>1gi\xc4\xe9\x19\xcd\
+\xad\xf7\xef<\xc9^\xc3Is\x9b7\x99\xf2pn\xde\
+\xa6\xcdO\xb2\xd7x\x96\xe6V\xe7\x89\x8b\x87\xee\xdb\xda\
+\xd2\xaa\xd5\xe1\xe3ee\x93\x13G\x8fMN\xac)#\
+6\xb9\xfe\xf6\xe7\x8c\x96\xd3~\x0aBr\xc6\xab\x187\
+\x07n\x1ex\xee\xf985\xca8\xc3$\xba\xa2\xab\xd8\
+\xbe\xe1\x8d\xb9\x06C\xee\xc6\xe1\xc3\x87G\x86\x0d\xb9\xb9\
+\x06voOe\xb9B.W\x94W\xf6X\xcd\x95r\
+\xc5\xba&uii\xf1\xe4\xc4\x81\x03\xe3c\xa5%%\
+\xa5c\xe3\x07\x0eLLRYY\x96F\x9b\xd5\xd2\x98\
+\x05G\xa3\xc5\xfa\xc4\xd0\x08\xd8N\x04D\x9d\xb7\xe8\x0f\
+P\x00\xd8!\xc62\xac\x0d\xc5Z\x1c\xaa\xc5\xf4M\x16\
+\x0e'{\xf9\xf1\x9b\x18|\x97\xb99\xc7^\xa2\xa3\x16\
+>\x05\xb7\xbdN\x87q\xa7\xccc\xc7X\x0bR\xa3\xdd\
+Q\xc29\xcb\xb3|7\x0f\x1cn\xb8\xfd9\xfd\x18p\
+\xa8@z\x18Y\x07*Yb\x92sr\x9d\xdb\xe8\x95\
+\x84v\x9b\x9cP\xa9\xf3\xf0J8\xd5\x03\xff4\xb3\xf5\
+\x97M\xe6\xcaL]llF\xba)o\xf5{\xe3%\
+\xa5\x83/\xec({\xf4\xaf\xb5E\x85Y\x99q\xb1\xce\
+\xd4\xd2\xf2z{aqq\xa1\xbd\xbe\xbctdwB\
+Be\x85\xadz\xf5*\xa5<<\x14\xcf\xbc\xd8\x99\xad\
+\xc7\xbb\x07\x9e\xc4\xa1areA\xc1ZW\xd3\xd5\x97\
+\xf3$qFS{\x87\xc1\x84%q^M X\x7f\
+\x18\x92s\xeb\x14p+\xf5xI\xb8\x18X\xa2\x85\xcb\
+|\x85\xb8\x16m5X\x9a\xba/OMOO]\xee\
+Z\xdbhr:Sk\x1b\x9a\x0e5Z,\x8d\x87\x9a\
+\xeb\xeb\x0eW\xab5\xfb\xf6\xfc\xf5\xab\xfd\x0f\xab5\xb5\
+T\xd0w\xf38\x00_,\xd4\xa8!4\x9d9\xd3?\
+\xa0J\x01\xa9\x85\xdd\xfe\x8c23\xd7\x91\x18\xa4\x0f\x81\
+G'\x94\xe9\x88\xf4\xb4\x22\x99\xd0\x1b\xf5\xf0a\xbb>\
+\xfb\xf4i\xe7\x95+\x91+3\x8a\x13TE\x11\xd8\x94\
+\xe7\xa0ffp0\xfb\xf5\x8c\xcbi\x90\xca\x92FW\
+\x03\x076\xe0`\x0b\xaf\x1f)Q\xc5b\x0c%\xed\x0e\
+_v7\xb7\x12H\x93/\x06\x04\x997\xe8\xf1E|\
+w\x7f.\x22B\xb3\x85\x84$%\xe6\xe567\x0d\xd9\
+\xd75\x19s\x93\x13C\xe0HL\xce56\xad\xb3\x0f\
+55\xe7\xe6%&\x85\x84\xd0\xbd\xd8/ \x22R\xa9\
+\xcc3\x95W\xe4\x99\x14\x89\x11Q~\xfe8,D\xa9\
+(-ik--Q*\xc2B\xa8\xf9\xde\xae\xce\xb6\
+\x96\x92\xc2\x94D\x8c\x13S\x0aKZ\xda:\xbbzm\
+\x9d\xdd-m\xc5\xc5\xc9p\x14\x17\xb7\xb5m\xe8\xb45\
+V\x9a\xcb\xcbt\x99\xd2\xb88i\xa6\xae\xac\xdc\x5c\xd9\
+ho\xef\xa8\xadW\xa7\xa5\xa9\xebk;\xdaAn\xe0\
+-\x94\x18\xb4\xc5'QS\xa0\xc4Z!\x1e\xfc/+\
+\xb6\x1cc\xc6\xff\xd4\x87\xd7\x83\xe5a$\x06\xcbSA\
+\x9fP.\x1aj\xc3\x81\x15\x10m\x98W\x02\xe2&\xc7\
+\xe1\xfb\xcck\xf0\xbcT\x96k\xa8\xaaj\xfbp\xd7\x8e\
+\x19\x5cS\xbd\x83>\xb7P2To\xd1\xea\xa2\xa28\
+\xbb\x86\x98\xfa\x1b\xf0\x0b\x91\xd7* $k9\xe5x\
+\x06\xa4u\xa6\xb6\xf6^\xf6\xf2lN\xce\xc0\xda\xdaj\
+\xb5sO\xa9Z\x83\xb1\x91z\xd95\xbe%]\x8bS\
+S\xf2\xa9kn\x1f\x19D\x88\x89\x00\x0de\x82\x8f\xe8\
+\xb2\xf4w\xb6%\x07W\xba\x1d\xe3.\x9d\x09\xa4\x22G\
+oYIM\xb5.3\x0bD\x13\x1d\x15\xe0\x87\x93S\
+\x8d\xab\xd6L\xb6w\xe4\xdb\xcc\xdb\xb6\x1e\x82\xd9\x0bW\
+%)\xe3e\xba\xac\x96\xd6\xb5\xeb\xb6S\x8f\xcd\xd4\x18\
+r\x0aVg\xa4e\xebSS\xd2\xd4\xaa\x14U]^\
+Nd\x84ZSm\xb7\xe6\xe8qD\xa4&\xad\xaa\xa6\
+\xb3\xbe\xdeR^\xd1\xdc\xba\xa6\xc2z\x1c\xd6\xc8g\x1d\
+487\x12\x22\xe4\xf6=\xbd\x1e\x02\x01\xfc\xe3\x0b\xe2\
+\x95\xd3r\x8dN&\x8d,`7<\x8d\xcbq\xe9\x19\
+VX\xfb;\x93\xf6[!\x16\x87\x1b\x8e\xd1\x9f/\xbc\
+O\xa7\xdcj\xbeL\x07\x815:\xd9\x19&\x07\xfc>\
+\x0c\x11\xd6=\xf9L\xbf\x18\xa5\x81Yy\x88\x87_a\
+8\x99\x09kgg\xf5\xcdM=\x97\xa6\xa7\xa6\xa6/\
+Y\x1b\xd7\xe6Q\xc1\x8d\x8dk\x0f\xae\xabkHLl\
+\xa8[w\x90\x9d\xe1Y\x0eW\x81\xff\xec\xd9\xf7\x97?\
+?\xbc\x1fc\x8d\xaa\xa1\x14\xbfl\xefWkV\xb3\xab\
+\x8bT\x1aLd\xdc{\xfb3\x88\xde\x83\xe0\x05\x9cG\
+\x91\xa6W\xb8E\xac\x95\x84\x0a\x96\x05\x16\x8f\x0a\xc5\x14\
+-=\xb8m{{\x87.\x1b\xe3l]G\xfb\xf6m\
+\x07q\xc5\xc5\xfd\xa6\xee\x9e\x89\x0f\x8f\x1c%\xe8\xe1\xd0\
+\x84\xb5\xdbx\xf0J\x04\xd6e\xb66?\xb8\xf3\xc4\xec\
+\x83\xbbZ\x9bu\x99\xec\xd75M\xd9\xfa\x93\x8f}\xfd\
+\xf8\xb6\xed%\xa58;\xab\xb9\x86\xbdA\xd6\x10\x02s\
+\xa7{\xac\xd3-<J\xef\xfa\xc3\x1b\xf8]\xfc\xee\xeb\
+\xae\xdf\x03t\xeafN\x82\x89\xba\xa3&\xb5\x85\xbe\x09\
+\xe8\x89DM.\xe5\x8b<Bq\xce\xe6[\xea7D\
+\xc7\x97\xd6\xd6K\xe9\x0f\xe6\xea2\xd2\x1f\xe3\xa7g\x18\
+\x5cE\xc8\x8d\xc9x0\x10\x17\xad\x85\x10\xad\x09`\x80\
+y\x84<\x0d\xab)f\xd3\xe7\xff\x86\xcf\xe0\xf9\xbf3\
+#\xb7\xf6\x93\x13f\xbc\xc1\xacX\x9c\x91\x8bs\xfed\
+m\x1c\xd0\x10\x92%\xd2\x06\xf6\xe4\xe9\xd9Y\xca\xe7\x0d\
+\xb6\x1c\x9f\xc3\xaf<\xc1~\xca\xb3,LQA\xec*\
+\xd7\xc7\x00Q\xc8\x8c\x8c\x13\xde\x0bA\xb1(\xc9\x9b\x17\
+9\xeb\xf4X\xa9\x0cK\x898\x89\xc4\xa5B\xa1\xd4\x0b\
+=\xa4s\xd4\xfa\x9f\xf4\xf5\x96\x94v\xd9k\xaa\xfb\x06\
+\xce\xb1yxv\xd8d\x04\x071\x0d\xb3\xbd\xf8\xd4D\
+QaA\xd1$\xdb\xce\xb3\xac_\x7fr\xba\xa1!<\
+\xa4\xb3{\xeaLw\x0f\xcd\x870\xb7\x01\x80\x17f\xcb\
+\x5c\x87\xf2MC\xddE\x85\xd8\x9d\xa7\xe8w\xc1>\xfd\
+=y\xca-_LG\xb1\xd7\xd8kg\xf1f\xd6\xf9\
+\x22\x0e\xc5!/\xb2N\xbc\x05\x1fc\xfb\xf1\x02\xfe\x88\
+\x9d\xc1Sl\x1c\xcbx$\xc7\xc4\x01\x1f\xbe\x1c\x0f\x22\
+)w\xce\xd1\xdb\x5c)\xd4\x9b\xae\x5c\x9e\xe58[\xf6\
+\x88\xeb \xc9\x08\xa4\xe76\xe8\x19\x8cV\x92\xb9\xa4 \
++\x0e\x0b\x10\x9e1&\xc6\x0b/\x87\xd3?cO\xb3\
+7\xe6)\xf9\xf9\xc9\x09\xdck;\x82G\xd8o\xcc\xe6\
+\xcaM0\xbfu\x13\x15\xe7\xfa\x88g\x19\x1e\xf9\x8f\xb3\
+\xbd}\x81\xae\xf7(\x17N[S\xe6\xfa\x86 \x18'\
+D\xeb\x1co\xbe!1\xdf\x0bG\xbd\xe1Y$\xf4\x86\
+`\x85\x07\x15:g\x8dk\x1b{\xde\x98\x9e\xc2xj\
+\xf3\xa5\x9e\xb5\xebr\x88_\x1c\x01\xf0\x81\x1b-G\x88\
+\x9f\xf0,\xae\x9bu\x1a\x15~x\xff\x97\x7f\xdd\xb3O\
+\xa3\xae>\x8c\x03\x0aST\x03\xfdg\xce\xd8\xfb\xb1Z\
+S\xe8E\x9cWaf/\xe2\x94y\x11'\xb7\x04\x09\
+ N}\x8ea\xc0R]G\x10gg{?6P\
+{\xee\xd3j9\xc0\x09\x13|\x0b\x88\x93\xbd\xe4*\x81\
+\x91\x0a@BU0\x92\x80\x8c$\xd5\x11I\xe2\x9bl\
+\x0d\x13\xc0V1\xe7\x8f\x1f\xbfU\x00}\xa4 \xca)\
+\x88yb\xc2%d\xb7%\xdcI2\x8d\x88d\xba\xcb\
+\xa7OW\x99wv\xea\x94\xc9\xea\x8a\xc4\xa4+Wh\
+\xcb\x8c\xf9\x11KC\xfch8\xc6\xe9\xdav\xf3\xcc\xc2\
+\xbcW\x1f#\x9c\xcd\x8b\x16\xed\x8f\x08\x0b&\xf5(#\
+c\x8e\x92_\x1e\x1b\xc5\xa3c\x97\xd8]T\xca\xa2\x1a\
+x\x96\x89\xc9\x9f\xbc01\xe9\xfa\x88bqZY\x99\
+\xeb[\x8f\x1cx\x1f@\x84J\xbcK\x0e\x99\xb2; \
+8Q\xb97t\x09y\x10fZ\xca\xd7T$\xce\xfe\
+\xbclMy\xd2\xec\xac\xbc\xb5\xa5\xdb^T(V\xb5\
+\xb5\xf5\xcc\x94\x96Ps\x9dYY*\xb5\x11\xaci\xee\
+]\x95\xc6\xc4A\xf4\x1c@\xfb\xba\xda5\x80A*\xcc\
+G\x5c:\x0em\xb0C4\x0bs\xabQ>\xc4Y\xfd\
+\xb2d\xab'IF\xb9\x1cz\x00\x22\xf0\xa6\x00\xee\x01\
+\x16z\x82\x98\xd8\x83\x8e\x8eW\xe6U\x9a\x07\xf3\xb3\xb3\
+4\xaa\xc8\x08\x9c\xb3vm\xf7\x9bS\x9b7O\xbd\xd9\
+ei09!\xca\xa7\xa4\x1aM\x05E\x15;[Z\
+\xa9MIu\x0dM\x87\x1b-\x18 JS}\x1d;\
+Z\x16'\x11\x06\xcb\xe2\x0d\xb9\xd5\xfbj4\x19x\xf7\
+\xee\xeb_\xed\xdd\xa3\xd2\xd4\x1d]X\xd5QQ\x91\x96\
+\x16'\x09\x0c\x02\x84D9\xf0Y\x80.}\xfdO?\
+c\x1b\xc0ijo\x0c\x0a\xf1D\x12\xa1\x943 )\
+\x9c\x8cm\xe1\xbf\xe7\xe7\xe9\xd8yj\xd4\xb5\x0f\xec\xe5\
+%\xca\xec\x8e<%t\x0c5\x0a\x96\x00\x99\x05\xeb\x05\
+J\xbdR/Vj\x05z\xb1@,P\x8a\xb1\xca\xef\
+\x92\xea\xeaU\xd5%\xbf\xf6\x80\xcb\x9a\xabW5\x97\x03\
+\xe8\x98\xafv\xd4\x0d\xf4\xd7l\xfb\xea\xabm5\xfd\x03\
+u;\xbe\x22q\x08\xec\x89>\xc8\xd9S\x22J\xbd\xdb\
+\xa6d\x8b6\x85\xbd\x95\xa8\xb7\x86!\xa5\xe8\xdd\x86\x86\
+\x7f\xb5X\x9b\xc6\xc6J\x92\xcdN\xaf\xe5\x8dGx\x0d\
+o\xb1\x5c\xc5\xd1\xb1)P\xaf\xe2[[\xb8\x82\x15\xf8\
+\xe1j\x10\xf4.\xd4 H\xff\x835G\xe0\xf2\xcab\
+=;\xc3i\x9d\xf3y\xc8\x89|w&\xd4y\xd6\x09\
+\x9a\xa6\x85\xcb\x12\x14IO4\xeb46Z\xba\xdc\x0a\
+\xednZ\x9b\xedt&\xd5\xd5\xafs\x83\xcc\xa6\x86:\
+v\x86\x0an\x80\xd4\x87\xf7?\xfc\xe7\xbf\xec\xdb\x03>\
+^u\xd8\xa5\xc5\x17\x0a4\xaa\xfe\x813\xcf\xf6\xdb!\
+K\xc2Z\xab \xda\xd4\x81\xd4j=\x95\xa1>\xdcm\
+m\xf7\xae\x0eu\x84\x1d\x09\xf1Q\x8f\x95\xdd\xbb.\xf4\
+ )IU\xb7yhpfm\xc1*y|\xc8\x0a\
+\x81O\x10\x14w\xd11\x22\xb1<1<\x22\xe5\x17\xd5\
+/\x84\xd3\xf8\xc1]\xbf\xc2\x9a\x9fY\x8f~\xb3\xa5\xb2\
+\x06O\xe6\x9e\xd0\xc4DjT1\xd1J\xe5\xca\xf0\xe8\
+\x88\x15\x81\xfe\xbe+B\xe4\xca\x9c\xdc\xc6\xa6~\xf6\xa7\
+\x17wX\xb2 \x13\x8bE\x09\x09Jerld\x04\
+\xb8\x1dT\x8b\xfe\xbeA\xfe>\xfc\x804e\xc3\xe9\x88\
+\xa8\xa7\x07\xfa\xceoy\x12\xe7\x99:\xbar\xa2\x92\x83\
+\xf8>\xc1\xc1\x01A\xa1a\xa2\xf0\xe8\xd88ib\xb2\
+:_\x9f\x93\x99E\x8ar\xa2'\xc8\xc2\x1c\xa2Y\xca\
+\xc6\xf8\x14\xdb\xed\x010=\xa0M@-D\xa34W\
+\xab\x9c\xe59\x81JAyDCXK\xffk\x15\x8b\
+Lww\xc9BY\xc6\xb1f\xee\xb9\x7f\xabnaF\
+\xb1\xf2;\xeb\xbf_\xbd`4\xce.`\x1b\xd8b8\
+ \x7f\x0e>r\x91\xc2\xbb\x15CR\xd6E\xb3V!\
+\x17\xf8\x88R#c\xe0\x1dU\xa6R\x8e\xd5i\xecB\
+\xbe4++\x83\x87c\xa25*\xa949\xb5\xa4\xa5\
+\xae\x81\xc4'\x12\xd9u\xe0\xdb~\xc4\xbaIl\xc7\xee\
+\xa2\x84\xc6R\xeaW\xaeIj\xcd\x97\xaf\xbd6\xcfJ\
+\xf1\x87\xb8y\x1f\xedXp\x1ec\x9ff\xce\xb9\xb2\xe1\
+\xcd\xae\xdb_\x80\xa5\x0d\xa2lT\xe7\xdd\x85\x08\xf7b\
+\x5c\x1d\x17\xf4=\xf2\xf4\x82\xb2%\x93\xe2/\x95'x\
+\xc9\x1a=e\x89W\xae\xcfYr\x8b\x0a\xbb\x01\xe8\xaa\
+R\xe2b\x82\x021\xce\xec\x1f\xd8\xb4\xb5\xab\xc7h\xc2\
+2i^^k\x8b}\xb8\xb99\xcf\x90\x04E\x0a\x0e\
+\x0dOQ\xadZ\xdd\xd26|\x9d\xea\xe1\x05\x04EE\
+\xc9\x95\xfa\x9c\xe2\x0a\xb2_\x13\x1a\xb6n\xed\xde\xee\xb6\
+\xb6}\xdb\x8a\xe3\x13\xc0\xc5u\xda\xd2\xe2\x8a\x8a\x1ay\
+HmA\x81Fm\xed\xde\xd7TW\x9doT$`\
+\xb9\x12Fh\xed\xb1\x8e\x8eXmM\xcd\x05\x85r\x05\
+\xed\xc8\xd2\xc2\xa1\x90G\x84\xe3\xa8\xa8\xe4\xd4tm\xfa\
+\x81\x8aJ\x9c\xad\x07=@4\xa7?v#?-&\
+\x19\x11\x7fK)]\x12\xfa\xb4\xeb*d\xc4\xf1[q\
+ !/:\x14\x80t\x91\x94\x96\xd22b\x92X\xca\
+\x8cO\xb9\xccS\xafR\xf2\xf7\xe0\x95\x11\xf6\x1aU\x83\
+5\xecURF3\xe7]\xbeD\xcbF\xfc\x1c\x95D\
+iI\x8d\x1d\x0ac\x1b\xf1u\xfc\xdc\xcc\x0cyb\xb8\
+\xfd\x19\xc3\x80\x7f\xaf\xf2\xfa\xb7\x17~\xf1\x05:wj\
+q_\xb8\x8b\x0bo\xa8\xe2\xda\x1d.Mv\xbf\x0c=\
+Fk\xd7$\xc0\x8a\x96\xd6G7\x87\x86O\xeein\
+\xc2k\xd7\xdd\xefhl2\xb7WO\x8e\x1f\xff\xe5\x03\
+\xf7G\xc5\xa4\xaa\xd23\xb4JR\xb3I\xa5\x22\xd1\xfd\
+\x0f\xfc\xf1\xa9\xad\xdb\xaf\xf4\xd7\xa7e\x90\xed\xb6\xe9\xbc\
+\x5c`\xe8\x04\x95\xa3\x1f\x19\x04\x00\x87\x13\x93\x1a\x06\xda\
+\x0d9\x9d\x1b\x9e-\xcd1\x10\xb7\xf4e\x02\x83\xa3c\
+\x12\x14\xfal\xd3O\x06\x87\xf0\xea|\xc2\xc3\x0c\xf0@\
+\xd0D\x82\xbb^\xf3.\x1a\x1c\x8d\xc3h\xcbKY\xb2\
+Rf\xa6o\xef\xf5\xdd\xeb\xc8\xdav\xff|\xe7\x16\xba\
+\xc8e\xcd\xb44lh\xac6\x9b\x8c\x09\xf1\x90\xc9~\
+\xc7^~c\xf8\xa5\x86\xbam\xbb\xea\xaa\xf1\x8e\x14\xea\
+\xa3\xe3\xac<\x13\x9e\xe0\xe8\x98\xac\xac\x86\x06\xeb\xaf7\
+Oco\x1e\xf3s#B\xa9\x1bH\x93,f]\xf8\
+d\xfe\x05:d\x9e\xa9\xba\xf5\x22\xe0\xe7+\x8c\x9ed\
+1\x1a\xf5A$5\x82\xa4U\xa8\x1cY\xdd{O\xfa\
+e\xe1A\x9b\xb1\xb4D\xafxE\x8bF\x8f3\x972\
+\xb7\xa7-\x15\x80\xa1K\xb1x\xd1\x13H)N$\xd1\
+\x8f;\xdaw\xefl\xb4$%\x16\x15\xd6\xd5\xac\xb3\xd4\
+\xd7\x16\x17&'r\xb9=3\xcb\xf8PG\x1b\x14E\
+\xbf}h\xd0QPD\x875Z\xb6no\xb0\xe0\x95\
+\xe1\xf1RU\x8a4N\x12'\x8dS\xa5\xc4KW\x86\
+\xe3\xb0\x88\xc8\x04E\xaaF\xa6\x88\x8e\x91\xc3o\x82\x22\
+\x22\x12\xc6\xddy\x7f{\x1bn\xde\xde\xd1\x9e,\xaf\xaf\
+\xdd\xdaTZ\x9c\x9c(\x16\x89\xc4\x89\xc9\xc5\xa5M\xab\
+\xf5\xd9\x8a\xa4\xc8\x18aR{\xc7\x8eg\xbb\xad\xa9)\
+\x96F\xda\xd7j2\x1aMV\x8d2I\x1c\x19\x22\x12\
+\xf81\x8c\x9f@\x14\x12)NRj\x5c\xd3\xda\xd4\x94\
+\xd8(q\xb8\xbf\x1fM\xfb\xf9\x87\x8b\xa3 ij\xed\
+\xab\x0a\x0aV!n\x87\xe23\xc6\x02\xb2\xcbF5w\
+\xecP\xb8\xb7!\x97y\xfa=\x04\xa9\x5c\xdc\xb2\xe0e\
+\xba\xb7a\xbc\x96\xbb\xb8M!\x0aU\xa7\xac^\xd5\xd6\
+2\xf2\xd5\x01\x8b\xa1\xa0\xa8\xbb\xa3\xa2R\xa5\x09_I\
+i\xed\xfd\xd3m\xb5\xd5&#\xc4\x15\xa9\xcc\x90\xd7\xd2\
+:8\xdc\xd4\x9c\xe7\xde\xb6(hZ\xb7\xbb\xa7\xa55\
+\x97'\x16)\x95\x05\xab-fS\x9eB\x1e\x16J\x9d\
+\x19\xb6\xf567\x17@\x0c\xc6On+\x94\xc7Cf\
+\xad\xa8l\xef\xe8\x95\x91\x08\x11\x15\x93\xa9k\xb0\xf4\xad\
+\xab\xad5\x9a\x12\x14X!/X\xd5\xdal\xb5\x1e\xdb\
+_Y\x81\xf5\xb9-\xc5\xf9\xf99\x06\xa9,*\x225\
+9#\x1d\xca-\xc0,\xbc\xf79\xcc\x92\x86V\xa3\xe2\
+\x1fF\xc2\xd2\xef\xa1\x191w_\xc6\xc1\x19\xc5\xff\x05\
+g\xe6\xe1F\xd5\x03\xebu\x8a\xa44\xb8\x81\xdf~\xdb\
+I\xf5$\xc5I0\xc47/\xc4\x99\xbd\x07\xb8&\xb7\
+\x8eY\x1a\xff\x15\xd4Cq\xf8k\x92\xe3%\xea\x87\xd1\
+\x97\xf4^\xab\xdbv\x0fx\xc5m\x12\xba}\x10\x97/\
+\xed\x1e\xce\xb9\x1f,Uk\xfe\xcb\xab5\xa9h\xb1^\
+\xa3\xdewWll\x12\xd9\xbb\xb0\xdd\xfe\x84\x97\x0f\xb9\
+'\x05\xac\x8b\xfa^\xcd\xbf\xe4MzR\xac\x10\xf4%\
+\xe3v\x08\xe6\xb2\xb3\xf5\x1d\xed;\xb6\x1f\xc2\x05\xbf\x9d\
+)\xec\xed\xdbttrSq1>~\xec\xa3\xe1\xae\
+N\x03\x9bBm\xed\xfe\xd1\xeeS\x87\xb6\xefh\xef\xc0\
+\x0f\xe1W\x1e\xdc\x09\xc5\xbf\xf66jh\xcc\xd4\x96\x94\
+n\xdd>w\xf3\xd1\xc7RS\xf2\xb0\xf8\x116t(\
+?\x1f\xeb\xb4\xad-\x84\xa7\x18\x84\xf87=5:\xb7\
+\xa3\xea\xa9U\x99\x97\xd8\xf7\xd8\xf7\xce\xb1\xd3\xaf`\x0d\
+\xce\xdd\x87s\xb0\xeaUv\xda\x13g\xf61\xa3\xe4$\
+R\xa1n\x9fb\x1d\x9eo+1\xdf\xff\xb6\x22\x16r\
+`S\x09P.\x5cw\xe7W\x96\x84\x8a\xca=\xabU\
+a+3\x9cw}my\xea\xd6\x1b\x87\xaak\x82v\
+\xf8c\xfc<c\x04m\x0e\xd1f\x8a\xe0\xc2`\xb2\xd7\
+\x0d2[6\xbe@\xa0\xa5\x16q-q7\xc1\xd3\xd9\
+\x90\xef\x14\x8a\x98\xa8\xc0\xe0\xc0\xa0\x0f\x00\xa3\xc5D)\
+\xe5\xd1Q\x18.\x03i3>\x15+\x8f\x89\x8e\x8aQ\
+\x049Fl\xfdp\x05\x1d!\xcepW \x0d?v\
+\x1a\xdf\x04\xdd(@4\xa4\xba\xe1*.\x1d@\x03\xa0\
+@#`5$.\x0a\x89W\x0b\x89\x9a\xb4\x22<\xde\
+k\xae\x8c\x8e\xc9\xd0\xc6DU\x9a{\xb7l\xc9V&\
+a\xdc\xde\x8eq\x922{\x0b;]Y\xb1\x19?m\
+LJ\xb4\xc2\xb5\x09\x9f\x9e\xaa6\xe3\x11uZ\x09[\
+\xb371y\x0f[S\xaa\xd2\x8c\x10-\x00\x878\x89\
+\xe3\xf0{\xfc\xdd\xc1\xcf\xdd\x0c\x90we\xec4\xe5\xe7\
+^s(\xf7-EH\x9c\x90[9\xd8=\x07\xfc`\
+\xa9zQ\xbcW\x1b2\xd9\x16}\x92\x12wt`e\
+\x92~\xcb\x96\xdeJ3\xc8H\xab\x8d\x8a\xc1\xe6\xca\xde\
+-\xecu\x8d\xaa\x14\x9f\xdd\x9b\x94\xb8\x17\x9f-IS\
+\x8f\xc0\xddi\xb6\xd5\x04|Y\x13\x93\x8cl\xf3\xe6\x8a\
+J\x98\xb5\x99\xb5\xe1k\xbci\xaeN\xf2f\x16\xb1\xf7\
+\x13\x0d\x9e\xde[^QQ\xbe\xb7\xd5\x9e\xa9\xd3e\xda\
+Y\xdb\xab\xd7\xbf\xf8\xf6\x9b/\xfft\xb1\xe4\xda\xab\x17\
+n|}\xfe\xb5\xf7`\x04X<\xdd\x0a\x88\x97\xecq\
+\xe8\xdc0D*\xea\xa7\xa4\xae\x0f\xa9/]\x7f\xa0T\
+\x93\xd4\x873\xe3\xae\x98]n\x1em\xf8\x94{\xb6P\
+\x12^\xf5^pO\x80\xc2w8S7\xd8\xba\xa7\xb2\
+\x02\x0c\xaauP\x97\x89o~}\xe1\xfc\xfb%\x17\xbe\
+\xfc\xf2\x9bo\xbf\xbc\xfeJ\xd9{\xaf\x9d\xf7\xecw1\
+7\xc0\xd2}\xb8\xdd(\xce\xc8\x85\x94\xca\xf5\xe9[\xf8\
+\x0c>\xf3\x96\xebs\xaa\x80\x0es\xed\xa2\xa6\x17\xae\xbb\
+\xce\xbb\xf3\xc0\xe7\xbc\x97@\xae\xa2e\x9e\xba\xac\xaa \
+\xb9\x12/n\x87\xbaw\xa3\xdd\x05\xcb+\x0d\x0d\x0d'\
+\x9do\xbfy\xd2iih\xb08O\xbe\xf9\xb6\xf3$\
+\xfdw\xa3i\xe3\xd8\xd1O~\xf4\x106\x19\xc6F\x8f\
+\x1d\x19\xdfh2\xe2\xd5T\xfa\x13s\xed-\x18\xb7\xb4\
+\xcf\x9dz\xeb\xca\xdc\xa9\x96\xb6\xb6\x16\xca\xff\xf1\xad[\
+\xcb\xcaN\x9e\xfc\xdbc\xf0[\x8eqy\xd9\xd6\xad$\
+\xca@^\xfa\xce\xbd#\x12\xea\xde\xdc\xd5s\x86\xa9\x15\
+\xae\x10\xf0\xe5\x12\x88\x10\xf3=\xdd/\xbf\xdc\xd3=\xff\
+\xf0~\xf6\x06{\xe3\xe1\xfdT\x08]\xb4p\xf1\x82}\
+\x08\xe3!\xfb\x05:\x7f\xe1<{\xeb\xc8Q|\xf4\x08\
+\xf7\x1d\x16N\xf53\xdd\xbe\x1d\xc1y\xff \x1f\x94\xef\
+>\xc0\xafm\x10\x19\x9c\xee\xda\xc4s`\xf2\xa5\xd6e\
+\x82\xbf\x87\x10b\xff\xc0\xbf\xb9\xf4E\xd7sTP\xd7\
+Q\x11\x13\x86\xe6\xf0;h\x1b\xfd\x0f\xb4\x9e\xd9\x01\xa7\
+\x0d9\xe9s\xa8\x08_C\xd3\xbcY4\xc7\x1cF\xeb\
+y\x1f\xa2\x08\xe8\xe3d\xf4h\x033\x8b\xd6S+@\
+\xe8\xcd(\x8c\xf9\x14\xd9\xa8\x9f\xa1\x14\xfa\x1d$&\xef\
+1/\xa1A\xfa+\xc4g\x1eAN\x9e\x0d\xd9x\x85\
+(\x84z\x129\xf9\x9b`\x9ch\xb8\xe7\x83\xe6\xe8\x8f\
+Q\x04c\x85\xeb\x0f\xe0\x9c\x85w\xfa\xe1\xdc\x8f\x0a\xa8\
+B$e^Ds\xfc\x09\xb8~\x04\xe6\x04\x9a:\x87\
+J\x98\x10\x08v\xb0\x16r\x8f9\x8b\xaa\xb8\xf1a\x1d\
+po\x9c\x99@\x05\xcc\xcb\xa8\x9b\x89E\xf9\xdc\x5cV\
+dd\xc6\x90\x819\x87fx\xcf\xc2\xf8O\xa1~x\
+n\xe3[`l2\xce\x17po\x1f\x9a\xe3\xbd\x84l\
+\x82\x15(\x06\xbfs\xfb\x14u\x1e9\xa80\xe4\x87\x1f\
+\xe1~e\xf8\x16j\xa6\xdfD\xfd\xf0+\xe3\x01\xb6\xe6\
+\xc7\x02\x1f\xb3$op;\xcf\xa5h\x13z\x03}\x81\
+\xdb\xf1^\xfc:%\xa0\x94\x94\x96\x9a\xa1^\x87\xf6'\
+\xba\x9d\x1e\xa6\x0f\xd3\xbf`\xfc\x19\x0d3\xc0<\xcf\xbc\
+\xce\xfc\x91\xb9\xc5\x13\xf3Zx\xd3\xbc\x03\xbc\x0b\xbc\x05\
+\xbe\x94\xaf\xe57\xf1\xb7\xf3\xcf\x0b$\x82lA\x8b`\
+N\xf0\x0b\xc17>c>\x0f\xf9|\xe6\x1b\xe4\x9b\xe2\
+;\xef\xfb\x8a\xef\xef}?\xf3+\xf3\xdb\xe9w\xc2?\
+\xc7\xff\xa7\x01Q\x01%\x01u\x01}\x01g\x03\xae\x06\
+R\x81\xfa\xc0\xd1\xc0\x83\x81\xef\x04\xfe9\x88\x0e\x92\x07\
+\x19\x83v\x05=\xc7i\xb5\x02\xf5\x02*@\xcb\xbf\xda\
+/;\x22\xb1i\xf1\xfe\x0a\x14\xef\xa11\xe4\x91J\x0f\
+MA\xed\xd0\xef\xa1i\x14\x8b\xcezh\x06\xfa|\xe1\
+\xa1y(\x0f\x0f{h>\x0a\xc5\xef{h\x01RQ\
+\xc5\x1e\xda\x07\xad\xa4\x9e\xf2\xd0\xbe(\x90\xfaO\x0f\xed\
+\x8f\xa2h\x89\x87\x0e\x00z\xccC\x07\xa1$\xfa\x13\x98\
+\x113\xbe\xdc\xff\x22@\x1e\x1a\xa3\x95H\xeb\xa1)\xe8\
+\xd5\xec\xa1i\xa8\xa27zh\x06\xfa\xfc\xc6C\xf3@\
++\xdfxh>R\xe0\xe7=\xb4\x005\x83\xce\xdd\xb4\
+\x0fJ\xa3F=\xb4/\x8a\x04\xbd\xbbi\x7f\x94E\xfd\
+\xc9C\x07\xa0,:\xcfC\x07\xa1:\xfa\x00\xaaG]\
+\xc8\x86\x1c\xd0\xech\x03\xf7;\x00\xeb\xacGch\x0a\
+\xee\xf4 T\xdfes8\xec\x1b\x1c\x8e\x01I\xfd\xd8\
+\x94\x1d\xee\xd4\xc0\x12\x1d\xb0\xa0>4\x88:\xa1s\x15\
+\x5cM\x00\x85j6:6\xf5\x0dvJ\xaa\x1c\x13p\
+U\x07o\xf7\xa2q\x18\xa5\x13^@u=\xbd\xe3\xf6\
+N \xb4H\x0d\xa8.\x1de!\x03\x0c`G\xa3\xd0\
+\x0cw\x0d\xea\x1dRu\xf7(ZuZz\x96\x81\xfc\
+\x8f\x0d\x83g62\x99jq\xf0\x7fqm\x16\x18u\
+#\xcc\xdb\x07\x8f\x87\xa0\xdb\xf25\xd5\x00\xf7\x12\xb8J\
+\xbb\xe3.\x91\xd1\x18\xc8\x8a\xf4\x9f\x80\xe7\xe9\xdc35\
+ \xf3l\x8e\x8fN\x90[\x0f\xd7\xc7\x0aw\xed0\xf2\
+\x06\x94\x01\x94\x0e\xce,\x94\x89\xf4\xd0t0q\xcf\xc6\
+\xd1>\xc7\x90\xc4\xcdGM\xbd$-\xcdM\xda\x1cc\
+]\x8e\xa1\x09I\xba:M\x9d\x9dm\x18\xec\x1c\xe8q\
+\x8cY\xd5\xf6\xbe\x0d\x19j\x9d:+S\xaf\xd7\xdd\xcd\
+\xdd\x0f\x0a\xe9\xdf\x92\x8c\x04\xee\x8c\xc2_B\x8dA\x9f\
+N\xd4\x0d\xa3\x0dr#\x11Sp\x00C\x12p$\xef\
+u=7\x02\x11\xc3(\xf7W}\xa7l%}\xa3\x92\
+N\xc9\xd8\xc6\xce\xee\x9e\xc1\xce\x8d\x03\x12\x87URI\
+~\xeb\xfb\x06\x1dC\xa3\x8e!\xe8\xfe\xc3c\xb9\x0do\
+\x1cV@\x14#Afh\x85\xf0\xc2\xf2\x01\xc0\x0a\xc7\
+\xbb\xfb\x1c\x12\xb3\xb9\xf0\x9f\x0du\xe7K\x08\xf47\x06\
+m\x18\xe5\x22\x0d\xb4I\xae\xa9\x17\xd9\x1c\xfd\x1eSD\
+\xd3\x83\xf0\xda\xd8\xd8p\xaeF399\xa9&\xec\x8c\
+z\xb9\xe8r\x0c\xfe\x7f\x1aS\x03\xf7\x87@Q\x0e\xa0\
+\x88\xedu\x81\x0aI\x9f\x1e8\xff\xd9|\x9a\xbe!\xab\
+Cc\xef\xeb\xea\x19\x1a\xed\x19E\xff\x0bX\xe1\xdaW\
+\x0aendstream\x0aendob\
+j\x0a131 0 obj\x0a6518\
+\x0aendobj\x0a129 0 ob\
+j\x0a<< /Type /Font\
+\x0a/Subtype /CIDFo\
+ntType2\x0a/BaseFon\
+t /ProximaNova-R\
+egular\x0a/CIDSyste\
+mInfo << /Regist\
+ry (Adobe) /Orde\
+ring (Identity) \
+/Supplement 0 >>\
+\x0a/FontDescriptor\
+ 127 0 R\x0a/CIDToG\
+IDMap /Identity\x0a\
+/W [0 [362 506 2\
+23 491 558 546 4\
+61 228 694 567 7\
+28 223 523 570 2\
+56 292 607 336 4\
+71 546 583 486 5\
+69 670 652 327 8\
+02 510 624 482 5\
+45 603 570 547 5\
+65 280 582 801 5\
+69 706 337 505 2\
+28 569 581 486 5\
+23 228 553 586 5\
+11 652 297 552 5\
+85 702 576 586 7\
+86 505 237 564 7\
+07 876 223 340 2\
+58 197 258 246 4\
+68 246 621 759 6\
+94 ]\x0a]\x0a>>\x0aendobj\
+\x0a130 0 obj\x0a<< /L\
+ength 882 >>\x0astr\
+eam\x0a/CIDInit /Pr\
+ocSet findresour\
+ce begin\x0a12 dict\
+ begin\x0abegincmap\
+\x0a/CIDSystemInfo \
+<< /Registry (Ad\
+obe) /Ordering (\
+UCS) /Supplement\
+ 0 >> def\x0a/CMapN\
+ame /Adobe-Ident\
+ity-UCS def\x0a/CMa\
+pType 2 def\x0a1 be\
+gincodespacerang\
+e\x0a<0000> <FFFF>\x0a\
+endcodespacerang\
+e\x0a2 beginbfrange\
+\x0a<0000> <0000> <\
+0000>\x0a<0001> <00\
+4A> [<004C> <006\
+9> <0063> <0065>\
+ <006E> <0073> <\
+003A> <0044> <00\
+6F> <0077> <006C\
+> <0061> <0064> \
+<0020> <0074> <0\
+030> <0031> <004\
+A> <0075> <0032>\
+ <0079> <0070> <\
+0043> <0056> <00\
+72> <004D> <006B\
+> <0042> <0078> \
+<0046> <0052> <0\
+062> <0068> <005\
+4> <0066> <0050>\
+ <006D> <0067> <\
+0048> <002A> <FB\
+01> <002E> <0071\
+> <0053> <0076> \
+<00E1> <002C> <0\
+034> <0039> <003\
+7> <0041> <002D>\
+ <0033> <0035> <\
+004E> <0038> <00\
+36> <FB03> <FB02\
+> <0049> <0045> \
+<0047> <0057> <0\
+06A> <0022> <007\
+B> <0027> <007D>\
+ <0028> <007A> <\
+0029> <0059> <00\
+4F> <0055> ]\x0aend\
+bfrange\x0aendcmap\x0a\
+CMapName current\
+dict /CMap defin\
+eresource pop\x0aen\
+d\x0aend\x0a\x0aendstream\
+\x0aendobj\x0a9 0 obj\x0a\
+<< /Type /Font\x0a/\
+Subtype /Type0\x0a/\
+BaseFont /Proxim\
+aNova-Regular\x0a/E\
+ncoding /Identit\
+y-H\x0a/DescendantF\
+onts [129 0 R]\x0a/\
+ToUnicode 130 0 \
+R>>\x0aendobj\x0a2 0 o\
+bj\x0a<<\x0a/Type /Pag\
+es\x0a/Kids \x0a[\x0a5 0 \
+R\x0a45 0 R\x0a91 0 R\x0a\
+]\x0a/Count 3\x0a/Proc\
+Set [/PDF /Text \
+/ImageB /ImageC]\
+\x0a>>\x0aendobj\x0axref\x0a\
+0 132\x0a0000000000\
+ 65535 f \x0a000000\
+0009 00000 n \x0a00\
+00094028 00000 n\
+ \x0a0000000171 000\
+00 n \x0a0000000266\
+ 00000 n \x0a000004\
+4909 00000 n \x0a00\
+00000303 00000 n\
+ \x0a0000026819 000\
+00 n \x0a0000085377\
+ 00000 n \x0a000009\
+3881 00000 n \x0a00\
+00026840 00000 n\
+ \x0a0000028031 000\
+00 n \x0a0000028052\
+ 00000 n \x0a000003\
+0664 00000 n \x0a00\
+00030685 00000 n\
+ \x0a0000032984 000\
+00 n \x0a0000033005\
+ 00000 n \x0a000003\
+3262 00000 n \x0a00\
+00033281 00000 n\
+ \x0a0000034912 000\
+00 n \x0a0000034933\
+ 00000 n \x0a000003\
+5190 00000 n \x0a00\
+00035209 00000 n\
+ \x0a0000036230 000\
+00 n \x0a0000036250\
+ 00000 n \x0a000003\
+6507 00000 n \x0a00\
+00036526 00000 n\
+ \x0a0000039236 000\
+00 n \x0a0000039257\
+ 00000 n \x0a000003\
+9514 00000 n \x0a00\
+00039533 00000 n\
+ \x0a0000043222 000\
+00 n \x0a0000043243\
+ 00000 n \x0a000004\
+3500 00000 n \x0a00\
+00043519 00000 n\
+ \x0a0000043717 000\
+00 n \x0a0000043922\
+ 00000 n \x0a000004\
+4127 00000 n \x0a00\
+00044326 00000 n\
+ \x0a0000044524 000\
+00 n \x0a0000044730\
+ 00000 n \x0a000004\
+5364 00000 n \x0a00\
+00048314 00000 n\
+ \x0a0000045030 000\
+00 n \x0a0000045295\
+ 00000 n \x0a000006\
+6192 00000 n \x0a00\
+00048335 00000 n\
+ \x0a0000050530 000\
+00 n \x0a0000050551\
+ 00000 n \x0a000005\
+0808 00000 n \x0a00\
+00050827 00000 n\
+ \x0a0000051385 000\
+00 n \x0a0000051405\
+ 00000 n \x0a000005\
+1662 00000 n \x0a00\
+00051681 00000 n\
+ \x0a0000053252 000\
+00 n \x0a0000053273\
+ 00000 n \x0a000005\
+3530 00000 n \x0a00\
+00053549 00000 n\
+ \x0a0000055520 000\
+00 n \x0a0000055541\
+ 00000 n \x0a000005\
+5798 00000 n \x0a00\
+00055817 00000 n\
+ \x0a0000057210 000\
+00 n \x0a0000057231\
+ 00000 n \x0a000005\
+7488 00000 n \x0a00\
+00057507 00000 n\
+ \x0a0000058660 000\
+00 n \x0a0000058680\
+ 00000 n \x0a000006\
+1499 00000 n \x0a00\
+00061520 00000 n\
+ \x0a0000062464 000\
+00 n \x0a0000062484\
+ 00000 n \x0a000006\
+2741 00000 n \x0a00\
+00062760 00000 n\
+ \x0a0000064028 000\
+00 n \x0a0000064049\
+ 00000 n \x0a000006\
+4306 00000 n \x0a00\
+00064325 00000 n\
+ \x0a0000064537 000\
+00 n \x0a0000064750\
+ 00000 n \x0a000006\
+4955 00000 n \x0a00\
+00065161 00000 n\
+ \x0a0000065374 000\
+00 n \x0a0000065587\
+ 00000 n \x0a000006\
+5793 00000 n \x0a00\
+00065999 00000 n\
+ \x0a0000066688 000\
+00 n \x0a0000069514\
+ 00000 n \x0a000006\
+6314 00000 n \x0a00\
+00066605 00000 n\
+ \x0a0000073593 000\
+00 n \x0a0000069535\
+ 00000 n \x0a000006\
+9854 00000 n \x0a00\
+00069874 00000 n\
+ \x0a0000070246 000\
+00 n \x0a0000070266\
+ 00000 n \x0a000007\
+0616 00000 n \x0a00\
+00070636 00000 n\
+ \x0a0000071067 000\
+00 n \x0a0000071087\
+ 00000 n \x0a000007\
+1548 00000 n \x0a00\
+00071569 00000 n\
+ \x0a0000072001 000\
+00 n \x0a0000072022\
+ 00000 n \x0a000007\
+2075 00000 n \x0a00\
+00072121 00000 n\
+ \x0a0000072174 000\
+00 n \x0a0000072227\
+ 00000 n \x0a000007\
+2280 00000 n \x0a00\
+00072472 00000 n\
+ \x0a0000073420 000\
+00 n \x0a0000072605\
+ 00000 n \x0a000007\
+2770 00000 n \x0a00\
+00072939 00000 n\
+ \x0a0000073132 000\
+00 n \x0a0000073281\
+ 00000 n \x0a000007\
+3486 00000 n \x0a00\
+00073976 00000 n\
+ \x0a0000078374 000\
+00 n \x0a0000073718\
+ 00000 n \x0a000007\
+3947 00000 n \x0a00\
+00078396 00000 n\
+ \x0a0000078664 000\
+00 n \x0a0000084111\
+ 00000 n \x0a000008\
+4561 00000 n \x0a00\
+00084089 00000 n\
+ \x0a0000085521 000\
+00 n \x0a0000085792\
+ 00000 n \x0a000009\
+2425 00000 n \x0a00\
+00092946 00000 n\
+ \x0a0000092403 000\
+00 n \x0atrailer\x0a<<\
+\x0a/Size 132\x0a/Info\
+ 1 0 R\x0a/Root 117\
+ 0 R\x0a>>\x0astartxre\
+f\x0a94140\x0a%%EOF\x0a\
+\x00\x00\x0d\xfe\
+(\
+\xb5/\xfd`YD\xa5o\x00*\xce\xb0\x1e*\xe0N\
+\x88\x92\x07\xab,\x85\x9f!\xc436h\x8f\x0b\xe8\xc8\
+\x8dk\x5c\xac\xa3Po\xdc%E\x08#\x9f\xb8\x0f\xd0\
+(c\x98af\xc8\xe0\x10K\x02\xc4\x01\xc4\x01M\x05\
+\xf2`8\xd4\xa3\xeb\xb2\xd3R\xca\xee\xbc=\xb2E\xb5\
+6B\xee\xdb\xe6\x97\xb7\xa91\x7f<\x13\xf6\xfei\xc6\
+\xc4\xab\xb9\xad\xb9F\xb7=\xf2\xf1\x92\xfe\x98\xefH\xc5\
+j]|t\xd7}9\x00\xe3\xc1\xba\x09\xd0T\x18\x90\
+\x8aB\x81\x12aL$h(\x13D\x1eh\x22\x984\
+\x94\x08\x85\x02\xa5\xf2\x88L\xd0\xc0\xdaw\xc2\xc4\xebO\
+\xcaeZ\x96\xb4|\x9f\xc8\xa3\xb5<\xa3P\xf8\x03P\
+(04\x13\x07\x84\xc67\xad\xad\x8bg\xfc\xf5\xc4\xcd\
+\xce\xce\xcc\xa6\x9a\xc2\x85\xcbcX\xad:\xc6\xabU\xfb\
+\xe6\xd8/r~\x15\x94\x09\x86\x04\x84\xd1h Xl\
+\x8e\xcb\xd5S..6\x06F\xa3*99\xf96\x11\
+Mol\x0cgx6l\xe1\x0bzx\xd4\xee[\xc7\
+B2\x12\xad\xba/\xb1\x18\xb3m\x15\xf3\x87u\xac\xe6\
+}\x95ok5>\xe3\xd9\xc9\xb0\xd0x\xdb\xef\xcea\
+m\xfc\xac_[c\xa1Y3~\x01\xc5PU\xe6x\
+)\xb6\xcc^VT\xcc\xd5P\x18\x18$\x8a#H\x0a\
+p\xbc\xd5.\x00\x84\x89\x04\x22i0\x90\x89\x0a\x05B\
+R\xa1(t\x0d\x1f\x0e\xc6d\x81\x09\xa3)c\xa30\
+4\x8eEB\x03\xa9<\x16\x8b\x82\x01\x08\xe4Q\x89`\
+\xf1xh&\x0d\xc4De\x91@@\xd3\xc0xx4\
+\xa80\x1e\x10\x1a\x8e\x08\xc9\x02\xc3\x82\x89\x84\x02\x84F\
+C\x81\x04 @0ccT\x18\x0eF\xa5yHh\
+@\x8d\x05\x8c\x07\x04\x1a\x12\x07B\xc5\xa1\xe1\xd18\xd8\
+\x96)\x14\x1c*\x8e\x87\xc4q\x9aM\x96E*\x84\xeb\
+\xd9\x14\x0a\x8e\xc7\x82\xd24\x18\x10\x94\xe6\x81\x11qT\
+\x1cTL\x02\x12$\xb0\xa84\x11j\x18\x9a\xc6$B\
+B!\x08\xc8\x03\x84EU\x19\xf3\x80Q\x89LP\x18\
+\xc6la\xb5\xe8\xee\x9f\x04\x83c\x12\x00%B\x89H\
+\x1e\x1e$\x8d\xc6\xc1\xa3\xd1P,N_P*\x91\xe6\
+\xa1\x814\x8b\x86\x032\x89\x80P(4\x1c\x08\x94\xc8\
+\xb2,\x0c\x1a\x1cP\x12\x180h\xc00\xcb\x00\x8b\x86\
+\x89\x84\x1e$!!\xb1X @T*\x0e\x02,\x0d\
+\x04\xa3A\xb1 \xc2\xc0\xe2PyH,\x8e\xa6\xc2h\
+&\x08,\x0c\x03@\x02\x83\x06\x06($\x11\x85B\x13\
+\x91@\x18\x8e\x08\xa3BY\x14\xcc( \xc1\x04\x0a\x85\
+\x86\xc8\xc3!iD\x9aEQt\x85BD\xf2\xa0L\
+\x1a\x07\x0b\xe4\xe1\x81\x01\x09\x01\x8f\x07\x8c\x87\x09f\x8e\
+\xa7F\xad\x8b\x99H\xac\xaaPx\xd0H{\x90H.\
+h(\x10\x06\xc3\xa4AB\xe2@a\xcb-\xb63\x91\
+\x87\x84)\x14$$\x0e\x86\x03\xa5q<\x22\x1c\x8fj\
+\x1a\x0dDR\xa9`A\xa2\x93\xc61\x91,04\x0d\
+\x0c\x08\x89\xe6\xe1\xc0\xb1H\xd0\xbd\xb4c\xa5+\xc5c\
+\xb9I\x8b\xf8\xf3\xd7]\xe5\xdd\xcc~\x07\xef\x9a\x9b~\
+\x8e\xdf\xfbc\xaa5k\xddk\xd2\xae;yIum\
+\x9c\xb9\xdc\x85\xc5\xca\x94\xaa\xfc\xb6\xd7\xfb\xcbd\x87w\
+\x9a\x8f\xa9-\xed\xb4\xf2\xfd\xe8\xdeV\xf7~\x98J?\
+X\xdd\xc6G7V}1RZ*'^S23\
+\xc7\xc8\xf8v\xb4*5\xfb\xee\x85\xfc\xb6\xba\xe2\xc6\xb2\
+_2\xde\x19\x19&\xea-ec\xda\xe9|E\xa52\
+\xb5\xaf\xf5\xed\xf9\xac\xafP_\x98\xd7Lw<\xab\xa7\
+\x94}cN3\xbe\xfb4\x11\xd9\xae\xad\xa9\x07\xf5\xdc\
+{\xf6\x9f\xf6\xb6\xf7He\xd5\xabX/\xe2\xac\x9fV\
+$n<k\xdd\x18\x99\x7f\xe3\xdb\xde\xb4\xda\xba\xd5\xd7\
+\x8e\xda\x10\x89\x8f\xfdf\xbb;\xb1\x1e\xcd;\xe95\x96\
+\xeem\xfdP\xbb\xac\xeeiz\xa7S\xdcf\xc2\xf3U\
+\x99\xdd\xad6\xa4\xcceN_\xed\x11\xfeg+\xf1\xf7\
+\x93\xb8\xacW\xad\xa5y2\xe6d[\xd5\xb2\xedeU\
+\x1d%\x83\x8c1\xca,\x96'\xdb\x00Z\xa9\xc4\xfa;\
+\x7f\xde\xc8\x8e\xcc\xe1\xaaj\xe3<\xe7\x9d\xd7\xb6\xef\xac\
+\xb6\xb0\xe9L_!\x93e!\x9d\xaaQ\xb2\xfd\xf0\xb1\
+H\x17\xef\x1c\xdf\x9a\xeb~M\xa4bN\xf25\x1e7\
+\xd5\xe9k\xe67]\x80\x07\x8fI\x85\xf1`lO\xda\
+w\xef\x19Sf2\xe2\x97\xfa\x9d\x8aE|v-\xae\
+\xe2\xddcN\xd5-\xea\x0a\xe3\xe1\xa0I\xc0\x11\x019\
+ \xc2xP(\x11\x8c\x05\x1a\x86\xdd\xbdIl\xc7L\
+Y\xfcs\xa6\xa6|ojf\xb9s\xd1\x959\xc7\xfc\
+#C\xb5\xd3\x99\xc5\xfa\xd9\xf4\xec\x1b\x1d\x99E\xeb\x0c\
+\xf1\x08\x8fY\x12y\xcf\x16\x9bn{\xcb\xa2+\xc5\xe4\
+\xa6\xece\x96\xd6+\xa1-\xe9Z\xbeYs\xcf\x94\xbd\
+\xd6\xc9\x85\xbdL\xa8\x8d\xc7t\x86]H\x87{~\xeb\
+!\x133\x9e9\xf6\xa6\xb6>$>\xe6\xe8\x1a\x127\
+\xd6)\x8f\xb8G\xbd?\xe4=\xd9\x7f0\xb5\x89qy\
+\xf75\xe5\x1e.\xa5\xbe\x853\xf1N\xe3\x9en\xbf\xd5\
+W\xb3\xd3\xfer+l:\xe6\xed\xben\xea\xd2\x1f\xd3\
+kbFf\xb5-\xb1\x97R\xfb(\x16\x12\xf2\xc2e\
+\xd9\xc4XuJ\xc3be\x8e5\xa6n\xed\xe9\xf4h\
+\xa4xH\x8bW[\xe2e^\xb2\xbd<_=U2\
+\x8b^\x9e\x8e\xf9\xb4\xf8f\x8a\xd1b\xe6\x5c\xfa\xed\xf5\
+\x8b\x1d\x13\x22[YS\xa2\xe9o\x8b\x0a\x7f\x1a\xaf\x88\
+\xcf,\xbf\xea%\xec\x83M\xff\xf2\xce/\x15\x1f\xcb#\
+\xdd;\xfbJy\xca{\x93\x0b\x1aH\xc4\xa4\x80\x01\xf0\
+V'\xdczR\xf1\xb5H\xad\x7f\xfao%\xce\xdb\x11\
+r\xd5\xd1\xe1\xbf8\xc0\xd6\x8c\xdb\x97T\x05\x0c\x10\x80\
+\x00\x90I\x04\xc2\x04c2a8\x10\xe1\x01\x994\x95\
+\xc7C%\x99!,\x5c\x1f\xa3\xb1@2\x89@\x18(\
+.Xp\x8b\xc9~\xaeoi\x99\xe5*OwN\xfa\
+\xb2\xaa\xa7>\xe7M\xc2\xd3C\xea\xde'SU/\x90\
+c\x1f\x122\x1b\xe9b\xbbv\xfa~t\xc5El?\
+\x8ay\xd4Z_\x1aX\x92\x8c\xb3\x9b\x92Y\xeeK\xca\
+\x9c+Lbf\xb9\x99\xd1\xad\xe8\x8d\x85\xd3\xde\xcaE\
+\xdb{f\xd9{S_\xff\xe4f\xd2\xb7\xbf<\x9c\xf9\
+\xb15 &$\x0e\x15\x06\x84\x82U\xaf\xa1\xe1\x81d\
+a\x81\x89\xa0L\x9a\x09\x06\x84\x99L\x22\xde\x5c\xf0x\
+\x08\x0c\x1a48\xa0,\x12\x184hX$\xf4\x8f\x91\
+\xee\xb8\x93\xde\xb7\xac\x9eQ\x1bs\x12\xb1\x09\x17\xd1\xce\
+m\x0b\xe9\xd4\xb2\xac\x88\xff\xf3E\xa3CL:\x1f\xce\
+/\xe5\x96\x92\xf21k\xa6e\xbeI\xd5\xf5\x83\x8dE\
+7Fo\xcbM}\x5cYt\xdc\xdctw\xf2w\xd2\
+E\xef\x9a\x94\x99\xff\xc3\xdd\xdb\xb8L\xc5\x8bjG\xdd\
+\xbc\xbc5\x89\xaf\xc8r1\xbb$L\xb4\xa4\xb4<a\
+uQ\xe9\xb9Ov;\x1f\xb7\xa9\xff\xd3\xc7G\x9a\xc5\
+\xf4c\xe5$N\xdb\x13\xfe\x98\xb3\xc7J\xa7\xfb\xc3\xa4\
+\xe3\xd9\xfdQ\xd9r\x9cvR+\xe9_\xfaf\xd4\x07\
+\xd5\x9a\xee\x8b\xde\x22\xe9O\xdeO\x8aK\xe2-\xe1-\
+\xe72\xca\xb3\xd8J\xf6\xe5\xf04\x1a\x13\xf3r\xddF\
+k\x87\xb3N\xad\xcbU7\x13\xa97\xcf\x0e2\xe7\xa2\
+|Gf\xa5\xc7\xe5\xa6\xba*2u\x7f\x11\xf3I\xcb\
+\xb6\xda\xd4\xba\xfb\xda\x9f\xd2\xd5\xb2G\xd7\x8e\xea_~\
+y\xaa\xf3\xe3*:\xd4/\xa8\xccdhT\xb9da\
+\xa7qS\xe7\xa5i\x22m\xdd\xe9S%\xc6]\xf4\xd8\
+\xf4\xfe9\x9a.\xd5\xe2\xb2\xfa\xa5\xc5\xee\x94zQ\x95\
+\x09\xf7\xca\xa8E\x8c\x9dH\xa9\xabL\xa6\x0c3\xd57\
+fr\xcb\x8c\x16O\xeb\xb8y\xd4\x8dL\xc6\xb9\x1c\xf3\
+\x11\xffd\x9f\xad[\xc9\xf4\x8em!1\xddXGz\
+3#)\x1ffj=\xa6\xfb\xb9\xce\x93\x9eY\xb2\x0c\
+I\x8b)oYc#>}d*[\xb0rI\xcf\
+\x8d\x91\x163\x8dm\xc9pY\x91yv\xe2\x5cE'\
+\x13\x9aF\x9a\x06SA\xdb\xbcKB\xbeZ.Y~\
+\x93\xce\xf2p\xdbQ\xe6r\xbe\xa2\xbe\xb3\x19\xd2\xf6-\
+\xb9X\x94\xa5j\x94\xb8\xcb\x04\x82\xb3\xa8Bj\xa2D\
+!(\x19##\x223\x93$\xe9\xc29\x86\x81i\x10\
+\x84z\xac<2\x894CA\x10\x85 \x0c\xc7\x18C\
+\x08\x22\xc4\x10\x22 \x84(\x22D\x06\x111!1u\
+c\x08\x93\xe3\x83t\xce\x1c\x17\x19 \xb7\xce\x8e\x15\xea\
+\xfb\xfa\xd8;r=h\x92\xed\xf1\x85\x12%aO\x0d\
+;\x995\xc0\xabK\x8d\xff\x83\x00h\xabeD\x895\
+\x9c\xf2\xbc\x1e\x10\xe6\xb9w\x0c\x8f\xd9\xd6k\x93\x93#\
+,\xc7l\x96O\xef\x96\x0e\x8d\xd2\xe8p\xf6\xd0\xa1\xb1\
+\xd0s\xb8J\xd494\xc3\x87\x06)*:\xcco\xf7\
+;\xb3\xa6\xaf\xf4\x0e\xc5\x09\xc9\xa8^\x1d.\x10\xbde\
+\x17\xfa\xc7\xe8\x05x\xa5\xaf\xb2\x9d,`\xe6\xa5w\xee\
+\xb6\xe2\x22A{\xa9\x09^<\xa4x\xaa\xec\x1f\x06?\
+\xe5\x1eZI\x89\x94\xd4\x15\x01D\x89\xcb\x13oF1\
+\x12\x07\xa6C\xbf\xda;\xd1\x83\xba#\xf4k\xdc\xf4\xda\
+\xd4\xa7q\x16axk\xde6#c`\xd8\xcd\x97\xfa\
+{\xb1\x17\x1a!bAx\xc4\x97\xf3Ge\xb1\xec\xc8\
+j9\xc8dc|\xb2R\xfa>B\xa1G\xc3\xa9\x1d\
+\x8b\x8a\xe4\x8b\x00E]\x8d8,8(\xe1\xdegD\
+MpN%y\x95\xc2\x97\xcc\xc9\xc3kw\xd0\x00>\
+\xe8\xe0\xaa\x80\xc1\x09P29P\xa4y'A\xe6%\
+6\xce\xb1\x1cT\x86\x81\x1b\xc2d>\xa7X\xc7\x8er\
+'l\xa6-\xd9\x1a\xf8\x03iN\x02\xebc?\x03]\
+\xd0`:\xca\x8b\xff\xd7dBl\xc7\x11\xd2y\xd3\xc4\
+7\x89\xb3@\xd9\x00\xe9\x1d\x92\xba\xa6c\xcavzm\
+\xa6\xba\x88\x9dF\xc4Ue|\xa5\xa8\x94\x14\xab\xe5k\
+\x92\x02\x9b\x044=\x03$C\x85W\x03r\xab\xa9\x00\
+\x81\xb1\xb0\x88\xdc\x01Z:\x06\xa1\xbf\xa3h\xb1\xdc\xbe\
+\x9a\x1f\xf6\x03\xf7w\xbch\xc6$s\x1f0\x92\x18O\
+\x85P\xf0\xa4je6E\xc4\xa4\xfe\x7f\x83:Q1\
+.\x12\xb8G\xba\x8c\x0b\x07?\xf0\x81\x9dc\xddD\xb4\
+M\xa3P\xba]/J\xa1\xbe&\xc8+\x96SoJ\
+\x19\xd97\xd36\x9e\xa9e\x0b\xb4a'^\xf1\xa7(\
+\xff\xc4\x92kU\xbe\x14=\xb5\xa4\x88\x97\x97H\xd9\x7f\
+\x1bK\x81\x8b\xb2[\xd7\xba\x18\xd3\xe0\xf9o\xb3F\x1c\
+3\xc5\x84\x80\xd3\xb0\x19\x7f\xdb\xfe\x16\x1b\xe0\x88\xbc\xf3\
+-xT\x18\x87\x85p\xbf\xa2\x0d?\xfb\x9bE\xdb\xcf\
+;}aO-<\xf5\x87\xad\xf6\xfc.\x9f\x88+\xdc\
+\xabl]]\xf7B<\xccO\x85\xfaq\xa2\x99\x91\xe9\
+\xc9u\x83\x90iNb\xab\xc3X\xac\xb8\xdc0I;\
+X\xc5\x1fE\x00$e\x81\x8b\xe1\x19'\xa6a\x8dp\
+\x95\xc6\xeb\x95\xba\x8a\x1e\x5c\xcf\x91l&0\xcdi)\
+\x013>\xc2\xd1\x5c\x17\xde\xbd\x13\x8a\x18\xae\xe3\xf0\x8e\
+\x84\x17\xa2\xdf\xff\x8e\x22\x9b(\xac\xb9\x0bc\xe6XY\
+*\x96\xff\xde\xee\xb6\xa6\xfc\xad\x1f\xd50E\x9cVy\
+U|\x82Q\xda\xede\x9dxl\x92-8\xdfT\x89\
+^i?tC\x1aq\xc7\xea\x9b\x85\xfbpa5\xe7\
+\x97\x07\xc4_\xa8t\x96BQ\x8d[\x9a\xc4\x82\xed6\
+]\xc0\xde\xa2r\x0d1T\x1b8\xf7\x11\x5c\x05\xb7-\
+f\xcc\xe2~\xa2 a\x11v\xfe\xf3.[\x07]\xb8\
+\xa7\x96[|jAY9'\xaa\xfe/\x5c,;\xcc\
+\xa2\xfas\x0fX$\xbf\xe5\xdd\x13V&\xfc\x17o\x80\
+\xf58\xc3&\xd4\x98ZW\xe6\xa0Zs\x90f\xce\xb1\
+.\x1b\xc1\x90`\xccu\xfa\xcf0\x06\x08i\x9aWY\
+8\xacIq\xc4\xfb\x9f\xdf\x83\xe1v\xb5\xb7Y\x88\x89\
+\x85\xc7\x01)\x14EX\xc4O`\xe6j\x85\x05]]\
+\x8e\xccl'\xe6,\x9f\xc1\x8c\xd3\xfe\xee\x9c\x8c\xb2I\
+\xf4*O\x9d \xcf<\x0e\x8a\x04}P\x0c\x89\xb3l\
+m\x00\xb2\xe7Ir\xe9|\xd7YI\xaco,\x96\xb9\
+Q\x84\xb1F\x13\xa1X\xb0\xb9:\x16\x84\x1al\x81\xd1\
+F\x06\x9cJ\xcf\x07\xa8\xc4v\xaa\x9cQ\xbc\xa4\x15\x80\
+\x85s\x98\xb6J$\x1c\x029\xe3\xd3\xed\x80\xa8\xaf\x01\
+\x9a\xda\xaf_\x082i\xc2]\xa8\x9b\xa0%\xeb2\xc1\
+\xdb\xbf\x04\xfd\x8bJ\xb05\x12R\xf9DRR\x01\xfe\
+\xc8\xc4\xf2+\xfd\xe9\xe8\xfe\xa7+r\xd6\xeb\xfe\xd0\xb6\
+D\x1f\xe5\x1f0(\x0e\xc8\x80X\xad\x22\x00\x5c\x81\xa1\
+\x87\xdb\xc7;\x8f\x026[\x8e\xe3\xe2\x02\x98\xa3\x82\xbd\
+ml\x9a\xe41o0^\xf0bDQSz\xea\xa2\
+\x90Z\x00z:\xb4\xacN\xf8&\xb67\xf0\x84\x14\x98\
+\xdf\x22\x0b\xb2\x99;C\x97\x9a\xf9a\x82Q\xc8\x83|\
+\xbd\xd8\x1a&\x9eo\xc6\xc9~S\x84Q\x85\x91\x1fp\
+\xe6\xb7;\xe6-\xfd5\xa1\x9f-\xabe\xdau\xae\xaf\
+\xf7a\x19Z\xd8?\xbe\xd5\xa7,X\xeb\xcd\x8eB\xf5\
+\x8ed\x18\xe1\xbe'\xba\xb2j\x07c\x11\x86^\x19\x8d\
+\xe9\x85\xb0\x0f\xb2\xc4H \xc2\xc8<\x82\xdd\x85\x09\x01\
+7\x0aI\x0eRh\xaf\x1cX\xb7\xa9j\x12q\x22^\
+Wa1\xfe\xad\xc5h\x8c\xa2|\x90.\xac\xc0\xf6u\
+\x87\xdf\xd4HD/\x96IM\x0c\xbf\xa7\xf9\xd8!\xd6\
+\xe8\xd9,\xc0YU\xed\x00\x14\xca\x9d'kCd\xf3\
+\xdcF\x1a[\xdbL\xee\x01\xc3\x90\x12I\xd2Pc\x1c\
+\xe3\x0b\x1c(f\xd9\xf8\x5c\x08awH\xbc\x99,\xc9\
+ \xb5\xae1N\x12\xa8@\xd0u~^\xb1^\xc37\
+\xbe}\x96\xa5\x86xy\xaa y\xfd\x81\xa4c64\
+\xa9`jYW\x9e\xa0\x05S\xdb\xfb+P~\xca8\
+1\xef\x06gU0\xe3\xa4\xc5f\xe0U~\x15e\xe6\
+,W\xa9g\xd0\xb7\x95\x82\xf9HD\xe7J\xd3Bg\
+&\xd8\xbffv\xe7\xba\x9f\xb9F\xca@\xca\x86\x04\x8e\
+0d\x03T\xddsT\x12\x5c\xb7\x17\xcbZ,\xb0\xc9\
+\xc6\x9c\xe9\xc0=C\x84\xc4\xebb'\xf3;=\xf0x\
+\xf7\xa3\x15\xbe\xa6\x93\x1e\xa7\x98\x1c\x0c\x04\x1bqL\x86\
+3\x03b\xb0\x040\xd2\xd2JX%\xd8\x04\xb8aa\
+m\x8cn\xc1\xb6\xe8\xaf\xb1\x0c\x9e\x0cUMP\x0a\x03\
+\xe6#\x03\xd0a\xe4l\x17J\x1e-\xc7;H\xff\x9c\
+\xd8\x11G\xcb\x96q\x22\x82\x8d\xa3\xa4X\xe7\x99\xf5\xc5\
+\x96\xa2w*\x84\xc3<l\xa9|.\x12\xa3\xcbW\xd1\
+%\x8e\xcaUp\xaf\xb52B%e=b\xba\x11\x11\
+\xf1\xdf@x\xb3\x14\xb4d\x90\x0bt\x01WN#P\
+}\xc7\x8d\x9eCC\xf0\x06A\x018\xd0\x16\xd0\x03D\
+\x9c\x83e'\xcb\xdbD\x7f\x0a\xb2N5\xe4\xf1\xac\xb0\
+\x85\xf2\x13!1~:\x905\xe9)\x06\xb0dw\x95\
+\xe5\xccb\x8a~\x01\xfbI\xf4\x87cO+\
+\x00\x00\x01`\
+(\
+\xb5/\xfd`U\x0b\xb5\x0a\x00vS6\x18`w\x0e\
+LS\x9f\xd5\x9fE\x06!%u\x06\x95F\xb6\xa2\xf3\
+\xb49\x8a\x82K5\x00.\x00+\x00\x94\x818\x80\x99\
+!\xe0T\xd3\x8b\xd9\xcb\xb2\x0c\x00\x0a\xea\xba\xa6;,\
+\x09\x8a\xb4y1O\xa6\x0e\xf6\x95\xb5\xd7\x1d\xda\x94d\
+\xcd\x83\xa9\xbb(\xd8w\xc75\x9d\xa7\x99\xea`\x96\x11\
+\xbc\xbc[\x1fm\xbb\xbb\xfb\xa8\x0b\xc3\xf9\xa8\xca\x0bK\
+\xecq\x89\x86\x04!\xbc\xb7>.k\xcb\x819>\xa2\
+wa\xb8\x13\x0aQOt\xe4\x0eF\xe7\xa5\x04\xef\x0d\
+\x02\x19\xf4\xf0\x84\x15\xde\x97\xf0\xc9\xe5\xe5\xdc\x8b\xbdw\
+B\x19\xe8\x07\xc0\xb1\xb2\xeau\xaf\xfb\xfd\xb2^\xbfW\
+)\x1b\x06\xf0\xc1\x85\x1f\x1e\xd4\x88\x83Y\xc0\xe3\x100\
+l}C\xd6\x9f\x08bl\x8e\xfa\xa1e\xeb\x89~\x1c\
+\x82\xdd\xb7.,\xbcw2\x81\xbd\xe7[\xad\xb7\xea{\
+Y\x17\x8e;\x03/ @\x0a\x05\xb2\x8c\x0eR\xa00\
+\x06\x80\xa8\xd8z)S\xf1?\x95l1\x855\xa0b\
+\xabR\xa5\xc2U\xb3\x15\x90\x14\xd6\x08\x10\x15\xc5\x96\x04\
+\x893\x08\xae\xc9\x90\xca6\xec\x8cH<\x86 \x04i\
+\xca\xa0\xa2m\x18Od\x86\xfa\x01\xecc\xbb\xd7ZS\
+k\xf3 \x0ck`F\x06\xb9\x10\x10\x01^\x0d\xcb9\
+P?\xc09~.\x86,\x10\x81\x8b\xca\xc9\x11\x86x\
+\x8ch\x83\xc3\xc2\x0c\x01\xd0,p(e*\xe0O\
+\x00\x00\x1a\x80\
+<\
+svg height=\x22511p\
+t\x22 viewBox=\x220 -1\
+ 511.99923 511\x22 \
+width=\x22511pt\x22 xm\
+lns=\x22http://www.\
+w3.org/2000/svg\x22\
+><path d=\x22m282.6\
+71875 289.46875 \
+139.285156 139.2\
+85156c1.464844 1\
+.464844 3.386719\
+ 2.195313 5.3046\
+88 2.195313s3.83\
+9843-.730469 5.3\
+00781-2.195313c2\
+.929688-2.929687\
+ 2.929688-7.6757\
+81 0-10.605468l-\
+139.285156-139.2\
+85157c-2.929688-\
+2.929687-7.67968\
+8-2.929687-10.60\
+5469 0-2.929687 \
+2.929688-2.92968\
+7 7.675781 0 10.\
+605469zm0 0\x22/><p\
+ath d=\x22m163.4609\
+38 159.652344c-2\
+.929688 2.929687\
+-2.929688 7.6757\
+81 0 10.605468l3\
+7.621093 37.6210\
+94c1.464844 1.46\
+4844 3.382813 2.\
+195313 5.304688 \
+2.195313 1.91796\
+9 0 3.835937-.73\
+0469 5.300781-2.\
+195313 2.929688-\
+2.929687 2.92968\
+8-7.675781 0-10.\
+605468l-37.62109\
+4-37.621094c-2.9\
+29687-2.929688-7\
+.675781-2.929688\
+-10.605468 0zm0 \
+0\x22/><path d=\x22m25\
+2.175781 290.394\
+531 120.796875-1\
+33.6875 8.988282\
+ 8.070313c2.5898\
+43 2.320312 5.83\
+5937 3.464844 9.\
+070312 3.464844 \
+3.714844 0 7.417\
+969-1.507813 10.\
+09375-4.46875l2.\
+375-2.628907 8.4\
+53125 7.636719-3\
+.355469 3.710938\
+c-3.664062 4.054\
+687-5.527344 9.2\
+89062-5.25 14.74\
+6093.277344 5.45\
+3125 2.660156 10\
+.476563 6.710938\
+ 14.136719l20.36\
+3281 18.398438c3\
+.789063 3.425781\
+ 8.613281 5.2773\
+43 13.683594 5.2\
+77343.351562 0 .\
+707031-.007812 1\
+.058593-.027343 \
+5.457032-.273438\
+ 10.476563-2.660\
+157 14.140626-6.\
+710938l45.191406\
+-50.019531c7.558\
+594-8.367188 6.9\
+02344-21.320313-\
+1.460938-28.8828\
+13l-20.363281-18\
+.398437c-4.05078\
+1-3.660157-9.285\
+156-5.519531-14.\
+742187-5.25-5.17\
+9688.261719-9.96\
+875 2.425781-13.\
+578126 6.113281l\
+-8.460937-7.6445\
+31 3.050781-3.38\
+2813c5.023438-5.\
+554687 4.589844-\
+14.164062-.96484\
+4-19.191406l-67.\
+679687-61.234375\
+v-.003906c-18.37\
+1094-16.597657-4\
+2.332031-27.0390\
+63-67.46875-29.4\
+0625-25.058594-2\
+.359375-48.61328\
+1 3.480469-66.32\
+8125 16.429687-4\
+.449219 3.25-6.4\
+88281 8.8125-5.1\
+99219 14.167969 \
+1.292969 5.35546\
+9 5.644531 9.375\
+ 11.085938 10.23\
+8281 51.265625 8\
+.148438 65.1875 \
+24.664063 68.792\
+969 31.386719 3.\
+644531 6.796875 \
+3.410156 14.4960\
+94-.71875 23.531\
+25-1.859376 4.07\
+4219-1.589844 8.\
+648437.527343 12\
+.363281l-121.097\
+656 134.027344c-\
+6.210937-3.5625-\
+14.292969-2.4570\
+31-19.285156 3.0\
+625l-8.984375 9.\
+945312c-5.019532\
+ 5.554688-5.2734\
+38 13.773438-1.0\
+23438 19.597657l\
+-31.285156 22.12\
+8906c-.046875.03\
+5156-.09375.0664\
+06-.140625.10156\
+3-12.59375 9.343\
+75-24.3125 19.98\
+0468-34.824219 3\
+1.617187l-89.675\
+781 99.246094c-1\
+7.804687 19.7031\
+25-16.257813 50.\
+21875 3.445313 6\
+8.023437 8.92578\
+1 8.066406 20.28\
+9062 12.429688 3\
+2.230468 12.4296\
+88.828125 0 1.66\
+0156-.019532 2.4\
+96094-.0625 12.8\
+47656-.648438 24\
+.671875-6.265625\
+ 33.296875-15.81\
+25l89.679687-99.\
+246094c10.511719\
+-11.632812 19.91\
+0157-24.367188 2\
+7.933594-37.8437\
+5.027344-.046875\
+.058594-.097656.\
+085938-.144531l1\
+8.851562-33.3632\
+81c2.363282 1.39\
+0624 5.050782 2.\
+125 7.839844 2.1\
+25.265625 0 .535\
+156-.007813.8046\
+88-.019532 4.148\
+437-.210937 7.96\
+875-2.023437 10.\
+753906-5.105468l\
+8.984375-9.94531\
+3c2.785156-3.082\
+031 4.203125-7.0\
+625 3.992187-11.\
+214844-.152344-3\
+.027343-1.160156\
+-5.878906-2.8906\
+25-8.28125zm-10.\
+894531-10.316406\
+-30.023438-27.12\
+8906 120.429688-\
+133.285157 30.11\
+7188 27.027344zm\
+227.40625-149.33\
+2031c1.457031-.0\
+70313 2.847656.4\
+21875 3.929688 1\
+.398437l20.35937\
+4 18.394531c2.23\
+0469 2.015626 2.\
+40625 5.46875.39\
+0626 7.695313l-4\
+5.191407 50.0195\
+31c-.976562 1.07\
+8125-2.316406 1.\
+714844-3.769531 \
+1.789063-1.44921\
+9.074219-2.84765\
+6-.425781-3.9257\
+81-1.398438l-20.\
+363281-18.398437\
+c-2.230469-2.015\
+625-2.40625-5.46\
+4844-.390626-7.6\
+95313l45.195313-\
+50.015625c.97656\
+3-1.082031 2.312\
+5-1.714844 3.765\
+625-1.789062zm-2\
+4.402344 2.25-22\
+.273437 24.65625\
+-8.453125-7.6367\
+19 22.277344-24.\
+65625zm-186.1132\
+81-105.394532c31\
+.203125-20.34765\
+6 80.648437-14.4\
+375 112.0625 13.\
+941407l66.636719\
+ 60.292969-45.93\
+3594 50.839843-5\
+6.410156-50.6171\
+87c5.703125-13.0\
+42969 5.664062-2\
+5.121094-.128906\
+-35.917969-12.87\
+1094-23.996094-5\
+1.863282-34.3320\
+31-76.226563-38.\
+539063zm-67.3476\
+56 321.140626c-7\
+.511719 12.60156\
+2-16.304688 24.5\
+07812-26.136719 \
+35.386718l-89.67\
+5781 99.246094c-\
+5.9375 6.574219-\
+14.082031 10.441\
+406-22.929688 10\
+.890625-8.847656\
+.449219-17.33593\
+7-2.578125-23.91\
+0156-8.515625-6.\
+570313-5.9375-10\
+.4375-14.082031-\
+10.882813-22.925\
+781-.449218-8.84\
+7657 2.574219-17\
+.339844 8.511719\
+-23.910157l89.67\
+9688-99.25c9.832\
+031-10.878906 20\
+.785156-20.82812\
+4 32.5625-29.574\
+218l33.691406-23\
+.828125 29.38671\
+9 26.554687zm49.\
+117187-48.910157\
+-8.984375 9.9453\
+13c-.035156.0429\
+68-.152343.16796\
+8-.382812.179687\
+-.230469-.011719\
+-.355469-.101562\
+-.394531-.140625\
+l-47.386719-42.8\
+125c-.226563-.20\
+7031-.242188-.55\
+8594-.039063-.78\
+125l8.984375-9.9\
+45312c.207031-.2\
+26563.554688-.24\
+2188.78125-.0390\
+63l47.382813 42.\
+816407c.042968.0\
+35156.171875.152\
+343.183594.37890\
+6.011718.230468-\
+.105469.359375-.\
+144532.398437zm0\
+ 0\x22/><path d=\x22m3\
+3.710938 164.402\
+344c19.496093 15\
+.773437 45.78906\
+2 22.316406 72.1\
+32812 17.957031 \
+10.785156-1.7890\
+63 21.964844 1.8\
+86719 29.902344 \
+9.824219l35.1289\
+06 35.125c1.4609\
+38 1.464844 3.38\
+2812 2.195312 5.\
+300781 2.195312 \
+1.921875 0 3.839\
+844-.730468 5.30\
+4688-2.195312 2.\
+929687-2.929688 \
+2.929687-7.67968\
+8 0-10.609375l-3\
+5.125-35.125c-11\
+.355469-11.35156\
+3-27.414063-16.5\
+89844-42.960938-\
+14.015625-22.121\
+093 3.664062-44.\
+082031-1.738282-\
+60.25-14.820313-\
+18.445312-14.921\
+875-28.800781-37\
+.625-28.113281-6\
+1.265625l45.2304\
+69 36.59375c12.6\
+25 10.214844 31.\
+203125 8.253906 \
+41.410156-4.3710\
+94l20.777344-25.\
+675781c4.945312-\
+6.117187 7.21484\
+3-13.789062 6.39\
+0625-21.609375-.\
+824219-7.824218-\
+4.648438-14.8554\
+68-10.761719-19.\
+800781l-45.23437\
+5-36.597656c24.0\
+50781-5.886719 4\
+9.257812.199219 \
+68.027344 16.585\
+937 16.503906 14\
+.410156 25.44531\
+2 36.378906 24.5\
+27344 60.273438-\
+.542969 14.21484\
+4 4.761718 27.98\
+4375 14.554687 3\
+7.78125l45.85937\
+5 45.859375c2.92\
+9688 2.925781 7.\
+675781 2.925781 \
+10.605469 0 2.92\
+9687-2.929688 2.\
+929687-7.679688 \
+0-10.609375l-45.\
+859375-45.855469\
+c-6.847656-6.851\
+563-10.554688-16\
+.546875-10.16796\
+9-26.601563 1.08\
+9844-28.445312-9\
+.71875-54.742187\
+-29.65625-72.148\
+437-23.46875-20.\
+488281-55.347656\
+-27.53125-85.273\
+437-18.832031-4.\
+765626 1.382812-\
+8.332032 5.26953\
+1-9.3125 10.1406\
+25-.984376 4.875\
+.808593 9.847656\
+ 4.671874 12.976\
+562l47.820313 38\
+.6875c3 2.425781\
+ 4.875 5.875 5.2\
+8125 9.714844.40\
+625 3.835937-.70\
+7031 7.601563-3.\
+136719 10.601563\
+l-20.773437 25.6\
+79687c-5.011719 \
+6.1875-14.121094\
+ 7.152344-20.312\
+5 2.140625l-47.8\
+16407-38.6875c-3\
+.867187-3.128906\
+-9.109374-3.8398\
+44-13.679687-1.8\
+63281-4.550781 1\
+.976562-7.601563\
+ 6.265625-7.9609\
+37 11.207031-2.1\
+67969 29.71875 1\
+0.34375 58.62890\
+6 33.46875 77.33\
+9844zm0 0\x22/><pat\
+h d=\x22m499.289062\
+ 432.773438-181.\
+28125-181.28125c\
+-2.929687-2.9257\
+82-7.679687-2.92\
+5782-10.605468 0\
+-2.929688 2.9296\
+87-2.929688 7.67\
+9687 0 10.609374\
+l181.28125 181.2\
+77344c11.097656 \
+11.101563 11.097\
+656 29.164063 0 \
+40.261719-11.101\
+563 11.097656-29\
+.160156 11.10546\
+9-40.253906.0039\
+06l-170.898438-1\
+70.894531c-2.929\
+688-2.929688-7.6\
+79688-2.929688-1\
+0.609375 0-2.925\
+781 2.929688-2.9\
+25781 7.675781 0\
+ 10.605469l170.8\
+98437 170.898437\
+c8.472657 8.4726\
+56 19.601563 12.\
+707032 30.730469\
+ 12.707032 11.12\
+8907 0 22.265625\
+-4.238282 30.738\
+281-12.714844 16\
+.945313-16.94531\
+3 16.945313-44.5\
+23438 0-61.47265\
+6zm0 0\x22/></svg>\
+\x00\x00\x05p\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Capa_1\x22 xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22 xm\
+lns:xlink=\x22http:\
+//www.w3.org/199\
+9/xlink\x22 x=\x220px\x22\
+ y=\x220px\x22\x0d\x0a\x09 view\
+Box=\x220 0 455.111\
+ 455.111\x22 style=\
+\x22enable-backgrou\
+nd:new 0 0 455.1\
+11 455.111;\x22 xml\
+:space=\x22preserve\
+\x22>\x0d\x0a<circle styl\
+e=\x22fill:#E24C4B;\
+\x22 cx=\x22227.556\x22 c\
+y=\x22227.556\x22 r=\x222\
+27.556\x22/>\x0d\x0a<path\
+ style=\x22fill:#D1\
+403F;\x22 d=\x22M455.1\
+11,227.556c0,125\
+.156-102.4,227.5\
+56-227.556,227.5\
+56c-72.533,0-136\
+.533-32.711-177.\
+778-85.333\x0d\x0a\x09c38\
+.4,31.289,88.178\
+,49.778,142.222,\
+49.778c125.156,0\
+,227.556-102.4,2\
+27.556-227.556c0\
+-54.044-18.489-1\
+03.822-49.778-14\
+2.222\x0d\x0a\x09C422.4,9\
+1.022,455.111,15\
+5.022,455.111,22\
+7.556z\x22/>\x0d\x0a<path\
+ style=\x22fill:#FF\
+FFFF;\x22 d=\x22M331.3\
+78,331.378c-8.53\
+3,8.533-22.756,8\
+.533-31.289,0l-7\
+2.533-72.533l-72\
+.533,72.533\x0d\x0a\x09c-\
+8.533,8.533-22.7\
+56,8.533-31.289,\
+0c-8.533-8.533-8\
+.533-22.756,0-31\
+.289l72.533-72.5\
+33l-72.533-72.53\
+3\x0d\x0a\x09c-8.533-8.53\
+3-8.533-22.756,0\
+-31.289c8.533-8.\
+533,22.756-8.533\
+,31.289,0l72.533\
+,72.533l72.533-7\
+2.533\x0d\x0a\x09c8.533-8\
+.533,22.756-8.53\
+3,31.289,0c8.533\
+,8.533,8.533,22.\
+756,0,31.289l-72\
+.533,72.533l72.5\
+33,72.533\x0d\x0a\x09C339\
+.911,308.622,339\
+.911,322.844,331\
+.378,331.378z\x22/>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a</svg>\x0d\x0a\
+\x00\x00\x06\xff\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x06\x8cID\
+ATX\x85\xedWklS\xe7\x19~\xcew\x8e/\
+\xb1\xe3\xfb\xb1c\xec8\x8e\x89\xb1K\x9c\x045d\xb4\
+\x1d\x97\xd1\x8a\xa4I\x97vRU*\xad\xd3\xf6\xa3h\
+B\xab&u[\xb5\xa2i?\xa6u\xd3\xfe\x0ci\xfb\
+\xd1\x1f\xd3\xd4RmHL\xed\xc4\xe8\xc4\xa0l\x15m\
+\xd3P\x1c\x12R\x12B.\x04\x12\xe7fc\x8c\xed\xf8\
+z\xecc\x9f\xcb~d\x09\x0d1`\x22\xed\xd7\xf6\xfc\
+\xfb\xce{\xf9\x9e\xefy\xdf\xf7\xd3w\x80\xffu\xd0\x9b\
+\x8c#\x1a\x8d\xa5C\xa7c\xf7*\x95\xda\x1a\x9e\xcf\xdd\
+\xda,\x01\xea\x11\xfd\x15\x1e\xcf\x9e#\x16\x8b\xeb\xa0\xd5\
+\xeamV\xab\xf5L\xb1\x98\x91\xe2\xf1\xd9\x89x|\xf6\
+\xcf\xa1P\xf0(\x00\xf9\xbfB\xc0lv\xd6;\x9d\xed\
+\xc7\x9b\x9a\xf6\xec'd\xa3p\x82\xc0\xcb\xd3\xd3\x9f|\
+85u\xfe\xdb\x00\xf8j\xf3V]\x02\x97\xebk\xef\
+\xed\x08\xd8{\xda\xfc\xb7\xb0\xab-\x0a\x7f\xe3<\x5c\xf6\
+\x08j\x14Q\xa4\xd2I\x88\xb2\x8d\xb2\xd9\xb6m\xe7\xb8\
+4\x9bN\x87\xcfT\x9b\xb7j\x05\xde\xf8A\xd7\xf4\xaf\
+\xdf\xf4n\xa3\xe9\x8d!eA\xc2_>\x8c\xe1\x9f\xfd\
+FLL\xc7\xa0TjB\xa9T\xf8X(t\xe1\xb7\
+x\x88\x1aU+\xd0\xdb\xd5\xf2\xc3=\xbb\x0c\x96\x8aI\
+\x08\x85\x1d\xcd\xb5x\xea\xf1\x12\xce\xf5\x11Xm\xad&\
+\xa7\xb3\xf9\x19\xad\xd6\xd8Y.\xcb_r\x5c\xfc\xbeM\
+Z\x0d\x01\xf5\xcf\x7f\xfa\xb3\x1f\x11\xa6\xb6\xb7 \xb5\xa8\
+\x96\xe2>\x5c\x9fs\xe2\xc6\xa2\x13\xe3\xb3V\xdcXd\
+\xf1\xc5p\x0anG\x11\xcbi\x1e\xb2\x10\x06\xa1\xf2H\
+eT0[|\xf5\x1a\x8d\xa1\x9b\xa2\x84\xc1t:\xba\
+X)9\xf3\xd5\xc5\xd6\xad{z\x01\xf9\xdd-[\x9a\
+\xf3j5\xe1\xec6\x95K\x14\xb3\xba\x86\x06/u\xe0\
+\xe9\xdd0\x1a\x0c\x15\x19\xf6\x07/\xe2\xcaL\x1a\x97/\
+}\x80\xef\xbf\xb4\x05&\xd6\x8c/\xc7\x96\xf0\xa7\x93\xb3\
+\x10\x84\xc7\xdd\x82\xc0\x1f\xcbf\xb3\x9d\xc9\xe4\xcc\x06\x12\
+k\x05\xf5x\x9e\xe84\x9b\xfdgh\x9aR\xd4\xd7\xb7\
+\xaes\x92$\x11\xe5R\x0cNG-\xb6\xba\xcdx\xf1\
+\x85NX\xcc\xa65\xfb\xc5\xc1\x01twwcrj\
+\x0cc\x83\x7f\xc0\xb7\xba\x94P*h\xc82\xf0\xd6\xef\
+\x97\xd0?\xec\xcc\x0d\x0d\xbd\xffX\xa1\x90\x08\xdfK\x80\
+\x06\x00\x83\xa1\xc1TW\xd72`0\xb8jD\x91\x83\
+Ng[\xcf\x92\x22`\x18\x1d\xb8\x82\x0a\xe1\xa8\x88\x8f\
+>\x0eb|r\x0c\xac\xb9\x16V+\x8b\x85\xf0\x12\xb6\
+y\xbd\xb0\xb2u\xf0\x07\x9e\xc5\xc7}\x8b(rQ\xd4\
+\xb14\xbe\xf1\xa4\x1e\xa7\xff5\x9a\x1c\x9f\xbc\xfe\x8bJ\
+\xea\xd1\x00\xe0vw\xf4\xd9l\x01\x0f\x00\x08\x02\x07\x9d\
+\xceZQ\xeaU\xd1hZ\x8bTF\x81\x0b\x03\xe3\x98\
+\x98\x1c\x85A\xafDk\xeb\x8aj\x84\x10\xf8\xfc\x1d\xc8\
+\xf2\x8d\xe8\xbb8\x05\x9b\x89\xc3\xcc\x5c\xf9\xea\x17\x837\
+\x8eU\xcaF\xdc\xee\x9d\xedz}C\xc7\xddO\xd5_\
+d\x0ccBh\xb1\x06\xa7\xcf\x8e\xe3\xe4\xa9\xb3\xebl\
+^\xefv\xbc\xf8\xf2\xaf0}\xbb\x0b\xd1eM\x1e\x80\
+\xb2\xa2\x02N\xe7\xcewL&\x8fo\xf5\xc3J\x09\x1e\
+\xa4\xc0\xbd\xa0 C\x87\xd1\xb1\x08\x82\x03\xfd\xf0\xfb\x5c\
+0\x19\x8dkVW\x83\x0f=\xdd\xbdM\x81@\xe0e\
+\x05\xcd\xb0\xd7&\xc6\x83\x00\xc45\x02\x0eG\xfb\xdb5\
+5\xc6\x9a\xcd\x13X\x01!\x0a\xe4\xf2*\x9c\xff4\x88\
+\xd9\xb9\x1b\xf06\xb9P\xab\xd5\xaelB\xd3\x08lo\
+f\x9f\xeb\xe9\xd9O\xd3t\xe7\xe7\x17\xfa\xdfY\x8dc\
+(\x0a\x9a\xbbgI\xc1n\x9eA\xa0\xa9\x00\x9e\xa7P\
+*\x11\x14K\x14\x96\xd34r\x9c\x1e\x0a\x95\x03\x840\
+\x15\xb6\xbf\x0b\x19\x16\x0c_\xe114\xfc6Z\x9a\xeb\
+\xf0\xd4\x13\xcd8\xf0\xcc>\x10B\xa0V\xab\xe1\xf7\xf9\
+\xd6\xd5\x98\xa1(\x92\x06`cH\x06\xaf<\xb7\x04^\
+\xd0\xe3\xd0+\xe6\x0d\x89\x13\xcby|>0\x84P\x98\
+\xc6\xcd9%\xa2q\x1b\x94j\xc7\x03\x14\xb1abJ\
+\xc6\xd5k\x97q\xfc\xc4\xa7h\xf2\xd4\xc1\xdd\xc0\xe2\xb3\
+\xfe\xf33\x00\x14\x00\xca\x00@\xb5\xb5\x1d\x1c5\x99\x1c\
+m\xbd{'\xf1\xeaA\x16'Ngq\xf8{\x0d\x0f\
+\x95|!\x9c\xc7\xa9sY\x8cLj\x90-\xfa\xc10\
+\xea\x87\xc6\x00\x00\xc7\xa5\x90\xcf'\xa2\xa2X\x9c\x8b\xc7\
+\xe7\x12\x0c\xcf/_\xd8\xde\x98n{\xf5 \x0b\x00\x90\
+\xa4\xea\xa6\xa0\xc1\xa9\xc5\xeb\x87\xb4\x90$\x19g\xce\x8f\
+\xa2o\x90\xc2|\xc4\x01ZQ\xff\xc08\x8d\xc6\x08\x8d\
+\xc6h\x07`\x97eL1\xb2\xbc\xf0\x9b\x9e}M\xaf\
+\xddu\x11\xef\x1b\x5c\x09\x84Px\xbe\xd3\x86\xe7;\x81\
+\xa9\x99\x04N}\x14\xc2\xf4\xbc\x19\x19\xae\x11\x0a\x85\xf6\
+\x81\xb1\x85B*J'\x12\x89l\xa3\xab\xe9\x8d\xdd;\
+5*\x00\x98]\xcc#\xe07\x81\x90G},\x01\xac\
+Y\x85\xbd\xbb\xf4x\xe1\x00\x03\xb3~\x01|a\x01\xf9\
+\xfc\x1d\xe4r\x1c\x04\x91\x01\xc3\xa8\xd6\xf9\xc7b7\xff\
+\xce\x00\xc0\xcdE\xe1\x97\xb7\xe3\xfc\xd1:V\x85\xaf\xb7\
+\xd7\xe2\xd2H\x12\xbb;\xd8G&\xb0\x0aB(t\xed\
+c\xd1\xb5oe\x9d\xca\xf0\xb8rm\x123\xf3\x05\xd0\
+D\x0d\x80B\xa9\x9c\xc7\x9dHdd\xed\x98G^\xeb\
+J\xbfy\x98\xd5\x03\xc0\x89\x7fdp\xf8\xbb\xeeM\x13\
+\xa8\x06\xc7O\xc6\xd2\x87~\xfcW\xe3\xdaP\x8f\x5c\xcf\
+\xf7\x9e\xeb\xa3\xfa\x9e~\xd2H\xfd\xedl\x04\xe1;:\
+4:\x05\xb4\xf8h\xec\x08\x18\xa1Rn\xf6\x01\xbd\x11\
+|I\xc4\xa5\x91\xcc{\xc0=O\xb2\xef\xbc\xf4\xecQ\
+Q\xe0\x7f2\x7f;@\xa9T\x04f\xb3\x1b<\x9f\x05\
+\xc1\x02L\xfa\x02,F\x09F\xbd\x08\xbb\x15\xb0\x18)\
+\xb8\x1c\x0a8\xecj\xd8,\x1aP\xf7\xb4\x8c HX\
+N\xf3H\xa6JX\xba\xc5c1\x22\x22\x91R\xe0V\
+\x8cApxvfh8\xe8\x07 n\xe84\xafw\
+\xff\xef,\x16\xff\xeb\xe5r\x96jll\xbf\xef)d\
+Y\x02\xcf\xe7 \x89Y0t\x16\xb2,\x81Pe\xa8\
+U\x0a\xd04\x8dB\x91BYPC\x94\xb5P\xa9j\
+\xd7\x1a0\x95\x0a\xc7C\xa1\xfeo\x86B\x97\x077(\
+\xb0\x0a\xbf\xbf\xf3\x08Mk\xdeb\xd9z%\xcbz\x1e\
+I\xdeJ(\x14\xd2R:\x1d\x89\xf0|f2\x99\x5c\
+z?\x14\x0a\xbe\xbbj\xbb\xef\xac9\x1c\xad\x8f)\x95\
+\xb5\x7f\xb4\xd9\xbc\x1aBh\xabVk\xb2\xa8\xd5\x06-\
+!4hZ\x89\xd5\x7f\x83r\xb9\x00Q,\xa3\x5c.\
+J\xc5bz\xb9T*$$IH\xf2<\x17.\x95\
+2\x0b\xb9\x5cb6\x99\x0c\x079.~\x15\xff\xb9~\
+\xbf\x8aj\x87\x9d\x02`\xd7\xe9\x1c\x1e\x9a\xa6T\x0cS\
+\xe3 \x84\x90\x15S)V(p\x99l6\x16\x01p\
+\x1b@\xb1Ze\xfe\x0f\x00\xf87\xfa'\x84\xa5o\xb8\
+S\xeb\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0d\xfe\
+(\
+\xb5/\xfd`YD\xa5o\x00*\xce\xb0\x1e*\xe0N\
+\x88\x92\x07\xab,\x85\x9f!\xc436h\x8f\x0b\xe8\xc8\
+\x8dk\x5c\xac\xa3Po\xdc%E\x08#\x9f\xb8\x0f\xd0\
+(c\x98af\xc8\xe0\x10K\x02\xc4\x01\xc4\x01M\x05\
+\xf2`8\xd4\xa3\xeb\xb2\xd3R\xca\xee\xbc=\xb2E\xb5\
+6B\xee\xdb\xe6\x97\xb7\xa91\x7f<\x13\xf6\xfei\xc6\
+\xc4\xab\xb9\xad\xb9F\xb7=\xf2\xf1\x92\xfe\x98\xefH\xc5\
+j]|t\xd7}9\x00\xe3\xc1\xba\x09\xd0T\x18\x90\
+\x8aB\x81\x12aL$h(\x13D\x1eh\x22\x984\
+\x94\x08\x85\x02\xa5\xf2\x88L\xd0\xc0\xdaw\xc2\xc4\xebO\
+\xcaeZ\x96\xb4|\x9f\xc8\xa3\xb5<\xa3P\xf8\x03P\
+(04\x13\x07\x84\xc67\xad\xad\x8bg\xfc\xf5\xc4\xcd\
+\xce\xce\xcc\xa6\x9a\xc2\x85\xcbcX\xad:\xc6\xabU\xfb\
+\xe6\xd8/r~\x15\x94\x09\x86\x04\x84\xd1h Xl\
+\x8e\xcb\xd5S..6\x06F\xa3*99\xf96\x11\
+Mol\x0cgx6l\xe1\x0bzx\xd4\xee[\xc7\
+B2\x12\xad\xba/\xb1\x18\xb3m\x15\xf3\x87u\xac\xe6\
+}\x95ok5>\xe3\xd9\xc9\xb0\xd0x\xdb\xef\xcea\
+m\xfc\xac_[c\xa1Y3~\x01\xc5PU\xe6x\
+)\xb6\xcc^VT\xcc\xd5P\x18\x18$\x8a#H\x0a\
+p\xbc\xd5.\x00\x84\x89\x04\x22i0\x90\x89\x0a\x05B\
+R\xa1(t\x0d\x1f\x0e\xc6d\x81\x09\xa3)c\xa30\
+4\x8eEB\x03\xa9<\x16\x8b\x82\x01\x08\xe4Q\x89`\
+\xf1xh&\x0d\xc4De\x91@@\xd3\xc0xx4\
+\xa80\x1e\x10\x1a\x8e\x08\xc9\x02\xc3\x82\x89\x84\x02\x84F\
+C\x81\x04 @0ccT\x18\x0eF\xa5yHh\
+@\x8d\x05\x8c\x07\x04\x1a\x12\x07B\xc5\xa1\xe1\xd18\xd8\
+\x96)\x14\x1c*\x8e\x87\xc4q\x9aM\x96E*\x84\xeb\
+\xd9\x14\x0a\x8e\xc7\x82\xd24\x18\x10\x94\xe6\x81\x11qT\
+\x1cTL\x02\x12$\xb0\xa84\x11j\x18\x9a\xc6$B\
+B!\x08\xc8\x03\x84EU\x19\xf3\x80Q\x89LP\x18\
+\xc6la\xb5\xe8\xee\x9f\x04\x83c\x12\x00%B\x89H\
+\x1e\x1e$\x8d\xc6\xc1\xa3\xd1P,N_P*\x91\xe6\
+\xa1\x814\x8b\x86\x032\x89\x80P(4\x1c\x08\x94\xc8\
+\xb2,\x0c\x1a\x1cP\x12\x180h\xc00\xcb\x00\x8b\x86\
+\x89\x84\x1e$!!\xb1X @T*\x0e\x02,\x0d\
+\x04\xa3A\xb1 \xc2\xc0\xe2PyH,\x8e\xa6\xc2h\
+&\x08,\x0c\x03@\x02\x83\x06\x06($\x11\x85B\x13\
+\x91@\x18\x8e\x08\xa3BY\x14\xcc( \xc1\x04\x0a\x85\
+\x86\xc8\xc3!iD\x9aEQt\x85BD\xf2\xa0L\
+\x1a\x07\x0b\xe4\xe1\x81\x01\x09\x01\x8f\x07\x8c\x87\x09f\x8e\
+\xa7F\xad\x8b\x99H\xac\xaaPx\xd0H{\x90H.\
+h(\x10\x06\xc3\xa4AB\xe2@a\xcb-\xb63\x91\
+\x87\x84)\x14$$\x0e\x86\x03\xa5q<\x22\x1c\x8fj\
+\x1a\x0dDR\xa9`A\xa2\x93\xc61\x91,04\x0d\
+\x0c\x08\x89\xe6\xe1\xc0\xb1H\xd0\xbd\xb4c\xa5+\xc5c\
+\xb9I\x8b\xf8\xf3\xd7]\xe5\xdd\xcc~\x07\xef\x9a\x9b~\
+\x8e\xdf\xfbc\xaa5k\xddk\xd2\xae;yIum\
+\x9c\xb9\xdc\x85\xc5\xca\x94\xaa\xfc\xb6\xd7\xfb\xcbd\x87w\
+\x9a\x8f\xa9-\xed\xb4\xf2\xfd\xe8\xdeV\xf7~\x98J?\
+X\xdd\xc6G7V}1RZ*'^S23\
+\xc7\xc8\xf8v\xb4*5\xfb\xee\x85\xfc\xb6\xba\xe2\xc6\xb2\
+_2\xde\x19\x19&\xea-ec\xda\xe9|E\xa52\
+\xb5\xaf\xf5\xed\xf9\xac\xafP_\x98\xd7Lw<\xab\xa7\
+\x94}cN3\xbe\xfb4\x11\xd9\xae\xad\xa9\x07\xf5\xdc\
+{\xf6\x9f\xf6\xb6\xf7He\xd5\xabX/\xe2\xac\x9fV\
+$n<k\xdd\x18\x99\x7f\xe3\xdb\xde\xb4\xda\xba\xd5\xd7\
+\x8e\xda\x10\x89\x8f\xfdf\xbb;\xb1\x1e\xcd;\xe95\x96\
+\xeem\xfdP\xbb\xac\xeeiz\xa7S\xdcf\xc2\xf3U\
+\x99\xdd\xad6\xa4\xcceN_\xed\x11\xfeg+\xf1\xf7\
+\x93\xb8\xacW\xad\xa5y2\xe6d[\xd5\xb2\xedeU\
+\x1d%\x83\x8c1\xca,\x96'\xdb\x00Z\xa9\xc4\xfa;\
+\x7f\xde\xc8\x8e\xcc\xe1\xaaj\xe3<\xe7\x9d\xd7\xb6\xef\xac\
+\xb6\xb0\xe9L_!\x93e!\x9d\xaaQ\xb2\xfd\xf0\xb1\
+H\x17\xef\x1c\xdf\x9a\xeb~M\xa4bN\xf25\x1e7\
+\xd5\xe9k\xe67]\x80\x07\x8fI\x85\xf1`lO\xda\
+w\xef\x19Sf2\xe2\x97\xfa\x9d\x8aE|v-\xae\
+\xe2\xddcN\xd5-\xea\x0a\xe3\xe1\xa0I\xc0\x11\x019\
+ \xc2xP(\x11\x8c\x05\x1a\x86\xdd\xbdIl\xc7L\
+Y\xfcs\xa6\xa6|ojf\xb9s\xd1\x959\xc7\xfc\
+#C\xb5\xd3\x99\xc5\xfa\xd9\xf4\xec\x1b\x1d\x99E\xeb\x0c\
+\xf1\x08\x8fY\x12y\xcf\x16\x9bn{\xcb\xa2+\xc5\xe4\
+\xa6\xece\x96\xd6+\xa1-\xe9Z\xbeYs\xcf\x94\xbd\
+\xd6\xc9\x85\xbdL\xa8\x8d\xc7t\x86]H\x87{~\xeb\
+!\x133\x9e9\xf6\xa6\xb6>$>\xe6\xe8\x1a\x127\
+\xd6)\x8f\xb8G\xbd?\xe4=\xd9\x7f0\xb5\x89qy\
+\xf75\xe5\x1e.\xa5\xbe\x853\xf1N\xe3\x9en\xbf\xd5\
+W\xb3\xd3\xfer+l:\xe6\xed\xben\xea\xd2\x1f\xd3\
+kbFf\xb5-\xb1\x97R\xfb(\x16\x12\xf2\xc2e\
+\xd9\xc4XuJ\xc3be\x8e5\xa6n\xed\xe9\xf4h\
+\xa4xH\x8bW[\xe2e^\xb2\xbd<_=U2\
+\x8b^\x9e\x8e\xf9\xb4\xf8f\x8a\xd1b\xe6\x5c\xfa\xed\xf5\
+\x8b\x1d\x13\x22[YS\xa2\xe9o\x8b\x0a\x7f\x1a\xaf\x88\
+\xcf,\xbf\xea%\xec\x83M\xff\xf2\xce/\x15\x1f\xcb#\
+\xdd;\xfbJy\xca{\x93\x0b\x1aH\xc4\xa4\x80\x01\xf0\
+V'\xdczR\xf1\xb5H\xad\x7f\xfao%\xce\xdb\x11\
+r\xd5\xd1\xe1\xbf8\xc0\xd6\x8c\xdb\x97T\x05\x0c\x10\x80\
+\x00\x90I\x04\xc2\x04c2a8\x10\xe1\x01\x994\x95\
+\xc7C%\x99!,\x5c\x1f\xa3\xb1@2\x89@\x18(\
+.Xp\x8b\xc9~\xaeoi\x99\xe5*OwN\xfa\
+\xb2\xaa\xa7>\xe7M\xc2\xd3C\xea\xde'SU/\x90\
+c\x1f\x122\x1b\xe9b\xbbv\xfa~t\xc5El?\
+\x8ay\xd4Z_\x1aX\x92\x8c\xb3\x9b\x92Y\xeeK\xca\
+\x9c+Lbf\xb9\x99\xd1\xad\xe8\x8d\x85\xd3\xde\xcaE\
+\xdb{f\xd9{S_\xff\xe4f\xd2\xb7\xbf<\x9c\xf9\
+\xb15 &$\x0e\x15\x06\x84\x82U\xaf\xa1\xe1\x81d\
+a\x81\x89\xa0L\x9a\x09\x06\x84\x99L\x22\xde\x5c\xf0x\
+\x08\x0c\x1a48\xa0,\x12\x184hX$\xf4\x8f\x91\
+\xee\xb8\x93\xde\xb7\xac\x9eQ\x1bs\x12\xb1\x09\x17\xd1\xce\
+m\x0b\xe9\xd4\xb2\xac\x88\xff\xf3E\xa3CL:\x1f\xce\
+/\xe5\x96\x92\xf21k\xa6e\xbeI\xd5\xf5\x83\x8dE\
+7Fo\xcbM}\x5cYt\xdc\xdctw\xf2w\xd2\
+E\xef\x9a\x94\x99\xff\xc3\xdd\xdb\xb8L\xc5\x8bjG\xdd\
+\xbc\xbc5\x89\xaf\xc8r1\xbb$L\xb4\xa4\xb4<a\
+uQ\xe9\xb9Ov;\x1f\xb7\xa9\xff\xd3\xc7G\x9a\xc5\
+\xf4c\xe5$N\xdb\x13\xfe\x98\xb3\xc7J\xa7\xfb\xc3\xa4\
+\xe3\xd9\xfdQ\xd9r\x9cvR+\xe9_\xfaf\xd4\x07\
+\xd5\x9a\xee\x8b\xde\x22\xe9O\xdeO\x8aK\xe2-\xe1-\
+\xe72\xca\xb3\xd8J\xf6\xe5\xf04\x1a\x13\xf3r\xddF\
+k\x87\xb3N\xad\xcbU7\x13\xa97\xcf\x0e2\xe7\xa2\
+|Gf\xa5\xc7\xe5\xa6\xba*2u\x7f\x11\xf3I\xcb\
+\xb6\xda\xd4\xba\xfb\xda\x9f\xd2\xd5\xb2G\xd7\x8e\xea_~\
+y\xaa\xf3\xe3*:\xd4/\xa8\xccdhT\xb9da\
+\xa7qS\xe7\xa5i\x22m\xdd\xe9S%\xc6]\xf4\xd8\
+\xf4\xfe9\x9a.\xd5\xe2\xb2\xfa\xa5\xc5\xee\x94zQ\x95\
+\x09\xf7\xca\xa8E\x8c\x9dH\xa9\xabL\xa6\x0c3\xd57\
+fr\xcb\x8c\x16O\xeb\xb8y\xd4\x8dL\xc6\xb9\x1c\xf3\
+\x11\xffd\x9f\xad[\xc9\xf4\x8em!1\xddXGz\
+3#)\x1ffj=\xa6\xfb\xb9\xce\x93\x9eY\xb2\x0c\
+I\x8b)oYc#>}d*[\xb0rI\xcf\
+\x8d\x91\x163\x8dm\xc9pY\x91yv\xe2\x5cE'\
+\x13\x9aF\x9a\x06SA\xdb\xbcKB\xbeZ.Y~\
+\x93\xce\xf2p\xdbQ\xe6r\xbe\xa2\xbe\xb3\x19\xd2\xf6-\
+\xb9X\x94\xa5j\x94\xb8\xcb\x04\x82\xb3\xa8Bj\xa2D\
+!(\x19##\x223\x93$\xe9\xc29\x86\x81i\x10\
+\x84z\xac<2\x894CA\x10\x85 \x0c\xc7\x18C\
+\x08\x22\xc4\x10\x22 \x84(\x22D\x06\x111!1u\
+c\x08\x93\xe3\x83t\xce\x1c\x17\x19 \xb7\xce\x8e\x15\xea\
+\xfb\xfa\xd8;r=h\x92\xed\xf1\x85\x12%aO\x0d\
+;\x995\xc0\xabK\x8d\xff\x83\x00h\xabeD\x895\
+\x9c\xf2\xbc\x1e\x10\xe6\xb9w\x0c\x8f\xd9\xd6k\x93\x93#\
+,\xc7l\x96O\xef\x96\x0e\x8d\xd2\xe8p\xf6\xd0\xa1\xb1\
+\xd0s\xb8J\xd494\xc3\x87\x06)*:\xcco\xf7\
+;\xb3\xa6\xaf\xf4\x0e\xc5\x09\xc9\xa8^\x1d.\x10\xbde\
+\x17\xfa\xc7\xe8\x05x\xa5\xaf\xb2\x9d,`\xe6\xa5w\xee\
+\xb6\xe2\x22A{\xa9\x09^<\xa4x\xaa\xec\x1f\x06?\
+\xe5\x1eZI\x89\x94\xd4\x15\x01D\x89\xcb\x13oF1\
+\x12\x07\xa6C\xbf\xda;\xd1\x83\xba#\xf4k\xdc\xf4\xda\
+\xd4\xa7q\x16axk\xde6#c`\xd8\xcd\x97\xfa\
+{\xb1\x17\x1a!bAx\xc4\x97\xf3Ge\xb1\xec\xc8\
+j9\xc8dc|\xb2R\xfa>B\xa1G\xc3\xa9\x1d\
+\x8b\x8a\xe4\x8b\x00E]\x8d8,8(\xe1\xdegD\
+MpN%y\x95\xc2\x97\xcc\xc9\xc3kw\xd0\x00>\
+\xe8\xe0\xaa\x80\xc1\x09P29P\xa4y'A\xe6%\
+6\xce\xb1\x1cT\x86\x81\x1b\xc2d>\xa7X\xc7\x8er\
+'l\xa6-\xd9\x1a\xf8\x03iN\x02\xebc?\x03]\
+\xd0`:\xca\x8b\xff\xd7dBl\xc7\x11\xd2y\xd3\xc4\
+7\x89\xb3@\xd9\x00\xe9\x1d\x92\xba\xa6c\xcavzm\
+\xa6\xba\x88\x9dF\xc4Ue|\xa5\xa8\x94\x14\xab\xe5k\
+\x92\x02\x9b\x044=\x03$C\x85W\x03r\xab\xa9\x00\
+\x81\xb1\xb0\x88\xdc\x01Z:\x06\xa1\xbf\xa3h\xb1\xdc\xbe\
+\x9a\x1f\xf6\x03\xf7w\xbch\xc6$s\x1f0\x92\x18O\
+\x85P\xf0\xa4je6E\xc4\xa4\xfe\x7f\x83:Q1\
+.\x12\xb8G\xba\x8c\x0b\x07?\xf0\x81\x9dc\xddD\xb4\
+M\xa3P\xba]/J\xa1\xbe&\xc8+\x96SoJ\
+\x19\xd97\xd36\x9e\xa9e\x0b\xb4a'^\xf1\xa7(\
+\xff\xc4\x92kU\xbe\x14=\xb5\xa4\x88\x97\x97H\xd9\x7f\
+\x1bK\x81\x8b\xb2[\xd7\xba\x18\xd3\xe0\xf9o\xb3F\x1c\
+3\xc5\x84\x80\xd3\xb0\x19\x7f\xdb\xfe\x16\x1b\xe0\x88\xbc\xf3\
+-xT\x18\x87\x85p\xbf\xa2\x0d?\xfb\x9bE\xdb\xcf\
+;}aO-<\xf5\x87\xad\xf6\xfc.\x9f\x88+\xdc\
+\xabl]]\xf7B<\xccO\x85\xfaq\xa2\x99\x91\xe9\
+\xc9u\x83\x90iNb\xab\xc3X\xac\xb8\xdc0I;\
+X\xc5\x1fE\x00$e\x81\x8b\xe1\x19'\xa6a\x8dp\
+\x95\xc6\xeb\x95\xba\x8a\x1e\x5c\xcf\x91l&0\xcdi)\
+\x013>\xc2\xd1\x5c\x17\xde\xbd\x13\x8a\x18\xae\xe3\xf0\x8e\
+\x84\x17\xa2\xdf\xff\x8e\x22\x9b(\xac\xb9\x0bc\xe6XY\
+*\x96\xff\xde\xee\xb6\xa6\xfc\xad\x1f\xd50E\x9cVy\
+U|\x82Q\xda\xede\x9dxl\x92-8\xdfT\x89\
+^i?tC\x1aq\xc7\xea\x9b\x85\xfbpa5\xe7\
+\x97\x07\xc4_\xa8t\x96BQ\x8d[\x9a\xc4\x82\xed6\
+]\xc0\xde\xa2r\x0d1T\x1b8\xf7\x11\x5c\x05\xb7-\
+f\xcc\xe2~\xa2 a\x11v\xfe\xf3.[\x07]\xb8\
+\xa7\x96[|jAY9'\xaa\xfe/\x5c,;\xcc\
+\xa2\xfas\x0fX$\xbf\xe5\xdd\x13V&\xfc\x17o\x80\
+\xf58\xc3&\xd4\x98ZW\xe6\xa0Zs\x90f\xce\xb1\
+.\x1b\xc1\x90`\xccu\xfa\xcf0\x06\x08i\x9aWY\
+8\xacIq\xc4\xfb\x9f\xdf\x83\xe1v\xb5\xb7Y\x88\x89\
+\x85\xc7\x01)\x14EX\xc4O`\xe6j\x85\x05]]\
+\x8e\xccl'\xe6,\x9f\xc1\x8c\xd3\xfe\xee\x9c\x8c\xb2I\
+\xf4*O\x9d \xcf<\x0e\x8a\x04}P\x0c\x89\xb3l\
+m\x00\xb2\xe7Ir\xe9|\xd7YI\xaco,\x96\xb9\
+Q\x84\xb1F\x13\xa1X\xb0\xb9:\x16\x84\x1al\x81\xd1\
+F\x06\x9cJ\xcf\x07\xa8\xc4v\xaa\x9cQ\xbc\xa4\x15\x80\
+\x85s\x98\xb6J$\x1c\x029\xe3\xd3\xed\x80\xa8\xaf\x01\
+\x9a\xda\xaf_\x082i\xc2]\xa8\x9b\xa0%\xeb2\xc1\
+\xdb\xbf\x04\xfd\x8bJ\xb05\x12R\xf9DRR\x01\xfe\
+\xc8\xc4\xf2+\xfd\xe9\xe8\xfe\xa7+r\xd6\xeb\xfe\xd0\xb6\
+D\x1f\xe5\x1f0(\x0e\xc8\x80X\xad\x22\x00\x5c\x81\xa1\
+\x87\xdb\xc7;\x8f\x026[\x8e\xe3\xe2\x02\x98\xa3\x82\xbd\
+ml\x9a\xe41o0^\xf0bDQSz\xea\xa2\
+\x90Z\x00z:\xb4\xacN\xf8&\xb67\xf0\x84\x14\x98\
+\xdf\x22\x0b\xb2\x99;C\x97\x9a\xf9a\x82Q\xc8\x83|\
+\xbd\xd8\x1a&\x9eo\xc6\xc9~S\x84Q\x85\x91\x1fp\
+\xe6\xb7;\xe6-\xfd5\xa1\x9f-\xabe\xdau\xae\xaf\
+\xf7a\x19Z\xd8?\xbe\xd5\xa7,X\xeb\xcd\x8eB\xf5\
+\x8ed\x18\xe1\xbe'\xba\xb2j\x07c\x11\x86^\x19\x8d\
+\xe9\x85\xb0\x0f\xb2\xc4H \xc2\xc8<\x82\xdd\x85\x09\x01\
+7\x0aI\x0eRh\xaf\x1cX\xb7\xa9j\x12q\x22^\
+Wa1\xfe\xad\xc5h\x8c\xa2|\x90.\xac\xc0\xf6u\
+\x87\xdf\xd4HD/\x96IM\x0c\xbf\xa7\xf9\xd8!\xd6\
+\xe8\xd9,\xc0YU\xed\x00\x14\xca\x9d'kCd\xf3\
+\xdcF\x1a[\xdbL\xee\x01\xc3\x90\x12I\xd2Pc\x1c\
+\xe3\x0b\x1c(f\xd9\xf8\x5c\x08awH\xbc\x99,\xc9\
+ \xb5\xae1N\x12\xa8@\xd0u~^\xb1^\xc37\
+\xbe}\x96\xa5\x86xy\xaa y\xfd\x81\xa4c64\
+\xa9`jYW\x9e\xa0\x05S\xdb\xfb+P~\xca8\
+1\xef\x06gU0\xe3\xa4\xc5f\xe0U~\x15e\xe6\
+,W\xa9g\xd0\xb7\x95\x82\xf9HD\xe7J\xd3Bg\
+&\xd8\xbffv\xe7\xba\x9f\xb9F\xca@\xca\x86\x04\x8e\
+0d\x03T\xddsT\x12\x5c\xb7\x17\xcbZ,\xb0\xc9\
+\xc6\x9c\xe9\xc0=C\x84\xc4\xebb'\xf3;=\xf0x\
+\xf7\xa3\x15\xbe\xa6\x93\x1e\xa7\x98\x1c\x0c\x04\x1bqL\x86\
+3\x03b\xb0\x040\xd2\xd2JX%\xd8\x04\xb8aa\
+m\x8cn\xc1\xb6\xe8\xaf\xb1\x0c\x9e\x0cUMP\x0a\x03\
+\xe6#\x03\xd0a\xe4l\x17J\x1e-\xc7;H\xff\x9c\
+\xd8\x11G\xcb\x96q\x22\x82\x8d\xa3\xa4X\xe7\x99\xf5\xc5\
+\x96\xa2w*\x84\xc3<l\xa9|.\x12\xa3\xcbW\xd1\
+%\x8e\xcaUp\xaf\xb52B%e=b\xba\x11\x11\
+\xf1\xdf@x\xb3\x14\xb4d\x90\x0bt\x01WN#P\
+}\xc7\x8d\x9eCC\xf0\x06A\x018\xd0\x16\xd0\x03D\
+\x9c\x83e'\xcb\xdbD\x7f\x0a\xb2N5\xe4\xf1\xac\xb0\
+\x85\xf2\x13!1~:\x905\xe9)\x06\xb0dw\x95\
+\xe5\xccb\x8a~\x01\xfbI\xf4\x87cO+\
+\x00\x00\x06:\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Layer_1\x22 xmln\
+s=\x22http://www.w3\
+.org/2000/svg\x22 x\
+mlns:xlink=\x22http\
+://www.w3.org/19\
+99/xlink\x22 x=\x220px\
+\x22 y=\x220px\x22\x0d\x0a\x09 vie\
+wBox=\x220 0 469.33\
+6 469.336\x22 style\
+=\x22enable-backgro\
+und:new 0 0 469.\
+336 469.336;\x22 xm\
+l:space=\x22preserv\
+e\x22>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\
+\x09\x09<path d=\x22M456.\
+836,76.168l-64-6\
+4.054c-16.125-16\
+.139-44.177-16.1\
+7-60.365,0.031L4\
+5.763,301.682\x0d\x0a\x09\
+\x09\x09c-1.271,1.282-\
+2.188,2.857-2.68\
+8,4.587L0.409,45\
+5.73c-1.063,3.72\
+2-0.021,7.736,2.\
+719,10.478c2.031\
+,2.033,4.75,3.12\
+8,7.542,3.128\x0d\x0a\x09\
+\x09\x09c0.979,0,1.969\
+-0.136,2.927-0.4\
+07l149.333-42.70\
+3c1.729-0.5,3.30\
+2-1.418,4.583-2.\
+69l289.323-286.9\
+83\x0d\x0a\x09\x09\x09c8.063-8.\
+069,12.5-18.787,\
+12.5-30.192S464.\
+899,84.237,456.8\
+36,76.168z M285.\
+989,89.737l39.26\
+4,39.264L120.257\
+,333.998\x0d\x0a\x09\x09\x09l-1\
+4.712-29.434c-1.\
+813-3.615-5.5-5.\
+896-9.542-5.896H\
+78.921L285.989,8\
+9.737z M26.201,4\
+43.137L40.095,39\
+4.5l34.742,34.74\
+2\x0d\x0a\x09\x09\x09L26.201,44\
+3.137z M149.336,\
+407.96l-51.035,1\
+4.579l-51.503-51\
+.503l14.579-51.0\
+35h28.031l18.385\
+,36.771\x0d\x0a\x09\x09\x09c1.0\
+31,2.063,2.708,3\
+.74,4.771,4.771l\
+36.771,18.385V40\
+7.96z M170.67,39\
+0.417v-17.082c0-\
+4.042-2.281-7.72\
+9-5.896-9.542\x0d\x0a\x09\
+\x09\x09l-29.434-14.71\
+2l204.996-204.99\
+6l39.264,39.264L\
+170.67,390.417z \
+M441.784,121.72l\
+-47.033,46.613l-\
+93.747-93.747l46\
+.582-47.001\x0d\x0a\x09\x09\x09\
+c8.063-8.063,22.\
+104-8.063,30.167\
+,0l64,64c4.031,4\
+.031,6.25,9.385,\
+6.25,15.083S445.\
+784,117.72,441.7\
+84,121.72z\x22/>\x0d\x0a\x09\
+</g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a</svg>\x0d\x0a\
+\x00\x00\xd1E\
+%\
+PDF-1.4\x0a1 0 obj\x0a\
+<<\x0a/Title (\xfe\xff\x00L\x00\
+i\x00c\x00e\x00n\x00s\x00e)\x0a/Cr\
+eator (\xfe\xff\x00w\x00k\x00h\x00\
+t\x00m\x00l\x00t\x00o\x00p\x00d\x00f\x00\
+ \x000\x00.\x001\x002\x00.\x005)\x0a/\
+Producer (\xfe\xff\x00Q\x00t\
+\x00 \x004\x00.\x008\x00.\x007)\x0a/C\
+reationDate (D:2\
+0221012202135Z)\x0a\
+>>\x0aendobj\x0a3 0 ob\
+j\x0a<<\x0a/Type /ExtG\
+State\x0a/SA true\x0a/\
+SM 0.02\x0a/ca 1.0\x0a\
+/CA 1.0\x0a/AIS fal\
+se\x0a/SMask /None>\
+>\x0aendobj\x0a4 0 obj\
+\x0a[/Pattern /Devi\
+ceRGB]\x0aendobj\x0a6 \
+0 obj\x0a<<\x0a/Type /\
+XObject\x0a/Subtype\
+ /Image\x0a/Width 1\
+588\x0a/Height 234\x0a\
+/BitsPerComponen\
+t 8\x0a/ColorSpace \
+/DeviceRGB\x0a/Leng\
+th 7 0 R\x0a/Filter\
+ /DCTDecode\x0a>>\x0as\
+tream\x0a\xff\xd8\xff\xe0\x00\x10JFIF\
+\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00\xff\xdb\x00\x84\x00\x03\
+\x03\x03\x03\x03\x03\x04\x04\x04\x04\x05\x05\x05\x05\x05\x07\x07\
+\x06\x06\x07\x07\x0b\x08\x09\x08\x09\x08\x0b\x11\x0b\x0c\x0b\x0b\
+\x0c\x0b\x11\x0f\x12\x0f\x0e\x0f\x12\x0f\x1b\x15\x13\x13\x15\x1b\
+\x1f\x1a\x19\x1a\x1f&\x22\x22&0-0>>T\x01\
+\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x05\x05\x05\x05\x05\x07\
+\x07\x06\x06\x07\x07\x0b\x08\x09\x08\x09\x08\x0b\x11\x0b\x0c\x0b\
+\x0b\x0c\x0b\x11\x0f\x12\x0f\x0e\x0f\x12\x0f\x1b\x15\x13\x13\x15\
+\x1b\x1f\x1a\x19\x1a\x1f&\x22\x22&0-0>>T\
+\xff\xc2\x00\x11\x08\x00\xea\x064\x03\x01\x22\x00\x02\x11\x01\
+\x03\x11\x01\xff\xc4\x00\x1e\x00\x01\x01\x00\x03\x00\x03\x01\x01\
+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x08\x09\
+\x07\x06\x0a\xff\xda\x00\x08\x01\x01\x00\x00\x00\x00\xf4kd\
+\x00\x80\x094\x90\x88\x08!\x04#\xab4\x10\x00\x80\x00\
+\x80\x00\x00\x01\x07\x8f\x11\x10A\x0c\xfb\xc0\x04\x00x\xa8\
+\x07W\x97\x98I1\xc6s\xf3\x14\x15Uh\xf2\xf9\x80\
+\x80\x109\x91\x01\x0b\xb7)\x86\xa9\x04\x0b\xd8\x10\x08\x01\
+\x00\x00\x00 \x00\x01\xc3\x80B \x83wX\x00\x02\x0f\
+\x12\x03/:\xc6I\x84\xc7\x97IAJ\xb5O/\x98\
+\x1b0\xc4\x08\x0elB\x08\xcb\xa6\x8ctj\x807\xef\
+\x81\x01\x00\x10\x00\x00\x04\x00\x009t\x90!\x10N\xcd\
+\xa0\x00\x10<H\x07o\x92\xc6I\x84\xc3\x86\x0a\x0a\xaa\
+\xaa\xf2\xf9\x83w\x90\xd7\xe3\x00@\xd1\xae\x08C\xaf!\
+\x0d|\xf8\x83>\xab\x04\x02\x00@\x00\x00\x08\x00\x00j\
+\xe5B\x02\x11/x\x00\x01\x07\x8a\x80\x1d\x9d\xf6c\x8e\
+\x1cZ\xe8\xa0\xa5Z_#v\xe63\xf2Z8\x00 \
+\xc3\x94B\x19v\x02\x13F\xa8m\xe8\xa8\x10\x10\x01\x00\
+\x00\x00@\x00\x04q\xc8\x22\x02\x1b\xfa \x00\x04\x0f\x1b\
+\xac\x01\x97V\xc9\xab\x9dhPUU\xaf#&\xfd\x81\
+\x00 90A\x0d\xdd!\x010\x99\xe4 \x80@\x08\
+\x00\x00\x01\x00\x00\x09\xa7@\x84 e\xd7P\x00\x02\x0e\
+.`\x00*\xda\x14)V\xaf\x90L\xfa\x02\x00 j\
+\xe5@:\xb6\x82\x00\x04\x08\x08\x00\x80\x00\x00\x10\x00\x00\
+\x9c\x91\x08!/^D\x00\x01\x03G\x00\x00\x0bj\xb3\
+\xcd\x8e\x02\xaa\xab\xc9I\xb3y4\xea\xc1\x9e\xed\xa2\x01\
+\xc9\xa8\x0b\xdb@\x80\x02\x08\x04\x00\x80\x00\x00\x10\x00\x00\
+\x8c9\xd0\x84\x0e\x9c\xc4\x00\x00\x82x\xb8\x00\x05d\xd9\
+\xd5\x9c&\xad\x12\x8bW\xc8\xa6\xed\xba\xb8y1)\x9f\
+_f\xc4\x04\xe3\xc0\x1d\x1b\xc0\x80\x00\x82\x02\x00 \x00\
+\x00\x02\x00\x00#\x0d\x10\x882\xe8\xa1\x00\x00K\x07'\
+ \x00\x0bv\xf6\x88'>\xaa\xaa\xbeJN\x8f\x1f\xc0\
+\xaa\xa1{{\xa8\x13\x9bIw\xef\x00\x80\x02\x08\x04\x00\
+\x80\x00\x00\x10\x00\x00\x82i\xc2\x11v\xec\x02\x00\x00@\
+\x9e3\x10\x00.}\xf4\x80s\xea*\xdf\x22\xc7\xc6\xe9\
+[iB\xec\xf2{@a\xae\xe7\x90\x04\x00\x04\x10\x10\
+\x01,\x00\x00\x01\x00\x00\x10&\x18\xd6Y\x10\x10\x00\x04\
+\xb05x\xe0\x00/~\xc0\x80skUy9\x87\x88\
+*\xda\xa0\xb7\xc9t\x82\x00\x01\x00\x01\x10\x04\x01\x00\x00\
+\x00 \x00\x01\x00   \x01}\xa6\xf3\xa7\xf0\x7f\xc1\
+\x7fG\xf8\x83o\x9d\xe4\xd1\xfc\xc8\x1eS\xc5\x83\xaf\xa4\
+\x10\x09\xc9\x15|\x92x\xadb\xdbJ\x16\xf9\x0e\xb0@\
+\x00\x80\x00\x82\x02\x00%\x80\x00\x00 \x00\x02\x00@@\
+\x80\x06\xff\x00\xa4\xfa\x7f3z\xe5\xee'\xe6\xde\x9a>\
+\xd8\x7fI\xeaG\x8a\xf9\xe3\xc1\x1e\xca\x7f;\xf8o\xfa\
+\x14\xf8G\xfc8\xdd\xdc\x04\x01\xa7A^RM>;\
+\x12\xb2R\x85\xbeG\xa8@\x00 \x00A\x00\x80\x08\x00\
+\x00\x04\x00\x00 \x02\x04\x04\x00\x1e\xc2{s\xeb\x1f\xe5\
+\xdf\xa1{Q\xf3\xa3\xf9\xbf\xdf\xfe\xdc|\xb0\xfe\x9bO\
+\xaf>\xdc\xfeG\xeb\x9f\xd5O\x01\xe8\xb7\xf4\x9e\x98{\
+-\xfa\xa7\xa8>\xe4~\x95\xe8\x7f\xe8\xbf\xad\xfe\xb3\xe8\
+\xd7\xe4\xe8\x02q\x95\xe4\xd2c\xa7\x15\xcb&\x1c\xb8\xa8\
+[\xe57\x88\x00\x10\x00\x10@@\x04\xb0\x00\x00\x04\x00\
+\x00@\x08\x08\x10\x00g\xf4\x1f\xfb\x7f@=\xf4\xf5\x97\
+\xd6'\xb2\x9fh\xfe`y\x9f;\xefG\xcd\xbf}\xfe\
+t{\x99\xfc\x1f\xa2_^~r\xfb\xd1\xea\x17\xeb>\
+_\xf1\x8fu\xfdD\xfd\xdf\xf1?\xdf~(\x00\x1c\xb8\
+\x17\xcaI!\x22'6\x92\x8a\xcb\xca\xed@\x00 \x00\
+A\x00\x80\x08\x00\x00\x04\x00\x00 \x02\x02\x04\x00\x0f\xd3\
+\xfd\xf9\xf4\x87\xd8\xdfD9\x8f\xf4W\xfeu>\x81\xfe\
+\xa3\xed\x1f\xc1\x0f\xab\xde\xb8~\xbd\xfc\x17\xa0\x1f|\xbd\
+g\xfe\x1b\xe7G\xd7\x0fV\xbdi\xfb\xe9\xf3\xdb\xf9/\
+Y~\xbc|)@\x0e}E\xf2i!\x12'.\xa1\
+El\xf2\xb9\xa0\x00@\x00A\x00\x80\x12\xc0\x00\x00\x10\
+\x0b\x96D\x98\xc2\x00 @\x80\x00\xf7_\xfb\xdf\x9f\x1c\
+P\xff\x00B\x7f\xe7\xb3\xdf\x8d\x9f\xab{Y\xfc\x7f\xce\
+\xac\xbe\xb0\xfc\xc1\xf7\xf7\xe4\xe7\xd8\xd7\xa0_B<\xd7\
+\xcd\xef!\xfc\x9f\xad_X\xfe \x80\x1c\xfai\xe5d\
+\x90\x91\x13\x87\x1aP\xad\xdeR\x80\x01\x00\x02\x08\x04\x00\
+@\x00\x00 \x17f@\xa9\x8e\x18\xc0\x08\x10 \x00<\
+\xdf\xec\x9f\x80\xe2\x00\x87\x9f\xf1\x1c\xed\x9eg\xc1uy\
+\x1f\x06\x04\x00\xe7\xd2\xaf(\x92\x11#W\x0d\xb4\xa1]\
+\x1eN\xc0\x00\x80\x01\x04\x02\x00K\x00\x00\x00A\x96\xc0\
+\x14&\x18\xe2\x04\x08\x10\x00\x01\x00 \x04\x00@\x0e]\
+e\xf2\xb2HH\x8e\x0dv\xa9E7\xf9:\x00\x10\x00\
+@\x80@\x04\x00\x00\x02\x06Y\x80\xa0\x13\x0c`\x81\x02\
+\x00\x034\xc0\x01\x00\x10\x02\x00\x9cB\xf9D\x90\x894\
+q-\xb4QWg\x92\xd8\x00 \x00A\x00\x80\x12\xc0\
+\x00\x00\x10\xce\x82\x80\x0a\xc7\x1c\x10  \x03=\xbb\x06\
+<\xd8\x80\x80\x10\x01\x00j\xe6\x17\xca\xc9!#W\x04\
+-\xb5AV\xf6\xf5\xd0\x04\x00\x10\x10\x10\x01\x00\x00\x00\
+B\xd0P(Pc1\xc4\x81\x002\xdb\xb0\x09\xc8\x02\
+\x00 \x04\x01\xc9\x80\xbeQ$#W\x06!m\xa5\x0a\
+\xac\xfa\xb7\xed\xa0\xc3\x0c1.Y\xec\x08\x10\x10\x00\x80\
+\x00\x00\x22\x80\xa0\x05\x02\x98\xccd\x102\xcf<\x80\x1c\
+\xf8\x01\x00\x08\x02\x01\xab\x96\x87\x96\x92Bs\xf1@2\
+\xaaP\xabV\xe7\x9eI\x84\xabUn\xed\xd6\x02\x02\x00\
+ \x00\x00\x04(\x00\x01@\x0aH-\xaa\x005j\x02\
+\x00 \x04\x04\xe2\x8a<\xaaH\xd3\xc9\xa4\x01rR\x85\
+Z\xb4\xb5Uj\xab.\x9c\xd0@@\x02\x00\x00\x00\x80\
+\x14\x00\x00\x02\x80\x14(.\x9d`@\x02\x00\x8190\
+(\xedMz\xf4\xe0\x00-\xb4QUj\xaa\xaa\xd5U\
+^\x8d\x81\x01\x00\x10\x00\x00\x02\x00\x00\x05\x00\x00\x00\xa0\
+\x15\xa7\x10 \x06:4\xe13\xdd\xbf$\x18\xf2b(\
+\xd4\x00\x00[h\xa2\xadUUZ\xb4\xaa\xbd9\x88\x08\
+\x00@\x00\x00\x11\x00\x0a\x00\x00P\x00\x00\x0d  \x0e\
+^X\x06\xfe\x8d\x8cthP\xa6\xa0\x00\x01m\xa5\x0a\
+\xabUUj\xaa\xd2\xf5\xd2\x02\x00 \x00\x00\x04LA\
+A@\x14\x00\x01@\x03\x0c\x00 N\x1d \x05J\xb6\
+\x85j\x00\x00\x15m(U[J\xb5UV\x9bz\x08\
+\x08\x00@\x00\x00\x10\xd6\x00PPP\x05\x00\x00\x1a\x80\
+\x1084\x80\x00\xb6\xa8\xad@\x00\x01mQE[T\
+\xabUU\x90\xe9\x00\x12\xc2\xc4\x00\x04\x00B\x00\xb2\x80\
+(,\xa2\x80\xb2\x804\xe0\x96\x02Yu\xf1\x00\x00-\
+\xb4W\xff\xc4\x00\x1a\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\xff\xda\
+\x00\x08\x01\x02\x10\x00\x00\x00\xfd\xe5\x01\x18\xccB\xdc\xc4\
+7\xd4@ \x80\x00\x1ey\x10/p\x03\xc4=}\xf3\
+3\xe7\x94\x16\xdfe^\xbcBg\x90^\xa7>c\xbd\
+\x08\x08\x10\x00\x07\x1c\xa2#\xa7@\x03\xc45\xed\xb9\xc7\
+\x9e\xd0U\xf4\xefW|\xc4N1\x1dv3\x86\xf4\x08\
+\x08\x10\x00\x069\x04N\xe0\x03\xc9\x90\xea\xc9h-\xf4\
+\xba\xb3\x9di\x0e\x5c\xc7z\x00\x08\x04\x10\x00\x03\x9ed\
+\x1d(\x00\xe1\xc4\x17G[3\x05\xf5\x5cy\xb3n\xfb\
+\xf5',:t\x00\x01\x02\x04\x00\x00s\x90\xdd@\x02\
+x\xc1m\xefF0_W\x9f\x86\x8b]=V\x22\x80\
+\x00\x80A\x00\x00\x09\x16\x10\x1eo\x16\xfd>\xa7\x1e\x00\
+\xd7m\x83\x9eO_/-\xa5\xad\xfa\xec\x00\x00\x10\x10\
+@\x00\x01\x08@|o\x81\xf6\xfeo\xeb?9\xee\xf5\
+r\xf1\xef\xd73\xee\xe1\xe9\xd0\x9c\x8f^s+\x9f:\
+o\xd6\x00\x00\x10\x10 \x00\x01\x08@?\x0f\xef\xfd\x07\
+o\x87\xd7\x0ck\x1d\xfa\xfc\xff\x00n\xfe\x98r\x8f^\
+a9\xf2\xb4\xeb\xe9\x00\x00\x10  \x05\xd5I\x91\x08\
+@<^_\xae\xf1\xdf?L\xdb\xcf\x87\xb7\xa6}!\
+\xca=y\x84\xe1\x95\xa7o@\x00\x01\x01\x02\x00\xba\x02\
+I\x08@*\x00A\x01\xca=y\x87.\x1a-:z\
+4\x00\x01\x01\x04\x00\xd5\x00\x8c\xc8@\xd6\xf6\xc7 \x10\
+ \xcf3\xd7\x98\xe5\xe7j\xaa\x97\xa6\xf4\xca.\xf6\x02\
+\x04\x10\x01B\x80I\x0b\xaa\x1c\xa0\x10 \xe2=8\xcf\
+\x1c\x16\xd3Am[Mu\xa0\x81\x02\x00\x00\x0a\x0a\x0a\
+r\x80LgZ\x1c\xb2\xae@-\xabB\xda\xd2\x97\xb8\
+ A\x00 \xa0\x00\x02\x9c\xc0\xc7\x9f%\xe9s\x16\xb9\
+\x00[V\x8bi\xaa:l\x04\xb1\x00\x0c\x01E(\x00\
+\xcc\x04\xf2@]\x0b\x7f\xff\xc4\x00\x1b\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\
+\x04\x05\x06\x07\xff\xda\x00\x08\x01\x03\x10\x00\x00\x00\xfcl\
+\x05\x17UI5h\xc6\x0a\x00\x00\x00\x1d\xe8\x07 \x03\
+\xd4<\xdc\xae\xafmI\x00\xf2\xc3\x97Pk\xa0\xb9\xe4\
+\xbb\xe89A@\x00\x00\x07k@\xce\x00\x0fP\x9e\x5c\
+\xeb}\x89 <\xf3.}\x01{)\xcb\x0a\xbb\xb8\x81\
+@\x00\x00\x06\xba-\x0e@\x03\xd3C\x0dA\x98\x0f=\
+\xe6\xd5\x99\x0e\x9d\x07\x08\xa0\xa1@\x00\x00\x03\xa5\xaab\
+\x00\x0e\xdd\x00\x8c\xe6(<\xed\xf6\xd2c\x97!\xd7n\
+|\xca\x0a\x0a\x00\x00\x00.\xea\xcc\xc5\x00/\xa4\x099\
+A\xaa<\xfd\xfbHfc\x84*\x0a\x0a\x14\x00\x00\x00\
+\x0bR\x94\x1f?\xe5v\xf6\xfd'^\xa5\x87,\x03T\
+\xf3\xf4\xf4\xb233\xe7\x80((P\x00\x00\x00\x14\xa5\
+\x07\xe5\xbf\x17\xfa\xcf\x87\xfd?\xefy<\xdb\xf5\xe3\xcb\
+w\xe3\xed\xe7\x82\xe8\xf3\xea\xea7\xd2I\x9f<\x02\x82\
+\x85\x00\x00\x00\x01JPO\xe4\x7fg\xf6\x9fO\xeb\xe3\
+Mg|y\xfb\xbc\x98\xf9\xe1\xb3\xcf\xaa]\xf4I1\
+\xe7\x02\x82\x85\x00\x00\x03\x22\xd1JP>G\xcf\xfd;\
+\xd4\xed\x8dI\xbe\xde^z\xf3\x86\xcf>\xa9{Re\
+\xcf\x8c\x0a\x0a\x14\x00\x00$\x10\xb6\xd2\x94\x08\xa0(\xa0\
+l\xf3\xea\x9dz\xc8f1\xc7!@\xa5\x00\x00\x08\x08\
+\x16\xdaP\x98\xcb]\x00\xa2\x83[\x93\xcf\xaa\xe9\xd8\x90\
+\xcc1\x88\xb6\xa6qE\x00\x00\x00\x01\x14\xa2H\x1d(\
+P\xa0\xea\x93\x8e\xb7\xbd\x89\x09 H\x82r\x0a\x00\x00\
+\x00\x00\x00A\xba\x14\xdd\x99\x1d4\x93\xa0\x04\x84\x90$\
+A9\x0a\x00\x00( \x00\x00l\x16\xf7\xa4\xc3A\x9e\
+\x80\x09\x09\x90H\x83\x19\x00\x00\x03`B\x09`\x03a\
+W\xd0\x02@\xff\xc4\x00U\x10\x00\x01\x02\x04\x02\x04\x07\
+\x0a\x06\x0d\x0a\x07\x00\x00\x00\x00\x01\x02\x03\x00\x04\x05\x11\
+\x06\x12\x07\x1301!2@AQ`a\x08\x10\x14\
+ \x22#PRq\x91\x156B\x81\xa1\xb2\x16\x17$\
+5Tprtu\x92\xb1\xd1\xe1%Ubcs\x82\
+\xa2\xb3\xc1\xc334CSd\x84\xd2\xff\xda\x00\x08\x01\
+\x01\x00\x01?\x01O\x14{=*7uQ<a\xcb\
+\xd9>^\xc9|\x95<Q\xec\xf4%\xaf\x19b\xc22\
+\x88\xcb\xd4\xe5o\xe4h\xdf\xcb\xc1\xb1\xbc\x03q}\x8a\
+\xf9*x\xa3\xd9\xb0\x09Q\xe6\x82\x08\xdb\x1d\xfb@/\
+\xe3\x94\xec\x92:\x84\xbd\xfc\x8d\x03\x83\xd0\x0d9n\x03\
+\xb0&\xd0M\xf9*x\xa3\xd9\xe3\xa0]]\xe5\x8b\x8d\
+\xb2\xb6\x80[`Sx\xb5\xbcp/\xd45n\xe4C\
+\x87\x94\x1d\xfb$;n\x03\x17\x07\xc5&\xd0\xa5_\x93\
+\xdc\xc0W\x8a\x93\x94\xc0 \xc2\xd4-m\xb2\xb7l\xc6\
+\xfd\x99O\x8a\x13~\xab s\xf2\x85\xf1\x8e\xcc\x127\
+@x\xf3\xc6\xb4v\xc6\xb4Ap\xc5\xef\xca\x92y)\
+\xe0;$o\xda\xe5\x11\x90E\x87Q\x949\x00\x17\xe5\
+.o\xf4Rw\xf2U\x0d\x927uX\x8bm\xc0\xb7\
+)p]<\x9f)\x8c\x862\x18\xcay\x02w\xf8\xa5\
+\xc4\x0ex\xd7&5\xc3\xa25\xc3\xa25\xc9\xed\x80\xb4\
+\x1e}\xa2\x85\xba\xbeE\xf6\xc0[\x95\x91c\xc9\x02o\
+\x00\x01\xe3\x14\xc5\xad\xb5OyKJw\x98S\xe7\x9a\
+\x09'y\xf1\xc2\x88\xdc`=\xd2 (+v\xc8\x8b\
+x\xe9\x1c\xfdX\x22\xfb0/\x00[\x9689\xf9\x1a\
+S}\x91M\xb6\x9b\x84-\xff\x00Wj\x97}h\x06\
+\xfb\x12\x9f\x14'\xa7\xabD^2\xf8\xf60\x13\xcb\xb7\
+\xc1\x16<\x85\x22\xe67l\xd4\x9d\x9a\xd6W\xb7J\x8a\
+a+\x0a\xd8\xd8\x18\xc8# \x8b\x01\xd5\xec\xa22\xc6\
+X\xcb\x16\x1e\x81Rsr\x14\x8b\x0d\xaa\x85\xb6'w\
+!\xdd\x08s6\xfd\xff\x00\x88 \x096\x11O\xd1\xd3\
+j\x97B\xa7f\x5cK\xaa\x17(n\xdeOe\xcc}\
+\xaei_\x85L\xff\x00\x87\xf7G\xda\xe6\x95\xf8T\xd7\
+\xf8\x7ft}\xaei_\x85L\xff\x00\x87\xf7F\x22\xc2\
+\x94z\x15<\xbf\xe13\x0auG+H%<'\xdd\
+\xcd\x18c\x0f*\xbf6\xb4\xadJC\x0d&\xee,o\
+\xe1\xdc\x04b\x5c\x1c\xba+\x1e\x14\xc3\xc5\xd6.\x02\xb3\
+\x0b)7\xef\xa1\x0bqA(IR\x89\xe0\x03\x84\x98\
+z\x91V\x96oX\xf4\x84\xd3H\xf5\x96\xca\x92=\xe6\
+%)\xf3\xf5\x05)2\x92\xaf\xcc\x14\x8b\xa84\xd9]\
+\xbd\xd1=L\x9f\x91)\x13R\xaf\xcb\xa9B\xe9\x0e\xb6\
+Q\x7f~\xc1\xb9\x19\xd7e\xd70\x89g\x94\xca8\xee\
+\x04\x12\x94\xfbO\x8e\x84\xf3\xed\xf7lV,y\x13k\
+\xbf\x01\xdf\xf8\x81i\xc2\xd3\xa8poB\x82\x87\xcd\x14\
+\xe9\xf6jrL\xcd3\xc5q7\xf6\x1eq\xf3EN\
+\xa4\xc5&T\xcc\xbe\x95\x96\xc1\x00\xe4\x17\xb5\xe3\xec\xfe\
+\x81\xfd\x7f\xea\x7f\x18\xfb?\xa0\x7f_\xfa\x9f\xc61\x1d\
+a\xccETN\xa1*-\x0b6\xc29\xcd\xff\x00\xd4\
+\xc6\x1f\xa4\x22\x8bLj\x5c[?\x19\xd5t\xac\xc6?\
+\xaa6\xc54H\x0e\x17&H$t!&\xf7\xf7\xf7\
+\xf4c\x83$0\xd5\x02Nh\xb2\x93P\x9be.\xbc\
+\xf1\x1eRs\x8b\x84\x0e\x80!\xed%`Iy\xb5\xc9\
+\xbbY`:\x95eW\x92\xb2\x8b\xfeP\x16\x8d\x08)\
+\x0b\xc5X\x8dH \xa0\xa2\xe9#\xa3Y\x1d\xd0_}\
+h\xdf\x9b;\xf5\xa1I\xbc\x11n\xfe\x01\xd1\xbc\xce<\
+jyl\xcf\xb7+\xe0\x8al\x1c\xc8+\xcd\x9e\xff\x00\
+\xba1\xe6\x08\x7f\x02\xd4%\xa4\xdd\x9bD\xd1}\x8dn\
+d\xa3%\xb8mn\x1e\xf6\x13\x14o\xb1Zg\xc1\xfa\
+\xaf\x02\xf04Z\xd6\xb5\xb2\xf9Y\xbbzc\x13|\x1b\
+\xf6EU\xf87/\x81\xf8k\xda\x8c\xbb\xb2f\xe0\xb7\
+gG\x8a\x84\xdf\x90(lT\x9c\xd0A\x1c\x89\xb5\xdf\
+\x80\xef\xfc@\xe0*\xdf\x82M\x9a{\xaa\xf3S\x06\xed\
+\xf6/\xf8\xc4\xc3\x0dM0\xe3.\xa72\x1cIJ\x87\
+a\x83\xa3e\x5c\xda\xa3\xc1\xcd\xe6\xbf\x8cb,:\xde\
+\x1f\xd4\xa4\xce\x87\x9cs\x87 F[$s\xef1\x80\
+h\x9a\xe7\x95Sy>CG+=\xaa\xe7?4M\
+L\xb3'.\xec\xc3\xca\xca\xdbi*Q\xf6EZ\xa4\
+\xf5Z}\xe9\xb7~Y\xf2G\xaa\x91\xb8w\xb0\x96\x8e\
++\xd8\xceI\xe9\xba{\xb2\x88C/j\x95\xaeZ\x92\
+ok\xf3$\xf4\xc4\xbb\x0bjA\xb6.\x02\x90\xc0E\
+\xc6\xeb\x81h\xfbA\xe2\xaf\xe7\x0ag\xeb9\xff\x00\xc4\
+h!\x95J\xe2\x0a\xf3+7-0\x94\x1b\x7fEv\
+\x8e\xe8/\xbe\xb4_\xcd]\xfa\xd1\x834o^\xc6W\
+y\x8c\xb2\xd2i6T\xcb\xbb\x8fb\x07\xca\x85w=\
+\xc8\x16-\xf0\xdb\xda\xdbq\xf5\x03/\xba\xf1!\xa0:\
+\xeb\xf3\xb3\xacMO\xb5.\x862j^\x0d\x17\x12\xf0\
+]\xfbE\x88\xb7\x08\x8cw\x83\x5c\xc0\xf5\x96\xa9\xcb\x9b\
+\x13Er\xa8{8FN2\x8am\xbc\xf4F\x8cp\
+\x0c\xfe\x04b\xa4\xdc\xd4\xd3\x0f\xf8Z\xda)\xd5\xdf\x83\
+%\xfa}\xb1\xa4\x9d\x18M\xe3\x9a\xa4\xa4\xe3U\x16\xa5\
+\x83\x12\xda\xac\xaal\xaa\xfeQ<\xd1\x8d\xf4O9\x82\
+\xa8\xe9\xa9;Rfe*\x98CY\x12\xd9O\x18\x13\
+\x7f\xa2(Z!\xc6\xb5j\x14\xbc\xcc\x9dZM\xa9I\
+\xe6R\xee\xa4\xbe\xf2n\x15\xeb$\x22\xd0\xfbJa\xe7\
+\x1aU\xae\xda\xcaM\xbb8#\x0fh\x87\x19b\x19t\
+L\x86\x1a\x93ab\xe8\x5c\xca\x8a3\x0e\xc4\x80LM\
+w?bv\x9a\xcd/P\x90yv\xe2\x1c\xe8\xf7p\
+E[\x0d\xd7(u1M\x9e\x92u\xa9\xa5\x10\x10\xdd\
+\xb3g\xbf\x00\xc9n5\xfb#\x0eh\x12\xb1>\xc2\x1f\
+\xacN\xa6C7\x0e\xa1\x09\xd6\xb9\xfd\xed\xc0D\xe7s\
+\xe4\xbe\xa4\xf8\x15ia\xce`\xf3W\x07\xf5wF%\
+\xc2\xd5\xac'=\xe0\x9562\x12.\xdb\x83\x85\x0e\x0e\
+\x94\x98\xc0:?w\x1d\xfc!\x92}\x12\x9e\x07\xa9\xde\
+\xde|\xda\xdc\xdd\xa3\xd5\x87\xb4\x19[Me\x99&\xa7\
+\x9b\x5c\xb9gX\xec\xd9l\xa5(\xe1\xb6P/\xe5*\
+\x17\xdc\xfd!\xa8\xf2+o\x87m\xc6,\x0c\xbe\xeb\xc6\
+.\xc1\xb5\x9c\x19>%\xa7\xd0\x92\x87.Y}\x1cG\
+\x00\xe8\xed\xec\xe4\xda\xb4\xc6\xa8v\xc6\xacFD\xc6T\
+\xf4E\x87x\xa4\x18\x22\xdb$/0\xed\xfc@%J\
+B\x82\x92H \xdc\x18\xc3u\x94\xd6\xa9\x8d\xbcO\x9d\
+G\x90\xf0\xfe\x90\xe7\xf9\xe1\xd7\x12\xcbKqW\xb2\x12\
+Tl.x!\xd5\xcd\xe2\xaa\xff\x00\x07\x02\xa6\x1c\xb2\
+G\xa8\x81\xfb\x84I\xca3!*\xd4\xb3\x22\xc8i!\
+\x221\xfdo:\xd3Ke\x5c\x09\xb2\x9f\xf6\xf3'\xbf\
+\x82\xb4\x97R\xc12\x0f\xcaJ\xc9\xcb\xbe\x97\x9f\xd6\x92\
+\xe1U\xf7\x01\xcd\xec\x86\x9e+\x91D\xc5\xacT\xc0_\
+\xd1x\xfb\x7f\xd7\xff\x00\x9a\xe4}\xeb\x8d\x03\xbefq\
+\x0dy\xf2,]`,\x8f\xca]\xe3L\xf4\xd5\xd6q\
+n\x16\xa7\xa4\xd8\xcdy\xab\xf4gp\x0b\xc7\xf2^\x17\
+\xa1\xf3K\xc9S\xe5\xff\x00U\x08\x1fI\xfd\xb1?\xa7\
+\xba\xfa\xa7\x8a\xa4$$\xdb\x95\x0a\xf2P\xe8R\xd6G\
+i\x04F\x0a\xc6RX\xd6\x8e'\x99F\xa5\xd4/#\
+\xec^\xf9\x17\xed\xe81\xa7\xb4\x85c)_\xd1m\x7f\
+\x98\xb8\xd1v;\xab\xe3f*k\xa83*\xd7\x82\xad\
+\xa0\x8dBT\x9b\xe7\xbe\xfc\xc5Q\xa5m$b\x0c\x19\
+X\x92\x94\xa7\x22T\xb6\xf4\xa6\xb1Z\xd4\x15\x1b\xe6#\
+\x98\x88\xc5ZO\xc4\x98\xc2\x98\x9a}A\x12\x81\x90\xf2\
+]\xf3M\x94\x9b\xa4\x11\xceOLh\xf7\xe2=\x03\xf4\
+{?\xb24M\x84\xa5\xab\xf8\xc2\xa3?8\xd8\x5c\xb5\
+1\xe2\xb0\x83\xb9N\xadG'\xba\xd7\x8d!\xe9\x02[\
+\x02H\xb0C\x1e\x1173\x9bP\xd5\xec<\x9d\xeaW\
+dQ\xbb\xa0j\xbe\x1a\x81W\xa6\xca\xaaYJ\xf2\x8c\
+\xb6d\xad\x1f\xacUx\xd1\xc2\x15\x8d\xb15[\x19\xcf\
+#\x81\xa7|\x1a\x9e\xd9\xff\x00\xa2\x90?m\x8f\xd2c\
+IzS\x7f\x09\xce\x0aU-\xa6\x979\x90-\xe7\x1c\
+\xe1KY\xb7\x0bz\xd1\x84t\xdfV56e\xab\xc9\
+a\xc9W\x96\x10_B2)\xab\xf3\x9e\x91\x1a@\xc3\
+,b|/;,\xa4\x02\xfbM)\xe9e\xf3\x87\x10\
+.=\xfb\x8cw<\xf1\xb1\x17\xb2O\xfd\xc8\xd2~\x90\
+\xdd\xc1LKK\xc9\xb2\x87gf\x92\xa5$\xaf\x88\xda\
+\x079\x1c\xe4\xc6\x8ft\xbfY\xac\xd7\xe5\xe9U\x840\
+\xb4M\x9c\xad\xbc\xda2\x14\xaf\x9a\xfd \xc6\x98)\x8c\
+O`I\xe7\x16\x9f.QM\xbc\xd2\xba\x0e`\x93\xf4\
+\x1d\xa2\xb7\xf2%\xec\x81\xb4%Y\x87\xe2\x03\x09\xd6\xfe\
+\x06\xa9\xa4\xad^a\xeb!\xde\xce\x85|\xd1\xbe1=\
+5\xec;[D\xdc\xaf\x90\xdb\x8b\xd6\xb4}U\x0d\xe9\
+\x87\xb1D\xaa0\xf0\xaa&\xd7Rl\x94\x7f[\xea\xc3\
+\xcf90\xea\xddqEKZ\x8a\x94O9>$\xbf\
+\xdef\xbf4O\xd4\xefw?}\xf8\xac~h\xdf\xd6\
+\x8d&\xce5#\xa4,\x172\xf1\xca\xda\x1d\x19\xcf@\
+\xd6\x8e\x18\xc6\xd4\x89\x9a\xee\x13\xaa\xc8J\xff\x00\xc6z\
+_\xcd\x8e\x95$\xe6\xb7\xcfhy\x97e\xdd[O!\
+M\xb8\x85\x14\xad\x0a\x16)#\x98\x88\xd0]\x12~\x99\
+C\x9e\x9e\x99mM\xa6}\xd6\xcb)W:\x1b\x07\xcb\
+\xf9\xef\x1ay\xf8\xe5+\xfa-\xaf\xf3\x17\x1d\xcf\xa4x\
+%\x7f\xfbYo\xd8\xb8\xee\x81e\x7f\x0fR\x9c)\xf2\
+\x15\x22R\x0fjW\xc3\xfbcV\x98\xc0\x1f\x12(\x03\
+\xff\x00\x01\x9f\xab\x1a\x0dy\x9c\xd8\x9e^\xfetO%\
+\x7f\xddU\xc7\xfaGt\x05\x22is\x14\xaa\xa0AT\
+\xbaZS\x0b>\xa2\xaf\x98{\xe1\xb6\x94\xe2\xd2\xdbh\
+*Z\x88\x09JE\xc9'\x98F\x82\xe6\x13\xf6-;\
+&\xa1\x91\xf9j\x8b\x9a\xc4\x1d\xe32G\xee\x8d5\xe1\
+\xb9\xf9\x0cP\xf5_V\xa5JO\x86\xec\xe72\x16\x84\
+\x04\x14\x1fta\xcc=R\xc4\xd5V$$\x9aR\xd4\
+\xb5\x0c\xeb\xb7\x92\xday\xd6\xae\xc1\x13\xf3\x0c\xd3)S\
+3\x0e\x9f7-,\xb5\xa8\x9fU\x09\xbcw<\xf1\xb1\
+\x17\xfe\x9f\xfb\x91\xdd\x01\xf1\x82\x95\xf9\x81\xfa\xe60\x07\
+\xc7j\x0f\xe9\x06~\xb4iK\xe2\x0do\xfb\x04}q\
+\xb4^\xfeD\xbd\xfb4\xab)\xbc\x03q\xd5;E\xa2\
+\xd1h\xb4e\x8bE\xbd\x0d\x81\xeb\x7f\x08Hx#\xaa\
+\xf3\xf2\xa0\x0f\xcaG1\xf9\xb7F \xa4\x22\xb5Lv\
+\x5c\xdb?\x19\xa5t,C\x8a}\xb4\x99e\x95\x00\x87\
+\x09\xc9\xd0\xad\xc7\xc5bzO\xe0\x86\x87\x845\xff\x00\
+*\x91\xc7\x1e\xa7{@o\xb2\xc5^\xae\x5cq\x08\xfb\
+\x91\x1cco\x95\x1a{y\xa7jtm[\x88]\xa5\
+\x9d\xe2\x9b\xfc\xa8\xd1\xe6\x97\xe9\xb32,Sk\xef\x89\
+y\xa6R\x10\x89\xa5\xf1\x1d\x03\xd6<\xca\x89\xa5`\xc9\
+\x92'\xe6M\x1d\xdc\xbc\x22ez\xa5Z\xdf\xd31!\
+\xa4\xac\x1b=9:\xc2j\x92\xcd\x22[V\x03\xce\xba\
+\x96\x92\xe9U\xef\xab\xcd\xbc&\xdb\xe3M\x15Jm[\
+\x15\xcb?!6\xc4\xd3B\x9c\xd2s\xb2\xb0\xb4\xdc-\
+|\x17\x11\xa1\xec_'\x86+\xaf\xb1<\xe0jV\xa0\
+\x84\xa0\xbaw!\xc4q\x0a\xbb8b\xa7G\xa2\xe2\x09\
+V\xd1=+/:\xcf\x1d\x19\xc0P\xe1\xe7I\x8d3\
+\xe1\x0aU\x02n\x9f9Li\x99v\x9fAm\xc9t\
+pYI\xdc\xabv\xc6\x02\x9b\x95F\x0b\xa1%S\x0d\
+$\x89\x06x\x0a\xc7Da\x8c\x5c\xfe\x0e\xc5\xcfO\xa0\
+\x17\x19S\xce70\xd0<v\xd4\xaen\xd1\xcd\x14\xaa\
+\xee\x1a\xc6T\xe3\xe0\xafK\xce2\xe2|\xe3\x0a\xb1#\
+\xb1h1O\xc2\x98^\x8c\xf1\x9a\x93\xa5IK,_\
+\xcf\x06\xc0#\xd8y\xa2\xb1\x8c\xa9\x18/I\x13\x15\x0a\
+<\xc2&\xe4\xe7\x90>\x12e\xae\x10\x1c\xe7(;\x8a\
+\xb9\xe2\x93Y\xa1b\x99\x0dt\x8c\xc3\x13\x8c->Z\
+7\xdb\xb1i;\xbexn^\x99Jeji\xa9i\
+6G\x94\xb2\x94\xa5\xa4\xfbN\xe8\xd2\xb6\x93\xa5*\x92\
+\xab\xa1Q]\xd62\xb3\xf7T\xcaw.\xdf!\x1d\x9d\
+\xb1\xdc\xfc\xfb,\x1cC\xacq\x08\xb8\x93\xb6co\xfb\
+\x91\xa7\xb7\x9az\xbfK-\xb8\x95\xfd\xc2x\xa6\xff\x00\
+,\xc6\x02RQ\x8d(*Q\x00\x0a\x837'\xf2\xa3\
+I\xb3r\xcb\xc0\x95\xa4\xa5\xf6\x89,\xa7\x80(\x1f\x96\
+6\x8b\xe4G\x84\xed\x10\xac\xa6\x01\xbfV\xed\x16\xf4\x1d\
+:\xa35K\x9bD\xcc\xb2\xb2\xad>\xe2:\x0cM\xe9\
+\x0a\xa4\xfc\xb1i\xa6\x1bej\x16.\x02M\xbd\x91\xbf\
+m/U\xaaI\xb7\xab\x97\x9d\x99e\x1e\xaa\x1dRG\
+\xd1\x0e\xba\xeb\xeb+qjZ\x8e\xf5(\xdc\xf7\xd0\xb5\
+\xb6\xa0\xa4(\xa4\x8d\xc4pC\xf5J\x9c\xd3z\xb7\xe7\
+f]@\x1cU\xba\xa5\x0f\xa7\xbc\xcb\xef\xcb8\x1ce\
+\xd5\xb6\xb1\xb9HQI\xf7\x88\x9a\xa9\xd4\xa7\x80\x13S\
+\x93\x0f\x81\xbbX\xea\x97\xfby\x0a\xf9\x0a\x8d\x86\xd9\x0b\
+\xcb\xec\xeax\xdb\xda-\xd4\x95o\xe4*7;t/\
+/\xb2\x01\x07\xab\xf6\xe5\xd9Le1c\xe9u\xaa\xdc\
+\x1c\x85*)\x84\xa8+\xac\x16\x8br\x80\x09\x8c\xa3\xc5\
+ \x18\x22\xde\x84Q\xe0\xe4\x0aVQ\xc9\x12\xefOX\
+\xad\x16\x8br+E\xb6\x07\x87\xd0\x8a7;u+,\
+\x13~J\x09\x10\x1d\xe9\x80\xb4\x9d\x85\xc7Lg\x11\xac\
+\xec\x8c\xe63\x98\xcec9\x8c\xf1\x98uN\xd1h\xb6\
+\xce\xc62\xc5\x86\xcc\xef\xf4\x12\x8d\xb6\xeaX\x1b\xa0\x9b\
+\xf2\xac\xca\xe9\x8c\xea\xe9\x8db\xa3X\xa8\xce\xae\x98\xb9\
+\xd9\x85\xf5^\xd1a\x16\x8b\x08\xb0\x8e\x0d\xba\xbd\x02M\
+\xa0\x9b\xedJ\xd2 \xac\x9fF\x83h\x06\xfdiW\xa0\
+I\xbe\xc3Z\x98\xd6&5\xa9\x8dh\xe8\x8di\x82\xa2\
+}\x22\x15\xd6\x83\xc8oh.\x0eh\xce\xa8\xcczc\
+1\xe9\x8c\xea\x80\xe7L\x02\x0f\x8eM\xa0\xaa\xfd@I\
+\xbf]\xd4\xe7D^\xfb\x00\xe1\x80\xb0{\xf7\x02\x0a\xfa\
+:\x85\xba/\xd6S\xc8\x14\xbb\xednz\x8a\x93\xd7E\
+\xaa\xff\x00\x8buo\xdb\xab\x8ayg\xff\xc4\x00+\x10\
+\x01\x00\x02\x00\x04\x05\x05\x00\x02\x03\x01\x01\x00\x00\x00\x00\
+\x01\x00\x11!01A\x10@Qaq P`\x81\
+\x91p\xa1\xb1\xf0\xf1\xd1\xc1\xff\xda\x00\x08\x01\x01\x00\x01\
+?\x10'\xd2\x94J%\x12\x89G\x0a%\x12\x89D\xa2\
+T\xa2Q(\x94J%\x12\x89D\xa2!O\xa6\xe5\xf3\
+'\x04\xa2Q\xc2\x8e\x14J\x94J%\x12\x89\x87\x0a\xf5\
+Q*Q(\x94J\x94J\x94J%J%\x12\x8e\x14\
+p\xa2Q(\x94J%\x12\x89D\xa2Q(\x94J%\
+\x12\x89G\x0a%\x12\x89D\xa2Q(\x94q\xa2'&\
+o\xc9\xcba\x1cW \x8f18>\x86<\x19\xa4\xe5\
+\x7f\xae\xe5\xb6\xe1|o$Z 7gn0^\xd1\
+\x13,-\x09\xa7\xc0E>L\xdd\xfa\x1c\xfb\x18\xd9\x80\
+\x03F1\xe2\xf0x<C\x95\xfe\xbb K!\x0aJ\
+\xce\x14\xb3aG\xa5\x07X\xc6&V\xf7\xc0\x86\x07\x93\
+\xaa\xfd}\x80\xbagF>\x87\x83\x00+,/+\xfd\
+W\xac\xf1\xb41\xe0/\xd4\xc4\xce4\xdee\x0a\xc8,\
+Z1J\x9f[\xa8\x14|\x08\xdf\x87$\x14\x10(\xe5\
+\xc5/9MLS\xac\x00\x22'\x17\x80\x0bX\x9e<\
+\xad\xf0\x0a\x03\xe9\xad`\x16#\x04\x83k\x9c/\x8a\xf2\
+1\x9c\xa4\x13\x18\xbbz[\xb0\x80\x05\x1f\x03q\x22R\
+\x9c\x8d<\xc0VX\xbe$\x81\xd00\xdf!\xdb\x18\xad\
+\x00\x8aV\xbc\xd5\x85r\xa6\xc3(bs\x10u#?\
+$\x0bo\x83or\x0c\xea\x18\x1c\xc1\xa2\xf5=\x98\xe6\
+K\x8b\xdc\xca\x15o\x8a\xa5\x91\x16p+D\x01\x5c\xce\
+!\xd3\x97\x17i\xdc'p\x88\xed\x1199B\x7f\xe0\
+q\x89\xe8,z\xd8o(.\xc2h\x872\xf5\x9ad\
+\x05\xb0(\xaf\x8b\xca\xcc\x05h\x87\xcd\x10D\x88\x83\xb7\
+(\xde>\xa4A)\x83\xb4V\xac\xd3\x82\xf0\x07\xfa\x22\
+05\xdej\xe3\xeb\xd4\xc21\x85\xdd\xc8V,\x94\x12\
+\x98\xef\xd7^/\x8c\xe4L\xa5\x80\x1c\xe6\x9f\xeb\x93\xbb\
+\xd8\x80\x05\x19\x08&$lF\x99\x82^\xb4\x11\x1c0\
+\x1de\xaa\xabnX\xa3cLs\x0f\xd4\x01cc\x90\
+\x82S\x1c\xc4\xf4\xef\xfch\x1a\xa2\x8e\xfe\xb1 \x1a\xf3\
+\xc8\x04c\xb0\xf2+T\x0aQ\x97F&R\x80\xae\xd1\
+lt\xd8\xcf_\x07\xc9\x09\xc3]\xcc\x97XN\x82\xc3\
+\xa8\xc3@|u\x060\xf2\x9er\x90\x0d\xbd\x84\x87x\
+\x88\xd3\x9e\x0a\xe1\x06\xad\xf3m^\xd9&\xd1\xd4y\x11\
+U\x8d$*\x18?\x80\x80\x81U\x005`w\x08T\
+\xbe\xe0m\x9f\xf4\xe7\xff\x00B\x7f\xf4\xe7Q\x8b\xa8\x1f\
+U\xad\x02PS\x02b\xc1z\xcb`3\x22\xc18\x05\
+L\x11x\x81\xc9\x07P\xec\x04~jZJx\x02\x10\
+C$\xcb\xba\x16\x88\xcd\xd4\x83&\xa8\x12\xe2'\xad\x11\
+-/]\x04\xa3\xd7V/\xac\xe4\xb2\x98\x96\xac\x9bs\
+\xec\xe4F\xa7\xf4\xc3\xd7\xf8\x06\x8dPGKV\x5ck\
+\xac\xf4\xdfI{\xac#\xdc\xd9\xb7\xa6)f\x17;\x9f\
+\x9cw?8\xc7rL\xc4e\xb5\xd5\x83\x92eo3\
+\xe8\xd0\x8d\xe1\xd1z\xff\x00`\x07\x11\xaf\xb8\x92\xba\xdd\
+#LW\x03*\xa0\xd2-\x95\xdd\xbd\x01M\x12\x7f\xaf\
+\xe9\x86z1\x1d<K\xa2+\x0cV\xc9\xa4\xd2l7\
+\x03{\x84\xf4\xe0\x80\xff\x00\x17\x91\xe5\xbc{\xc2//\
+\xb3\x7f\xcf\xe9Y\xb7C\x90\xde\xc93\xd1\xd9\x8a\xd2r\
+T\xf6\x1f\xc08\x07YW\x0e\x9f\xd6\x0c\xe5Op\xa6\
+^\x8c\xbbF\xe8}I\xd7\xce;\xd4\xbb\xce\x04\xc7\xc1\
+\x02\x9f\xf1P\x18t0\x04\xbd\xc1\xd7l\xc0\x1f\x83\x83\
+\xfe\xa0)'\x09\x85\xa8\xe8\xccH\x06\xc4u\x99b`\
+\xa9\xd0\xab\x1f\xe8:e\x08nSq\xa8qDfv\
+\xe5\x8b\x9a?g\x8f\x1dLYe\xc1\xfc\xf2\x18U\x8d\
+\x1d\xa9\x89\x09-\xd4\x9bI4\xa5bE\x1d`;\x02\
+\xfe\xf1\x82\xb3S\x87X\x0d\x83M\x8a\xf2f\xd0\xadU\
+\x0a[\x9b\x9dh\xdb\x12\xeb\xa8\xab\xd1\xae\x00:\xcd\xd7\
+\xd8\xae\x05\x80\xc0\xb5\xc8j\xa7Ek\x97\x22\xc5\x9b\xd9\
+*\x18\xb5\xd7\x99\xaf\xfb}\xcdH\xf1\xa8\xda\xff\x00\xac\
+\xa2\xa0\xf2f\xf6\xac\xdf)Q\xe8\xd3\x85[\xe3\x22!\
+-\x8e\xbdf\x90n\xb2\xd2\xca\xf4\xdf\xa5\x07\x04\x18\xae\
+\xc9;\xb1\xdfe[,\x0bd\xec\x12\x89\xb1DU\x92\
+(\xdc\xc2\x9d\x1f\xc0\x06%\xc2i\x13\x11!4\xfa\x89\
+l\xe9\xa8\x80\x02 D\x0d\xb4\x1a\xb0v\xe4\xd8\x9f\xf9\
+kev\xf4\xf8\xd5{\xae,\xd7\x0aP\xeb\xab\xea\xd5\
+\xe2\xbfhx\x16\xa9~\x91M*&\xd6\xe1\x1c;\x0f\
+F\xc6\x82\xb0\xd1\x8e\x9e\xfb\xc61\x06\xad\x06\x1f\xa4\x9f\
+\xaayd\xb1\xee~1\x04\x9dh\x16V\xe2lx$\
+\xeb\x9e\xa7\x90-\xf1\xd2\xdcJ\xf6\xef\xb1\x9am\x8d\x16\
+\x18\xec\xb8\x7f\x17\xc8\x8d\xe3\xd3\xa9|\x18G\x85fk\
+\xe6\xdb\x95\x8e\x80fu\x03M\xe2\xf5:Y\xbfS\xfb\
+\x85B^i\x0d\x99KD\xb3\xd4\x00\x9aHj5\xc9\
+4c\xe0\x1e\x9c7v\x8f\xb1Uj\xa5,\xd0\x89g\
+8a\x94\x1bH\x0as\xbc\x83\xfd\x873\x05>Hb\
+e#\x13\x04\x87w\xe9\xfc\x00\x8aEga\xff\x00\xd3\
+\x04\x026:2\xe7\xe8\x11\x82/\xc5\xdb\xa3.\xed\x7f\
+\xb8\xdb\x0bxK{MK\xce2m}~+\x7f\x83\
+\xae\xf8\xb0z\x0b1\xaa\xa8\xfd\xf4\x89\xf6A\xba\xa5\x14\
+\x89\x01\xd6\xadM\x12\x9d\x1f\x0eZ\xd6\xe4`?\xee-\
+(\xfc\x956Hk\xa0\x90\xc1\x16\xde\xaa\x1f\xe3\x07\xab\
+\x1f\xa6\xad\x96\xf5\xb4\x16P\x06*\xb2\xd9\x03\x1a\xb0\xfa\
+\x9eQ\x12\x8b\xb3\x15\xb0v\x5cd\x14\xc3\x92V\xd2v\
+\x85u\xdf]\x14\xaf\xba\x13\xfa\x5c4j\xbf\xd7\xc1\x9a\
+\xcfC\x92X2\xd0\x042O\x89\x89\x83\x9er\xb2\xbd\
+Y\xe5/\x14m\xec\xda\xfe\x08\xba\xe8\xff\x00\x98\x81\x10\
+%\xcf\x17\xe9\xd1\x8b\x07\xd3Z\xd7+\xae\x15\xe9%m\
+\xc2b\xff\x00n\x00hDF\xec\xb7\x0bi=f6\
+4^\xb4\xb7\xf7\x96:P\x8c\xb9\xd0\x96\xcd8\xf2\xb1\
+}\xa3Qp\xcc\xfe\x974\xb8\xeb_Mqz\x07a\
+f\xa5\xf8\x8aF\x1b[7#0\xf8M\x5czL\x19\
+\x17 \xa2MY\xddF:\xfd+\x84\x13hS\x9dq\
+\xf3\xec\x86\x09\xd5?\xde\xdcL\x1f\x09\xbf\x16v]\xfd\
+\xd4\x95\x86!)\xdf\xbd\xae\xc2a\x89\x00Z\xd5@C\
+\xb2n\xdav6\xfdq\xb3{N\xf8,\xd8\x0a&j\
+\x0d\x94P\x04Q\xc9\xb6\xceg\xa8\xe4\x9d\xaeb\xf6\x9d\
+H\x00O\x88\x02\xc0\x0c\x94\x18\x98\xbfc\x05\xb6\xf5-\
+Z\x86\xe3\x1b\xdfS6\xdc\xba1T\xaa\xaa\xda\xaes\
+\x87\xcb\xb7{\xec\xc2j\x9f\xf1o+\xc5\x02U\xa9C\
+\xd9 \x8a\x00\x08N\x94\x93\x86\x9alC\xe1\x063H\
+\xb0A\xe0o\x22\xb19\xf9gN\xa8\x22\x08\xfc8g\
+ \xc7\xa6(\xf8J\xb7\xc8\xf8\xe3=\x1f^\x88\x08\x8f\
+\xc3\x02\xf9$\x18\xf4\xc4\xaep\x16\x0b\xb7\x0d-\xbd\x9b\
+H\xb6\xf2\x14)\xab\x9epR\xc8.\x1a\xf4\xf8Y.\
+\x5c\xb9|/=\x0cf\x93\x98@;\xfa\x91\x15{%\
+\x5c\x80;\x9bEU]y!F\xc9\xb1\xfb\x82%\x88\
+\x9f\x16\xbc\xb43\xb5\x8a\xe4\x84\xc0\x99\x02\x9e\xc9a\xd0\
+\xcf\x01\x8f\xd1\x11\xdb\xca\xe8\xaaF4\x5c\xdd\xaa\x08\xe8\
+\xdf\xad=Df\x8d\xa3\xb4O\x1c\xf0\xc3\xa0C\xb6\x0f\
+\xda\x08\xfc2\xf8\xdc\xbe\x14xm)\xca\x12\x1dL\x0b\
+,\xd7\xb1)ws\xf0\xdcLEo2)\x02\xd1@\
+\xe3\xb8N\xe1,\x855W(SI\xd4\x82&\x1f\x15\
+\xa3\xa4\xa7N\x058\x85tg\xea=\x84\x05\xb1\x15\xb9\
+\xbb\xed\xb3M\xc0\xf6\x93\xd0\x8b\x08?\x17^]\xcb\x97\
+/\x85\xf0\xd5\xec\x0a\x05\xacw\x91\xe5\x9d\xf7\xf2=\xd8\
+\xed(\xae\x80MI}\xc6\xec\x1d~P\xady\x14\x0b\
+Z\x82\xd0\xb1n\xd1]\xd3\xba\x81o:(&\x0f\xac\
+M\xb1\x9fo\x80R\xef\xee\x0f\xbb-\x1c\x88\x18~\xa2\
+\x95\xad\xfa\xc5!5\xc4\x9b\x95qu\x89\xc1*\xb6\xfc\
+\x04Ud\x02Y\xed\xef\x1b\xe1r\xf8\x5c\xb9~\xd8\xb3\
+\xd4\x0bca4\xcc\xb4\x9d\xc7\xe0\xb55\xed\xeem\xf1\
+\xb9r\xe5\xcb\x97/.\xf9E\xaeB\xdd\x1a\x1e\xfcM\
+\xb3L\x8be\xb2\xd9o\x0bs\xed\x96\xcbe\xb2\xd9o\
+\x0bx[\xc2\xd9o\x0be\xb2\xd9l\xb6[-\x96\xcb\
+`\xb2\xd9l\x17\xdbL\x84\xc5\xbde\xb0^\xb2\xd9l\
+\xb6[-\x96\xcbe\xb2\xd9l\xb67\x9c?\xff\xc4\x00\
+6\x11\x00\x01\x03\x02\x03\x07\x02\x04\x05\x03\x05\x00\x00\x00\
+\x00\x00\x01\x00\x02\x11\x03\x04\x12 1\x05\x10\x13!0\
+AQ@P\x142aq\x22#$R\x81\x15`\x92\
+5r\xa1\xc1\xc2\xff\xda\x00\x08\x01\x02\x01\x01?\x00\x1a\
+\x0e\x9b\x94\xa9\xca\x01+\x09FF\xe9\xc8\xc1\xec$(\
+Q\x9cs#\xd0[\xbaZF\xf2\x8aw\xcd\xd3\x1a\x0d\
+\xe0I\x84i\x88\xce\xed34NB\xcf\x19@\x81\xec\
+/\x10z,\x1c\xe7\xd05\xc5\x86Bk\xda\xf1\xcbq\
+NpoU\xae\x9e[\x87$j\x123\xea\x11\xd5J\
+\x9d\xec\xd3)\x00\xa2\xc2\xb0\x14\x1a\x07\xb1<H\xe8D\
+\xa0 u\x1e!\xc70\xaa\xff\x00(\xd4q\xef\xd6\x1a\
+\x8d\xe5\xec\x1d\xc2\xe2\xd3\xf2\x83\xd8{\x8c\xcfo|\xa0\
+@\xf6\xb2#tekc\xabXs\x07\xa4\x04\xa0\xcf\
+%`\x0b\x02 \x8c\xed\xd5>\xb8\x1c\x9b\xcd9\xeev\
+\xa7 {\x9b\xa1L\xac\x0e\xbc\xb2\xb9\x91\xbd\xad\xee}\
+\xb0\x89D\x11\x93\x09(6:\xcen!\x08\x889\x86\
+\xe0%5\xa1\xa3)nj\xc4\x88\x1d\x8a\x19\x06\xf6T\
+,\xfb&\x90\xeec!\x00\xa0\x00\xf6\xf8\x0a\x02\x8e\x9d\
+\xcd\xe5\xbd\xa3A\xaa\xe8\xc5\xa0\x89%\x7f[\xb0\xfd\xee\
+\xff\x00\x12\xa9mk:\xd5\x1bM\x85\xc5\xce0\x06\x12\
+\x9d{l\xcb\x91n_\x15\x0cr\xfb\xee$\x0e\xea\xa3\
+C\x8f\x221x\xe81\xb0$\xe7p\x8c\xb5\x1b\x88-\
+\x0a\x19\xd8\xf2\xc2\x9a\xe0\xe1#\xfb\x03mZ\x1b\x8bq\
+Q\xbf5)1\xe4wVM\xd9\xafc\x85\xd3\x9e\xc7\
+\x03\xc8\x89\x82\x15*[:\xc6\x81\xbd\xa4\x5c\xef\xc2C\
+1w'\xc2\xd9V\xef\xbd\xbc7\x159\x86;\x11>\
+]\xd9>\xa3)7\x13\xdc\x00\xf2U!B\xe6\xa5W\
+\xdcU-3\xc9\x0f\xf5a\xfe\xdf\xfc\xab\x8b\x9bZn\
+\xc2\xe7\x80\xee\xf0%6\xbd\x17\xbf\x03\x5c\x09\x84/?\
+RAx\xe1\xfd\x95\xcf\x06\xe2\x9b\x0f\x144\x07j\x8b\
+\xd9I\xa3\x13\x80\x1eJejU>W\x82\x85\xe5\xa8\
+|9\xff\x00\xf0JujM\xa7\xc4.\x18<\xa3\x7f\
+h\xd8\xfc\xcd|\x02\x98\xf6\xbd\xa1\xcd \x83\xa1\xcaD\
+\x8c\xa5\x10\x0e\xa1`g\x85\x84\x0e\xdb\x9e\x04NV?\
+\x01@\x82'\xfb\x03i\xd9\xfc\x1d\xc9\x81\xf9o\xe6\xdf\
+\xfb\x0bi\xb5\xf74l\xfe\x1cM\x17\x00\xd6\xb4vw\
+\xd5Y\xdb6\xd2\xdd\x94\x9b\xdbS\xe4\xaa\x94\xd9U\xb8\
+^$x[6\xde\x8dn.6\x07A\x10\x9f-\xda\
+n\xc3\xa8\xa6c\xfcV\xcd\xa1B\xbbj:\xa0\x0et\
+\xe8U\xb5:l\xda/c9\xb4\x03\x08[\xd2;E\
+\xd4\xb0\x8c1\xc8\x7f\x0bh\xd1\x14h\xb0\x00\x00\xc5\xd9\
+9\x9ck\xf1N\xa6\x80\x08\x1f\xc4\xab\xcbjv\xf4\x1e\
+\xf6\x08q\x80c\xc2\xa1kf\xeb6\xb8\x81\xcd\xb2\xe7\
+w\x05Qs\x8d\x85\xcb{\x02\xc8\xfeJ\xa1kA\xd6\
+8\x8b\x01qi2\xb6Q?\x0e\xef\xa3\xcec\xaeC\
+\x95\xe7\x96jo\xc3\xc8\xe9\xed0\xa0(\x0a\x02\xc2\x16\
+\x1fE\xb4,\xc5\xed\xb9g \xe1\xcd\x87\xea\xb6M\xad\
+\xd5\xad7\xb6\xb4F)h\x99\x8d\xf6\x96\x82\xd7\x1f\xe3\
+\xc5\x8a;F\x8b\xe1?W\xf1\x18\xfbF\x18\xfaB\xab\
+\xb2\xe9\xbd\xe5\xccyd\xea\x02\xa1aN\xde\xaf\x11\xae\
+:D\x15sa\xc7\xab\xc5c\xcb\x1d\xddU\xb1uZ\
+\x14\xe9\xba\xa9%\x87\xe6\x85sb\xcb\x82\x1c\x1cZ\xf0\
+\x22U\x1d\x9f\x81\xce5j\x97\xe2l\x10\x8e\xc9\xe7\x0d\
+\xacp\xce\x90\x8d\x95?\x864\x18`\x18\x93\xaa\xa7C\
+\x87n(\xe2\x9f\xc2D\xabKo\x85an,Rg\
+H\xcc\xedr\x1c\xae2w\x8c\x94\xeaa\xe4t\xf6p\
+:\x10\x14u\xe0\x95\x07\xc7\xa49\x0eJ\x8f\x8eAN\
+A\x91\x8f-\xfb \xe0\xed=\xc2\x14\x1e\x90\x04\xa0\x00\
+R\xa58\x03\xe8\x9c`e;\xdfP7\x90\xd7x\xe8\
+\x8a\xae\x08U\x1e\x17\x11\xab\x88\xd5\xc5\xfa,nX\x9d\
+\xe5b>V2\x83\xc1\xf5\xd2\xa5J\x9e\x84\x05\x84,\
++\x09XJ\xc2V\x15\x00f:\xfa\x12d\xe4\xc6\xcf\
+\xdc\x11\xa8\xcf(\xd5juG;\xe9\xe8\x86P\xe2\x10\
+3\xec\xd3\xbaT\xa9S\xd1:\xf4MF\x85\xc5\x1e\x10\
+\xa8\xd3\x95\xce\x9fV2\xb4\xc1\xf52\xa5J\x95>\x92\
+w\x13\xcb\xa0\xe7\x86\xa78\xbb q\x1a\x14*\x9e\xe1\
+q>\x88\xb8\x9e\xb8\xf4l=I\xf4\xb2\xa5J\x9e\xb1\
+\xceL\x02\x89$\xc9\xea\x0d\xdf\xff\xc4\x008\x11\x00\x02\
+\x01\x02\x03\x06\x04\x04\x03\x07\x05\x00\x00\x00\x00\x00\x01\x02\
+\x11\x00\x03\x04\x12 \x05\x10!01Q\x13@AP\
+\x06\x14\x22a$q\x81\x15\x16#25`\x92Sr\
+\x91\xc1\xc2\xff\xda\x00\x08\x01\x03\x01\x01?\x00=yb\
+\xa2\xa3I VaB\x0e\xa7\xf6\x11\xc9'\x87\x90\xbe\
+>\xa0hn\x14)zr\xcf]\xe4\xc0\x9a\x178\xeb\
+^\xbab\x98\xc0\xd0\xaf\xdfI2}\x85O\x0eKy\
+\x06P\xc2\x0d2\x14\xdc)A<\xd27\x8b`\x1db\
+\x86\x97\xeb\xa4\x12(8\xac\xe2\x8b\x13\xecJx\xf2I\
+\x93\xccS*5\x1bh}(\x22\x8dG\x90zo\x08\
+\xc7\xd0\xd7\x86\xfd\xa8\xab\x0fMH}4\x93'\xda\xc1\
+\x9dlg\x9bl\xf0\x8eYj\xcck5\x03:\xcd-\
+\x92x\x9a\x08\xab\xd0o4T\x1e\xa2\x9a\xd9\x1d4\xab\
+O]\xec\xde\x83\xdb&\x83\x0d\x13\x14L\xf3\x94\xc1\xe5\
+\x13:A\xd5h\x0e<\x86@\xd4A\x06\x0e\x89\x22\x89\
+'\xdb\xe4\xd4\x9a\x93\xcb\xc7\xedL\x16\xccDlM\xcc\
+\xb9\xcc(\x00\x92b\xbf{67\xfa\x97?\xc0\xd5\x8f\
+\x89v^&\xf2Y\xb4\xd7\x19\xdd\x80Q\x90\xd3\xedl\
+\x05\xbcr\xe0\x9a\xe8\x17\x9a A\x89=\x04\xf7\xdd\x04\
+\xd2\x12:\x8e\x1c\x873\xc3X\xd3m\xb2\x9eK(a\
+D\x10\x7f\xb0>*\xd9\x87\x1b\x82\x17\xed\x89\xb9\x87\x93\
+\x1d\xd4\xf5\xad\x93o`\xdd\xb4\xe3h\x5c\xb9i\xc3}\
+%f\x08?\x905c\x0f\xb16F\x11\xb6\xae\x18\xbd\
+\xcf\xa0\xad\xb2\xf3\xc4\x9e\x1c\x01\x02\xbe\x1c\xc1^\xda\x9b\
+Q\xb1\xb7\xc9+i\xf3\x93\xdd\xfa\x81H\x8fq\xb2\xa8\
+$\xd5\xc3z\xc2[[\x16\x83p\xe3G\xfai\xff\x00\
+w\xfe\xaa\xce\x1f\x10\xeb!%i\xac\xddE\xcc\xcb\x02\
+\x8e\x13\xf0\xe0\x84>%a\xfc[\x0e\xc3\xc3\x92E\x05\
+{\x8cr\xac\x9e\xc2\x9e\xcd\xdb\x7f\xcc\xa4Q\xc2\xe2J\
+\xc8J[W\x1a\xe7\x86\x14\xe6\xedC\x05\x893\xf4t\
+\xfb\x8aed%XA\x1c\xa1@\x91Y\xdb\xbdI\xef\
+\xb9N\x96\x5c\xc2\xba\x7f`|A\xb2\xff\x00fc\xc8\
+U\xfe\x0d\xdf\xaa\xdf\xfd\xaf\xe9[}.\xe3\xf0\xdb,\
+\xe0\xd6p\xae\x02[A\xe8\xfd \xd6\xcc\xc0[\xd9\xb8\
++xt\xea\xa2X\xf7c\xd4\xd2\x5c{M\x99\x0c\x1a\
+\xc7\xdf\xbbhZ\xc8\xc4H3I\x07g\x89\xe8\x5cO\
+\xf9V>\xf5\xeb%\x15\x0eU\x8fJ\xc4;\xbe\x01\x19\
+\xb81\x22h\xde\xb80\x0bs1\xcd\xdf\xf5\xac\x0d\xd3\
+v\xeb\x92I9i[\xc2\xc1\x1b\x89\xd4\x9e'\xf5\x8a\
+\xc2\xdf{\xf7\x95\x5c\xc8\x12G\xe7W\xb1\x18\xa5\xc5\x10\
+\x09\xe0\xd0\x16\xae\xaa\x8cm\x86\xf5!\xa7\xfe*\xf6&\
+\xf2\xe32\x869C\x01\x15\xb4\x80\xf1\x97\xee\x83\x944\
+\xaf]N\xb9\xbf?i\x9a\x9d\xd2jj|\x96\xda\xd9\
+\x8b\xb5pMk\x80\xb8\xbfU\xb6>\x86\xbe\x1a\xd9\xdb\
+Cg\xd8\xbbo\x16\x14.pm\xac\xe6 \xfa\x9d\xf8\
+\x9cW\xcc\xe4\xfar\xe5\x9fZ\xf9\x9f\xc3x\x19}z\
+\xcd[\xda\x17\x15\x02\xba\x07\x8e\x86\xafc^\xfd\xac\x8c\
+\xa3\xac\xcda\xf1\xbe\x0d\xbf\x0d\xd02\xd5\xbcX\xb7y\
+\xee-\xb1\x0c:Ma\xf1\x8fbV3)\xf4\xab\xb8\
+\xec\xc1E\xbba2\xb4\x83Ci\xf0\xe3j[\xbc\xd0\
+\xc5\xbf\xcc\x0b\xcc&:\x0a{\xb9\xef\xf8\xb1\xea\x0cV\
+'\x11\xf3\x0e\x1b,@\x8e\xba\x87M\x03J\x88\x1a\xdd\
+'\x88\xf6s\xc8\x9a\x91\xe4$y\x81\xa1\x16x\xee\x8d\
+\x11\xbd\x905\x15#\xd9\xa2\xa3|j\x9a\x91\xca$\x0a\
+,N\xf0c\xc9(\x93\xa4oT'\x89\xe6\x1bjk\
+\xc2\xfb\xd7\x86\xd5\xe1\x9a\x16\xeb\x22\xd6U\xedYGj\
+\xc8(\xa1\x1e\xd5555\x22\xb3Vj$\xea\x1d<\
+\x88\x104dn\xc6\x827j\x16\xda\x82\x01\xe5\xca\xcd\
+D{\x8cTTP\xe9\xc9\x08\xc6\xbc3E\x08\xd2\x04\
+y(\xe7\x11>f***<\xfa\xa9cAB\xe8\
+ \x1a6\xfe\xf5\x93\xef@\x01\xa6<\xeb\x0e>\xc3\x1e\
+D\x0d`q\xa0 s\xbf\xff\xd9\x0aendst\
+ream\x0aendobj\x0a7 0 \
+obj\x0a10308\x0aendobj\
+\x0a10 0 obj\x0a<<\x0a/Ty\
+pe /XObject\x0a/Sub\
+type /Image\x0a/Wid\
+th 256\x0a/Height 2\
+56\x0a/BitsPerCompo\
+nent 8\x0a/ColorSpa\
+ce /DeviceGray\x0a/\
+Length 11 0 R\x0a/F\
+ilter /FlateDeco\
+de\x0a>>\x0astream\x0ax\x9c\xed\
+\xddyl\x14e\x1c\xc6\xf1\xb7,\xa5E#\xd0**\
+\x8a\xa5T\x02\x0a(\x12(\x8d\xe0\x91jA\x83\x98\x82\
+m\xc5T<9\x9a\x88h\x09\x04\x04\x11[\x0eA\x81\
+\x006\xcai)\x08\x825JD<@\x05Q4=\
+T@9\x84R/\x10* g\xed\xdd}\xdd\xeda\
+\xaf\x99\xd9\x99y\xdfy\x9f\x9d\xd9\xf7\xf3/\x09\xfc\xbe\
+ew;;\xef\xcc;\x84H\x92$I\x92$I\x92\
+$I\x92$I\x92$I\x1cu\x88\xea\x17\x97\x98\x94\
+4\xb8oDk\xf4(\x82\xb5\xbdgJf\xeey\xfa\
+\xbf\x8a\x82\x8fg\x0f\xbf\x1a=\x95 \xd1\xe9\xbb\xca\xa8\
+\x02\xf7\xbe\x85\x83Z\xa1\x87\xb3Z\x9fy\x85J\xed\xf5\
+\x8e/\xbc\x09=\xa1\x85B\x1e\xcb\xd1\x8a\xaf}\x15|\
+\x15\xef\xd0\x17AX\xfa)\x9f\xf55\x0e&\x07\xa1g\
+\xe5/,\xfd\xbc\xef\xf2z\xb9\x83\xd0\xe3r\x16\xfc\xfc\
+Y\xfd\xf5\xdew\xc1\xbb]\xd1#\xf3t\xff!C\xf5\
+^\xa5i\x8e9(\x08[a\xb8\xde+\xaf;zp\
+>\x92t~\xec\xb5pi\x0czt\x0eB\x97\x99\xac\
+\xf7\xda|%z|V\xdd\xf70\xe4SZx3:\
+\x80M\xf2E\xa6|J\xcf\xc5\xa1\x13\x18\xb8\x962\xd6\
+{T\x8cEW\x98\x16\xfa.{\xbe\xc7R\x9b\x1e\x0f\
+_\xf9\x0d\x97|J7\xda\xf2H\xa0K\x01\xa7|J\
+\xb3l\xf8\x0a\x88\xd0\xfc\x9ek\xd0F\x17:\xc7\xa8\xc8\
+\xdf9\xe6\xdb\xef\x15\x10~\x98k>\xa5\x99\xe8\x22c\
+\x9e\xe1\x9cO\xa9\xbd\xbe\x0cL\xe5\xde\x7f\x15:\xc9\x10\
+\xee\xfd\x97\xd0E\xc6p\xef\xdf\x8f.2\x86{\xff\xe1\
+!\x97\xa1\x9b\x8c\xe0\xff\xfe\xa7\xe5\xbbf\xf6Gg\xe9\
+fA\xbfW\xe1\xbc\xbe\xe82},\xea\xf78\xf2\xd2\
+5\xe88\x1d\xac\xeb\xa7\xb4\xec\xedht\x9eOV\xf6\
+{\xe4$\xfb\xf9WB\x8b\xfb)=\xfa\xa4_\xff\x04\
+,\xef\xa7\xb4 \x11\x1d\xa9A@?\xa5\xdf\xf8\xef\xe7\
+\x80\x90~\xea^\x11\x86\x0eU!\xa6\x9f\xd2\xa2dt\
+\xa92Q\xfd\x94~r\x1d\xbaU\x89\xb8~\xfa\xf7p\
+t\xac\x02\x81\xfd\x94\xbe\x19\x82\xcemAh?\xcd\x8f\
+D\xf76'\xb6\x9f\x9e\xbd\x1f\x1d\xdc\x8c\xe0~Z\xf5\
+\x1c\xba\xb8)\xd1\xfd\x94f\xf8\xd5\x12\x81\xf8~\xba%\
+\x14\x1d\xdd\x08\xa0\x9f\xee\xb8\x02]\xdd\x00\xd1Os\xc2\
+\xd1\xd9\xff\x83\xf4\xd3\xbd~\xf1\x03\x08\x8dyv\xed\x9f\
+\x90~\x9a\xdb\x0e\xdc\x1e\xf5\xd4\xf2\x1f*0\xed5\xbe\
+\x06\x9e%\xef\xf2D\x16\xdfE_3>\x0b\xb6&.\
+$\xba\xf7\x0d\x1a\x9f\xaf\xa1\xf7e\xf0\x5c\xefg\xf0\x96\
+%\xf9\x91\x07\xbc\x7fw\xd5\x99\x82\xdd\xef-\x992*\
+\xf6\xa6\xb6\x8d\xff\xb0\xe3\x98\xcd\xc5\xe8\xec\x06\xd3,\xc8\
+\x1fP\xd4\xfc_9\xfe\xd5\xea\x17\x12\xfbz^\x11\xe1\
+\xa3\xb7W!2U\xb9Gr\xcf\x7f\xe8_\xb5\x7f\xac\
+\xe8{\xe4\xa7\x9d\xb2R\xdekD\x93\xab\xd1I\xc6\x14\
+r=+\xe8b\xb9\x80\x17\xe3#\x8eW\x0b\xb5~\x07\
+]c\xc2\x8b\xfc\xf27\xa1[\xcc(o\xc3)?8\
+\x1b\x9db\xca\xef\xbc\xf2\xdfG\x97\x98\xc3\xe9j\xb9\xe0\
+\xcd\xe8\x10\x93\x1e\xe3\x92\x1f\x94\x89\xee0\xab3\x97\xfe\
+Y\xe8\x0c\xb3\x0es\xc9\x1f\x87\xce0m9\x8f\xfca\
+\x95\xe8\x0c\xd3\x1e\xe6\x90\x1f\xadz\xcc\xef\xf7\xdc\x1cv\
+\x12\xe8\x08:\x83\xc5\xc3\xcf\xec\xf9\xae/\xd0\x11\x0c^\
+g\xef\x7f\x05\xdd\xc0\x82}A<\xde\x8dn`P\xcd\
+\xfc\xf5\xf7F\x03\xb7\xea\xfb\x9f\x1fX\xf3]\xdf\xa2\x13\
+\x98,`\xed\x9f\x86.`3\x941\xff\xb6rt\x01\
+\x93J\xc65\xa0\x90}\xe8\x026\xdf1\xfe\xf7\xcfC\
+\x070\x9a\xcb\x96\xdf\xcb\xffNh\x1b\xc3v\xc3|\xd0\
+N\xf4\xfc\x8c\xca\xd8V@\x1fE\xcf\xcfj\x17S~\
+\xfb\x93\xe8\xf9Y\xa51\xf5/B\x8f\xcf\xecn\x96\xfc\
+\x88R\xf4\xf8\xacJ\x98\xae\x85\xcdB\x8f\xcf\xecs\x96\
+\xfc\xde\xfe\xb5\x92m\x06\xd3\xca\xd7\x87\xe8\xe9\xd9\xdd\xce\
+\x90\xdf\x17=<\xbb\x8b,\x97\xff\xd8r\xa9\xb3\xa9m\
+\x0c\xf9Q\xf6\x7f\xf7\xd3\xea\xec(\xd3\xfd\xcb\xd1\xc3s\
+Q\xb6\xc8\xe4\x9ei\x1dm\xff\xbb\xbf\xce\xf9\xe9\xa6\xbe\
+\x02\xd8\xfc\xacOc\x7f\x8d3~s\xac\x0b\x7f\xed&\
+G\xbf$\x18\xddB6\x1e=2gy\xb1\xc6\xfa?\
+A\x0f\xcc\xdd\xc7\xb7\x1a\xc8\xbf\xd6\xbe\xab\xbd\xaa\xaa\xd7\
+u\xd3\xdd?\x11=\xac%*3\xf5n#\xfc#z\
+T\x8bT\xac\xec\xa2'\xbf\x1bzN\xeb\x94/\xbb\xc1\
+w\x7f*zJ+\x95-\x8b\xf4\xd5\xff%zFk\
+U\xac\xd3~\xac@;{/y\xe9P\xf5No\x8d\
+\xfe$\xf4x\x02\xb8?\xb8E\xb5\x7f-z8!\x8a\
+\xdb\xaa\xf5\xdb\xfe\xac\xbf>\xedU\xf2\xbb\xa2\x07\x13\xa3\
+B\xed\xb6\x88d\xf4db\x14\xa8\xbd\xfc3\xd0\x93\x89\
+\xa1zr\xd0\xf7Si\x1ca\x99Z\xbf\xad/\xf7\xd2\
+/U\xad\xff\x02z21\xeeP\xeb?\x80\x9eL\x88\
+J\xd5\xd3\xa2\xdb\xd0\xa3\x09\x91\xaf\x96Ol{\x9f\x8b\
+!\xf3U\xfbm{\xa3\x8b!\x83U\xfb\xc7\xa2G\x13\
+A\xfd\xe8\x9f\xc4\xa2g\x13![5\x9ftF\xcf&\
+\xc2#\xea\xfdA\xf6\xbd\xd7G\xb7R\xad\xdd\x91~B\
+Og\xbd\x0d\x1a\xf9\xc4\xa6\xb7\xf9\x1a\xa1\xb9\x1c6\x1b\
+=\x9d\xe5\x8ej\xae\x87:\xff\xfc\xdfz\xcde\x90\x1e\
+\xe8\xf1\x04\xb8\x90\xb3z\xd2}\x11\xca\xfd\xae\x00\xf8\x05\
+P\xcb\xf3S\x98\x9c\xd0\xbf\xc5\x0d\xa2y\xe8\xb9\x04+\
+9\xf8\xe9\xf2\xe9\x8f\x0f\x1d\x10yym\xbf\xb9't\
+:AIQ\xc1lB\x9eF\x8f\x81t\x8e\x90\x9e\xe8\
+\x19\x90\x8a=G\xc0\xc6\x1eO\xec,\xa5$PN\x01\
+)\xab\xf0\xf4\xa7\xa3\x87\x00\xbaH\x02\xe4\x14\x80\x8a\x13\
+\x9e\xfe\xd0\x12\xf4\x1485\xdb\xc58\xfc\x0a\x10-\xdf\
+{\xfbg\xa0\xa7\xc0\xf9\xc8\xdb?\x10=\x05N\xcdv\
+A\xae3\xe81`f\xd4|\x05\xd8\x80\x1e\x03\xe6\xa9\
+\x9a\xfeG\xd0c\xc0\x0c\xaa\xe9oo\xf7\x1b\xdfM\xab\
+\xbbaf\x07z\x0e\x903u\xe7@\x9eC\x0f\x02\xb2\
+\xbb\xae\xbf\x93\x03\xee\x7f3#\xa3\xfe$X\x80\xbe\x01\
+\x1e\xaf\xefOAO\x82\xd1\xab\xbe\xff\xaa\x80\xfc\x0dp\
+\xa9\xe1\xc19[\xd1\xb3 \xech8\x0b\xfe\x10z\x16\
+\x84\x99\x0d\xfd\xc1-\xb6\xf9\x0f\x00w5Z\x06y\x0d\
+=\x8cx\xa5\x8d7\x0c\xe9a\xe7}\x0f\xcdi\xf4\xf6\
+\xf7\xd8\x89\x1eG\xb8)M\xfaG\xa0\xc7\x11\xaeg\x93\
+~\x97\x9f<\xc5F\x98_IS\x8e\xbe\x11PAF\
+\xb3\xfev\x01r-x\xbd!\xcd\xfa\x1d\xb0\x03\x98\x11\
+\xa7[l\x14\xd1\xc9)\xdb\x80\xe8\xa2\xb0S|\x80\xdc\
+\x0cTK\xe1\xaa\xb8\xcee\xe8\xa1\xc49\xa9\xf4\xd0T\
+g\xec\x03\xa4\xcbb\x85|\xd2%p>\x01\x94\xef\x08\
+^\x80\x1eK\x94\x5c\xc5|\xd2!P\x96\xc2\xc6*\xf7\
+\x93I\xe8\xc1\xc4(V\xdb);\xc4Q{A\xa9Z\
+\xa9\x92OH\x22z4\x11\xdc\x1a;B|\x86\x1eN\
+\x00\xad\xadR\xbb\x05\xc0A\x90\xe6s\x02\x9c\x7fK\xe0\
+\x11\xcd\x87D\xb6=\x8a\x9e\xcfj\xe3\xb4\xf2\x09\xb9\xdb\
+f\x0f=5\xea\x98\xaf\x8d\xa2\x97\xa2'\xb4\xd6\x04\x1f\
+\xf9\xe4\xb2\x02\xf4\x88V*R\xbf\x1b\xb6\xde\x1dN~\
+\x07L\xf6\x99O\xc8|\xf4\x90\xd69q\xb9\x8e\xfe`\
+{?\x07IK\x8a\x8e|B\x22\xfeA\xcfi\x91\xc3\
+:\xf7\xc7\xb5\xf5s\xd04$\xea\xcb'd1zR\
+K\xe4\xe8\xde\x1c\xb8\xb5\x9d\x9f\x83\xa8\xc6=Po>\
+!\xe1\x0e<\x0e^\xa3?\x9f\x90^\x8e[\x10;g\
+\xec\xf1\xa8\x0f:\xed0\xc8\xe7\x91o3\xe3\xd1\x03\xf3\
+\xb5Wi\xcdC\xd3\x1c\xf4\xc8<UF\x1b\xcd'A\
+\xab\xd0Cs\xf4\xaa\xe1|\xcfoA\x07<\x18\xa7\xce\
+\xa1P\x13\xfd$\xd4)\xbb\xe3W\x9b|>P\x88C\
+.\x8d]d.\x9f\x906\x8ex\x0b\xec5\xf5\xea\xaf\
+\xfd\x01lF\x0f\xcf\xaeX{\x17pm\xc1\xd9\xe8\xf1\
+\x99\x8df\xc8'\xa4\x95\xdd\xbf\x0cnb\xca\xf7H\xb5\
+\xf5\xa1\xf0Q\xb5\xed\xaf\xf5K\xb0\xf1]\xf2\x97\xb46\
+\xc0\xd7k\xe0)t\x86Y\xee\x04\x0e\xf9\x84D\xe4\xa3\
+CL\x9a\xc3%\xdfs(\xf8\x16\xba\xc4\x94\xad\x9a\xab\
+\x9d\x86\xa4\xd8om|\xffB\xad\xdd\x1f\x8d\x8a\xf9\x15\
+\xddc@\xd5\xbe7F^\xc31\xde\xab\xddzt\x95\
+>\x17\xb7\xa7\x0dQ\xbb\xc6\x89\xcd\xa3~\x7fV\xf0\xb7\
+\xf5\xe3\xfb\x18>\xd3\xa3_\xd7\x9d\xe8@u'\xb6\xcc\
+\x1cj\xec\x1c\xa7\x09A)\xfe\xf8\xd4\x80?\xb6\xcc\x8a\
+\xbf\xde\xea\xf4:\xd7oA\xd76V\xbe'+56\
+LPz\x9daG\xd0\xd5^\x15\x07\xdf\x9b5\xf2\x16\
+\x96\x07\x1f\x9b\x162\xf5\x1c\xb2\xbcd_vZR\xaf\
+6\x88\xf2z\x1d\xd2\x10k\xe4\xa5?\x7f\xf0\xda\xd8\xd8\
+\xceF\x9fqj\x89\x90\x07\xa7\xaf\xf9\xee\xb4\x98\xee\xb2\
+\x82\x1dY\xe9c\xee\x8d\xf0\x8b\xf0&\xc2cF\xcdX\
+\xf5\xf9\x11\x8b\x0e\x8dO\xe6\xbd\xbf$5a@'t\
+\xa5OA\xd7\xdd>b\xc2\xdc\xacm\xfbO1_9\
+Qv,\x7f\xeb\x9aW'\x8e\x1ark'\xe3O3\
+\xc6kuu\xcf;G\xa4L\x9d\x9f\x91\x99\xbdm\xf7\
+\x9e\xc2\xd3>\xcf\x9c\x5c8~0g{\xf6\xaaE/\
+O\x1c\x9d\x14\x17\xd3\x83\xfdd\x8d\x9fi\x15\x16\x11\xd5\
+\xa7\x9fG\xff8\xaf\x07\x92\x92\xe2\xe3\xe2\x06\xf5\xeb\xd7\
+=**<\xcc\x9a\xa3tI\x92$I\x92$I\x92\
+$I\x92$I\x92\xa4@\xf7\x1f\xff\xe1\xcf/\x0ae\
+ndstream\x0aendobj\x0a\
+11 0 obj\x0a2337\x0aen\
+dobj\x0a12 0 obj\x0a<<\
+\x0a/Type /XObject\x0a\
+/Subtype /Image\x0a\
+/Width 256\x0a/Heig\
+ht 256\x0a/BitsPerC\
+omponent 8\x0a/Colo\
+rSpace /DeviceRG\
+B\x0a/SMask 10 0 R\x0a\
+/Length 13 0 R\x0a/\
+Filter /FlateDec\
+ode\x0a>>\x0astream\x0ax\x9c\
+\xed\x9dwX\x93W\xfb\xc7\xc9\x02BHHH \x03\
+\x02\x093\x84\x90\x90\x84\x00!\x810\xc2J\x80\x00.\
+\x04Eq\x80\xb8\xb7\xd5\xbaZ\xeb\xa8\xf4\xed\xb2\xd6\xee\
+ewk\xb5\xd6j\xb7o\xed\xb0\xc3\xd1a\xeb\xa8Z\
+\xed\xb0\xdb\xee\xf5\xfe\xfe\xf9\xdd\x0f\x0f\x8d\x14B\x08!\
+\xe1@<\xdf\xeb{\xbd\x97/\x0d!y\x9e\xcf9\xe7\
+\xbe\xcfs\xce}\x82\x82\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\
+\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\
+\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\
+\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\
+\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\x02\x5c\x14\x0a\
+58\x98\xc5b\xf1I\x07\x07\x87\xa1\xfeDXX~\
+\x11\x95J\xe3\xf3e\x09\x09y\x1aM\xad\xc9\xd4ZQ\
+\xb1\xa2\xa6f}}\xfdu=\x5cW\xd7a\xb7\xaf)\
+,\x9cc04\xa6\xa6\x16GG\xa70\x18L\xd4\x9f\
+\x1d\x0b\xcbKEDH\xd2\xd2J\xf3\xf3g8\x1c\x1b\
+{\xd3\xee\x89\xa1E\x14\x17/P\xa9\xaa\x04\x029\x85\
+BA\xfd\x85\xb0\xb0\xfaWD\x84X\xa5\xb2\x97\x97/\
+\xf7\x8e\xf9\xbel\xb3\xadV\xab\x1d\x1c\x8e\x18\xf5\xf7\xc3\
+\xc2r!\x1a\x8d\x11\x1fo\x80\xe8\xc5\xb7\xd8\xf7va\
+\xe1\xdc\xd8\xd8LH\x1fP\x7fc,,B\x10\xa5+\
+\x14\xd6\xaa\xaa\xab\xfcM~w\xc3\xf8\x22\x93\xe5\xe0V\
+\x80\x85Ptz\xa8RYQ]}\xcdP\x92\xdf\xdd\
+V\xeb\x22H\x93Q_\x06\xac\xcbNT*M.\xcf\
+\xb5\xdb\xd7\xa0\x22\xbf\xbb\xcd\xe66H:P_\x12\xac\
+\xcbE\x02Abi\xe9\x12\xe4\xd8ww]\xdd\xe6\xf4\
+t\x1b\xb4J\xd4\xd7\x06+\x90\x05\xa1\xbe^?\xae\xbe\
+\xbe\x039\xf0.]\x5c\xbc\x80\xcd\x16\xa2\xbeHX\x81\
+\xa9\xc8\xc8x\x9f\xcfj\xfa\xdc\x0e\xc7\xa6\x94\x94\x22\xfc\
+\xb0\x00\xcb\x87\x82\xb8\x02\xa2\x8b\xba\xbaa\xda\xed\xf7\xb6\
+\xc94\x0d/\xa8\xc0\xf2\x89\xc2\xc3\xa3\x8a\x8a\xe6!G\
+z\xa0.+[\x16\x1e.@}\xf1\xb0F\xb6\x84B\
+\x05\xc2\xe9\xcdA\xba\xbaz]TT\x12\xeaK\x885\
+R\x95\x98h\xae\xab\xdb\x8c\x1c\xe3\xc1\x18>\x7fBB\
+\x1e\xea\x0b\x895\xc2D\xa5\xd2;\xe7y\xd0\x03\xec\x13\
++\x95\x15\xa8\xaf(\xd6\x88\x11\x8d\x16l2\xb5\x22\x87\
+\xd6\xb7\xce\xc8\xa8F}]\xb1F\x80\x18\x0c\xe6 \xd7\
+\xb0\xd9\xedk\x8a\x8b\x17\x18\x8d-\xd9\xd9\x13\xb4\xda\xd1\
+\x00\x1et\xbf\x0aE\xa9Je\x07k\xb5\xa3\xe0\x87Y\
+Y\xe3\xf3\xf2\xa6Z\xad\x8b!D\x1f\xc2&P\x85\xfa\
+\xeab\x0dk\x05\x07\xb3JJ\x16yN\x94\xc3\xb1\x09\
+P\xd7\xeb\x1bRR\x0a\x85\xc2\xd4\xf0p\x01\x8dF\x1f\
+\xe8\x1f\xa5\xd3C8\x1c\x11$\xda\xf0&\xd9\xd9\x13\xfd\
+\xfa\x88A\xad\xae\xf1\xc7u\xc3\x0a\x001\x18\xa1\x00s\
+\xbf\x08A\x8fm4NII)\xe2\xf3e}\xad7\
+\xe0\x84\x07\xa7%G\x16\xe6\xc5\x94\x17\xc6\x8d\xb2'\x8d\
+\xadI\x9e\xd6\x98\x0en\xa8M\xa9\xb7%\x96\x98\xa5\xf9\
+9\x92\xf4\xd4Hx\x99\xcb_\x0f\x0e\x0e\x13\x0aS\x14\
+\x0a\xab\xc52\xcb\xe7\x098n\x02X.\x05\x1d\xb8\x1b\
+lJJ\x16\xa6\xa7\xdb\xf8|y\x8f%\xc7\xe1,F\
+\x96&z\xf2\xb8\xb4kW\x9a\x9e}\xb0\xe6\xd8\xfe\xa6\
+\x1fO\xb4\xfe\xef\xb3Y\x1e\xfa\xdbc\xd3\x0e=7n\
+\xe7=\xf6\x8e\xd5\xe6\xa6\xfaTE\x12\x8fJ\xfd\xd7\xa3\
+[h\x0bR\xa9\xd6`h\xf2U\xa4TQ\xb1bh\
+\xaf+\xd6\xc8\x90K\xfe\xad\xd6E\xa9\xa9%,\x16\xbf\
+\xfb+\xc5B\xd6\xe8\xaa\xa4\x1b\xae\xca\x7fg\xdf\xd8?\
+?\x9d\xe99\xed\x9e\xf8\xe2\xf1\xd6W\x9e\xac\xdb\xbc\xca\
+\x04cGh\xc8\xa5\xf1\x05\xda]tt\xb2\xc1\xd0\x08\
+A\xd7`\xf8\xcf\xcfo\x1f\xf2K\x8b5\x02\xd4\x9d\xff\
+\x9a\x9a\x0d\x90\xa5FDH\x9c\xff\x95F\xa3\x18\xf5\xa2\
+u\xcbr\xa1\xbb\xf6-\xf0n\xfc\xd3\xc9\xb6\x9d\xf7\xda\
+\xdb&\xaa\xe2b\xd8\xceO\x02\x19zB\x82\xc9\x93P\
+\xcd\xa5![Aqu\xb1\x86\xbbH\xfe\xcb\xca\x96%\
+%\xe5;\x0b/P(A\x80\xfdM\xeb\x0a\xbe<:\
+e\xc8\xb0w\xe9\x83{\xc6\xcchV\xf1\x22B\x9c\x1f\
+\x98\xcb\x8d\xc9\xca\x1a?\xd0\x04!-\xad\x0c\xd1\x05\xc6\
+\x1a\xd6b\xb3\xa3 \xeb\x04\xe4\xc9\xff\x0bA\xce\xca\xf9\
+\x86SoLD\x8b}\x0f\xff\xf2\xc9\x8c\xed[\xca \
+\x83v\xa6\x09\x10\x9b\xc1PU[{\xad\x87\xfc\xc7\xc7\
+\x1b\xd0]c\xac\x11\xa0\xa2\xbc\xd8\xc7o\xaf\xfc\xe3l\
+;r\xda\xdd\xf8\x937\x9bgN\xce`\x86vM\xb7\
+2\x99\x11\x1aM\xad'\x85V\xc8\x15AL&\x97F\
+c \xbd\xccX\xc3K\x10\xe1CV\xfb\xd6\xb3c\x91\
+\xb3\xed\xb9??\xd2\xb2h\x86\x96\xcd\xea\x9aG\x0d\x0d\
+\xe5de5\xb8\xdf\x9eC\xe6\xf2\xe9\xe9\x8e\x82\x82\xc5\
+\x99\x99\x8d2\x99)\x22\x22\xc69\xeaa]\xb6*\xb3\
+\xc4!\xe7\xd9;\x7f\xfd\xc1\xd4U\x0b\x0c\xce\xd4 2\
+2\xbe\xaf\x05\xdb\x90,\x90\xcf,t\xba\xe6\xc2\xc2e\
+N\x1b\x8d\xb3\x92\x92J8\x9c\x18\xa4w\x00\x0b\xa5F\
+.\xff\xceV\xd0>)\x03F\xb1 \x22m\xa7@\x9c\
+o\xb3\xf5\xdc\x9e_Y\xb9\x92\xfc\xb2yy\xb3\xbb\xf3\
+\xeft~\xfe<\x95\xca\xcebE\x22\xbd\x15X\x084\
+\xd2\xf9'}\xf8\xf9\x86\x82\xdc\xaei[\x06#\x14R\
+\xe3\xee\xe1PA\xc1\xac\xa0\xceR].\xe1\x07WV\
+^\xd59Lt\x18\x8d-\xd1\xd1\xc9Ho\x08\xd6\x90\
+*0\xf8'\xfd\xd0\xd6\xb2XI8\xf9\xbd\x84B\x85\
+\xcd\xb6\x9a\xe4?+k<\xfc$,\x8c\xdf\x17\xffv\
+\xfb\xbf6\xfbX\xad\x8b\xe5\xf2\x5c\x9c)_\x0e\x0a$\
+\xfe\xc1?\x9eh\x9d?=\x93\x9c&\x0d\x0e\x0e\xcb\xce\
+\x9eP\xff\xcfF\x80\xc8\xc8\x84\xbe\xf8\xaf\xae\xde\xd0;\
+k\x80\xe6\x93\x98h\xf6bi\x1f\xd6\x08R\x80\xf1O\
+\xfa\xf9G\x1d\xce\x81 6V#\x91d\xc0?$\x92\
+\xcc\xbe\xf8w\xb3\xb8\xa2\xb2r\x95L\x96\x8d+K\x04\
+\xaa\x02\x92\xff\xffu.\xb1k\xa8\xfdW\x8d\xc4\x84\x04\
+K_\xfc\xf7[\xe3\xa2\xb8x\x01\xdeS\x1c\x90\x0aT\
+\xfeI?\xb2\xad<\x92\x1bJ~S\xa5\xb2\xda%\xfc\
+EE\x9en=0\x1a\xa70\x99\x11h\xef\x17\x96o\
+\x15\xd8\xfc\x83\xcf\x1cl&\x83\x17\x9dn\x82K\xfe\xad\
+\xd6+=_GT]\xbd\x0eRc\xd47\x0d\xcbg\
+\x0ax\xfe\xcf\xbf;\x99\xfc\xa6F\xe3,\x97\xfc\x97\x95\
+\xad\x1e\xd0R\xbaz\xa2\xd0\xd6t<\x10\x04\x86\x02\x9e\
+\xffWw\x8e\x0a\xea\xaceg\xb1,u\xc9\x7fE\x85\
+7G\x18\xc0@\x10\x1b\x9b\x89\xfa\xeea\x0dV\x01\xcf\
+\xff\xf6-\xc4\xcag&\x93\xd7W\xf2k\xb3y\xbf\xc5\
+L\xab\x1d\x8d'HG\xb4\x02\x9e\xffu\xcb\x88p\x9d\
+\xc7\x93\xf5=\xf9\xef\xe2TJ\xcf]\x5c\xbc\xa0\xc7F\
+9\xac\x11\xa4\x80\xe7\x7fzS:|M\xb1X\xe3\xc5\
+\xe4\xbf\xe7\xb1\x10^51B\x15\xf0\xfc\x97\x17\xc6\xc1\
+\xd7\x94\xcb\xf3\xbd\x9e\xfc\xf7\xc4\xb5\xb5\xd7\xe2y\xa1\x91\
+\xa8\x01\xf1\xff\xc3\xc7\xad'_\x9f\xf8\xfa\xd3\xa3w\xdd\
+Wu\xffM\xa5\xb7n*\xecXm^\xbf\xdc\xb8t\
+\xa6na\x9b\x96\xacv\xe2\xd23\x9aUK\xdauk\
+\x16\xe5lXn\x84\xdf\xba\xe7\x06\xeb#\xdb\xca\x9f{\
+\xc4q\xe4\x85\x86\xf3\x87Z\xfc\xba\xe9&5\x91\x17D\
+\x1c^\x93\xa4P\xd8\xb4\xda\x09f\xf3<\xef&\xff=\
+qFF5~R<\xb2\xd4\x83\xff\xbf\xcf\xcf:\xfb\
+\xd6\xa4\xfd;\xea\x1f\xb8\xb9\x14\xc0\x9e99\xc3n\x95\
+i\xd2\x05b!+\x98\xe1\xc7c\x86\xf8\xbcPE\x12\
+\xcf\x9c-\xa9\xadL\x98\xdd\xa2\xben\x8dy\xc7]\xb6\
+\xc3\xcf7@\x8b\x1b\x0c\xfc\xf0u\x9c\x9b\xc5\x9c\x82\x5c\
+X(T&%\x95\xe8t\x13\x8b\x8bW\xf8\x90\x7f\xb0\
+\xc1\xd0\x88\xcfc\x1aA\xd2\xab\xa3\xb7o)\xbbr^\
+\xd6\x98\xead\xe0<\x8c\xe9\xd1l\x067\x22\x22F\x22\
+IIJ\xd6j2-\xf9\x05U\x95\xb6q\xa3\xc7L\
+j\x9a\xe0\xc6c\xebGU\x94\x96\xe5\xe5\xe4\xaa\x94\xe9\
+q\xb1Rx\x07\x0f?\xa1 24K\x13M\x96^\
+\x01\x9e\x07\xc4\xff\xe7GZ\xc87)1\x89\xd3\x92\xb8\
+!!=\xc9d0\xc2\xa4R\x9d\xc1\xd0\xe4\xc3\x83\x5c\
+\x8d\xc6)xRhD+$$D\x1e/3f\xe7\
+\x8c\xa9\xab\x9f3c\xe6\xc6\xab\xd6\xdd\x7f\xc7\xdd\xcf?\
+\xbd\xe7\xd8\xbbG?;q\xfa\x87\xcf\xbf\xf2\x95\xcf~\
+t\xf2\xbd\x83\xef\x1ex\xe1\xe5=;vm\xbb\xe9\x96\
+U\xcb\x96O\x998\xa9\xdcZ\xaaT\xa4Ep8\xbd\
+?Xeq\xfc\xd7\x1fL\xf5\x9c\xff7v\x8f\x86\xdf\
+b\xd0\xa9\xdf\x1e\x1d\xff\xc3\xfb\x8d\xdf\xbf\xd7\xf8\xd6\xae\
+\xaam\xeb\x8d\xd3\xc7\xa7d\xa9\x05\xf0s\xe7;S(\
+T>_\xa6\xd1\xd4\xda\xedk\x07\xdf\x04\xf2\xf3\xdbi\
+4\xd7e\xee\xb0\x86\x9bDB\x11\xf4\xe1\xadS\xa6]\
+\xbf\xa9\xe3\xd9\xa7\x9e>\xf9\xde1\x1f\x12>\x18\x9f?\
+\xfe\xc9\x1b/\xff\xf7\xd1\xfb\x1f\x846\xe8\xfc\xb4\xf1\xb1\
+\xec\x83{\xc6x\xc8\xff\xc3\xb7\x96\xc3\xaf\xc8b\xc3\x01\
+\xfe\xde>\xf7\xe6\x98\x87n)\x99<.M\x1c}\xe9\
+\xd4$h\x08\x22QZ^\xde\x94A\xe6\xc5fs\x1b\
+\x1e\x05\x86\xa1B\x82\x83\xb3\xb3\x0cmS\xa7\xdfp\xed\
+u{\x9f\xda}\xe6\xd8\x09\xe4\x9c\xf7\xebm7n\x81\
+O\x1e\x1d\x15%\xe0\xf3;\xbf\x02\xed\x96\x0d\x16O\xf8\
+\xdf\xb8\x828\x05\xc3l\x10\xba\xe4\x1f\xfc\xc7\x99\xe9d\
+\x9a\xf0\xf6\xde\xb1\x10\x04\xca\xa4\x97\x06\x9d\xb0\xb0H\x95\
+\xca>\x98sp\xf2\xf2\xa6\xe2\x5c`8H\x18-\x84\
+\x10\xfd\xeaUk\xf6\xed\xdc}\xe1\xccy\xe4<\x0f\xd4\
+\x8b\xe6\xce\x87oQm\xaf:{\xf2\x93\x9c\xecl\xf2\
+K\x8ds$_<\xdeOv<\xa3Y\x05\xaflt\
+$\xf4\xc5\xff_\x9f\xb6\xf5\xc8\x97!\xf7o\x1e\xa3p\
+\xd6`d0BSSK\xbc\x0e\x8ars'\xf7(\
+\x9d\x8a54\x82\x1c\xb3eb\xf3m7o=\xf2\xe6\
+\xdb\xc8\x01\x1e\xa4\xeb\xaa\x1d\xf0\x8d\xe6\xcd\x99\xf3\x7f\xbf\
+\xff\xf9\xc7O\xbf\xcc\x9d=\x9b\x9cfLI\xe4\x1ey\
+\xa1\xc1\x0d\xff\xb6\xe2xx\xd9\xb2\xf6\x8c\xbe\xf8\xff\xfb\
+\xbc\xebB\xa6\x17\xde\x9bz\xcd\x15F\x89\x88E^L\
+:=X\xa1\xb0\xd6\xd4x\xf3\xa483\xb3\x1e!\x06\
+\x97\x95\x18t\x869\xcft\xd5\xca\xd5o\xbe\xf2*r\
+h}hu\x06\xb1\x81\xeb\xe6\xebo\x00\xfeI?\xfe\
+\xf0\xa3d\x82\xcc\x0c\xa5\xdf\xd1Q\xdc\x17\xff\xca\x14\xa2\
+\xa4\xc3\xd6u\xb9.\xe1\xbf\xf8A\x93\xfb\xe1\xe3\xd7\xd3\
+3\xb6n,\x84\x8c\x83\xbc\xbc!!\xe1\x99\x99u^\
+\xd4fON.D\x07\xc5\xb0SI\xc9\xa2\xea\xeau\
+\x15\x15+JJ\x16\xe6\xe7\xb7ggOT\xab\x1d)\
+)\x85qq\xfa\xa8\xa8$6[H\xa7\x87\x0e\xe8\x0d\
+\xa3\xa3\xa2\x1b\xc76\xdc{\xdb\x9d\x9f~|\x129\xab\
+\xfep$\x8fx\x86\xb5g\xd7\xd3N\xfe\xc1'>8\
+\xa6Q\xab\xc9+0aT\xaa\xcbX(\x9cE\xeca\
+\xdf}w\x89K\xfe\x7f<\xe6Q\x99\xc7\xdf\xcf\xb6o\
+\xdbT$\x8a\xea\xca\x91\xb9\xdc\x98\x81\x9e\x0c\x0b\xa9t\
+L\x8c\xda\xa7\x10\x8d<\x85\x86v\xcdx{2\x8c:\
+\x1c\x1b\xad\xd6\xc5\x10=\xaaTU2Y\x0e\xb4\x8b\xce\
+\x05\xe7\xae\x9f-\x02\xffe%\xd6\xa5\x0b\x16=t\xcf\
+\xfd\x1f\x1f~\x0f9\xae\xbe\xf5\x85\xd3\xe7\xc8h\xe7\xa3\
+\xf7\xde\xef\xce?\xf8\xd7\x1f~\x9c\xda2\x85\xbc\x08I\
+rn\x8f*v\x10\xc3\x90\xff\xe9\xe8>\x87K\xfe\x7f\
+\xfax\x92\xe7S\xa9?|\xdcz\xc5l=\xf94\x0d\
+B\xfa\xa4\xa4\xfc\x01\x85CpC\xa1\xe1\xf8\x1d\xb2\xe1\
+*\x81 Y\xa5\x22\xe2\xc0\xe0`\x96\xd7\xf3\x09p\x0d\
+a\xec\xc8\xcd\x9d\xa4R\xd9e\xb2l\x1e/\x0e\xe2\xd2\
+\xde\x7fK$\x14U\x94\x96]\xb1h\xc9#\xf7m?\
+q\xf4\x03\xe4\x00\x0f\xd2\x90\xbf\x90\xdf\xeb\x87\xaf\xbf\xe9\
+\xc1?\xe9{\xef\xba\x9b\xc5\x22\x02\xf5`\x06m\xd3\x95\
+y\xcegd\xd0\x1c\xe0\x87t\x1a\xe5\x9b#\xe3]\xf2\
+\xff\xeb\xc9\x01W\xb7>\xf5\xc6Dk\xbe\x94\xfc<\xe1\
+\xe1\x82\x01\x0d\x04\xe5\xe5+.\xcf\xe3\xe9\xc5b\x8d\xc5\
+\xb245\xb52\x88X\x88+\xf5\x9a\x7f\x97\x03kY\
+\xd9\x1599\xcd\x0aE\xa9D\xa2r\xb9))A\x9e\
+0\xa1\xa1q\xdb\x8d[\xde\x7f\xeb\x10r\x98\xbd\xf0\xde\
+\xa7v\x07\x11\xb3\x91a.\xe1'\xfd\xc1\xe1#\xceX\
+\xa8\xb4@\xfa\xd9\xe1\x16`\xf5\xb1\xdb\x88\xb2'R1\
+\xab\xaf\xe4\xf7\xb7S\xd3\x06\xca?9G\x04\x19\x07\x97\
+C\xd4]\xa4Ri0@{\xfe\xa4\xc0d\x9av\xb9\
+-\x10\x8a\x8f\xcf#\x97Z\xc9d\xe6\xa0\xcer\x1c>\
+\xe4\xbf\xb7m\xb6\xd5Fc\x8bBa\x15\x0aS\x9c\xf5\
+\xfc\x9d\x8a\x8b\x95\x8e\x1b=\xe6\xe6\xeb\xae?\xf4\xda\x9b\
+\xc8\xc1\xf6\xd0\xf7l\xbb#\x88X\xc0)w\xc3?\xf8\
+\xb7\x8b?\xcd\x9f;\x97\xa4+\x9a\xcf|\xe6\x81\xea\xcd\
+\xabL\xf0\xef<}t\x9f\x93\xff\xa7\xa7{\xc1?\xe9\
+\xf3\xefN\xb6\x18\xbb\xe2\x19\xa1P\xe1\xf9c\x82\xcb\xe7\
+$\x02\xb8\x17\xc9\xc9e\xce\xa5\x86\x12\x09\xb1].5\
+\xb5\xd8\xaf\xfc\xff\xdb\x1d\xa5\xa5Ku\xba1\x90Y\x87\
+\x85\xf1z|<\xb1H4v\xd4\xe8;\xb7n;\xfd\
+\xe1q\xe4\x90\xbb\xf1\x86\xb5W\xc3\xa75\xe6\xe6\xba\xe7\
+\x9f\xf4\xde\xdd\xcf\xc0\xf7\xea\xbc\xf8A\xd2\xce\xe3c\xc6\
+V\xc9\xfb\xe2\xff\xcf\x7fO\xfe\x0f\xd4\x7f~:s\xf9\
+\x9c,\xb2\xd6\x16\x9b-\xf4\xf0\x08K\xbd~\xdcP\x83\
+\x88F\x14\x85\xc2\xd6}\xa9-\x9f\x9f\x08?\xcd\xcc\xac\
+\x1fB\xfe\xff\xe5\x8a\x8a\x95YY\xe3\xe5\xf2\x5c6;\
+\xba\xfb\x07\xa5\xd1h\xb9\x86\xecU\xcb\x96\xbf\xfa\xfcK\
+\xc8i\xef\xed\xb9\xedD\xf5\xce:\x87\xc3\x13\xfe\xc1\x17\
+\xce\x7f^m\xbft\xe6\xef\xfc)\xca>'\xff\xcf\xf9\
+\xe0\x14\xb3=\xdb\xab\xc9\x12+\x10\xdb\x17\x14\xb4\xf7{\
+\x17\xa0/\x1aZ\x0e\xd1(%\xa5\xbc\xc7>\x8b\xf0p\
+\x82\xba\xdc\xdc\xc9\xa8\xf8\xefn\x08\x93\xa0#\x82`\xac\
+GF&\x11\x8b'5M\xd8~\xd7\xbd\x9f\x9f<\x83\
+\x9c|\xd2\xe3\xc7\x10\x1d\xe6\x8c\xd66\x0f\xf9'\xbd\xf5\
+\xa6\x9b!e\x08\xea\x5c,\xb1f~&\xb9\xfem@\
+\x93\xff\x9e\xfb\xc3\xfd\x8d\xe4\xc2\x09*\x95n4Nq\
+\x7f\xe5/\x87\xc2\x11\xc9\xc9\xd6\xde\xfb\x8c\xc8h|\xa0\
+S\xc7\xfev]\xdd\xe6\xc2\xc29\x10\x94FF\xc6u\
+\x7fR\x1f\x12\x1c\x5cQZv\xdb\xcd[\xcf\x1f\xff\x04\
+-\xffU\x956\xf8<kW\xad\x1e\x10\xff\xe0\x0f\x8f\
+\x1cu&\xc59\x99Q\x87\xf6\xd4x1\xf9\xef\xa1?\
+?\xd2\x92\xa5!\xfa7\xc8\x88sr\x9a\xfb\xba\xdae\
+e\xcbP\xf08\xa4JL,\xea\x0d\x7fA\xc1\x22\xf2\
+\xbfVV\xaeB\xce|_\xae\xaa\xba:;{BL\
+\x8c\xa6\xfb\xb4jhhh\xb5\xcd~\xf7\xad\xb7\x7fq\
+\xea,\x12\xfe-\xf9\x05\xf01n\xbc\xee?\x03\xe5\xbf\
+GR\xcc\x0a\xa3_\xb7\xd2\xf0\xfd{]\xfc\xff<\x90\
+\xc9\x7fO\xfc\xd3\xc9\xb6\xd2\x02bj\x14\xba\x11\x83\xa1\
+\xc9\xe5\x15\xd6jG\xa1@r\xe8$\x93\x99]n2\
+\xcd\xc9i\x0d\xea\xbc2>?\xd9\xdc\x1fv86B\
+\x9c\x06\x91j\xf7\x19$\x08'\xeakj!4\xbap\
+\xfa\xdcP\xf2\xaf\xd7\xea\xe0\xaf\xdf\xb9\xed6/\xf8'\
+\xfd\xe2\xbe\xe7d2\x19\xf9-JL\xe2c/\xd6\x02\
+\xff\xbf\x9ch\xf1-\xff\xe0\x9fO\xb5\x15\x9bb\xc9\x1b\
+\xed2\x10\x0a\xec\x92Ab\xb1\xba\xafM\xd6\x99\x99\x8d\
+A\x9d'U!g{@\xae\xad\xbd\xd6d\x9a&\x93\
+e\x07\x07\xb3\x9c_\x93\x1d\xce\x86\x98|\xefS\xbb\x87\
+\x86\xff\xd4d\xa2\x8c\xedC\xf7o\xf7\x9a\x7f\xf0\xc5o\
+\xbe\x9d>\xb5k\xee\x9d\xcb\x09\xbe}c\xdeo\xa7\x06\
+\xb0\x8ff@\xa3\x009/J\xa31\x8a\x8a\xe6\xfe\xfb\
+zv\x84\x84\x84#b\xd3\xef\xe2\xf1\xe2-\x96%}\
+\xf1\x9f\x96V\x1dD,\x1d\x89E\x8e\xb4w\x86a\xcb\
+ln\x83\x11\xa1\xfb\xa9\x10)I\xc9\xebV\xaf=\xf5\
+\xfeG~\xe5\x1fRr\xf8[O\xefxj0\xfc\x93\
+\xde\xf7\xcc\x9e8i\xd7\xd3\xdb\xfa\xca\x04?\x9dn\xfc\
+\xe3\x89\xd6\x1c\x9d0\x88X/\xc7*+\xbb\xc2y\x0d\
+\xad\xd6\xc5(\xc0\x1c\x0a\xb1X\x02\xb3y~_\xf0\x83\
+\x13\x12\x0a\x83:\x1f\x94 'y\x90\xae\xa9Y\xaf\xd3\
+\x8d\xe5\xf3\xe5\xce\xc5H\xc1\xc1\xc1u\xd5\x8e\xa7\x1e~\
+\xec\xbb\xf3_\xfa\x83\x7f\x0e\x9b\x98Zy\xe9\xb9\xe7\x07\
+\xcf?\xf8\xfb\xaf\xbe\x9e\xdc<\x89\xfc\xe4\x82\xc8\xd0\xed\
+[\xca\xfc\xd1\x04 \x1d&\x0f\xaf\x0f\x0f\x178\x1f\x8d\
+i4\xb5H\xe0\xf4\xb7 6\xc8\xcd\x9d\xe1\x06~p\
+l,q\xfe2\xf4\x9f\xc8\x01\xf6\x95\xa1gS(\xac\
+aa\x5c\xe7u\x90\xc5\xc5_\xb9\xf4\x8a\x8f\x0e\x1d\xf5\
+!\xfc\xdf\x7fv\x81J%f\xa5\x0e\x1ex\xdd'\xfc\
+\x93\xde\xfd\xd4\xce\x18I\xd7yav\xab\xec\xdc;\x93\
+}\xde\x04\x0e?\xdf@\xae>\x8d\x89Q\x93WL\x22\
+Q\xa1\xc0\xd3\xbf\x82LG\xabmr\x0f?X$\x22\
+V\xb0'%\x15 \xe7\xd6\xb7\xae\xab\xeb\x80\xb8H*\
+\xd59\xf7\xba2\xe8\x8c1u\xf5\xfb\xf7\xbd\xe8\x13\xfe\
+?;q\x9a|\xdb\x0f\x0e\x1f\xf1!\xff\xe0o\xbf\xfc\
+j\xc2\xf8F\xf2\xcd\xb9\x9c\x90\xdb7\x17\x0d\xb4\xb8D\
+\xbf\xdeq\x97\x8d|:\xac\xd1\xd4\xc1\x85\x0a\xc8\xc5o\
+.g;{[  \xea\xe3\xa5\xa7W\x22'\xd6O\
+\xb6\xdb\xd7*\x95\x15\x90\xe0;\xafL\x819\xff\xb1\x07\
+\x1e\x82\x0e|0\xfc\xc3hB\xbe\xdb\x99\x13\xa7|\xcb\
+?\xe9\xa7\x1e\x7fB$\x14\x92\x7f\xa2\xc4,=\xf5\x86\
+/\x1f\x0a\x80\x97\xcd\x22\x9e\xf6R\xa9t\x9dn\xcc\x90\
+\xb3\xe9w\x01\xd5\x9e\xc0\x0f\xe6r\x89*|p\x11\x90\
+\x83\xeaW\xd7\xd6^k04\xf2xR\xe7%R\xa4\
+\xa4\xde|\xdd\xf5^o:v.~\xfe\xfa\xf3/\xfd\
+\xc1?\xf8\x9b/.@F\xf0\xcf3\x02\xc6\xf5W\xe5\
+\xff\xe5\x8bu\x11\xa4\x7f;3C\xab\x8a\x0a\xea\x5c\x0c\
+\x86\x82P?*44\xa2G1=7\x1eV\x8b\x1f\
+\x86\xc0\x16\xcb\xec\xd8X\x8d\xf3\x81rtT4\xa4\x06\
+^,\xb4;\xf4\xda\x9b\xe4;\xfc\xf2\xfdE?\xf1O\
+\xfa\xc5}\xcf%%u\x9d\xf0\x95\x97%>\xb6\xdfg\
+\xab#>x\xa5\xd1\xc3\xaab#HT*M\xaf\x9f\
+\xe4!\xfc`20((\x98\x89\x9c\xcc\xa1te\xe5\
+\xaa\xd4\xd4bg\xdc\xcbb\xb1\x16\xcc\x997\xa0\x8a+\
+o\xff\xf7u\xf2w\x7f\xbb\xf8\x93_\xf9\x07C\x13[\
+\xb6x\x09\x83A$\xad!\xc1\xb4U\x0b\x0c\xbf|2\
+\xc3'M\xe0\xa6u\x05\xa8@\xf5\x93\xdc\x1c&\xe8\xd2\
+t:\xb1]\xa2\xa4d\x11r&\x87\xde55\x1b\xd4\
+j\x87s\xddW8+|\xde\xcc\xd9\x1enU~\xf3\
+\x95W\xc9\xdf\xfa\xfd\xc7\x9f\xfd\xcd?\xe9\xa3\xef\xbc\xeb\
+,\xb1\x92\x10\x1f\xb1g{\xf5\xe0\xf9\x7fmW@-\
+{`\xb3\x85n\x1eu\xf5\xb6\xc5\xb2\x94\xfc\xc5\x8a\x8a\
+\x01\x1c\xb5\x16`\x86\xd4 +\xab!<\x5c@^\x8a\
+H\x1eo\xf5\xf2+\xfb]S\xf4\xfaK\xfb\xc9\xd7\xff\
+\xf1\xd3/C\xc3?\xf8\xef_\x7f\xdf\xb6\xe5\x16vx\
+\xd7\xb3Z{\xc9`'H\xc938\x02C\x90\xcbg\
+gO\x1bP\xe7o2\xcd#\x7f\xb7\xba\xda\xfb\xa3v\
+\x02\xc3\xd0\x0at\xba1Lf\xd7S\x03\x91P\xb4\xf9\
+\x9a\x0d_\x9d\xfd\xac/\xfe\x0f\xbc\xf02\xf9\xca!\xeb\
+\xff\x9d>s\xe2\x94\xad\xa2\x92\xfc\xeb\xbc\x88\x90\xad\x1b\
+\x0b\xbd\xce\x8b\x9d[\x86\x03@\x89\x89\xc5\x03\x82\xbf\x90\
+X\xfc\xd6\xd6\xf9\xab\x94\x11\xb1\xf8m\x08\xecpl\x82\
+\x88\xc8\xb9\x18F\x1a\x1b\xbb\xf5\xfa\x9b\x5c\xce\x94\x1e|\
+\xe5\x00\xf9\x9a\xa1\xec\xff\xbb\xfb\xc1\xfb\x1e\x10Fwm\
+\x17\xca\xd5\x8b\x0e?\xef\xae\xdcV_S@\x01\x93\xff\
+r8\xe2\xbe\x8e\x11tc\xbd~r\x10QC,\x04\
+9x\xc3\xca55\xeb\x95\xca\x0a\x06\xa3\xab\xd8\x91^\
+\xab{\xf9\xd9\xe7\xfa\x9a\xff\xf9\xf5\x87\x1f\x91\xf0\xff\x7f\
+\x9dO\xca\xda\xdbf\xd0h\xb4\xce\x9bH]\xd8\xa6\xfd\
+\xf1\xc4\x00N%x\xe5\xc9:D\xb4\xfa\x5c\x94\x01\xcd\
+\xf98\xad\xd14\x04\x11\xc7.D Gn\x18\xdan\
+_\x9b\x90\x90G\xce\x94R\xa9\xd4\xe6\xc6\xa6\xee\x0b\xea\
+\xde\x7f\xeb\x10y\xe9\xbf\xbb\xf0\x15*\xfeI\xbf\xfb\xe6\
+[\xb999\xe4\x87\x91\xc6\xb0w\xdce\xf3\x90\xff\xd5\
+\x0b\xb3Q\xf1\xea[I$Z/\xe0\x07\xa7\xa7\x13\x0b\
+\x9f kF\x0e\xdb\xb0\xb5\xd5\xbaD(T\x90\xd7\x99\
+\x1b\x11\x01I\xc1\xb7\xe7\xbe\x00\xfe\x8f\x1fy\x9f\xfc\xe1\
+\xe7g\xcf\xa1\xe5\x1f\xfc\xbf\xdf\xfe\xb8s\xdbmQ\x82\
+\xae\x14\xbe\xcc\x12\xf7\xe1\xfe\xc6~\xf9/\xc8\x95 \xc1\
+\xd5\xb7b0\x98\x90\xc6z\xc7\xbf?*\xff\x04\xa4M\
+\xa6\xe9\xce\xbd\xf9*e\xfa\x9e\x1d\xbbN\x7fx\x9c\xfc\
+\xbf\xa7\x8f\x9fD\xce\xff\xff\xfd\x13\x0e\xb5Mo%\xc3\
+!\x06\x9d:\x7fz\xe6w\x1f\xf5YG\xe5\xe7Sm\
+!\xc1\x81P\x02=5\xb5\xc2;\xf8\xc1II%A\
+\xc4b\x099r\xc0\x86\xbfkk\xafMO\xb7\x91\xbb\
+\x0c(\x14\x0a\xb9\xf97\xc8U\xf1C\xb4~\xfb\xf57\
+\xb3\x0d\x06\xf2\xb3E\xf3\x99\xb7o.r9;\xf4\xdc\
+#\x0eT\xc4\xfaPaa\x91\x03\x9a\xf0\xefa\xb9\x9c\
+x\xfc\x17\x00\x8b\xff\x87\xcc\x95\x95\xabz\xd4\x099\xfc\
+\xd6\xdb\xc8\x99\xefa\x08\x87\xee\xb9\xf3\xae\xe8\xa8(\xf2\
+\x13jUQ\xfbw\xd4\xf7\xe0\xff\x8a\xd9\x81P\xedD\
+\xa5\xaa\xf7\x1a~p|<q\x0a\x89D\xa2B\xce\xd5\
+\xc8\xb2\xd18\xc5\xf9\xd4\xb8\xbc\xb4l8\xa4\x00\xbd\xfd\
+\xcd\x17\x17Z\xa7M'7)P(AM\xf5\xa9\xe7\
+\xdf\xbd\xf4\xb0,W/B\x09\xae/\xc4\xe1\xc4\x0c\x06\
+~\xb0TJ\xcc\x1bH\xa5:\xe4D\x8d8WW_\
+#\x93\xe5\x90{\xcd\x04|\xfe\x13\x8f<\x86\x1cx\x97\
+>t\xf0\xed\xc2\x02\x0b\x09L8\x8b\xb1~\xb9\xf1\xd7\
+\xd33~\xf8\xb8\xb5\xfb\x11{#T\x99\x99\x8d\x83\xe4\
+?&\x86\xa8`\x00\xf7\x119N#\xd4fs\x1b\x84\
+\xa0\xe4\xed\x98\xdc<\xe9\xe27\xdf\x22\x07\xde\xa5\x9f|\
+\xf4q\xe7\x22\xd2DY\xc4\xa2\x19Zd\xd4\xfaH\x5c\
+\xaet\x90\xf0\x83\xc5b\xa2\x0aSb\xa2\x199H#\
+\xd755\xeb\x13\x12\xf2\xc8\x81@.\x97\xbf\xfa\xd2+\
+\xc8iw\xe9\xdf\x7f\xfc\xb9c\xe3\xb5<.\xb7?\xb2\
+F\x86\xd4\xea\xb1\x83\xe7_(T\x06\x11\x15\x11\x8b\x90\
+S4\xd2m2\xb5\x92+\xc9!\xde\x9e=s\xd6\xd0\
+/\x0a\xf2\xd0\x90\x14,Y\xb8(8xd\x1f\x01\xcc\
+f\x0b\x07\x0f?8**5h\xa8+?\x07\xacm\
+\xb65Ba*y\x83tZ\xedp\x9b\x17\xed\xee\x0f\
+\x8f\x1c\xad,\xaf@\x8a\xf0\xa0\xa4T:|\xc2?\xb9\
+\xf9W\xa1(E\x0eO\xa0\xb8C\xadvP\xa9\xc4\xa2\
+2V\x18\xeb\xb6[\xb6\x22G\xdd\x8d\xf7\xee~&]\
+\x99\x8e\x9a\xe5\x01\x0b\xc6Y/\x96\xba\xb94\x9fO\xe4\
+Dii\xe5\xa8\xb1\x09(\x97\x94,\xe4p\xba\xb6\xae\
+\xd79\x1c\xfe\xdb <x\xff\xf9\xf3\xaf[o\xba\xd9\
+\xf9\xa4`Dh\xa0;\xbc\xdc\xf2OT\xfe\x0f\xe0\xe2\
+\x0f\xa8\xecpl\x94\xcb\x8d\xe4\xfd\x8a\x91H\x9e\xdb\xf3\
+,r\xd4\xdd\xf8\xc7o\xbe[\xb3r\x15Y\xcek\x98\
+\x8bJ\xa5\xe5\xe5\xcd\xf1\x15\xff\x91\x91\xf2 \xe2!\x9a\
+\x1d90\x01i\xa3\xb1\x85,OJ\xa1P&\x8co\
+\xfc\xf6K\xc4+E\xdd\x1b\xc6)H\x8dCC\x07v\
+\xc4\xed\x10K$R\xf9\x0a~0\x8fG\x9cB\x9e\x91\
+Q\x8d\x1c\x95@\xb5\xcd\xb6Z,V\x92\xf7N\x1a\x1b\
+\xdb\xe3\xa4\xe0a\xe83'NM\x9a\xd8L.\xa2\x1b\
+\x86\xca\xcc\x1c\xefC\xfe\xc9\xe2?\x1aM-rN\x02\
+\xdbYY\xe3\x9d\x05\xdb\x9b'L\x1c\xe6\x03\xc1\xffu\
+N\x10\xd5\xd6\xd4\x0c\xb7\xd2@\xa1\xa1\x11>\x84\x1f\x1c\
+\x11A\xd4\x84W\xab\x1d\xc8\x09\x09xw\x1f\x08DB\
+\xe1}w\xdf\xf3\xbf\xdf\xfe@\xce\xb9{\xbf\xf1\xdf\x03\
+\xce\xb5\x13\xc3A2\x99\xc9\xb7\xfcs\xb9\xc4\xf6g\xb5\
+\xba\x069\x1e\x97\x89\xb3\xb3'8+1\x16\xe4\xe7\xbf\
+\x7f\xe80r\xc8\xfb\xf5\xde\xdd\xcf\xe8\xb4\xc3b\xbd\x84\
+\xc10\xd5\xd7\xfc\x13\xf1\x0f\x8e\xff\x87\xd2\xd5\xd5\xd7t\
+n\xab$B\x0b\x06\x83\xb1h\xfe\x82\x1f\xbf\xf9\x0e9\
+\xe4\xee\x0dC\xd5#\xdb\x1fR\xa5\xa3,\x13\xcdd\xf2\
+|\x0b\x7f\xe1\xa5\xfc\xb7\x0a9\x15\x97\x9b\x8b\x8a\xe6r\
+\xb9]\xa7T\xc7H$w\xdfq\xe7\xdf\xbf\xfe\x8e\x9c\
+s\xf7\x86O\xf8\xd8C\x8f\xa83\xd4H\xf8\x97Js\
+\xfc\xc0\xbf,\x88\x98\xff\xc4\xfc#p]]GVV\
+\x83\xb3\xd6\x8a63\xd3WGi\xf8\xdb\xcf\xedy6\
+K?\xd4\xdbg<)\xe6?PGF&\x04\xe1\xf9\
+\x7f\xa4\xae\xae^\x97\x94\x94O\xa5v\xcd7\xd6TU\
+\x7f\xfc\xde\x07\xc8\x09\xef\xd7\x10\x11\xed|\xe2I\xbdN\
+74\xf03\x18a\xbeZ\xf3\xd0\xdd\xff<\xff\xb5!\
+\xc7\xe02wi\xe9\x12\x91(\xed\x9f{\xcd\x98\xda2\
+\xc5O\xc7\x0a\xf8\xdcO\xefx\xca\xb9\xdd\xd8\x7f\x12\x89\
+2|\x0e\x7f\xe1?\xeb\x7f\x94\xca\x0a\xe4\x00`\x83\xf3\
+\xf3\xdb##\xe3\xc8;\x1e\x12\x122{\xe6\xac\xe1\xb9\
+\xb3\xb2\xb7\xf7\xecz\xda\x98\xeb\xc7R\xa2ii\xd5\xfe\
+\xe0?*\x8a8\xc1S\xa1\xb0\x22\xbf\xf5\xd8\xff\xb8#\
+'\xa7\x99\xcd\xeeZ\x90\x16\x16\x16\xb6x\xc1\xc2/\xcf\
+}\x86\x9cpO\xfc\xe0}\x0f\xf8\x89\xff\xdc\xdcv\x7f\
+\xf0O\xee\x7fIN\xb6\xa0\xbe\xe9\xd8\xffr]\xddf\
+\x9dn,\x8b\xc5w\xb6\x02\x18\x0b\xce\x9e\xfc\x049\xe1\
+\xee}\xe0\xe5\xfd\xfe\x80?4\x94\xe3\x0f\xf8\x0b/\xed\
+\x7f4!\xbf\xe3\xd8\xbd\xddY\x92\xfaR+\x08\x0e\x0e\
+\x9e\xdc<\xe9\xf8\xfb\x1f\x22\xe7\xbc/?\xfa\xe0\xc3\xfe\
+\xe0\x1fzi?\xf1\x8f\xf7\xbf\x0f\x7f\x93\xad\xc0y<\
+\x01\x95J\xads8\xf6\xbf\xf0\x12r\xda{{\xdd\xda\
+\xab\xfc\xc1\x7fR\xd2\x80\x0b\x9b{h\xa9\x94\xa8\x80\x1a\
+H\x87\xff\x06\xaa\xeb\xea\x88\xbc\xa0\xfb\xf9}z\x9d\xee\
+\x81{\xefCU}\xdd\xa5\xc7\x8d\xf1\xcbQ\x92\x1a\xcd\
+8?\xf1O\xd6\xbfr\x9e\x83\x8c=\xfc\x9d\x9f?C\
+(Lq\xb2\x11#\x91\x5c\xb5z\xcdgg>E\x0e\
+?X\x99\xa6\xf4\x0f\xff\x0d~\xe2\x9f\xac\x7f\x18\x15\x95\
+T^\xbe\xbc\xb8x\xbe\xc52\xdbln\x83~&'\
+g\xa2K\xe7\xe6N\x82\x17\xc0-\x80\x17\x17\x17/\x80\
+\xdf\xaa\xaa\xba\x1a\x9f\x9d1\xf4\xb6Z\x17C\xd4J\x16\
+#\x0d\xea|d0\xba\xbe\xfe\x85\xbd\xfb\x10\xae)\xfd\
+\xed\xe2O\xe4\x09}>\x97Ba\xf3\x07\xfc\x16\xcb\x12\
+\x81 \xc9'\x9f\x10n\x04$\xe9lv4\x9f/\x93\
+HTr\xb9Q\xa1(\xd5hj\x0d\x86\xa6\x82\x82v\
+h&\xb5\xb5\x9b\x903\x13x\x86\xceG\xa5\xb2\x87\x85\
+]*\xe9\x93\x92\x9c\xb2i\xfd\x86s\x9f\x9c\x19z\xfe\
+_~\xee\x05\x9f\xb0\xd4[2\x99\xd9\xe7\xf0\xe7\xe7/\
+ 7?vW8\x8b\xc1\xe7\x85\xca\xe38}9.\
+\x86\xcd\x8b\x08\xf1\xaet^h(\x1b\xc2Wh\x1d\x89\
+\x89f\xb5\xba&/oJi\xe92H\xee\x90S4\
+\xd2\x0d\xe3\xaf\xd18\x05.\xacs\x11\x05\xe4\xc8%E\
+\xc5\xf7\xdcy\xd7P\xae,]\xbet\xd9`A\xefC\
+b\xb1\xda\xb7\xf0\xe7\xe5\xcdf\xb3\x85\xce\xf7O\x92s\
+\x7f\xf8x\x00\xe7\xe6\x80\xff8\xdb\xfe\xcd\x87\xd3\xce\x1c\
+l>\xb6\xbf\xe9\xadg\xc7\xbe\xf0h\xed\xae\xfb\xaa\x1e\
+\xbc\xa5\xec\xc6\xab\x0bV\xce7\xcchV\xd5\xd9\x12\xf3\
+s$\x8a$\x1e'\xdc]\xa9%\x0a\x85\xcab\xf1!\
+\xa0MH\xc8S\xab\x1d\x10\x5c\xd9\xedk\x91\x135B\
+m\xb7\xaf\xc9\xc8\xa8\xea~gY,VS\xc3\xf8g\
+\x9f\xde\xfd\xd7/\xbf\xf9\x9b\x7f\xff\xad\x82\xe0\xf1d>\
+\x84?;{:y\xcaa\x18\x93\xde\xd6D\xd4k\x12\
+E\x85y}\x80\xa6'\xfe\xfe\xe3\xe9\xef\xbd4~\xf7\
+\xfdU\xdb6\x15A\xeb\x988Z\x01M\x03\xfeh_\
+\xdf7$\x84\x1d\x1d\x9d\x9c\x9cl\xd1\xeb\xc7A\xa2\xe1\
+plD\x8e\xd6\xc82\xe4q2Y6y\xb23)\
+\xb1H4\x7f\xee\x5c\xff\x95j\xff\xf6\xcb\xaf\xfc\xb7e\
+8,,\xd2W\xf0ge\xb50\x18\x04x\x5cN\xf0\
+s\x0f\x94\xed\xbb\xbf\x0c\xfe\x1d\x1aB\xf3+\xff}\xf9\
+\xe2\xf1\xd6w\xf7\x8d{\xf4\xb6\x8au\xcbr'\x8fK\
+\xcb\xd5\x8b\x5c\x0e\x160Fp\xb91\x90S\xe8tc\
+!\xef\xc3\xe9\xb6\x87\xae\xa9\xd9\x00\x1d\x08\x9f\xff\xaf(\
+\x17\xba\x95\xc5\x0b\x16\x1exy\xbfo\xb7\x1b<\xfe\xf0\
+\xa3~\x82?\xa8\xf3`_\x1f\xc1?\x99\xdc\x85-\x14\
+0_{\xd2\xf6\xc3\xfb\x8do\xee\xb4\x93\x7f\xe2\x97O\
+f i\x02=\xfc\xf7\xf9Y\xa7\xde\x98\xb8\xf3\x1e\xfb\
+\xd5Ks\xc7T'+S\x22{\xe7\x1a\xd0\xadEE\
+%\xa6\xa4\x14\xe6\xe6N\xc2\xc1\x92'./_\x01q\
+Qdd<Y\xa4\x97\x940:z\xca\xe4\x96]O\
+\xee\xf0\xc9\xf9\x95\xcd\x13&\xfa\x8f\x7f\xd0\xe0k\xfe\xe8\
+\xf5\x93\xc9\x03=e\xb1\xe1\x87\x9f\xad\x01\xf8\xc1\x1f\xbf\
+\xdcu\x02\xe6g\x87[\x90\xc3\xef\xd2\xbf\x9d\x99\xf1\xc6\
+\xee\xd1\x90VL\x18\x95\x9a\x9a\xc8\xebU\x90\x80\xc2\xe1\
+\x88\x12\x13M99\xcd\xb8-\xf4\xeb\xca\xca\x95\x90d\
+\x09\x04\xf2\xee\x85\x1d G\xa8\xaf\xad\xbd\xf7\xae\xbb\xbf\
+\xf9\xe2\x82w\xf0C\x0b\x8a\xe0D\xf8\x95\xffAn~\
+\xd1\xeb'\xd1\xe9\x04\xfc)\x09\x1c`\x9e\x84\x1f\xfc\xe5\
+;\xe3\xc8\xf7\x874\x169\xea\x9e\xf8\xbb\x8f\xa6\xef{\
+\xb8\x06F\x87\xea2y\x14\x9f\xe9\xaa-\x98a\x5c\xa8\
+\xaa\xba\x1a9l\xc3\xd96\xdb\xea\xcc\xcc\xfa\xa8\xa8$\
+\xf2tWR\x10\xc0C\x0e{\xc5\x92\xa5/\xec\xdd7\
+\xa0A\xe1\x89G\x1e\xf3+\xfc\x04\xb7)\xe5\x83\x89\xf9\
+I\xf8\xe5q\xec\x8f^\xba\x04?\xe9\x90\x10\x22my\
+\xfd\xe9\xd1\xc8\xd9\x1e\xa8!X:\xfa\xe2x\x18\x1a\xea\
+l\x89=\xda\x02\xdcV\x88{\xd3\xd3m%%\x0b\x91\
+\xc36\x9c\x0d\x83\xa6N7&&F\xed,OD\x8a\
+\xc9d\x96\x14\x15\xaf\xbfz\xdd\xc1\x03\xaf\xf7;wT\
+SU\xedo\xfecc\xf5\xde\xc1\x9f\x93\xd3J\x96\xe0\
+\x93\x8aY\xef?\xe7\xe8\x01?8Z@4\x8d]\xf7\
+U!\xe7\xd9WmA\x10\xf9\xaf\x0a~Lf\x84\x5c\
+\x9ek4\xb6@>\x88\x9c\xb7a\xeb\xba\xba\xcd\x85\x85\
+s\x95\xca\xf2\xce\xe8\xe8_9\x17\x8f\xcb\xad\xad\xa9\xe9\
+\xd8x-d\xcd\xbf]\xfc\xa9\x07\xfc\xe7>9C\xa7\
+\xd3\xfd\xcd?\x8f\x17\xef\x05\xfcyy\xb3\xc8\xa9Nq\
+t\xd8\xa1=5\xbd\xe1\x07+\x93\x89\x17\xdcy]1\
+r\x86}\xe5\xbf\xce\xcd|m\xd7\xa8+\xe7e\xe92\
+\xa2\xba\xe7\x0bT*](L\xd1jG\xe1L\xc1\xbd\
+kj\xd6Cw\x91\x90`r.:u*888\
+';{\xee\xec\xd9\x0f?\xf0 \xb9\x1fa\xcd\xcaU\
+\xfe\x86\xbf\xf3\xef\xb2\x06\x0a\xbf\xd9<\x8f\xc5\x22\xb6\x11\
+A\x7f\xf8\xd6\xae*\x97\xf0\x83-\xb9\xc49\x80\xd7\x5c\
+aD\xce\xad?\x0cy\xfd\x1d\x1d\xc5\xf5\xb6\xc4\xee3\
+\xab\xd0\xbfEG'\xc3\xb8\x8f\xd3\x84~]^\xbeB\
+\xaf\x1f\x07\x03(\x87#\xee1.\x04u\xae\xbe\xe3F\
+\xf87\xf3u\xcad\x9a\xeb9\xfc\x05\x05\x8b\xc8\xda\x86\
+\xac0\xfa+\x8fT\xf4\x05?x\x8c]\x06/\x9b7\
+M\x83\x9cU\xbf\xfa\xf7\xb3\xed/<Z;w\xaaF\
+\x22buo\x08Ba\xaaN7\x167\x04O\x5c]\
+}\x8d\xd9\xdc\x061\x92H\x94\x16\x1c\xdc\xe7\xe3K?\
+i@\x95o\xa3\xa3\x89\x95\xa8t\x1a\xe5\xd1[\x0a\xdd\
+\xc0\x0f\x9e\xd5L\x94\x1dh\xa8MA\x8e\xe8\xd0\x18\xa2\
+\xa3\xfd;\xeag\xb5\xa8\xc5\xc2K\x0d\x81J\xa5\x09\x85\
+\x0a\x83\xa1\xc9\xe1\xc0\xeb\xf4<tGi\xe9Rrh\
+\xe0\xf1\xa4\xe4\x917~Urr\xa9\x87\xf0\xcbd&\
+\xf2Wn\x5c\x93\xe3\x1e~\xf0\xda\x05Di\xc7bS\
+,r2\x87\xbe!\xbc\xfcD]\xfb\xa4\x8c\xee+1\
+\x18\x0cfb\xa2\xa9\xb8x\x01j\xbaF\x98!}.\
+)Y\xa4\xd77$%\xe5GG\xa7t.I\xf5q\
+\xedh\xa10\xdd\x13\xf8\xd3\xd2\xba&\xa3\x96\xb4\xa9\xfa\
+\x85\x1f|\xeb5\xc41%*\x05\x1f9\x90\xa8\xfc\xe7\
+\xa73!4jiP\xb2\xc3/-_\xe7rc4\
+\x9a\xba\xea\xeau\xc8\xd1\x1a\xa1v86\x96\x94,\xcc\
+\xce\x9e\x08\xf1\x92T\xaa\x8d\x8c\x8cs\x16\xfe\xf5NL\
+&\xb7_\xf8u\xba\x89\xe4\x22X\x88\xea\xbf\x7f\xaf\x7f\
+\xf8\xc1O\xdeV\x14\xd4\x99##\xe7\x10\xb9/\x1eo\
+\xbd\xf3\xbab\x93A\xec\xbc\xe64\x1a\x1d\xee\x1d\x04\xbd\
+uu\x1d\xc8\x89\x0a\x00\xd7\xd6n*+\xbb\x02\xae'\
+\xe4\x5ciie\xf1\xf1Y0XDDH\x98\xcc\x08\
+\xb8\xd4\xfd6\x01\xf7\xab L\xa69!!lxY\
+fz\xe4\x97\xef\x8c\xf3\x04~\xf0\xeb;l\xe4\x9b\xff\
+t\xb2\x0d9\x81\xc3\xc4\xc7\xf67-i\xd7\x89\xa3/\
+\xc5E\xe1\xe1\x82\xcc\xcc\xba\x9a\x9a\xf5\xc8\x11\x0a`\xc3\
+\xe5\xad\xa8XQT47#\xa3\xca%\xff*U}\
+_\xf0[,K\xc9\xfd,Q\xfc\xd0\x0f_\xa8\xf5\x10\
+~\xf0\xb97\xbb\xf6,\x8f\x94%\x10CfH\x10\xf6\
+=\x5c3\xca\x9e\xe4\x5c\x83G\xa7\x87&&\x9a+*\
+\xaeD\x8eJ`\xdbd\x9a\xee\x92\xff\xb8\xb8\xdc\xbe\xf8\
+\x8f\x8f'\xc2\xf8\xe0`\xea\xbe\xfb\xcb<\x87\x9ft\x04\
+\x9b\x98\x1b\xdf\xfbP\x0dr\xe4\x86\xa7\xcf\xbd3y\xd9\
+,=\x9f\xd7\xf5X\x99B\xa1\xc6\xc6j\x0a\x0b\xe7 \
+\xe7$Pm4\xb6\xb8\xe4\x9f\xcb\x95\xba\x84?#c\
+\x14\xf9\x82\xff\xac\xca\x1e(\xfc`U*\x0f~\xf7\xf6\
+\xcdE\xc8I\x1b\xce\x86\xf8p\xeb\xc6BE\x12\xcfy\
+;x\xbc\xb8\xec\xec\x09x\x0b\xa7\xcf\x0dW\xd5%\xff\
+4\x1a\xc3bY\xd2\x03\xfe\x9c\x9c6r\xa7O}E\
+\xbc\x17\xf0\x83+,\xc4A\x0c\xab\x16\x18\x9036\xfc\
+\xfd\xf7\xf9Y\xcf<P]f\x89s\xae\xac`2\xb9\
+\x10\xafVW_\x83\x1c\x9b\x80\xb1V;\xca%\xffA\
+\xc4S\xb0\xc6\x1e\xcfy\xc9\xfd\x9eri8D\xf2\xde\
+\xf1?\xb5\x81\xa8'3il\x1ar\xbaF\x90?~\
+\xb5iv\x8b:\x8cI\xff'5\x08\xe9L\x0dV\x22\
+\x87'\x00\xacP\x94\xf6\xc5?\xc4\xf9\xdd\xf9'\x0bx\
+B\xd8\xbf\xffQw\x8b\x1c\xdc{\xcd\xfcLx\x93\xa2\
+\xbc\xcb\xee\x11\xd8\xe0}\xe1\xbd\xa9k\x16\xe5\x08\x05]\
+3ET*-.N\x8f\x17]\x0f\xd22YN_\
+\xfc\xb3\xd9\x22'\xfc*U=\xf9\xc3\x8d\xcb\xf4^\xc3\
+\x0f\xbe\xbb\xc3\x0co\x22\x8da#\xc7i\x84\xfa\xd7\xd3\
+3 {R\xa6D:oStt\x8a\xc9\xd4Z_\
+\x8f\x9f\x1axc\x91\xc8M\x1d9\x8a\xc9D<\x05\xc8\
+\xcb\x9bM\xeed\xb7\x15\xc7z\xf8\xa8\xab/\xef\x7f\xac\
+\xb2\xb3\xef\xa2\xfc|\x0a?\x02\xf0\xdedjPb\xbe\
+T\xa2\x93\xc3\x11B(\x8b\xf7\x1d\x0c\xd4\x5cnl\xdf\
+\xfc\x07)\x95\xc4Y\x18\xe4\xd1E1\xa2\xb0O^\x1d\
+5\x18\xf8\xc1\x9f\xbf5\x96\xcc\xe6\x8e\xbc\xd0\x80\x9c\xa2\
+\x00\xf0\xe1\xe7\x1b\xa65\xa6\x87\x86\xd0\xfeI\x0dB\xe5\
+\xf2\xdc\xd2\xd2\xa5\xc8\xb9\x1a)v\xbfRB$R\xa5\
+\xa4\x94\x93=\xf6\xb3\xf7\x95\x0e\x12~\xd2\x12!1\x94\
+<v[\x05rx\x02\xc6\xe7\xdf\x9d\xbct\xa6\x8e\x17\
+\xd1U\x84\x87B\xa1\x88\xc5\xe9fs\x1b\x0e\x8a\xdc\xdb\
+\xe1\xd8\xd4{\xa3Aw1\x18L\x1a\x8dxb\xd5>\
+Q\xe1\x13\xf8\xc1\xf9\xd9\xc4$R\xa0\xee\x82A\xe8\x8b\
+\xc7[o\xbc\xba 9\xe1R\x89N\x0eG\x94\x99Y\
+\x87\xe7K\xfb\xb2\xd5\xba\xd8\x0d\xfcN%\xc6\xb3=_\
+\xe4\xd3\xaf[\xc6$\xc3{N\x1e\x87\xa7@\xfd\xe5\xb7\
+\x9e\x1d\xdbT\x9f\xea\x5cJA\xa3\xd1cb4\x9d\xc3\
+\x01z\xe4\x86\x95ss'\xf5\x0b\xbf\x0f#\x1f\xd2\xeb\
+\x97\x10\x07\xc1\xe4e\x89\x91s\x12\xd8\xfe\xecp\xcbU\
+Kr\xe2b\xd8\xce[\x19\x11!\xc9\xcc\xac\xc7\xc3\x81\
+\xd3\xe9\xe9\xb6~\xf9\x87\xb4w\x90s>=\xfc\xe8-\
+\x85\xf0\xb6|\x1e^\x05=\x14\xfe\xeb\xdc\xcc]\xf7U\
+\xd9Kd4Z\xd7Sd:=X&\xcb\xb6Xf\
+#\xc7\x0f\xb9\xa5R\xad'\xf1\xcf\xde\xfb}\xd9\xff\x1f\
+\xdd\xe7 \xdf\xf6\xdc;\x93\x91\xe3q\xf9\xf8\xcc\xc1\xe6\
+\x15s\xb3\xfe\xbd\xd0:J\xa9\xac\xb8\x9c\x9f#w\xaf\
+_\xedFS\xc7%\xfb\x90\x7f\x18M\xb8\x1c\x22\xa7\xde\
+}\xff\xc8.\x044\x12\xfd\xe7\xa7\xc4Bk\x18\x0e\x9c\
+k\x8a(\x14\x0a\x9f/\xd3jG_n;\x0e\x1c\x8e\
+\x8d\xee'\x7f\x9c\x8a\xe4\x86|u\xa8\xc1\x87M O\
+\x1f\x1d\x84\xa7\x80\x90\xfa\xc4k\x13V-0\xc8\xe3.\
+\xcd~\xd3\xe9!\xf1\xf1\x06\x93i\xfaeR\xf5\xba\xb0\
+p\xae'\xf0\x93z\xe8\xa6\x02\x1f\xf2?}<\xb1\x0a\
+n\x9c#\x199\x06\x97\xb9\xff>?\xeb\x95'\xebZ\
+\x1a\x94\xe4\xbe\x0cR\xc1\xc1,\xb9\xdc\x98\x9f\xdf\x1e\xd8\
+;15\x9aZ\xcf\xf9w\x94\xc5\xf9\x90\xff\x9b\xd6\x12\
+\x8b\x8e\xd2\x92#\x91\x03\x80M\xfa\xe7Sm\xdb\xb7\x94\
+\xd9\x8a\xe3\x83\x19\x97\x8e\x96\x08\x0d\xe5$&\x9a;3\
+\xe5\x00l\x08\xb1\xb1\x99\x9e\xf3\x1f\x12B\xfb\xf4\x0d/\
+\xd7<\xf7\xf6\xcb\x0fW\x04\x11\x03.u\x98\x9c\x05\x80\
+\xed\xf4\xb7\xc7\xa6\xdds\x83\x15\x12\x84\xee\xa7!\x84\x84\
+\x84\xc7\xc5\xe9\x8d\xc6)\x81t\xb6 \x939\xb0jr\
+\xd7{\xb5\xe1\xcb\xa5\xbf|g\x1c\x8dJ$`o\xef\
+\x1d\x8b\xfc\x8ec\xbb\xf4\x17G\xa6lYo)\xc8\x95\
+P\xa9\x97\xaa\xeb@\x8e\x10\x13\xa31\x18\x1aGz\xb5\
+\x96\x8a\x8a\x15\x03\x82\x1f\xa4L\xe6\xfa0\x04JM \
+Z\xdf\xb6Mx#\xe4p74\x84\xdb\xae-\x82\x11\
+\x81\x19z\xa9l\x08\x85B\x8d\x8aJLO\xb7\x15\x17\
+\xcf\x1f\x89iBV\xd6\xf8\x81\xf2\x0f\xda}\xb7\xd5W\
+\xfc7\xd4$\x04\xe1\x8d`#\xca?\x9eh}\xfc\xf6\
+\xca\x09\xa3R\x9d\xdb\xf3IAt$\x95j\xf5\xfaq\
+\x95\x95\xab\x90\x83\xed\xa1\xe3\xe3\xb3\xbc\xe0\xbf\xda*\xf5\
+\x15\xff\xffY\x95\x0do\xa8H\xe2!\xbf\xad\xd8\x03\xf5\
+\x1fg\xdb\xf7\xef\xa8_17+K\x13\xdd=:\x0a\
+\xea\xdc\x86 \x97\x1b\xa1w\x1d\xde\x8f\xd5:\xbc+\x10\
+G\xa7Q>x~\x00\x05\x7f\xdc\xf8\xc0\x13\xc4\xd2\x0b\
+\x0a%\xe8\x9b\x0f\xa7!\xbf\xa1\xd8^\xfb\xc2{S\xb7\
+o)\x9b8Z\xd1\xfb\x90Y&\x93+\x95\xea\xb4\xda\
+Q%%\x8b\x86\xd53\x85\x92\x92\x85^\xc0Oj\xfe\
+\xd4t\x9f\xf0\xff\xed\xd1\xf1\xe1,\xa2\x06\xe6\x9e\xed\xd5\
+\xc8o\x22\xf6\xe0\xfd\xf7\xf9Y\xef\xbf<~\xeb\xc6\xc2\
+\xf1u)\xb1\x92\xf0\x1e\xd8\xd0h\x8c\xc8\xc8\xb8\x84\x84\
+<\x9dnlq\xf1\x02\xb4\x85\x5cT*\xbb\xd7\xfc\x0b\
+x!\x17|\xb4\x16\xba \x878\x0e\x03\xd7B\x09H\
+\x7f\xf2f\xf3\xbd7Z\xa7\x8cW\xa6\xa7F:\x97\xde\
+9E\xa5\xd2\x22\x22$\xb1\xb1\x9a\xb4\xb4\xd2\xec\xec\x09\
+\xd0\x22\x86\xe6\xe4q\x18\x86\xca\xcb\x97w\x1e\xcf\xea\xbd\
+6/\xcf\xf2\x09\xff\x8bZU\xf0ne\x968\xe47\
+\x0b\xdb\xaf\x86\xc4\xf9\xbfO\xd5\xffg\xad\xb9\xa9>5\
+-9\xb2G\xca\xf0\x8f(\x10/\xf1\xf9\xb2\xd8\xd8\xcc\
+\xe4\xe4B\x8d\xa667wra\xe1\x5c\xc0\xd5\x8b\xb9\
+V\x18_ \x19/*\x9a\x97\x977\x05F\x9c\xd4\xd4\
+\x92\x98\x185\x87#\xf2\xc9\xd9\x011\xa2\xb0\x0b\xef\xfa\
+`9\xd0#\x9d\x0b\xa1\xb9\x9c\x90\xbf\xce\xcdD~\x8f\
+\xb0\x87\xcc\x17\x8f\xb7\xbe\xb6k\xd4\x1d\x1d\xc5\x8b\xdbu\
+U\xa5\xf2$9\x97\xde\xeb\xe4\xf1\xdeb0\x98,\x16\
+\x9f\xcb\x8d\xe1rc\xa3\xa3\x93\x9d\x16\x89\xd2\xe0\x7f\x05\
+\x029\xfc\x9c\xcd\x8e\x86\xd7\x90\x870\xfaU\xde\x15?\
+\xec\xe1\xd3\x07F\x93]\xc1;\xfb\xf0S\xb0\xcb\xda\xbf\
+\x9d\x99\xf1\xdeK\xe3\x9f\xba\xdbv\xd3\xba\x82e\xb3\xf4\
+0L\x14\xe4J\x12e\x11\xce}\xfd^K(\x08\xcb\
+\xd5\x8b %\xb9r^\xd6]\xff)y\xf9\x89\xba\xbc\
+,q\xff\xbf\xd6\x9f\xa4b\xd6\xd7\x87}0\x04\xa8\x15\
+D\x89\xcbMW\xe6!\xbf\x05\xd8\xc3\xd3\xdf\x1e\x9bv\
+\xfa`\xf3\x91\x17\x1a \x82\xda}\x7f\xd5C[\xcbn\
+\xddT\xb8a\xb9q}/\xdf\xb2\xc1\xf2\xe0-e{\
+\xb6W\xbf\xfe\xf4\xe8c\xfb\x9b>?\xd2\x02\xcd\xaa\xc7\
+\xbb}yt\x0a\xc3\x83\xb1\xc6\x13\xdd\xb4\xb6\xff\x03\x8f\
+\xfa\xf5\xecI\xc4\x89`\xe5\x858\x05\xc0\x1e\x0a\xc3\xf8\
+\xe2\x13\xf8A\xb2\xd8\xf0o\x8e\x8c\x1f$\xffOl#\
+N\x84a\x851z7Ull\x9f\x1bb!_\xf1\
+\x0f\xda\xbc\xc20H\xfe\xbfx{lp01\x1e\xbd\
+\xf4x\x1d\xf2\x8b\x83\x1d\xd8>\xf9\xfaD\x8aO\x0f\xca\
+\x13\xf0B\x06\xbf(\xda\x94E\xec\xc1\x84\xf4\x04\xf9\xf5\
+\xc1\x0el\xafZ`\xf0%\xfd\x9d\x9a\xdb\xa2\x1c$\xff\
+\xcbg\x11e\xa5\x8dz\x11\xf2\xeb\x83\x1d\xc0\xfe\xe3l\
+{\xf7\xe3\xc8}%\x88^\x8e\xec\xad\x19\x0c\xff\xcfo\
+/\x0b\xea\xdc\x0b\xf3\xddG\xd3\x91_%\xec@\xf5\xe3\
+\xb7W\xfa\x1c~R\xb5\x83\xdb\x1a\x09I4/\x82\xd8\
+|\xfa\xd0\xd62\xe4W\x09;P]Z \xed\x97d\
+\xef\x049\xc5\x9e{\x07\xb5/`l\x15q\x9a\xe4\xd8\
+\x1a\xbc\x1d\x1e\xdb/>~`\x82o3\xdf\x1eJM\
+\x88\x18L\x81\x94\xfb\xaf\xcf\x877\xe1\x84\x07\xffz\x1a\
+\xcf\x82b\xfb\xde\xf3\xa7\x0f`\xab\xbbw\x824\xd6k\
+\xfe\xbfx{,\xb9\xb7\xee\x99\x07\xf0Zhl\x1f\x1b\
+\xf2\xca\xee\xd5]\xfc$H\x84\x0f\xee\xac\xf2\xba\x09T\
+\x14\x12\xc7pLoJG~\xb9\xb0\x03\xccW-\xe9\
+\xf3\x84/\xdf\xca\x94\x15\xedu\xa5\xdc-W\xe5\xc2;\
+\x88\xa3\xc3\xf0ZPl\x1f\xfa\xe7Sm\xd1|\xe6\xd0\
+\xf0\x0f\xbaa\xb5\x97\xebBO\xbd:\x8a\xac\x88r`\
+\xe7(\xe4\x17\x0d;`\xec\xc3\x05?\x9e(\x9c\xc58\
+\xb4\xc7\xcb\xc7\x010|\xc0;\x94\x16Hw\xdec\xc7\
+\xcf\x02\xb0\x07\xef?\xce\xb6\xcb\xa4\xde\xecs\x1f\x8c\x0c\
+\x1a\x81\x17\xeb\xe2\x8e\xbdX\x1b+\xbe\xf4x\x8eF\xa3\
+\xe8\xd5\xd1\x0b\xdb\xb4\xbb\xee\xab\xfa\xfec\xdc\x16\xb0\xbd\
+\xf1\x1d\x1d\xc5C\x0c?\xa9e\xed\x19\x03\x82\xff\xec\xeb\
+\xa3\x95\xc9\xdcno\xf0\xaf\xb9Z:\x9d\x9a\xa5\x89\x9e\
+\xdd\xa2\xde\xbe\xa5\xec\xf4\xc1f\xe4W\x15{D\xf8\x97\
+Of\xf4\xde\x86?4\xa2\xd3(\xcfo/\xf3\x10\xfe\
+\x0b\xef6\x90\x91\x0f\x8d\x16\xccbE\x05\x11\xe7\xce\x1b\
+\x8a\x8a\xe6fdT\x8b\xc5\xe9\xc1\xc1=\xabj@\x8e\
+\x5c[\x99p\xedJ\xd3\x7f\x9f\xaa\xc7\xe5C\xb1\xfb\xf2\
+\xe6U&\x04\xe8\xff#\xb94\x1cz\xf5~\xe1\xff\xee\
+\xe8xGY\x5cPg==\xb5z\xacRY\x13\xd4\
+Yd\xb2\xdbY\x0c\x1dV\xeb\xe2\xcc\xcc\xfa\xd8\xd8\xcc\
+\xde5\x8b\x18tj\xb6V8g\x8a\xe6\xc1[\xca\xce\
+\xe0\xa1\x01\xfb\x1fC\xfe\xd8\xa3H\xdd\xd0\xab\xc2\x12\xd3\
+\xeft(y\x10\x00(-\xad\xaa\xb0pYA\xc1b\
+\x06\x83\x98\xad\xd2\xe9\xc6\xb8\xdc\xd7_^\xbe\x5c\xaf\x1f\
+\x07\x03Dx\xb8\xa0\xf7_\x14\x0bY\x8e\x8a\x84\xb5\x8b\
+sv\xdf_\xf5\xf9\x91\x16\xe4w\x01\x1b\x95W\xcc\xf5\
+\xa6\xbc\xa1\xcf\xb5\xc2\xedC\xe1U\xf3\xba\x9eJ'$\
+X\x00~\xd2\xb1\xb1z\xf8\x09\x8f\x17\xd7o\x8d\x0b\x9b\
+m\xb5\xd1\xd8\xa2PX\x85\xc2\xd4\xdea\x12H\x22b\
+\xd9\xad\xb2U\x0b\x0c;\xef\xb1\xe3\xb3\xc6.\x13\xffq\
+\xb6\xfd\xd5\x9d\xa3\xc8\xd2j\xc8E\xa5R\x9e\xbc\xad\xc8\
+%\xfc\xb7^c$\x97$\xc5\xc4\xe8\x9d\xf0\x83\xb3\xb2\
+\xa6\x90\xbf[R\xb2h@%_`h\xc8\xce\x9e\x90\
+\x9cl\x11\x08\x12 \x82\xea\xfda\xa2\xf9\xcc\x12\xb3t\
+\xde4\xcd\x9d\xd7\x15\xbf\xf5\xec\xd8\x9fO\xb5!\xbfY\
+\xd8>10\x7f`\xe7\xa8\xf5\xcb\x8d\x15E\xf1\xec\xf0\
+aA\xbeS\x91\x11!\xbd7\x08<~k\x11\xb9\x0d\
+?*Ja\xb1,\xed\xce?\x98\xcd&*T$&\
+\x9a\x06S\xe6\x0b\xb2\x06\x88\x94\x12\x12L0\x94\xb8\xac\
+zD\xa3QR\x12\xb9\xa3\xecIk\x16\xe5<yg\
+\xe5\x89\xd7&\xe0G\xcf#\xc8\xd0}\xed\xdfQ\x7f\xd5\
+\x92\x9c\xd2\x02)+lx1\xdfC)\x09\x9c3\xaf\
+]\xca\x85_~\xb8\x82\x15F\x00\xc9\xe5\xc6A\xc0\xdf\
+\x03~pJ\x0a\xb1#\x06\x12\x01_\xd5\xc4\xab\xad\xbd\
+\xd6j]d04\xa5\xa6\x16\x8bD\xca\xb0\xb0H\x97\
+\x9f34\x84\xa6V\x0aFW%]9/k\xfb\x96\
+\xb2\xb7\xf7\x8e\xfd\xf1D+\xf2\x1b\x8dM\x1a:\xf9w\
+\xf7\x8d\xdb\xb6\xa9hj\xa3R\x93.\xe8Q2\x8bB\
+\xa1BG\x97\x98h\xa6\xd3\x11\xa7\xbd.\x95\x9f-$\
+\xeb\x05\x1dz\xa6Z\x10I|B\x16+\xcal\x9e\xdf\
+\x1b~0\xfc\x9cF#ZtV\xd6x?\xd5\x81\xac\
+\xae\xbe\xa6\xb0p\x8eV;\x1aF\x99\xa8\xa8D\x97\xe9\
+CP\xe7\xd6\x86\xb8\x186\xf40\xb3[\xd4[\xd6[\
+\xf6=\x5cs\xf2\xf5\x89p#\x90\xc3p9\x18zx\
+\xe8\x82\xee\xb9\xc1:g\x8a\xc6\xa8\x17u?}\x83\x14\
+D\xb9\xd1\xd1\xc9iiefs[M\xcd\x86\xfa\x01\
+\x1ei7\xc4jt$\x9cx\xa5^.%\x1eI\x84\
+\x86r\x8c\xc6\x99.\xe1'-\x16\x13\x9b\x82\xf9|\xb9\
+\x9f\xf8w\x99M\x9bL\xad\x19\x19U2Y\xb6@ \
+\x0f\x09a\xf7\xf5E\xa0\xe7\x91\xc7q \x95\x98\xd6\x98\
+\x0e1\xe7#\xdb\xca\x0f\xee\x19\xf3\xf5\x07S\x91\x033\
+\xa2\xfd\xfb\xd9\xf6\xa3/\x8e\x7fhk\xd9\x8a\xb9Y\x8e\
+\x8a\x84DYD\xef\xaa\xb9\x14\x0a\x85\xcd\x8e\x92J\xb5\
+j\xb5\xa3\xa8h^\x8f\x9a\xea\x95\x95\xab\x86g\xe7\xef\
+\x14\xd9\xf33\x18\xa1\x06\xc3T7\xf0\x83\xb3\xb3\xa7Q\
+:\xd3c\xf8\x9aC\xd6\x04z\x8f\x11\xc5\xc5\x0b \xa7\
+V*+\xe2\xe2\xb2\x22#\xe3\xfb\x1a&Hq9!\
+ZUT\x9d-\x11\xfa\xab\x8d+\xf2\xee\xbb\xd1\xfa\xd2\
+\xe3u\x1f\xbf\xda\x84\x13\xed\x1e\xfe\xf5\xf4\x8c\x0f\xf77\
+\xee\xba\xaf\xea?k\xcd\xb3Z\xd4\x90\xb4&'p]\
+\x96e#\xcbD\xc7\xc7\x1b\xa0c\xb7Xf\xb9?\xa1\
+[\x22Q\xf9\x89[\x1f\x0aRQ\xad\xb6\xc9=\xfc\xa4\
+\x05\x82$x}ll&*\xfe\xfbh\x14\xeb\x8a\x8a\
+\xe6\x1a\x0c\x8dii\xa5\xd0\x11A\xa3\x80\xb1\x8c\xd2\xdf\
+\xe6:^D\x882%\xb2\xbc0n\xd2\xd8\xb4\x95\xf3\
+\x0d\xb7l\xb0\xec\xbc\xc7\xfe\xc6\xee\xd1\x10M\x05\xea\xea\
+\xa6\xbf\xce\xcd<\x7f\xa8\xe5\xcdg\xc6\xec\xb8\xcbv\xe3\
+\xd5]U=-\xc6\x18\x88'\xfb\xa8\xffL\xc4\xf0,\
+\x16_$JKN.\xd4\xe9\xc6@\xd7\xe7\xf9q\x93\
+99\xcd\xbe\x87\xd5\x0f\x02T\x14\x0a\xbb'\xfcC3\
+\xe9|=\xb5\xa2b\x05r\xec\xdd\x1b\xf2k\xf8\x90\x05\
+\x05\xb3 aIO\xb7%$\xe4A\x96\x1d\x11!&\
+\x9f\xe5\xf5+\xe8\xfaDQa\xd0@\x0ar%\xb5\x95\
+\x09\x10V]1[\xbfy\x95\xe9\xee\xebKv\xdek\
+?\xb0s\xd4G\xff%\xaaY~{l\xb8\x1c\x94\x03\
+#\xda\x97G\xa7\x1c\xdb\xdf\xf4\xea\xceQO\xddm\xbb\
+\xa3\xa3\x18\xe2\xc0\x05\xad\x99\x13G+l\xc5\xf1\xd9Z\
+a\x8c8\xbc\xdf2\x9b0\x98\xf2xR\xa9T\x07\xc3\
++\xd0k\xb5.\xf6\xfapU\xbb}MH\x08\x9a\xa5\
+>^\x08\x9a\x80RY\xe3I\x13\xe0p$\xf0\xfa\xa4\
+\xa4|\xe4\x84{m\xc8\xcb\xac\xd6%&\xd3t\xe8\xd0\
+ SKH0\xc5\xc4\xa8\x05\x82\x046[\xe8]\x99\
+\xee\xd0\x10\x1a\x8c&\xf1\xb1l\x88\x19t\x19Q\xf99\
+\x12k\xbet\x94=\x09zWh8\x0b\xdb\xb4\xcb\xe7\
+d9K\xc2\xde\xba\xa9\xd0\xe9m\x9b\x8a U\x01\xdf\
+{\xa3\xb5\xfb\xcfIo\xddXH\xfe\x0a4\xbd%\xed\
+:\x08K\xe0\xdd\x80gxg\x88OL\x06\xb1Z)\
+\x80\xac\x07\xfe\xb4'\xb5\xca\xbb\x0b2)\x1e/.&\
+F\x03\xbdzff]^\xde\x14@\xdd}$3P\
+\x8b\xc5\xe9^\x5cI\x84\x82^==\xbd\xb6_\xfe\xd3\
+\xd3\xeb\x82:\x8f\xce\xb1\xdb\xd7\x22'\xd9\x1f\x86\x0c\x0e\
+\xf2n\xabu\x91\xd9\xdcf04AZ\xa7PXe\
+\xb2\x1c\xb8\xa1|\xbe\x8c\xc3\x11\x87\x85E\xc2 \x02\x97\
+\x0b\xf5\x1ds-:=\x98\xc9\x8c\xe0pD\x02A\x22\
+D\x83\xd0S\xa5\xa7W\xea\xf5\xe3\xf2\xf2\xa6\x16\x17\xcf\
+\x87\x84t\x08\xce9\x82?\x87\xfa2x#\xb8\xa7\xfd\
+\x8e\x02\x16\xcbR&\x93(\x90\x9e\x92R\x88\x9cU\xb4\
+v86\xc2(_Vv\x05p\x95\x9f?\xc3hl\
+\x81\x1cD\xab\x1d\xa5R\xd9SSK\x12\x13\xcdry\
+.\x18\xda\x0e\xf4\xb4\xa4\xc5b\xa5\xf3\x90\x08\x884\xb8\
+\xdcX0\xb0\xday\x8aDlwC[s\xbeR\x22\
+\xc9\x80\xdf\x85\xb7\x82(.%\xa5\x08\xda#\xfc\x09h\
+\x980~\xe5\xe4L4\x9b[!,\x87\x8f\x01=\x12\
+\xda3\xbcH\x97\x97\xaf`0\x86\xf5\x9c\x8f\x1bA \
+\x94\x9aZ\xe9\xbe\x09\x90\xcf\xc2\xa0\x9f\x09\xd4!\x00\xdb\
+kC\x03\x84\xc8\x0a5\xc5\x83Ur\xb2\xd5\x0d\xff\x05\
+\x05\x8bCC\x89\x93\xe2\xa1/B~\xc1\xb1\x87\x95\x93\
+\x92\x86to\xaf\xff\x14\x17\x97\xeb\xa6\x09\xa4\xa5U\x05\
+uf\x01\x10*#\xbf\xe6\xd8\xc3\xc4\x10\x01\xf6\xd8'\
+8\xa2%\x14*]\xae\x05\x22\xb3\x80\xf0pb\x83\x18\
+\x04\xa5\xc8/;\xf6ppE\xc5\x0a\xf7\xcf\x22G\xa2\
+x\xbcx\x93i\x9e\xcb&\xa0V\x8f\x09\xeaL\x99K\
+K\x97\x22\xbf\xf8\xd8h]S\xb3!\x22B\x82\x9aV\
+\xbf\x88\xc9\xe4\xf5\xb54\x82\xcb%2\x1d\x89D\x85\xfc\
+\xfac#uGl\xac\x065\xa7~\x14\x9d\x1e\x92\x91\
+1\xba7\xff:]\xd7\x03\xee\xfc\xfc\x19\xa8o\x016\
+2\xa7\xa7\xdb\xd0\xf29$\xa2@Fl\xb1,\xe9\xd1\
+\x04\xa2\xa2R\xe1\xbfq8\xa2\xe10\xf3\x8c=\xb4&\
+\xca \xa8T\xf6~\x97Z\x05\x8c8\x1cINN[\
+w\xfesrZ\xc9\x9d\x5cju\x0d\xea\xdb\x81\xedw\
+\xd7\xd5m.)Y\xa8\xd1\xd4B\xd0;\x04G\xba\x0f\
+CA,\xa4TVwo\x022\x99\xa9\xf3\xe7\xa1x\
+.4 ]UuU^\xde\x14\x85\xc2\x1a\x1d\x9d\xec\
+r\x13\xf7e(\x91(#?\x7f\xc1?\x8f\xc3\x161\
+\x99D\xa5\xb8\x98\x185\xf2\x9b\x85=xC'_\x5c\
+\xbc 3\xb3..N\xef\xb2\xa6\x0d\x16(,,R\
+\xa7\x9b\xd0}.\x14\x94\x93\xd3\x8c\xfc\xf6a\x0f\xd4u\
+u\x1d\xa5\xa5\xcb\x0c\x86\xa6\xe4\xe4B\x81@Nnt\
+\xc5\xf2@\x14\xb1Xc2\xcd\x85& \x14\x12\xeb]\
+CC\xd9UUW#\xbf\xa1\xd8\xeeM\x16\x1f\xd0\xeb\
+\x1b\x12\x13\xcd|\xbe\x1cG5\x83\x11\x83\xc1T(l\
+\xd0\x0a\xc8\x84\x08\x06M\xe4\xf7\x17\xbb\x87;wRO\
+W\xa9\xaa\xe0\xeeDDH\xa8T\x1ajj\x02M\x11\
+\x11\xb12\x99\x99\xfcwv\xf6D\xe4w\xfcr\xb6\xdd\
+\xbe6?\xbf]\xab\x1d\x05\xdd{TTR\xe0-K\
+\x18\x9e\xa2P\xa8\xe4\xae\x10\x18\x11**V\x22\xc7\xe0\
+r0\xe4\xaaeeW\x18\x8d-*\x95]&\xcb\x8e\
+\x8c\x8c\xf7p\x83'\x96_%\x10$\xf4(\x85\x81=\
+H;\x1c\x9bJK\x97\xe4\xe5MQ\xab\x1d\xd0\xb1\x8b\
+Dilv\x14\x8ed\x86\xad\xf8|YBB\x1e\xdc\
+\xac\xbc\xbc\xa9\xd0G\xe1\x07\xc4\x9es\x0e\x97\xab\xa0\xa0\
+=+k\xbcRY\xd1Y\xfb(\x91\xc9\x8c\x08\xa4\xa5\
+\xc5\x97\xa1 4\x0a\x0f\x17\x08\x85\x0ah\x14\xe9\xe96\
+\x83\xa1\xc9b\x99]Y\xb9\xaa\xae\xae\x039rC\xef\
+\x9a\x9a\x0d\xe5\xe5\xcb\xc9\xf2\x14\x10\xba$&\x9a\xc4\xe2\
+t.7\xc6M\x8d/\xac\x80\x14\x8c\xe0,\x16\x9f\xcf\
+\x97\xc7\xc4h`X\x87\xa6\xa1\xd77\x98L\xd3\xac\xd6\
+E6\xdb\xea\x918j@\xe0g\xb7\xaf\xb1Z\x17\xe7\
+\xe7\xcf\xe8\xb6\x83>[,VB|\x1e\x16\x16\x89'\
+\xd8\xb1<\x17\x9d\x1e\x02\xcc\xf0xR\xa10U*\xd5\
+\xca\xe5\xc6\x94\x94\xa2\xb4\xb4r\xe86\xb5\xda\xd1\xd0\x7f\
+v\xee\x01o\xb3Xf\x15\x17\xcf\x87N\x15\xc6\x94\xea\
+\xeau\x83\x19Vjj\xd6\xc3;\xd8lk\xe0\xdd\xc0\
+\xf0\xb6`\x08H\xe0\xaf\xe4\xe6N\x86\xe6\xa9\xd1\xd4B\
+d\x92\x9c\x5cH\xeem\x17\x0aS\x22#\xe3\xd8la\
+h(\x87N\xf7\xfb\xb1\xe6XX\x9e\x8b\xc1\x08e0\
+\x98n\x0c\xd0Bt\xdd\xf9\xef\x91Z\xb5\x00\x0b\x0b\x0b\
+\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\
+\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\
+\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\
+\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\
+\x0b\xcb\xb7\xfa\x7f\xe6\xab\xbcL\x0aendstr\
+eam\x0aendobj\x0a13 0 \
+obj\x0a13051\x0aendobj\
+\x0a14 0 obj\x0a<<\x0a/Ty\
+pe /Annot\x0a/Subty\
+pe /Link\x0a/Rect [\
+226.500000  437.\
+750000  368.2500\
+00  455.750000 ]\
+\x0a/Border [0 0 0]\
+\x0a/A <<\x0a/Type /Ac\
+tion\x0a/S /URI\x0a/UR\
+I (https://www.f\
+laticon.com/cont\
+act)\x0a>>\x0a>>\x0aendob\
+j\x0a5 0 obj\x0a<<\x0a/Ty\
+pe /Page\x0a/Parent\
+ 2 0 R\x0a/Contents\
+ 15 0 R\x0a/Resourc\
+es 17 0 R\x0a/Annot\
+s 18 0 R\x0a/MediaB\
+ox [0 0 595 842]\
+\x0a>>\x0aendobj\x0a17 0 \
+obj\x0a<<\x0a/ColorSpa\
+ce <<\x0a/PCSp 4 0 \
+R\x0a/CSp /DeviceRG\
+B\x0a/CSpg /DeviceG\
+ray\x0a>>\x0a/ExtGStat\
+e <<\x0a/GSa 3 0 R\x0a\
+>>\x0a/Pattern <<\x0a>\
+>\x0a/Font <<\x0a/F8 8\
+ 0 R\x0a/F9 9 0 R\x0a>\
+>\x0a/XObject <<\x0a/I\
+m6 6 0 R\x0a/Im12 1\
+2 0 R\x0a>>\x0a>>\x0aendo\
+bj\x0a18 0 obj\x0a[ 14\
+ 0 R ]\x0aendobj\x0a15\
+ 0 obj\x0a<<\x0a/Lengt\
+h 16 0 R\x0a/Filter\
+ /FlateDecode\x0a>>\
+\x0astream\x0ax\x9c\xe5\x5cKo$5\
+\x10\xbe\xcf\xaf\xe83R:~\xb6m\x09!m&\x09\
+\x82\x03R\x94H\x1c\x10\x07\x94eA+\xb2\xb0\xec\x81\
+\xbf\x8f\xdd]\xee\x99\xe9\xea\xcf\xd3\xe3\xe9(\x83`E\
+f\xb2v\xd7\xf3+W\xb9\xec\xde\xebo\x1f\x7fi~\
+\xfb\xd2\x5co\x1f\xffj\x9e\xe9s\xfb\xb8\x11\xad\xb3b\
+\xf8\xafI\x7f\xae\x0e\xff\xc2\x1b\xd5<\xbfl>7\x9f\
+7\x0f\x9b\x87\xf83\x7f\xa6\xc1\x97\x8d\x0b:~\xfe\xd1\
+\x7fJ\xa9t\xfc*v_\xd2\xc8\xef\x9b\x1f\xbfj>\
+m\xd2\x83\xd7\x83\x08\x91\xa5\x09A;\xa1\x9c\xebY\xa6\
+\xdf\xadS]\xfc\xd9\xff\x1e\xf9I\xeb\xfd \x8e\xd2&\
+~\xa4\x9f\xcf/\xcd\xf5w/]\xd3\xdc\xfe\x19e\xc8\
+z\x88\xd6\x07!C'\x5c|\xa0\x0dR;eMH\
+D\x83\x0aFJ\xd7\x99\xe6\xcb\xf3\xa7\x91\xb9\x8e\xf2E\
+\x9d\x9c\x8e\x02[\xdd\xfc\xfd\xeb\xe6\xc3>\xad\xfe\x01'\
+l\xfanE\xf0B\x07\x95\xbe;ot\xa2=GK\
+\xc5\xe9V\x9cO*\x10)y6)e\xf4,)\xd9\
+\xffa|e?Y\x1d\x9b\xab\xb4\xed'[\xe5\x8fO\
+>\x85p/\xb1z\x05!\xd2\xe4Dy\xa9\xc4\x8b\xa5\
+Hs\x83^.\xf1b!\xfa\xc9\x91\xf2\xcc\xe4\x0a\xa4\
+k%{\xa4\xc7\xc0:\xaeP\x9a\xacD4\xc0Q\xd0\
+(\xad\x86\xd9\xca-\x98ml\xe8gka\x16\xccN\
+\x82\xf4^H1z\xbe\x01\x88\x14\x0f\xa9:Jz\x05\
+JF\xda\x95(%\x99\xa2\x83\xcdy\x84zo\xbe2\
+\xa5y\x0c\xf5\x96\x88@_\x06\xa1\x85\x84\xd3\xdcDX\
+\xc7\xd8\x5c\x95\xb0\xeb\xf4Jv\x8aK\xa3\xd0\xbeII\
+\xd3\x13\xa9\x87\x94\x1f!\xeb\xe1o\x1e\xb7?\xc4G\xff\
+\x89\xeb\xc2\xf7\xf1\xff\x8f\xcdO?\xc7\xcc\xf8\xbe\xf8\xe0\
+\xcd\xd3\xe6\xfa>\x1a\xd87O\x1f\xe2P\x9fQ\x87\x8f\
+\xa7\x97\x84\xa0\xab(\xd9\xd3\xfb\xe6\xeb\x98\xec\xe57\xcd\
+\xd3\xc7Mh\x8d\xe8\x94\x1d\x92?\x8d\xa8~\xc4\xb4\xd6\
+t>\xd5\x06\xbb\x11\xdd\x8f\xf86\x0c\x03{#\x86\xa8\
+\xc5<o\xc5\xc1\x88\xedG\xa4\xc8\x8cv#\x1dQ\xb3\
+\xce\xcb\xc3\x11L\xcde\xd9h\xe8<\xd9|?\xd2\xb5\
+\x86=\x13hD0\xd9\xb0u\xde\x8d\x9a*\x99\x86\x96\
+\xc8vC\xb2\xb9\xceN\xac\x83%\x18\xf4\xb9{:\xa8\
+\x8a\x94\xb4\x9d\xefT\x84j\xfc\xde\x7f\x89\x85C\xfc\xae\
+\x0d\x15\x13\x87\x88\x5c0\xff(\xfcNe\xda\x833\xc4\
+\x12j\x0e\x9c6\xfd\x12+\x9b\x03t\xba\xb6W}\x06\
+\x9d\xba\x95\x0cO\x9a,\x16\x06\xf33\x8b\xb9\xd6\xbb)\
+5K#Nh9\x87\xce\xae\xdd+\x8e\x8fRs;\
+\xcf\xbc\x9d\x85=\xb0\xb0\xb2\xf6\xc0\xc4\xdb\x01\xae2\xa3\
+r\x0aJ7\x13dC\xc0\xd8\x96\xac\xb57r{\x09\
+\xaa\x97\xc0\xa5\xe2&\xe5@\x8b\x18t~\xaa\xc5\x10t\
+~&\xa6\xd5\x10\xa0K\x90s\x03\x11\xca\xc8o\x89\x88\
+fP\xba\xa5%\x83[\xfa\x8e\xc8wbp\xcf\x92g\
+0\x9f{Z\xce$\xa3v\xe10G\xbe\xeea\xbes\
+\xb6\x14\xa4\xa0\xd3\xe6PA)\xc9\x5c\xb4\x5c,1\xb1\
+T\x19\x0f\xe4\xf6%\xab\x0f61\xe6\x03e\x939\x97\
+\x0c\xf9b\xd93\xf2\x92\x1d\xd6\x07\xa7\x9b\xd4%\xff\xb5\
+\x95\x1f\x07%\xf4\xbe4\xc4\xc7\x9b\xc92+-\x0c\xe4\
+\x0b\x0f\xcab\xee\xd9s\xf2\x1d\xa9\x11\xfc$(\x0b\x19\
+&\xab\xce\x02\xb90\xe2\xc8-\xbc\xc4\xccn\xe1a$\
+\xa0\xf1\xb1l\x98\xcf\x08\xcdi\xe9\x87\xf9P\xb8\xa6\xcc\
+<)$\xf1H\xc1\x06Xj(\xdb\x18j\x96=\x03\
+k\x03\x89\x9f\x81\xd6\x19\x173\xc1*\x8d\x1c\x84\x9dC\
+!}\x82\xb7)\xd4\xe4\xd8\xeb\x5c\xa2i\xc8\x89\x83-\
+\xa79<\xf9\x82\x8eq\x80k*\xc8\xa70\x82}\x0a\
+\xf5\x91y\xbb\xa5\xa6\x0b^\xc1\x0bX\x02\xcc\x07\xc7\x8f\
+\x85|\xb0\xe7\xb0\x7f\xf0\x08\xc65\xc6\x0e\x96m]$\
+^\xf82\xad\x9a+\xad]\x16\xd6\xe7\xb0\x11\xc3fw\
+\x89\xea\xd8\x5c\xd8-5p\x0e9\x08\xfdtW\xff\x1a\
+\xa0\xbdP\x87\x19\x17\xf6\x1d6\x16O\xa4\xc5%EK\
+M^\x95\xef`\xc9\x87a\x86c/7[x\xce\xaf\
+X\x01q\x168\xaai\x0f\xa6\x8730\xb1\x7f\xb6\xa6\
+\xf4\xae|\x14\xcd\xfe\xefR\xc8F\x9b\x90\xce\xd7j\x19\
+)\xdb\x0d\x88\x1b\xbe\xa4\x9f\xc3\xb1\x9cTt.w\x8e\
+\x1a\x97\xb7\x17QV\xc7x\xf2\xb9N\xa5\x9c\x19Zc\
+\xa7937\x22\xf9\xd6\xcd\xc3\x8d\x05\xde\xc0\x1c\xdbr\
+\x5c\xe8\xd6\xcdx\xb1o.\xbcw\xc3F\x91\xb9\xcf\xc9\
+vAg\xb43&\xbdQ\xea\xcf\xcb\xd0\x1f=\xef:\
+\xf7\x96\x8eS\xed\x04\x95\xc7\xe7/0\xf3iL\xb3\x99\
+\xe5,*\xb5o\xae\x8c\xe9\x0eWE\xc2\xc4\xc5\x09k\
+\xd4\xbe\xb0\xb4\xd5S\xadW\xd3\x92xK\xcb>o\xc3\
+u4\x82:&s\xd4n\x09G<\xf5\xe5}6\xab\
+\x14(!\xd8\x99\xa2\xdc\xd23\x82u\xf9!\xb5\x82\x04\
+XjE#\xfc\x04\x02K\x80\xa9\xdd\xd3\x02\xc3;@\
+\xdbLm\x9a\xfa\x0a\xfa`>\xd8?P\x82\x82\xb7\xb1\
+\xa6\xd8\xa2\x90\x9a\xcc\xe9\xbfc\xfd\xa3\x1a\xff`}0\
+\xaa\xa0\x042\xafh\xbc{S\x83\xf8u-\x8a\xf9h\
+\xe2c\xd8\xf9Y^\xbb\xd5*\x12\xe0X\xc0^\xc0\xcf\
+\xd4\xc8V\xe3\x85\x1a>\x90\x9a\xbc\x83\xcf\xdc@M1\
+\x0ej\xec\xb6\xaa\xb7\xe5=\xf1\xb1rz\xbeY\xc1\x07\
+\xc7\x8f\xdc\xcb\xfbo\x9a\x12\xbb\xb9\x94\x18bQ\x99j\
+\xac\x03\x1f\xfb\xd6\xb1\x83\xb7@\xe5&+\x10iM\xb1\
+\xf9\x18\x8aa\xc9\xcc\xf4\xcb\xb7\xc4\xc7\xb0\xaex\xde\xba\
+\xf8i\x0c\xca\xb1\xbf\xccp\x0e\xf9(\x91\xa5f[>\
+\x8f\xf8\xe43\xf9%\x0a\x8e;W\x96\xa4\xa7D(~\
+\xdd\x0c\xa6\xa0\xf4\x05\xc6\x8c\xfc\x0d\x94\x04\x9b:\xf7\x99\
+\xf9n\x80\x91\xbf\xcdv\x04\x99x\xce\xc7\x98<\xc4R\
+\x0d5\x99\x15D\x15\xcc\x9cQ*\xbcQ\xb0\x01\xd6G\
+\x13\x9f0\xbd\xc9\x82\xf1G+\x89T\xa8\x91\xbe\xe7\x16\
+\x18,\x05\xe3c\x05\xd7\x0dq\x8cH\xec\x16h\xaeS\
+T\xc7\xbeeDp\xe8Y\xb4p\x14\xf4b\xe4q\xe8\
+\xad!c\xc1Z\x18\x905\x88\xc1j`\x09*\xf0W\
+H>\xeb\xaen5\xf8\xab\xb1(NK\xf9\x82\x1bk\
+\x12\x14\x96\x05\x88\xc8\x02Vk\x22\xba\xc6s\x01\xa6f\
+lk\xec\xb9\xbbK(\x98p[;\xfe\x22\x5c8\x14\
+\xf6\xd5\x8f\x8b\x0bg\x0a\xb8}~\x9bW\x19&\x1bn\
+Do\x092\xbcyXs(\x8c\xa5\xc6\x87\x8e\xb0\x81\
+/\xf3\xfe\x8c\x87\xc0\x1d\xd2\xa7\xa0\xe9=\xf1\xd1a\x12\
+\x1cT5\xceQ\x93\x97\x00M\xd4\xf2\x94\xde\xceas\
+\xee\x0e\x0fl\x1e\xb3{`\xb9\x1c\x91\xad\x0a\x87\x07m\
+x\x04_\x05\xc1\xbd\xe9\xc2E\x19\xdc\x9b\xc6\xcdV|\
+\xd1\x0d\x1aE)\x02\xc4@k.,\x99>J\xa3\xa0\
+\xa8\xea\xa8\xe3\x0b9\xb8\xa7\x0f\xaf\xea\x14.\xfeL\x9d\
+\xac\x0cM\x0d\x0c\x0f\xd8\x5c6\xbb\x7f\xaa\xba\xea*\xdc\
+\x02]Y01~&G\xfd)\xf7\xe7p\xb7\x9f\xdd\
+\x8d\x84j\x14\x0e\x13*\xa2\xa5`\xfc\x91\xcf\xb4VR\
+y\xc9e\x99\xbd0\x82\xa9U\x18\x12\xe3[f\x87\xf1\
+\xe3ol\x03<\xb2\xee\xe5Ex\x19S\xbd#}\xd8\
+\xed\x94*\x98\xe1\x0bt5!Ps\xed\x0f^/\xac\
+A\xaf\xba9]\xb6B\x16\xa8Ynr\xc9\xc2\xfds\
+\x9b\x11\xc2\x1a\xe1\xf8\xea-\xc6A.\xf5xc\x1f^\
+|U\xb9\xc8\xa0\x92yQ4\xd6\xc4\x1c\xbe\x0c\x8e\xf3\
+\x10\xce68N\xa1\x04Z\xe4\xfc\x0d\x9a\xc03\xb8\xd6\
+\x17]N\x05\x9bW\xb0\xf8\x97R\x8cB+\x82\x9b\x9f\
+\xd6\x8d\x97\x1c>:C\x94/\xf10H\x0a\x10\xc5\xa1\
+\x00\xc3G\x9b\xbc\x17`\xdbaH\x0d\x8fh\x8bd\xc3\
+#\x85\xf0\xc1\x85$\xbe\x8b]\xf1\x1aD\xc1so^\
+bV\xe1\x0d\xa7\x9f\x9a\x97D\xa6u\x96\xeer\xd8\xd0\
+\x9bfKv\x0b5\x19\xb1\xe6\x1d\x14\xec\xe4\x8a\x0cR\
+\x93\xf7N(K\x0bH\xc1\xf8\xc6F\xc1\x86\xc4oH\
+@j\x05ta\xa9\x99\xea\xd8~c\xc5\xc7\x14\xac\xd8\
+m\xad[\xa7\xd6dz\x5cQ\xac\x9c\xcf]v\xe5\xd1\
+0\xe5=\x03\x07\xa5\xaf\xa9\x98a\xcd\x8e\x13T\xe1U\
+$\x1c\x9d\xd8\xb2\xff\x9bM0\x8e\x96\x9a}K\xcd\xb2\
+#g\xaf\xc9\xa9\xbdR\xce+m\xfbw\xd9\x0b\xd7\xe4\
+\x8e\xcf_r\x1b\xf1$\xa6\xb9k<{\xcc\xae\x85\xa2\
+\x5c\xdc\x5cY=\xbe\x00H\xef~(\xde[;:2\
+SJfd\xb3\xc6\xe9x\xde\xc0K\xa2\x5c~v\xe0\
+P\xd3\x16^\xc2\xe7\x17A\xc6\xf3\x13\xf0F\xd1\xdc\x19\
+E>\xbd\xe0;$\xa8O\x0d\x9f\xdc\xa4\x1e\xef>\xed\
+\xf8(\xd2\x94\xc7\xfd\xaa\xfa\x14,\x8a\xbd\x00% j\
+t_{\xf8\xe7\x90D\x0f7\x80\xec\x87\xe6a\xf3/\
+x\xb8\x8d\xdc\x0aendstream\x0ae\
+ndobj\x0a16 0 obj\x0a2\
+156\x0aendobj\x0a20 0 \
+obj\x0a<<\x0a/Type /XO\
+bject\x0a/Subtype /\
+Image\x0a/Width 24\x0a\
+/Height 22\x0a/Bits\
+PerComponent 8\x0a/\
+ColorSpace /Devi\
+ceGray\x0a/Length 2\
+1 0 R\x0a/Filter /F\
+lateDecode\x0a>>\x0ast\
+ream\x0ax\x9c\xd5\xd0\xa1\x15\x80 \x14\x85\xe1\
+\xd7M4\x0b\xdd5\x5c\xc6H4\xda]\x81%\xa8T\
+\xa2CP\xd9\xc0|E\x04}\x07q\x00\xbf\xf8\x1f.\
+\xe1\x11E=#\xa8Xwpa\xbc\xb2Be\x97\xa9\
+[h\xc9\x0c\x1eS\xea\x1b\x14q\x0e\xf3\xcf\xba]8\
+\x9f{\xa8\xef\x00}\xe6)\x1f\xc5F\xee9P\x97\x9f\
+\x0fi\xbb\xdc\x839o\x95\x88\xa4Ay\xf5\xfe\xfd\x1a\
+43\x0c\xf9f_\xa9\x1b[\xe8\xd3\x01j\x1c\xe2B\
+\x0aendstream\x0aendob\
+j\x0a21 0 obj\x0a123\x0ae\
+ndobj\x0a22 0 obj\x0a<\
+<\x0a/Type /XObject\
+\x0a/Subtype /Image\
+\x0a/Width 24\x0a/Heig\
+ht 22\x0a/BitsPerCo\
+mponent 8\x0a/Color\
+Space /DeviceRGB\
+\x0a/SMask 20 0 R\x0a/\
+Length 23 0 R\x0a/F\
+ilter /FlateDeco\
+de\x0a>>\x0astream\x0ax\x9c\xed\
+\x94=\x0e\xc3 \x0c\x85\xb9\xff\x8d\xf8\x91\xa2\xaaCL\
+\xd5\xa9\x06\xa9k\xa6\x5c\xa3&TQ\x09\xa68\xe9\x98\
+Z\xdf\x14\x9c\xf7ld\xa3T\x11\x83\x0f]\xae\x8fI\
+\xb5\xc3\xfa`!\x18@\x09\x16\xd0\x01r\x22Q\xa8\xf0\
+!\x15.\xb7\xadT\xaeD\x03\xd2Q\x97\xe1\xfe4K\
+>\xfd\xb5\xd1y[\xf8\xf8\xa5\xf1\xd27\xe5\xd7\xad\xfd\
+uN\xad\x93\xa6K\x0e\xa3cw.EF\x97:\xec\
+z\xd2\xc7\x92\xce\x8a\xe9yfsh\x89\xaa\xde\x19\xbb\
+\xb5$\xd7Zg\x1f\xe9\x9dY!_3\xf2\x99\xd9\xf1\
+\xd8\xcd\xd4%\xfd(\x92\x18\xb1\xd5\xf5.\xe8!\xcd\xf7\
+\xec\x96I8\x8cpt\x85\xf1\x02\x8fv\xcce\x0ae\
+ndstream\x0aendobj\x0a\
+23 0 obj\x0a177\x0aend\
+obj\x0a24 0 obj\x0a<<\x0a\
+/Type /XObject\x0a/\
+Subtype /Image\x0a/\
+Width 22\x0a/Height\
+ 22\x0a/BitsPerComp\
+onent 8\x0a/ColorSp\
+ace /DeviceGray\x0a\
+/Length 25 0 R\x0a/\
+Filter /FlateDec\
+ode\x0a>>\x0astream\x0ax\x9c\
+\x8d\xd1\xb1\x01\x84 \x0cF\xe1\xbf\xa2\xb7s\x00\x1aV\
+`\x0b\x9d\x22[\xb8\x82\xa5\x0b0\x02s8\x05\x05\xfd\
+\xf51z\xa7\x90\x5c\xe3+\xbf\x02\x12\x000x\x9d\x03\
+\xe0\x12\x9b>\x04\xac\x16\xa5\x88\x9d\x97A5\x8a\xa0\xf0\
+\x0c]\xe2\xf5\x95\xfae\xfc\xd7P\xe5L\xab\x82\xc5[\
+\xfd\xe2\xa3\x91\x5c\xc3Gw\xce\xee\xc2\xd0\xcf@\xccY\
+\xb0\x06=\x19\x9d{\xfe\xb0\xbb\x8d\x1a\xf63\xcc\xe9\xc6\
+\xd7\x1b7%\xa3YT\xbe\xa2\xa8*\xf3\x04yd\xdb\
+v~\x5c\x9ct\xb2\xf5\x01\x0e\x1e\xbd\x05\x0aend\
+stream\x0aendobj\x0a25\
+ 0 obj\x0a142\x0aendob\
+j\x0a26 0 obj\x0a<<\x0a/T\
+ype /XObject\x0a/Su\
+btype /Image\x0a/Wi\
+dth 22\x0a/Height 2\
+2\x0a/BitsPerCompon\
+ent 8\x0a/ColorSpac\
+e /DeviceRGB\x0a/SM\
+ask 24 0 R\x0a/Leng\
+th 27 0 R\x0a/Filte\
+r /FlateDecode\x0a>\
+>\x0astream\x0ax\x9c\xbd\x94K\x0e\xc3\
+ \x0cD\xb9^\x80\xaa\xabnr\xaeB\x17]t\x9f\
+\xe3\x18\x0e\xd4!\x04\x82\xf2\xc3 \xb5\xd6(\x02)\xf3\
+\x84\xf1\x08!\x96\x1a\xc9\xde\xfc\x9b\xaf\x87\x9f\x92U`\
+\xad\xdcS\x92i\x95&\x13\x09\x9az\xecQw\x17 \
+\x03\xd9ykG\xb6\xa4\xffd\x17\x082\xae\x9d\x11-\
+\x15\x1b\xc7\xf9\xffL\xc0\x08\xe4\xdcB\x1f\x01?\xc8e\
+d\xb6\x83P\xdaq\x92V\xc2\xde~A\xc0|\x91\x93\
+2o\x87\xf6\x0b\xc2\x90\xd6\x11R\xda7\x87<#\xe8\
+\x9c7gV;\xbe\xbb\x1e/\xeeAo\xa2{d\xaf\
+\xde\xa4\xae\xd99\xb3\xc0V\x9d\xdb9\x84j\xfd\x82\x90\
+\x9f\x0bf\x85I%B\xf1@Y\xae\x92E\xd1+\xd0\
+\xd6\xe7\xa2M\xaah\x1c\x09D\x9e\x01\xe4+'\xfc\x0b\
+g\xbd\xe7*\x0aendstream\x0ae\
+ndobj\x0a27 0 obj\x0a2\
+03\x0aendobj\x0a28 0 o\
+bj\x0a<<\x0a/Type /XOb\
+ject\x0a/Subtype /I\
+mage\x0a/Width 24\x0a/\
+Height 24\x0a/BitsP\
+erComponent 8\x0a/C\
+olorSpace /Devic\
+eGray\x0a/Length 29\
+ 0 R\x0a/Filter /Fl\
+ateDecode\x0a>>\x0astr\
+eam\x0ax\x9c\x85\x91\xbd\xb1\xc3 \x10\x847\xa3\
+\x00\x17@\x03\x0aT\x80:\xa0\x00\xe5\x9ey\x99\x227\
+@\x09\xc44@\x09\xa4\x8e\xd4\x00\x0d\xd0\x021\xc9\xbe\
+\x93dY\x88\xc4\x1b0\xf0q\xff\x07lR\xc6\xa7R\
+\xf3jG\xb4\x9a3O\xc5\xe1KU k\x5c\xccd\
+l\x92\xdb\xf3\xc4+\x19t\xe3i\x8fk\xb8LD\x8b\
+\xc4\x9aw\x0b\xb2\xc1\x7fdayH\x94\xccp\xc3Q\
+\x17:\xc0\xb0\xea\x1bV\xb0,\x0a\x9e\xb1\xc3P\x95\x06\
+\x89K\x87\x81\xb7\x94T\xe4\xaf\xc3\x12\xc3\xa3r\xea1\
+\x9c\x94\x92?\xf6\x0d\x96\x8e\x1c\xd6\xa3\xbd\x16K\xce\x97\
+\x14\x95z\xac\xc9\x01\xe3\xd6\xf6\x0dK\xda,gd^\
+nx\xac\xfb`\x86\xca\x1b\xd6y\x8f\x0c<eT\xd7\
+(\xc6\xfc}Y\xf9\xb0\x87\x83\xf6\x95e:m\xe6\x22\
+kz{\x17d]L\x97/\x1e\xae|\xd6\x9b\x9b]\
+lR\xc6\xfa\xe0^\x03~\xe9\x1f\xc6\xb5\xb5\xdb\x0ae\
+ndstream\x0aendobj\x0a\
+29 0 obj\x0a234\x0aend\
+obj\x0a30 0 obj\x0a<<\x0a\
+/Type /XObject\x0a/\
+Subtype /Image\x0a/\
+Width 24\x0a/Height\
+ 24\x0a/BitsPerComp\
+onent 8\x0a/ColorSp\
+ace /DeviceRGB\x0a/\
+SMask 28 0 R\x0a/Le\
+ngth 31 0 R\x0a/Fil\
+ter /FlateDecode\
+\x0a>>\x0astream\x0ax\x9c\xad\x94K\
+\x0e\xc5 \x08E\xdd\xa1\xb6\xc6\xa1Kp\xff3}Z\
+Z\xf0\x0f&\xcf\x10cS<^PP\xaa\x1f)\x84\
+t]\xc5\xee;\x19S\x0c?\xb5\x1e\xdc\xe7\xa38\xc3\
+\xae\x85\xc5g\xde\x11PF6c\x22\x08\xc8\xb3s\xaf\
+\x18<\x22+\xb4\x96\x87<\xbbx\xb53\x1f\xf6 \x09\
+\x8a~\xb1\x10k\xe9D\x98\xbd\x1f#\x12B\x22^\xe5\
+\x83\xea#Z\xe4d\x02\x09\x81\xa2\xc8\x1b\xe1\xf3\xfb{\
+\x04y\x03\xf9\x9e\x16a\xd7b\xa6\x10\x18\xb1\xcav\xcd\
+<\x82PN@\x0fp\x9c;\x85t\x1aV\x97\xc5B\
+TuG\xb4\xee^\x94\x00\xa2\xda\xdc\x8ey>\x83`\
+\x5cZ\xd7\x92\x84\x90iBbU/RH>\x1d\x92\
+\x5c\x95\x12\xd5\x8b\x10\x82\x11\x0d\xaf\xae)\xc0}\x81`\
+\x1e\x16\x9eM\x9b\xca\xeb\xf1\xd5aA\xc1<{r\xe4\
+\x89\x01BK\xc4\x8dm\xdb\xd9k.(\xef\x9b\xde>\
+\x1a\xd7\xa3\x1a\x1a4\xa5.R\xaeA\xfde\xfc\x00\x16\
+\xf3\xb6\x00\x0aendstream\x0aen\
+dobj\x0a31 0 obj\x0a24\
+8\x0aendobj\x0a32 0 ob\
+j\x0a[1 /XYZ 22.500\
+0000  \x0a735.50000\
+0  0]\x0aendobj\x0a33 \
+0 obj\x0a[1 /XYZ 22\
+.5000000  \x0a665  \
+0]\x0aendobj\x0a34 0 o\
+bj\x0a[1 /XYZ 37.50\
+00000  \x0a525.5000\
+00  0]\x0aendobj\x0a35\
+ 0 obj\x0a[1 /XYZ 3\
+7.5000000  \x0a290.\
+750000  0]\x0aendob\
+j\x0a36 0 obj\x0a[1 /X\
+YZ 37.5000000  \x0a\
+400.250000  0]\x0ae\
+ndobj\x0a37 0 obj\x0a<\
+<\x0a/Type /Annot\x0a/\
+Subtype /Link\x0a/R\
+ect [22.5000000 \
+ 139.250000  170\
+.250000  155 ]\x0a/\
+Border [0 0 0]\x0a/\
+A <<\x0a/Type /Acti\
+on\x0a/S /URI\x0a/URI \
+(https://www.fla\
+ticon.com/terms-\
+of-use)\x0a>>\x0a>>\x0aen\
+dobj\x0a38 0 obj\x0a<<\
+\x0a/__WKANCHOR_2 3\
+2 0 R\x0a/__WKANCHO\
+R_4 33 0 R\x0a/__WK\
+ANCHOR_6 34 0 R\x0a\
+/__WKANCHOR_a 35\
+ 0 R\x0a/__WKANCHOR\
+_8 36 0 R\x0a>>\x0aend\
+obj\x0a40 0 obj\x0a<</\
+Title (\xfe\xff\x00F\x00R\x00E\x00\
+E\x00 \x00L\x00I\x00C\x00E\x00N\x00S\x00\
+E\x00 \x00\x5c(\x00W\x00I\x00T\x00H\x00 \
+\x00A\x00T\x00T\x00R\x00I\x00B\x00U\x00T\
+\x00I\x00O\x00N\x00\x5c))\x0a  /Pa\
+rent 39 0 R\x0a  /D\
+est /__WKANCHOR_\
+2\x0a  /Count 0\x0a  /\
+Next 41 0 R\x0a>>\x0ae\
+ndobj\x0a41 0 obj\x0a<\
+</Title (\xfe\xff\x00H\x00o\x00\
+w\x00 \x00t\x00o\x00 \x00a\x00t\x00t\x00\
+r\x00i\x00b\x00u\x00t\x00e\x00 \x00c\x00\
+o\x00n\x00t\x00e\x00n\x00t\x00s\x00?)\
+\x0a  /Parent 39 0 \
+R\x0a  /Dest /__WKA\
+NCHOR_4\x0a  /Count\
+ 0\x0a  /Next 42 0 \
+R\x0a  /Prev 40 0 R\
+\x0a>>\x0aendobj\x0a42 0 \
+obj\x0a<</Title (\xfe\xff\
+\x00W\x00h\x00e\x00r\x00e\x00 \x00y\x00o\
+\x00u\x00 \x00c\x00a\x00n\x00 \x00u\x00s\
+\x00e\x00 \x00F\x00l\x00a\x00t\x00i\x00c\
+\x00o\x00n\x00'\x00s\x00 \x00c\x00o\x00n\
+\x00t\x00e\x00n\x00t\x00*\x00:)\x0a  \
+/Parent 39 0 R\x0a \
+ /Dest /__WKANCH\
+OR_6\x0a  /Count 0\x0a\
+  /Next 43 0 R\x0a \
+ /Prev 41 0 R\x0a>>\
+\x0aendobj\x0a43 0 obj\
+\x0a<</Title (\xfe\xff\x00W\x00\
+h\x00a\x00t\x00 \x00y\x00o\x00u\x00 \x00\
+C\x00A\x00N\x00 \x00D\x00O\x00:)\x0a \
+ /Parent 39 0 R\x0a\
+  /Dest /__WKANC\
+HOR_8\x0a  /Count 0\
+\x0a  /Next 44 0 R\x0a\
+  /Prev 42 0 R\x0a>\
+>\x0aendobj\x0a44 0 ob\
+j\x0a<</Title (\xfe\xff\x00W\
+\x00h\x00a\x00t\x00 \x00y\x00o\x00u\x00 \
+\x00C\x00A\x00N\x00N\x00O\x00T\x00 \x00D\
+\x00O\x00:)\x0a  /Parent \
+39 0 R\x0a  /Dest /\
+__WKANCHOR_a\x0a  /\
+Count 0\x0a  /Prev \
+43 0 R\x0a>>\x0aendobj\
+\x0a39 0 obj\x0a<</Typ\
+e /Outlines /Fir\
+st 40 0 R\x0a/Last \
+44 0 R>>\x0aendobj\x0a\
+45 0 obj\x0a<<\x0a/Typ\
+e /Catalog\x0a/Page\
+s 2 0 R\x0a/Outline\
+s 39 0 R\x0a/PageMo\
+de /UseOutlines\x0a\
+/Dests 38 0 R\x0a>>\
+\x0aendobj\x0a19 0 obj\
+\x0a<<\x0a/Type /Page\x0a\
+/Parent 2 0 R\x0a/C\
+ontents 46 0 R\x0a/\
+Resources 48 0 R\
+\x0a/Annots 49 0 R\x0a\
+/MediaBox [0 0 5\
+95 842]\x0a>>\x0aendob\
+j\x0a48 0 obj\x0a<<\x0a/C\
+olorSpace <<\x0a/PC\
+Sp 4 0 R\x0a/CSp /D\
+eviceRGB\x0a/CSpg /\
+DeviceGray\x0a>>\x0a/E\
+xtGState <<\x0a/GSa\
+ 3 0 R\x0a>>\x0a/Patte\
+rn <<\x0a>>\x0a/Font <\
+<\x0a/F8 8 0 R\x0a/F9 \
+9 0 R\x0a>>\x0a/XObjec\
+t <<\x0a/Im6 6 0 R\x0a\
+/Im22 22 0 R\x0a/Im\
+26 26 0 R\x0a/Im30 \
+30 0 R\x0a>>\x0a>>\x0aend\
+obj\x0a49 0 obj\x0a[ 3\
+7 0 R ]\x0aendobj\x0a4\
+6 0 obj\x0a<<\x0a/Leng\
+th 47 0 R\x0a/Filte\
+r /FlateDecode\x0a>\
+>\x0astream\x0ax\x9c\xed]K\x8f\xdc\
+\xb8\x11\xbe\xf7\xaf\xd0y\x81m\x8bo\x0aX\x04\xf0\x8c\
+\xc7Ar\x08`\xd8\xc0\x1e\x82\x1c\x02o6\x8bE\xbc\
+\x89\xb3\x87\xfc\xfd\x88\x12\xa9\x16I}\xecV\x0d\xbb\xa5\
+\x1e\x8f\x07\x9en\x0d\xc5\xe2\xabX\xac\xfaX,\xbe\xf9\
+\xe3\xc7\xbf7\xff\xfc\xbdy\xf3\xf8\xf1?\xcdg\xff\xf9\
+\xf8\xf1\xd0\x1e\x8dj\xc7\x7f\x8d\xfb\xf9>\xfe\x83\x95\xbc\
+\xf9\xfc\xe5\xf0\xb5\xf9z\xf8p\xf8\xd0\xff\xfez\x18\xdf\
+\xfb\xf8\xf8\x97\xfe\xdb\xff\x1a\xde\xfc\xb9\xff\xffk\xf3\xd7\
+\xbf\xf5\x7f\xfc\xc9\xbf\xe4^\xf8r0\x9d\xe8?\xff5\
+|2\xc6E\xff\xb5=}q)\xbf\x1c~\xfc\xae\xf9\
+\xad\xa7\xc9\x06\x9a\xee\xf7\xf7\xc3\x0b}\x91\xc5b\xbe\x1e\
+\xde\x8c\xed\xe9\xeb/\xbbN\x98\x96\x1b3dp\xcf\xca\
+p\xdd\xffn|i=\xb1\xd0\xea\x91\xe8\xef\x9f\x7f\x9b\
+\xf23e\xed\xd8p.d\xff\xe1~\x7f\xfe\xd2\xbc\xf9\
+\xd3\x17\xdd4\xef\xfe\xed\x1a\xe4J\x0b\xf9\x8f\x9d\xe1J\
+v-\xeb\xdcw\xdb\x8a\x8e3\xa5\x87\xefR0\xd1'\
+F\xd4A\xcb\x18\x97m\xe3\xba\x85\xdb\xb6\xf9\xef?\x0e\
+?\xf7\x85\x9c\x8a\xb0\x8e\xbcn\x8dud\x07\x9a}\x81\
+\xee;\xef$cF\xcbK\x8a\xe0L\xb3\xa1\x08+C\
+\x09\x1f\x96\xdf\x0d\x05\xb3\xe1'\xea\x9b\xe1/x\x08`\
+\xc6\x87O\x877\xefm\xc3l\xf3\xe9\xe7f,\xf2\xfb\
+\xf1\xe3\xd3\x97\x83\x18\xca\xb6\xa6\xf9\xf4S\xf3C\xcfe\
+\xec\x0f\xcd\xa7_\x0f\xddQ\xb6\x9a\xab\x91\xeb|\x0a\x1f\
+R\xe4QIm\x1dS\x9eR\xc4\x90b\x8f\xdd\x980\
+K\x91\x9eZ\xcf\x13\xaa\x8dR\xd4\x90\xc2\xdaP\xd0)\
+E{j\xcaX\x16\xa7`j&\xd4\xcd'=\xafn\
+vH\xd1G\x99\xe5\xe9|J\x9b\xd5\x0d\xf7\xce\xdb\xa9\
+\xa5\x9c\xb9\xa4K\xea\xf6\xe0\xebf\xb4Jz\x07\xd7`\
+l\xcf\xd3\xa7\x88{\xf9\x8c{-\x17j`\xda\xfe\xbb\
+Z\x9c \x97\xbc\x7f\x96\x01\xd7\x16\x1a\xd8SC\xf6\xe4\
+V\x84F>\xf9\x8e\x19\xda>\xef2.B7\xf3\xa4\
+cx\x18h\xe13]\x9021T\x9b1\x14\xf3\x83\
+&<\xaf\x9d\xa8)\x9f\xc7\xf3\xd3)\x85=\x86\xba9\
+\xb94g\x81B\xdd\xc6i\xc0\xd81e\x01\xf6\xde\xe7\
+\xc9\x98\x9d\xd2\x1e\x1eR\xc2:sJ\x19\xa7\x01\x93\xc7\
+\x94=qKy\xe7k\xc0\xbbd\x1a\xf0\xb7S{R\
+f\x87uc\x0fh\x8a\x16\xca\xc1)\x98Cp{\x1e\
+B\x9el\xb4\x1f\xa7\xf6\x8c\x12\xec\x92\x1a\xe0r\xde\x8d\
+\xd4\xf8\xb1_\xf1b\x0e\x81|\xc0\x9f\x96&\xbc\x98\xad\
+\x88r6\x0f\xd1\x84?\xff\xfe\x05\x13~]\xa1\xc3\x84\
+\xef\x1a&\xe1\x84\x17=\xa5\xb1\x91\xa2\x1d\x1air\x19\
+\xe9'\x959\x1a\x962\xd4(\x8b\xc5\x91\x81\xb5E\x1f\
+g:U$X\xc4Q\xb7\xc9@{Y\xbcD\x0d\x97\
+#|9\xdd(\xf23)m\x8e6e\x01\xbf\x22\xf6\
+\xedi\x05\xbb\xb4\xd6\x98\x1anO\xe8\xb7\x8c\x09\x0b-\
+\xc5)#\xb3\xdb\x85\xe5\x8e\x8f\x0c\xfb\xac\xceg\xd2\xe7\
+\x19\xe5f\xa9`fa\xff\xe1\xbex\xef'$\xcbR\
+\xb2v\xe1:\xe2\x82\xab\x0e\x9c\x97\xee\xe2\xd8\xa9\xb4\x9c\
+\xac/\x82H\xcd[L _\xa0\x86\x9bQ\x973\xe1\
+\xdc(0\x08.'\xed\xaeB\xcf\xe2Q\x7f\xf2U\xf2\
+r\xe9\xa2\xc9\x82\x1b\x88\x19\x91\x22d2\xe6\xc5\xb2\x05\
+\xf7R\x15\xf2\xb8]\x14A\x88\xa9\x11d\xcb\x95\xe7S\
+\x15\xd1E*Xy\x0d\xd5\x13\xbb\x88ZZ%a!\
+\xdb\xe1\x81\xc3\x1cSu\xe0\x0a\xd3\xa8\xee\xfa~9\x9f\
+s\x81\xfa\xfcf\xcd\x80]\x5cP\x94\xe0P\x92\xc4*\
+l\x0fi\x01\xa1\xf4\x1bf3\xdc;\xb8nP\xf2z\
+\xab`i\x86a]\x80\x22\x09\xdf\x11\xb8\xaa\x86JS\
+\x97\x99pG\xfa\xce\x1fL\x98\xbd\x9a\x22\xf2\x02\xfe&\
+\x8cz\xa1#k\xac>\x05\xb5\x81\xa2\x0b\xd4\xe5\x07\x5c\
+\x0efx,\xaa\x1e|J\xce\xf0\xb8\xa5\xb8w\x08\x8a\
+\x18\x0b\x98\x5c.,\x09}pW\xcb\xb7\xc7\xa26\x9e\
+\xc0E\xf0P\x98\x80mc\x08\x8a\x8d(Cwd&\
+i\xba_\x08\x1d03\x22\x10\xa7N\xc1\x10\xe18\x1a\
+*\xc7\xd0q9\x05ja\xb1\xc9\x0d\x0dXN!\xc5\
+\xfa\x94\x0c\xee\x9b\x10\xec6E\xb0\x99\xf6\xb5\xce\x05\x9f\
+\xf0)<\xa3\x86k }{\xf2\xd9\x82\xfb@x\xa6\
+\xcdQ \xdc\xa3\xaaj\xdd(\xd4\x82\x1a\xa73\xb0z\
+6m\xae\x0d\xdd\xb1|\xba\xa9~\xc2\xc8\xd6\x8e\xeae\
+\xf3\xc5?wGk[\xc3\x1a\xa5\xc7/\xcc\xfd\x95\xf5\
+\xcf*\xe8\xa1\xe3\xf3\xe7\x83\xea%\x01\xeb\xb8\xb5\xcc\xbf\
+!\xa2\xfcbN\xbd\x7f{x6c\x96&\xca\xdb\xea\
+\x98z\xff\xdc\xbf?/\xdf\xbda\xa3\xfc6\xa6\xfe\xcb\
+\xe1\xe1\xbbmE\xcf\xa2\xee`\xdc\x83d\xc9\xbe\x85\x09\
+\x1b\x00\x19\x03/-ya\xaa\xe6)\xc6K\xf7l\x8b\
+,\x88\xabi\xdb8\x97\xfbF\xa45\x08\x1bn<[\
+&q9\x93\xbd\x93M\xd5\x89\xe9\xb3\x09\x19\x16\xeal\
+\xdfB\x84>`\x99\x88\x83\xb5\x16l\x0f+\x0fR\x1d\
+\x99\xb6K\xe3\xbf\xb0\xdc\x8b\xd0\x93&\xdd-\xa0\xd8`\
+Xy \xa1RX# \xa8\x97\x95m\xe4\xba\x80=\
+\xac\xb5\xe8\x82z\x99\xf1&\xae\x01\xc6\xc0\x09\x8agA\
+\xc5\xde^a'X\xb5~\xe6\xea\x9c\xe3\x0b\xd4\xf0\xfc\
+y\xeb\xf3\xe4\xd4\x08\xc6D\x01y\xc1h\x00\xe6kl\
+\x80T\xb5\xf9\x0bx\x04\x05\xc7a\x81\xe3S\xb5\xa5\x80\
+Sb\x13\x08\xb7\x87\x82\xe3\xd4\xdd\xbe\xc8,\xedw\xc1\
+B\xc8\xb4\xfd\x97\xbe\x11P\x98G\xb7\x02\x19\x08\xb2\xbe\
+\xc0w\x94M`\x02\xe2W\x18d\x8a<\x85u+\xac\
+\xec\xd9 C\x1e\xe2A\xa1\xe3+\x96\x12\xdc]\x9b\x01\
+\x8a\x14\x0cz+\x8cN\x8c\x0c\xc2\x8f^\x87\xcezv\
+\xa7*\xech\xc1\x08\xb9\xdf\x9e-L\x16\x82oHa\
+\x82Q\x04 e\x0b\x07\x0b\xcd\xcb\xa7xe\xa7\x148\
+\xea\xcf\x90\x88\x9b\xc2\x1e\xaa\x8da\x0f\xc5\x96`\x0f%\
+b`\xa2\x7fN`\x0f\xf7\x86\x88\xf2\x8b9u\x0f{\
+\xc8n\x09\xf6\x906\xa6\xde?'\xb0\x87\xf4@\xc7)\
+\xbf\x8d\xa9\xef\x1a\xf6P*0\xc9\xe4\xf8\xe8\xe1\xb9|\
+~\xe40\x014\xf9\x0by P!\xb8g\xd3\x1c\xdc\
+\x08\x13Ee\x0c\x1c&\x97\xd2\xa9\x1b%N\xc1\xb5\xc6\
+0\x0e\xce3\xc9\x22\x80-\xcb\x05\xc9\x06\xfb\x00\xe7)\
+\x80O7\x82\x98\xf6\x0d\xe3p\x16\xf3s\xc1\x0c}\xf4\
+)\x02\xb8\x1f\xafs.Z\xa1\xec\xe1\x85fs=\x97\
+\xa4n\xbe\x22\x17\xaf\xc8\xc5\x0f\xaf\xc8\xc5\x19\xd5\xf7\x15\
+\xb9\xb8d\x1e\xe1\xa6\xc3\xee\x22y\xf3RF\x1dKZ\
+\x8a4\x83\x883\xc5\xbf\x89\xe2GE\xf2\xe7\xa4\x98B\
+7\x92\xceu\x5c\xc3\xefp\x86\xedT\x15\x1b-\x0b\xa3\
+c\x8d\xb2;\xca\xb3\xce\xbb{\xf6N&iHx=\
+'\xa8\x9a\x14)p\x16\xd2\xda\x00\xf6x\xd5\xa5\xf7\x88\
+\xba\xde\xa9G.\x9e\x135NV\xbc4\xe5\xe3fN\
+\x07u\x1d\xa5\xef\xd3C\x16\xf6\x0e\xc9\xc9\x1e\xf7\x1bE\
+9\xa4\x08\xff*\xce\xce\x04f*\xf8u\xacX\x8f\xb0\
+\xa3\x07e[\x10\x8eF\xc1P\xc7~\xd1\xd8\x22\xdc\xfc\
+\xe8\x15\xe9`$\xe5t\xd1jA\xbeJ\xfb]\xd8c\
+\x98\x87B\xd1\xe1\xdf\xa0\xc3\xf6\xcf\xc2\xff4\xa2mX\
+O?\x8a\x85\xb2RY\xe6rT\x909\xef\x7fs\xee\
+\xa3\xa4\xf4_\xc60)\xfbS\xe0\xa5\xee\x1f\x94N<\
+\xe2\xd2p\x15\xfd\x1bVs#\xdd\xf7\xe1\x8bj]\xd9\
+b\x0c\xb5b\xda4\x5c\xc5\xd9\xf7/\x09W\xb1\xaa\xd0\
+\xa2\xc7\xb9j\xa3F\xe2\x10\x0al\xf2'\xce\x22|`\
+\x1fd\xec\xbbM\xf0\xa9fA\xdad\x98|\xc1\x1b\x1e\
+\xfb{\x13|\xb7\x0b\x9e\xed\xd8\xdb\x1a\xb7\x07\xd7M\xfb\
+\x1ad~\xd8$_t\x18\x82\x84A\x0fz\x92\x0f?\
+\xa6V\xd5\x1b\x9e\xbd\xf522\x8f\x9d\x83\xfb\xed\x85y\
+\xea{\xa5C-\x80\xf4\xb3\xfd\xa9\x8d\xb6\xacu+\xa3\
+-k\xdd\xaa\x85-\xeb\x9eb\xb4\xa9\xec\x9e\xe3-\xeb\
+\xe1\x0d\x11\xe5\x17s\xea\xe3\x96\xb5n\xc5\xc2\x96\xb5n\
+yB\x9d'[\xd6\xc3\x1b6\xcaoc\xea\x1boY\
+\x17\x81\xa5~\xdc\xc3\x80Oj\x93\x0f\xf0s\x81jR\
+0\xa7\x08\xb8\x01\x05\x95\x9a\x9f\xc3\xda\x8aM\xb9\x8a\xd9\
+\x94\xeb%6\xe5\xb1\xef\x83{N\xd8\xd4\xbd!\xa2\xfc\
+bN\xdd\xb3)\x97Kl\xcaEB]\xa4l\xea\xde\
+\xb0Q~\x1bS\xdf5\x9b\x8a\x89\xe5B\x18\xaa\xdc\xaf\
+aEt\x0b\xcci\xd8\xb0\xa9z\xca\x9b\x84j\xe1\x1a\
+\xe0\xa3\x93\x14\x88\x82\x02\xaa\xd7\x05\xefW\xa0MU!\
+\xe6\x82\xed\x98q\x17\x96}\xb8]7\xc2?}\xbc-\
+'\xcb/G\x05q\xdd(G\x83)F8\x05\x94\xc1\
+sb\x07+\x83\xd4\xf1\xca \xcd\xd2\xca\xd0\xdb\xc3\x91\
+\xecv\xf6q\xbc2\xb87D\x94_\xcc\xa9\xfb\x95A\
+\xaa\xa5\x95A\xca\x84\xbaLW\x06\xf7\x86\x8d\xf2\xdb\x98\
+\xfa\xaeW\x06\xc5\x82\x02\xf3\x04\xed:\xcaVp\xdd\xcd\
+3\x0aNK\x88\x0aE*\x870\xed\x0a\xb8\x1cE\xbd\
+\xa3Df\xa3\xc8\xf0\x1b\x89\x9e\x82\xeb\xd3{\x9f\x92\xed\
+\xde\x16j\x8d]\x91\xf1(\xc0<\xb2\x0d\xebef\xc1\
+R\xe6\x02\xc1-\x8b\xa4\xfaPj@\x08\xc8WP\x97\
+\x08\xcaW\xc1l!\xf8\xf6\x93\x14\x01\xac\xa4d*V\
+\x16J\x03o\x14\xd4\x1d[\x82RY\xe8?<\x93\xeb\
+\xd6\x9a\xb0\xc3G\xda}\xc4\xe5\xd4\xd5|\xb1_\x89\xf5\
+)\x99\xd3C\xdd\xadyR\x1f\xe0\x19v\xa3\x03rk\
+b\xa5Q\x86\x85\xd2\x0c\x8a\x17mf\xdeP\xc6\x16\x1b\
+1\xef\xc2\xa8\xa7\xb2\x84\xb2\xeeQ\x0c,\xc9\xe0\xca\xbb\
+\x03CA\x9b\xd8P\xd0v\xc9P\xe8\x15\xdeH\x957\
+mj(\xb87D\x94_\xcc\xa9{CA\xeb%C\
+A\xab\x98z\xff\x9c\x18\x0a\xee\x0d\x1b\xe5\xb71\xf5]\
+\x1b\x0a\x86\x07f|\xf4\x02-\x87\x90\xe0\xcc\xa1\x84\xba\
+*,R\x14L\x84\xb0u|\xb3\xad\xf0\xcd\x8d\x98*\
+\xc1\xc3V\xa0?\xd7F\xb5\xaaZD\x95!w\xdcK\
+X\xaf\xde\x81\x8c\xb5q\xdc'm\x97\xe2>\xe9.\x8e\
+\xfb\xe4\x9e\x13\x19\xdby\xa9j\xe7q\x9fN\xd4\xbd\x8c\
+\xb5Kq\x9f\xb4\x8d\xe3>\xb9\xe7D\xc6\xda1\xee\xd3\
+,\xbf\x8d\xa9\xefZ\xc6v\xc1\x01\x80\x04\xc6P\xce\xf8\
+\xd4\x95c\x9b\xa1\xd8W\x8e\xd9]C:\x16\x16G\x0c\
+*o\x1f\x19\xf9V\xcb\x0c\xec\x03\x92;4e\x0b\x86\
+\xa0\x97\x93\x22xV\xf5\x95\xa3\x04\xd2<\xe3~f\xb8\
+\xff\x19d\xd3\xfc\xd9\xb9\x9f\x19&\x9f\xe5~\xc6G\xc1\
+\x97\xb8\x9f\xe9}\xbb\x9f\x19\x91p\xc9Kt?;5\
+\x92\xe4~FqU\xda\xdc\xc9\x0c\xdf\xb0\xc4\xa6\x1b|\
+\xd2<\xf8f\x9dB96\xe4\x91\xe9MN\xf0\x06\x9f\
+\x1d\xb8\x10\x19\xc3\x22\xa5\xcf\x18\xbe\xa0\xf4\x19\x13\xef\x91\
+\xb9\xe7X\xe9\x1b\xde\x10Q~1\xa7>*}\xc6\xb4\
+\x0bJ\x9f\xd1\xf1\xfe\x9e{\x8e\x95\xbe\xe1\x0d\x1b\xe5\xb7\
+1\xf5=+}f:\x9b&\xb9\x97\xf2&c\xe0\x1a\
+\x97\xd6\x14\x0e\x14`\xa0\xb8j\x88\xea\x9b\x1dvX\xe1\
+\x89\x8f\xe1F\x88\xb9\x91\x8e\x92b\xbd\x03j1\xa4S\
+=U\xa3\x8dW\xdek\xaa\xd2\xf9\x94\xf3_\x14\xf5\x16\
+o\x0f`\x0b\x82\x82e]#R\xd2\x9d\x0c%\xd6j\
+\xb7\xb7\x06\xea\xde\xb7v\xa3A.\x08\x7f\xca\xe1H\xb8\
+?^\x10\xd7\x9b\x1d\x99\xbf\xd1mj7[\xc3\xf6\xcc\
+\xceU\x1duH[X\x14\xe0\x95\xe2\xc6T\x17H\xa6\
+\xacC\x14\x8e\xc7\xd4\x08\x5cU\x18\x9f\xaa\xc0\xb8\xe7\x9d\
+=\xc7\x910\x9d9\xdb\xc5\x85\x90A\xb0#)\x9e\x0d\
+\xa4\x03\xaf5\xd0\xd0\x9b\xf9\xb3R\x80\xcc[E\x16\xae\
+{\xb1\xe4\xad\x5c\x15\xeb^\xe1z\x97.\x84W\xbe\xbd\
+q\xfb\xf3\xfc+\xb6e)\xe3T\xe8\x14\xca\xad\x0fu\
+\xd7\xd7*\xf7o\xde\xc8\x1fq\xb3\xedl\xca&\x0cn\
+`\x9d09u\x17\x01\x8a\xeaL\x89\x93r#\x7f\xf5\
+\x15^\xa8$?\x9b\xed\x9d\x0b,\x13\x11\xcel\x99\x5c\
+\xc0\x99-\x8b\xb7\xff\xdds\x8c3\x0fo\x88(\xbf\x98\
+S\x1fqf\xcb\xf8\x02\xcel\x93+\xab\xecxeU\
+T>k\xc6\xda\xf1\x19\xce<\xa7\xbeg\x9c\xd9\xf6M\
+\x18\x07\xfc\xda83\xc1\x9e\xab\xac5Q\xceb\xd5U\
+\xb4o\xa5\xd1\xd5\x0d\xebS\xd5\xde\xae|]'\xc1z\
+/H\xc3\xaa\x9e*\x95wI\xf0\xc1\x8b\x15\xb7G\x10\
+N\x1f\xeca!\x10q\xcc\x02+\x96b\x16X\x11\xc7\
+,p\xcf\xc9B \xc6\x98\x05\xb3\xfcbN\xdd/\x04\
+b)f\x81\x15<\xa1\x9e\xc6,\x18\xde\xb0Q~\x1b\
+S\xdf\xf5B B\xcc\x82+/\x04\xa4\xe3\xceu\x81\
+\xb0\xaa\xd0\xef=Fe]\x8a{\x5c5\x0a\xe7\x0b\x09\
+\xa8JY\xac(\xe6\xd2\xcd.@\xbc\x11\x0e\xb1\x83}\
+%\x0a\xd3\xd6\xb5\xf1W\xb8\xb0Rt\xbc\x1a\xfa@A\
+B\xd5\xadR\xddcU\xd87b\xcc\xa3r\x95\xeb\x0a\
+\x1e\x91Y@\xbe\xe9\xd9yDZ\xddV\x09\xc8\xe7>\
+\xb9\xf4\x1e\x91=\xe1]{D\xda\xc9k\xe9\x05{D\
+\x9e\x1a\xf9\xea\x11I\xf3\x88,\xa4@\xbfG\xde\x85Z\
+gNT/\xcd\xbf\xb2c\xf1\xc1\xc5\x8e-\x1d\x5c\xec\
+x|p\xd1=\xc7\xe6\xce\xf0\x86\x88\xf2\x8b9\xf5\xd1\
+\xdc\xe9\xd8\xd2\xc1\xc5\x8e\xc5\x07\x17\xddsl\xee\x0co\
+\xd8(\xbf\x8d\xa9\xef\xd9\xdc\xe9\xf8tp\x11\xc6\xbez\
+q\xfeFu\xdd\xc0(VT\xd5\x0d\xc5:\x1b;\x14\
+Dl\xf3\xd3\x9c$d\xb4\x86\x99\xb8g\x9b\x0c\xc7\x81\
+\xb9v\x5c\xf0\x1a\xa1\xcf([\xdd~\xf15\xd7\xde\x85\
+\xaa|P\xfb\xba\x11!6st\xa1\xd8\xd0\x98A\xe4\
+\x0e\x14\x11\x11\x9f\xee\xed\xc4\xd2\xe9\xdeN\xc6[d\xee\
+9QD\xa4W=\xc4\xfct\xef\x89\xbaWD\xc4\xd2\
+\xe9\xdeN\xc4\xdb{\xee9QD\xc4x\xbaw\x96\xdf\
+\xc6\xd4w\xad\x88\xc8)\x869\x0c\x09Sw\x83z\x07\
+7\xa2|\xbb0\xeb7\x0c\x99V\xf6L\xa58\x87\xd4\
+\xf5\x1d\xa4\x5c\x1fE8mE\xa95)(V\xdd;\
+\xf7\x08\xc7\xa1H'\xea\xeb\xf2\xc19h\xb1\x92/\xc2\
+v\xb7\xdcCv.\xc40\xdc\xf1%\xad\xf7\xb8,l\
+\xaa\xd2\xa9.V\xe9t\xbb\xa4\xd2\xe9x\xb3\xdb='\
+*\x9d{CD\xf9\xc5\x9c\xbaW\xe9\x94]R\xe9T\
+\xbcQ\xef\x9e\x13\x95\xce\xbda\xa3\xfc6\xa6\xbek\x95\
+N\xcb\xc0\x9d#\xd7\xb8\xdb\xcdGn\xbf\xc0\xf2\xa8|\
+\x90\xf0F;\x8b\xf78\x0f_\xd5\xb3(\xcf\x9e\xaf\x09\
+\xdf\x1f\x1a\xf4R\x90\x9d\xd7y{\xe7\xf3\xf6\xbe\xb09\
+H\x1e\x87\x12\xdd\xee\xd4\x0e\x9eO+\xaen\xa4\xd8\xb6\
+\x19y<\xe3v}<R\x0c\xeaP\x17<\x0b\xfd\xe5\
+`r\xc1\xb3\x10\x8b\xf1\xd67=\xbf\x02l\x87G\xa7\
+(\x17\xc3\xe0\xca\xd6u\xaf\xbe\xab\xed\x9f+c\xf8w\
+\xb9KK\xd2\xean\xe4m[\xf7\x0e\xe8:\xbcJ\x08\
+$R\xf7\x8c\xc8\xb7s\x91\xb4\x97\xd2j\xe1ZN\x82\
+\x12B\x09\x86{e\x89!\x83\xd3\xd4\x1a\xf7\xe8\xba\xfe\
+\x16\x94\xa1\xa4h\xeau\xfd;\xeb\x1e!\xaf\x0a\x10\x93\
+\x0e\x02QZ\xba\xc2\x83\xa5\xae2\xbf\xb9\x5cxU:\
+\x9e\xd9\xe7\xe7v~w\xac\xf8\xf3\x96S,)|v\
+\x91\x10B\xa5.\x83P\x9c\xc8\xeb\xf7\xb9E\x1e\xd8\xc6\
+\x05\xd0my\xcc\x88&x\xec\xce\x1a\x18n\xfe\xc6\xba\
+\x9a\x11i\x1e\x98\xe2E\x96]8S\x18\x98We\xe5\
+\xbc\xf3\xd4dV\xb7\xb02*\xbf\xd0\xa6\x93\xa4[X\
+\x15Z\xb8*\xb0\xc0\x18\x9e\x9b.\xa9u@\xde\xf2}\
+\xb0i\xf5\x01n\xd8z\xc1\xd9\xfa\x09\xb5\xa7\xd0\xd2\xf7\
+\xbe\x1c\xd1\xa5\xd8i\x0b\xa9\xb1=\xb0&\x12\x07\xcc\xaa\
+%\xde|\x1e\x5c\xf7\xedD0\xe1\xdc3\xc4\x1a\x15\x93\
+r\x99`Uo\x22\xd2\x8ey\x8d\x85\x16_\xd4\xca5\
+aX\xaa\xde\x14X\xf9\xba\xaal\xf5$\x84\x8d%\xad\
+\x9e\xb8\xf3\xa7rR\xef\x0e\x1eDnv&\xa6\x90\x82\
+\xa9UuY'i\xbd\x14\xe0\x0e\x0f\xf2t\x0c!\xad\
+\x81_\xded\xbe\xf4\xf2\xb7\xbe=\xd9\xd1\x05\x12\x9b\x11\
+\xaei,L\x81\xaa\x11\x9a\xf7\x1c>\xaf n\xe0\x9d\
+X\x85\xab\xdb\xe0h\x17\xf8 \xa8z\x198\xc1\xc2\xf8\
+\x8c\xf3j\x9e'(\x19\x5c%s\xa10\x1b)s\x8e\
+\x02\x1aP,\xa5s\xd8\x94^\xc0\xa6 _\x8b]\xab\
+S\xdd\xc9y\xa6\xd7\xaa\xf8t=\x10\xf7\xecfS\xbd\
+q\xcf\xd3G\x04\x16\xcdE<\x9c$\x05\x16\xc5S\x01\
+N\x1f!\x83-\xc0S\xf1\x06\xa9\xe1\x14\xa1P\xddp\
+\xca\xf6!\x83(\xf8\xd9\xadTL\x12\xbf\xd5\x05\xe5\xb3\
+k|\xa7\x13\xac\xed\xc8\x00\x97X\x0b\x94\x15\xb1*\x80\
+KYA(\xeb\xde\x0a\xb5\x94\xb4\xddA8\x88\xe5\xed\
+c\x93\xcfq\xd2}\xc8+|!p\xff\xc1\x83\xa7\xa4\
+\xb3\x1bU\xf5T\xd2\xb5\xd8P\xa3\xa8\xbc\x9e\x9b0\x94\
+g\xa7)r\x03Y\xaa=Ec\x86:;^\xa0\xb0\
+FV\x98\x9d\xb8g\xbf\x19#\xb8pL\x9b`\xb7P\
+\xc4\xcer 4>S\xe5,\x17\x8aw\x92\xb1\x82\xf7\
+\xf6\xf9\xf7/\x09i\xb1\xaa\xd0\x22j<\x22\xf5J\x85\
+F\xca\xa0\xaeg\xd2\xf0\x5cJ\x97\xbb\xf5`\xbcr\x1a\
+\xce|\x12c\xfc\xb5\x0b\x13\x04n\x93\xe4H\xf3\xb4\x1c\
+g\xeeC\x105\xc68o\x01\x7f%\x94\x83\xd1i\x0f\
+\xf8\xc9U}\x80\xb1{\x88\xf7\xe3\x1aLz\x9aN\x11\
+m\xaf\xafc\xd3u\xa9G\xc3\x02\x90\x09\xbd\x025\x81\
+F\x01\xd7\xcd\xf7\xc10E\xfb\x9f\xe6k?k\xda\x81\
+\xd3\xc1\xa4\xfa\xd0|8\xfc\x1f\xca\xc4@\xbc\x0aen\
+dstream\x0aendobj\x0a4\
+7 0 obj\x0a4292\x0aend\
+obj\x0a50 0 obj\x0a<< \
+/Type /FontDescr\
+iptor\x0a/FontName \
+/QYBAAA+ProximaN\
+ova-Bold\x0a/Flags \
+4 \x0a/FontBBox [-8\
+0.0781250 -199.2\
+18750 1041.01562\
+ 909.179687 ]\x0a/I\
+talicAngle 0 \x0a/A\
+scent 1079.10156\
+ \x0a/Descent -387.\
+695312 \x0a/CapHeig\
+ht 1079.10156 \x0a/\
+StemV 87.8906250\
+ \x0a/FontFile2 51 \
+0 R\x0a>>\x0aendobj\x0a51\
+ 0 obj\x0a<<\x0a/Lengt\
+h1 6632 \x0a/Length\
+ 54 0 R\x0a/Filter \
+/FlateDecode\x0a>>\x0a\
+stream\x0ax\x9c\xcdX{T\x14W\x9a\
+\xbf_Uu7\xc8\xb3i\xba\x9b\x87B\x17\x0d\xfd\x00\
+\xba\x9b\xee\xa6\xbb\x11T\x1e\xf2T\x0c-\x10D\xf0\x01\
+*\x08\x0a4\xefg\x0c\x92\xa0$\xe2\x9aI\x8c\xc6h\
+\xe2\x185n\x96\xc9\xe6\xe4d\xcd\x18\xc7\xc79j\xb2\
+f\x12\xf3\x1a'\xc7\xf5\xccp\xb2\x8e\x13\xdd\x9cq\xdc\
+$c\x12C\xe8b\xbf\xaa\xaeV\x1279g\xff\xdb\
+\xba\xa7\xba\xbe{\xfb\xde\xef~\xcf\xdfw\xab\x08\x10B\
+\x02\xc8VB\x13RVa\xb1\xed\xff\xafwN\xe2\xc8\
+N\xbc\xeb6\xb6\x0c4^\x19\xfe\xcf\x06\xa4o\x11\x12\
+A55\xd4oh\x5c]\x12\x88\xf4\x978\xe6l\xc2\
+\x81\xb0'%\xb1\x84(\x0c\xd8Olj\xed\xee\xbfr\
+:\xbc\x02\xfb\xa5\xd8\xff\xb8\xc5\xb3\xbe\xbe\xdf\xd65N\
+H\xe4\x5c\xecoj\xad\xefo'\x19d9\xf6\x9f\xc0\
+\xbe\xa6\xad\xbe\xb5A\x11qw\x1d\xf6_!D\x92C\
+hFO\x9d&\x12\xc2H\xec\xcc\x078c\xbf\xefI\
+}@\x8eSn|\x12\x89\x94\xe6\x1f\x8c\x86Pc\xf8\
+?/\xbbp\xb5\xb6tu\x11\x0d\x09\xf9\x81\x91\x96s\
+\xe5\xa8\xd0a:FC\xe0\xd7\xfc\x7fp\x9d:\xc0\xef\
+F\x18\x5c\x99\x8f\xcb7H\x1eFme\x84\xd8\xe5\xac\
+<\x89\x95\xb3\xf9\x94\x86K\x84}\x5c\x93\xe4\xe1\xa9\xdf\
+\xe4\xe3\x8e@\x90;}KR\x85\xb2\x08\xb3X\xf9\x18\
+h\xa9<I\xd5\x0f\x133\x84\x97\xa0\x11\xf9\x1e\x94\x1c\
+#aD\x81\x94T\xafs\xa4\xbb\x9cv\x9bZ\xa5\x8c\
+\x94Ii\x9c\x0fT\xb6\xd9b1gg[\xcc&\xcb\
+9`\x18\x0fXRs\xb1g\xb6d\xe7\xa6Z~x\
+\x86\x9e\x9c\xd6\xf2\x1a\xe4\xce\xdc\xa4?\xa5\xbf%\xbc\x15\
+u\xc8C\xa3\x96\xe9\xb4\x092\xa92R\xad\xb2\xab\x5c\
+j\xa9L\xaaM\xd0\xeb\xf2`\xcf37\x80\x1e\x9d(\
+\xda\xd1_\xb2tiI\xff\xb6\xd2\x89\xf9\xf5\xeb\xc6o\
+<\xb3\x07\xbe\xfc\xcb\xee\xa7\xdf8\xb4\xa9\xcc=\xfcX\
+\x99\x1b6\xbf\xe8\xb6\xd9w?\xcdK\x997s\x93\xb1\
+\x22\xef\xb9\xc4\x84\xdcQB\x9f\x8cj%\xabB\xe66\
+\xec\xfb\xd9\x03>\x85\xc6\xea\xf4B\xcb\xcb\xcd\xee\xeb\xdd\
+\xfd\xe7\x1dO\x80\x97\x0d^\xb6d\xb0pI\x89\xa5\xb3\
+\xb8\xa5\xad\xe7\xc6\xb3{)\x92e\xb2\xcc\x9d\x17&g\
+\xe0&\x1d\x12\x16;\xcf\x92\x06_\xee\xea\xeb)*x\
+n\xdf\xd7\xf37\xe4\xe4\xc5\xc6\x9a^\xc9KL\xfc\xd5\
+.*\x01\x14\x91,\x9b\xa4\xd3%\xe9\xb4ZV\xc9\x1b\
+\x8b\x8c\x10\xc2\xb0(\x95\x9a\x10V\x8e[\xf1\xda\xcax\
+#+Q>\x17J\xa6\x94\xd3\xf3\xc0\x9cV]\x9c\x99\
+\x95\xc8M\x03\xe3\xacY\xd9q\xb0b9UU\x9f\x9a\
+\xc2j\xd3\xbc\x8d\xf4\xe4H\x8e9\x05\xa0\xfc\xe1g\xbd\
+\x85\xc81\x05m\xf84r,#\xc4\xe5\xf2\xab&*\
+\xf2`s\xe8\x043\xc8\xc4\xad\x95R\xb4\xc8\x83-\xd2\
+g\x98\x94\x8e\xf9\xeb\xebW\x96\xa7\x18\x00BB\xe3\xe2\
+\xe25i\xc6\x88\x08\x83Q\xa1d\xb5\xf2HU\xf4\x9c\
+\x10Y \xb4\xb5\x9c\xfe\xfc7\xcd\x962\xf7\x8a\xa2\xe4\
+d\xb0\x98\xeb\xf4J\x85!)J\xc5\xb2\x91\x8ahU\
+hp\xa0\x0c:\xbb.\x8e\xf4\xf4\x8d\xfc\xd6i0\xc6\
+F\xa7EE*BC\x02eA2\x09\x154'@\
+\x16\x16\x12\x1e\xa6V\xc6DiY\xddc\xabj\xc6\xfe\
+\xcd\xca\xb2Q1\xc9\xc9\xaa(E\x00-\x09\x0c\x92\x05\
+\x86\x85\x85\xcbU\xd1\xd1\xb1\x09Z\xc3\xce\xea\x1a\xa3A\
+\xb4\x22u\x8e\xbe\x83\x11\xc8G\xa8`:\xa5N/\x98\
+r\x04\x18W\xd5\xc35\x89\x89y%K\xe2\xe9\xc9\xb1\
+\x02S\x0ap2`\xb5&o\x17\xae\x0c\x9f\xb9A\x1d\
+cn\x91h\xcc9>r\xe5Z\x07\x1f\xe3v%j\
+\xa4V\xb9|a\x01\x1f<Y\x5c|\xf4(H\x7f\xff\
+\xfb\xa8\xa8\xe4\xb91\xd1\xc1\xae\xe2h(*\x18\xa5\x98\
+\xeb\x10\xc6}u\x9d\xcb\xb5\xc4i 00\xe8\x9d\x5c\
+\xcc&\xf4%\x93%\xe4\x83\x81\xa4>\x98\x11\xc0\xef\xc1\
+\x0f\xb8l\xfe\xf0V\xf2\xfb\xb1|j\xd1\x87\xfc\xa9b\
+2Y\xa6\xfft\xe4\xc8\xea\xda\xbd\x9dK\x9d\x89i\x19\
+,\xfb\xee\xbb\xdc\xf7T\xc3\xac\xf41Yr\x84\xf4\xa1\
+\xa6\xae;~\xbd\xba\x16\x0cg\xa2\x13uy\x8e\xeb^\
+\xa9\x90P\x14\xe6\xd3\x0d\xfa\x0a\xc6B*Y\x88\xf1\xe5\
+\xc0\x98\xd6'\xf8\xfc\xee\xd2\xf1\x09 \xc8\xa0R;|\
+\xde\xd7\xfb\x12\x82o\xf2$\x87?\x22|\xa9\xe7\xa4.\
+\xdb\xcb+\xea\x17e.\xb0\xdb\xe35\x00\x9a8\x87-\
++3{}\xc5r\x1bd.\xac?\xbae\xdd\x1b\x5c\
+\xf5\xd2\x92\x9c\x85\x89\x09\xc0Mk\x5c\x999\xcb\xd3\x1d\
+\xcetwN\xa6\xabq\x01\xab\x05\xa5R\xaf\xcf\xcdv\
+\x97\xe7d'&(\xc2!N\x93\xf9\xe4\x12\x8b\xa9\xe7\
+\xb5\x17\x14\x91\xc6\xe4\xa5K7zGn\x0f\x1a\xd5*\
+\xbd\xb1 _\xa7\x07\xb5\x8a\xf8pG\xeaF\xdc\x09\xe6\
+s\x03\xb4\xc0\xa7\x05\x00+\x97\xa4p\xc3\xc3\xdc07\
+\x09\xfb`)\x94\xc2~\xfa\xca\xb4\x91\xbf%U\xd3\xaf\
+\xd2\x95S\x13b^\x15\xe3\xda \x5c\x0b2%oZ\
+\xc0\xc54\xc5M\xf5\xf1i\x04}\x90\xcd\x0d\xc0\xb3\xb0\
+e\x98\xc3e\x1f\xc1[\x5c\x8e\xf7\xba\xb8+\xf3\x10\xae\
+\x0c\xf4\xc5\x12+\xdcc\xf4E\xef*j\x8fw\xb3\xa4\
+j\x8a\xbb2\xe5\xbd\xc8\xcfD?S\xefH6\xf1O\
+\xfb\xcf\xf8\xf4w~\x07j\xad\x99\xf1\xe8\xc0{\x9e:\
+\xa9L\xd2\x15X\xd1S\x222U\xa3\x97\xa2\x89\x1e\xa3\
+Pp\x90\xc0J\xc8\x7f_\xcc\xf0\x0d\x03YHd\x9f\
+W\xa8\xd2\x83\xfd\x83\x0b\x16-Z0\xd8\x7f\xf0\xe0\xe0\
+\xc0\xa2\x85\x89\xba\x9c\xbc\x0d\x0d\xdc'`*X\x0c\xb0\
+\xb8\xa0\xa7gq~tqa_\xcfS\xbbz\xbaJ\
+\x0a\x01\x0aK\xbazvm^]WXbH\x86\x05\
+\x95\x95\xe5C\x03\x15\xe5\xe5\x15\x03Cb\x06I\xcbQ\
+\x06\x03o\xeb\xf4\xfb8\x94\xfe\x00 \xa9\xc5\xa8Q\xca\
+%\xa5\x89\x89\xa5\xd9\xce\x8cx\xee\xfb\xdd\x8b\x5c\x19\x1a\
+\xde\xaeI\xabj\x9b6\x15\xe5\xcf3\xad]\xbdy\xc7\
+\xb2R\xaa\xa3$99\x01sm\x03\xd5\xf1bB\xa2\
+Y\x80+\xa7\xcd\x0a\x08i\x0f\x978\xd3ai\xe9\xb3\
+^\x87o\x7f\xd8\x86V\xa7}5\x06\xb3\x16-=!\
+H6s\x03\x11rR@H!\x82\x854e\xf9\xf4\
+\x14\xa0\x8dO\x9ayY+j\xda\x0f\x95-\x07\xc6b\
+^Y\x98\x95\xa9\x07fKnr*@\xc5\xf2=\xd4\
+Y\xef+\xeb\x92\x935\xf1V\xea\xa0\xaf\xca\xe0%\xd5\
+#G>\xaeh\x9a\x05V\xa1\xb0+\x14,\xd0\x9f\x7f\
+\xf21\xf7\x05w\x19BO^\xbdy\xf5$\x84r\x97\
+\xa9\xc3\xde5\xf4\xa4w#\xf5<\x7f\xe3r_di\
+QR?b\xeb\xfd\x06\x92\x8b\x15\x05\x11;\x1e\xd5\xab\
+)\x9a\xbf \x897I\xfa\xaa\xda\x8eC\xcb\x97S5\
+\xf5\xc9\x06\x10 [R\xc5IsL\xa6\xf2\x8a\xdd\xde\
+<\xf4?\xafa+r\x8c Z\x9f\xf6<#\xd1\xf1\
+\x98\xafJ\xb9\xca\x97\x82\x0e\xde/|(\xa0u\xe6\xbb\
+\xcbV\x9e\x1b\xc2\xeb\xdc\xc9\xfe\xf8\xdc\x9c\xec\xce\x02\xbc\
+:\xb3sr\xe3\x91y@\x89A\x0f\xe3\xbbn\x7f\xbd\
+c'\xec\x1b\x86\x85\x16\xccXw\xd9\xc8\x88\xbb\x0c\xe2\
+Y+\xea`\xa7nS/`\xe4\xca\xd1\x1c.\x99\xde\
+\xa5w\xa9\xf5v\x99K-S\xcb\xf4j\xd0\xcf9\x9b\
+s\xf1b\xce\xd99#sN\xe7]\xbc\x98wz\x0e\
+u\xfb\xda\x80\xa7\xb1\xb1c\xe0\xda\xb5\x81\x8e\xc6F\xcf\
+\xc05\xbe\xa2b\xa6H\xfaP\xeeP\x1e=Qn\xdb\
+\xfdh\xd5\xd2\x82oP`\xbdv\x8c\x8a\xbd|\xec\xe5\
+U\xb5\xb5\xab^>v\xf9\xee\xdd\xb7\xbb\xbb\xa0\xbd\xe3\
+\xfd\xbb\x92\xaa\xca\xaa\x03/\xbewi\xff\x0b\x95\x95@\
+\x86\x86\x8e\x9f\xe9\xef\x05\xde\x1a\xdc\x18\xd3\x8a\x91\x18N\
+X\x94N\x08<\x01\x96|\xc5\x19\xfc6\x90\x8b\xa5\x0d\
+\xb6\xf16\xee=uap\x00``\xf0\xc2\xa9^\xb8\
+ZP\xd0\xce[B\x93\x9b\xb3\xa8\xbd\xa0\x80\x1b\x93T\
+m\xd9\xbbc\xfc\xab\xaf\xc7w\xee\x83\x8ea\xde\x0a\x09\
+f\xee\xa5\xb4x\xd6]\xc6\xc7C\x0dM\xa0\x07\xad\x81\
+\xd5CA\x09\x99\xe7\xd7C\xf6Z\xa5\xd1\xb0 #5\
+Y\x89\x17\xce\xfa\xad>\x13}\x08\x86\xe4\xcc\x88\xde~\
+O\x1b\xa1f\xbeE\x1b\x8c\xa0\x0ddd\x0e\xc6\x83\x9e\
+\x95\xb1\x02\xcc\xb0L~\x95\xf7\xc5*\xee\x1c\x15\x0e\xad\
+T\xa87\xeb:\xbcs\xeb\x16\x1f\xd2L\x8d\xf7\x9fp\
+\xcf\xc2\x99\x1b\x92jI+I\xf1\xd5\x9dY9\x7f\x1f\
+\x84e\xb3!X\xa8D\x14\x1d\xb1\xe7\xf1\xd1\xbazW\
+F\x86\xab\xben\xf4\xf1=\xeduk\x8a\x0amV\xc3\
+\x94\xa9\xba\xa6\xf5xo__\xef\xf1\xd6\x9aj\xd3\xd4\
+\xf9hp\xa4\xaf\xaa\xd9>z\xe0\xf9\xed\xdbV\xd58\
+\xd2c\xe7\xa5\xd9\x5c\x19\x05C+2\x5c\xc3[\xcf\x9d\
+\x1f\xde\x9a\xe1\x5c9\xc0\xbdN`\xe6\x0e\xe7a\xf8l\
+\xc0X\x10\x0a\x9e\x8bW\x80\x15\xce@\x09\xfamI\xa6\
+Fm\x12\xe7\x01\x15P\xd8\xa29\x8b\xa3v\xd5xQ\
+\xe6~9\x14W\xd2\x7f\xf3\xba\xa9\xd7\x7f\x18y<\xdd\
+A\x87\xa2Nu\xdcMx\x0b\x1c\x04\xc1[\xa1\xe7U\
+\x11\x0e\x0dB\xe9\x13\x0d\xfay{\xba\xc5\x1c\xacPd\
+\x19\x8ci\xe6\xbcR\xa7s\xfe|\xee\xe6\xea\xd8\x0c\xa7\
+C\x9a\x9c\x9c\x9bgK\x03\xd7\xfc\xba\x8eu\x0d\xbcW\
+\x8c\x88\x8aO\xa1W\x96\x8a\xe7\x18\x97\xea\xc1s\x8c\xcb\
+\x7fH\xc4\x8e\xd4g\xa8_h(\x00\xab1\x1e*\xf3\
+\xb4mo\xcf^\x88g\x980\xa5ZgL\xd0\xba\xce\
+T~\x18+\x01xj\xe7-(\xfa\xf0\xb0{c\xf3\
+\xc6\xbatG\x80L\xa5\x88T\xe8\x92b\xa2\xed\xd6y\
+\xb16\x8b&.\xd9\x10\x1b\x1d?W\x1e\x1e4\x07\xc6\
+wr\xdfp{\xceMV\xd8\x1c\x00\x16Sv\x5cT\
+\x94<L\x1e\x1a\x14\x10\x9a\xac\xab=\x19\xa7y\xad\xaf\
+\xf7\xec\xa7%\xfa$\x80$}\xb6:B\x11\x126'\
+xN\xb04 (H\x16\x10\x12\x1a\x1c\xa2\x88T*\
+\xe3\xe2Xmr\xaa\xf5\x9d\xfeA\xd4v\xed\xcc\x17\xf0\
+*\xda.\x04\xb5\xd5\xdd?+h\x13\x9e\xb6\xd9\xac\xf9\
+\x8bmV\xabmq~\xec\x09\xdf3\xcd\x86y\xa2\x16\
+p\x88\xaf>\xb1?_\x7fxX\xfa\xddO\x0e\x11\xb0\
+\x06\x98\x07O\x0c\x02\xdc\x226\xce\x5c\xa1\x0eK\x86y\
+\x1cV\x82\x1d\xe0\xf33\x5c\x8cQ\xf2\xcaT\xb5/\xdf\
+\x99\xab\x18\xeb\x0a<CcU\x15\xb8\xdb\xee\xd7'\x19\
+\x80\x13\x03\x16\x07U\xf48w\xe7Sn\x92\x1a\xfe\xc3\
+\x96G\xa2cRR\xed\x8e\xf9`\xe7\xf6dffU\
+s\x1f\x81\xb5\x1a\xbe\xe0\xd4\x92\xaa\xa1G\xce\xad(Y\
+b\xb1\xc5iB\xbcwi\xf5\xa4\xc3\xce\x8d\xc1\xac\x0a\
+\x1c4\xbb\x02\xb3\xca{5\x98:\xea\xab\xc2\xdc\x85i\
+\xdfl\x98\xb8_9\xf0\xdd\xc4_9x|\x12+9\
+\xeb;<\xe0\x0f\xe3\xf0\xf6\xe0\xc9!\x85\x1a\x00-\xbd\
+wz\x13\x16\xffq\xbaG\xd0\xbd\x82k\xa2\xb2$C\
+\x02*\xfa\x8fHj\x7fX\xc1\xbe=+V\x02\xac\x5c\
+\xb1\xe7\xc8f+\xfad3\xd7t\xec\xbb;\xdf\x7f\xf7\
+\xcd?&\x86.\xbcy\xe2\xb3ko\x9e8Kx\xfc\
+\x22\xb2*\xf1\xcc\xe2\xab-hE\xac-\xcc\x0b_\xde\
+\xe6\xde\xc7\x13G\xe1\x7f\x03\xf3W\xa0\xfe\x0e\xc5\xdc\x10\
+=1\x8ds\xa7\x93\xe8?\xf1\xb7 \x83\x1du\xef\x11\
+\xf0\x84\xb0r_\x83\x0b\x5c;\x93\xc7u2U@f\
+\xc8\x0f\x13\xa2f\x95\xe2\xe9F~\xbf1\x16\xef\x10\xea\
+\xa6\xa5\xb6A\x12\xb5\xd0{AR\xe5\xbdIE#_\
+Z\xb0\xe9\x14\xaeP\x91\x04\xfe\xfd\xc7\x8f\xd6\xa2\xf7\xf8\
+'\x8f\xaf\xc0\xfa\xcb\x0c+\xc7\x19>\x04\xd7\xb2c\xd4\
+Gk\x96\x95\xa6\x99c\xa3\x17\xe7oh]V\x0a\x1b\
+7\x9d\xe2\x16BkqjJJj1\xb7\x1b\xfa\xca\
+-f,y\xe5\xdc\x93\x92\xaa\xb9\xf3\xac\xb6\x85\x8b\x0a\
+\xb6TT*\xe5uu\xc3\x8776\xd1VH5\xe6\
+g\xa7&s\x97\xbd\x17SS\x96.\xb6\x98x\x1d\x10\
+\x01KQ\x22%\xa2\x05\xca.\x153\x1c\xc9p\x994\
+\x89\xd1\xeb\xc6@\x8f\xf5\xfb\xc0s\xe5e\x00\xfa\xe7\x0f\
+p\x7f\xe4>\xde\x7f\x80bi\xc7\xf4\xa7\xbb}\xae\xd8\
+M\xa7L\x7f\xc0\xdd\xdd\x7f\x00\xe0\xc0\xf3|E*\x9c\
+\xb9)\xb9\x8a\xa8\x1aM\x8c<\x96\xcf:\xe2\x0a\xf5\xc3\
+\xf7\x16\x83/x\xe9?\x06\xd6G\x9c\xce\xf4\xb5\xab\xb7\
+\x8f\xee\xbbt\xf4\xc8\xaaZ\x80\xdaUG\x8e^\xda7\
+\xba}\xf5Z\x9a\xeb\xea>y\xaa\xbd\xb3\xb3\xfd\xd4I\
+\xac[\xbb\xe0\xf8\xe8\xe8\xeaZ<\xb7\xd4\xd4\x1c>\xf2\
+\xde\xfb\x87\x0f\xd7 \xb6\xae\xa9\x85\x97\xceo}\xf4\xd1\
+\xad\xe7\x11W\xb7\x0e\xa3nZ\x8c\xa4P\x8c$\xac(\
+\xae\x08\xdc\xf1^A\xd1;\xcfc\x06\xb7\x1e\xdd\xbb\xb2\
+\xbaz\xe5\xde\xa3-\xb5T\xdf\x897\xcf\x0fM\xfc\xe3\
+\x9b\xef\xbe\xbf\xf3\xdd\xb1\xe13\xbc\x16\x113_\xd0[\
+0\xb3\xed$\x17#Q\xac\x0a\xfe\xc6{G\xcf\x9f\xd5\
+ET\xf5\xbf\xab\x8aM-\xc5\xfcW\xfc\x08A\xc0\x18\
+\x1c\x1c\x16\x12?7\x22\x5ckP\x22\xa4\x19\x8ce\xbb\
+\x9b\x8f\xb9\xfb\xba\xb7_@\x95\xc2\xe5\x09\xda\xb9qf\
+]\x98\x5c\x15\x15\x18\x04\xa0\xfb,\xdff\xb3\xa5\xf9!\
+\x87\xaa2\xe8\x12\xa3Tq\xb1\xa1A1s#\xc2\xe6\
+\xc5\xce\xb3\xb3\xf10|j\x8d\xc3\x0e\xd55\xbfZ\x94\
+f3\x18\xd5\xd1\xf1\xb1!\xa1\xaahUT\xac\x83\xcd\
+-\xe1\xd2\xee\xc3\x14\x7f\xba\xe5\xda\x18\x93p\xb2\x9c\x8f\
+\x15\xc6\xe5\xabd\xbc\x22\x8e\xd9\xe5\xc1\x81\x11\xe0\xd7A\
+\x8b\x05\x11\xe4\xb3\x8a\x1f\xff\x1a\xd6\xda\xdd\xf6\xae\xddd\
+2\x1ab\xa2\xb6\x1c?\xdf?8\xd8\x7f\xfe\xc4 H\
+\xf1@\x93\xee(*),*\xdb\xb6\xa1\x91Z\xab\xc9\
+\xce\xc9\xe9\xc8/(\xc8\xef\xc8\xc9\xce\xe6N\x0f\x06\x07\
+\xc7\xc6\xda\xadE\x0d/\x8c\x8e~\xf9\xf7\xed\xdb\xe0\xb9\
+\xe1\xe9\x8dm\x15\x95v;\xcb\x06\x07\x83\x96\xa5^\x85\
+\x1c\xab&\xbed\xc9\x96GK\x96\x80&\x1e\xe5\x15\x90\
+\x98\xbe\x85H\xec\xff\x0a!ZR/\xa5\x7f\x16\x99\xad\
+\xb3h\xea\x93\xb7\xfc\x83\x00\xdeGfcv\x1e\x9e\xf4\
+,\xfe\x93\x1e\x9ef\xb5\xe2\xab\xa1\x10\xa2|\xaa\xfb\xb5\
+F7\x0a\x86\xa2\x8d\x83'\xce\x0f\x0c\x0d\x0d\x9c\xafv\
+?\x94\x05RnJ\x93\x9d\x9b\xeb)(\x02(*l\
+\xcb\xcd\xcd\x1e\xde\x07;w|}{\xd78\xe8\x0d%\
+pwj\x02\xb2a-jT\xe6\x1e\xd9Z\xe6\xd6\xc4\
+\xf18\xb8\x10F(#\xb5\x86GH\x85\x83U.\x84\
+[029I\xc4oFx\xff\xa51,hm\xd8\
+\x82o\xf8\x8f_?\xbd\xf0|\xd0\x84\x88v\x0c\xe7I\
+\xef\x0d\x02\xffUi\xfa\x06\xfe\xfeuf\xd7\xcc\x5cY\
+\xd5\xfd\xafO\xe2\x95N\xdd\x22\xf9\x8c\x85\x8cQR\xd2\
+H{I\x1e\xd3\x82\xf7Kd\x84\xfe\x98\xa4P\x88\x8e\
+\xd452B\x1d'\xe1\xcc\x11\xa2f\xaaI\x9e\xf4\x0a\
+\x19c\x8a\xc8\x08\xf34\xaey\x11\xc7\x9e\xc3\xb1\x8fq\
+\x8e\x14\xc7p\x9dT\x87\x08v\x04\xe9\xd7q\xecCb\
+\x97\x9c\xc5\xf9\xaf\x91\x11\xb8Dj$\xfd3\xdfJ\x1e\
+%\x85L\xcc\xcc\x1d\xe4]\xc7\x5c\x22F\xe1\x89\xbc\xa9\
+\x97\x10+\x13q\xee\xbf _+\x19\x93\xfc\x11\x9fu\
+\xa4R\x86\x15\x8d\xf9g\xe4s\x15\xc7\x96\xe1\xfd\x072\
+&\x8d#\x85\xf8\x9f\x96~\x99D \xef<\x8aB\x1e\
+\xaf\xe3\xb3\x91\x7f\x7f&\x91$\x91\x94\x90>r\x9e\xfc\
+\x0d\x1a\xb0=\x86\x15\xfb+\xcaM\xb5Q\xe3\xd4!\xea\
+mZJ\x17\xd2\x15\xf4#\xf4\x01\xfam\xda\xcbh\x98\
+\xa5\xcc(s\x989+\xa1%\x06I\x99\xe4\xdf%\x9f\
+I\xe7H\xa3\xa4\xa5\xd2\xf5\xd2v\xe9\x13\xd2\x09\xe9{\
+\xd2I\xe9\xb7\xb2lY\xb3\xec_e\x97\x02\xec\x01\xe3\
+\x01'\x03\xee\x04\x8a>!\xe9\xc4\xcd{l\xf6\x97\xbd\
+YW\x0c,\xba7\x1e\x8e\x98\x0e\xe2\xcc`\xb2L\xa4\
+)\xc2\x90\x0d\x22Mc,\xbf$\xd2\x0c\xd6\xb7k\x22\
+-!\x0b\xa0U\xa4\xa5$\x1cm\xe9\xa3e\xc4D\xcd\
+\x17\xe9\x00\x12E=/\xd2\x81$\x04m\xef\xa3\x83H\
+,\x1d)\xd2\xc1H7\x89t(1\xd2\xff\x81;\x02\
+\x13(|i$\x22\x0d$\x0a\x11\xcdGS\xc8\xb5F\
+\xa4i\xe2$\xcd\x22\xcd\xa0&gDZB\xfa\xc9?\
+DZJ40!\xd22R\x03\x93\x22\x1d@\xd2\xa8\
+\x8d\x22\x1dHb\xa87D:\x888\xa9?\x8bt0\
+q\xd2i\x22\x1dJ\xca\xe9QRA\xd6\x93&\xe2\xc1\
+\xd6B\xd6\x09\xcf\xcd(g\x05\xe9&\x038\x82\x87\xcf\
+\x8a\xf5M\x1eO\xcb:\x8fg\xb3\xa6\xa2{\xa0\x05G\
+\xdc\xa4\x13\xa7\xf5\xa3\xa0\xad\xa4\x1e'?\x84\xbd^\xa4\
+\x88\xbb\xd3\xd3\xdf\xdcZ\xafy\xc8\xd3\x8b\xbd<\x81\xe7\
+\x06$<-\xf8k'f\x92F\xac\xa8`\x16\xaek\
+!]\xd8\xb2~\xc2\xcb\xcf\xc9t\x7f\xb1\xdd\x9cfu\
+f\xf1\x9fq\xb3D\xf6<w\x93\x8f\xe7\xcfI\xa2\xb9\
+\xbf~\xb6L\x1a\xdf\xaa*T\xab\x13wo\xc69m\
+8w\xb6dnT]\x83\xbd\xb4\x1f\x8d\xf2\x06\xeaF\
+C\xf1\xf3{\xf1\x7f\xab\xf0\x9f\x99d`\xcb\x12\xf6\xde\
+\x8c<\xf99\x8d8\xda\x82\x9c\xd7\x11\x1bR\x0e\xbc\x9d\
+\x18\xbc.l\x0e\xdc\xb8\xa1\xb3\xab\xd9\xd3\xa6\xf1\xe9\xe4\
+\xae\xd0\xa4\xa5\xf9\xc8&O\xf7zO[\xaf\xc6jN\
+3gdd\xb5\xd6on\xf0t7\x9a[\x9a\xd7\xd9\
+\xcc\x0e\xb33\xdd\xe5r\xfcT\xd9\xff\xc5T\xff\x17\xfb\
+4\x13\xfe\xb38Ou\xe3\x9cz\x5c\xde \xcc\xe9\x14\
+\xdc\xefA=4\x98<\xfe~\x85\xc0\x81\xd7\xbeK\xf8\
+5\xff\xc4\xae\xcd]\x9azMwg\xfd\x86\x86\xd6\xfa\
+\xce\xcd\x1aO\xa3f\x19\xff\xachn\xf5\xb4uy\xda\
+p\xfa\xcf\xf3\xf2\x05[\x0fJ\xc0\xfbCCJ\xb1-\
+\xc6\x05\xb3\x19`\xe4\xf5lh\xf6hJK\x17\xff\x12\
+\xab\x1f/\x22\xe8\xb6nl\xed$\x93X\xb0\xf5\x09\xcd\
+|O\xcd\xae\x07\x94\xe2\x1d\xdc\x8a\xcb\xba\xbb\xdb3-\
+\x96\xbe\xbe>3\xafN\x97_\x8b\xf5\x9e\xd6\xffO<\
+-8\xde\x86\x8e\xf2 \xc5\x87\xdczt!?\xa7\x01\
+\xef_\xda\xcf\xd2\xdc\xd6\xe8\xb1\xb44\xafoh\xebj\
+\xe8\x22\xff\x03X:\xf7l\x0aendstre\
+am\x0aendobj\x0a54 0 o\
+bj\x0a4497\x0aendobj\x0a5\
+2 0 obj\x0a<< /Type\
+ /Font\x0a/Subtype \
+/CIDFontType2\x0a/B\
+aseFont /Proxima\
+Nova-Bold\x0a/CIDSy\
+stemInfo << /Reg\
+istry (Adobe) /O\
+rdering (Identit\
+y) /Supplement 0\
+ >>\x0a/FontDescrip\
+tor 50 0 R\x0a/CIDT\
+oGIDMap /Identit\
+y\x0a/W [0 [362 519\
+ 251 495 548 574\
+ 473 254 357 335\
+ 575 539 848 530\
+ 566 324 569 845\
+ 251 574 762 575\
+ 581 348 712 580\
+ 223 678 681 509\
+ 254 595 254 575\
+ 326 637 578 272\
+ 723 295 911 577\
+ 725 657 722 759\
+ 295 452 580 249\
+ 581 297 ]\x0a]\x0a>>\x0a\
+endobj\x0a53 0 obj\x0a\
+<< /Length 721 >\
+>\x0astream\x0a/CIDIni\
+t /ProcSet findr\
+esource begin\x0a12\
+ dict begin\x0abegi\
+ncmap\x0a/CIDSystem\
+Info << /Registr\
+y (Adobe) /Order\
+ing (UCS) /Suppl\
+ement 0 >> def\x0a/\
+CMapName /Adobe-\
+Identity-UCS def\
+\x0a/CMapType 2 def\
+\x0a1 begincodespac\
+erange\x0a<0000> <F\
+FFF>\x0aendcodespac\
+erange\x0a2 beginbf\
+range\x0a<0000> <00\
+00> <0000>\x0a<0001\
+> <0033> [<004C>\
+ <0069> <0063> <\
+0065> <006E> <00\
+73> <0020> <0072\
+> <0074> <FB01> \
+<0061> <004D> <0\
+06B> <0046> <006\
+6> <006F> <006D>\
+ <006C> <0075> <\
+0077> <0068> <00\
+62> <002A> <0044\
+> <0070> <0027> \
+<0041> <0043> <0\
+079> <002C> <005\
+3> <002E> <FB02>\
+ <002F> <0052> <\
+0045> <0049> <00\
+4E> <0028> <0057\
+> <0054> <0048> \
+<0042> <0055> <0\
+04F> <0029> <003\
+F> <0067> <003A>\
+ <0064> <002D> ]\
+\x0aendbfrange\x0aendc\
+map\x0aCMapName cur\
+rentdict /CMap d\
+efineresource po\
+p\x0aend\x0aend\x0a\x0aendst\
+ream\x0aendobj\x0a8 0 \
+obj\x0a<< /Type /Fo\
+nt\x0a/Subtype /Typ\
+e0\x0a/BaseFont /Pr\
+oximaNova-Bold\x0a/\
+Encoding /Identi\
+ty-H\x0a/Descendant\
+Fonts [52 0 R]\x0a/\
+ToUnicode 53 0 R\
+>>\x0aendobj\x0a55 0 o\
+bj\x0a<< /Type /Fon\
+tDescriptor\x0a/Fon\
+tName /QDCAAA+Pr\
+oximaNova-Regula\
+r\x0a/Flags 4 \x0a/Fon\
+tBBox [-84.96093\
+75 -199.218750 1\
+050.78125 907.22\
+6562 ]\x0a/ItalicAn\
+gle 0 \x0a/Ascent 1\
+079.10156 \x0a/Desc\
+ent -344.726562 \
+\x0a/CapHeight 1079\
+.10156 \x0a/StemV 5\
+3.7109375 \x0a/Font\
+File2 56 0 R\x0a>>\x0a\
+endobj\x0a56 0 obj\x0a\
+<<\x0a/Length1 9056\
+ \x0a/Length 59 0 R\
+\x0a/Filter /FlateD\
+ecode\x0a>>\x0astream\x0a\
+x\x9c\xcdYit\x1bU\x96~\xaf\xaa$ywd\
+[V\xbcK\x96%y\x93d[\x96d[\x96\xbc/\
+\xf1\xbe\xca\xfbn\xc9\xb2-Yv\xbc\xc51\xd9\xd8<\
+d\xdf\x08\xb1\x08`B\xa0C\x9a\xa69\x1c\xa6;\xc3\
+@ \x90\x00\xe9n\x9aNg893=i\x0e\x87\
+%@\xd2MH3\x1cNb\x95\xe7VIr\x9c\x00\
+=\xdd\xff\xa6\x9e\xcb\xbaU\xf5\xea\xbdw\xdf\xbd\xf7{\
+\xdf}\x850B\xc8\x07mG$B\xb5\x8d\xaa\x8c\xc5\
+\xc1\xf36\xb8\xb3\x1b\xce\xde!\xdb\x9c\xc5w\xef\xec\xef\
+A\xbe\x8ePT\x90\xd5\xdc7h\xfeY\xb9\x0b\xe4e\
+\xb8\xa7\xb5\xc2\x8d\xe0\xc7\xa8\x1b\x08Eg\xc2u\x82\xd5\
+>\xb5)\xe4\x8b\xf5\xb7\xe0\xba\x15!\xbc\xce\xe6\x18\xe8\
+\xfb\x9a\xba\xfa7\x84b\xac\xf0|\xa7\xbdo\xd38\xda\
+\x80@\x8e\xf9\x16\xaeEc}v\xb3\x8cwY\x80P\
+l\x18B\x9c*D\x92+x?\xe2 \x8a\xa3\xa6\xde\
+\x87\x1aN\xf7/\xf1>r\x10u\xf0\x8b8\x5c\x92\xf9\
+\xa1D\x88X\x80\xe7\xcc\xd8\xd9\xc3n\x9b\x9cD\xf9(\
+\xf06\xc5m\xa0\x1b@\xa1\xe3\xc4[\x22\x84\x9fb\x9e\
+\xe1O\x88\xc7\x99\xde\x10\x05o\x16\xc3\xeb\x83\x9cf\xd0\
+\x96\x87\x90\x9a/\xe6K\xc5|q1!\xa2\x13\xf0Q\
+\xda\xcai\xbe\xf5\xf3b\xe8\x11\xa3%\x84\xc8\xf3\x1c\x13\
+\x8c\x05jA=\xc1\xd2)b\x9ec\xba]x\x94\xe9\
+\x7f+\xb4Z\xc3i@\xc1(\x14\xa1P\xae\x5c\xa6\xcb\
+\xd4i\xd5\x19\xc2pA\x18\x8fKB\xfd\xcf\x92bE\
+8669Y\x14\x17'\x9a^\xa4\x1e\xc0\xa2\xd8\xd4\
+\xe4X8\x92ScE\xb7\xb7\x92W\x96%\xd0K\xef\
+\xca\xe7\xe4i\xf2;\x14\x03\xad@\x0bP2\x84<\x99\
+\x84\xcb\xe3\x0a\xc2\x84\xe1\xea\x0c\x9d\x90+\x8f\x97\xcb\xe4\
+\xb2^\xa3ab\xfc\xe0\xa7\x0f[z\x9e8\xd6\x05\xc7\
+1g\xbf\xe5\xe1O\x0f\x8eO\x18\x8c\xf8\xc6\x81\xd9\xe9\
+\x92\x22\xfcB\xf7\x0e<b{\xeeg6\xdb\x8e\x9e_\
+\xe0\x92\xa2M3\xccH{V>\xa7$\xd0C4R\
+x\xfbP\x87\x0b\xa1\x08\x04\xe2p\xb6\x0b-t\x22\x01\
+\x15p<\x8f\xcb\x16\xb1L\xce\x96\xde<\xc3\x84c\xf7\
+\x811{\x96n\xf9#\x9f\xfe\x9e\xc7\x9b\x1b\xea\xf4\x1b\
+\x8e~se\xcf>|\xb5\xda\x90'\x95\x87\x0b\x09\xe2\
+\x11\x22D \x95\xe5\x17\xe0\x1b{g\xa7\xcbJpi\
+\xf9\xcc\xa6#\xf2\x83}\x03b\xb1~\xf0(>x\x80\
+\x18\x8b\x8dM\xcb\xc8\xca\xc9\xc9\xc9\xd2\xa9\xd3D\xb1\x8c\
+\xd5\x9c0\xbb\x1f\xc0\xa8\xc0\xf2b~&t\xc6\xf4\xcd\
+\x97\xf0\xd5\x02f|\x14\x9fOj\xb2sFZj\xeb\
+\x95\x8b\x8b9\xbd\xddV\x9cK,\xdc\xa7\xc9\xc4\x0aE\
+\xbeKA^\xd9W\x92\x91\x8e\xe9\xb3\xae\x0a\xa6\xadb\
+\x98\xc3Vh\xab\x1a!\x9d\xce\xa3\x92&S.\xfb\xb1\
+\xa2q\x9b\x89\x07\xa2w\x92\x7f\xac0V\x94\xc7\x17\xd7\
+f\xb6\xb5\xf4;\x8c\x86\xe0u\xa1\x02\xa9<:6=\
+=\x22*%5\x222V\xbc\x8e\x1f\x1000\xf0\xf3\
+?\xef/SU\xd7u\x98sr\x83\x02\xc3B\x13\xe2\
+c\xa2\xd3\x94\xb1\xd1\xa9)\xd1Q\xa2\xb8P~P\x80\
+e\xe8\xf4\xf2\x03\x0eCb\x92BQ\x11\x17\x15\xc1\x0f\
+\xe6\x07\xfb\xf2\x02\xfd|\xb8A\x81\xc1\x81BAdD\
+\x82$uSc\xc3\xfe\x11]B<NL.\x8a\x11\
+\xac\x0f\x5c\x17\x18\xc4\xf3\x09\xf0\xe7\xf9\x80\x14\xbc~}\
+T\xb4T\xae|\xa0\xd1\x84\xc1\x96\x9bW\xae\xe3N\xf2\
+:\x0aDQ`K\xd9\x1d\x8f\x93s\xc95W\x92\xf8\
+'$\x12\x91J)\x86C\xa9\x12\xad\x91\xc9\xd4\xfb$\
+b\xb1D\x0171vQ\xde\x0b1\xb4\xbd\xb4\xb2\xc2\
+Q\x81\xbf\xafCql\x5cd\xb0\xf3\xe0v\x08\xae\x5c\
+*f\xfcD\xaba'Q\x22^\xc2\x97\xfe\xf0\xf4\x92\
+\xa9\x19\xa7g\xb4w\xde\xff\xe01\xfa2NZ\xda\xbc\
+\xc9\x98\x8bsr7m~\x86\xbe\xcc1\xb5w:\x1f\
+?{\xf0\xbe\xad\x1d\x9dj\x0d>Z^>;\xf3\xe8\
+\x91\xd9\x99\x0d\xe5\x8cO\xf6\xae\x5c\xa5\xd4\xac\xf5S\x10\
+\x92R^\xc3\xb85p\xeb\xc0q\xf7\xc7\x9aQ\xc2:\
+&c+\xb2\x86\x1e\x1e\xdf\x98\xa3\xd7\xe7l\x1c?t\
+hb\x5c\x9f\x93\xa3\xa7w\x9b\xab+dR\xa9\xac\xa2\
+\xdal\xa9\xaa\x96\xca\xdaZ\x95ee%\xb33\xfb\xf7\
+OO\x95\x95\x96\x96MM\xef\xdf?3Kh\xb5\xa6\
+f\xab\xc5\xd4\xac\x85\xa3\xd9dyzl\x02|'\x02\
+P\xe7]\xf2\x0a\x0a\x00?\xc4X\x82\xd5\xa1X\x8dC\
+\xd5\x98\xbcI\xc3\xe1\xa4\xcf?u\x13C\xecR7\x97\
+\xe8sd\xd4\xf2g\x10\xb6\xd7\xc90\xf6\x94x\xfc\x18\
+\xaba\xd6H7J8\x179\xa6[\xa7@\xc3\xfe\x95\
+\xab\xe4\x93\xa0\xa1\x0c\xe9\xa0e\x0d\x98\xe4\x8e\x92l\x90\
+k\xdcN/gd\xb7\xcb\xf1\xe5\x1a\x8f\xae\x8c\xa6:\
+\xd0\x9f\xa4\xb6\xfe\xa6\xb5\xaa:S\x13\x1b\x9b\x91n\xcc\
+-\xb84]Zf\x7fqG\xf9\x13_\xd7\x17\x17i\
+3\xe3b\x9d\xa9e\x15\x8d\xb6\xa2\x92\x92\x22[cE\
+\xd9\xc4\xce\x84\x84\xeaJkmA\xbe\x5c\x1a\x1e\x8a\x17\
+^\xee\xcb\xd2\xe1\x9d\xa3\xcf\xe0\xd00\xa9\xbc\xb0\xb0\xc5\
+\xd5z\xf1\xd5\x5cQ\x9c\xc1\xd8\xdd\xa37bQ\x9c\xd7\
+\x12\x08\xc6\x1f\x86\xa4\xec8y\xecH=Q\x12.\x04\
+\x95H\xfe\x9aXaB\x8b\xb4\xe8M\xad\x83\xe7\xe7\xe6\
+\xe7\xe7\xce\x0f\xb44\x1b\x9d\xce\xd4\xfa\xa6\xd6\x83\xcd&\
+S\xf3\xc1\xf6\xc6\x86C\xb5J\xd5\x9e]__\xdb\xb7\
+W\xa9\xaa'\x82n\x9d\xc2\x01\xf8l\x91J\x09\xd0t\
+\xf2\xe4\xc8\xa8\x22\x05f-l\xe5s\xa2\x8a\xba\x8e\x84\
+0\xfb\x00<\x1a\xbeD\xc3\xcc\x9eZ \xe1{Q\x0f\
+\x1f\xb2\xe9\xb2N\x9cp^\xb8\x10\xb9>\xa3$AQ\
+\x1c\x81\x8d\xb9\x0eba\x01\x07\xd3\xdf,\xb8\x9cz\xb1\
+$i\xb2\x00\xda\x02\x0f\x22\x84\xa0\x01\x97A\x12\x9e\x1c\
+\xab\xf9\xd8\xfe\xdf\x16l:BM\x7f1\x8c{\xc1\x1a\
+\x18\xd9\x11\xa2\x228#\x08\xd6(\xb5F\xab\xbb\xbb\xdc\
+q1\xb9\xdb4\xab\x08\xe0\x85C\x81c\xa8\xbc\xb4\xae\
+V\x93\xa9\xcd\x14\xc7EG\x05\xf8\xe1\xe4TC\xfe\x86\
+\xd9\xee\x9e<k\xd5\xb6\xad\x07[\xeak\x8b\xf2\x93\xe4\
+\xf1\x12\x8d\xb6\xa3\xb3\xa5m;\xf1\xe4B\x9d>\xbb\xb0\
+ #-K\x97\x9a\x92\xa6T\xa4(\x1ar\xb3##\
+\x94\xaaZ\x9b%[\x87#\x22Ui5u}\x8d\x8d\
+\xa6\x8a\xca\xf6\xce\x0d\x95\x96\xa3`\x09\xeb\xcaU\xce+\
+\x1c\xbb;&B\x09vhkF\xc2\x98\x05\xaf\x0eU\
+\xc0e\x9e\xe8\xc2\x99Z\xaf555\x1ds\xbe\xf7\xce\
+1\xa7\xa9\xa9\xc9\xe4<\xf6\xce{\xcec\xe4\xb7\x06\xe3\
+\xc6\xa9G?\xfd\x97G\xb0Q?5y\xe4\xf0\xf4F\
+\xa3\x01\x17\x10\xe9O/uw`\xdc\xd1\xbdt\xfc\xdd\
+\x0bK\xc7;\xba\xba:\x08\xff\xa7\xb6n-/?v\
+\xecoO\xc2o\x05\xc6\x15\xe5[\xb7\xba\xc7Cm\x81\
+9\x93\xa3\xca\xd5\xb5iuLw\xcf\x90\xdb\xb9\x99\x22\
+]\x05Z\x89w1\xf1\x8c\xd5\xb3\xd2@\xb1\x86\x84$\
+%\xe6\xe6\xb4\xb7\x8e\xd9\xdaZ\x0d9\xc9\x89!p$\
+&\xe7\x18Z\xdblc\xad\xed9\xb9\x89I!!\xe4\
+\x10\xf6\x0b\x88\x88\x94\xcbs\x8d\x15\x95\xb9FYbD\
+\x94\x9f?\x0e\x0b\x91\xcb\xcaJ\xbb:\xcbJ\xe5\xb2\xb0\
+\x10\xe2\xd4\xd0@_WGiQJ\x22\xc6\x89)E\
+\xa5\x1d]}\x03C\xd6\xbe\xc1\x8e\xae\x92\x92d8J\
+J\xba\xba\xfa\xfb\xac\xcd\xd5U\x15\xe5\x1a0]\x9c8\
+SS^QU\xddl\xeb\xee\xa9oT\xa6\xa5)\x1b\
+\xeb{\xba\xc1?\xb8\xb4\x83\x84\xd0F|\x84\xdc\x91\xa7\
+\xd3\x01\x0c\xc0\x1f\x97\x17/\x9f\x97\xaa4\x12qd!\
+\xdd\xff\x1c\xae\xc0e'i~\xfd\x1f\x8d\xea\xef\xf9X\
+\x18\xae?B^]\xfe\x90L\xb9\xdd~\x9e\x0c\x829\
+s\xd2\x0bT6D}\x18b\xc0\xc1\xb3\x9a\xe9V1\
+\x1a\xe6E\x1a\xe2\x99\x1a>c\xbf\x0c\xac^\x5c\xd4\xb5\
+\xb7\x9a\xcf\xcd\xcf\xcd\xcd\x9f\xb34\xb7\xe4\x12\xc1\xcd\xcd\
+-\x07\xda\x1a\x9a\x12\x13\x9b\x1a\xda\x0e\xd0\x0b\x1c\xd3\xa1\
+\x1a\x88\x9e]{\xfe\xfa\x97\xbd\xfb0V)\x9a\xca\xf0\
+\xab\xb6\x11\xa5\xaa\x80.(V\xa80\x83BC+\x9f\
+\x03v\xdb\xc1Vl<1E's\xcf\xb6Z\x14\xca\
+[\x03+`\x06\xc6i\x84\x04)>\xb0m{w\x8f\
+&\x0b\xe3,MO\xf7\xf6m\x07p\xe5\xd9}\xc6A\
+\xf3\xccG\x87\x1fe\xb8\xc3\xc1\x19\xcb\xa0\xe1\xc0\x85\x08\
+\xac\xc9\xecl\x7f\xf8\xc1\xc7\x17\x1f~\xa8\xb3]\x93I\
+\x7fS\xd7\x9a\xa5;\xf6\xe47Om\xdb^Z\x86\xb3\
+\xb4\xedu\xf4\x0d\x0f\x12\x12[\xc8\x9b\xc0\x88\x18$d\
+\x97q\x81GU\xe7b\x9e\xa9\xb1?:\xbe\xac\xbeQ\
+L^Yj\xc8H\x7f\x92\x9b\x9e\xa1w\x15\xb3\xef\xc1\
+\xea\xfd\x01\xcc\xbd\xc0\x8b?\xb0\xf8\xabY\x18`\x06\xca\
+\x00\x90\xc6\xd8\xd5=D\x9f_\xcc\xce\x1e\x85HS:\
+w\x95)U\x18\x1b\x88W]\xd3[\xd2\xd585%\
+\x8f\xb8\xecFc\xc0\x00\xd6\x8e\x0c\x16\xb8\x0d\x88\x8f\xd3\
+\x83\x1e\xb3\x99\x01\xbb\xc1V\xee\x9a\xa5d\x0c1\x09\xde\
+\x0d\x16\xc7:\x9e\x5c'\xd7\x09\xe5j\x9eN\xc8\x13\xf2\
+\xe4B\xac\xf0;\xa7\xb8xQq\xce\xaf;\xe0\xbc\xea\
+\xe2E\xd5\xf9\x002\xe6\xda\x8e\x86\xd1\x91\xbam\xd7\xae\
+m\xab\x1b\x19m\xd8q\x0d\xbaBb\xf8w\x00Z\x11\
+\xa2D\x94\xca\xe8\x0d8\xb6\xca0X\xcc\x140\x98\x86\
+\xbd\xfc\xd0\xcb,\x18\x82x\xfe\xc4\x89\x9a\xaa\x07\xfb4\
+\xf2deeb\xd2\x85\x0b\xf8\xb7\xab\x8c16V\x94\
+\x5c\xe5$M\x0bU\x8f\x99\x9a\xe2\xa7#p\xba\xba\xbb\
+ja\xf9\xd4*\x89\xc4\xd1\xb1)\xc0\x22\xf1\xed-,\
+\x8d\xf4\xf0\xa9\x8b\x80\x82^>%\xf1\xf2)>\xeb\x03\
+\xc0\xa7t\xd9\xfaQSm\x03\xc3\xa7\xfa\xbaG\xb0\x9e\
+\xd8u\x9fZ\xcd\xd2)\x8e\xc9\xf5=\xf0)\xfa\x9c\xab\
+\xd4\xdd\x12\xe7\x0a\xf8p\xe2=-eJ\xee\xa2h\x0c\
+Lz\x9d\x9b\xcf\x01G\xec\xa8\xd8P\x99\xb8\xf8\xeb\xf2\
+\x0d\x15I\x8b\x8b\xd2\xce\x8eA[q\x91P\xd1\xd5e\
+^(+%\x96\xfa\xb4Z\x85\xd2\xe0J!\x96\xdeW\
+\xa8\x8c,\x85\xcb\x066\xa8\xa9\xdf\x00kTe\xd5a\
+\x97\x06\xb997\x15\x07Z\xf8\xb2\x0cD f\xcf%\
+r\x1b\xbc\xf7\x8e+\x87c:J\x97?\xe6:\xc0\xd4\
+d\x99\x10z\x1f\x98\x10\xd2\xfd$\xf3\x09\x5c\xcboz\
+\xe9\x05\x92fcS\xca\xc6&\xd7\x1d\x91\x1a\x8f]\x84\
+\x1a\xb5{\xa5\xf3\x04\x0a\xe3}$\xed44\x9b\x06\xde\
+\x99\xdb\xbcy\xee\x9d\xc1\xd6\x96,\xa73\xa9\xa1\xb1\xcd\
+\xbd\xd4\xb565\xd0\x0bDp\x13\x84 \xde\xb7\xf7/\
+\x7f\xdd\xb3\x0b+U5\x87\x5cj\xfcF\xa1J12\
+z\xf2\xf9\x11\x1bD+\x8c\xb5\x06\x90\xb4\x01\xbc\xa4\xde\
+\xc3O\xdd\xb0\xfdS\x1cU\xc3\xa8#b\x18*\x8cD\
+\xf8\xa3\xfct\x0d\xf2\x8aj\x06\xab\xc6\xec\x0b-\x85\xf9\
+\xd2\xf8\x90u<\x9f \xa0\x98\xd11\x02\xa141<\
+\x22\xe5\xdfj_\x0c'\xf1\xc3\x0f\xfd\x16\xab~ey\
+\xf4\xbb-\xd5ux6\xe7qUL\xa4J\x11\x13-\
+\x97\xaf\x0f\x8f\x8eX\x17\xe8\xef\xbb.D*\xcf\xcei\
+n\x1d\xa1\xff\xf5\xec\x0e\x93\x16\x10A(HH\x90\xcb\
+\x93c##\xc0\xb8\xc0Y\xfd}\x83\xfc}\xb8\x01i\
+\xf2\xa6\x13\x11Q\xcf\x8d\x0e\x9f\xd9\xf2\x0c\xce5\xf6\x0c\
+dG%\x07q}\x82\x83\x03\x82B\xc3\x04\xe1\xd1\xb1\
+q\xe2\xc4de\x9e.;S\xcb\xa4\x06\x0c\xbf`,\
+\xba\x0d,\x1a\x8c\xd631)\x06\xffa\x99%\xa3\x01\
+\xc6\x0c\x18\x82\x91\xc3\xc9_\xd1'\xe8\x1b\xa7\x08\xe9\x99\
+\xd9\x19<d=\x8c'\xe8\xef\xaa\xaa\xaa7\xd1Nl\
+\xd9D\xc4\xb9>\xe6\x98\xc6'\xfe\xfd\xa5\xa1\xe1@\xd7\
+%\xc2\x85\xd36\x94\xbb\xbe\xc3\xacM\xc7X\x9b*Q\
+\x1e \xb7n\xcd\x22\xa3c\xa0D\xbe\x96\xca\x00\xc3\xf0\
+.\xe8\xec\x03\xec\xb5\xb6\xd0\xc3\xb6\x8eV\xe7VW\xd9\
+\xf3\xb2\xb4*Ed\x04\xceni\x19t\x1b~\xc0\xd4\
+dt\xc2\x9a\x9d\x92j0\x16\x16W>\xd8\xd1Il\
+Jjhj=\xd4l\xc2\x8c\x1f46\xd0\x93\xe5q\
+\x22~\xb0$^\x9fS\xbb\xa7N\x95\x81w\xee\xbc~\
+m\xf7.\x85\xaa\xe1\xd1\xe5\xfc\x9e\xca\xca\xb4\xb48Q\
+`\x100.\xc2\x81_\x02*4<\xf2\xdc\xcf\xac\xa3\
+8M\xc9x2`\x081\xc7b\xc8=\xf8!_\xc5\
+\x8f{\xa1\xc2\x8b\x0c\x93\xe1\xd8\x0b\x0d\x9e\xe8\xe1\xfc'\
+\xcc5\xc3e\xf9\xc0e\x99X\x05\x0c\xe4sT\xb4\xaa\
+\x84N?\xf57|\x12\x9f\xfa\x96\x9a\xb8\xbd\x8f9!\
+\x95\xbdA\xad\x03z\x048\xc6\xb0\xd5\x978N\x90R\
+P.\x13\x1dXM\xfec\x9cU\xa2\xb9\x97\xb4\x12\xa6\
+i\xacZz\xe1\x9fb\xae\xd4$\x96\xdf\xb2\xfc\xf3\xfc\
+\x15\xa3iz\x19[\x01\x07\xc2\x81\xa3\xb0\xf4\x8d\xb5\xad\
+7\x19g\xdc\xecl\x95Z&\xe5\xf9\x08R#c\xe0\
+\x1dE\xa6\x5c\x8a\x95i\xf4r\x9eX\xab\xcd\xe0\xe0\x98\
+h\x95B,NN-\xedhhb\xfc\xb5\x10\xfcU\
+\x03s\xe8\xc7 \x0b\xb8\xa6\x06\xbbi)\x89\xc5\xc4o\
+]\xb3\xc4\x86\xaf\xde|\xf3\x14-\xc6\x1f\xe1\xf6=\xa4\
+c\xd9y\x84~\x8e:\xed\xca\x827\x07V\xbe\x84(\
+\xb7\xa3,\xd4\xe0\xcdC\xc3\xbd\xa4I\xc3\x1a\xd33\x9f\
+\xde\x85\xf9N8s\xef\x10)|\x07\x09<\x04\xca;\
+\xaf/\x98r\x8a\x8b\x06\x81h*R\xe2b\x82\x021\
+\xce\x1c\x19\xdd\xb4u\xc0\x0c\xf9\xbfD\x9c\x9b\xdb\xd9a\
+\x1boo\xcf\xd5'\x01\x9d\xc2\xa1\xe1)\x8a\xfc\x82\x8e\
+\xae\xf1\xeb\x84\x99\x13\x10\x14\x15%\x95\xeb\xb2K*\x99\
+\x8c=4\xac\xade\xf7`W\xd7\x9em%\xf1\x09\xb0\
+\x9ch\xd4e%\x95\x95u\xd2\x90\xfa\xc2B\x95\xd22\
+\xb8\xa7\xb5\xa16\xcf K\xc0R9\xb4\xd0i\xb6L\
+NX\xac\xad\xed\x85ER\x19\xe9\xd0\xaa\xe1\x90I#\
+\xc2qTTrj\xba:}\x7fe5\xce\xd2\x81\x1d\
+ \xfe\xc8O\xdc,\x5c\x8d\xc5\x1a\xb1\x00\x7fO\xc8]\
+\x22\xf2\x84\xeb\x22u\xe6\xe8\xf4\xed8\x86\x1d\x01\x0ef\
+{s\x0d\xb5gibf\xc0;7\x02\xbe7\x82\xbd\
+\xfa;\x17\x0d-\xcd\xe6\xb7\xe7\xe70\x9e\xdb|\xce\xdc\
+\xd2\x96\xcd\xb0\xa2\xc3\x90x\xe2f\xd3a\x86%\xc1\xe2\
+u\xb3A\xa5\xc0{\xf7}\xf5\xf5\xae=*e\xed!\
+\x1cP\x94\xa2\x18\x1d9y\xd26\x02\x88\x5c\xc4X5\
+\x04\x22#\x1dz\xe6\x81]\x91\x98\x14\x93\x12\x86\x1a`\
+15=\xe7\xaa\x9a{\x9d\x90^\x82\xc1N\xd0\x97\x89\
+:\xac\xa2/2)\x1cu\xc6\xe5\xcb\xf8\x97\x01\xbf@\
+$\x11j&\xbf\x0b\x05\xad\x0c\xf8:~aa\x81y\
+\xa2_\xf9\x9c\xa2 n\xf3\xbd\xa8\xee\xddu\xe0\xf24\
+n%\xdc\x17\xee\xb4\xc2\xbb@\xb1\xe5. gv^\
+\xf4f\x83e`\x16\xd4\xea\xe8|bsh\xf8\xec\xae\
+\xf6V\xdc\xd2v\xbf\xa3\xb9\xb5\xaa\xbbvv\xfa\xe8o\
+\x1e\xb8?*&U\x91\x9e\xa1\x963\xbcV,\x16\x08\
+\xee\x7f\xe0\xcf\xcfn\xdd~a\xa41-\x83\xd9\xea\x99\
+\xcf\xcd\x01\x85\x1e'\xb2u\x13\xf6<\x03\xd0\xe1\xa4\xa6\
+\xd1n}v_\xff\xf3e\xd9z\x06\x8c}\xa9\xc0\xe0\
+\xe8\x98\x04\x99.\xcb\xf8K\xfb\x18.\xc8ctX\x00\
+\x1dj`^\x12X\x1dV\x07\x0d!\xce\xae\xbck\xe9\
+>3Rjax\xf7\xf5\x9dm\xcc\xd8v\xfe\xfa\xc1\
+-d\xb1\xcb\x92ij\xeao\xae\xad2\x1a\x12\xe2\x01\
+\xf5\xfeH\x9f\x7f{\xfc\x95\xa6\x86m\x0f5\xd4\xe2\x1d\
+)\xc4\xc7Gii&<\xc1\xd11ZmS\x93\xe5\
+\xf7\x9b\xe7Y\xbe\xcaDY\x0dk\x0f6\xc6\x98\xbe\xf0\
+M\xba\x8e\x0a\xa0k\xc0[\x8e\xde.tg\xe6\xe4\xfb\
+\xc0\xe5\xfc=\x99\xb9\x87\xcf\x91Q\xf4e\xfa\xf2Kx\
+3\xed|\x19\x87\xe2\x90\x97a\x8d\xd8\x82\x8f\xd0#x\
+\x19\x7fL/\xe09:\x8e\xa6\xbch\xe8\xe7\xe6\x12b\
+7\x14\x82\xc7Q\x96\xe5OO\xbdH\x86\x9c\xa2jn\
+\xbf\x0c\x08x\x81\xd2\xb9\x11\x90Y\xa7\x9cP;\x04\xc5\
+\xa2$\xef\xfe\x07k0\xaf\x99\xb08\xdc\xe3\x98b>\
+_\xec5\xb6x\x89\xe8\xfd\xe5\xf0Pi\xd9\x80\xad\xae\
+vx\xf44\x9d\x8b\x17\xc7!\xd5\xc2\x06\xe38=\x84\
+\x8f\xcf\x14\x17\x15\x16\xcf\xd2\xdd\x1cSo\xef\xb1\xf9\xa6\
+\xa6\xf0\x90\xbe\xc1\xb9\x93\x83f\x92\x0b\xe9l\x7f/\x98\
+\x8a.w\x1d\xcc3\x8e\x0d\x16\x17a\x18\xc70\xc4\x88\
+\x01\xbcJ\x81*\x90\xc5\xbd\xc7\xa3[\x03\xc2\xea\x8c;\
+\xe6\xf0\xba\x92`\x15Zp\xe6\x9d\x15\xcdS\xee\xa4\xb9\
+\xa1w\xd8\xc6*\xde0\xa9\x19c\xf5\x11\xdc\xd3\xbd\xf3\
+\xc1fSRbqQC]\x9b\xa9\xb1\xbe\xa4(9\
+\x91]\xf32\xb5\x86Gz\xba \xfd\xf8\xc3#vG\
+a1\x19\xd6l\xda\xba\xbd\xc9\x84\xd7\x87\xc7\x8b\x15)\
+\xe28Q\x9c8N\x91\x12/^\x1f\x8e\xc3\x22\x22\x13\
+d\xa9*\x89,:F\x0a\xbf\x09\xb2\x88Hh\xf7\xc1\
+\xfb\xbb\xbbp\xfb\xf6\x9e\xeedic\xfd\xd6\xd6\xb2\x92\
+\xe4D\xa1@ LL.)k-\xd0e\xc9\x92\x22\
+c\xf8I\xdd=;\x9e\x1f\xb4\xa4\xa6\x98\x9aI_\x8b\
+\xd1`0ZT\xf2$ad\x88\x80\xe7GQ~<\
+AH\xa40I\xaer\xcd\xabSSb\xa3\x84\xe1\xfe\
+~$\xe9\xe7\x1f.\x8c\x02\x1a\xac\xb6\xe5\x17\x16\xe6#\
+6c\xfd\x9c2\xc1\xdce\xa1\xba\xbb2V\xf7v\xdf\
+\x1a<\xfd\x91\x89\x94\xaf\xa6\xb0\x9cL\xf7v\x877J\
+W\xd3VA\xa82\xa5 \xbf\xabc\xe2\xda~\x93\xbe\
+\xb0x\xb0\xa7\xb2Z\xa1\x0a_O\xa8m#\xf3]\xf5\
+\xb5F\x03\xa0\xb7X\xa2\xcf\xed\xe8\xb4\x8f\xb7\xb6\xe7\xba\
+\xd3\xd8\xc2\xd6\xb6\x9d\xe6\x8e\xce\x1c\x8eP \x97\x17\x16\
+\x98\xaa\x8c\xb92iX(qr\xdc:\xd4\xde^\x08\
++\x1d~f[\x914\x1e\x90\xaa\xb2\xba\xbbgH\xc2\
+\xe0pTL\xa6\xa6\xc94\xdcV_o0&\xc8\xb0\
+LZ\x98\xdf\xd9n\xb1\x1c\xd9W]\x89u9\x1d%\
+yy\xd9z\xb1$*\x2259#\x1dQ\x0c\x83\xe0\
+|\xc82\x884T\x80J~\x9aG\x88\x7f\x90\x9f\x08\
+\xd9\xfb\x126A\x91\xfd_\x09\xca)\xb8Q\xf3@\xaf\
+F\x96\x94\x067\xf0{\xef9\x09sR\x9c\x08\xc3*\
+\xe2MZ\x16\x7f\x84\x9a0\xb7\x8e\x98\x9a\xff\x91<\x86\
+`3\xaaYV\x97\xa8\x9f\xce\xa7\xc4?6\xbam?\
+\x920\xb1\x9bq\x88X9N;<\xbb\xf51?\xdc\
+\xad\x17\xf2\xd9\xc4A\x0e\xb4<\x5cs\xf7\xbe}Be\
+\xf5\xae\x02E\xd8\xfa\x0c\xe7=\xfb\xf7\xcf\xde~\xfb`\
+m]\xd0\x0e\x7f\x8c\x7fA\x19\xdcY\x13\xbb\x8f\xc6\xa2\
+\x95;\xf1b\xd1JO\x1f;\xb1\xb8H\xf8\xbcMW\
+\xe0\xd3\xf8\xb5\xa7\xe9\xcf8\xa6\xe59\x22\x88\xcew}\
+\xc2\xe8;FV\x11Ln\x10\xcc\xec\xba\x86\x12k\xc7\
+\xc5\xe3\xa9\x89\xd5\xdc\x86qH\xdesY\xb0\xee\xcad\
+1Q\x81\xc1\x81AW\x80\xa7\xc7D\xc9\xa5\xd1Q\x18\
+.\x03\xc9*|<V\x1a\x13\x1d\x15#\x0brLX\
+G\xe0\x0a*B$\xb2W0B\xe8\x09'\xb1=\xfd\
+\xa0\x9f\xbb\xda\xbd\xb7!\x0f\x96\xe2\x8a;\xbb\x9cK\xee\
+\x89\xc5\xcclroz\x18'\xbb{\xeaAi\xea\x15\
+\xfa\x12}\xe94=\xff\x1aV\xe1\x9c=8\x1b+^\
+\xa7\xe7=\x98\xbb\x87\x9adN\xd62,\xeeN\xb0-\
+\x08VQ\x97\xc13X\x10<\xc9A\xc6\x12!=?\
+5\x89'\xa7\xce\xd1\x0f\x11)\xabi\x01\xc743\xfb\
+\xcb\x17gf]\x1f\x134N+/w}\xcf\x8c\xb4\
+\x9d\xb6\xe2\xcb\x9cy6\xaf\xf7\xe2\xa6\xd0\xbb\xd1\x8f\xe7\
+wWTVV\xec\xee\xb4ej4\x996\xda\xfa\xfa\
+\xf5/\xbf\xff\xee\xab/\xce\x96^~\xfd\x8d\x1b\xdf\x9c\
+y\xf3\x12\xb4\x00\x0a\x93\x9d\xb0\xee09\xa8\xc6Me\
+\xc4\x82\x11B\xec\xfa\x88\xf8\xca\xf5'B1K|\xb4\
+0\xed\x8ay\x88\xe9M\x02\xbd\x1dw\xf7\x16\xca\x80\x87\
+\xce\x9b\x9c1K\xfe-\x9c\xa9\xb1w\xee\xaa\xae\x04'\
+\xea\xb4k2\xf1\xcdo\xde8\xf3a\xe9\x1b_}\xf5\
+\xdd\xf7_]\x7f\xad\xfc\xd2\x9bg\x986\x80\x9bP7\
+`\x06|X\xd6\xceN\x1f\x9fP\xb8>{\x17\xd8\xfa\
+\xc9w]W\x89B2\xcc\xf5\x101\xbf|\xdd\xc5\xd6\
+_\x02\x94\xbb\xe5\xce\xf4C\xdd\x1b%L>\xa9\x01q\
+\x1d\x8f+\x15\xc9eK\xa7\xcc\x83\xaf\xbej\x1e<\xb5\
+w\x1f}\x83\xbe\xb1w\x1f\x11B\x16/\x9f}\xc36\
+\x86\xf1\x98\xed\x0d2o\xf9\x0c}\xfb\xf0\xa3\xf8\xd1\xc3\
+\x9e\xefgp~\xff\xd8\x17\x1f\xf4\x04\xe7\xfe\x0f\xf3!\
+\xf0\xde\x03\xa2\xc7\x0aVv\xba\xf7W<\x07f\xbe\xb0\
+\xb9\x8c\xf0\xff B\xf4\x9f\xb87\xef|\x89\xf3\x1c\xc5\
+\xc4uTL\x85\xa1%\xfc;\xb4\x8d\xfc\x1f\xd4K\xed\
+\x80\xd3\x8a\x9c\xe4iT\x8c/\xa3y\xce\x22Z\xa2\x0e\
+\xa1^\xceG(\x02\xea8)\x1d\xea\xa7\x16Q/\xb1\
+\x0e\x1c\xa3\x1d\x85\x11\xbfB)\xd4+\xc8\xce\x8dEV\
+\xea3d%\xaf!.\xf5\x18rr\xac\xc8J<\x03\
+\xf5\x99\xb6\xe0\x1eq\x1a\x95R!HL\x8d 'w\
+\x06\xee[\xa0Oh\x1f\xea\xf6R/\xa1\x1a\xea\x0a\xf4\
+\x032Q\x84\xc4\xdcM C?\xf0|\x9a\x9aA\x85\
+\xd4\xabh\x90\x8aEy\xd0\xaf\x93S\x84B\x08\x0b2\
+PSHO\x9dF\x0b\xd4>TH~\x82\x228\xcf\
+\xa3%\x8e\x0f\xbc\xf7,\x1a\x81\xfaV\xae\x09\xfa\x82\xfe\
+\xf0\xefV\x8eS\xd1\xc8I\x9cA\x0e\xfc\x18\x9c_\xa2\
+%\xde:\x14C\xbd\x0c\xfd\xdfF\xed\xe4;h\x04~\
+%\x1c\xe0\x9f\x8c\xae0'\xcc\xbe`\x19\xda\x84\xdeF\
+_\xe2n\xbc\x1b\xbfE\xf0\x089\xa1&\x16\x88\xb7\xa0\
+|A\xdc\x22\xab\xc8\xc3\x94\x1f\xa5\xa4F\xa8\x17\xa8\xf7\
+\xa8\xbfrH\x8e\x8c3\xca\xd9\xcf\xf9=\xe7\x13\xce2\
+7\x9b\xfbk\xee\xe7\xbcr\x9e\x9d\xb7\x93w\xd5'\xd8\
+'\xd5\xe7\xe7>\xaf\xfb\xdc\xf2\x15\xfa&\xf8>\xec\xfb\
+\x96\xef\x7f\xf8~\xeb\xe7\xefW\xeb\xf7\x17\xffa\xff\x0f\
+\xfco\x05\xa4\x04\x94\x05\xdc\x17\xe0\x0cx.\xe0\xdd\x80\
+\xaf\x03\xd7\x05\xca\x02\xcb\x03{\x03\xbd\xdfM\x8b\xd1\x10\
+\x80\x16Z\xfb\x15u\xcd\x11\x89\x8d\xab\xf7\xd7\xa1x\x8f\
+\x8c!R\xab=2\x01\xfcm\xc4#\x93\xc0\x9b^\xf2\
+\xc8\x14\xd4\xf9\xd2#sP.\x1e\xf7\xc8\x5c\x14\x8a?\
+\xf4\xc8<\xa4 J<\xb2\x0fZO<\xeb\x91}Q\
+ \xf1_\x1e\xd9\x1fE\x91\x22\x8f\x1c\x00\xf2\x94G\x0e\
+BI\xe4\xa7\xd0#\xa6|\xd9\xaf\xba\xc8#c\xb4\x1e\
+\xa9=2\x01\xb5\xda=2\x099\xedF\x8fLA\x9d\
+\x0f<2\x07,\xf1\x9dG\xe6\x22\x19\xfe\x85G\xe6\xa1\
+v\xb0\xa5[\xf6Ai\xc4\xa4G\xf6E\x91`k\xb7\
+\xec\x8f\xb4\xc4\x17\x1e9\x00i\xc9\x5c\x8f\x1c\x84\x1a\xc8\
+\xfd\xa8\x11\x0d +r@\xb1\xa1~\xf6w\x14\xc6\xd9\
+\x88\xa6\xd0\x1c\xdc1#\xd48`u8l\xfd\x0e\xc7\
+\xa8\xa8qj\xce\x06w\xea`\x88\x0e\x18\xd00\xb2\xa3\
+>\xa8\x5c\x03W3 \xa1\xba\x8d\x8eM\xc3\xf6>Q\
+\x8dc\x06\xae\x1a\xe0\xed!4\x0d\xad\xf4\xc1\x0b\xa8\xc1\
+<4m\xeb\x03A\x8d\x94\xb0\xfa\xa7#-\xd2C\x03\
+64\x09E\x7fO\xa3\xde&\x15\xf7\xb6\xa2V\xa6\xa5\
+k\xf5\xcc\x17t\xbd\xa77\xa63\xc5j\xe3\xff\xe0\xd8\
+L\xd0\xeaF\xe8w\x18\x1e\x8fA\xb5\xb5c\xaa\x03\xed\
+Ep\x95v\xd7]f\x8e\xa6`\xae\x98\xfa3\xf0<\
+\x9d}\xa6\x04\x06\x97\xc5\xea\xd1\x07\xf3ff\xebX\xe0\
+\xae\x0dZ\xeeG\x19 i\xe0\xd4\xa2L\xa4\x83\xa2\x81\
+\x8e\xcd\x1b'\x87\x1dc\x22\xb7\x1eu\x8d\xa2\xb44\xb7\
+huL\x0d8\xc6fD\xe9\xca4eV\x96\xde\xde\
+7jvLY\x94\xb6\xe1\xfe\x0c\xa5F\xa9\xcd\xd4\xe9\
+4\xf7j\xf7\x93\x93\xf4O\xcd\x8c\x08\xeeL\xc2\x7fF\
+\x9a\x82:}h\x10Z\xb3\xb3-1\xae\xe0\x00\x85D\
+\x10H\xde\xebF\xb6\x05f\x1a&\xd9\xff\xca\xbb\xe7V\
+4<)\xea\x13Mm\xec\x1b4\xdb\xfb6\x8e\x8a\x1c\
+\x16Q5\xf3\xdb8lw\x8cM:\xc6\xa0\xfaO\xb7\
+\xe5v\xbci\x18\x01c\x18\x11\xaa\x82\x02Y\xf1]\x0d\
+\x80\x17N\x0f\x0e;DUUE\x7f\xaf\xa9\xbb_B\
+`\xbf)(\xe3(\x07\xa9\xa0\xcc\xb2E\xb9\xaa\xe6\xe4\
+\x0f\x94b,m\x87\xd7\xa6\xa6\xc6sT\xaa\xd9\xd9Y\
+%\xa3\xce\xa4W\x8b\x01\x87\xfd\xffS\x9b*\xb8?\x06\
+\x86r\x80\xc4\xf8\xde\x00\x98\x90\xa9c\x86\xf3\xef\xf5\xa7\
+\x1a\x1e\xb38T\xb6\xe1\x01\xf3\xd8\xa4y\x12\xfd/\xe7\
+\x05A\xd2\x0aendstream\x0aen\
+dobj\x0a59 0 obj\x0a60\
+67\x0aendobj\x0a57 0 o\
+bj\x0a<< /Type /Fon\
+t\x0a/Subtype /CIDF\
+ontType2\x0a/BaseFo\
+nt /ProximaNova-\
+Regular\x0a/CIDSyst\
+emInfo << /Regis\
+try (Adobe) /Ord\
+ering (Identity)\
+ /Supplement 0 >\
+>\x0a/FontDescripto\
+r 55 0 R\x0a/CIDToG\
+IDMap /Identity\x0a\
+/W [0 [362 506 2\
+23 491 558 546 4\
+61 228 694 567 7\
+28 223 523 570 2\
+56 292 336 583 7\
+59 607 486 569 6\
+70 327 546 486 3\
+37 505 547 801 5\
+45 228 569 581 6\
+03 569 280 802 5\
+23 228 553 586 5\
+11 570 652 297 5\
+52 585 565 482 7\
+02 624 576 586 7\
+86 505 223 510 3\
+40 197 237 876 5\
+82 246 468 246 6\
+21 694 ]\x0a]\x0a>>\x0aen\
+dobj\x0a58 0 obj\x0a<<\
+ /Length 833 >>\x0a\
+stream\x0a/CIDInit \
+/ProcSet findres\
+ource begin\x0a12 d\
+ict begin\x0abeginc\
+map\x0a/CIDSystemIn\
+fo << /Registry \
+(Adobe) /Orderin\
+g (UCS) /Supplem\
+ent 0 >> def\x0a/CM\
+apName /Adobe-Id\
+entity-UCS def\x0a/\
+CMapType 2 def\x0a1\
+ begincodespacer\
+ange\x0a<0000> <FFF\
+F>\x0aendcodespacer\
+ange\x0a2 beginbfra\
+nge\x0a<0000> <0000\
+> <0000>\x0a<0001> \
+<0043> [<004C> <\
+0069> <0063> <00\
+65> <006E> <0073\
+> <003A> <0044> \
+<006F> <0077> <0\
+06C> <0061> <006\
+4> <0020> <0074>\
+ <0031> <0032> <\
+004F> <0030> <00\
+79> <0070> <0043\
+> <0072> <0075> \
+<0076> <002A> <F\
+B01> <0068> <006\
+D> <0046> <002E>\
+ <0071> <0053> <\
+0052> <0067> <00\
+66> <004D> <00E1\
+> <002C> <0034> \
+<0039> <0037> <0\
+062> <0041> <002\
+D> <0033> <0035>\
+ <0054> <0078> <\
+004E> <0042> <00\
+38> <0036> <FB03\
+> <FB02> <006A> \
+<006B> <0022> <0\
+027> <0049> <005\
+7> <0050> <0028>\
+ <007A> <0029> <\
+0059> <0055> ]\x0ae\
+ndbfrange\x0aendcma\
+p\x0aCMapName curre\
+ntdict /CMap def\
+ineresource pop\x0a\
+end\x0aend\x0a\x0aendstre\
+am\x0aendobj\x0a9 0 ob\
+j\x0a<< /Type /Font\
+\x0a/Subtype /Type0\
+\x0a/BaseFont /Prox\
+imaNova-Regular\x0a\
+/Encoding /Ident\
+ity-H\x0a/Descendan\
+tFonts [57 0 R]\x0a\
+/ToUnicode 58 0 \
+R>>\x0aendobj\x0a2 0 o\
+bj\x0a<<\x0a/Type /Pag\
+es\x0a/Kids \x0a[\x0a5 0 \
+R\x0a19 0 R\x0a]\x0a/Coun\
+t 2\x0a/ProcSet [/P\
+DF /Text /ImageB\
+ /ImageC]\x0a>>\x0aend\
+obj\x0axref\x0a0 60\x0a00\
+00000000 65535 f\
+ \x0a0000000009 000\
+00 n \x0a0000052188\
+ 00000 n \x0a000000\
+0171 00000 n \x0a00\
+00000266 00000 n\
+ \x0a0000026787 000\
+00 n \x0a0000000303\
+ 00000 n \x0a000001\
+0781 00000 n \x0a00\
+00044077 00000 n\
+ \x0a0000052043 000\
+00 n \x0a0000010802\
+ 00000 n \x0a000001\
+3313 00000 n \x0a00\
+00013334 00000 n\
+ \x0a0000026572 000\
+00 n \x0a0000026594\
+ 00000 n \x0a000002\
+7135 00000 n \x0a00\
+00029367 00000 n\
+ \x0a0000026908 000\
+00 n \x0a0000027108\
+ 00000 n \x0a000003\
+3241 00000 n \x0a00\
+00029388 00000 n\
+ \x0a0000029683 000\
+00 n \x0a0000029703\
+ 00000 n \x0a000003\
+0065 00000 n \x0a00\
+00030085 00000 n\
+ \x0a0000030399 000\
+00 n \x0a0000030419\
+ 00000 n \x0a000003\
+0807 00000 n \x0a00\
+00030827 00000 n\
+ \x0a0000031233 000\
+00 n \x0a0000031253\
+ 00000 n \x0a000003\
+1686 00000 n \x0a00\
+00031706 00000 n\
+ \x0a0000031758 000\
+00 n \x0a0000031803\
+ 00000 n \x0a000003\
+1855 00000 n \x0a00\
+00031907 00000 n\
+ \x0a0000031959 000\
+00 n \x0a0000032150\
+ 00000 n \x0a000003\
+3074 00000 n \x0a00\
+00032277 00000 n\
+ \x0a0000032439 000\
+00 n \x0a0000032604\
+ 00000 n \x0a000003\
+2793 00000 n \x0a00\
+00032938 00000 n\
+ \x0a0000033137 000\
+00 n \x0a0000033616\
+ 00000 n \x0a000003\
+7984 00000 n \x0a00\
+00033363 00000 n\
+ \x0a0000033589 000\
+00 n \x0a0000038005\
+ 00000 n \x0a000003\
+8271 00000 n \x0a00\
+00042880 00000 n\
+ \x0a0000043304 000\
+00 n \x0a0000042859\
+ 00000 n \x0a000004\
+4219 00000 n \x0a00\
+00044488 00000 n\
+ \x0a0000050667 000\
+00 n \x0a0000051158\
+ 00000 n \x0a000005\
+0646 00000 n \x0atr\
+ailer\x0a<<\x0a/Size 6\
+0\x0a/Info 1 0 R\x0a/R\
+oot 45 0 R\x0a>>\x0ast\
+artxref\x0a52293\x0a%%\
+EOF\x0a\
+\x00\x00\x0d\xfe\
+(\
+\xb5/\xfd`YD\xa5o\x00*\xce\xb0\x1e*\xe0N\
+\x88\x92\x07\xab,\x85\x9f!\xc436h\x8f\x0b\xe8\xc8\
+\x8dk\x5c\xac\xa3Po\xdc%E\x08#\x9f\xb8\x0f\xd0\
+(c\x98af\xc8\xe0\x10K\x02\xc4\x01\xc4\x01M\x05\
+\xf2`8\xd4\xa3\xeb\xb2\xd3R\xca\xee\xbc=\xb2E\xb5\
+6B\xee\xdb\xe6\x97\xb7\xa91\x7f<\x13\xf6\xfei\xc6\
+\xc4\xab\xb9\xad\xb9F\xb7=\xf2\xf1\x92\xfe\x98\xefH\xc5\
+j]|t\xd7}9\x00\xe3\xc1\xba\x09\xd0T\x18\x90\
+\x8aB\x81\x12aL$h(\x13D\x1eh\x22\x984\
+\x94\x08\x85\x02\xa5\xf2\x88L\xd0\xc0\xdaw\xc2\xc4\xebO\
+\xcaeZ\x96\xb4|\x9f\xc8\xa3\xb5<\xa3P\xf8\x03P\
+(04\x13\x07\x84\xc67\xad\xad\x8bg\xfc\xf5\xc4\xcd\
+\xce\xce\xcc\xa6\x9a\xc2\x85\xcbcX\xad:\xc6\xabU\xfb\
+\xe6\xd8/r~\x15\x94\x09\x86\x04\x84\xd1h Xl\
+\x8e\xcb\xd5S..6\x06F\xa3*99\xf96\x11\
+Mol\x0cgx6l\xe1\x0bzx\xd4\xee[\xc7\
+B2\x12\xad\xba/\xb1\x18\xb3m\x15\xf3\x87u\xac\xe6\
+}\x95ok5>\xe3\xd9\xc9\xb0\xd0x\xdb\xef\xcea\
+m\xfc\xac_[c\xa1Y3~\x01\xc5PU\xe6x\
+)\xb6\xcc^VT\xcc\xd5P\x18\x18$\x8a#H\x0a\
+p\xbc\xd5.\x00\x84\x89\x04\x22i0\x90\x89\x0a\x05B\
+R\xa1(t\x0d\x1f\x0e\xc6d\x81\x09\xa3)c\xa30\
+4\x8eEB\x03\xa9<\x16\x8b\x82\x01\x08\xe4Q\x89`\
+\xf1xh&\x0d\xc4De\x91@@\xd3\xc0xx4\
+\xa80\x1e\x10\x1a\x8e\x08\xc9\x02\xc3\x82\x89\x84\x02\x84F\
+C\x81\x04 @0ccT\x18\x0eF\xa5yHh\
+@\x8d\x05\x8c\x07\x04\x1a\x12\x07B\xc5\xa1\xe1\xd18\xd8\
+\x96)\x14\x1c*\x8e\x87\xc4q\x9aM\x96E*\x84\xeb\
+\xd9\x14\x0a\x8e\xc7\x82\xd24\x18\x10\x94\xe6\x81\x11qT\
+\x1cTL\x02\x12$\xb0\xa84\x11j\x18\x9a\xc6$B\
+B!\x08\xc8\x03\x84EU\x19\xf3\x80Q\x89LP\x18\
+\xc6la\xb5\xe8\xee\x9f\x04\x83c\x12\x00%B\x89H\
+\x1e\x1e$\x8d\xc6\xc1\xa3\xd1P,N_P*\x91\xe6\
+\xa1\x814\x8b\x86\x032\x89\x80P(4\x1c\x08\x94\xc8\
+\xb2,\x0c\x1a\x1cP\x12\x180h\xc00\xcb\x00\x8b\x86\
+\x89\x84\x1e$!!\xb1X @T*\x0e\x02,\x0d\
+\x04\xa3A\xb1 \xc2\xc0\xe2PyH,\x8e\xa6\xc2h\
+&\x08,\x0c\x03@\x02\x83\x06\x06($\x11\x85B\x13\
+\x91@\x18\x8e\x08\xa3BY\x14\xcc( \xc1\x04\x0a\x85\
+\x86\xc8\xc3!iD\x9aEQt\x85BD\xf2\xa0L\
+\x1a\x07\x0b\xe4\xe1\x81\x01\x09\x01\x8f\x07\x8c\x87\x09f\x8e\
+\xa7F\xad\x8b\x99H\xac\xaaPx\xd0H{\x90H.\
+h(\x10\x06\xc3\xa4AB\xe2@a\xcb-\xb63\x91\
+\x87\x84)\x14$$\x0e\x86\x03\xa5q<\x22\x1c\x8fj\
+\x1a\x0dDR\xa9`A\xa2\x93\xc61\x91,04\x0d\
+\x0c\x08\x89\xe6\xe1\xc0\xb1H\xd0\xbd\xb4c\xa5+\xc5c\
+\xb9I\x8b\xf8\xf3\xd7]\xe5\xdd\xcc~\x07\xef\x9a\x9b~\
+\x8e\xdf\xfbc\xaa5k\xddk\xd2\xae;yIum\
+\x9c\xb9\xdc\x85\xc5\xca\x94\xaa\xfc\xb6\xd7\xfb\xcbd\x87w\
+\x9a\x8f\xa9-\xed\xb4\xf2\xfd\xe8\xdeV\xf7~\x98J?\
+X\xdd\xc6G7V}1RZ*'^S23\
+\xc7\xc8\xf8v\xb4*5\xfb\xee\x85\xfc\xb6\xba\xe2\xc6\xb2\
+_2\xde\x19\x19&\xea-ec\xda\xe9|E\xa52\
+\xb5\xaf\xf5\xed\xf9\xac\xafP_\x98\xd7Lw<\xab\xa7\
+\x94}cN3\xbe\xfb4\x11\xd9\xae\xad\xa9\x07\xf5\xdc\
+{\xf6\x9f\xf6\xb6\xf7He\xd5\xabX/\xe2\xac\x9fV\
+$n<k\xdd\x18\x99\x7f\xe3\xdb\xde\xb4\xda\xba\xd5\xd7\
+\x8e\xda\x10\x89\x8f\xfdf\xbb;\xb1\x1e\xcd;\xe95\x96\
+\xeem\xfdP\xbb\xac\xeeiz\xa7S\xdcf\xc2\xf3U\
+\x99\xdd\xad6\xa4\xcceN_\xed\x11\xfeg+\xf1\xf7\
+\x93\xb8\xacW\xad\xa5y2\xe6d[\xd5\xb2\xedeU\
+\x1d%\x83\x8c1\xca,\x96'\xdb\x00Z\xa9\xc4\xfa;\
+\x7f\xde\xc8\x8e\xcc\xe1\xaaj\xe3<\xe7\x9d\xd7\xb6\xef\xac\
+\xb6\xb0\xe9L_!\x93e!\x9d\xaaQ\xb2\xfd\xf0\xb1\
+H\x17\xef\x1c\xdf\x9a\xeb~M\xa4bN\xf25\x1e7\
+\xd5\xe9k\xe67]\x80\x07\x8fI\x85\xf1`lO\xda\
+w\xef\x19Sf2\xe2\x97\xfa\x9d\x8aE|v-\xae\
+\xe2\xddcN\xd5-\xea\x0a\xe3\xe1\xa0I\xc0\x11\x019\
+ \xc2xP(\x11\x8c\x05\x1a\x86\xdd\xbdIl\xc7L\
+Y\xfcs\xa6\xa6|ojf\xb9s\xd1\x959\xc7\xfc\
+#C\xb5\xd3\x99\xc5\xfa\xd9\xf4\xec\x1b\x1d\x99E\xeb\x0c\
+\xf1\x08\x8fY\x12y\xcf\x16\x9bn{\xcb\xa2+\xc5\xe4\
+\xa6\xece\x96\xd6+\xa1-\xe9Z\xbeYs\xcf\x94\xbd\
+\xd6\xc9\x85\xbdL\xa8\x8d\xc7t\x86]H\x87{~\xeb\
+!\x133\x9e9\xf6\xa6\xb6>$>\xe6\xe8\x1a\x127\
+\xd6)\x8f\xb8G\xbd?\xe4=\xd9\x7f0\xb5\x89qy\
+\xf75\xe5\x1e.\xa5\xbe\x853\xf1N\xe3\x9en\xbf\xd5\
+W\xb3\xd3\xfer+l:\xe6\xed\xben\xea\xd2\x1f\xd3\
+kbFf\xb5-\xb1\x97R\xfb(\x16\x12\xf2\xc2e\
+\xd9\xc4XuJ\xc3be\x8e5\xa6n\xed\xe9\xf4h\
+\xa4xH\x8bW[\xe2e^\xb2\xbd<_=U2\
+\x8b^\x9e\x8e\xf9\xb4\xf8f\x8a\xd1b\xe6\x5c\xfa\xed\xf5\
+\x8b\x1d\x13\x22[YS\xa2\xe9o\x8b\x0a\x7f\x1a\xaf\x88\
+\xcf,\xbf\xea%\xec\x83M\xff\xf2\xce/\x15\x1f\xcb#\
+\xdd;\xfbJy\xca{\x93\x0b\x1aH\xc4\xa4\x80\x01\xf0\
+V'\xdczR\xf1\xb5H\xad\x7f\xfao%\xce\xdb\x11\
+r\xd5\xd1\xe1\xbf8\xc0\xd6\x8c\xdb\x97T\x05\x0c\x10\x80\
+\x00\x90I\x04\xc2\x04c2a8\x10\xe1\x01\x994\x95\
+\xc7C%\x99!,\x5c\x1f\xa3\xb1@2\x89@\x18(\
+.Xp\x8b\xc9~\xaeoi\x99\xe5*OwN\xfa\
+\xb2\xaa\xa7>\xe7M\xc2\xd3C\xea\xde'SU/\x90\
+c\x1f\x122\x1b\xe9b\xbbv\xfa~t\xc5El?\
+\x8ay\xd4Z_\x1aX\x92\x8c\xb3\x9b\x92Y\xeeK\xca\
+\x9c+Lbf\xb9\x99\xd1\xad\xe8\x8d\x85\xd3\xde\xcaE\
+\xdb{f\xd9{S_\xff\xe4f\xd2\xb7\xbf<\x9c\xf9\
+\xb15 &$\x0e\x15\x06\x84\x82U\xaf\xa1\xe1\x81d\
+a\x81\x89\xa0L\x9a\x09\x06\x84\x99L\x22\xde\x5c\xf0x\
+\x08\x0c\x1a48\xa0,\x12\x184hX$\xf4\x8f\x91\
+\xee\xb8\x93\xde\xb7\xac\x9eQ\x1bs\x12\xb1\x09\x17\xd1\xce\
+m\x0b\xe9\xd4\xb2\xac\x88\xff\xf3E\xa3CL:\x1f\xce\
+/\xe5\x96\x92\xf21k\xa6e\xbeI\xd5\xf5\x83\x8dE\
+7Fo\xcbM}\x5cYt\xdc\xdctw\xf2w\xd2\
+E\xef\x9a\x94\x99\xff\xc3\xdd\xdb\xb8L\xc5\x8bjG\xdd\
+\xbc\xbc5\x89\xaf\xc8r1\xbb$L\xb4\xa4\xb4<a\
+uQ\xe9\xb9Ov;\x1f\xb7\xa9\xff\xd3\xc7G\x9a\xc5\
+\xf4c\xe5$N\xdb\x13\xfe\x98\xb3\xc7J\xa7\xfb\xc3\xa4\
+\xe3\xd9\xfdQ\xd9r\x9cvR+\xe9_\xfaf\xd4\x07\
+\xd5\x9a\xee\x8b\xde\x22\xe9O\xdeO\x8aK\xe2-\xe1-\
+\xe72\xca\xb3\xd8J\xf6\xe5\xf04\x1a\x13\xf3r\xddF\
+k\x87\xb3N\xad\xcbU7\x13\xa97\xcf\x0e2\xe7\xa2\
+|Gf\xa5\xc7\xe5\xa6\xba*2u\x7f\x11\xf3I\xcb\
+\xb6\xda\xd4\xba\xfb\xda\x9f\xd2\xd5\xb2G\xd7\x8e\xea_~\
+y\xaa\xf3\xe3*:\xd4/\xa8\xccdhT\xb9da\
+\xa7qS\xe7\xa5i\x22m\xdd\xe9S%\xc6]\xf4\xd8\
+\xf4\xfe9\x9a.\xd5\xe2\xb2\xfa\xa5\xc5\xee\x94zQ\x95\
+\x09\xf7\xca\xa8E\x8c\x9dH\xa9\xabL\xa6\x0c3\xd57\
+fr\xcb\x8c\x16O\xeb\xb8y\xd4\x8dL\xc6\xb9\x1c\xf3\
+\x11\xffd\x9f\xad[\xc9\xf4\x8em!1\xddXGz\
+3#)\x1ffj=\xa6\xfb\xb9\xce\x93\x9eY\xb2\x0c\
+I\x8b)oYc#>}d*[\xb0rI\xcf\
+\x8d\x91\x163\x8dm\xc9pY\x91yv\xe2\x5cE'\
+\x13\x9aF\x9a\x06SA\xdb\xbcKB\xbeZ.Y~\
+\x93\xce\xf2p\xdbQ\xe6r\xbe\xa2\xbe\xb3\x19\xd2\xf6-\
+\xb9X\x94\xa5j\x94\xb8\xcb\x04\x82\xb3\xa8Bj\xa2D\
+!(\x19##\x223\x93$\xe9\xc29\x86\x81i\x10\
+\x84z\xac<2\x894CA\x10\x85 \x0c\xc7\x18C\
+\x08\x22\xc4\x10\x22 \x84(\x22D\x06\x111!1u\
+c\x08\x93\xe3\x83t\xce\x1c\x17\x19 \xb7\xce\x8e\x15\xea\
+\xfb\xfa\xd8;r=h\x92\xed\xf1\x85\x12%aO\x0d\
+;\x995\xc0\xabK\x8d\xff\x83\x00h\xabeD\x895\
+\x9c\xf2\xbc\x1e\x10\xe6\xb9w\x0c\x8f\xd9\xd6k\x93\x93#\
+,\xc7l\x96O\xef\x96\x0e\x8d\xd2\xe8p\xf6\xd0\xa1\xb1\
+\xd0s\xb8J\xd494\xc3\x87\x06)*:\xcco\xf7\
+;\xb3\xa6\xaf\xf4\x0e\xc5\x09\xc9\xa8^\x1d.\x10\xbde\
+\x17\xfa\xc7\xe8\x05x\xa5\xaf\xb2\x9d,`\xe6\xa5w\xee\
+\xb6\xe2\x22A{\xa9\x09^<\xa4x\xaa\xec\x1f\x06?\
+\xe5\x1eZI\x89\x94\xd4\x15\x01D\x89\xcb\x13oF1\
+\x12\x07\xa6C\xbf\xda;\xd1\x83\xba#\xf4k\xdc\xf4\xda\
+\xd4\xa7q\x16axk\xde6#c`\xd8\xcd\x97\xfa\
+{\xb1\x17\x1a!bAx\xc4\x97\xf3Ge\xb1\xec\xc8\
+j9\xc8dc|\xb2R\xfa>B\xa1G\xc3\xa9\x1d\
+\x8b\x8a\xe4\x8b\x00E]\x8d8,8(\xe1\xdegD\
+MpN%y\x95\xc2\x97\xcc\xc9\xc3kw\xd0\x00>\
+\xe8\xe0\xaa\x80\xc1\x09P29P\xa4y'A\xe6%\
+6\xce\xb1\x1cT\x86\x81\x1b\xc2d>\xa7X\xc7\x8er\
+'l\xa6-\xd9\x1a\xf8\x03iN\x02\xebc?\x03]\
+\xd0`:\xca\x8b\xff\xd7dBl\xc7\x11\xd2y\xd3\xc4\
+7\x89\xb3@\xd9\x00\xe9\x1d\x92\xba\xa6c\xcavzm\
+\xa6\xba\x88\x9dF\xc4Ue|\xa5\xa8\x94\x14\xab\xe5k\
+\x92\x02\x9b\x044=\x03$C\x85W\x03r\xab\xa9\x00\
+\x81\xb1\xb0\x88\xdc\x01Z:\x06\xa1\xbf\xa3h\xb1\xdc\xbe\
+\x9a\x1f\xf6\x03\xf7w\xbch\xc6$s\x1f0\x92\x18O\
+\x85P\xf0\xa4je6E\xc4\xa4\xfe\x7f\x83:Q1\
+.\x12\xb8G\xba\x8c\x0b\x07?\xf0\x81\x9dc\xddD\xb4\
+M\xa3P\xba]/J\xa1\xbe&\xc8+\x96SoJ\
+\x19\xd97\xd36\x9e\xa9e\x0b\xb4a'^\xf1\xa7(\
+\xff\xc4\x92kU\xbe\x14=\xb5\xa4\x88\x97\x97H\xd9\x7f\
+\x1bK\x81\x8b\xb2[\xd7\xba\x18\xd3\xe0\xf9o\xb3F\x1c\
+3\xc5\x84\x80\xd3\xb0\x19\x7f\xdb\xfe\x16\x1b\xe0\x88\xbc\xf3\
+-xT\x18\x87\x85p\xbf\xa2\x0d?\xfb\x9bE\xdb\xcf\
+;}aO-<\xf5\x87\xad\xf6\xfc.\x9f\x88+\xdc\
+\xabl]]\xf7B<\xccO\x85\xfaq\xa2\x99\x91\xe9\
+\xc9u\x83\x90iNb\xab\xc3X\xac\xb8\xdc0I;\
+X\xc5\x1fE\x00$e\x81\x8b\xe1\x19'\xa6a\x8dp\
+\x95\xc6\xeb\x95\xba\x8a\x1e\x5c\xcf\x91l&0\xcdi)\
+\x013>\xc2\xd1\x5c\x17\xde\xbd\x13\x8a\x18\xae\xe3\xf0\x8e\
+\x84\x17\xa2\xdf\xff\x8e\x22\x9b(\xac\xb9\x0bc\xe6XY\
+*\x96\xff\xde\xee\xb6\xa6\xfc\xad\x1f\xd50E\x9cVy\
+U|\x82Q\xda\xede\x9dxl\x92-8\xdfT\x89\
+^i?tC\x1aq\xc7\xea\x9b\x85\xfbpa5\xe7\
+\x97\x07\xc4_\xa8t\x96BQ\x8d[\x9a\xc4\x82\xed6\
+]\xc0\xde\xa2r\x0d1T\x1b8\xf7\x11\x5c\x05\xb7-\
+f\xcc\xe2~\xa2 a\x11v\xfe\xf3.[\x07]\xb8\
+\xa7\x96[|jAY9'\xaa\xfe/\x5c,;\xcc\
+\xa2\xfas\x0fX$\xbf\xe5\xdd\x13V&\xfc\x17o\x80\
+\xf58\xc3&\xd4\x98ZW\xe6\xa0Zs\x90f\xce\xb1\
+.\x1b\xc1\x90`\xccu\xfa\xcf0\x06\x08i\x9aWY\
+8\xacIq\xc4\xfb\x9f\xdf\x83\xe1v\xb5\xb7Y\x88\x89\
+\x85\xc7\x01)\x14EX\xc4O`\xe6j\x85\x05]]\
+\x8e\xccl'\xe6,\x9f\xc1\x8c\xd3\xfe\xee\x9c\x8c\xb2I\
+\xf4*O\x9d \xcf<\x0e\x8a\x04}P\x0c\x89\xb3l\
+m\x00\xb2\xe7Ir\xe9|\xd7YI\xaco,\x96\xb9\
+Q\x84\xb1F\x13\xa1X\xb0\xb9:\x16\x84\x1al\x81\xd1\
+F\x06\x9cJ\xcf\x07\xa8\xc4v\xaa\x9cQ\xbc\xa4\x15\x80\
+\x85s\x98\xb6J$\x1c\x029\xe3\xd3\xed\x80\xa8\xaf\x01\
+\x9a\xda\xaf_\x082i\xc2]\xa8\x9b\xa0%\xeb2\xc1\
+\xdb\xbf\x04\xfd\x8bJ\xb05\x12R\xf9DRR\x01\xfe\
+\xc8\xc4\xf2+\xfd\xe9\xe8\xfe\xa7+r\xd6\xeb\xfe\xd0\xb6\
+D\x1f\xe5\x1f0(\x0e\xc8\x80X\xad\x22\x00\x5c\x81\xa1\
+\x87\xdb\xc7;\x8f\x026[\x8e\xe3\xe2\x02\x98\xa3\x82\xbd\
+ml\x9a\xe41o0^\xf0bDQSz\xea\xa2\
+\x90Z\x00z:\xb4\xacN\xf8&\xb67\xf0\x84\x14\x98\
+\xdf\x22\x0b\xb2\x99;C\x97\x9a\xf9a\x82Q\xc8\x83|\
+\xbd\xd8\x1a&\x9eo\xc6\xc9~S\x84Q\x85\x91\x1fp\
+\xe6\xb7;\xe6-\xfd5\xa1\x9f-\xabe\xdau\xae\xaf\
+\xf7a\x19Z\xd8?\xbe\xd5\xa7,X\xeb\xcd\x8eB\xf5\
+\x8ed\x18\xe1\xbe'\xba\xb2j\x07c\x11\x86^\x19\x8d\
+\xe9\x85\xb0\x0f\xb2\xc4H \xc2\xc8<\x82\xdd\x85\x09\x01\
+7\x0aI\x0eRh\xaf\x1cX\xb7\xa9j\x12q\x22^\
+Wa1\xfe\xad\xc5h\x8c\xa2|\x90.\xac\xc0\xf6u\
+\x87\xdf\xd4HD/\x96IM\x0c\xbf\xa7\xf9\xd8!\xd6\
+\xe8\xd9,\xc0YU\xed\x00\x14\xca\x9d'kCd\xf3\
+\xdcF\x1a[\xdbL\xee\x01\xc3\x90\x12I\xd2Pc\x1c\
+\xe3\x0b\x1c(f\xd9\xf8\x5c\x08awH\xbc\x99,\xc9\
+ \xb5\xae1N\x12\xa8@\xd0u~^\xb1^\xc37\
+\xbe}\x96\xa5\x86xy\xaa y\xfd\x81\xa4c64\
+\xa9`jYW\x9e\xa0\x05S\xdb\xfb+P~\xca8\
+1\xef\x06gU0\xe3\xa4\xc5f\xe0U~\x15e\xe6\
+,W\xa9g\xd0\xb7\x95\x82\xf9HD\xe7J\xd3Bg\
+&\xd8\xbffv\xe7\xba\x9f\xb9F\xca@\xca\x86\x04\x8e\
+0d\x03T\xddsT\x12\x5c\xb7\x17\xcbZ,\xb0\xc9\
+\xc6\x9c\xe9\xc0=C\x84\xc4\xebb'\xf3;=\xf0x\
+\xf7\xa3\x15\xbe\xa6\x93\x1e\xa7\x98\x1c\x0c\x04\x1bqL\x86\
+3\x03b\xb0\x040\xd2\xd2JX%\xd8\x04\xb8aa\
+m\x8cn\xc1\xb6\xe8\xaf\xb1\x0c\x9e\x0cUMP\x0a\x03\
+\xe6#\x03\xd0a\xe4l\x17J\x1e-\xc7;H\xff\x9c\
+\xd8\x11G\xcb\x96q\x22\x82\x8d\xa3\xa4X\xe7\x99\xf5\xc5\
+\x96\xa2w*\x84\xc3<l\xa9|.\x12\xa3\xcbW\xd1\
+%\x8e\xcaUp\xaf\xb52B%e=b\xba\x11\x11\
+\xf1\xdf@x\xb3\x14\xb4d\x90\x0bt\x01WN#P\
+}\xc7\x8d\x9eCC\xf0\x06A\x018\xd0\x16\xd0\x03D\
+\x9c\x83e'\xcb\xdbD\x7f\x0a\xb2N5\xe4\xf1\xac\xb0\
+\x85\xf2\x13!1~:\x905\xe9)\x06\xb0dw\x95\
+\xe5\xccb\x8a~\x01\xfbI\xf4\x87cO+\
+\x00\x00\x09z\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Capa_1\x22 xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22 xm\
+lns:xlink=\x22http:\
+//www.w3.org/199\
+9/xlink\x22 x=\x220px\x22\
+ y=\x220px\x22\x0d\x0a\x09 view\
+Box=\x220 0 512 512\
+\x22 style=\x22enable-\
+background:new 0\
+ 0 512 512;\x22 xml\
+:space=\x22preserve\
+\x22>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\x09\
+\x09<path d=\x22M491.7\
+29,112.971L259.2\
+61,0.745c-2.061-\
+0.994-4.461-0.99\
+4-6.521,0L20.271\
+,112.971c-2.592,\
+1.251-4.239,3.87\
+6-4.239,6.754\x0d\x0a\x09\
+\x09\x09v272.549c0,2.8\
+78,1.647,5.503,4\
+.239,6.754l232.4\
+68,112.226c1.03,\
+0.497,2.146,0.74\
+6,3.261,0.746s2.\
+23-0.249,3.261-0\
+.746\x0d\x0a\x09\x09\x09l232.46\
+8-112.226c2.592-\
+1.251,4.239-3.87\
+6,4.239-6.754V11\
+9.726C495.968,11\
+6.846,494.32,114\
+.223,491.729,112\
+.971z M256,15.82\
+8\x0d\x0a\x09\x09\x09l215.217,1\
+03.897l-62.387,3\
+0.118c-0.395-0.3\
+01-0.812-0.579-1\
+.27-0.8L193.805,\
+45.853L256,15.82\
+8z M176.867,54.3\
+33l214.904,103.7\
+46\x0d\x0a\x09\x09\x09l-44.015,\
+21.249L132.941,7\
+5.624L176.867,54\
+.333z M396.799,1\
+72.307v78.546l-4\
+1.113,19.848v-78\
+.546L396.799,172\
+.307z\x0d\x0a\x09\x09\x09 M480.\
+968,387.568L263.\
+5,492.55V236.658\
+l51.873-25.042c3\
+.73-1.801,5.294-\
+6.284,3.493-10.0\
+15\x0d\x0a\x09\x09\x09c-1.801-3\
+.729-6.284-5.295\
+-10.015-3.493L25\
+6,223.623l-20.79\
+6-10.04c-3.731-1\
+.803-8.214-0.237\
+-10.015,3.493\x0d\x0a\x09\
+\x09\x09c-1.801,3.73-0\
+.237,8.214,3.493\
+,10.015l19.818,9\
+.567V492.55L31.0\
+32,387.566V131.6\
+74l165.6,79.945\x0d\
+\x0a\x09\x09\x09c1.051,0.508\
+,2.162,0.748,3.2\
+55,0.748c2.788,0\
+,5.466-1.562,6.7\
+59-4.241c1.801-3\
+.73,0.237-8.214-\
+3.493-10.015l-16\
+2.37-78.386\x0d\x0a\x09\x09\x09\
+l74.505-35.968L3\
+40.582,192.52c0.\
+033,0.046,0.07,0\
+.087,0.104,0.132\
+v89.999c0,2.581,\
+1.327,4.98,3.513\
+,6.353\x0d\x0a\x09\x09\x09c1.21\
+4,0.762,2.599,1.\
+147,3.988,1.147c\
+1.112,0,2.227-0.\
+247,3.26-0.746l5\
+6.113-27.089c2.5\
+92-1.251,4.239-3\
+.875,4.239-6.754\
+v-90.495\x0d\x0a\x09\x09\x09l69\
+.169-33.392V387.\
+568z\x22/>\x0d\x0a\x09</g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\
+\x0a\x09\x09<path d=\x22M92.\
+926,358.479L58.8\
+11,342.01c-3.732\
+-1.803-8.214-0.2\
+37-10.015,3.493c\
+-1.801,3.73-0.23\
+7,8.214,3.493,10\
+.015\x0d\x0a\x09\x09\x09l34.115\
+,16.469c1.051,0.\
+508,2.162,0.748,\
+3.255,0.748c2.78\
+8,0,5.466-1.562,\
+6.759-4.241\x0d\x0a\x09\x09\x09\
+C98.22,364.763,9\
+6.656,360.281,92\
+.926,358.479z\x22/>\
+\x0d\x0a\x09</g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a\x09<g>\x0d\x0a\x09\x09<pat\
+h d=\x22M124.323,33\
+8.042l-65.465-31\
+.604c-3.731-1.80\
+1-8.214-0.237-10\
+.015,3.494c-1.8,\
+3.73-0.236,8.214\
+,3.494,10.015\x0d\x0a\x09\
+\x09\x09l65.465,31.604\
+c1.051,0.507,2.1\
+62,0.748,3.255,0\
+.748c2.788,0,5.4\
+66-1.562,6.759-4\
+.241\x0d\x0a\x09\x09\x09C129.61\
+7,344.326,128.05\
+3,339.842,124.32\
+3,338.042z\x22/>\x0d\x0a\x09\
+</g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a</svg>\x0d\x0a\
+\x00\x00\x076\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Layer_1\x22 xmln\
+s=\x22http://www.w3\
+.org/2000/svg\x22 x\
+mlns:xlink=\x22http\
+://www.w3.org/19\
+99/xlink\x22 x=\x220px\
+\x22 y=\x220px\x22\x0d\x0a\x09 vie\
+wBox=\x220 0 512 51\
+2\x22 style=\x22enable\
+-background:new \
+0 0 512 512;\x22 xm\
+l:space=\x22preserv\
+e\x22>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\
+\x09\x09<path d=\x22M425.\
+298,51.358h-91.4\
+55V16.696c0-9.22\
+-7.475-16.696-16\
+.696-16.696H194.\
+855c-9.22,0-16.6\
+96,7.475-16.696,\
+16.696v34.662\x0d\x0a\x09\
+\x09\x09H86.704c-9.22,\
+0-16.696,7.475-1\
+6.696,16.696v51.\
+357c0,9.22,7.475\
+,16.696,16.696,1\
+6.696h5.072l15.2\
+6,359.906\x0d\x0a\x09\x09\x09c0\
+.378,8.937,7.735\
+,15.988,16.68,15\
+.988h264.568c8.9\
+46,0,16.302-7.05\
+1,16.68-15.989l1\
+5.259-359.906h5.\
+073\x0d\x0a\x09\x09\x09c9.22,0,\
+16.696-7.475,16.\
+696-16.696V68.05\
+4C441.994,58.832\
+,434.519,51.358,\
+425.298,51.358z \
+M211.551,33.391h\
+88.9v17.967h-88.\
+9\x0d\x0a\x09\x09\x09V33.391z M\
+372.283,478.609H\
+139.719l-14.522-\
+342.502h261.606L\
+372.283,478.609z\
+ M408.602,102.71\
+5c-15.17,0-296.1\
+14,0-305.202,0\x0d\x0a\
+\x09\x09\x09V84.749h305.2\
+02V102.715z\x22/>\x0d\x0a\
+\x09</g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a\x09<g>\x0d\x0a\x09\x09<path \
+d=\x22M188.835,187.\
+304c-9.22,0-16.6\
+96,7.475-16.696,\
+16.696v206.714c0\
+,9.22,7.475,16.6\
+96,16.696,16.696\
+\x0d\x0a\x09\x09\x09c9.22,0,16.\
+696-7.475,16.696\
+-16.696V204C205.\
+53,194.779,198.0\
+55,187.304,188.8\
+35,187.304z\x22/>\x0d\x0a\
+\x09</g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a\x09<g>\x0d\x0a\x09\x09<path \
+d=\x22M255.998,187.\
+304c-9.22,0-16.6\
+96,7.475-16.696,\
+16.696v206.714c0\
+,9.22,7.474,16.6\
+96,16.696,16.696\
+\x0d\x0a\x09\x09\x09c9.22,0,16.\
+696-7.475,16.696\
+-16.696V204C272.\
+693,194.779,265.\
+218,187.304,255.\
+998,187.304z\x22/>\x0d\
+\x0a\x09</g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a\x09<g>\x0d\x0a\x09\x09<path\
+ d=\x22M323.161,187\
+.304c-9.22,0-16.\
+696,7.475-16.696\
+,16.696v206.714c\
+0,9.22,7.475,16.\
+696,16.696,16.69\
+6\x0d\x0a\x09\x09\x09s16.696-7.\
+475,16.696-16.69\
+6V204C339.857,19\
+4.779,332.382,18\
+7.304,323.161,18\
+7.304z\x22/>\x0d\x0a\x09</g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a</s\
+vg>\x0d\x0a\
+\x00\x00\x03F\
+<\
+svg height=\x22411p\
+t\x22 viewBox=\x220 0 \
+411 410\x22 width=\x22\
+411pt\x22 xmlns=\x22ht\
+tp://www.w3.org/\
+2000/svg\x22><path \
+d=\x22m211.898438 1\
+99.5 17.601562-5\
+2.699219 35.1015\
+62 35.097657zm65\
+.703124-24.39843\
+8-41.300781-41.3\
+00781 133.398438\
+-133.300781 41.3\
+00781 41.300781z\
+m0 0\x22/><path d=\x22\
+m353.199219 170.\
+5c-1.859375-.011\
+719-3.644531.722\
+656-4.960938 2.0\
+39062-1.316406 1\
+.3125-2.050781 3\
+.101563-2.039062\
+ 4.960938v186.89\
+8438c-.015625 18\
+.21875-14.78125 \
+32.984374-33 33h\
+-266.199219c-18.\
+21875-.015626-32\
+.980469-14.78125\
+-33-33v-266.1992\
+19c.019531-18.21\
+875 14.78125-32.\
+980469 33-33h186\
+.898438c3.867187\
+ 0 7-3.132813 7-\
+7 0-3.863281-3.1\
+32813-7-7-7h-186\
+.898438c-25.9414\
+06.042969-46.960\
+9375 21.058593-4\
+7 47v266.199219c\
+.0390625 25.9414\
+06 21.058594 46.\
+960937 47 47h266\
+.199219c25.94140\
+6-.039063 46.960\
+937-21.058594 47\
+-47v-186.898438c\
+-.011719-3.86328\
+1-3.136719-6.988\
+281-7-7zm0 0\x22/><\
+/svg>\
+\x00\x00\x08\xe6\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Layer_1\x22 xmln\
+s=\x22http://www.w3\
+.org/2000/svg\x22 x\
+mlns:xlink=\x22http\
+://www.w3.org/19\
+99/xlink\x22 x=\x220px\
+\x22 y=\x220px\x22\x0d\x0a\x09 vie\
+wBox=\x220 0 321.06\
+8 321.068\x22 style\
+=\x22enable-backgro\
+und:new 0 0 321.\
+068 321.068;\x22 xm\
+l:space=\x22preserv\
+e\x22>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\
+\x09\x09<path d=\x22M160.\
+427,160.535c-44.\
+267,0-80.213,36.\
+053-80.213,80.32\
+s35.947,80.213,8\
+0.213,80.213s80.\
+213-36.053,80.21\
+3-80.32\x0d\x0a\x09\x09\x09C240\
+.641,196.482,204\
+.694,160.535,160\
+.427,160.535z M1\
+60.427,307.628c-\
+36.907,0-66.88-2\
+9.973-66.88-66.8\
+8\x0d\x0a\x09\x09\x09c0-36.907,\
+29.973-66.88,66.\
+88-66.88s66.88,3\
+0.08,66.88,66.88\
+C227.307,277.655\
+,197.334,307.628\
+,160.427,307.628\
+z\x22/>\x0d\x0a\x09</g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\x09\x09\
+<rect x=\x22153.708\
+\x22 y=\x22191.788\x22 wi\
+dth=\x2213.333\x22 hei\
+ght=\x2281.707\x22/>\x0d\x0a\
+\x09</g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a\x09<g>\x0d\x0a\x09\x09<polyg\
+on points=\x22190.4\
+01,234.028 160.4\
+27,264.002 130.4\
+54,234.028 121.0\
+68,243.522 160.4\
+27,282.882 199.7\
+87,243.522 \x09\x09\x22/>\
+\x0d\x0a\x09</g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a\x09<g>\x0d\x0a\x09\x09<pat\
+h d=\x22M275.628,97\
+.708c2.773-8.64,\
+3.84-17.6,3.307-\
+26.773c-2.347-38\
+.827-36.907-70.6\
+13-77.013-70.933\
+\x0d\x0a\x09\x09\x09c-32.533-0.\
+213-61.76,19.52-\
+73.28,48.427c-11\
+.947-9.387-27.30\
+7-13.973-42.88-1\
+2.48c-22.187,2.0\
+27-41.6,16.853-4\
+9.387,37.76\x0d\x0a\x09\x09\x09\
+c-3.413,9.28-4.3\
+73,18.773-2.667,\
+28.267c-20.373,9\
+.6-33.707,29.867\
+-33.707,52.16c0,\
+31.253,23.893,54\
+.187,57.28,55.46\
+7\x0d\x0a\x09\x09\x09c7.253,11.\
+2,21.12,16.533,3\
+1.68,17.6l1.387-\
+13.12c-6.507-0.7\
+47-18.773-4.373-\
+23.04-13.76l-1.8\
+13-3.947h-5.44\x0d\x0a\
+\x09\x09\x09c-27.627,0-46\
+.827-17.387-46.8\
+27-42.24c0-18.56\
+,12.267-35.413,3\
+0.4-41.813l5.973\
+-2.133l-1.707-6.\
+08\x0d\x0a\x09\x09\x09c-2.453-8\
+.64-2.133-17.28,\
+0.96-25.707c5.97\
+3-16.107,20.907-\
+27.52,38.293-29.\
+12c15.253-1.387,\
+30.08,4.587,39.6\
+8,15.893l8.64,10\
+.24\x0d\x0a\x09\x09\x09l2.987-1\
+3.12c6.507-28.58\
+7,32.853-48.96,6\
+3.467-48.853c33.\
+173,0.213,61.867\
+,26.453,63.787,5\
+8.347\x0d\x0a\x09\x09\x09c0.64,\
+9.813-1.173,19.4\
+13-5.227,28.48l-\
+3.84,8.533l9.387\
+,0.853c23.787,2.\
+24,41.813,21.333\
+,41.813,44.373\x0d\x0a\
+\x09\x09\x09c0,11.627-7.2\
+53,29.44-23.04,4\
+1.067c-10.667,7.\
+893-29.013,15.46\
+7-56,7.147l-3.94\
+7,12.8c32.32,9.9\
+2,54.72,0.533,67\
+.84-9.173\x0d\x0a\x09\x09\x09c1\
+9.627-14.507,28.\
+373-36.48,28.373\
+-51.84C321.068,1\
+26.828,302.081,1\
+03.895,275.628,9\
+7.708z\x22/>\x0d\x0a\x09</g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a</s\
+vg>\x0d\x0a\
+\x00\x00\x07\xc8\
+<\
+?xml version=\x221.\
+0\x22?>\x0a<svg xmlns=\
+\x22http://www.w3.o\
+rg/2000/svg\x22 wid\
+th=\x22512\x22 height=\
+\x22512\x22 viewBox=\x220\
+ 0 128 128\x22><g><\
+path d=\x22M121.693\
+,29.624H84.358V1\
+3.818a1.75,1.75,\
+0,0,0-1.75-1.75H\
+45.392a1.75,1.75\
+,0,0,0-1.75,1.75\
+V29.624H6.307a1.\
+749,1.749,0,0,0-\
+1.75,1.75v82.808\
+a1.75,1.75,0,0,0\
+,1.75,1.75H121.6\
+93a1.75,1.75,0,0\
+,0,1.75-1.75V31.\
+374A1.749,1.749,\
+0,0,0,121.693,29\
+.624ZM47.142,15.\
+568H80.858V29.62\
+4H76.831v-8.4a1.\
+749,1.749,0,0,0-\
+1.75-1.75H52.919\
+a1.749,1.749,0,0\
+,0-1.75,1.75v8.4\
+H47.142Zm7.527,1\
+4.056V22.973H73.\
+331v6.651Zm-46.6\
+12,3.5H119.943V5\
+2.835H8.057ZM99.\
+3,56.335h3.435v9\
+.4H99.3Zm-74.029\
+,0H28.7v9.4H25.2\
+68Zm-17.211,56.1\
+v-56.1H21.768V67\
+.48a1.749,1.749,\
+0,0,0,1.75,1.75h\
+6.935a1.749,1.74\
+9,0,0,0,1.75-1.7\
+5V56.335H95.8V67\
+.48a1.749,1.749,\
+0,0,0,1.75,1.75h\
+6.935a1.749,1.74\
+9,0,0,0,1.75-1.7\
+5V56.335h13.711v\
+56.1Z\x22/><path d=\
+\x22M82.231,81.674A\
+11.094,11.094,0,\
+0,0,84.25,68.69a\
+1.75,1.75,0,0,0-\
+2.792-.433L75.6,\
+74.114l-1.667.11\
+4.113-1.667L79.9\
+,66.7a1.75,1.75,\
+0,0,0-.433-2.792\
+A11.134,11.134,0\
+,0,0,63.938,77.7\
+2l-3.3,3.3L45.85\
+7,66.243a1.75,1.\
+75,0,0,0-2.474,2\
+.475L58.161,83.5\
+,43.856,97.8a4.6\
+,4.6,0,0,0,6.5,6\
+.5l11.37-11.371a\
+6.058,6.058,0,0,\
+0,.921,1.222L72.\
+8,104.307a6.126,\
+6.126,0,0,0,8.64\
+7,0h0a6.123,6.12\
+3,0,0,0,0-8.648L\
+71.3,85.51a6.092\
+,6.092,0,0,0-1.2\
+23-.921l.366-.36\
+6A11.085,11.085,\
+0,0,0,82.231,81.\
+674ZM67.262,79.3\
+46a1.75,1.75,0,0\
+,0,.317-2.041A7.\
+637,7.637,0,0,1,\
+75.42,66.238L71.\
+108,70.55a1.755,\
+1.755,0,0,0-.508\
+,1.118l-.294,4.3\
+22a1.75,1.75,0,0\
+,0,.508,1.357,1.\
+721,1.721,0,0,0,\
+1.357.508l4.322-\
+.293a1.756,1.756\
+,0,0,0,1.118-.50\
+9l4.312-4.312a7.\
+637,7.637,0,0,1-\
+11.067,7.841,1.7\
+47,1.747,0,0,0-2\
+.041.317l-2.927,\
+2.928a6.085,6.08\
+5,0,0,0-1.8.649l\
+-.979-.979ZM47.8\
+85,101.831a1.1,1\
+.1,0,0,1-1.554-1\
+.555l14.305-14.3\
+.979.979a6.081,6\
+.081,0,0,0-.649,\
+1.8Zm31.086-3.7a\
+2.615,2.615,0,0,\
+1-3.7,3.7L65.125\
+,91.683a2.615,2.\
+615,0,0,1,3.7-3.\
+7Z\x22/><path d=\x22M3\
+7.722,46.339a1.7\
+5,1.75,0,0,0-1.7\
+5-1.75H17.748a1.\
+75,1.75,0,0,0,0,\
+3.5H35.972A1.75,\
+1.75,0,0,0,37.72\
+2,46.339Z\x22/><pat\
+h d=\x22M44.1,48.08\
+9h3.408a1.75,1.7\
+5,0,0,0,0-3.5H44\
+.1a1.75,1.75,0,0\
+,0,0,3.5Z\x22/></g>\
+</svg>\x0a\
+\x00\x00\x02\x1b\
+<\
+svg id=\x22Capa_1\x22 \
+enable-backgroun\
+d=\x22new 0 0 551.1\
+3 551.13\x22 height\
+=\x22512\x22 viewBox=\x22\
+0 0 551.13 551.1\
+3\x22 width=\x22512\x22 x\
+mlns=\x22http://www\
+.w3.org/2000/svg\
+\x22><path d=\x22m465.\
+016 172.228h-51.\
+668v34.446h34.44\
+6v310.011h-344.4\
+57v-310.011h34.4\
+46v-34.446h-51.6\
+69c-9.52 0-17.22\
+3 7.703-17.223 1\
+7.223v344.456c0 \
+9.52 7.703 17.22\
+3 17.223 17.223h\
+378.902c9.52 0 1\
+7.223-7.703 17.2\
+23-17.223v-344.4\
+56c0-9.52-7.703-\
+17.223-17.223-17\
+.223z\x22/><path d=\
+\x22m258.342 65.931\
+v244.08h34.446v-\
+244.08l73.937 73\
+.937 24.354-24.3\
+54-115.514-115.5\
+14-115.514 115.5\
+14 24.354 24.354\
+z\x22/></svg>\
+\x00\x00\x04\xfa\
+<\
+svg height=\x22512\x22\
+ viewBox=\x220 0 12\
+8 128\x22 width=\x2251\
+2\x22 xmlns=\x22http:/\
+/www.w3.org/2000\
+/svg\x22><g><path d\
+=\x22m109.057 112.2\
+06-14.7-25.03-13\
+.982-23.823v-28.\
+1h1.75a8.25 8.25\
+ 0 0 0 0-16.5h-1\
+.75v-8.006a10.76\
+2 10.762 0 0 0 -\
+10.75-10.747h-11\
+.25a10.762 10.76\
+2 0 0 0 -10.75 1\
+0.75v8.009h-1.75\
+a8.25 8.25 0 0 0\
+ 0 16.5h1.75v28.\
+1l-14.616 24.888\
+-14.066 23.959a1\
+0.483 10.483 0 0\
+ 0 9.04 15.794h7\
+2.034a10.483 10.\
+483 0 0 0 9.04-1\
+5.791zm-57.932-1\
+01.459a7.258 7.2\
+58 0 0 1 7.25-7.\
+25h11.25a7.258 7\
+.258 0 0 1 7.25 \
+7.25v8.009h-25.7\
+5zm-10 16.259a4.\
+756 4.756 0 0 1 \
+4.75-4.75h36.25a\
+4.75 4.75 0 0 1 \
+0 9.5h-36.25a4.7\
+56 4.756 0 0 1 -\
+4.75-4.75zm9.408\
+ 38.307a1.751 1.\
+751 0 0 0 .592-1\
+.313v-28.744h25.\
+75v28.744a1.751 \
+1.751 0 0 0 .592\
+ 1.313l11.815 20\
+.124a51.936 51.9\
+36 0 0 0 -25.821\
+ 1.585 48.409 48\
+.409 0 0 1 -26.2\
+63 1zm49.484 59.\
+187h-72.034a6.98\
+4 6.984 0 0 1 -6\
+.022-10.519l13.3\
+87-22.8a51.914 5\
+1.914 0 0 0 29.1\
+89-.824 48.461 4\
+8.461 0 0 1 27.1\
+7-.787l14.332 24\
+.412a6.984 6.984\
+ 0 0 1 -6.022 10\
+.519z\x22/><path d=\
+\x22m74.188 95.75a9\
+.938 9.938 0 1 0\
+ 9.937 9.938 9.9\
+49 9.949 0 0 0 -\
+9.937-9.938zm0 1\
+6.375a6.438 6.43\
+8 0 1 1 6.437-6.\
+437 6.445 6.445 \
+0 0 1 -6.437 6.4\
+37z\x22/><path d=\x22m\
+50.531 100a6.657\
+ 6.657 0 1 0 6.6\
+57 6.656 6.664 6\
+.664 0 0 0 -6.65\
+7-6.656zm0 9.813\
+a3.157 3.157 0 1\
+ 1 3.157-3.157 3\
+.16 3.16 0 0 1 -\
+3.157 3.157z\x22/><\
+/g></svg>\
+\x00\x00\x03\x8b\
+<\
+svg id=\x22_x31_px\x22\
+ enable-backgrou\
+nd=\x22new 0 0 24 2\
+4\x22 height=\x22512\x22 \
+viewBox=\x220 0 24 \
+24\x22 width=\x22512\x22 \
+xmlns=\x22http://ww\
+w.w3.org/2000/sv\
+g\x22><path d=\x22m23.\
+5 21h-23c-.276 0\
+-.5-.224-.5-.5s.\
+224-.5.5-.5h23c.\
+276 0 .5.224.5.5\
+s-.224.5-.5.5z\x22/\
+><path d=\x22m21.5 \
+21c-.276 0-.5-.2\
+24-.5-.5v-9c0-.2\
+76.224-.5.5-.5s.\
+5.224.5.5v9c0 .2\
+76-.224.5-.5.5z\x22\
+/><path d=\x22m2.5 \
+21c-.276 0-.5-.2\
+24-.5-.5v-11.5c0\
+-1.103.897-2 2-2\
+h2.5c.276 0 .5.2\
+24.5.5s-.224.5-.\
+5.5h-2.5c-.551 0\
+-1 .449-1 1v11.5\
+c0 .276-.224.5-.\
+5.5z\x22/><path d=\x22\
+m14 13c-.13 0-.2\
+58-.051-.354-.14\
+6l-4.5-4.5c-.195\
+-.195-.195-.512 \
+0-.707l4.5-4.5c.\
+143-.143.358-.18\
+6.545-.108s.309.\
+259.309.461v2.5h\
+6c1.378 0 2.5-1.\
+122 2.5-2.5 0-.2\
+76.224-.5.5-.5s.\
+5.224.5.5v1c0 3.\
+033-2.467 5.5-5.\
+5 5.5h-4v2.5c0 .\
+202-.122.385-.30\
+9.462-.062.026-.\
+127.038-.191.038\
+zm-3.793-5 3.293\
+ 3.293v-1.793c0-\
+.276.224-.5.5-.5\
+h4.5c1.853 0 3.4\
+49-1.126 4.137-2\
+.73-.591.458-1.3\
+33.73-2.137.73h-\
+6.5c-.276 0-.5-.\
+224-.5-.5v-1.793\
+z\x22/></svg>\
+\x00\x00\x07\xb3\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Capa_1\x22 xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22 xm\
+lns:xlink=\x22http:\
+//www.w3.org/199\
+9/xlink\x22 x=\x220px\x22\
+ y=\x220px\x22\x0d\x0a\x09 view\
+Box=\x220 0 412.72 \
+412.72\x22 style=\x22e\
+nable-background\
+:new 0 0 412.72 \
+412.72;\x22 xml:spa\
+ce=\x22preserve\x22>\x0d\x0a\
+<g>\x0d\x0a\x09<g>\x0d\x0a\x09\x09<pa\
+th d=\x22M404.72,82\
+.944c-0.027,0-0.\
+054,0-0.08,0h0h-\
+27.12v-9.28c0.14\
+6-3.673-2.23-6.9\
+74-5.76-8\x0d\x0a\x09\x09\x09c-\
+18.828-4.934-38.\
+216-7.408-57.68-\
+7.36c-32,0-75.6,\
+7.2-107.84,40c-3\
+2-33.12-75.92-40\
+-107.84-40\x0d\x0a\x09\x09\x09c\
+-19.464-0.048-38\
+.852,2.426-57.68\
+,7.36c-3.53,1.02\
+6-5.906,4.327-5.\
+76,8v9.2H8c-4.41\
+8,0-8,3.582-8,8v\
+255.52c0,4.418,3\
+.582,8,8,8\x0d\x0a\x09\x09\x09c\
+1.374-0.004,2.72\
+4-0.362,3.92-1.0\
+4c0.8-0.4,80.8-4\
+4.16,192.48-16h1\
+.2h0.72c0.638,0.\
+077,1.282,0.077,\
+1.92,0\x0d\x0a\x09\x09\x09c112-\
+28.4,192,15.28,1\
+92.48,16c2.475,1\
+.429,5.525,1.429\
+,8,0c2.46-1.42,3\
+.983-4.039,4-6.8\
+8V90.944\x0d\x0a\x09\x09\x09C41\
+2.72,86.526,409.\
+139,82.944,404.7\
+2,82.944z M16,33\
+3.664V98.944h19.\
+12v200.64c-0.05,\
+4.418,3.491,8.04\
+,7.909,8.09\x0d\x0a\x09\x09\x09\
+c0.432,0.005,0.8\
+64-0.025,1.291-0\
+.09c16.55-2.527,\
+33.259-3.864,50-\
+4c23.19-0.402,46\
+.283,3.086,68.32\
+,10.32\x0d\x0a\x09\x09\x09C112.\
+875,307.886,62.3\
+97,314.688,16,33\
+3.664z M94.32,28\
+7.664c-14.551,0.\
+033-29.085,0.968\
+-43.52,2.8V79.98\
+4\x0d\x0a\x09\x09\x09c15.576-3.\
+47,31.482-5.241,\
+47.44-5.28c29.92\
+,0,71.2,6.88,99.\
+84,39.2l0.24,199\
+.28C181.68,302.3\
+04,149.2,287.664\
+,94.32,287.664z\x0d\
+\x0a\x09\x09\x09 M214.32,113\
+.904c28.64-32,69\
+.92-39.2,99.84-3\
+9.2c15.957,0.047\
+,31.863,1.817,47\
+.44,5.28v210.48\x0d\
+\x0a\x09\x09\x09c-14.354-1.8\
+49-28.808-2.811-\
+43.28-2.88c-54.5\
+6,0-87.12,14.64-\
+104,25.52V113.90\
+4z M396.64,333.6\
+64\x0d\x0a\x09\x09\x09c-46.496-\
+19.028-97.09-25.\
+831-146.96-19.76\
+c22.141-7.26,45.\
+344-10.749,68.64\
+-10.32c16.846,0.\
+094,33.663,1.404\
+,50.32,3.92\x0d\x0a\x09\x09\x09\
+c4.368,0.663,8.4\
+47-2.341,9.11-6.\
+709c0.065-0.427,\
+0.095-0.859,0.09\
+-1.291V98.944h19\
+.12L396.64,333.6\
+64z\x22/>\x0d\x0a\x09</g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a</svg>\
+\x0d\x0a\
+\x00\x00\x09\xa1\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Capa_1\x22 xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22 xm\
+lns:xlink=\x22http:\
+//www.w3.org/199\
+9/xlink\x22 x=\x220px\x22\
+ y=\x220px\x22\x0d\x0a\x09 view\
+Box=\x220 0 512 512\
+\x22 style=\x22enable-\
+background:new 0\
+ 0 512 512;\x22 xml\
+:space=\x22preserve\
+\x22>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\x09\
+\x09<path fill=\x22whi\
+te\x22 d=\x22M491.729,\
+112.971L259.261,\
+0.745c-2.061-0.9\
+94-4.461-0.994-6\
+.521,0L20.271,11\
+2.971c-2.592,1.2\
+51-4.239,3.876-4\
+.239,6.754\x0d\x0a\x09\x09\x09v\
+272.549c0,2.878,\
+1.647,5.503,4.23\
+9,6.754l232.468,\
+112.226c1.03,0.4\
+97,2.146,0.746,3\
+.261,0.746s2.23-\
+0.249,3.261-0.74\
+6\x0d\x0a\x09\x09\x09l232.468-1\
+12.226c2.592-1.2\
+51,4.239-3.876,4\
+.239-6.754V119.7\
+26C495.968,116.8\
+46,494.32,114.22\
+3,491.729,112.97\
+1z M256,15.828\x0d\x0a\
+\x09\x09\x09l215.217,103.\
+897l-62.387,30.1\
+18c-0.395-0.301-\
+0.812-0.579-1.27\
+-0.8L193.805,45.\
+853L256,15.828z \
+M176.867,54.333l\
+214.904,103.746\x0d\
+\x0a\x09\x09\x09l-44.015,21.\
+249L132.941,75.6\
+24L176.867,54.33\
+3z M396.799,172.\
+307v78.546l-41.1\
+13,19.848v-78.54\
+6L396.799,172.30\
+7z\x0d\x0a\x09\x09\x09 M480.968\
+,387.568L263.5,4\
+92.55V236.658l51\
+.873-25.042c3.73\
+-1.801,5.294-6.2\
+84,3.493-10.015\x0d\
+\x0a\x09\x09\x09c-1.801-3.72\
+9-6.284-5.295-10\
+.015-3.493L256,2\
+23.623l-20.796-1\
+0.04c-3.731-1.80\
+3-8.214-0.237-10\
+.015,3.493\x0d\x0a\x09\x09\x09c\
+-1.801,3.73-0.23\
+7,8.214,3.493,10\
+.015l19.818,9.56\
+7V492.55L31.032,\
+387.566V131.674l\
+165.6,79.945\x0d\x0a\x09\x09\
+\x09c1.051,0.508,2.\
+162,0.748,3.255,\
+0.748c2.788,0,5.\
+466-1.562,6.759-\
+4.241c1.801-3.73\
+,0.237-8.214-3.4\
+93-10.015l-162.3\
+7-78.386\x0d\x0a\x09\x09\x09l74\
+.505-35.968L340.\
+582,192.52c0.033\
+,0.046,0.07,0.08\
+7,0.104,0.132v89\
+.999c0,2.581,1.3\
+27,4.98,3.513,6.\
+353\x0d\x0a\x09\x09\x09c1.214,0\
+.762,2.599,1.147\
+,3.988,1.147c1.1\
+12,0,2.227-0.247\
+,3.26-0.746l56.1\
+13-27.089c2.592-\
+1.251,4.239-3.87\
+5,4.239-6.754v-9\
+0.495\x0d\x0a\x09\x09\x09l69.16\
+9-33.392V387.568\
+z\x22/>\x0d\x0a\x09</g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\x09\x09\
+<path fill=\x22whit\
+e\x22 d=\x22M92.926,35\
+8.479L58.811,342\
+.01c-3.732-1.803\
+-8.214-0.237-10.\
+015,3.493c-1.801\
+,3.73-0.237,8.21\
+4,3.493,10.015\x0d\x0a\
+\x09\x09\x09l34.115,16.46\
+9c1.051,0.508,2.\
+162,0.748,3.255,\
+0.748c2.788,0,5.\
+466-1.562,6.759-\
+4.241\x0d\x0a\x09\x09\x09C98.22\
+,364.763,96.656,\
+360.281,92.926,3\
+58.479z\x22/>\x0d\x0a\x09</g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\x09<\
+g>\x0d\x0a\x09\x09<path fill\
+=\x22white\x22 d=\x22M124\
+.323,338.042l-65\
+.465-31.604c-3.7\
+31-1.801-8.214-0\
+.237-10.015,3.49\
+4c-1.8,3.73-0.23\
+6,8.214,3.494,10\
+.015\x0d\x0a\x09\x09\x09l65.465\
+,31.604c1.051,0.\
+507,2.162,0.748,\
+3.255,0.748c2.78\
+8,0,5.466-1.562,\
+6.759-4.241\x0d\x0a\x09\x09\x09\
+C129.617,344.326\
+,128.053,339.842\
+,124.323,338.042\
+z\x22/>\x0d\x0a\x09</g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a</g>\x0d\x0a</svg>\x0d\x0a\
+\
+\x00\x00\x07j\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Layer_1\x22 xmln\
+s=\x22http://www.w3\
+.org/2000/svg\x22 x\
+mlns:xlink=\x22http\
+://www.w3.org/19\
+99/xlink\x22 x=\x220px\
+\x22 y=\x220px\x22\x0d\x0a\x09 vie\
+wBox=\x220 0 512 51\
+2\x22 style=\x22enable\
+-background:new \
+0 0 512 512;\x22 xm\
+l:space=\x22preserv\
+e\x22>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\
+\x09\x09<path fill=\x22wh\
+ite\x22 d=\x22M425.298\
+,51.358h-91.455V\
+16.696c0-9.22-7.\
+475-16.696-16.69\
+6-16.696H194.855\
+c-9.22,0-16.696,\
+7.475-16.696,16.\
+696v34.662\x0d\x0a\x09\x09\x09H\
+86.704c-9.22,0-1\
+6.696,7.475-16.6\
+96,16.696v51.357\
+c0,9.22,7.475,16\
+.696,16.696,16.6\
+96h5.072l15.26,3\
+59.906\x0d\x0a\x09\x09\x09c0.37\
+8,8.937,7.735,15\
+.988,16.68,15.98\
+8h264.568c8.946,\
+0,16.302-7.051,1\
+6.68-15.989l15.2\
+59-359.906h5.073\
+\x0d\x0a\x09\x09\x09c9.22,0,16.\
+696-7.475,16.696\
+-16.696V68.054C4\
+41.994,58.832,43\
+4.519,51.358,425\
+.298,51.358z M21\
+1.551,33.391h88.\
+9v17.967h-88.9\x0d\x0a\
+\x09\x09\x09V33.391z M372\
+.283,478.609H139\
+.719l-14.522-342\
+.502h261.606L372\
+.283,478.609z M4\
+08.602,102.715c-\
+15.17,0-296.114,\
+0-305.202,0\x0d\x0a\x09\x09\x09\
+V84.749h305.202V\
+102.715z\x22/>\x0d\x0a\x09</\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\x09\
+<g>\x0d\x0a\x09\x09<path fil\
+l=\x22white\x22 d=\x22M18\
+8.835,187.304c-9\
+.22,0-16.696,7.4\
+75-16.696,16.696\
+v206.714c0,9.22,\
+7.475,16.696,16.\
+696,16.696\x0d\x0a\x09\x09\x09c\
+9.22,0,16.696-7.\
+475,16.696-16.69\
+6V204C205.53,194\
+.779,198.055,187\
+.304,188.835,187\
+.304z\x22/>\x0d\x0a\x09</g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a\x09<g>\
+\x0d\x0a\x09\x09<path fill=\x22\
+white\x22 d=\x22M255.9\
+98,187.304c-9.22\
+,0-16.696,7.475-\
+16.696,16.696v20\
+6.714c0,9.22,7.4\
+74,16.696,16.696\
+,16.696\x0d\x0a\x09\x09\x09c9.2\
+2,0,16.696-7.475\
+,16.696-16.696V2\
+04C272.693,194.7\
+79,265.218,187.3\
+04,255.998,187.3\
+04z\x22/>\x0d\x0a\x09</g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\
+\x09\x09<path fill=\x22wh\
+ite\x22 d=\x22M323.161\
+,187.304c-9.22,0\
+-16.696,7.475-16\
+.696,16.696v206.\
+714c0,9.22,7.475\
+,16.696,16.696,1\
+6.696\x0d\x0a\x09\x09\x09s16.69\
+6-7.475,16.696-1\
+6.696V204C339.85\
+7,194.779,332.38\
+2,187.304,323.16\
+1,187.304z\x22/>\x0d\x0a\x09\
+</g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a</svg>\x0d\x0a\
+\x00\x00\x03`\
+<\
+svg height=\x22411p\
+t\x22 viewBox=\x220 0 \
+411 410\x22 width=\x22\
+411pt\x22 xmlns=\x22ht\
+tp://www.w3.org/\
+2000/svg\x22><path \
+fill=\x22white\x22 d=\x22\
+m211.898438 199.\
+5 17.601562-52.6\
+99219 35.101562 \
+35.097657zm65.70\
+3124-24.398438-4\
+1.300781-41.3007\
+81 133.398438-13\
+3.300781 41.3007\
+81 41.300781zm0 \
+0\x22/><path fill=\x22\
+white\x22 d=\x22m353.1\
+99219 170.5c-1.8\
+59375-.011719-3.\
+644531.722656-4.\
+960938 2.039062-\
+1.316406 1.3125-\
+2.050781 3.10156\
+3-2.039062 4.960\
+938v186.898438c-\
+.015625 18.21875\
+-14.78125 32.984\
+374-33 33h-266.1\
+99219c-18.21875-\
+.015626-32.98046\
+9-14.78125-33-33\
+v-266.199219c.01\
+9531-18.21875 14\
+.78125-32.980469\
+ 33-33h186.89843\
+8c3.867187 0 7-3\
+.132813 7-7 0-3.\
+863281-3.132813-\
+7-7-7h-186.89843\
+8c-25.941406.042\
+969-46.9609375 2\
+1.058593-47 47v2\
+66.199219c.03906\
+25 25.941406 21.\
+058594 46.960937\
+ 47 47h266.19921\
+9c25.941406-.039\
+063 46.960937-21\
+.058594 47-47v-1\
+86.898438c-.0117\
+19-3.863281-3.13\
+6719-6.988281-7-\
+7zm0 0\x22/></svg>\
+\x00\x00\x09\x1a\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Layer_1\x22 xmln\
+s=\x22http://www.w3\
+.org/2000/svg\x22 x\
+mlns:xlink=\x22http\
+://www.w3.org/19\
+99/xlink\x22 x=\x220px\
+\x22 y=\x220px\x22\x0d\x0a\x09 vie\
+wBox=\x220 0 321.06\
+8 321.068\x22 style\
+=\x22enable-backgro\
+und:new 0 0 321.\
+068 321.068;\x22 xm\
+l:space=\x22preserv\
+e\x22>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\x0a\
+\x09\x09<path fill=\x22wh\
+ite\x22 d=\x22M160.427\
+,160.535c-44.267\
+,0-80.213,36.053\
+-80.213,80.32s35\
+.947,80.213,80.2\
+13,80.213s80.213\
+-36.053,80.213-8\
+0.32\x0d\x0a\x09\x09\x09C240.64\
+1,196.482,204.69\
+4,160.535,160.42\
+7,160.535z M160.\
+427,307.628c-36.\
+907,0-66.88-29.9\
+73-66.88-66.88\x0d\x0a\
+\x09\x09\x09c0-36.907,29.\
+973-66.88,66.88-\
+66.88s66.88,30.0\
+8,66.88,66.88C22\
+7.307,277.655,19\
+7.334,307.628,16\
+0.427,307.628z\x22/\
+>\x0d\x0a\x09</g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a\x09<g>\x0d\x0a\x09\x09<re\
+ct fill=\x22white\x22 \
+x=\x22153.708\x22 y=\x221\
+91.788\x22 width=\x221\
+3.333\x22 height=\x228\
+1.707\x22/>\x0d\x0a\x09</g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a\x09<g>\
+\x0d\x0a\x09\x09<polygon fil\
+l=\x22white\x22 points\
+=\x22190.401,234.02\
+8 160.427,264.00\
+2 130.454,234.02\
+8 121.068,243.52\
+2 160.427,282.88\
+2 199.787,243.52\
+2 \x09\x09\x22/>\x0d\x0a\x09</g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a\x09<g>\x0d\
+\x0a\x09\x09<path fill=\x22w\
+hite\x22 d=\x22M275.62\
+8,97.708c2.773-8\
+.64,3.84-17.6,3.\
+307-26.773c-2.34\
+7-38.827-36.907-\
+70.613-77.013-70\
+.933\x0d\x0a\x09\x09\x09c-32.53\
+3-0.213-61.76,19\
+.52-73.28,48.427\
+c-11.947-9.387-2\
+7.307-13.973-42.\
+88-12.48c-22.187\
+,2.027-41.6,16.8\
+53-49.387,37.76\x0d\
+\x0a\x09\x09\x09c-3.413,9.28\
+-4.373,18.773-2.\
+667,28.267c-20.3\
+73,9.6-33.707,29\
+.867-33.707,52.1\
+6c0,31.253,23.89\
+3,54.187,57.28,5\
+5.467\x0d\x0a\x09\x09\x09c7.253\
+,11.2,21.12,16.5\
+33,31.68,17.6l1.\
+387-13.12c-6.507\
+-0.747-18.773-4.\
+373-23.04-13.76l\
+-1.813-3.947h-5.\
+44\x0d\x0a\x09\x09\x09c-27.627,\
+0-46.827-17.387-\
+46.827-42.24c0-1\
+8.56,12.267-35.4\
+13,30.4-41.813l5\
+.973-2.133l-1.70\
+7-6.08\x0d\x0a\x09\x09\x09c-2.4\
+53-8.64-2.133-17\
+.28,0.96-25.707c\
+5.973-16.107,20.\
+907-27.52,38.293\
+-29.12c15.253-1.\
+387,30.08,4.587,\
+39.68,15.893l8.6\
+4,10.24\x0d\x0a\x09\x09\x09l2.9\
+87-13.12c6.507-2\
+8.587,32.853-48.\
+96,63.467-48.853\
+c33.173,0.213,61\
+.867,26.453,63.7\
+87,58.347\x0d\x0a\x09\x09\x09c0\
+.64,9.813-1.173,\
+19.413-5.227,28.\
+48l-3.84,8.533l9\
+.387,0.853c23.78\
+7,2.24,41.813,21\
+.333,41.813,44.3\
+73\x0d\x0a\x09\x09\x09c0,11.627\
+-7.253,29.44-23.\
+04,41.067c-10.66\
+7,7.893-29.013,1\
+5.467-56,7.147l-\
+3.947,12.8c32.32\
+,9.92,54.72,0.53\
+3,67.84-9.173\x0d\x0a\x09\
+\x09\x09c19.627-14.507\
+,28.373-36.48,28\
+.373-51.84C321.0\
+68,126.828,302.0\
+81,103.895,275.6\
+28,97.708z\x22/>\x0d\x0a\x09\
+</g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a<g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a</svg>\x0d\x0a\
+\x00\x00\x07\xfd\
+<\
+?xml version=\x221.\
+0\x22?>\x0a<svg xmlns=\
+\x22http://www.w3.o\
+rg/2000/svg\x22 wid\
+th=\x22512\x22 height=\
+\x22512\x22 viewBox=\x220\
+ 0 128 128\x22><g><\
+path fill=\x22white\
+\x22 d=\x22M121.693,29\
+.624H84.358V13.8\
+18a1.75,1.75,0,0\
+,0-1.75-1.75H45.\
+392a1.75,1.75,0,\
+0,0-1.75,1.75V29\
+.624H6.307a1.749\
+,1.749,0,0,0-1.7\
+5,1.75v82.808a1.\
+75,1.75,0,0,0,1.\
+75,1.75H121.693a\
+1.75,1.75,0,0,0,\
+1.75-1.75V31.374\
+A1.749,1.749,0,0\
+,0,121.693,29.62\
+4ZM47.142,15.568\
+H80.858V29.624H7\
+6.831v-8.4a1.749\
+,1.749,0,0,0-1.7\
+5-1.75H52.919a1.\
+749,1.749,0,0,0-\
+1.75,1.75v8.4H47\
+.142Zm7.527,14.0\
+56V22.973H73.331\
+v6.651Zm-46.612,\
+3.5H119.943V52.8\
+35H8.057ZM99.3,5\
+6.335h3.435v9.4H\
+99.3Zm-74.029,0H\
+28.7v9.4H25.268Z\
+m-17.211,56.1v-5\
+6.1H21.768V67.48\
+a1.749,1.749,0,0\
+,0,1.75,1.75h6.9\
+35a1.749,1.749,0\
+,0,0,1.75-1.75V5\
+6.335H95.8V67.48\
+a1.749,1.749,0,0\
+,0,1.75,1.75h6.9\
+35a1.749,1.749,0\
+,0,0,1.75-1.75V5\
+6.335h13.711v56.\
+1Z\x22/><path fill=\
+\x22white\x22  d=\x22M82.\
+231,81.674A11.09\
+4,11.094,0,0,0,8\
+4.25,68.69a1.75,\
+1.75,0,0,0-2.792\
+-.433L75.6,74.11\
+4l-1.667.114.113\
+-1.667L79.9,66.7\
+a1.75,1.75,0,0,0\
+-.433-2.792A11.1\
+34,11.134,0,0,0,\
+63.938,77.72l-3.\
+3,3.3L45.857,66.\
+243a1.75,1.75,0,\
+0,0-2.474,2.475L\
+58.161,83.5,43.8\
+56,97.8a4.6,4.6,\
+0,0,0,6.5,6.5l11\
+.37-11.371a6.058\
+,6.058,0,0,0,.92\
+1,1.222L72.8,104\
+.307a6.126,6.126\
+,0,0,0,8.647,0h0\
+a6.123,6.123,0,0\
+,0,0-8.648L71.3,\
+85.51a6.092,6.09\
+2,0,0,0-1.223-.9\
+21l.366-.366A11.\
+085,11.085,0,0,0\
+,82.231,81.674ZM\
+67.262,79.346a1.\
+75,1.75,0,0,0,.3\
+17-2.041A7.637,7\
+.637,0,0,1,75.42\
+,66.238L71.108,7\
+0.55a1.755,1.755\
+,0,0,0-.508,1.11\
+8l-.294,4.322a1.\
+75,1.75,0,0,0,.5\
+08,1.357,1.721,1\
+.721,0,0,0,1.357\
+.508l4.322-.293a\
+1.756,1.756,0,0,\
+0,1.118-.509l4.3\
+12-4.312a7.637,7\
+.637,0,0,1-11.06\
+7,7.841,1.747,1.\
+747,0,0,0-2.041.\
+317l-2.927,2.928\
+a6.085,6.085,0,0\
+,0-1.8.649l-.979\
+-.979ZM47.885,10\
+1.831a1.1,1.1,0,\
+0,1-1.554-1.555l\
+14.305-14.3.979.\
+979a6.081,6.081,\
+0,0,0-.649,1.8Zm\
+31.086-3.7a2.615\
+,2.615,0,0,1-3.7\
+,3.7L65.125,91.6\
+83a2.615,2.615,0\
+,0,1,3.7-3.7Z\x22/>\
+<path fill=\x22whit\
+e\x22 d=\x22M37.722,46\
+.339a1.75,1.75,0\
+,0,0-1.75-1.75H1\
+7.748a1.75,1.75,\
+0,0,0,0,3.5H35.9\
+72A1.75,1.75,0,0\
+,0,37.722,46.339\
+Z\x22/><path fill=\x22\
+white\x22 d=\x22M44.1,\
+48.089h3.408a1.7\
+5,1.75,0,0,0,0-3\
+.5H44.1a1.75,1.7\
+5,0,0,0,0,3.5Z\x22/\
+></g></svg>\x0a\
+\x00\x00\x025\
+<\
+svg id=\x22Capa_1\x22 \
+enable-backgroun\
+d=\x22new 0 0 551.1\
+3 551.13\x22 height\
+=\x22512\x22 viewBox=\x22\
+0 0 551.13 551.1\
+3\x22 width=\x22512\x22 x\
+mlns=\x22http://www\
+.w3.org/2000/svg\
+\x22><path fill=\x22wh\
+ite\x22 d=\x22m465.016\
+ 172.228h-51.668\
+v34.446h34.446v3\
+10.011h-344.457v\
+-310.011h34.446v\
+-34.446h-51.669c\
+-9.52 0-17.223 7\
+.703-17.223 17.2\
+23v344.456c0 9.5\
+2 7.703 17.223 1\
+7.223 17.223h378\
+.902c9.52 0 17.2\
+23-7.703 17.223-\
+17.223v-344.456c\
+0-9.52-7.703-17.\
+223-17.223-17.22\
+3z\x22/><path fill=\
+\x22white\x22 d=\x22m258.\
+342 65.931v244.0\
+8h34.446v-244.08\
+l73.937 73.937 2\
+4.354-24.354-115\
+.514-115.514-115\
+.514 115.514 24.\
+354 24.354z\x22/></\
+svg>\
+\x00\x00\x05!\
+<\
+svg height=\x22512\x22\
+ viewBox=\x220 0 12\
+8 128\x22 width=\x2251\
+2\x22 xmlns=\x22http:/\
+/www.w3.org/2000\
+/svg\x22><g><path f\
+ill=\x22white\x22 d=\x22m\
+109.057 112.206-\
+14.7-25.03-13.98\
+2-23.823v-28.1h1\
+.75a8.25 8.25 0 \
+0 0 0-16.5h-1.75\
+v-8.006a10.762 1\
+0.762 0 0 0 -10.\
+75-10.747h-11.25\
+a10.762 10.762 0\
+ 0 0 -10.75 10.7\
+5v8.009h-1.75a8.\
+25 8.25 0 0 0 0 \
+16.5h1.75v28.1l-\
+14.616 24.888-14\
+.066 23.959a10.4\
+83 10.483 0 0 0 \
+9.04 15.794h72.0\
+34a10.483 10.483\
+ 0 0 0 9.04-15.7\
+91zm-57.932-101.\
+459a7.258 7.258 \
+0 0 1 7.25-7.25h\
+11.25a7.258 7.25\
+8 0 0 1 7.25 7.2\
+5v8.009h-25.75zm\
+-10 16.259a4.756\
+ 4.756 0 0 1 4.7\
+5-4.75h36.25a4.7\
+5 4.75 0 0 1 0 9\
+.5h-36.25a4.756 \
+4.756 0 0 1 -4.7\
+5-4.75zm9.408 38\
+.307a1.751 1.751\
+ 0 0 0 .592-1.31\
+3v-28.744h25.75v\
+28.744a1.751 1.7\
+51 0 0 0 .592 1.\
+313l11.815 20.12\
+4a51.936 51.936 \
+0 0 0 -25.821 1.\
+585 48.409 48.40\
+9 0 0 1 -26.263 \
+1zm49.484 59.187\
+h-72.034a6.984 6\
+.984 0 0 1 -6.02\
+2-10.519l13.387-\
+22.8a51.914 51.9\
+14 0 0 0 29.189-\
+.824 48.461 48.4\
+61 0 0 1 27.17-.\
+787l14.332 24.41\
+2a6.984 6.984 0 \
+0 1 -6.022 10.51\
+9z\x22/><path fill=\
+\x22white\x22 d=\x22m74.1\
+88 95.75a9.938 9\
+.938 0 1 0 9.937\
+ 9.938 9.949 9.9\
+49 0 0 0 -9.937-\
+9.938zm0 16.375a\
+6.438 6.438 0 1 \
+1 6.437-6.437 6.\
+445 6.445 0 0 1 \
+-6.437 6.437z\x22/>\
+<path fill=\x22whit\
+e\x22 d=\x22m50.531 10\
+0a6.657 6.657 0 \
+1 0 6.657 6.656 \
+6.664 6.664 0 0 \
+0 -6.657-6.656zm\
+0 9.813a3.157 3.\
+157 0 1 1 3.157-\
+3.157 3.16 3.16 \
+0 0 1 -3.157 3.1\
+57z\x22/></g></svg>\
+\
+\x00\x00\x03\xbf\
+<\
+svg id=\x22_x31_px\x22\
+ enable-backgrou\
+nd=\x22new 0 0 24 2\
+4\x22 height=\x22512\x22 \
+viewBox=\x220 0 24 \
+24\x22 width=\x22512\x22 \
+xmlns=\x22http://ww\
+w.w3.org/2000/sv\
+g\x22><path fill=\x22w\
+hite\x22 d=\x22m23.5 2\
+1h-23c-.276 0-.5\
+-.224-.5-.5s.224\
+-.5.5-.5h23c.276\
+ 0 .5.224.5.5s-.\
+224.5-.5.5z\x22/><p\
+ath fill=\x22white\x22\
+ d=\x22m21.5 21c-.2\
+76 0-.5-.224-.5-\
+.5v-9c0-.276.224\
+-.5.5-.5s.5.224.\
+5.5v9c0 .276-.22\
+4.5-.5.5z\x22/><pat\
+h fill=\x22white\x22 d\
+=\x22m2.5 21c-.276 \
+0-.5-.224-.5-.5v\
+-11.5c0-1.103.89\
+7-2 2-2h2.5c.276\
+ 0 .5.224.5.5s-.\
+224.5-.5.5h-2.5c\
+-.551 0-1 .449-1\
+ 1v11.5c0 .276-.\
+224.5-.5.5z\x22/><p\
+ath fill=\x22white\x22\
+ d=\x22m14 13c-.13 \
+0-.258-.051-.354\
+-.146l-4.5-4.5c-\
+.195-.195-.195-.\
+512 0-.707l4.5-4\
+.5c.143-.143.358\
+-.186.545-.108s.\
+309.259.309.461v\
+2.5h6c1.378 0 2.\
+5-1.122 2.5-2.5 \
+0-.276.224-.5.5-\
+.5s.5.224.5.5v1c\
+0 3.033-2.467 5.\
+5-5.5 5.5h-4v2.5\
+c0 .202-.122.385\
+-.309.462-.062.0\
+26-.127.038-.191\
+.038zm-3.793-5 3\
+.293 3.293v-1.79\
+3c0-.276.224-.5.\
+5-.5h4.5c1.853 0\
+ 3.449-1.126 4.1\
+37-2.73-.591.458\
+-1.333.73-2.137.\
+73h-6.5c-.276 0-\
+.5-.224-.5-.5v-1\
+.793z\x22/></svg>\
+\x00\x00\x07\xc0\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22iso\
+-8859-1\x22?>\x0d\x0a<!--\
+ Generator: Adob\
+e Illustrator 19\
+.0.0, SVG Export\
+ Plug-In . SVG V\
+ersion: 6.00 Bui\
+ld 0)  -->\x0d\x0a<svg\
+ version=\x221.1\x22 i\
+d=\x22Capa_1\x22 xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22 xm\
+lns:xlink=\x22http:\
+//www.w3.org/199\
+9/xlink\x22 x=\x220px\x22\
+ y=\x220px\x22\x0d\x0a\x09 view\
+Box=\x220 0 412.72 \
+412.72\x22 style=\x22e\
+nable-background\
+:new 0 0 412.72 \
+412.72;\x22 xml:spa\
+ce=\x22preserve\x22>\x0d\x0a\
+<g>\x0d\x0a\x09<g>\x0d\x0a\x09\x09<pa\
+th fill=\x22white\x22 \
+d=\x22M404.72,82.94\
+4c-0.027,0-0.054\
+,0-0.08,0h0h-27.\
+12v-9.28c0.146-3\
+.673-2.23-6.974-\
+5.76-8\x0d\x0a\x09\x09\x09c-18.\
+828-4.934-38.216\
+-7.408-57.68-7.3\
+6c-32,0-75.6,7.2\
+-107.84,40c-32-3\
+3.12-75.92-40-10\
+7.84-40\x0d\x0a\x09\x09\x09c-19\
+.464-0.048-38.85\
+2,2.426-57.68,7.\
+36c-3.53,1.026-5\
+.906,4.327-5.76,\
+8v9.2H8c-4.418,0\
+-8,3.582-8,8v255\
+.52c0,4.418,3.58\
+2,8,8,8\x0d\x0a\x09\x09\x09c1.3\
+74-0.004,2.724-0\
+.362,3.92-1.04c0\
+.8-0.4,80.8-44.1\
+6,192.48-16h1.2h\
+0.72c0.638,0.077\
+,1.282,0.077,1.9\
+2,0\x0d\x0a\x09\x09\x09c112-28.\
+4,192,15.28,192.\
+48,16c2.475,1.42\
+9,5.525,1.429,8,\
+0c2.46-1.42,3.98\
+3-4.039,4-6.88V9\
+0.944\x0d\x0a\x09\x09\x09C412.7\
+2,86.526,409.139\
+,82.944,404.72,8\
+2.944z M16,333.6\
+64V98.944h19.12v\
+200.64c-0.05,4.4\
+18,3.491,8.04,7.\
+909,8.09\x0d\x0a\x09\x09\x09c0.\
+432,0.005,0.864-\
+0.025,1.291-0.09\
+c16.55-2.527,33.\
+259-3.864,50-4c2\
+3.19-0.402,46.28\
+3,3.086,68.32,10\
+.32\x0d\x0a\x09\x09\x09C112.875\
+,307.886,62.397,\
+314.688,16,333.6\
+64z M94.32,287.6\
+64c-14.551,0.033\
+-29.085,0.968-43\
+.52,2.8V79.984\x0d\x0a\
+\x09\x09\x09c15.576-3.47,\
+31.482-5.241,47.\
+44-5.28c29.92,0,\
+71.2,6.88,99.84,\
+39.2l0.24,199.28\
+C181.68,302.304,\
+149.2,287.664,94\
+.32,287.664z\x0d\x0a\x09\x09\
+\x09 M214.32,113.90\
+4c28.64-32,69.92\
+-39.2,99.84-39.2\
+c15.957,0.047,31\
+.863,1.817,47.44\
+,5.28v210.48\x0d\x0a\x09\x09\
+\x09c-14.354-1.849-\
+28.808-2.811-43.\
+28-2.88c-54.56,0\
+-87.12,14.64-104\
+,25.52V113.904z \
+M396.64,333.664\x0d\
+\x0a\x09\x09\x09c-46.496-19.\
+028-97.09-25.831\
+-146.96-19.76c22\
+.141-7.26,45.344\
+-10.749,68.64-10\
+.32c16.846,0.094\
+,33.663,1.404,50\
+.32,3.92\x0d\x0a\x09\x09\x09c4.\
+368,0.663,8.447-\
+2.341,9.11-6.709\
+c0.065-0.427,0.0\
+95-0.859,0.09-1.\
+291V98.944h19.12\
+L396.64,333.664z\
+\x22/>\x0d\x0a\x09</g>\x0d\x0a</g>\
+\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\
+\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</g\
+>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<g\
+>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a</\
+g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a<\
+g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a<\
+/g>\x0d\x0a<g>\x0d\x0a</g>\x0d\x0a\
+<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\x0a\
+</g>\x0d\x0a<g>\x0d\x0a</g>\x0d\
+\x0a<g>\x0d\x0a</g>\x0d\x0a<g>\x0d\
+\x0a</g>\x0d\x0a</svg>\x0d\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0f\
+\x094\x18\xa6\
+\x00i\
+\x00c\x00o\x00n\x00l\x00i\x00c\x00e\x00n\x00s\x00e\x00.\x00p\x00d\x00f\
+\x00\x12\
+\x0f\xa9\x0bg\
+\x00c\
+\x00m\x00a\x00k\x00e\x00b\x00u\x00i\x00l\x00d\x00t\x00o\x00o\x00l\x00.\x00s\x00v\
+\x00g\
+\x00\x0c\
+\x02\xe6\xcb\xc7\
+\x00b\
+\x00i\x00n\x00a\x00r\x00i\x00e\x00s\x00.\x00s\x00v\x00g\
+\x00\x0d\
+\x0a\xa8\x0f\x87\
+\x00b\
+\x00u\x00i\x00l\x00d\x00a\x00b\x00l\x00e\x00.\x00s\x00v\x00g\
+\x00\x0a\
+\x09\xb2jG\
+\x00c\
+\x00a\x00n\x00c\x00e\x00l\x00.\x00s\x00v\x00g\
+\x00\x09\
+\x0c\x0d\x82g\
+\x00c\
+\x00r\x00u\x00i\x00z\x00.\x00p\x00n\x00g\
+\x00\x19\
+\x0c'\xfc\x07\
+\x00c\
+\x00m\x00a\x00k\x00e\x00b\x00u\x00i\x00l\x00d\x00t\x00o\x00o\x00l\x00v\x00e\x00r\
+\x00b\x00o\x00s\x00e\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x04RN'\
+\x00e\
+\x00d\x00i\x00t\x00a\x00b\x00l\x00e\x00.\x00s\x00v\x00g\
+\x00\x16\
+\x07v\xc7\xe6\
+\x00i\
+\x00c\x00o\x00n\x00l\x00i\x00c\x00e\x00n\x00s\x00e\x00_\x00c\x00r\x00u\x00i\x00s\
+\x00e\x00.\x00p\x00d\x00f\
+\x00\x14\
+\x02\x00:\xc7\
+\x00r\
+\x00e\x00m\x00o\x00v\x00e\x00c\x00m\x00a\x00k\x00e\x00c\x00a\x00c\x00h\x00e\x00.\
+\x00s\x00v\x00g\
+\x00\x04\
+\x00\x04\xa8\x8b\
+\x00D\
+\x00a\x00r\x00k\
+\x00\x05\
+\x00R\xfd\xf4\
+\x00L\
+\x00i\x00g\x00h\x00t\
+\x00\x0b\
+\x07<\xae\xe7\
+\x00p\
+\x00a\x00c\x00k\x00a\x00g\x00e\x00.\x00s\x00v\x00g\
+\x00\x11\
+\x0f\xbb\xbfG\
+\x00r\
+\x00e\x00m\x00o\x00v\x00e\x00p\x00a\x00c\x00k\x00a\x00g\x00e\x00.\x00s\x00v\x00g\
+\
+\x00\x0a\
+\x08\xad\x0b\xa7\
+\x00c\
+\x00r\x00e\x00a\x00t\x00e\x00.\x00s\x00v\x00g\
+\x00\x0b\
+\x08\xcf\xef\x87\
+\x00i\
+\x00n\x00s\x00t\x00a\x00l\x00l\x00.\x00s\x00v\x00g\
+\x00\x09\
+\x00'\x89G\
+\x00b\
+\x00u\x00i\x00l\x00d\x00.\x00s\x00v\x00g\
+\x00\x11\
+\x05\x0bkG\
+\x00e\
+\x00x\x00p\x00o\x00r\x00t\x00p\x00a\x00c\x00k\x00a\x00g\x00e\x00.\x00s\x00v\x00g\
+\
+\x00\x0f\
+\x02\xbdE\xc7\
+\x00t\
+\x00e\x00s\x00t\x00p\x00a\x00c\x00k\x00a\x00g\x00e\x00.\x00s\x00v\x00g\
+\x00\x0b\
+\x09V\xd4\x07\
+\x00i\
+\x00m\x00p\x00o\x00r\x00t\x00s\x00.\x00s\x00v\x00g\
+\x00\x0a\
+\x08\x9b\x17G\
+\x00s\
+\x00o\x00u\x00r\x00c\x00e\x00.\x00s\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0b\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0c\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01V\x00\x04\x00\x00\x00\x01\x00\x02\x96M\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x00^\x00\x04\x00\x00\x00\x01\x00\x01\x88e\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x01\xbe\xc6\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01$\x00\x00\x00\x00\x00\x01\x00\x01\xc5\x04\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x01\xa4M\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x00|\x00\x00\x00\x00\x00\x01\x00\x01\x89\xc9\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x01\xa9\xc1\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x00\xce\x00\x04\x00\x00\x00\x01\x00\x01\xb0\xc4\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x004\x00\x04\x00\x00\x00\x01\x00\x01zc\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01\x84\x00\x02\x00\x00\x00\x09\x00\x00\x00\x17\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01\x92\x00\x02\x00\x00\x00\x09\x00\x00\x00\x0e\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x02\x1c\x00\x00\x00\x00\x00\x01\x00\x02\xc1;\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x5c\x00\x00\x00\x00\x00\x01\x00\x02\xcb&\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x024\x00\x00\x00\x00\x00\x01\x00\x02\xc9\x07\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01\xa2\x00\x00\x00\x00\x00\x01\x00\x02\xa4O\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x9c\x00\x00\x00\x00\x00\x01\x00\x02\xd3\xb3\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x02\xb5\x07\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x00\x00\x00\x00\x00\x00\x01\x00\x02\xb8Q\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x80\x00\x00\x00\x00\x00\x01\x00\x02\xd0$\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x01\x00\x02\xad\xcd\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x1c\x00\x00\x00\x00\x00\x01\x00\x02\xf8\xff\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x5c\x00\x00\x00\x00\x00\x01\x00\x03\x039\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x024\x00\x00\x00\x00\x00\x01\x00\x03\x01\x00\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01\xa2\x00\x00\x00\x00\x00\x01\x00\x02\xdbj\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x9c\x00\x00\x00\x00\x00\x01\x00\x03\x0c!\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x02\xec}\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x00\x00\x00\x00\x00\x00\x01\x00\x02\xef\xe1\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x02\x80\x00\x00\x00\x00\x00\x01\x00\x03\x08^\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x01\x00\x02\xe5\x0f\
+\x00\x00\x01\x9bx\xdf\x9b\xd8\
+"
+
+
+def qInitResources():
+    QtCore.qRegisterResourceData(
+        0x03, qt_resource_struct, qt_resource_name, qt_resource_data
+    )
+
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(
+        0x03, qt_resource_struct, qt_resource_name, qt_resource_data
+    )
+
+
+qInitResources()
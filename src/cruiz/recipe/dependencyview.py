@@ -4,34 +4,343 @@
 
 from __future__ import annotations
 
+import itertools
+import math
 import typing
 
-from PySide6 import QtSvg, QtSvgWidgets, QtWidgets
+from PySide6 import QtCore, QtGui, QtSvg, QtWidgets
 
-from cruiz.svggraph import DependenciesToDigraph, DigraphToSVG, SVGScene
+from cruiz.layeredgraph import LayeredGraphScene, LayoutGenerator
+from cruiz.settings.managers.graphvizpreferences import GraphVizSettingsReader
+from cruiz.svggraph import SVGGenerator, SVGScene
+
+from cruizlib.graph.cache import LRUCache
+from cruizlib.graph.detail import reduce_graph
 
 if typing.TYPE_CHECKING:
+    from cruiz.layeredgraph import GraphDrawing
+
+    from cruizlib.graph.detail import ReducedGraph
     from cruizlib.interop.dependencygraph import DependencyGraph
 
 
+# edge length in pixels of the cached raster tiles, and how many are kept
+TILE_SIZE = 256
+TILE_CACHE_CAPACITY = 192
+ZOOM_STEP = 1.25
+# most paths listed between packages, as there may be exponentially many
+MAXIMUM_PATHS_LISTED = 100
+
+
+def _message_scene(text: str) -> QtWidgets.QGraphicsScene:
+    scene = QtWidgets.QGraphicsScene()
+    scene.addText(text)
+    return scene
+
+
 class DependencyView(QtWidgets.QGraphicsView):
-    """View of the dependencies."""
+    """
+    View of the dependencies.
+
+    Graphs are drawn with the built-in layout, unless GraphViz is preferred.
+    If GraphViz fails, the built-in layout is used instead.
+
+    Subtrees may be collapsed, by double clicking their root node, and build
+    requirements grouped into one node, from the context menu.
+
+    Graphs are rasterised in tiles, cached per zoom level, and only tiles
+    visible in the viewport are drawn. The scene of the graph is not shown
+    directly, so that panning and zooming large graphs does not visit every
+    item. Zoom with Ctrl and the mouse wheel.
+    """
+
+    visualisation_failed = QtCore.Signal(str)
+
+    def __init__(self, parent: typing.Optional[QtWidgets.QWidget] = None) -> None:
+        """Initialise a DependencyView."""
+        super().__init__(parent)
+        self._svg_generator = SVGGenerator(self)
+        self._svg_generator.generated.connect(self._on_svg_generated)
+        self._svg_generator.failed.connect(self._on_svg_failed)
+        self._layout_generator = LayoutGenerator(self)
+        self._layout_generator.generated.connect(self._on_layout_generated)
+        self._request: typing.Optional[typing.Tuple[DependencyGraph, str, bool]] = None
+        self._depgraph: typing.Optional[DependencyGraph] = None
+        self._reduced: typing.Optional[ReducedGraph] = None
+        # references of collapsed nodes, so that they survive regeneration
+        self._collapsed: typing.Set[str] = set()
+        self._group_build_requirements = False
+        # highlighted node ids, and (parent, child) edges, of the original graph
+        self._highlighted_nodes: typing.Set[int] = set()
+        self._highlighted_edges: typing.Set[typing.Tuple[int, int]] = set()
+        self._fills: typing.Dict[int, QtGui.QColor] = {}
+        self._graph_scene: typing.Optional[
+            typing.Union[LayeredGraphScene, SVGScene]
+        ] = None
+        self._tiles: LRUCache[QtGui.QPixmap] = LRUCache(capacity=TILE_CACHE_CAPACITY)
+        self.setTransformationAnchor(
+            QtWidgets.QGraphicsView.ViewportAnchor.AnchorUnderMouse
+        )
 
     def clear(self) -> None:
         """Clear the contents of the view."""
-        self.setScene(None)
+        self._svg_generator.cancel()
+        self._layout_generator.cancel()
+        self._depgraph = None
+        self._reduced = None
+        self._show(None)
 
-    def visualise(self, depgraph: DependencyGraph, rankdir: int) -> None:
-        """Visualise the dependency graph."""
+    def visualise(
+        self, depgraph: DependencyGraph, rankdir: int, flipped_edges: bool = False
+    ) -> None:
+        """Visualise the dependency graph, in the background."""
         if not rankdir:
             rank_dir = "LR"
         else:
             assert rankdir == 1
             rank_dir = "TB"
-        digraph = DependenciesToDigraph(depgraph, rank_dir)
-        svg = DigraphToSVG(digraph)
-        self._scene = SVGScene(QtSvg.QSvgRenderer(svg.svg))
-        self.setScene(self._scene)
+        if depgraph is not self._depgraph:
+            self._highlighted_nodes = set()
+            self._highlighted_edges = set()
+            self._fills = {}
+        self._depgraph = depgraph
+        self._request = (depgraph, rank_dir, flipped_edges)
+        self._show(_message_scene("Generating visualisation..."))
+        self._generate()
+
+    def _generate(self) -> None:
+        assert self._request is not None
+        depgraph, rank_dir, flipped_edges = self._request
+        self._svg_generator.cancel()
+        self._layout_generator.cancel()
+        collapsed = {
+            node.node_id for node in depgraph.nodes if node.reference in self._collapsed
+        }
+        if collapsed or self._group_build_requirements:
+            self._reduced = reduce_graph(
+                depgraph, collapsed, self._group_build_requirements
+            )
+            depgraph = self._reduced.graph
+        else:
+            self._reduced = None
+        with GraphVizSettingsReader() as settings:
+            use_graphviz = settings.use_graphviz.resolve()
+        if use_graphviz:
+            self._svg_generator.generate(depgraph, rank_dir, flipped_edges)
+        else:
+            self._layout_generator.generate(
+                depgraph, rank_dir, flipped_edges, self.font()
+            )
+
+    def _show(self, scene: typing.Optional[QtWidgets.QGraphicsScene]) -> None:
+        self._graph_scene = None
+        self._tiles = LRUCache(capacity=TILE_CACHE_CAPACITY)
+        self._scene = scene
+        self.setScene(scene)
+
+    def _show_graph(
+        self, graph_scene: typing.Union[LayeredGraphScene, SVGScene]
+    ) -> None:
+        # an empty scene of the same extent is viewed, and the graph drawn as tiles
+        self._show(QtWidgets.QGraphicsScene(graph_scene.sceneRect()))
+        self._graph_scene = graph_scene
+        graph_scene.changed.connect(self._on_graph_scene_changed)
+
+    def _on_graph_scene_changed(self) -> None:
+        assert self._graph_scene is not None
+        self._tiles = LRUCache(capacity=TILE_CACHE_CAPACITY)
+        self.setSceneRect(self._graph_scene.sceneRect())
+        self.viewport().update()
+
+    def _on_svg_generated(self, svg: bytes) -> None:
+        self._show_graph(SVGScene(QtSvg.QSvgRenderer(svg)))
+
+    def _on_svg_failed(self, message: str) -> None:
+        self.visualisation_failed.emit(f"{message}\nUsing the built-in layout instead")
+        if self._request is not None:
+            depgraph = (
+                self._reduced.graph if self._reduced is not None else self._request[0]
+            )
+            self._layout_generator.generate(
+                depgraph, self._request[1], self._request[2], self.font()
+            )
+
+    def _on_layout_generated(self, drawing: GraphDrawing) -> None:
+        scene = LayeredGraphScene(
+            drawing, self._reduced.hidden_counts if self._reduced is not None else None
+        )
+        scene.setFont(self.font())
+        scene.node_activated.connect(self._on_node_activated)
+        self._show_graph(scene)
+        self._apply_highlight()
+
+    def highlight(
+        self,
+        node_ids: typing.AbstractSet[int],
+        edges: typing.AbstractSet[typing.Tuple[int, int]] = frozenset(),
+    ) -> None:
+        """
+        Highlight nodes, and (parent, child) edges, by their id in the graph.
+
+        Highlighting is only drawn with the built-in layout.
+        """
+        self._highlighted_nodes = set(node_ids)
+        self._highlighted_edges = set(edges)
+        self._apply_highlight()
+
+    def fill(self, colours: typing.Mapping[int, QtGui.QColor]) -> None:
+        """
+        Fill nodes with colours, by their id in the graph.
+
+        Fills are only drawn with the built-in layout.
+        """
+        self._fills = dict(colours)
+        self._apply_highlight()
+
+    def _apply_highlight(self) -> None:
+        if not isinstance(self._graph_scene, LayeredGraphScene):
+            return
+        node_ids = self._highlighted_nodes
+        edges = self._highlighted_edges
+        fills = self._fills
+        if self._reduced is not None:
+            new_id_of = {
+                member: new_id
+                for new_id, members in enumerate(self._reduced.members)
+                for member in members
+            }
+            node_ids = {new_id_of[n] for n in node_ids if n in new_id_of}
+            edges = {
+                (new_id_of[parent], new_id_of[child])
+                for parent, child in edges
+                if parent in new_id_of and child in new_id_of
+            }
+            fills = {
+                new_id_of[node_id]: colour
+                for node_id, colour in fills.items()
+                if node_id in new_id_of
+            }
+        self._graph_scene.highlight(node_ids, edges)
+        self._graph_scene.fill(fills)
+
+    def _on_node_activated(self, node_id: int) -> None:
+        if self._depgraph is None:
+            return
+        if self._reduced is not None:
+            if node_id == self._reduced.group_id:
+                self._group_build_requirements = False
+                self._generate()
+                return
+            node_id = self._reduced.members[node_id][0]
+        reference = self._depgraph.node(node_id).reference
+        if reference in self._collapsed:
+            self._collapsed.remove(reference)
+        elif self._depgraph.child_ids(node_id):
+            self._collapsed.add(reference)
+        else:
+            return
+        self._generate()
+
+    def _toggle_group_build_requirements(self, checked: bool) -> None:
+        self._group_build_requirements = checked
+        self._generate()
+
+    def _expand_all(self) -> None:
+        self._collapsed.clear()
+        self._generate()
+
+    def contextMenuEvent(self, event: QtGui.QContextMenuEvent) -> None:
+        """Override the context menu, to change the level of detail."""
+        if self._depgraph is None:
+            super().contextMenuEvent(event)
+            return
+        menu = QtWidgets.QMenu(self)
+        group_action = menu.addAction("Group build requirements")
+        group_action.setCheckable(True)
+        group_action.setChecked(self._group_build_requirements)
+        group_action.toggled.connect(self._toggle_group_build_requirements)
+        expand_action = menu.addAction("Expand all")
+        expand_action.setEnabled(bool(self._collapsed))
+        expand_action.triggered.connect(self._expand_all)
+        menu.addSeparator()
+        menu.addAction("Reset zoom", self.resetTransform)
+        menu.exec_(event.globalPos())
+
+    def mouseDoubleClickEvent(self, event: QtGui.QMouseEvent) -> None:
+        """Override the double click, to activate the graph beneath it."""
+        if self._graph_scene is not None and self._graph_scene.activate(
+            self.mapToScene(event.position().toPoint())
+        ):
+            event.accept()
+            return
+        super().mouseDoubleClickEvent(event)
+
+    def viewportEvent(self, event: QtCore.QEvent) -> bool:
+        """Override viewport events, to show tooltips of the graph."""
+        if event.type() == QtCore.QEvent.Type.ToolTip and self._graph_scene is not None:
+            help_event = typing.cast("QtGui.QHelpEvent", event)
+            for item in self._graph_scene.items(self.mapToScene(help_event.pos())):
+                if item.toolTip():
+                    QtWidgets.QToolTip.showText(
+                        help_event.globalPos(), item.toolTip(), self
+                    )
+                    return True
+            QtWidgets.QToolTip.hideText()
+            event.ignore()
+            return True
+        return super().viewportEvent(event)
+
+    def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
+        """Override the wheel event, to zoom while Ctrl is held."""
+        if event.modifiers() & QtCore.Qt.KeyboardModifier.ControlModifier:
+            steps = event.angleDelta().y() / 120
+            if steps:
+                factor = ZOOM_STEP**steps
+                self.scale(factor, factor)
+            event.accept()
+            return
+        super().wheelEvent(event)
+
+    def drawBackground(
+        self,
+        painter: QtGui.QPainter,
+        rect: typing.Union[QtCore.QRectF, QtCore.QRect],
+    ) -> None:
+        """Override the background, to draw the graph from cached tiles."""
+        scene = self._graph_scene
+        if scene is None:
+            super().drawBackground(painter, rect)
+            return
+        scale = self.transform().m11()
+        tile_extent = TILE_SIZE / scale
+        first_column = math.floor(rect.left() / tile_extent)
+        last_column = math.floor(rect.right() / tile_extent)
+        first_row = math.floor(rect.top() / tile_extent)
+        last_row = math.floor(rect.bottom() / tile_extent)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                source = QtCore.QRectF(
+                    column * tile_extent, row * tile_extent, tile_extent, tile_extent
+                )
+                key = f"{scale!r}:{column}:{row}"
+                tile = self._tiles.get(key)
+                if tile is None:
+                    tile = self._render_tile(scene, source)
+                    self._tiles.put(key, tile)
+                painter.drawPixmap(source, tile, QtCore.QRectF(tile.rect()))
+
+    def _render_tile(
+        self,
+        scene: typing.Union[LayeredGraphScene, SVGScene],
+        source: QtCore.QRectF,
+    ) -> QtGui.QPixmap:
+        ratio = self.devicePixelRatioF()
+        tile = QtGui.QPixmap(math.ceil(TILE_SIZE * ratio), math.ceil(TILE_SIZE * ratio))
+        tile.setDevicePixelRatio(ratio)
+        tile_painter = QtGui.QPainter(tile)
+        scene.render(tile_painter, QtCore.QRectF(0, 0, TILE_SIZE, TILE_SIZE), source)
+        tile_painter.end()
+        return tile
 
 
 class InverseDependencyViewDialog(QtWidgets.QDialog):
@@ -45,15 +354,38 @@ class InverseDependencyViewDialog(QtWidgets.QDialog):
         """Initialise an InverseDependencyViewDialog."""
         super().__init__(parent)
         self.setWindowTitle(f"What uses {depgraph.root.name}")
+        self._view = DependencyView(self)
+        QtWidgets.QVBoxLayout(self).addWidget(self._view)
+        self._view.visualise(depgraph, 0, flipped_edges=True)
+
+    def done(self, result: int) -> None:
+        """Override the dialog's done, to cancel any outstanding generation."""
+        self._view.clear()
+        super().done(result)
+
+
+class DependencyPathsDialog(QtWidgets.QDialog):
+    """List of the paths between packages in a dependency graph."""
 
-        # TODO: should this be in cruiz.svggraph to isolate the SVG code?
-        digraph = DependenciesToDigraph(depgraph, "LR", flipped_edges=True)
-        svg = DigraphToSVG(digraph)
-        self._renderer = QtSvg.QSvgRenderer(svg.svg)
-        item = QtSvgWidgets.QGraphicsSvgItem()
-        item.setSharedRenderer(self._renderer)
-        self._scene = QtWidgets.QGraphicsScene()
-        self._scene.addItem(item)
-        view = QtWidgets.QGraphicsView(self._scene)
-
-        QtWidgets.QVBoxLayout(self).addWidget(view)
+    def __init__(
+        self,
+        title: str,
+        depgraph: DependencyGraph,
+        paths: typing.Iterator[typing.List[int]],
+        parent: typing.Optional[QtWidgets.QWidget] = None,
+    ) -> None:
+        """Initialise a DependencyPathsDialog, listing paths of node ids."""
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        paths_list = QtWidgets.QListWidget(self)
+        QtWidgets.QVBoxLayout(self).addWidget(paths_list)
+        # one more than listed is generated, to know whether there are more
+        listed = list(itertools.islice(paths, MAXIMUM_PATHS_LISTED + 1))
+        for path in listed[:MAXIMUM_PATHS_LISTED]:
+            paths_list.addItem(
+                " -> ".join(depgraph.node(node_id).reference for node_id in path)
+            )
+        if len(listed) > MAXIMUM_PATHS_LISTED:
+            paths_list.addItem(
+                f"Only the first {MAXIMUM_PATHS_LISTED} paths are listed"
+            )
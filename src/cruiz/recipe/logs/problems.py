@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+"""Recipe problems window."""
+
+from __future__ import annotations
+
+import typing
+
+from PySide6 import QtCore, QtWidgets
+
+if typing.TYPE_CHECKING:
+    from cruiz.model.problemsmodel import ProblemsModel
+
+
+class RecipeProblemsWidget(QtWidgets.QTableView):
+    """QTableView representing the problems found in command output."""
+
+    # Diagnostic, occurrence
+    jump_to_log = QtCore.Signal(object, int)
+
+    def __init__(
+        self,
+        model: ProblemsModel,
+        parent: typing.Optional[QtWidgets.QWidget] = None,
+    ) -> None:
+        """Initialise a RecipeProblemsWidget."""
+        super().__init__(parent)
+        self._problems_model = model
+        self.setModel(model)
+        self.setSelectionBehavior(
+            QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setWordWrap(False)
+        self.verticalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.activated.connect(self._on_activated)
+        self.clicked.connect(self._on_activated)
+
+    def _on_activated(self, index: QtCore.QModelIndex) -> None:
+        diagnostic, occurrence = self._problems_model.diagnostic(index.row())
+        self.jump_to_log.emit(diagnostic, occurrence)
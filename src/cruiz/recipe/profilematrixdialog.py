@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+
+"""Dependency graph profile matrix dialog."""
+
+from __future__ import annotations
+
+import collections
+import functools
+import typing
+
+from PySide6 import QtCore, QtWidgets
+
+from cruiz.commands.context import ConanContext
+from cruiz.commands.logdetails import LogDetails
+from cruiz.model.graphdiffmodel import DependencyGraphDiffModel
+from cruiz.model.profilematrixmodel import ProfileMatrixModel
+from cruiz.pyside6.recipe_profile_matrix_dialog import Ui_ProfileMatrixDialog
+
+from cruizlib.graph.matrix import (
+    ProfileMatrix,
+    matrix_configurations,
+    parse_option_values,
+)
+
+if typing.TYPE_CHECKING:
+    from cruizlib.graph.matrix import MatrixConfiguration
+    from cruizlib.interop.commandparameters import CommandParameters
+
+
+# default maximum number of dependency graphs computed at the same time
+DEFAULT_PARALLEL_JOBS = 4
+
+
+class ProfileMatrixDialog(QtWidgets.QDialog):
+    """
+    Dialog computing the dependency graph of a recipe for a matrix of configurations.
+
+    Each graph is computed in its own process, with a bounded number of
+    processes running at the same time, and the remainder queued.
+    """
+
+    def __init__(
+        self,
+        cache_name: str,
+        profiles: typing.Sequence[str],
+        current_profile: typing.Optional[str],
+        make_parameters: typing.Callable[[MatrixConfiguration], CommandParameters],
+        parent: QtWidgets.QWidget,
+    ) -> None:
+        """Initialise a ProfileMatrixDialog."""
+        super().__init__(parent)
+        self._ui = Ui_ProfileMatrixDialog()
+        self._ui.setupUi(self)  # type: ignore[no-untyped-call]
+        self._make_parameters = make_parameters
+        for profile in profiles:
+            item = QtWidgets.QListWidgetItem(profile, self._ui.profileMatrixProfiles)
+            item.setCheckState(
+                QtCore.Qt.CheckState.Checked
+                if profile == current_profile
+                else QtCore.Qt.CheckState.Unchecked
+            )
+        self._ui.profileMatrixJobs.setValue(
+            min(DEFAULT_PARALLEL_JOBS, QtCore.QThread.idealThreadCount())
+        )
+        self._run_button = QtWidgets.QPushButton("&Run")
+        self._run_button.clicked.connect(self._run)
+        self._stop_button = QtWidgets.QPushButton("&Stop")
+        self._stop_button.clicked.connect(self._stop)
+        self._stop_button.setEnabled(False)
+        self._ui.profileMatrixButtonBox.addButton(
+            self._run_button, QtWidgets.QDialogButtonBox.ButtonRole.ActionRole
+        )
+        self._ui.profileMatrixButtonBox.addButton(
+            self._stop_button, QtWidgets.QDialogButtonBox.ButtonRole.ActionRole
+        )
+        self._log_details = LogDetails(
+            self._ui.profileMatrixLog, None, True, False, None
+        )
+        self._context = ConanContext(cache_name, self._log_details)
+        self._matrix: typing.Optional[ProfileMatrix] = None
+        self._model: typing.Optional[ProfileMatrixModel] = None
+        self._diff_model: typing.Optional[DependencyGraphDiffModel] = None
+        self._pending: typing.Deque[int] = collections.deque()
+        self._in_flight: typing.Set[int] = set()
+        # results from an earlier run are ignored
+        self._run_count = 0
+
+    def done(self, result: int) -> None:
+        """Override the done method."""
+        if self._context.is_busy:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Profile matrix cannot be closed",
+                "Dependency graphs are still being computed. Stop them first.",
+                QtWidgets.QMessageBox.StandardButton.Ok,
+                QtWidgets.QMessageBox.StandardButton.NoButton,
+            )
+            return
+        self._context.close()
+        super().done(result)
+
+    def _checked_profiles(self) -> typing.List[str]:
+        profiles = self._ui.profileMatrixProfiles
+        return [
+            profiles.item(row).text()
+            for row in range(profiles.count())
+            if profiles.item(row).checkState() == QtCore.Qt.CheckState.Checked
+        ]
+
+    def _run(self) -> None:
+        try:
+            option_values = parse_option_values(self._ui.profileMatrixOptions.text())
+        except ValueError as exc:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Invalid options",
+                str(exc),
+                QtWidgets.QMessageBox.StandardButton.Ok,
+                QtWidgets.QMessageBox.StandardButton.NoButton,
+            )
+            return
+        configurations = matrix_configurations(self._checked_profiles(), option_values)
+        if not configurations:
+            return
+        self._run_count += 1
+        self._matrix = ProfileMatrix(configurations)
+        self._model = ProfileMatrixModel(self._matrix)
+        self._ui.profileMatrixTable.setModel(self._model)
+        self._ui.profileMatrixTable.selectionModel().currentRowChanged.connect(
+            self._on_current_row_changed
+        )
+        self._ui.profileMatrixDiffView.setModel(None)
+        self._pending.extend(range(len(configurations)))
+        self._run_button.setEnabled(False)
+        self._stop_button.setEnabled(True)
+        self._start_pending()
+
+    def _start_pending(self) -> None:
+        assert self._matrix is not None
+        assert self._model is not None
+        jobs = self._ui.profileMatrixJobs.value()
+        while self._pending and len(self._in_flight) < jobs:
+            index = self._pending.popleft()
+            self._in_flight.add(index)
+            self._model.set_status(index, "Computing...")
+            self._context.conancommand(
+                self._make_parameters(self._matrix.configurations[index]),
+                None,
+                functools.partial(self._on_graph_computed, self._run_count, index),
+            )
+        if not self._pending and not self._in_flight:
+            self._run_button.setEnabled(True)
+            self._stop_button.setEnabled(False)
+
+    def _stop(self) -> None:
+        assert self._model is not None
+        for index in list(self._pending) + list(self._in_flight):
+            self._model.set_status(index, "Stopped")
+        self._pending.clear()
+        self._in_flight.clear()
+        self._context.cancel()
+        self._run_button.setEnabled(True)
+        self._stop_button.setEnabled(False)
+
+    def _on_graph_computed(
+        self, run_count: int, index: int, payload: typing.Any, exception: typing.Any
+    ) -> None:
+        if run_count != self._run_count or index not in self._in_flight:
+            return
+        assert self._matrix is not None
+        assert self._model is not None
+        self._in_flight.discard(index)
+        if payload:
+            self._matrix.set_graph(index, payload)
+        else:
+            self._matrix.set_error(index, str(exception))
+        self._model.update_rows()
+        current = self._ui.profileMatrixTable.currentIndex()
+        if current.isValid():
+            self._show_diff(current.row())
+        self._start_pending()
+
+    def _on_current_row_changed(
+        self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex
+    ) -> None:
+        # pylint: disable=unused-argument
+        self._show_diff(current.row())
+
+    def _show_diff(self, row: int) -> None:
+        assert self._matrix is not None
+        diff = self._matrix.diff(row)
+        if diff is None:
+            self._ui.profileMatrixDiffSummary.setText(
+                "Select a computed configuration, other than the first, to show its "
+                "differences from the first configuration"
+            )
+            self._ui.profileMatrixDiffView.setModel(None)
+            return
+        self._ui.profileMatrixDiffSummary.setText(
+            f"{len(diff.changes)} change(s), and {diff.unchanged} unchanged "
+            f"package(s), from {self._matrix.configurations[0]}"
+        )
+        self._diff_model = DependencyGraphDiffModel(diff)
+        self._ui.profileMatrixDiffView.setModel(self._diff_model)
@@ -2,10 +2,12 @@
 
 """Conan recipe widget representation."""
 
+import functools
 import logging
 import os
 import pathlib
 import re
+import time
 import typing
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -17,14 +19,21 @@ import cruiz.revealonfilesystem
 from cruiz.commands.context import ConanContext
 from cruiz.commands.logdetails import LogDetails
 from cruiz.manage_local_cache import ManageLocalCachesDialog
-from cruiz.model.graphaslistmodel import DependenciesListModel, DependenciesTreeModel
+from cruiz.model.graphaslistmodel import (
+    DependenciesFilterProxyModel,
+    DependenciesListModel,
+    DependenciesTreeModel,
+)
+from cruiz.model.graphdiffmodel import CHANGE_COLOURS, DependencyGraphDiffModel
+from cruiz.model.problemsmodel import ProblemsModel
 from cruiz.pyside6.recipe_window import Ui_RecipeWindow
 from cruiz.revealonfilesystem import reveal_on_filesystem
-from cruiz.settings.managers.basesettings import WorkflowCwd
+from cruiz.settings.managers.basesettings import BaseSettings, WorkflowCwd
 from cruiz.settings.managers.fontpreferences import FontSettingsReader, FontUsage
 from cruiz.settings.managers.generalpreferences import GeneralSettingsReader
 from cruiz.settings.managers.namedlocalcache import NamedLocalCacheSettingsReader
 from cruiz.settings.managers.recipe import (
+    LOCKFILE_DIRECTORY_NAME,
     RecipeSettings,
     RecipeSettingsReader,
     RecipeSettingsWriter,
@@ -33,24 +42,44 @@ from cruiz.widgets.util import BlockSignals, clear_widgets_from_layout
 
 import cruizlib.globals
 import cruizlib.workers.api as workers_api
+from cruizlib.commands.buildprogress import BuildProgress, format_duration
+from cruizlib.commands.diagnostics import Diagnostic, DiagnosticSeverity
+from cruizlib.constants import GraphResolutionMode
 from cruizlib.exceptions import RecipeInspectionError
+from cruizlib.graph.cache import DependencyGraphCache, dependency_graph_cache_key
+from cruizlib.graph.diff import DependencyGraphDiff
+from cruizlib.graph.reachability import ReachabilityIndex
+from cruizlib.graph.store import DependencyGraphStore, STORE_DIRECTORY_NAME
 from cruizlib.interop.commandparameters import CommandParameters
-from cruizlib.interop.dependencygraph import dependencygraph_from_node_dependees
+from cruizlib.interop.dependencygraph import DependencyGraph
 from cruizlib.workers.utils.text2html import text_to_html
 
+if typing.TYPE_CHECKING:
+    from cruizlib.graph.matrix import MatrixConfiguration
+
 try:
     import git
 except ImportError as exc:
     print(exc)
 
-from .dependencyview import InverseDependencyViewDialog
+from .dependencyview import DependencyPathsDialog, InverseDependencyViewDialog
 from .expressioneditordialog import ExpressionEditorDialog
 from .findtextdialog import FindTextDialog
+from .logs.problems import RecipeProblemsWidget
+from .profilematrixdialog import ProfileMatrixDialog
 from .recipe import Recipe
 
 
 logger = logging.getLogger(__name__)
 
+# seconds without build progress before the build is reported as stalled
+BUILD_STALL_SECONDS = 30
+# milliseconds to wait for further configuration changes before computing the graph
+DEPENDENCY_GRAPH_DELAY_MS = 500
+# shared by all recipe windows, as the same recipe may be open more than once
+_DEPENDENCY_GRAPH_CACHE = DependencyGraphCache()
+_SPARKLINE_BLOCKS = "\u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
+
 
 class RecipeWidget(QtWidgets.QMainWindow):
     """Widget representing a Conan recipe."""
@@ -281,6 +310,22 @@ class RecipeWidget(QtWidgets.QMainWindow):
         )
         # tabify the docks on the bottom side
         self.tabifyDockWidget(self._ui.conanLogDock, self._ui.conanCommandsDock)
+        # problems extracted from command output
+        self._problems_model = ProblemsModel(self)
+        self._problems_model.rowsInserted.connect(self._update_problems_title)
+        self._problems_model.modelReset.connect(self._update_problems_title)
+        self._problems_dock = QtWidgets.QDockWidget("Problems", self)
+        self._problems_dock.setObjectName("conanProblemsDock")
+        problems_widget = RecipeProblemsWidget(
+            self._problems_model, self._problems_dock
+        )
+        problems_widget.jump_to_log.connect(self._jump_to_log)
+        self._problems_dock.setWidget(problems_widget)
+        self.addDockWidget(
+            QtCore.Qt.DockWidgetArea.BottomDockWidgetArea, self._problems_dock
+        )
+        self.tabifyDockWidget(self._ui.conanCommandsDock, self._problems_dock)
+        self._ui.conanCommandsDock.raise_()
         if cruizlib.globals.CONAN_MAJOR_VERSION > 1:
             self._ui.conanLogDock.hide()
             self._ui.conanLocalWorkflowDock.hide()
@@ -305,6 +350,36 @@ class RecipeWidget(QtWidgets.QMainWindow):
         self._ui.dependency_rankdir.currentIndexChanged.connect(
             self._visualise_dependencies
         )
+        self._ui.dependency_refresh.clicked.connect(self._refresh_dependency_graph)
+        self._ui.dependency_matrix.clicked.connect(self._open_dependency_matrix)
+        self._ui.dependency_lock.toggled.connect(self._on_dependency_lock_toggled)
+        self._ui.dependency_resolution.currentTextChanged.connect(
+            self._on_dependency_resolution_changed
+        )
+        self._ui.dependency_structure_only.toggled.connect(
+            self._on_dependency_structure_only_toggled
+        )
+        self._ui.dependencyView.visualisation_failed.connect(
+            self._on_dependency_visualisation_failed
+        )
+        self.dependency_graph: typing.Optional[DependencyGraph] = None
+        self._dependency_reachability: typing.Optional[ReachabilityIndex] = None
+        self._dependency_graph_diff: typing.Optional[DependencyGraphDiff] = None
+        # the last graph with binaries analysed, rather than just its structure
+        self._dependency_graph_analysed: typing.Optional[DependencyGraph] = None
+        self._dependency_graph_key: typing.Optional[str] = None
+        self._dependency_graph_store = DependencyGraphStore(
+            BaseSettings.data_directory(STORE_DIRECTORY_NAME)
+        )
+        self._dependency_graph_restored = False
+        # results from an earlier, superseded, computation are ignored
+        self._dependency_graph_generation = 0
+        self._dependency_graph_timer = QtCore.QTimer(self)
+        self._dependency_graph_timer.setSingleShot(True)
+        self._dependency_graph_timer.setInterval(DEPENDENCY_GRAPH_DELAY_MS)
+        self._dependency_graph_timer.timeout.connect(
+            self._generate_dependency_graph_after_delay
+        )
 
         # busy icon
         self._busy_icon = QtWidgets.QProgressBar(self)
@@ -312,6 +387,16 @@ class RecipeWidget(QtWidgets.QMainWindow):
         self._busy_icon.setMinimum(0)
         self._busy_icon.setMaximum(1)
 
+        # build progress, from Ninja or Makefile output
+        self._build_progress_bar = QtWidgets.QProgressBar(self)
+        self._build_progress_bar.setMinimumWidth(300)
+        self._build_progress_bar.hide()
+        self._build_progress: typing.Optional[BuildProgress] = None
+        self._build_progress_time = 0.0
+        self._build_progress_timer = QtCore.QTimer(self)
+        self._build_progress_timer.setInterval(1000)
+        self._build_progress_timer.timeout.connect(self._refresh_build_progress)
+
         # colours
         self._update_widget_colours_from_settings()
 
@@ -328,6 +413,10 @@ class RecipeWidget(QtWidgets.QMainWindow):
         self._ui.dependenciesPackageList.customContextMenuRequested.connect(
             self._dependency_list_context_menu
         )
+        self._dependencies_filter_model = DependenciesFilterProxyModel(self)
+        self._ui.dependenciesFilter.textChanged.connect(
+            self._dependencies_filter_model.set_filter_text
+        )
         self._ui.behaviourToolbar.profile_changed.connect(
             self._generate_dependency_graph_from_profile_change
         )
@@ -342,8 +431,10 @@ class RecipeWidget(QtWidgets.QMainWindow):
             self.combined_output_and_error_logs,
             use_batching,
             self._ui.conanLog,
+            self._problems_model,
         )
         self.log_details.start()
+        self.log_details.build_progress.connect(self._on_build_progress)
         self.recipe = Recipe(
             path,
             uuid,
@@ -355,6 +446,28 @@ class RecipeWidget(QtWidgets.QMainWindow):
 
         self._create_statusbar()
         self._load_local_workflow_dock()
+        if cruizlib.globals.CONAN_MAJOR_VERSION > 1:
+            with RecipeSettingsReader.from_recipe(self.recipe) as settings:
+                locked = bool(settings.lockfile.resolve())
+                resolution_mode = settings.graph_resolution_mode.resolve()
+                structure_only = settings.graph_structure_only.resolve()
+            with BlockSignals(self._ui.dependency_lock) as blocked_widget:
+                assert isinstance(blocked_widget, QtWidgets.QToolButton)
+                blocked_widget.setChecked(locked)
+            with BlockSignals(self._ui.dependency_resolution) as blocked_widget:
+                assert isinstance(blocked_widget, QtWidgets.QComboBox)
+                if resolution_mode:
+                    blocked_widget.setCurrentText(resolution_mode)
+            with BlockSignals(self._ui.dependency_structure_only) as blocked_widget:
+                assert isinstance(blocked_widget, QtWidgets.QToolButton)
+                blocked_widget.setChecked(structure_only)
+        else:
+            # lockfiles are only written by Conan 2 lock create
+            self._ui.dependency_lock.hide()
+            # and remotes are only chosen by Conan 2 lock create
+            self._ui.dependency_resolution.hide()
+            # and binaries are always analysed by Conan 1 lock create
+            self._ui.dependency_structure_only.hide()
 
         cruiz.globals.get_main_window().theme_changed.connect(self._on_theme_change)
 
@@ -387,6 +500,7 @@ class RecipeWidget(QtWidgets.QMainWindow):
             )
             event.ignore()
             return
+        self._dependency_graph_timer.stop()
         self._dependency_generate_log.stop()
         self._dependency_generate_context.close()
         self.log_details.stop()
@@ -570,6 +684,7 @@ class RecipeWidget(QtWidgets.QMainWindow):
 
     def _create_statusbar(self) -> None:
         self._ui.statusbar.addWidget(self._busy_icon)
+        self._ui.statusbar.addWidget(self._build_progress_bar)
         if self._git_repository:
             self._git_workspace_label.setContextMenuPolicy(
                 QtCore.Qt.ContextMenuPolicy.CustomContextMenu
@@ -658,7 +773,7 @@ class RecipeWidget(QtWidgets.QMainWindow):
     def _on_configuration_update(self) -> None:
         self._on_local_workflow_update()
         attributes = self.get_recipe_attributes()
-        self._generate_dependency_graph(attributes)
+        self._dependency_graph_timer.start()
         self._update_window_title(attributes)
 
     def _changed_local_workflow_cwd(self, index: int) -> None:
@@ -1119,18 +1234,30 @@ class RecipeWidget(QtWidgets.QMainWindow):
 
     def _generate_dependency_graph_from_profile_change(self, profile: str) -> None:
         # pylint: disable=unused-argument
+        self._dependency_graph_timer.start()
+
+    def _generate_dependency_graph_after_delay(self) -> None:
+        # coalesces all of the changes made during the delay
         attributes = self.get_recipe_attributes()
         self._generate_dependency_graph(attributes)
 
-    def _generate_dependency_graph(
-        self, recipe_attributes: typing.Dict[str, str]
-    ) -> None:
-        # reset views
-        self._ui.configurePackageId.setText("Calculating...")
-        # https://stackoverflow.com/questions/46630185/qt-remove-model-from-view
-        self._ui.dependenciesPackageList.setModel(None)
-        self._ui.dependencyView.clear()
-        # calculate lock file
+    def _refresh_dependency_graph(self) -> None:
+        attributes = self.get_recipe_attributes()
+        self._generate_dependency_graph(attributes, use_cache=False)
+
+    def _dependency_graph_profile_path(
+        self, profile: typing.Optional[str]
+    ) -> typing.Optional[pathlib.Path]:
+        if not profile:
+            return None
+        profile_path = pathlib.Path(profile)
+        if profile_path.is_absolute():
+            return profile_path
+        return self.recipe.context.profiles_dir() / profile_path
+
+    def _dependency_graph_parameters(
+        self, recipe_attributes: typing.Dict[str, str], use_lockfile: bool = True
+    ) -> typing.Tuple[CommandParameters, typing.Dict[str, str]]:
         params = CommandParameters("lock create", workers_api.lockcreate.invoke)
         params.recipe_path = self.recipe.path
         params.name = recipe_attributes.get("name")
@@ -1147,23 +1274,192 @@ class RecipeWidget(QtWidgets.QMainWindow):
                 for keyvalue in attributes["extra_config_options"].split(","):
                     option_name, option_value = keyvalue.split("=", maxsplit=1)
                     params.add_option(None, option_name, option_value)
+            lockfile = settings.lockfile.resolve()
+            resolution_mode = settings.graph_resolution_mode.resolve()
+            params.graph_structure_only = settings.graph_structure_only.resolve()
+        if not resolution_mode:
+            with GeneralSettingsReader() as general_settings:
+                resolution_mode = general_settings.graph_resolution_mode.resolve()
+        params.graph_resolution_mode = GraphResolutionMode(resolution_mode)
+        if lockfile:
+            # the lockfile is rewritten each time, but only read when not refreshing
+            lockfile_path = pathlib.Path(lockfile)
+            params.lockfile_out = lockfile_path
+            if use_lockfile and lockfile_path.is_file():
+                params.lockfile = lockfile_path
+        return params, attributes
+
+    def _dependency_matrix_parameters(
+        self, configuration: "MatrixConfiguration"
+    ) -> CommandParameters:
+        params, _ = self._dependency_graph_parameters(self.get_recipe_attributes())
+        params.profile = configuration.profile
+        # the recipe's lockfile is only for its own configuration
+        params.lockfile_out = None
+        # configurations are compared by their package_ids
+        params.graph_structure_only = False
+        for key, value in configuration.options:
+            params.add_option(params.name, key, value)
+        return params
+
+    def _on_dependency_lock_toggled(self, checked: bool) -> None:
+        lockfile = BaseSettings.data_directory(LOCKFILE_DIRECTORY_NAME) / (
+            f"{self._dependency_graph_store_id}.lock"
+        )
+        settings = RecipeSettings()
+        if checked:
+            settings.lockfile = str(lockfile)
+        else:
+            settings.lockfile = None
+            lockfile.unlink(missing_ok=True)
+        RecipeSettingsWriter.from_recipe(self.recipe).sync(settings)
+        self._generate_dependency_graph(self.get_recipe_attributes())
+
+    def _on_dependency_resolution_changed(self, text: str) -> None:
+        settings = RecipeSettings()
+        # the first item uses the general preference
+        settings.graph_resolution_mode = (
+            text if self._ui.dependency_resolution.currentIndex() else None
+        )
+        RecipeSettingsWriter.from_recipe(self.recipe).sync(settings)
+        self._generate_dependency_graph(self.get_recipe_attributes())
+
+    def _on_dependency_structure_only_toggled(self, checked: bool) -> None:
+        settings = RecipeSettings()
+        settings.graph_structure_only = checked
+        RecipeSettingsWriter.from_recipe(self.recipe).sync(settings)
+        self._generate_dependency_graph(self.get_recipe_attributes())
+
+    def _open_dependency_matrix(self) -> None:
+        with RecipeSettingsReader.from_recipe(self.recipe) as settings:
+            current_profile = settings.profile.resolve()
+        profiles = [
+            str(profile_path)
+            for profile_path, _ in self.recipe.context.get_list_of_profiles()
+        ]
+        dialog = ProfileMatrixDialog(
+            self.recipe.context.cache_name,
+            profiles,
+            current_profile,
+            self._dependency_matrix_parameters,
+            self,
+        )
+        dialog.exec_()
+
+    def _generate_dependency_graph(
+        self, recipe_attributes: typing.Dict[str, str], use_cache: bool = True
+    ) -> None:
+        # supersede any pending or computing graph
+        self._dependency_graph_timer.stop()
+        self._dependency_generate_context.cancel()
+        self._dependency_graph_generation += 1
+        # reset views
+        self._ui.configurePackageId.setText("Calculating...")
+        # https://stackoverflow.com/questions/46630185/qt-remove-model-from-view
+        self._ui.dependenciesPackageList.setModel(None)
+        self._ui.dependencyView.clear()
+        # calculate lock file
+        params, attributes = self._dependency_graph_parameters(
+            recipe_attributes, use_lockfile=use_cache
+        )
+        self._dependency_graph_key = dependency_graph_cache_key(
+            params,
+            self._dependency_graph_profile_path(params.profile),
+            attributes,
+            ".".join(str(c) for c in cruizlib.globals.CONAN_VERSION_COMPONENTS),
+            self.recipe.context.cache_name,
+        )
+        if params.graph_resolution_mode == GraphResolutionMode.ALWAYS_UPDATE:
+            # remotes are checked every time, although the result is still cached
+            use_cache = False
+        if use_cache:
+            cached_graph = _DEPENDENCY_GRAPH_CACHE.get(self._dependency_graph_key)
+            if cached_graph is not None:
+                self._on_dependency_graph_generated(cached_graph, None)
+                return
+            if not self._dependency_graph_restored:
+                self._restore_dependency_graph()
+        else:
+            _DEPENDENCY_GRAPH_CACHE.discard(self._dependency_graph_key)
         self._dependency_generate_context.conancommand(
             params,
             None,
-            self._on_dependency_graph_generated,
+            functools.partial(
+                self._on_dependency_graph_computed, self._dependency_graph_generation
+            ),
+            functools.partial(
+                self._on_dependency_graph_structure_computed,
+                self._dependency_graph_generation,
+            ),
         )
 
+    @property
+    def _dependency_graph_store_id(self) -> str:
+        return self.recipe.uuid.toString(QtCore.QUuid.StringFormat.WithoutBraces)
+
+    def _restore_dependency_graph(self) -> None:
+        # show the graph from the last session immediately, while it is revalidated
+        self._dependency_graph_restored = True
+        persisted = self._dependency_graph_store.load(self._dependency_graph_store_id)
+        if persisted is None:
+            return
+        key, graph = persisted
+        status = "(revalidating...)" if key == self._dependency_graph_key else "(stale)"
+        self._on_dependency_graph_generated(graph, None, status)
+
+    def _on_dependency_graph_computed(
+        self, generation: int, payload: typing.Any, exception: typing.Any
+    ) -> None:
+        if generation != self._dependency_graph_generation:
+            return
+        if payload and self._dependency_graph_key:
+            _DEPENDENCY_GRAPH_CACHE.put(self._dependency_graph_key, payload)
+            self._dependency_graph_store.save(
+                self._dependency_graph_store_id, self._dependency_graph_key, payload
+            )
+        self._on_dependency_graph_generated(payload, exception)
+
+    def _on_dependency_graph_structure_computed(
+        self, generation: int, payload: typing.Any
+    ) -> None:
+        if generation != self._dependency_graph_generation:
+            return
+        # shown while binaries are analysed, which replaces it when complete
+        self.dependency_graph = payload
+        self._ui.configurePackageId.setText("Analysing binaries...")
+        # any differences shown are from the previous graph
+        self._clear_dependency_graph_diff(
+            "Comparing with the previous dependency graph, once binaries are analysed"
+        )
+        self._visualise_dependencies(self._ui.dependency_rankdir.currentIndex())
+
     def _on_dependency_graph_generated(
-        self, payload: typing.Any, exception: typing.Any
+        self,
+        payload: typing.Any,
+        exception: typing.Any,
+        status: typing.Optional[str] = None,
     ) -> None:
         if payload:
-            self.dependency_graph = payload
-            self._ui.configurePackageId.setText(self.dependency_graph.root.package_id)
-            try:
-                self._visualise_dependencies(self._ui.dependency_rankdir.currentIndex())
-            except FileNotFoundError as exc:
-                exception = exc
-                # fall through
+            previous = self._dependency_graph_analysed
+            if previous is not None and previous is not payload:
+                if bool(previous.root.package_id) == bool(payload.root.package_id):
+                    # compare with the graph shown before, whether computed, cached
+                    # or persisted from the last session
+                    self._dependency_graph_diff = DependencyGraphDiff(
+                        previous, payload
+                    )
+                else:
+                    # only one of them has package_ids from analysing binaries
+                    self._clear_dependency_graph_diff(
+                        "The previous dependency graph was computed differently, so "
+                        "is not compared with"
+                    )
+            self.dependency_graph = self._dependency_graph_analysed = payload
+            package_id = self.dependency_graph.root.package_id or "(structure only)"
+            self._ui.configurePackageId.setText(
+                f"{package_id} {status}" if status else package_id
+            )
+            self._visualise_dependencies(self._ui.dependency_rankdir.currentIndex())
         if exception:
             if payload is None:
                 self._ui.configurePackageId.setText("Failed")
@@ -1176,17 +1472,58 @@ class RecipeWidget(QtWidgets.QMainWindow):
                 f"Exception raised from running command:<br>" f"{html}<br>"
             )
 
+    def _on_dependency_visualisation_failed(self, message: str) -> None:
+        html = "<font color='red'>"
+        html += text_to_html(message)
+        html += "</font>"
+        self._dependency_generate_log.stderr(
+            f"Unable to visualise the dependency graph:<br>{html}<br>"
+        )
+
     def _visualise_dependencies(self, rank_dir_index: int) -> None:
         if self.dependency_graph is None:
             return
         # list visualisation of dependencies
-        self._dependencies_list_model = DependenciesListModel(self.dependency_graph)
-        self._ui.dependenciesPackageList.setModel(self._dependencies_list_model)
-        # tree visualisation of dependencies (DISABLED)
-        self._dependencies_tree_model = DependenciesTreeModel(self.dependency_graph)
+        self._dependencies_list_model = DependenciesListModel(
+            self.dependency_graph, self
+        )
+        self._dependencies_filter_model.setSourceModel(self._dependencies_list_model)
+        self._ui.dependenciesPackageList.setModel(self._dependencies_filter_model)
+        # tree visualisation of dependencies
+        self._dependencies_tree_model = DependenciesTreeModel(
+            self.dependency_graph, self
+        )
         self._ui.dependenciesPackageTree.setModel(self._dependencies_tree_model)
         # graphical visualisation of dependencies
         self._ui.dependencyView.visualise(self.dependency_graph, rank_dir_index)
+        self._show_dependency_graph_diff()
+
+    def _clear_dependency_graph_diff(self, summary: str) -> None:
+        self._dependency_graph_diff = None
+        self._ui.dependenciesDiffView.setModel(None)
+        self._ui.dependenciesDiffSummary.setText(summary)
+
+    def _show_dependency_graph_diff(self) -> None:
+        diff = self._dependency_graph_diff
+        if diff is None or diff.new is not self.dependency_graph:
+            return
+        self._dependencies_diff_model = DependencyGraphDiffModel(diff)
+        self._ui.dependenciesDiffView.setModel(self._dependencies_diff_model)
+        if diff:
+            summary = (
+                f"{len(diff.changes)} change(s), and {diff.unchanged} unchanged "
+                "package(s), since the previous dependency graph"
+            )
+        else:
+            summary = "No changes since the previous dependency graph"
+        self._ui.dependenciesDiffSummary.setText(summary)
+        self._ui.dependencyView.fill(
+            {
+                change.new_id: CHANGE_COLOURS[change.kind]
+                for change in diff.changes
+                if change.new_id is not None
+            }
+        )
 
     def _set_pane_font(self) -> None:
         with FontSettingsReader(FontUsage.OUTPUT) as settings:
@@ -1229,6 +1566,9 @@ class RecipeWidget(QtWidgets.QMainWindow):
 
     def _command_started(self) -> None:
         self._busy_icon.setMaximum(0)
+        self._build_progress = None
+        self._build_progress_bar.hide()
+        self._build_progress_timer.start()
         self._ui.conanConfigureDock.setEnabled(False)
         self._ui.conanLocalWorkflowDock.setEnabled(False)
         self._ui.behaviourToolbar.setEnabled(False)
@@ -1236,11 +1576,55 @@ class RecipeWidget(QtWidgets.QMainWindow):
 
     def _command_ended(self) -> None:
         self._busy_icon.setMaximum(1)
+        self._build_progress_timer.stop()
         self._ui.conanConfigureDock.setEnabled(True)
         self._ui.conanLocalWorkflowDock.setEnabled(True)
         self._ui.behaviourToolbar.setEnabled(True)
         self._ui.buildFeaturesToolbar.setEnabled(True)
 
+    def _on_build_progress(self, progress: BuildProgress) -> None:
+        self._build_progress = progress
+        self._build_progress_time = time.monotonic()
+        self._refresh_build_progress()
+
+    def _refresh_build_progress(self) -> None:
+        progress = self._build_progress
+        if progress is None:
+            return
+        if progress.is_percentage:
+            text = f"{progress.completed}%"
+            units = "%/s"
+        else:
+            text = f"{progress.completed}/{progress.total}"
+            units = "targets/s"
+        since_update = time.monotonic() - self._build_progress_time
+        if (
+            self._build_progress_timer.isActive()
+            and progress.completed < progress.total
+            and since_update >= BUILD_STALL_SECONDS
+        ):
+            text += f" - no progress for {format_duration(since_update)}"
+        elif progress.rate is not None:
+            text += f" - {progress.rate:.1f} {units}"
+            if progress.eta is not None and progress.completed < progress.total:
+                text += f", ETA {format_duration(progress.eta)}"
+        self._build_progress_bar.setRange(0, progress.total)
+        self._build_progress_bar.setValue(progress.completed)
+        self._build_progress_bar.setFormat(text)
+        if progress.recent_rates:
+            peak = max(progress.recent_rates) or 1.0
+            sparkline = "".join(
+                _SPARKLINE_BLOCKS[
+                    round(rate / peak * (len(_SPARKLINE_BLOCKS) - 1))
+                ]
+                for rate in progress.recent_rates
+            )
+            self._build_progress_bar.setToolTip(
+                f"Recent build rate ({units}):\n{sparkline}\n"
+                f"Elapsed {format_duration(progress.elapsed)}"
+            )
+        self._build_progress_bar.show()
+
     def _pane_context_menu(self, position: QtCore.QPoint) -> None:
         sender_plaintextedit = self.sender()
         assert isinstance(sender_plaintextedit, QtWidgets.QPlainTextEdit)
@@ -1313,6 +1697,43 @@ class RecipeWidget(QtWidgets.QMainWindow):
             pane.moveCursor(QtGui.QTextCursor.MoveOperation.End)
             result = pane.find(pattern, flags)
 
+    def _update_problems_title(self) -> None:
+        errors = self._problems_model.count(DiagnosticSeverity.ERROR)
+        warnings = self._problems_model.count(DiagnosticSeverity.WARNING)
+        if errors or warnings:
+            self._problems_dock.setWindowTitle(
+                f"Problems ({errors} errors, {warnings} warnings)"
+            )
+        else:
+            self._problems_dock.setWindowTitle("Problems")
+
+    def _jump_to_log(self, diagnostic: Diagnostic, occurrence: int) -> None:
+        if diagnostic.is_stderr and not self.combined_output_and_error_logs:
+            pane = self._ui.errorPane
+        else:
+            pane = self._ui.outputPane
+        # spaces are logged as non-breaking spaces
+        expression = QtCore.QRegularExpression(
+            "[ \\x{00a0}]".join(
+                QtCore.QRegularExpression.escape(part)
+                for part in diagnostic.text.split(" ")
+            )
+        )
+        document = pane.document()
+        cursor = QtGui.QTextCursor(document)
+        found = None
+        for _ in range(occurrence + 1):
+            cursor = document.find(expression, cursor)
+            if cursor.isNull():
+                break
+            found = cursor
+        if found is None:
+            return
+        self._ui.pane_tabs.setCurrentIndex(0)
+        pane.setTextCursor(found)
+        pane.ensureCursorVisible()
+        pane.setFocus()
+
     def _dependency_list_context_menu(self, position: QtCore.QPoint) -> None:
         menu = QtWidgets.QMenu(self)
         open_package_dir_action = QtGui.QAction("Open package directory", self)
@@ -1326,6 +1747,25 @@ class RecipeWidget(QtWidgets.QMainWindow):
         what_uses_this_action = QtGui.QAction("What uses this?...", self)
         what_uses_this_action.triggered.connect(self._on_what_uses_this)
         menu.addAction(what_uses_this_action)
+        menu.addSeparator()
+        why_action = QtGui.QAction("Why is this here?", self)
+        why_action.triggered.connect(self._on_highlight_why)
+        menu.addAction(why_action)
+        dependents_action = QtGui.QAction("Highlight all dependents", self)
+        dependents_action.triggered.connect(self._on_highlight_dependents)
+        menu.addAction(dependents_action)
+        dependencies_action = QtGui.QAction("Highlight all dependencies", self)
+        dependencies_action.triggered.connect(self._on_highlight_dependencies)
+        menu.addAction(dependencies_action)
+        paths_action = QtGui.QAction("Highlight paths between selected", self)
+        paths_action.setEnabled(
+            len(self._ui.dependenciesPackageList.selectedIndexes()) == 2
+        )
+        paths_action.triggered.connect(self._on_highlight_paths)
+        menu.addAction(paths_action)
+        clear_highlight_action = QtGui.QAction("Clear highlights", self)
+        clear_highlight_action.triggered.connect(self._on_clear_highlights)
+        menu.addAction(clear_highlight_action)
         menu.exec_(self._ui.dependenciesPackageList.mapToGlobal(position))
 
     def _get_package_directory_of_current_dependency(self) -> pathlib.Path:
@@ -1351,11 +1791,98 @@ class RecipeWidget(QtWidgets.QMainWindow):
         QtWidgets.QApplication.clipboard().setText(os.fspath(directory))
 
     def _on_what_uses_this(self) -> None:
-        index = self._ui.dependenciesPackageList.currentIndex()
-        node = index.data(QtCore.Qt.ItemDataRole.UserRole)
-        new_graph = dependencygraph_from_node_dependees(node)
+        new_graph = self._reachability().dependents_graph(self._current_dependency_id())
         InverseDependencyViewDialog(new_graph).exec_()
 
+    def _reachability(self) -> ReachabilityIndex:
+        # computed on first use, for each graph
+        assert self.dependency_graph is not None
+        if (
+            self._dependency_reachability is None
+            or self._dependency_reachability.graph is not self.dependency_graph
+        ):
+            self._dependency_reachability = ReachabilityIndex(self.dependency_graph)
+        return self._dependency_reachability
+
+    def _current_dependency_id(self) -> int:
+        index = self._ui.dependenciesPackageList.currentIndex()
+        return index.data(QtCore.Qt.ItemDataRole.UserRole).node_id
+
+    def _highlight_dependencies(
+        self,
+        node_ids: typing.Iterable[int],
+        edges: typing.Iterable[typing.Tuple[int, int]] = (),
+    ) -> None:
+        highlighted = set(node_ids)
+        self._dependencies_list_model.highlight(highlighted)
+        self._ui.dependencyView.highlight(highlighted, set(edges))
+
+    def _on_highlight_why(self) -> None:
+        reachability = self._reachability()
+        node_id = self._current_dependency_id()
+        root_id = reachability.graph.root_id
+        self._highlight_dependencies(
+            reachability.between(root_id, node_id),
+            reachability.path_edges(root_id, node_id),
+        )
+        DependencyPathsDialog(
+            f"Why is {reachability.graph.node(node_id).name} here?",
+            reachability.graph,
+            reachability.why(node_id),
+            self,
+        ).exec_()
+
+    def _on_highlight_dependents(self) -> None:
+        reachability = self._reachability()
+        node_id = self._current_dependency_id()
+        dependents = reachability.dependents(node_id)
+        # every parent of a dependent is also a dependent
+        self._highlight_dependencies(
+            [node_id] + dependents,
+            [
+                (parent, child)
+                for child in [node_id] + dependents
+                for parent in reachability.graph.parent_ids(child)
+            ],
+        )
+
+    def _on_highlight_dependencies(self) -> None:
+        reachability = self._reachability()
+        node_id = self._current_dependency_id()
+        dependencies = reachability.dependencies(node_id)
+        # every child of a dependency is also a dependency
+        self._highlight_dependencies(
+            [node_id] + dependencies,
+            [
+                (parent, child)
+                for parent in [node_id] + dependencies
+                for child in reachability.graph.child_ids(parent)
+            ],
+        )
+
+    def _on_highlight_paths(self) -> None:
+        reachability = self._reachability()
+        source_id, target_id = (
+            index.data(QtCore.Qt.ItemDataRole.UserRole).node_id
+            for index in self._ui.dependenciesPackageList.selectedIndexes()
+        )
+        if reachability.depends_on(target_id, source_id):
+            source_id, target_id = target_id, source_id
+        self._highlight_dependencies(
+            {source_id, target_id}.union(reachability.between(source_id, target_id)),
+            reachability.path_edges(source_id, target_id),
+        )
+        DependencyPathsDialog(
+            f"Paths from {reachability.graph.node(source_id).name} to "
+            f"{reachability.graph.node(target_id).name}",
+            reachability.graph,
+            reachability.paths(source_id, target_id),
+            self,
+        ).exec_()
+
+    def _on_clear_highlights(self) -> None:
+        self._highlight_dependencies(())
+
     def _dependents_log_context_menu(self, position: QtCore.QPoint) -> None:
         sender_plaintextedit = self.sender()
         assert isinstance(sender_plaintextedit, QtWidgets.QPlainTextEdit)
@@ -1460,7 +1987,13 @@ class RecipeWidget(QtWidgets.QMainWindow):
         menu.exec_(sender_label.mapToGlobal(position))
 
     def _on_configure_package_id_copy(self) -> None:
-        QtWidgets.QApplication.clipboard().setText(self._ui.configurePackageId.text())
+        graph = self._dependency_graph_analysed
+        if graph is not None and graph is self.dependency_graph:
+            # the label may also describe a restored graph being revalidated
+            package_id = graph.root.package_id
+        else:
+            package_id = self._ui.configurePackageId.text()
+        QtWidgets.QApplication.clipboard().setText(package_id)
 
     def _on_theme_change(self) -> None:
         attributes = self.get_recipe_attributes()
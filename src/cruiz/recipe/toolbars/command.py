@@ -3,6 +3,7 @@
 """Recipe command toolbar."""
 
 import os
+import pathlib
 import typing
 from io import StringIO
 
@@ -394,6 +395,7 @@ class RecipeCommandToolbar(QtWidgets.QToolBar):
         with_force: bool = False,
         with_exclusive_package_folder: bool = False,
         with_options: bool = False,
+        with_lockfile: bool = False,
         v2_omit_test_folder: bool = False,
         v2_need_reference: bool = False,
     ) -> CommandParameters:
@@ -449,6 +451,10 @@ class RecipeCommandToolbar(QtWidgets.QToolBar):
                     fudge_source_folder = False
             if with_profile:
                 params.profile = settings.profile.resolve()
+            if with_lockfile:
+                lockfile = settings.lockfile.resolve()
+                if lockfile and pathlib.Path(lockfile).is_file():
+                    params.lockfile = pathlib.Path(lockfile)
             if with_cwd:
                 workflow_cwd = settings.local_workflow_cwd.resolve()
                 common_subdir = settings.local_workflow_common_subdir.resolve()
@@ -501,6 +507,7 @@ class RecipeCommandToolbar(QtWidgets.QToolBar):
             with_pkgref=True,
             with_profile=True,
             with_options=True,
+            with_lockfile=True,
         )
         if args:
             params.arguments.extend(args)
@@ -520,6 +527,7 @@ class RecipeCommandToolbar(QtWidgets.QToolBar):
             with_profile=True,
             with_install_folder=True,
             with_options=True,
+            with_lockfile=True,
         )
         if args:
             params.arguments.extend(args)
@@ -21,6 +21,7 @@ except ImportError:
 
 import cruizlib.globals
 from cruizlib.interop.packagebinaryparameters import PackageBinaryParameters
+from cruizlib.remote.cache import RemoteQueryKind
 
 with contextlib.suppress(ImportError):
     from cruiz.pyside6.remote_browser_fileview import Ui_remote_browser_fileview
@@ -31,11 +32,20 @@ if typing.TYPE_CHECKING:
     from cruiz.pyside6.remote_browser import Ui_remotebrowser
 
 
+# number of children of a directory added to the tree at a time
+FETCH_BATCH_SIZE = 256
+
+
 class _FileNode:
-    def __init__(self, path: str, parent: typing.Optional[_FileNode]):
+    def __init__(self, path: str, parent: typing.Optional[_FileNode], row: int = 0):
         self.path = path
         self.parent = parent
+        # position of this node among its parent's children
+        self.row = row
         self.children: typing.List[_FileNode] = []
+        self._children_by_path: typing.Dict[str, _FileNode] = {}
+        # number of children added to the model so far
+        self.fetched = 0
         self.is_file = True
         self.link_target: typing.Optional[str] = None
         self.container: typing.Optional[str] = None
@@ -45,12 +55,13 @@ class _FileNode:
 
     def add_child(self, path: str) -> _FileNode:
         """Add a child path."""
-        find = [x for x in self.children if x.path == path]
-        if find:
-            assert len(find) == 1
-            return find[0]
-        node = _FileNode(path, self)
+        try:
+            return self._children_by_path[path]
+        except KeyError:
+            pass
+        node = _FileNode(path, self, len(self.children))
         self.children.append(node)
+        self._children_by_path[path] = node
         return node
 
     def add_tarball(
@@ -60,16 +71,20 @@ class _FileNode:
         tar_node = parent.add_child(tarball_basename)
         tar_node.is_container = True
         tarball_path = directory / tarball_basename
+        # directories already added, by their path in the tarball
+        directories: typing.Dict[str, _FileNode] = {"": tar_node}
+        # a single pass over the member headers
         with tarfile.open(tarball_path, "r") as tar:
             for tarinfo in tar:
-                path = pathlib.PurePosixPath(tarinfo.name)
-                parent = tar_node
-                combined_path = pathlib.PurePosixPath()
-                for part in path.parts:
-                    combined_path /= part
-                    parent = parent.add_child(str(combined_path))
-                    parent.is_file = False
-                    parent.container = tarball_basename
+                dirname, _, basename = tarinfo.name.rpartition("/")
+                parent = directories.get(dirname) or self._add_directories(
+                    dirname, tarball_basename, directories
+                )
+                parent = parent.add_child(
+                    basename if parent is tar_node else f"{parent.path}/{basename}"
+                )
+                parent.is_file = False
+                parent.container = tarball_basename
                 if tarinfo.isfile():
                     parent.is_file = True  # the leaf is a file
                     parent.tar_info = tarinfo
@@ -82,15 +97,34 @@ class _FileNode:
                             f"Unknown entity type for '{tarinfo.name}'"
                         )
 
+    @staticmethod
+    def _add_directories(
+        dirname: str, tarball_basename: str, directories: typing.Dict[str, _FileNode]
+    ) -> _FileNode:
+        parent = directories[""]
+        combined_path = pathlib.PurePosixPath()
+        for part in pathlib.PurePosixPath(dirname).parts:
+            combined_path /= part
+            parent = parent.add_child(str(combined_path))
+            parent.is_file = False
+            parent.container = tarball_basename
+        directories[dirname] = parent
+        return parent
+
     @property
     def child_index(self) -> int:
         """Get the child index of this node in relation to its parent."""
-        if self.parent:
-            return self.parent.children.index(self)
-        return 0
+        return self.row
 
 
 class _PackageBinaryModel(QtCore.QAbstractItemModel):
+    """
+    Qt model of the files in a package binary.
+
+    The children of directories are only added when they are expanded, as
+    packages may contain tens of thousands of files.
+    """
+
     def __init__(self, parent: QtCore.QObject) -> None:
         super().__init__(parent)
         self._root: typing.Optional[_FileNode] = None
@@ -122,7 +156,7 @@ class _PackageBinaryModel(QtCore.QAbstractItemModel):
             return 0
         if parent.isValid():
             node = parent.internalPointer()
-            return len(node.children)
+            return node.fetched
         return 1
 
     def columnCount(self, parent) -> int:  # type: ignore
@@ -132,6 +166,30 @@ class _PackageBinaryModel(QtCore.QAbstractItemModel):
             return 0
         return 1
 
+    def hasChildren(self, parent) -> bool:  # type: ignore
+        """Get whether the index has children, whether fetched or not."""
+        if self._root is None:
+            return False
+        if not parent.isValid():
+            return True
+        return bool(parent.internalPointer().children)
+
+    def canFetchMore(self, parent) -> bool:  # type: ignore
+        """Get whether the index has children not yet fetched."""
+        if not parent.isValid():
+            return False
+        node = parent.internalPointer()
+        return node.fetched < len(node.children)
+
+    def fetchMore(self, parent) -> None:  # type: ignore
+        """Fetch the next batch of children of the index."""
+        node = parent.internalPointer()
+        first = node.fetched
+        last = min(first + FETCH_BATCH_SIZE, len(node.children)) - 1
+        self.beginInsertRows(parent, first, last)
+        node.fetched = last + 1
+        self.endInsertRows()
+
     def parent(self, index) -> QtCore.QModelIndex:  # type: ignore
         """Get the index's parent."""
         if not index.isValid():
@@ -298,29 +356,59 @@ class PackageBinaryPage(Page):
     def showEvent(self, event: QtGui.QShowEvent) -> None:
         """Override the widget's showEvent method."""
         # pylint: disable=unused-argument
+        self._prefetcher.cancel()
         pkgref = self._previous_pkgref
         self._ui.pbinary_pkgref.setText(pkgref)
 
         if self._current_pkgref != pkgref:
-            self._artifact_folder = pathlib.Path(tempfile.mkdtemp(suffix="cruiz"))
             self._model.set(None, None)
             self._enable_progress(True)
             self._ui.pbinary_groupbox.setEnabled(False)
+            if self._revisions_enabled:
+                # a package revision is immutable, so reuse any earlier download
+                cached = self._remote_cache.get(
+                    self._remote_url, RemoteQueryKind.PACKAGE_BINARY, pkgref
+                )
+                if cached is not None and self._is_downloaded(cached.payload):
+                    self._complete(cached.payload, None)
+                    return
+            self._artifact_folder = pathlib.Path(tempfile.mkdtemp(suffix="cruiz"))
             params = PackageBinaryParameters(
                 reference=pkgref,
                 remote_name=self._ui.remote.currentText(),
                 where=self._artifact_folder,
             )
-            self._context.get_package_details(params, self._complete)
+            self._context.get_package_details(params, self._downloaded)
+
+    @staticmethod
+    def _is_downloaded(payload: typing.Any) -> bool:
+        folder = pathlib.Path(payload["folder"])
+        return all((folder / file).exists() for file in payload["files"] or [])
+
+    def _downloaded(self, results: typing.Any, exception: typing.Any) -> None:
+        payload = None
+        if not exception:
+            payload = {"folder": str(self._artifact_folder), "files": results}
+            if self._revisions_enabled:
+                self._remote_cache.put(
+                    self._remote_url,
+                    RemoteQueryKind.PACKAGE_BINARY,
+                    self._previous_pkgref,
+                    payload,
+                )
+        self._complete(payload, exception)
 
-    def _complete(self, results: typing.Any, exception: typing.Any) -> None:
+    def _complete(self, payload: typing.Any, exception: typing.Any) -> None:
         self._enable_progress(False)
         if exception:
             self._log_details.stderr(str(exception))
             return
+        self._artifact_folder = pathlib.Path(payload["folder"])
+        results = payload["files"]
         if results is not None:
             self._model.set(results, self._artifact_folder)
-            self._ui.package_binary.expandAll()
+            # expand the package folder, and the top level of each tarball
+            self._ui.package_binary.expandToDepth(1)
             self._ui.pbinary_groupbox.setEnabled(True)
             self._current_pkgref = self._previous_pkgref
 
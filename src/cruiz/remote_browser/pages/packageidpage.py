@@ -11,159 +11,94 @@ from PySide6 import QtCore, QtGui, QtWidgets
 from cruiz.widgets.util import BlockSignals
 
 from cruizlib.interop.packageidparameters import PackageIdParameters
+from cruizlib.remote.cache import RemoteQueryKind
+from cruizlib.remote.packageidtable import PackageIdTable
+from cruizlib.remote.packagequery import can_query, package_query
 
 from .page import Page
 
 if typing.TYPE_CHECKING:
     from cruiz.pyside6.remote_browser import Ui_remotebrowser
 
+    from cruizlib.remote.packageidtable import PackageIdDetails
+
 
 class _PackageIdModel(QtCore.QAbstractTableModel):
     def __init__(self) -> None:
         super().__init__()
-        self.pids: typing.Optional[
-            typing.List[
-                typing.Dict[
-                    str,
-                    typing.Union[str, bool, typing.Dict[str, str], typing.List[str]],
-                ]
-            ]
-        ] = None
-        self.options: typing.Optional[typing.List[str]] = None
-        self.settings: typing.Optional[typing.List[str]] = None
-        self.options_values: typing.Optional[typing.Dict[str, typing.Set[str]]] = None
-        self.settings_values: typing.Optional[typing.Dict[str, typing.Set[str]]] = None
-
-    def set(
-        self,
-        results: typing.Optional[
-            typing.List[
-                typing.Dict[
-                    str,
-                    typing.Union[str, bool, typing.Dict[str, str], typing.List[str]],
-                ]
-            ]
-        ],
-    ) -> None:
+        self.table: typing.Optional[PackageIdTable] = None
+
+    def set(self, results: typing.Optional[typing.List[PackageIdDetails]]) -> None:
         """Set the package ids into the model."""
         self.beginResetModel()
-        self.pids = results
-        if results is not None:
-            options = set()
-            option_values: typing.Dict[str, typing.Set[str]] = {}
-            settings = set()
-            settings_values: typing.Dict[str, typing.Set[str]] = {}
-            for pid in results:
-                if "options" in pid:
-                    assert isinstance(pid["options"], dict)
-                    for option, value in pid["options"].items():
-                        options.add(option)
-                        if option not in option_values:
-                            option_values[option] = set()
-                        option_values[option].add(value)
-                if "settings" in pid:
-                    assert isinstance(pid["settings"], dict)
-                    for setting, value in pid["settings"].items():
-                        settings.add(setting)
-                        if setting not in settings_values:
-                            settings_values[setting] = set()
-                        settings_values[setting].add(value)
-            self.options = sorted(list(options))
-            self.settings = sorted(list(settings))
-            self.options_values = option_values
-            self.settings_values = settings_values
-        else:
-            self.options = None
-            self.settings = None
-            self.options_values = None
-            self.settings_values = None
+        self.table = PackageIdTable(results) if results is not None else None
         self.endResetModel()
 
+    @property
+    def settings(self) -> typing.List[str]:
+        """Get the names of the settings columns."""
+        return self.table.settings if self.table is not None else []
+
+    @property
+    def options(self) -> typing.List[str]:
+        """Get the names of the options columns."""
+        return self.table.options if self.table is not None else []
+
     def rowCount(self, parent) -> int:  # type: ignore
         """Get the number of rows in the model."""
         if parent.isValid():
             return 0
-        if self.pids is None:
+        if self.table is None:
             return 0
-        return len(self.pids)
+        return len(self.table)
 
     def columnCount(self, parent) -> int:  # type: ignore
         """Get the number of columns in the model."""
         # pylint: disable=unused-argument
-        if self.pids is None:
+        if self.table is None:
             return 0
-        num_cols = 1  # the package id
-        if self.settings:
-            num_cols += len(self.settings)
-        if self.options:
-            num_cols += len(self.options)
-        if "requires" in self.pids[0]:
-            num_cols += 1
-        return num_cols
+        return len(self.table.headers)
 
     def headerData(self, section, orientation, role):  # type: ignore
         """Get the header data of the model."""
         if (
             role == QtCore.Qt.ItemDataRole.DisplayRole
             and orientation == QtCore.Qt.Orientation.Horizontal
+            and self.table is not None
         ):
-            num_settings = len(self.settings) if self.settings else 0
-            num_options = len(self.options) if self.options else 0
-            if not section:
-                return "Package Id"
-            if section >= 1 and section < 1 + num_settings:
-                return self.settings[section - 1]  # type: ignore[index]
-            if section >= 1 + num_settings and section < 1 + num_settings + num_options:
-                index = section - 1 - num_settings
-                return self.options[index]  # type: ignore[index]
-            return "Requires"
+            return self.table.headers[section]
         return None
 
     def data(self, index, role):  # type: ignore
         """Get data from the model."""
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
-            num_settings = len(self.settings) if self.settings else 0
-            num_options = len(self.options) if self.options else 0
-            section = index.column()
-            assert self.pids
-            if not section:
-                return self.pids[index.row()]["id"]
-            if section >= 1 and section < 1 + num_settings:
-                header = self.headerData(  # type: ignore[no-untyped-call]
-                    section,
-                    QtCore.Qt.Orientation.Horizontal,
-                    QtCore.Qt.ItemDataRole.DisplayRole,
-                )
-                try:
-                    return self.pids[index.row()]["settings"][header]
-                except KeyError:
-                    return "-"
-            if section >= 1 + num_settings and section < 1 + num_settings + num_options:
-                header = self.headerData(  # type: ignore[no-untyped-call]
-                    section,
-                    QtCore.Qt.Orientation.Horizontal,
-                    QtCore.Qt.ItemDataRole.DisplayRole,
-                )
-                try:
-                    return self.pids[index.row()]["options"][header]
-                except KeyError:
-                    return "-"
-            value = "\n".join(sorted(self.pids[index.row()]["requires"]))
-            return value
+            assert self.table is not None
+            return self.table.value(index.row(), index.column())
         return None
 
 
 class _FilteringModel(QtCore.QAbstractTableModel):
     def __init__(self) -> None:
         super().__init__()
-        self.filters: typing.List[typing.Tuple[int, str, str]] = []
+        # each filter is the name in package queries (None for the package id),
+        # the key displayed, and the value
+        self.filters: typing.List[typing.Tuple[typing.Optional[str], str, str]] = []
 
-    def add(self, index: int, key: str, value: str) -> None:
+    def add(self, name: typing.Optional[str], key: str, value: str) -> None:
         """Add a filter to the model."""
         self.beginResetModel()
-        self.filters.append((index, key, value))
+        self.filters.append((name, key, value))
         self.endResetModel()
 
+    @property
+    def query_filters(self) -> typing.List[typing.Tuple[str, str]]:
+        """Get the filters of settings and options, that package queries can match."""
+        return [
+            (name, value)
+            for name, _, value in self.filters
+            if name is not None and can_query(value)
+        ]
+
     def remove(self, index: int) -> None:
         """Remove a filter from the model."""
         self.beginResetModel()
@@ -208,7 +143,20 @@ class _PackageIdSortFilterProxyModel(QtCore.QSortFilterProxyModel):
     def __init__(self, model: _PackageIdModel, filtering: _FilteringModel) -> None:
         super().__init__()
         self.setSourceModel(model)
+        self._model = model
         self._filtering = filtering
+        # the rows matching the filters are evaluated together, once per change
+        self._masked_table: typing.Optional[PackageIdTable] = None
+        self._masked_filters: typing.List[typing.Tuple[typing.Optional[str], str]] = []
+        self._matching_rows = b""
+
+    def _matching_rows_of(self, table: PackageIdTable) -> bytes:
+        filters = [(name, value) for name, _, value in self._filtering.filters]
+        if table is not self._masked_table or filters != self._masked_filters:
+            self._matching_rows = table.matching_rows(filters)
+            self._masked_table = table
+            self._masked_filters = filters
+        return self._matching_rows
 
     def filterAcceptsRow(
         self,
@@ -216,14 +164,26 @@ class _PackageIdSortFilterProxyModel(QtCore.QSortFilterProxyModel):
         source_parent: typing.Union[QtCore.QModelIndex, QtCore.QPersistentModelIndex],
     ) -> bool:
         """Override the model's filterAcceptRow method."""
-        for column, _, value in self._filtering.filters:
-            index = self.sourceModel().index(source_row, column, source_parent)
-            if value != self.sourceModel().data(
-                index, QtCore.Qt.ItemDataRole.DisplayRole
-            ):
-                return False
+        table = self._model.table
+        if (
+            self._filtering.filters
+            and table is not None
+            and not self._matching_rows_of(table)[source_row]
+        ):
+            return False
         return super().filterAcceptsRow(source_row, source_parent)
 
+    def lessThan(
+        self,
+        source_left: typing.Union[QtCore.QModelIndex, QtCore.QPersistentModelIndex],
+        source_right: typing.Union[QtCore.QModelIndex, QtCore.QPersistentModelIndex],
+    ) -> bool:
+        """Override the model's lessThan method, to compare the encoded values."""
+        table = self._model.table
+        assert table is not None
+        sort_keys = table.sort_keys(source_left.column())
+        return sort_keys[source_left.row()] < sort_keys[source_right.row()]
+
 
 class PackageIdPage(Page):
     """Remote browser page for displaying package ids."""
@@ -232,6 +192,10 @@ class PackageIdPage(Page):
         """Set up the UI for the page."""
         self._base_setup(self_ui, 2)
         self._current_pkgref: typing.Optional[str] = None
+        # filters matched by the remote, rather than the client, for the current
+        # package ids
+        self._queried_filters: typing.List[typing.Tuple[str, str]] = []
+        self._query: typing.Optional[str] = None
         self._model = _PackageIdModel()
         self._filtering_model = _FilteringModel()
         self._sorting_model = _PackageIdSortFilterProxyModel(
@@ -293,6 +257,7 @@ class PackageIdPage(Page):
     def showEvent(self, event: QtGui.QShowEvent) -> None:
         """Override the widget's showEvent method."""
         # pylint: disable=unused-argument
+        self._prefetcher.cancel()
         self._ui.pid_pkgref.setText(self._previous_pkgref)
         self._compute()
 
@@ -302,9 +267,15 @@ class PackageIdPage(Page):
             self._ui.pid_groupbox.setTitle("Error finding package ids")
             self._log_details.stderr(str(exception))
             return
+        if results is None and self._queried_filters:
+            # no package ids matched the query, but the filters must be removable
+            results = []
         if results is not None:
             self._model.set(results)
-            self._ui.pid_groupbox.setTitle(f"{len(results)} package ids found")
+            title = f"{len(results)} package ids found"
+            if self._queried_filters:
+                title += f" matching {self._query}"
+            self._ui.pid_groupbox.setTitle(title)
             self._ui.pid_groupbox.setEnabled(True)
             self._current_pkgref = self._previous_pkgref
             self._ui.pid_filter_group.setEnabled(True)
@@ -318,17 +289,16 @@ class PackageIdPage(Page):
             assert isinstance(blocked_widget, QtWidgets.QComboBox)
             blocked_widget.clear()
             blocked_widget.addItem("Package Id")
-            if self._model.settings:
-                blocked_widget.addItems(self._model.settings)
-            if self._model.options:
-                blocked_widget.addItems(self._model.options)
+            blocked_widget.addItems(self._model.settings)
+            blocked_widget.addItems(self._model.options)
             blocked_widget.setCurrentIndex(-1)
         model = self._ui.pid_filter_key.model()
         assert isinstance(model, QtGui.QStandardItemModel)
         # disable those with active filters
-        for index, _, _ in self._filtering_model.filters:
-            item = model.item(index)
-            item.setEnabled(False)
+        for name, _, _ in self._filtering_model.filters:
+            column = self._model.table.column_of(name) if self._model.table else None
+            if column is not None:
+                model.item(column).setEnabled(False)
         with BlockSignals(self._ui.pid_filter_value) as blocked_widget:
             assert isinstance(blocked_widget, QtWidgets.QComboBox)
             blocked_widget.clear()
@@ -354,9 +324,9 @@ class PackageIdPage(Page):
 
     def _on_refresh(self) -> None:
         self._current_pkgref = None
-        self._compute()
+        self._compute(refresh=True)
 
-    def _compute(self) -> None:
+    def _compute(self, refresh: bool = False) -> None:
         pkgref = self._previous_pkgref
         if self._current_pkgref != pkgref:
             self._ui.pid_groupbox.setTitle("0 package ids found")
@@ -364,13 +334,35 @@ class PackageIdPage(Page):
             self._enable_progress(True)
             self._ui.pid_groupbox.setEnabled(False)
             self._ui.pid_filter_group.setEnabled(False)
+            query_filters = self._filtering_model.query_filters
+            query = package_query(query_filters)
+            if query and not refresh:
+                # filter unexpired package ids locally, rather than query the remote
+                cached = self._remote_cache.get(
+                    self._remote_url, RemoteQueryKind.PACKAGE_IDS, pkgref
+                )
+                if cached is not None and not cached.expired:
+                    query = None
+            self._query = query
+            self._queried_filters = query_filters if query else []
             params = PackageIdParameters(
                 reference=pkgref,
                 remote_name=self._ui.remote.currentText(),
+                package_query=query,
+            )
+            self._fetch(
+                RemoteQueryKind.PACKAGE_IDS,
+                f"{pkgref} ({query})" if query else pkgref,
+                params,
+                self._complete,
+                refresh,
             )
-            self._context.get_package_details(params, self._complete)
 
     def _on_restart(self) -> None:
+        if self._queried_filters:
+            # the package ids found do not match without the filters
+            self._current_pkgref = None
+            self._queried_filters = []
         self._filtering_model.invalidate()
         self._sorting_model.invalidateFilter()
         self._open_start()
@@ -378,7 +370,7 @@ class PackageIdPage(Page):
     def _on_package_id_header_menu(self, position: QtCore.QPoint) -> None:
         menu = QtWidgets.QMenu(self)
         offset = 1
-        settings = self._model.settings or []
+        settings = self._model.settings
         for i, s in enumerate(settings):
             action = QtGui.QAction(s, self)
             action.setCheckable(True)
@@ -388,7 +380,7 @@ class PackageIdPage(Page):
             menu.addAction(action)
         menu.addSeparator()
         offset = 1 + len(settings)
-        options = self._model.options or []
+        options = self._model.options
         for i, o in enumerate(options):
             action = QtGui.QAction(o, self)
             action.setData(i + offset)
@@ -414,44 +406,29 @@ class PackageIdPage(Page):
         self._ui.package_ids.setColumnHidden(action.data(), not checked)
 
     def _on_pid_filter_changed(self, text: str) -> None:
+        # pylint: disable=unused-argument
         self._ui.pid_filter_value.setEnabled(True)
-        assert self._model.settings
+        assert self._model.table is not None
         sender_combobox = self.sender()
         assert isinstance(sender_combobox, QtWidgets.QComboBox)
-        if not sender_combobox.currentIndex():
-            with BlockSignals(self._ui.pid_filter_value) as blocked_widget:
-                assert isinstance(blocked_widget, QtWidgets.QComboBox)
-                blocked_widget.clear()
-                assert self._model.pids
-                for pid in self._model.pids:
-                    package_id = pid["id"]
-                    assert isinstance(package_id, str)
-                    blocked_widget.addItem(package_id)
-                blocked_widget.setCurrentIndex(-1)
-        elif sender_combobox.currentIndex() < len(self._model.settings) + 1:
-            with BlockSignals(self._ui.pid_filter_value) as blocked_widget:
-                assert isinstance(blocked_widget, QtWidgets.QComboBox)
-                blocked_widget.clear()
-                assert self._model.settings_values
-                settings = list(self._model.settings_values[text])
-                blocked_widget.addItems(settings)
-                blocked_widget.setCurrentIndex(-1)
-        else:
-            with BlockSignals(self._ui.pid_filter_value) as blocked_widget:
-                assert isinstance(blocked_widget, QtWidgets.QComboBox)
-                blocked_widget.clear()
-                assert self._model.options_values
-                options = list(self._model.options_values[text])
-                blocked_widget.addItems(options)
-                blocked_widget.setCurrentIndex(-1)
+        # the index of the filter key is the column of the package id table
+        with BlockSignals(self._ui.pid_filter_value) as blocked_widget:
+            assert isinstance(blocked_widget, QtWidgets.QComboBox)
+            blocked_widget.clear()
+            blocked_widget.addItems(
+                self._model.table.distinct_values(sender_combobox.currentIndex())
+            )
+            blocked_widget.setCurrentIndex(-1)
 
     def _on_pid_filter_value_changed(self, text: str) -> None:
         # pylint: disable=unused-argument
         self._ui.pid_add_filter.setEnabled(True)
 
     def _on_add_pid_filter(self) -> None:
+        assert self._model.table is not None
+        # the index of the filter key is the column of the package id table
         self._filtering_model.add(
-            self._ui.pid_filter_key.currentIndex(),
+            self._model.table.name_of(self._ui.pid_filter_key.currentIndex()),
             self._ui.pid_filter_key.currentText(),
             self._ui.pid_filter_value.currentText(),
         )
@@ -473,6 +450,12 @@ class PackageIdPage(Page):
         selected_row_index = (
             self._ui.pid_filterTable.selectionModel().selectedRows()[0].row()
         )
+        name, _, value = self._filtering_model.filters[selected_row_index]
         self._filtering_model.remove(selected_row_index)
+        if name is not None and (name, value) in self._queried_filters:
+            # package ids not matching the query must be fetched
+            self._current_pkgref = None
+            self._compute()
+            return
         self._sorting_model.invalidateFilter()
         self._populate_settings_options_filter()
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import functools
+import time
 import typing
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -14,53 +16,105 @@ from cruiz.widgets.util import BlockSignals
 import cruizlib.globals
 from cruizlib.commands.conanconf import ConanConfigBoolean
 from cruizlib.interop.searchrecipesparameters import SearchRecipesParameters
+from cruizlib.remote.cache import RemoteQueryKind
+from cruizlib.remote.search import SearchRefiner
 
 from .page import Page
 
 if typing.TYPE_CHECKING:
+    from cruiz.commands.conaninvocation import ConanInvocation
     from cruiz.pyside6.remote_browser import Ui_remotebrowser
 
 
-class _PackageReferenceModel(QtCore.QAbstractListModel):
+# time allowed for each remote to answer a search
+SEARCH_TIMEOUT_MS = 30000
+# time after the search pattern was last edited, before searching
+SEARCH_DELAY_MS = 400
+
+
+class _PackageReferenceModel(QtCore.QAbstractTableModel):
     def __init__(self) -> None:
         super().__init__()
-        self._list: typing.List[str] = []
+        # each row is the package reference, and the remote it was found on
+        self._rows: typing.List[typing.Tuple[str, str]] = []
 
     def clear(self) -> None:
         """Clear the model."""
         self.beginResetModel()
-        self._list = []
+        self._rows = []
         self.endResetModel()
 
-    def add(self, text: str) -> None:
-        """Add a package reference to the model."""
-        count = len(self._list)
-        self.beginInsertRows(QtCore.QModelIndex(), count, count + 1)
-        self._list.append(text)
+    def extend(self, texts: typing.List[str], remote_name: str) -> None:
+        """Add package references found on a remote to the model."""
+        if not texts:
+            return
+        count = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), count, count + len(texts) - 1)
+        self._rows.extend((text, remote_name) for text in texts)
         self.endInsertRows()
 
+    def remote_name(self, row: int) -> str:
+        """Get the name of the remote that the package reference was found on."""
+        return self._rows[row][1]
+
     def rowCount(self, parent) -> int:  # type: ignore
         """Get the number of rows in the model."""
         if parent.isValid():
             return 0
-        if not self._list:
+        return len(self._rows)
+
+    def columnCount(self, parent) -> int:  # type: ignore
+        """Get the number of columns in the model."""
+        if parent.isValid():
             return 0
-        return len(self._list)
+        return 2
 
     def data(self, index, role) -> typing.Any:  # type: ignore
         """Get data from the model."""
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
-            return self._list[index.row()]
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role):  # type: ignore
+        """Get the header data from the model."""
+        if (
+            role == QtCore.Qt.ItemDataRole.DisplayRole
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return ("Reference", "Remote")[section]
         return None
 
     def flags(self, index):  # type: ignore
         """Get flags from the specified model index."""
         default_flags = super().flags(index)
-        if "->" in self._list[index.row()]:
+        if "->" in self._rows[index.row()][0]:
             return default_flags & ~QtCore.Qt.ItemFlag.ItemIsEnabled
         return default_flags
 
 
+class _RemoteSearch:
+    """The state of searching a single remote."""
+
+    def __init__(self, pattern: str, alias_aware: bool) -> None:
+        self.pattern = pattern
+        self.alias_aware = alias_aware
+        self.started = time.monotonic()
+        self.status = "searching"
+        self.done = False
+        # results received so far, as they arrive in chunks
+        self.results: typing.List[typing.Tuple[str, typing.Optional[str]]] = []
+        self.refined = False
+        self.invocation: typing.Optional[ConanInvocation] = None
+        self.timer: typing.Optional[QtCore.QTimer] = None
+
+    def stop_timer(self) -> None:
+        """Stop waiting for the remote to answer."""
+        if self.timer is not None:
+            self.timer.stop()
+            self.timer.deleteLater()
+            self.timer = None
+
+
 class _PackageSearchValidator(QtGui.QValidator):
     """Validate the input given to the package search."""
 
@@ -80,19 +134,37 @@ class PackageReferencePage(Page):
         self._base_setup(self_ui, 0)
 
         self._revs_enabled = False
+        self._remote_urls: typing.Dict[str, str] = {}
+        self._enabled_remote_names: typing.List[str] = []
+        self._searches: typing.Dict[str, _RemoteSearch] = {}
+        # results of searches from before a new search or cancellation are ignored
+        self._search_generation = 0
+        self._refiner = SearchRefiner()
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self._search)
         self._model = _PackageReferenceModel()
         self._ui.package_references.setModel(self._model)
+        self._ui.package_references.horizontalHeader().setSectionResizeMode(
+            0, QtWidgets.QHeaderView.ResizeMode.Stretch
+        )
+        self._ui.package_references.setColumnHidden(1, True)
         self._ui.package_references.customContextMenuRequested.connect(
             self._on_selected_pkgref_menu
         )
+        self._ui.package_references.selectionModel().currentChanged.connect(
+            self._on_current_pkgref_changed
+        )
 
         self._ui.local_cache_name.currentTextChanged.connect(self.on_local_cache_change)
         self._ui.remote.currentTextChanged.connect(self._on_remote_change)
+        self._ui.all_remotes.toggled.connect(self._on_all_remotes_toggled)
 
         self._ui.search_pattern.setPlaceholderText("e.g. *xyz*")
         self._ui.search_pattern.setValidator(_PackageSearchValidator(self))
         self._ui.search_pattern.inputRejected.connect(self._pattern_incorrect)
         self._ui.search_pattern.returnPressed.connect(self._search)
+        self._ui.search_pattern.textEdited.connect(self._on_search_pattern_edited)
 
         self._ui.package_references.doubleClicked.connect(self._on_pkgref_dclicked)
 
@@ -100,6 +172,7 @@ class PackageReferencePage(Page):
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:
         """Override the widget's showEvent method."""
+        self._prefetcher.cancel()
         self.refresh_local_cache_names()
         super().showEvent(event)
 
@@ -116,23 +189,33 @@ class PackageReferencePage(Page):
     @property
     def package_reference(self) -> str:
         """Get the package reference selected on this page."""
-        selection = self._ui.package_references.selectedIndexes()
+        selection = [
+            index
+            for index in self._ui.package_references.selectedIndexes()
+            if not index.column()
+        ]
         assert len(selection) == 1
         return self._model.data(selection[0], QtCore.Qt.ItemDataRole.DisplayRole)
 
     def on_local_cache_change(self, text: str) -> None:
         """Call when which local cache has been selected has changed."""
         self._context.change_cache(text)
+        self._prefetcher.change_cache(text)
+        self._refiner.clear()
         index_of_first_enabled_remote: typing.Optional[int] = None
+        self._remote_urls.clear()
+        self._enabled_remote_names.clear()
         with BlockSignals(self._ui.remote) as blocked_widget:
             assert isinstance(blocked_widget, QtWidgets.QComboBox)
             blocked_widget.clear()
             for index, remote in enumerate(self._context.get_remotes_list()):
+                self._remote_urls[remote.name] = remote.url
                 blocked_widget.addItem(remote.name)
                 model = blocked_widget.model()
                 assert isinstance(model, QtGui.QStandardItemModel)
                 item = model.item(index)
                 if remote.enabled:
+                    self._enabled_remote_names.append(remote.name)
                     item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsEnabled)
                     if index_of_first_enabled_remote is None:
                         index_of_first_enabled_remote = index
@@ -152,48 +235,233 @@ class PackageReferencePage(Page):
 
     def _on_remote_change(self, text: str) -> None:
         # pylint: disable=unused-argument
+        self._prefetcher.cancel()
+        self._stop_searches()
+        self._enable_progress(False)
         self._ui.search_pattern.setEnabled(True)
         self._model.clear()
+        self._ui.pkgref_remote_status.clear()
+
+    def _on_all_remotes_toggled(self, checked: bool) -> None:
+        self._ui.remote.setEnabled(not checked)
+        self._ui.search_pattern.setEnabled(True)
 
     def _pattern_incorrect(self) -> None:
         with BlockSignals(self._ui.search_pattern) as blocked_widget:
             assert isinstance(blocked_widget, QtWidgets.QLineEdit)
             blocked_widget.setText("")  # clear doesn't actually clear
 
+    def _on_search_pattern_edited(self, text: str) -> None:
+        # searches for the earlier text are no longer wanted
+        self._stop_searches()
+        self._update_search_status()
+        self._enable_progress(False)
+        if text:
+            self._search_timer.start(SEARCH_DELAY_MS)
+        else:
+            self._search_timer.stop()
+
     def _enable_progress(self, enable: bool) -> None:
-        self._ui.pkgref_ui_group.setEnabled(not enable)
+        # the pattern remains editable while searching, to search as you type
+        # but the local cache cannot change while the context is busy
+        self._ui.local_cache_name.setEnabled(not enable)
         self._ui.pkgref_progress.setMaximum(0 if enable else 1)
         self._ui.pkgref_cancel.setEnabled(enable)
 
     def _search(self) -> None:
+        self._search_timer.stop()
+        if not self._ui.search_pattern.text():
+            return
+        self._prefetcher.cancel()
+        self._stop_searches()
         self._model.clear()
         self._ui.pkgref_groupbox.setTitle("0 package references found")
         self._enable_progress(True)
         self._ui.pkgref_groupbox.setEnabled(False)
+        all_remotes = self._ui.all_remotes.isChecked()
+        self._ui.package_references.setColumnHidden(1, not all_remotes)
+        remote_names = (
+            self._enabled_remote_names
+            if all_remotes
+            else [self._ui.remote.currentText()]
+        )
+        pattern = self._ui.search_pattern.text()
+        alias_aware = self._ui.alias_aware.isChecked()
+        self._searches = {
+            remote_name: _RemoteSearch(pattern, alias_aware)
+            for remote_name in remote_names
+        }
+        self._update_search_status()
+        for remote_name in remote_names:
+            self._search_remote(remote_name)
+
+    def _search_remote(self, remote_name: str) -> None:
+        search = self._searches[remote_name]
         params = SearchRecipesParameters(
-            remote_name=self._ui.remote.currentText(),
-            pattern=self._ui.search_pattern.text(),
+            remote_name=remote_name,
+            pattern=search.pattern,
             case_sensitive=True,
-            alias_aware=self._ui.alias_aware.isChecked(),
+            alias_aware=search.alias_aware,
         )
-        self._context.get_package_details(params, self._complete)
-
-    def _complete(self, results: typing.Any, exception: typing.Any) -> None:
-        self._enable_progress(False)
-        if exception:
-            self._ui.pkgref_groupbox.setTitle("Error finding package references")
-            self._log_details.stderr(str(exception))
+        if search.alias_aware:
+            query = f"{search.pattern} (alias aware)"
+            refined = None
+        else:
+            query = search.pattern
+            refined = self._refiner.refine(self._remote_url_of(remote_name), query)
+        if refined is not None:
+            search.refined = True
+            self._complete(self._search_generation, remote_name, refined, None)
             return
-        if results is not None:
-            for pkgref, alias in results:
-                if alias:
-                    self._model.add(f"{pkgref} -> {alias}")
-                else:
-                    self._model.add(pkgref)
-            self._ui.pkgref_groupbox.setTitle(
-                f"{len(results)} package references found"
+        search.invocation = self._fetch(
+            RemoteQueryKind.SEARCH,
+            query,
+            params,
+            functools.partial(self._complete, self._search_generation, remote_name),
+            partial_continuation=functools.partial(
+                self._on_partial_results, self._search_generation, remote_name
+            ),
+        )
+        if search.invocation is not None:
+            search.timer = QtCore.QTimer(self)
+            search.timer.setSingleShot(True)
+            search.timer.timeout.connect(
+                functools.partial(
+                    self._on_search_timeout, self._search_generation, remote_name
+                )
             )
+            search.timer.start(SEARCH_TIMEOUT_MS)
+
+    def _add_results(self, remote_name: str, results: typing.Any) -> None:
+        texts = [
+            f"{pkgref} -> {alias}" if alias else pkgref
+            for pkgref, alias in results or []
+        ]
+        self._model.extend(texts, remote_name)
+        self._searches[remote_name].results.extend(results or [])
+
+    def _on_partial_results(
+        self, generation: int, remote_name: str, results: typing.Any
+    ) -> None:
+        if generation != self._search_generation:
+            return
+        search = self._searches[remote_name]
+        if search.done:
+            return
+        self._add_results(remote_name, results)
+        search.status = f"{len(search.results)} found so far"
+        self._update_search_status()
+        # browsable while the remainder arrive, and the search can be stopped early
+        self._ui.pkgref_groupbox.setEnabled(True)
+
+    def _complete(
+        self,
+        generation: int,
+        remote_name: str,
+        results: typing.Any,
+        exception: typing.Any,
+    ) -> None:
+        if generation != self._search_generation:
+            return
+        search = self._searches[remote_name]
+        if search.done:
+            return
+        if exception:
+            search.status = "failed"
+            self._log_details.stderr(f"{remote_name}: {exception}")
+        else:
+            self._add_results(remote_name, results)
+            found = len(search.results)
+            if search.refined:
+                search.status = f"{found} found by refining an earlier search"
+            elif search.invocation is None:
+                search.status = f"{found} found in the cache"
+            else:
+                elapsed_ms = (time.monotonic() - search.started) * 1000
+                search.status = f"{found} found in {elapsed_ms:.0f} ms"
+            if not search.refined and not search.alias_aware:
+                # later searches for refinements of the pattern are filtered locally
+                self._refiner.add(
+                    self._remote_url_of(remote_name), search.pattern, search.results
+                )
+        self._finish_search(remote_name)
+
+    def _on_search_timeout(self, generation: int, remote_name: str) -> None:
+        if generation != self._search_generation:
+            return
+        search = self._searches[remote_name]
+        if search.done:
+            return
+        assert search.invocation is not None
+        self._context.cancel_invocation(search.invocation)
+        search.status = f"timed out after {SEARCH_TIMEOUT_MS // 1000} s"
+        self._finish_search(remote_name)
+
+    def _finish_search(self, remote_name: str) -> None:
+        search = self._searches[remote_name]
+        search.done = True
+        search.stop_timer()
+        self._update_search_status()
+        if self._model.rowCount(QtCore.QModelIndex()):
             self._ui.pkgref_groupbox.setEnabled(True)
+        if all(search.done for search in self._searches.values()):
+            self._enable_progress(False)
+            self._prefetch_around(0)
+
+    def _stop_searches(self) -> None:
+        self._search_generation += 1
+        for search in self._searches.values():
+            search.stop_timer()
+            if not search.done:
+                search.done = True
+                search.status = (
+                    f"stopped after {len(search.results)} found"
+                    if search.results
+                    else "cancelled"
+                )
+                if search.invocation is not None:
+                    self._context.cancel_invocation(search.invocation)
+
+    def _update_search_status(self) -> None:
+        remaining = sum(not search.done for search in self._searches.values())
+        title = f"{self._model.rowCount(QtCore.QModelIndex())} package references found"
+        if remaining:
+            title += f" (waiting for {remaining} remote(s))"
+        self._ui.pkgref_groupbox.setTitle(title)
+        self._ui.pkgref_remote_status.setText(
+            "; ".join(
+                f"{remote_name}: {search.status}"
+                for remote_name, search in self._searches.items()
+            )
+        )
+
+    def _on_current_pkgref_changed(
+        self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex
+    ) -> None:
+        # pylint: disable=unused-argument
+        if current.isValid():
+            # subsequent pages query the remote that the package reference is on
+            with BlockSignals(self._ui.remote) as blocked_widget:
+                assert isinstance(blocked_widget, QtWidgets.QComboBox)
+                blocked_widget.setCurrentText(self._model.remote_name(current.row()))
+            self._prefetch_around(current.row())
+
+    def _prefetch_around(self, row: int) -> None:
+        # the selected reference, and those adjacent, are the most likely browsed next
+        for adjacent_row in (row, row + 1, row - 1):
+            if not 0 <= adjacent_row < self._model.rowCount(QtCore.QModelIndex()):
+                continue
+            pkgref = self._model.data(
+                self._model.index(adjacent_row, 0), QtCore.Qt.ItemDataRole.DisplayRole
+            )
+            if "->" in pkgref:
+                continue
+            remote_name = self._model.remote_name(adjacent_row)
+            remote_url = self._remote_url_of(remote_name)
+            if self._revs_enabled:
+                self._prefetcher.recipe_revisions(remote_name, remote_url, [pkgref])
+            else:
+                self._prefetcher.package_ids(remote_name, remote_url, [pkgref])
 
     def _on_pkgref_dclicked(self, index: QtCore.QModelIndex) -> None:
         # pylint: disable=unused-argument
@@ -205,9 +473,16 @@ class PackageReferencePage(Page):
     def on_cancel(self) -> None:
         """Call when the user cancels the operation."""
         self._context.cancel()
+        self._stop_searches()
+        self._update_search_status()
         self._enable_progress(False)
+        if self._model.rowCount(QtCore.QModelIndex()):
+            # the results found before stopping can still be browsed
+            self._ui.pkgref_groupbox.setEnabled(True)
+            self._prefetch_around(0)
 
     def invalidate(self) -> None:
         """Invalidate the package reference search."""
         self._model.clear()
         self._ui.search_pattern.clear()
+        self._ui.pkgref_remote_status.clear()
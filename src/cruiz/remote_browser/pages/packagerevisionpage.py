@@ -9,6 +9,7 @@ import typing
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from cruizlib.interop.packagerevisionsparameters import PackageRevisionsParameters
+from cruizlib.remote.cache import RemoteQueryKind
 
 from .page import Page
 
@@ -107,6 +108,7 @@ class PackageRevisionPage(Page):
     def showEvent(self, event: QtGui.QShowEvent) -> None:
         """Override the widget's showEvent method."""
         # pylint: disable=unused-argument
+        self._prefetcher.cancel()
         self._ui.prev_pkgref.setText(self._previous_pkgref)
         self._compute()
 
@@ -136,9 +138,9 @@ class PackageRevisionPage(Page):
 
     def _on_refresh(self) -> None:
         self._current_pkgref = None
-        self._compute()
+        self._compute(refresh=True)
 
-    def _compute(self) -> None:
+    def _compute(self, refresh: bool = False) -> None:
         pkgref = self._previous_pkgref
         if self._current_pkgref != pkgref:
             self._ui.prev_groupbox.setTitle("0 package revisions found")
@@ -149,7 +151,13 @@ class PackageRevisionPage(Page):
                 reference=pkgref,
                 remote_name=self._ui.remote.currentText(),
             )
-            self._context.get_package_details(params, self._complete)
+            self._fetch(
+                RemoteQueryKind.PACKAGE_REVISIONS,
+                pkgref,
+                params,
+                self._complete,
+                refresh,
+            )
 
     def _on_restart(self) -> None:
         self._open_start()
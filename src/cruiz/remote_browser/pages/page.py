@@ -5,16 +5,43 @@
 from __future__ import annotations
 
 import abc
+import datetime
+import functools
 import typing
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 if typing.TYPE_CHECKING:
+    from cruiz.commands.conaninvocation import ConanInvocation
     from cruiz.commands.context import ConanContext
     from cruiz.commands.logdetails import LogDetails
     from cruiz.pyside6.remote_browser import Ui_remotebrowser
+    from cruiz.remote_browser.prefetcher import RemotePrefetcher
     from cruiz.remote_browser.remotebrowser import RemoteBrowserDock
 
+    from cruizlib.interop.packagebinaryparameters import PackageBinaryParameters
+    from cruizlib.interop.packageidparameters import PackageIdParameters
+    from cruizlib.interop.packagerevisionsparameters import (
+        PackageRevisionsParameters,
+    )
+    from cruizlib.interop.reciperevisionsparameters import RecipeRevisionsParameters
+    from cruizlib.interop.searchrecipesparameters import SearchRecipesParameters
+    from cruizlib.remote.cache import (
+        CachedResponse,
+        RemoteMetadataCache,
+        RemoteQueryKind,
+    )
+
+    RemoteQueryParameters = typing.Union[
+        SearchRecipesParameters,
+        RecipeRevisionsParameters,
+        PackageIdParameters,
+        PackageRevisionsParameters,
+        PackageBinaryParameters,
+    ]
+    RemoteQueryContinuation = typing.Callable[[typing.Any, typing.Any], None]
+    RemoteQueryPartialContinuation = typing.Callable[[typing.Any], None]
+
 
 class Page(QtWidgets.QWidget):
     """Base class for all pages shown in the remote browser."""
@@ -48,6 +75,104 @@ class Page(QtWidgets.QWidget):
         # TODO: this is non-public access as is just forwarding the parent's details
         return remote_browser._context
 
+    @property
+    def _remote_cache(self) -> RemoteMetadataCache:
+        remote_browser: RemoteBrowserDock = self._ui.dockWidgetContents.parent()  # type: ignore[assignment]  # noqa: E501
+        # pylint: disable=protected-access
+        # TODO: this is non-public access as is just forwarding the parent's details
+        return remote_browser._remote_cache
+
+    @property
+    def _prefetcher(self) -> RemotePrefetcher:
+        remote_browser: RemoteBrowserDock = self._ui.dockWidgetContents.parent()  # type: ignore[assignment]  # noqa: E501
+        # pylint: disable=protected-access
+        # TODO: this is non-public access as is just forwarding the parent's details
+        return remote_browser._prefetcher
+
+    @property
+    def _remote_url(self) -> str:
+        return self._remote_url_of(self._ui.remote.currentText())
+
+    def _remote_url_of(self, remote_name: str) -> str:
+        # pylint: disable=protected-access
+        # TODO: this is non-public access as is just forwarding the parent's details
+        return self._ui.pkgref._remote_urls.get(remote_name, remote_name)
+
+    def _fetch(
+        self,
+        kind: RemoteQueryKind,
+        query: str,
+        params: RemoteQueryParameters,
+        continuation: RemoteQueryContinuation,
+        refresh: bool = False,
+        partial_continuation: typing.Optional[RemoteQueryPartialContinuation] = None,
+    ) -> typing.Optional[ConanInvocation]:
+        """
+        Get the response of the remote named in the parameters to a query.
+
+        Unexpired responses in the remote metadata cache are used, unless refreshing.
+        Otherwise, the invocation querying the remote is returned.
+
+        Responses sent in chunks are lists, each chunk being passed to the partial
+        continuation, and the last to the continuation. Cached responses are
+        passed whole to the continuation.
+        """
+        remote_url = self._remote_url_of(params.remote_name)  # type: ignore[union-attr]
+        cached = self._remote_cache.get(remote_url, kind, query)
+        if cached is not None and not cached.expired and not refresh:
+            continuation(cached.payload, None)
+            return None
+        chunks: typing.List[typing.Any] = []
+        return self._context.get_package_details(
+            params,
+            functools.partial(
+                self._on_fetched, kind, query, remote_url, cached, chunks, continuation
+            ),
+            (
+                functools.partial(
+                    self._on_fetched_partially, chunks, partial_continuation
+                )
+                if partial_continuation is not None
+                else None
+            ),
+        )
+
+    def _on_fetched_partially(
+        self,
+        chunks: typing.List[typing.Any],
+        partial_continuation: RemoteQueryPartialContinuation,
+        results: typing.Any,
+    ) -> None:
+        # remembered, so that the whole response is cached once complete
+        chunks.extend(results)
+        partial_continuation(results)
+
+    def _on_fetched(
+        self,
+        kind: RemoteQueryKind,
+        query: str,
+        remote_url: str,
+        cached: typing.Optional[CachedResponse],
+        chunks: typing.List[typing.Any],
+        continuation: RemoteQueryContinuation,
+        results: typing.Any,
+        exception: typing.Any,
+    ) -> None:
+        if exception and cached is not None and not chunks:
+            # the remote cannot be contacted, so use the earlier response
+            stored = datetime.datetime.fromtimestamp(cached.stored)
+            self._log_details.stderr(
+                f"{exception}\nShowing the response of {remote_url} from "
+                f"{stored:%Y-%m-%d %H:%M:%S}"
+            )
+            continuation(cached.payload, None)
+            return
+        if not exception:
+            self._remote_cache.put(
+                remote_url, kind, query, chunks + (results or []) if chunks else results
+            )
+        continuation(results, exception)
+
     # TODO: does this belong in the parent?
     @property
     def _revisions_enabled(self) -> bool:
@@ -8,7 +8,10 @@ import typing
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from cruiz.remote_browser.prefetcher import latest_recipe_revision
+
 from cruizlib.interop.reciperevisionsparameters import RecipeRevisionsParameters
+from cruizlib.remote.cache import RemoteQueryKind
 
 from .page import Page
 
@@ -106,6 +109,7 @@ class RecipeRevisionPage(Page):
     def showEvent(self, event: QtGui.QShowEvent) -> None:
         """Override the widget's showEvent method."""
         # pylint: disable=unused-argument
+        self._prefetcher.cancel()
         self._ui.rrev_pkgref.setText(self._previous_pkgref)
         self._compute()
 
@@ -120,6 +124,13 @@ class RecipeRevisionPage(Page):
             self._ui.rrev_groupbox.setTitle(f"{len(results)} recipe revisions found")
             self._ui.rrev_groupbox.setEnabled(True)
             self._current_pkgref = self._previous_pkgref
+            latest = latest_recipe_revision(results)
+            if latest is not None:
+                self._prefetcher.package_ids(
+                    self._ui.remote.currentText(),
+                    self._remote_url,
+                    [f"{self._current_pkgref}#{latest}"],
+                )
 
     def _on_back(self) -> None:
         self._ui.stackedWidget.setCurrentWidget(self._ui.pkgref)
@@ -135,9 +146,9 @@ class RecipeRevisionPage(Page):
 
     def _on_refresh(self) -> None:
         self._current_pkgref = None
-        self._compute()
+        self._compute(refresh=True)
 
-    def _compute(self) -> None:
+    def _compute(self, refresh: bool = False) -> None:
         pkgref = self._previous_pkgref
         if self._current_pkgref != pkgref:
             self._ui.pkgref_groupbox.setTitle("0 recipe revisions found")
@@ -148,4 +159,10 @@ class RecipeRevisionPage(Page):
                 reference=pkgref,
                 remote_name=self._ui.remote.currentText(),
             )
-            self._context.get_package_details(params, self._complete)
+            self._fetch(
+                RemoteQueryKind.RECIPE_REVISIONS,
+                pkgref,
+                params,
+                self._complete,
+                refresh,
+            )
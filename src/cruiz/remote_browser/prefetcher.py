@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+"""Prefetching for the remote browser."""
+
+from __future__ import annotations
+
+import collections
+import functools
+import typing
+from dataclasses import dataclass
+
+from PySide6 import QtCore, QtWidgets
+
+from cruiz.commands.context import ConanContext
+from cruiz.commands.logdetails import LogDetails
+
+from cruizlib.interop.packageidparameters import PackageIdParameters
+from cruizlib.interop.reciperevisionsparameters import RecipeRevisionsParameters
+from cruizlib.remote.cache import RemoteQueryKind
+
+if typing.TYPE_CHECKING:
+    from cruizlib.remote.cache import RemoteMetadataCache
+
+
+# maximum number of remote queries prefetched at the same time
+PREFETCH_JOBS = 2
+
+
+@dataclass(frozen=True)
+class _PrefetchQuery:
+    remote_name: str
+    remote_url: str
+    kind: RemoteQueryKind
+    reference: str
+
+
+def latest_recipe_revision(
+    revisions: typing.Optional[typing.List[typing.Dict[str, str]]],
+) -> typing.Optional[str]:
+    """Get the most recent revision of a list of recipe revisions, if any."""
+    if not revisions:
+        return None
+    return max(revisions, key=lambda revision: revision["time"])["revision"]
+
+
+class RemotePrefetcher:
+    """
+    Fetch the responses of remotes, before the user navigates to them.
+
+    Responses are stored in the remote metadata cache, so that the next
+    page shown is populated without contacting the remote.
+    A bounded number of queries are run at the same time, and the remainder
+    are queued. Queries already cached and unexpired are skipped.
+    """
+
+    def __init__(self, cache_name: str, remote_cache: RemoteMetadataCache) -> None:
+        """Initialise a RemotePrefetcher."""
+        # prefetching is silent, so neither writes to, nor clears, the visible log
+        self._log = QtWidgets.QPlainTextEdit()
+        # no context while closed
+        self._context: typing.Optional[ConanContext] = self._make_context(cache_name)
+        # contexts of earlier local caches, closed once their cancelled queries finish
+        self._retired_contexts: typing.List[ConanContext] = []
+        self._retired_contexts_timer = QtCore.QTimer()
+        self._retired_contexts_timer.setSingleShot(True)
+        self._retired_contexts_timer.setInterval(0)
+        self._retired_contexts_timer.timeout.connect(self._close_retired_contexts)
+        self._remote_cache = remote_cache
+        self._pending: typing.Deque[_PrefetchQuery] = collections.deque()
+        self._in_flight: typing.Set[_PrefetchQuery] = set()
+        # responses to queries from before a cancellation are ignored
+        self._generation = 0
+
+    def _make_context(self, cache_name: str) -> ConanContext:
+        return ConanContext(cache_name, LogDetails(self._log, None, True, False, None))
+
+    def change_cache(self, cache_name: str) -> None:
+        """Change the local cache used for prefetching."""
+        self.cancel()
+        if self._context is None:
+            self._context = self._make_context(cache_name)
+            return
+        if cache_name == self._context.cache_name:
+            return
+        # cancelled queries are only released once their threads have finished
+        if self._context.is_busy:
+            self._retired_contexts.append(self._context)
+            self._context = self._make_context(cache_name)
+        else:
+            self._context.change_cache(cache_name)
+
+    def close(self) -> None:
+        """Cancel any prefetching, and close the resources associated with it."""
+        self.cancel()
+        if self._context is not None:
+            self._retired_contexts.append(self._context)
+            self._context = None
+        for context in self._retired_contexts:
+            # so that no query is left running
+            context.cancel()
+        self._close_retired_contexts()
+
+    def _close_retired_contexts(self) -> None:
+        for context in [
+            context for context in self._retired_contexts if not context.is_busy
+        ]:
+            context.close()
+            self._retired_contexts.remove(context)
+        if self._retired_contexts:
+            # the threads of cancelled queries have already finished, but the queries
+            # are only released once the notifications that they finished are
+            # delivered, after which closing is tried again
+            self._retired_contexts_timer.start()
+
+    def cancel(self) -> None:
+        """Cancel all queued and running prefetches."""
+        self._generation += 1
+        self._pending.clear()
+        self._in_flight.clear()
+        if self._context is not None:
+            self._context.cancel()
+
+    def recipe_revisions(
+        self, remote_name: str, remote_url: str, references: typing.Iterable[str]
+    ) -> None:
+        """Prefetch the recipe revisions of each reference."""
+        for reference in references:
+            self._queue(
+                _PrefetchQuery(
+                    remote_name, remote_url, RemoteQueryKind.RECIPE_REVISIONS, reference
+                )
+            )
+        self._start_pending()
+
+    def package_ids(
+        self, remote_name: str, remote_url: str, references: typing.Iterable[str]
+    ) -> None:
+        """Prefetch the package ids of each reference."""
+        for reference in references:
+            self._queue(
+                _PrefetchQuery(
+                    remote_name, remote_url, RemoteQueryKind.PACKAGE_IDS, reference
+                )
+            )
+        self._start_pending()
+
+    def _queue(self, query: _PrefetchQuery) -> None:
+        if query in self._pending or query in self._in_flight:
+            return
+        cached = self._remote_cache.get(query.remote_url, query.kind, query.reference)
+        if cached is not None and not cached.expired:
+            self._on_cached(query, cached.payload)
+            return
+        self._pending.append(query)
+
+    def _start_pending(self) -> None:
+        self._close_retired_contexts()
+        if self._context is None:
+            return
+        while self._pending and len(self._in_flight) < PREFETCH_JOBS:
+            query = self._pending.popleft()
+            self._in_flight.add(query)
+            params: typing.Union[RecipeRevisionsParameters, PackageIdParameters]
+            if query.kind == RemoteQueryKind.RECIPE_REVISIONS:
+                params = RecipeRevisionsParameters(
+                    reference=query.reference, remote_name=query.remote_name
+                )
+            else:
+                params = PackageIdParameters(
+                    reference=query.reference, remote_name=query.remote_name
+                )
+            self._context.get_package_details(
+                params,
+                functools.partial(self._on_prefetched, self._generation, query),
+            )
+
+    def _on_prefetched(
+        self,
+        generation: int,
+        query: _PrefetchQuery,
+        results: typing.Any,
+        exception: typing.Any,
+    ) -> None:
+        if generation != self._generation:
+            return
+        self._in_flight.discard(query)
+        if not exception:
+            self._remote_cache.put(
+                query.remote_url, query.kind, query.reference, results
+            )
+            self._on_cached(query, results)
+        self._start_pending()
+
+    def _on_cached(self, query: _PrefetchQuery, results: typing.Any) -> None:
+        if query.kind != RemoteQueryKind.RECIPE_REVISIONS:
+            return
+        # the package ids of the latest revision are the most likely browsed next
+        latest = latest_recipe_revision(results)
+        if latest is not None:
+            self._queue(
+                _PrefetchQuery(
+                    query.remote_name,
+                    query.remote_url,
+                    RemoteQueryKind.PACKAGE_IDS,
+                    f"{query.reference}#{latest}",
+                )
+            )
@@ -10,8 +10,15 @@ from PySide6 import QtCore, QtGui, QtWidgets
 from cruiz.commands.context import ConanContext
 from cruiz.commands.logdetails import LogDetails
 from cruiz.pyside6.remote_browser import Ui_remotebrowser
+from cruiz.remote_browser.prefetcher import RemotePrefetcher
+from cruiz.settings.managers.basesettings import BaseSettings
 
 from cruizlib.constants import DEFAULT_CACHE_NAME
+from cruizlib.remote.cache import (
+    CACHE_DATABASE_NAME,
+    CACHE_DIRECTORY_NAME,
+    RemoteMetadataCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +42,10 @@ class RemoteBrowserDock(QtWidgets.QDockWidget):
         self._log_details = LogDetails(self._ui.log, None, True, False, None)
         self._log_details.logging.connect(self._ui.log.show)
         self._context = ConanContext(DEFAULT_CACHE_NAME, self._log_details)
+        self._remote_cache = RemoteMetadataCache(
+            BaseSettings.data_directory(CACHE_DIRECTORY_NAME) / CACHE_DATABASE_NAME
+        )
+        self._prefetcher = RemotePrefetcher(DEFAULT_CACHE_NAME, self._remote_cache)
         self._ui.pkgref.setup(self._ui)
         self._ui.rrev.setup(self._ui)
         self._ui.package_id.setup(self._ui)
@@ -45,10 +56,12 @@ class RemoteBrowserDock(QtWidgets.QDockWidget):
         """Override the widget's showEvent method."""
         # although this looks like a no-op, it regenerates necessary resources
         self._context.change_cache(self._context.cache_name)
+        self._prefetcher.change_cache(self._context.cache_name)
         super().showEvent(event)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """Override the widget's closeEvent method."""
+        self._prefetcher.cancel()
         if self._context.is_busy:
             QtWidgets.QMessageBox.warning(
                 self,
@@ -60,6 +73,8 @@ class RemoteBrowserDock(QtWidgets.QDockWidget):
             event.ignore()
             return
         self._context.close()
+        self._prefetcher.close()
+        # the remote metadata cache stays open, since the dock may be shown again
         super().closeEvent(event)
 
     def cleanup(self) -> None:
@@ -67,6 +82,8 @@ class RemoteBrowserDock(QtWidgets.QDockWidget):
         self._ui.stackedWidget.currentWidget().on_cancel()  # type: ignore[attr-defined]
         self._log_details.stop()
         self._context.close()
+        self._prefetcher.close()
+        self._remote_cache.close()
 
     def on_local_cache_modified(self, cache_name: str) -> None:
         """Call when a local cache has been changed upstream."""
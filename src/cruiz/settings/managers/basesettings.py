@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import inspect
+import pathlib
 import types
 import typing
 from dataclasses import dataclass
@@ -158,6 +159,11 @@ class BaseSettings:
             "preferences",  # application name
         )
 
+    @staticmethod
+    def data_directory(name: str) -> pathlib.Path:
+        """Get the path to a named directory of data stored beside the settings."""
+        return pathlib.Path(BaseSettings.make_settings().fileName()).parent / name
+
     @staticmethod
     def _location_of_key_value_pair(array_key: str, key: str, value: str) -> str:
         with BaseSettings.ReadArray(array_key) as (settings, size):
@@ -8,6 +8,8 @@ import typing
 
 from PySide6 import QtCore, QtGui
 
+from cruizlib.constants import GraphResolutionMode
+
 from .basesettings import (
     BaseSettings,
     BoolSetting,
@@ -67,6 +69,12 @@ class GeneralSettings(ComparableCommonSettings):
             "new_recipe_loading_behaviour": SettingMeta(
                 "NewLoadingBehaviour", BoolSetting, False, ScalarValue
             ),
+            "graph_resolution_mode": SettingMeta(
+                "GraphResolutionMode",
+                StringSetting,
+                GraphResolutionMode.CACHE_FIRST.value,
+                ScalarValue,
+            ),
         }
 
     @property
@@ -167,6 +175,15 @@ class GeneralSettings(ComparableCommonSettings):
     def new_recipe_loading_behaviour(self, value: str) -> None:
         self._set_value_via_meta(value)
 
+    @property
+    def graph_resolution_mode(self) -> StringSetting:
+        """Get how remotes are used when resolving dependency graphs."""
+        return self._get_value_via_meta()
+
+    @graph_resolution_mode.setter
+    def graph_resolution_mode(self, value: str) -> None:
+        self._set_value_via_meta(value)
+
 
 class GeneralSettingsReader:
     """Context manager to read from disk settings."""
@@ -8,6 +8,7 @@ import typing
 
 from .basesettings import (
     BaseSettings,
+    BoolSetting,
     ComparableCommonSettings,
     SettingMeta,
     StringSetting,
@@ -27,6 +28,9 @@ class GraphVizSettings(ComparableCommonSettings):
         super().__init__()
         self._property_meta = {
             "bin_directory": SettingMeta("BinDir", StringSetting, None, ScalarValue),
+            "use_graphviz": SettingMeta(
+                "UseGraphViz", BoolSetting, True, ScalarValue
+            ),
         }
 
     @property
@@ -38,6 +42,15 @@ class GraphVizSettings(ComparableCommonSettings):
     def bin_directory(self, value: str) -> None:
         self._set_value_via_meta(value)
 
+    @property
+    def use_graphviz(self) -> BoolSetting:
+        """Get whether GraphViz, rather than the built-in layout, draws graphs."""
+        return self._get_value_via_meta()
+
+    @use_graphviz.setter
+    def use_graphviz(self, value: bool) -> None:
+        self._set_value_via_meta(value)
+
 
 class GraphVizSettingsReader:
     """Context manager for reading GraphViz settings from disk."""
@@ -12,6 +12,7 @@ from multiprocessing import cpu_count
 from PySide6 import QtCore
 
 from cruizlib.exceptions import InconsistentSettingsError
+from cruizlib.graph.store import DependencyGraphStore, STORE_DIRECTORY_NAME
 
 from .basesettings import (
     BaseSettings,
@@ -32,6 +33,9 @@ if typing.TYPE_CHECKING:
 
     from cruizlib.constants import CompilerCacheTypes
 
+# name of the directory, beside the settings, of lockfiles written for recipes
+LOCKFILE_DIRECTORY_NAME = "lockfiles"
+
 
 class RecipeSettings(ComparableCommonSettings):
     """Representation of recipe settings."""
@@ -136,6 +140,13 @@ class RecipeSettings(ComparableCommonSettings):
             "compilercache_autotools_configuration": SettingMeta(
                 "CompilerCacheAutoToolsConfig", DictSetting, {}, DictValue
             ),
+            "lockfile": SettingMeta("Lockfile", StringSetting, None, ScalarValue),
+            "graph_resolution_mode": SettingMeta(
+                "GraphResolutionMode", StringSetting, None, ScalarValue
+            ),
+            "graph_structure_only": SettingMeta(
+                "GraphStructureOnly", BoolSetting, False, ScalarValue
+            ),
         }
 
     @property
@@ -390,6 +401,37 @@ class RecipeSettings(ComparableCommonSettings):
     def compiler_cache(self, value: bool) -> None:
         self._set_value_via_meta(value)
 
+    @property
+    def lockfile(self) -> StringSetting:
+        """Get the path to the lockfile that dependencies are resolved from."""
+        return self._get_value_via_meta()
+
+    @lockfile.setter
+    def lockfile(self, value: typing.Optional[str]) -> None:
+        self._set_value_via_meta(value)
+
+    @property
+    def graph_resolution_mode(self) -> StringSetting:
+        """
+        Get how remotes are used when resolving dependencies of this recipe.
+
+        None to use the general preference.
+        """
+        return self._get_value_via_meta()
+
+    @graph_resolution_mode.setter
+    def graph_resolution_mode(self, value: typing.Optional[str]) -> None:
+        self._set_value_via_meta(value)
+
+    @property
+    def graph_structure_only(self) -> BoolSetting:
+        """Get whether only the structure of the dependency graph is computed."""
+        return self._get_value_via_meta()
+
+    @graph_structure_only.setter
+    def graph_structure_only(self, value: bool) -> None:
+        self._set_value_via_meta(value)
+
     @property
     def compilercache_autotools_configuration(self) -> DictSetting:
         """Get the dictionary of autotools configuration for this recipe."""
@@ -510,5 +552,12 @@ class RecipeSettingsDeleter:
 
     def delete(self, uuid: QtCore.QUuid) -> None:
         """Delete the recipe settings from the specified UUID."""
-        group = f"Recipe/{uuid.toString(QtCore.QUuid.StringFormat.WithoutBraces)}"
-        self._settings.remove(group)
+        uuid_str = uuid.toString(QtCore.QUuid.StringFormat.WithoutBraces)
+        self._settings.remove(f"Recipe/{uuid_str}")
+        DependencyGraphStore(
+            BaseSettings.data_directory(STORE_DIRECTORY_NAME)
+        ).remove(uuid_str)
+        lockfile = BaseSettings.data_directory(LOCKFILE_DIRECTORY_NAME) / (
+            f"{uuid_str}.lock"
+        )
+        lockfile.unlink(missing_ok=True)
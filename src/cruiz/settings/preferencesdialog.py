@@ -249,6 +249,9 @@ class PreferencesDialog(QtWidgets.QDialog):
         self._ui.prefs_general_new_recipe_load.stateChanged.connect(
             self._general_newrecipeload
         )  # TODO: this has no place in the new UI
+        self._ui.prefs_general_graph_resolution.currentTextChanged.connect(
+            self._general_graph_resolution
+        )
 
     def _setup_font_toolbox(self) -> None:
         self._prefs_font = {
@@ -295,6 +298,9 @@ class PreferencesDialog(QtWidgets.QDialog):
             self,
         )
         open_graphviz_bindir_action.triggered.connect(self._graphviz_open_bindir)
+        self._ui.prefs_graphviz_use_graphviz.stateChanged.connect(
+            self._graphviz_use_graphviz_changed
+        )
         self._ui.prefs_graphviz_bin_directory.addAction(
             open_graphviz_bindir_action,
             QtWidgets.QLineEdit.ActionPosition.TrailingPosition,
@@ -551,6 +557,11 @@ class PreferencesDialog(QtWidgets.QDialog):
                 blocked_widget.setChecked(
                     settings.new_recipe_loading_behaviour.resolve()
                 )
+            with BlockSignals(
+                self._ui.prefs_general_graph_resolution
+            ) as blocked_widget:
+                assert isinstance(blocked_widget, QtWidgets.QComboBox)
+                blocked_widget.setCurrentText(settings.graph_resolution_mode.resolve())
 
     def _general_clearplanes(self, state: int) -> None:
         self._prefs_general.clear_panes = (
@@ -643,6 +654,10 @@ class PreferencesDialog(QtWidgets.QDialog):
         )
         self.modified.emit()
 
+    def _general_graph_resolution(self, text: str) -> None:
+        self._prefs_general.graph_resolution_mode = text
+        self.modified.emit()
+
     # -- font --
     @staticmethod
     def _font_from_details(
@@ -820,14 +835,24 @@ class PreferencesDialog(QtWidgets.QDialog):
     def _graphviz_load_defaults(self) -> None:
         with GraphVizSettingsReader() as settings:
             bin_path = settings.bin_directory.resolve()
+            use_graphviz = settings.use_graphviz.resolve()
         with BlockSignals(self._ui.prefs_graphviz_bin_directory) as blocked_widget:
             assert isinstance(blocked_widget, QtWidgets.QLineEdit)
             blocked_widget.setText(bin_path)
+        with BlockSignals(self._ui.prefs_graphviz_use_graphviz) as blocked_widget:
+            assert isinstance(blocked_widget, QtWidgets.QCheckBox)
+            blocked_widget.setChecked(use_graphviz)
 
     def _graphviz_bin_directory_changed(self, text: str) -> None:
         self._prefs_graphviz.bin_directory = text or None  # type: ignore
         self.modified.emit()
 
+    def _graphviz_use_graphviz_changed(self, state: int) -> None:
+        self._prefs_graphviz.use_graphviz = (
+            QtCore.Qt.CheckState(state) == QtCore.Qt.CheckState.Checked
+        )
+        self.modified.emit()
+
     def _graphviz_open_bindir(self) -> None:
         with GraphVizSettingsReader() as settings:
             last_dir = settings.bin_directory.resolve()
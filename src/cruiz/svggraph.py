@@ -5,19 +5,24 @@
 from __future__ import annotations
 
 import os
+import subprocess
+import threading
 import typing
 
 from PySide6 import QtCore, QtGui, QtSvg, QtSvgWidgets, QtWidgets
 
 from cruiz.settings.managers.graphvizpreferences import GraphVizSettingsReader
 
-from cruizlib.environ import EnvironSaver
+from cruizlib.graph.cache import LRUCache, dependency_graph_hash
+from cruizlib.graph.traversal import DepthFirstTraversal
 
 import graphviz
 
 if typing.TYPE_CHECKING:
     from cruizlib.interop.dependencygraph import DependencyGraph
-    from cruizlib.interop.packagenode import PackageNode
+
+# shared by all views, keyed on the graph content and layout options
+_SVG_CACHE: LRUCache[bytes] = LRUCache(capacity=16)
 
 
 class DependenciesToDigraph:
@@ -36,59 +41,152 @@ class DependenciesToDigraph:
         graph.attr(rankdir=rankdir)
         graph.attr("edge", color="red")
         graph.attr("node", color="blue", style="filled", fillcolor="white")
-        self._visited: typing.List[PackageNode] = []
-        self._edges: typing.List[typing.Tuple[PackageNode, PackageNode]] = []
-        self._visit(graph, depgraph.root, flipped_edges)
+        self._visit(graph, depgraph, flipped_edges)
         self.digraph = graph
 
+    @staticmethod
     def _visit(
-        self, graph: graphviz.Digraph, node: PackageNode, flipped_edges: bool
+        graph: graphviz.Digraph, depgraph: DependencyGraph, flipped_edges: bool
     ) -> None:
-        def _format_ref(ref: str) -> str:
-            return ref.replace("@", "@\n")
-
-        if node not in self._visited:
-            node_name_and_id = _format_ref(node.reference)
-            if node.is_runtime:
+        traversal = DepthFirstTraversal(depgraph)
+        names = {
+            node_id: depgraph.node(node_id).reference.replace("@", "@\n")
+            for node_id in traversal.node_ids
+        }
+        for node_id in traversal.node_ids:
+            node_name_and_id = names[node_id]
+            if depgraph.node(node_id).is_runtime:
                 graph.node(node_name_and_id, id=node_name_and_id)
             else:
                 graph.node(node_name_and_id, fillcolor="gray", id=node_name_and_id)
-            self._visited.append(node)
-        for child in node.children:
-            self._visit(graph, child, flipped_edges)
-            if (child, node) not in self._edges:
-                if flipped_edges:
-                    graph.edge(
-                        _format_ref(node.reference), _format_ref(child.reference)
-                    )
-                else:
-                    graph.edge(
-                        _format_ref(child.reference), _format_ref(node.reference)
-                    )
-                self._edges.append((child, node))
-
-
-class DigraphToSVG:
-    """Convert a Graphviz Digraph to an SVG."""
-
-    def __init__(self, depstodigraph: DependenciesToDigraph) -> None:
-        """Initialise a DigraphToSVG."""
-        with EnvironSaver():
-            with GraphVizSettingsReader() as settings:
-                graphviz_bin_dir = settings.bin_directory.resolve()
-            if graphviz_bin_dir:
-                os.environ["PATH"] = (
-                    QtCore.QDir.toNativeSeparators(graphviz_bin_dir)
-                    + os.pathsep
-                    + os.environ["PATH"]
-                )
-            exe_path = QtCore.QStandardPaths.findExecutable("dot")
-            if not exe_path:
-                # if dot cannot be found, abort before trying any graphviz work
-                raise FileNotFoundError(
-                    "Cannot find 'dot' to generate dependency graph visualisation"
+        for child, parent in traversal.edges:
+            if flipped_edges:
+                graph.edge(names[parent], names[child])
+            else:
+                graph.edge(names[child], names[parent])
+
+
+def _graphviz_environment() -> typing.Tuple[str, typing.Dict[str, str]]:
+    # the environment is passed to dot, rather than modifying os.environ, as
+    # SVGs are generated on background threads
+    env = os.environ.copy()
+    with GraphVizSettingsReader() as settings:
+        graphviz_bin_dir = settings.bin_directory.resolve()
+    if graphviz_bin_dir:
+        env["PATH"] = (
+            QtCore.QDir.toNativeSeparators(graphviz_bin_dir)
+            + os.pathsep
+            + env.get("PATH", "")
+        )
+    exe_path = QtCore.QStandardPaths.findExecutable(
+        "dot", env["PATH"].split(os.pathsep) if "PATH" in env else []
+    )
+    if not exe_path:
+        # if dot cannot be found, abort before trying any graphviz work
+        raise FileNotFoundError(
+            "Cannot find 'dot' to generate dependency graph visualisation"
+        )
+    return exe_path, env
+
+
+class SVGGenerator(QtCore.QObject):
+    """
+    Generate SVGs of dependency graphs on a background thread.
+
+    A new request cancels any request still in progress, killing its 'dot'
+    process. Generated SVGs are cached, keyed on the graph content and the
+    layout options, so repeated requests are immediate.
+    """
+
+    generated = QtCore.Signal(bytes)
+    failed = QtCore.Signal(str)
+    _finished = QtCore.Signal(int, str, bytes, str)
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = None) -> None:
+        """Initialise an SVGGenerator."""
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._request = 0
+        self._process: typing.Optional[subprocess.Popen[bytes]] = None
+        self._finished.connect(self._on_finished)
+
+    def generate(
+        self, depgraph: DependencyGraph, rankdir: str, flipped_edges: bool = False
+    ) -> None:
+        """Request the SVG of the dependency graph; emits generated or failed."""
+        self.cancel()
+        key = f"{dependency_graph_hash(depgraph)}:{rankdir}:{flipped_edges}"
+        svg = _SVG_CACHE.get(key)
+        if svg is not None:
+            self.generated.emit(svg)
+            return
+        try:
+            exe_path, env = _graphviz_environment()
+        except FileNotFoundError as exc:
+            self.failed.emit(str(exc))
+            return
+        with self._lock:
+            request = self._request
+        threading.Thread(
+            target=self._run,
+            args=(request, key, depgraph, rankdir, flipped_edges, exe_path, env),
+            daemon=True,
+        ).start()
+
+    def cancel(self) -> None:
+        """Cancel any SVG being generated."""
+        with self._lock:
+            self._request += 1
+            if self._process is not None:
+                self._process.kill()
+                self._process = None
+
+    def _run(
+        self,
+        request: int,
+        key: str,
+        depgraph: DependencyGraph,
+        rankdir: str,
+        flipped_edges: bool,
+        exe_path: str,
+        env: typing.Dict[str, str],
+    ) -> None:
+        source = DependenciesToDigraph(depgraph, rankdir, flipped_edges).digraph.source
+        try:
+            with self._lock:
+                if request != self._request:
+                    return
+                process = self._process = subprocess.Popen(
+                    [exe_path, "-Tsvg"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=env,
                 )
-            self.svg = depstodigraph.digraph.pipe()
+            svg, errors = process.communicate(source.encode("utf-8"))
+        except OSError as exc:
+            self._finished.emit(request, key, b"", str(exc))
+            return
+        with self._lock:
+            if request != self._request:
+                return
+            self._process = None
+        if process.returncode:
+            self._finished.emit(
+                request, key, b"", errors.decode("utf-8", errors="replace")
+            )
+        else:
+            self._finished.emit(request, key, svg, "")
+
+    def _on_finished(self, request: int, key: str, svg: bytes, error: str) -> None:
+        if request != self._request:
+            # superseded
+            return
+        if error:
+            self.failed.emit(error)
+            return
+        _SVG_CACHE.put(key, svg)
+        self.generated.emit(svg)
 
 
 class _SVGDialog(QtWidgets.QDialog):
@@ -156,10 +254,16 @@ class SVGScene(QtWidgets.QGraphicsScene):
         item.setSharedRenderer(renderer)
         self.addItem(item)
 
-    def mouseDoubleClickEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
-        """Override the default mouseDoubleClickEvent to show a dialog."""
-        item = self.itemAt(event.scenePos(), QtGui.QTransform())
+    def activate(self, position: QtCore.QPointF) -> bool:
+        """Show a dialog of the SVG, if it is at the position."""
+        item = self.itemAt(position, QtGui.QTransform())
         if item and isinstance(item, QtSvgWidgets.QGraphicsSvgItem):
             _SVGDialog(self._renderer).exec_()
+            return True
+        return False
+
+    def mouseDoubleClickEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
+        """Override the default mouseDoubleClickEvent to show a dialog."""
+        if self.activate(event.scenePos()):
             event.setAccepted(True)
         return super().mouseDoubleClickEvent(event)
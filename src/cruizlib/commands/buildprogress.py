@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+Tracking build progress from command output.
+
+Ninja reports progress as [completed/total] and Makefiles as [ percent%].
+The HTML lines are matched directly, so that no conversion is needed for
+the vast majority of lines that are not progress lines.
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import re
+import time
+import typing
+
+_PROGRESS_EXPR = re.compile(
+    r"^(?:<[^>]*>)*\[(?:\s|&nbsp;)*(?P<completed>\d+)"
+    r"(?:/(?P<total>\d+)|(?P<percent>%))\]"
+)
+
+# seconds of samples used to calculate the current rate
+RATE_WINDOW = 20.0
+# minimum seconds between recorded rate history samples
+HISTORY_INTERVAL = 1.0
+# number of recent rate history samples reported with each progress update
+RECENT_HISTORY_LENGTH = 30
+# progress falling below this fraction of that completed is a new build
+NEW_BUILD_FRACTION = 0.5
+
+
+@dataclasses.dataclass(frozen=True)
+class BuildProgress:
+    """A snapshot of the progress of a build."""
+
+    completed: int
+    total: int
+    is_percentage: bool
+    elapsed: float
+    rate: typing.Optional[float]
+    eta: typing.Optional[float]
+    recent_rates: typing.Tuple[float, ...]
+
+
+def parse_progress(
+    html_line: str,
+) -> typing.Optional[typing.Tuple[int, int, bool]]:
+    """Parse a line of output for (completed, total, is_percentage)."""
+    if "[" not in html_line:
+        return None
+    match = _PROGRESS_EXPR.match(html_line)
+    if not match:
+        return None
+    completed = int(match["completed"])
+    if match["percent"]:
+        return completed, 100, True
+    return completed, int(match["total"]), False
+
+
+class BuildProgressTracker:
+    """
+    Track the progress of builds, and the rate at which targets are completed.
+
+    The rate is measured over a sliding window, and a history of rates is kept
+    so that stalls and slow periods can be seen after the event.
+    A new build is detected when the total changes, or progress falls back
+    towards the start. Parallel builds report progress slightly out of order,
+    so smaller falls are treated as no progress.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(
+        self, clock: typing.Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialise a BuildProgressTracker."""
+        self._clock = clock
+        self._start = clock()
+        self._samples: typing.Deque[typing.Tuple[float, int]] = collections.deque()
+        self._total: typing.Optional[int] = None
+        self._completed = 0
+        self.history: typing.List[typing.Tuple[float, float]] = []
+
+    def _reset(self, now: float, total: int) -> None:
+        self._start = now
+        self._samples.clear()
+        self._total = total
+        self._completed = 0
+        self.history = []
+
+    def feed(self, html_line: str) -> typing.Optional[BuildProgress]:
+        """Feed a line of output, returning the updated progress if it changed."""
+        parsed = parse_progress(html_line)
+        if parsed is None:
+            return None
+        completed, total, is_percentage = parsed
+        now = self._clock()
+        if total != self._total or completed < self._completed * NEW_BUILD_FRACTION:
+            self._reset(now, total)
+        completed = max(completed, self._completed)
+        self._completed = completed
+        self._samples.append((now, completed))
+        while len(self._samples) > 2 and now - self._samples[0][0] > RATE_WINDOW:
+            self._samples.popleft()
+        elapsed = now - self._start
+        rate = None
+        eta = None
+        oldest_time, oldest_completed = self._samples[0]
+        if now > oldest_time:
+            rate = (completed - oldest_completed) / (now - oldest_time)
+            if rate > 0:
+                eta = (total - completed) / rate
+            if not self.history or elapsed - self.history[-1][0] >= HISTORY_INTERVAL:
+                self.history.append((elapsed, rate))
+        recent_rates = tuple(
+            sample_rate for _, sample_rate in self.history[-RECENT_HISTORY_LENGTH:]
+        )
+        return BuildProgress(
+            completed, total, is_percentage, elapsed, rate, eta, recent_rates
+        )
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration in seconds in a compact human readable form."""
+    hours, remainder = divmod(int(round(seconds)), 3600)
+    minutes, whole_seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{whole_seconds:02d}s"
+    return f"{whole_seconds}s"
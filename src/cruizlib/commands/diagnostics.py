@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+
+"""
+Extraction of compiler, linker and CMake diagnostics from command output.
+
+Command output arrives as HTML lines, so these are converted back to plain
+text before matching. A cheap keyword check is made on every line first, so
+that the regular expressions are only run over the small number of lines
+that could possibly be diagnostics.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import html
+import re
+import typing
+from enum import Enum
+
+
+class DiagnosticSeverity(Enum):
+    """Severity of a diagnostic."""
+
+    ERROR = "error"
+    WARNING = "warning"
+    NOTE = "note"
+
+
+@dataclasses.dataclass(frozen=True)
+class Diagnostic:
+    """A diagnostic extracted from a line of command output."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    severity: DiagnosticSeverity
+    tool: str
+    message: str
+    file: typing.Optional[str]
+    line: typing.Optional[int]
+    column: typing.Optional[int]
+    text: str
+    is_stderr: bool
+
+
+_KEYWORDS = (
+    "error",
+    "Error",
+    "warning",
+    "Warning",
+    "note:",
+    "undefined reference",
+    "multiple definition",
+    "cannot find",
+)
+
+_TAG_EXPR = re.compile(r"<[^>]*>")
+
+_GCC_CLANG_EXPR = re.compile(
+    r"^(?P<file>(?:[A-Za-z]:)?[^:\s][^:]*?):(?P<line>\d+):(?:(?P<column>\d+):)?\s*"
+    r"(?P<severity>fatal error|error|warning|note):\s*(?P<message>.*)$"
+)
+_MSVC_EXPR = re.compile(
+    r"^\s*(?:\d+>)?(?P<file>[^(\s][^(]*?)\((?P<line>\d+)(?:,(?P<column>\d+))?\)"
+    r"\s*:\s*(?P<severity>fatal error|error|warning)\s+(?P<code>[A-Z]+\d+)\s*:\s*"
+    r"(?P<message>.*)$"
+)
+_MSVC_LINK_EXPR = re.compile(
+    r"^\s*(?:\d+>)?(?P<file>[^:]+?)\s*:\s*(?P<severity>fatal error|error|warning)\s+"
+    r"(?P<code>LNK\d+)\s*:\s*(?P<message>.*)$"
+)
+_CMAKE_EXPR = re.compile(
+    r"^CMake (?:Deprecation )?(?P<severity>Error|Warning)(?: \(dev\))?"
+    r"(?: at (?P<file>.+?):(?P<line>\d+)(?: \([^)]*\))?)?:?\s*(?P<message>.*)$"
+)
+_CMAKE_CALL_STACK = "Call Stack (most recent call first):"
+_GNU_UNDEFINED_EXPR = re.compile(
+    r"^(?P<file>[^:]+?):(?:(?P<line>\d+)|\([^)]*\)):?\s*"
+    r"(?P<message>(?:undefined reference|multiple definition) .*)$"
+)
+_GNU_LINKER_EXPR = re.compile(
+    r"^(?:\S*[/\\])?(?:ld|ld\.lld|ld\.gold|ld64\.lld|lld-link|collect2)(?:\.exe)?:"
+    r"\s*(?:(?P<severity>fatal error|error|warning):\s*)?(?P<message>.*)$"
+)
+_DRIVER_EXPR = re.compile(
+    r"^(?:\S*[/\\])?(?P<tool>[\w.+-]*(?:gcc|g\+\+|clang|clang\+\+|cc|c\+\+))"
+    r"(?:\.exe)?:\s*(?P<severity>fatal error|error|warning):\s*(?P<message>.*)$"
+)
+
+
+def _severity(text: str) -> DiagnosticSeverity:
+    text = text.lower()
+    if "error" in text:
+        return DiagnosticSeverity.ERROR
+    if "warning" in text:
+        return DiagnosticSeverity.WARNING
+    return DiagnosticSeverity.NOTE
+
+
+def _optional_int(text: typing.Optional[str]) -> typing.Optional[int]:
+    return int(text) if text else None
+
+
+def html_to_text(html_line: str) -> str:
+    """Convert a line of HTML command output back into plain text."""
+    text = html_line.replace("<br>", "\n")
+    text = _TAG_EXPR.sub("", text)
+    return html.unescape(text).replace("\xa0", " ")
+
+
+# pylint: disable=too-many-return-statements
+def parse_diagnostic(
+    line: str, is_stderr: bool = False
+) -> typing.Optional[Diagnostic]:
+    """Parse a single line of plain text, returning a Diagnostic if recognised."""
+    stripped = line.strip()
+    if not stripped:
+        return None
+    match = _CMAKE_EXPR.match(stripped)
+    if match:
+        return Diagnostic(
+            _severity(match["severity"]),
+            "CMake",
+            match["message"],
+            match["file"],
+            _optional_int(match["line"]),
+            None,
+            stripped,
+            is_stderr,
+        )
+    match = _MSVC_EXPR.match(stripped)
+    if match:
+        return Diagnostic(
+            _severity(match["severity"]),
+            "MSVC",
+            f"{match['code']}: {match['message']}",
+            match["file"],
+            _optional_int(match["line"]),
+            _optional_int(match["column"]),
+            stripped,
+            is_stderr,
+        )
+    match = _MSVC_LINK_EXPR.match(stripped)
+    if match:
+        return Diagnostic(
+            _severity(match["severity"]),
+            "Linker",
+            f"{match['code']}: {match['message']}",
+            match["file"],
+            None,
+            None,
+            stripped,
+            is_stderr,
+        )
+    match = _GNU_UNDEFINED_EXPR.match(stripped)
+    if match:
+        return Diagnostic(
+            DiagnosticSeverity.ERROR,
+            "Linker",
+            match["message"],
+            match["file"],
+            _optional_int(match["line"]),
+            None,
+            stripped,
+            is_stderr,
+        )
+    match = _GNU_LINKER_EXPR.match(stripped)
+    if match:
+        message = match["message"]
+        if match["severity"]:
+            severity = _severity(match["severity"])
+        elif any(keyword in message for keyword in _KEYWORDS):
+            severity = DiagnosticSeverity.ERROR
+        else:
+            # context lines such as "in function 'main':"
+            return None
+        return Diagnostic(
+            severity, "Linker", message, None, None, None, stripped, is_stderr
+        )
+    match = _GCC_CLANG_EXPR.match(stripped)
+    if match:
+        return Diagnostic(
+            _severity(match["severity"]),
+            "GCC/Clang",
+            match["message"],
+            match["file"],
+            _optional_int(match["line"]),
+            _optional_int(match["column"]),
+            stripped,
+            is_stderr,
+        )
+    match = _DRIVER_EXPR.match(stripped)
+    if match:
+        return Diagnostic(
+            _severity(match["severity"]),
+            "Linker" if "linker" in match["message"] else "GCC/Clang",
+            match["message"],
+            None,
+            None,
+            None,
+            stripped,
+            is_stderr,
+        )
+    return None
+
+
+class DiagnosticsExtractor:
+    """
+    Incrementally extract diagnostics from HTML lines of command output.
+
+    CMake diagnostics put their message on the indented lines that follow,
+    which may be separated by blank lines and followed by a call stack, so
+    these are held back until the next unindented line, or the end of output.
+    """
+
+    def __init__(self) -> None:
+        """Initialise a DiagnosticsExtractor."""
+        self._pending: typing.Optional[Diagnostic] = None
+        self._pending_message: typing.List[str] = []
+
+    def feed(self, html_line: str, is_stderr: bool) -> typing.List[Diagnostic]:
+        """Feed a line of HTML output, returning any diagnostics completed by it."""
+        if self._pending is None and not any(
+            keyword in html_line for keyword in _KEYWORDS
+        ):
+            return []
+        found: typing.List[Diagnostic] = []
+        for line in html_to_text(html_line).splitlines() or [""]:
+            if self._pending is not None:
+                if not line.strip():
+                    # separates paragraphs of the message
+                    continue
+                if line[:1].isspace() or line.startswith(_CMAKE_CALL_STACK):
+                    self._pending_message.append(line.strip())
+                    continue
+                found.extend(self.flush())
+            diagnostic = parse_diagnostic(line, is_stderr)
+            if diagnostic is None:
+                continue
+            if diagnostic.tool == "CMake" and not diagnostic.message:
+                self._pending = diagnostic
+                self._pending_message = []
+            else:
+                found.append(diagnostic)
+        return found
+
+    def flush(self) -> typing.List[Diagnostic]:
+        """Return any diagnostic still waiting for the rest of its message."""
+        if self._pending is None:
+            return []
+        diagnostic = dataclasses.replace(
+            self._pending, message=" ".join(self._pending_message)
+        )
+        self._pending = None
+        self._pending_message = []
+        return [diagnostic]
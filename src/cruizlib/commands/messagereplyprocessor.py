@@ -13,16 +13,20 @@ import logging
 import multiprocessing
 import sys
 import threading
+import time
 import typing
 
 from PySide6 import QtCore
 
 import cruizlib.workers.api as workers_api
+from cruizlib.commands.buildprogress import BuildProgressTracker
+from cruizlib.commands.diagnostics import DiagnosticsExtractor
 from cruizlib.dumpobjecttypes import dump_object_types
 from cruizlib.interop.message import (
     ConanLogMessage,
     End,
     Failure,
+    PartialSuccess,
     Stderr,
     Stdout,
     Success,
@@ -30,10 +34,14 @@ from cruizlib.interop.message import (
 from cruizlib.workers.utils.text2html import text_to_html
 
 if typing.TYPE_CHECKING:
+    from cruizlib.commands.diagnostics import Diagnostic
     from cruizlib.multiprocessingmessagequeuetype import MultiProcessingMessageQueueType
 
 logger = logging.getLogger(__name__)
 
+# minimum seconds between build progress updates
+BUILD_PROGRESS_INTERVAL = 0.25
+
 
 def coverage_resolve_trace(fn: typing.Any) -> typing.Any:
     """
@@ -62,9 +70,12 @@ class MessageReplyProcessor(QtCore.QObject):
     """
 
     completed = QtCore.Signal(object, Exception)
+    partial_result = QtCore.Signal(object)
     stdout_message = QtCore.Signal(str)
     stderr_message = QtCore.Signal(str)
     conan_log_message = QtCore.Signal(str)
+    diagnostics = QtCore.Signal(list)
+    build_progress = QtCore.Signal(object)
     critical_failure = QtCore.Signal(str)
 
     def __del__(self) -> None:
@@ -80,6 +91,9 @@ class MessageReplyProcessor(QtCore.QObject):
         super().__init__()
         self._mp_context = multiprocessing.get_context("spawn")
         self._queue = queue
+        self._diagnostics_extractor = DiagnosticsExtractor()
+        self._build_progress_tracker = BuildProgressTracker()
+        self._last_build_progress_time = 0.0
 
     def stop(self) -> None:
         """Stop the background thread."""
@@ -101,6 +115,25 @@ class MessageReplyProcessor(QtCore.QObject):
         self.critical_failure.emit("Conan has leaked into cruiz")  # pragma: no cover
         return False  # pragma: no cover
 
+    def _emit_diagnostics(self, found: typing.List[Diagnostic]) -> None:
+        # extracted here on the background thread, so as not to slow the log
+        if found:
+            self.diagnostics.emit(found)
+
+    def _track_build_progress(self, html_line: str) -> None:
+        progress = self._build_progress_tracker.feed(html_line)
+        if progress is None:
+            return
+        # throttle, so that fast builds do not flood the UI with updates
+        now = time.monotonic()
+        if (
+            progress.completed < progress.total
+            and now - self._last_build_progress_time < BUILD_PROGRESS_INTERVAL
+        ):
+            return
+        self._last_build_progress_time = now
+        self.build_progress.emit(progress)
+
     # pylint: disable=too-many-branches
     @coverage_resolve_trace
     def process(self) -> None:
@@ -122,16 +155,28 @@ class MessageReplyProcessor(QtCore.QObject):
                 if not self.__check_for_conan_leakage(entry):
                     break  # pragma: no cover
                 if isinstance(entry, End):
+                    self._emit_diagnostics(self._diagnostics_extractor.flush())
                     break
                 if isinstance(entry, Stdout):
                     self.stdout_message.emit(entry.message)
+                    self._track_build_progress(entry.message)
+                    self._emit_diagnostics(
+                        self._diagnostics_extractor.feed(entry.message, False)
+                    )
                 elif isinstance(entry, Stderr):
                     self.stderr_message.emit(entry.message)
+                    self._emit_diagnostics(
+                        self._diagnostics_extractor.feed(entry.message, True)
+                    )
                 elif isinstance(entry, ConanLogMessage):
                     self.conan_log_message.emit(entry.message)
+                elif isinstance(entry, PartialSuccess):
+                    self.partial_result.emit(entry.payload)
                 elif isinstance(entry, Success):
+                    self._emit_diagnostics(self._diagnostics_extractor.flush())
                     self.completed.emit(entry.payload, None)
                 elif isinstance(entry, Failure):
+                    self._emit_diagnostics(self._diagnostics_extractor.flush())
                     # TODO: temporary, at least always record the exception
                     # in the error log
                     if entry.html:
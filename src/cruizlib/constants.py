@@ -27,4 +27,15 @@ class CompilerCacheTypes(Enum):
     BUILDCACHE = "buildcache"
 
 
+class GraphResolutionMode(Enum):
+    """How remotes are used when resolving a dependency graph."""
+
+    # only use the local cache, failing on any package not in it
+    OFFLINE = "offline"
+    # use the local cache, only contacting remotes for packages not in it
+    CACHE_FIRST = "cache-first"
+    # check remotes for newer versions and revisions of every package
+    ALWAYS_UPDATE = "always-update"
+
+
 DEFAULT_CACHE_NAME = "Default"
@@ -0,0 +1 @@
+"""Utilities for computing with, and storing, dependency graphs."""
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+"""
+Content-hash keyed cache of dependency graphs.
+
+Computing a dependency graph means running Conan in a child process, and
+(when updating) contacting remotes. When none of the inputs to the graph
+have changed, the previous result can be reused instead.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import pathlib
+import typing
+
+from cruizlib.constants import GraphResolutionMode
+
+if typing.TYPE_CHECKING:
+    from cruizlib.interop.commandparameters import CommandParameters
+    from cruizlib.interop.dependencygraph import DependencyGraph
+
+
+def _update_with_file(hasher: typing.Any, path: typing.Optional[pathlib.Path]) -> None:
+    # a missing file hashes differently to an empty file
+    if path is not None:
+        try:
+            hasher.update(path.read_bytes())
+            hasher.update(b"\x01")
+            return
+        except OSError:
+            pass
+    hasher.update(b"\x00")
+
+
+def _update_with_text(hasher: typing.Any, name: str, value: typing.Any) -> None:
+    hasher.update(f"{name}={value}".encode("utf-8"))
+    hasher.update(b"\x00")
+
+
+def dependency_graph_cache_key(
+    params: CommandParameters,
+    profile_path: typing.Optional[pathlib.Path],
+    attribute_overrides: typing.Dict[str, str],
+    conan_version: str,
+    local_cache_name: str,
+) -> str:
+    """
+    Get the key identifying the dependency graph computed from these inputs.
+
+    The key changes when the content of the recipe, its conandata.yml, the
+    profile or any lockfile changes, as well as when any options, attribute
+    overrides, the local cache, the Conan version, updating from remotes or
+    analysing binaries change.
+    """
+    hasher = hashlib.sha256()
+    recipe_path = pathlib.Path(params.recipe_path) if params.recipe_path else None
+    _update_with_file(hasher, recipe_path)
+    _update_with_file(
+        hasher, recipe_path.parent / "conandata.yml" if recipe_path else None
+    )
+    _update_with_file(hasher, profile_path)
+    _update_with_text(hasher, "recipe_path", recipe_path)
+    _update_with_text(hasher, "profile", params.profile)
+    _update_with_text(hasher, "name", params.name)
+    _update_with_text(hasher, "version", params.version)
+    _update_with_text(hasher, "user", params.user)
+    _update_with_text(hasher, "channel", params.channel)
+    for key, value in sorted(params.options.items()):
+        _update_with_text(hasher, f"option:{key}", value)
+    for key, value in sorted(attribute_overrides.items()):
+        _update_with_text(hasher, f"attribute:{key}", value)
+    _update_with_text(hasher, "conan_version", conan_version)
+    _update_with_text(hasher, "local_cache", local_cache_name)
+    if params.lockfile:
+        # only when locked, so that unlocked keys are unchanged
+        _update_with_file(hasher, pathlib.Path(params.lockfile))
+        _update_with_text(hasher, "lockfile", params.lockfile)
+    if params.graph_resolution_mode == GraphResolutionMode.ALWAYS_UPDATE:
+        # offline and cache first resolve the same graph from the local cache
+        _update_with_text(hasher, "update", True)
+    if params.graph_structure_only:
+        # binaries are not analysed, so there are no package_ids
+        _update_with_text(hasher, "structure_only", True)
+    return hasher.hexdigest()
+
+
+def dependency_graph_hash(graph: DependencyGraph) -> str:
+    """Get a hash of the content of the dependency graph."""
+    hasher = hashlib.sha256()
+    for string in graph.strings:
+        _update_with_text(hasher, "string", string)
+    for node_id in range(graph.node_count):
+        hasher.update(graph.string_fields(node_id).tobytes())
+        hasher.update(graph.flags(node_id).to_bytes(1, "little"))
+        hasher.update(graph.child_ids(node_id).tobytes())
+        hasher.update(b"\x00")
+    _update_with_text(hasher, "root", graph.root_id)
+    return hasher.hexdigest()
+
+
+ValueT = typing.TypeVar("ValueT")
+
+
+class LRUCache(typing.Generic[ValueT]):
+    """Least recently used cache of values, keyed on strings."""
+
+    def __init__(self, capacity: int = 32) -> None:
+        """Initialise an LRUCache."""
+        self._capacity = capacity
+        self._values: typing.OrderedDict[str, ValueT] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached values."""
+        return len(self._values)
+
+    def get(self, key: str) -> typing.Optional[ValueT]:
+        """Get the value cached for the key, if any."""
+        value = self._values.get(key)
+        if value is not None:
+            self._values.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: ValueT) -> None:
+        """Cache the value for the key."""
+        self._values[key] = value
+        self._values.move_to_end(key)
+        while len(self._values) > self._capacity:
+            self._values.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Remove any value cached for the key."""
+        self._values.pop(key, None)
+
+
+class DependencyGraphCache(LRUCache["DependencyGraph"]):
+    """Least recently used cache of dependency graphs, keyed on their inputs."""
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+"""
+Reduce the level of detail of dependency graphs, for visualisation.
+
+Subtrees may be collapsed into the node at their root, and build time
+(non-runtime) dependencies grouped into a single node.
+"""
+
+from __future__ import annotations
+
+import typing
+from dataclasses import dataclass
+
+from cruizlib.interop.dependencygraph import DependencyGraphBuilder
+
+if typing.TYPE_CHECKING:
+    from cruizlib.interop.dependencygraph import DependencyGraph
+
+BUILD_GROUP_NAME = "build requirements"
+
+
+@dataclass
+class ReducedGraph:
+    """A dependency graph with less detail, and how it relates to the original."""
+
+    graph: DependencyGraph
+    # ids of the nodes in the original graph represented by each node
+    members: typing.List[typing.List[int]]
+    # number of nodes hidden by each collapsed node
+    hidden_counts: typing.Dict[int, int]
+    group_id: typing.Optional[int]
+
+
+def _reachable(
+    graph: DependencyGraph, start: int, expand: typing.Callable[[int], bool]
+) -> typing.List[int]:
+    visited = bytearray(graph.node_count)
+    visited[start] = 1
+    order = [start]
+    pending = [start]
+    while pending:
+        node_id = pending.pop()
+        if not expand(node_id):
+            continue
+        for child in graph.child_ids(node_id):
+            if not visited[child]:
+                visited[child] = 1
+                order.append(child)
+                pending.append(child)
+    return order
+
+
+def reduce_graph(
+    graph: DependencyGraph,
+    collapsed: typing.AbstractSet[int],
+    group_build_requirements: bool = False,
+) -> ReducedGraph:
+    """
+    Reduce the graph, collapsing the subtrees of some nodes.
+
+    A collapsed node hides its descendants, unless they are also reachable
+    from the root without passing through a collapsed node.
+    """
+    # pylint: disable=too-many-locals
+    visible = _reachable(
+        graph, graph.root_id, lambda node_id: node_id not in collapsed
+    )
+    is_visible = bytearray(graph.node_count)
+    for node_id in visible:
+        is_visible[node_id] = 1
+    hidden_counts_by_node = {
+        node_id: sum(
+            1
+            for descendant in _reachable(graph, node_id, lambda _: True)
+            if not is_visible[descendant]
+        )
+        for node_id in visible
+        if node_id in collapsed
+    }
+
+    builder = DependencyGraphBuilder()
+    new_id_of: typing.Dict[int, int] = {}
+    members: typing.List[typing.List[int]] = []
+    group_id = None
+    grouped = [
+        node_id
+        for node_id in visible
+        if group_build_requirements
+        and node_id != graph.root_id
+        and not graph.node(node_id).is_runtime
+    ]
+    for node_id in visible:
+        if grouped and node_id in new_id_of:
+            continue
+        if grouped and node_id == grouped[0]:
+            group_id = builder.add_node(
+                BUILD_GROUP_NAME,
+                f"{len(grouped)} {BUILD_GROUP_NAME}",
+                "",
+                "",
+                False,
+                None,
+                False,
+                "",
+            )
+            members.append(list(grouped))
+            new_id_of.update((member, group_id) for member in grouped)
+            continue
+        new_id_of[node_id] = builder.add_package_node(graph.node(node_id))
+        members.append([node_id])
+
+    added_edges: typing.Set[typing.Tuple[int, int]] = set()
+    for node_id in visible:
+        if node_id in collapsed:
+            continue
+        for child in graph.child_ids(node_id):
+            edge = (new_id_of[node_id], new_id_of[child])
+            if edge[0] != edge[1] and edge not in added_edges:
+                added_edges.add(edge)
+                builder.add_edge(*edge)
+    hidden_counts: typing.Dict[int, int] = {}
+    for node_id, count in hidden_counts_by_node.items():
+        new_id = new_id_of[node_id]
+        hidden_counts[new_id] = hidden_counts.get(new_id, 0) + count
+    return ReducedGraph(
+        builder.build(new_id_of[graph.root_id]), members, hidden_counts, group_id
+    )
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""
+Differences between two dependency graphs.
+
+Nodes are first matched exactly, by reference and package id, and are then
+unchanged. Remaining nodes are paired by package name and whether they are
+runtime dependencies, so that a different reference is a version change,
+and the same reference with a different package id is a package id change.
+Anything left over was added or removed. Each pass is a dictionary lookup
+per node, so the diff is linear in the size of the graphs.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing
+from enum import Enum
+
+if typing.TYPE_CHECKING:
+    from cruizlib.interop.dependencygraph import DependencyGraph
+
+
+class ChangeKind(Enum):
+    """Kind of change to a package between two dependency graphs."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    VERSION_CHANGED = "version changed"
+    PACKAGE_ID_CHANGED = "package id changed"
+
+
+@dataclasses.dataclass(frozen=True)
+class NodeChange:
+    """A change to a package, by its node id in the old and new graphs."""
+
+    kind: ChangeKind
+    name: str
+    old_id: typing.Optional[int]
+    new_id: typing.Optional[int]
+
+
+class DependencyGraphDiff:
+    """Differences between an old and a new dependency graph."""
+
+    def __init__(self, old: DependencyGraph, new: DependencyGraph) -> None:
+        """Initialise a DependencyGraphDiff, comparing the graphs."""
+        self.old = old
+        self.new = new
+        self.changes: typing.List[NodeChange] = []
+        self.unchanged = 0
+        old_exact: typing.Dict[typing.Tuple[str, str], typing.List[int]] = {}
+        for node in old.nodes:
+            old_exact.setdefault((node.reference, node.package_id), []).append(
+                node.node_id
+            )
+        new_remaining = []
+        for node in new.nodes:
+            candidates = old_exact.get((node.reference, node.package_id))
+            if candidates:
+                candidates.pop()
+                self.unchanged += 1
+            else:
+                new_remaining.append(node)
+        old_by_package: typing.Dict[typing.Tuple[str, bool], typing.List[int]] = {}
+        for node_ids in old_exact.values():
+            for old_id in node_ids:
+                node = old.node(old_id)
+                old_by_package.setdefault((node.name, node.is_runtime), []).append(
+                    old_id
+                )
+        for node in new_remaining:
+            candidates = old_by_package.get((node.name, node.is_runtime))
+            if not candidates:
+                self.changes.append(
+                    NodeChange(ChangeKind.ADDED, node.name, None, node.node_id)
+                )
+                continue
+            old_id = candidates.pop()
+            kind = (
+                ChangeKind.PACKAGE_ID_CHANGED
+                if old.node(old_id).reference == node.reference
+                else ChangeKind.VERSION_CHANGED
+            )
+            self.changes.append(NodeChange(kind, node.name, old_id, node.node_id))
+        for node_ids in old_by_package.values():
+            for old_id in node_ids:
+                self.changes.append(
+                    NodeChange(ChangeKind.REMOVED, old.node(old_id).name, old_id, None)
+                )
+        kinds = list(ChangeKind)
+        self.changes.sort(key=lambda change: (kinds.index(change.kind), change.name))
+
+    def __bool__(self) -> bool:
+        """Whether there are any changes."""
+        return bool(self.changes)
+
+    def before(self, change: NodeChange) -> str:
+        """Get a description of the package before the change."""
+        if change.old_id is None:
+            return ""
+        node = self.old.node(change.old_id)
+        if change.kind == ChangeKind.PACKAGE_ID_CHANGED:
+            return node.package_id
+        return node.reference
+
+    def after(self, change: NodeChange) -> str:
+        """Get a description of the package after the change."""
+        if change.new_id is None:
+            return ""
+        node = self.new.node(change.new_id)
+        if change.kind == ChangeKind.PACKAGE_ID_CHANGED:
+            return node.package_id
+        return node.reference
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+
+"""
+Layered (Sugiyama style) layout of directed graphs.
+
+The layout proceeds in the classic phases:
+
+1. cycle removal, reversing the back edges found by a depth first search
+2. layering, by longest path, with dummy vertices splitting long edges
+3. crossing minimisation, by barycenter sweeps over the layers
+4. coordinate assignment, pulling vertices towards their neighbours while
+   keeping vertices in a layer apart
+
+Each source vertex of an edge is placed in an earlier layer than its target,
+as GraphViz's dot does. A previous layout may be provided, to seed the
+ordering of vertices in each layer, so that relayouts are quicker, and
+vertices keep their relative positions. It is only used when most vertices
+were in it, as the ordering of an unrelated graph is a poor starting point.
+"""
+
+from __future__ import annotations
+
+import collections
+import typing
+from dataclasses import dataclass
+
+# in-layer gap between vertices, and the gap between layers
+VERTEX_SEPARATION = 20.0
+LAYER_SEPARATION = 50.0
+# sweeps of crossing minimisation, and of coordinate assignment
+ORDERING_ITERATIONS = 8
+POSITIONING_ITERATIONS = 4
+# fraction of vertices that must be in a previous layout, for it to seed the ordering
+MINIMUM_SEED_OVERLAP = 0.5
+
+Point = typing.Tuple[float, float]
+
+
+@dataclass
+class LayoutEdge:
+    """Route of an edge between two vertices, through any bends."""
+
+    source: int
+    target: int
+    points: typing.List[Point]
+
+
+class LayeredLayout:
+    """Layered layout of a directed graph."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        vertex_count: int,
+        edges: typing.Sequence[typing.Tuple[int, int]],
+        keys: typing.Optional[typing.Sequence[str]] = None,
+        previous: typing.Optional[LayeredLayout] = None,
+    ) -> None:
+        """
+        Initialise a LayeredLayout, computing the layers and their ordering.
+
+        Keys identify vertices between layouts, and default to their index.
+        """
+        self.vertex_count = vertex_count
+        self.keys = (
+            list(keys) if keys is not None else [str(i) for i in range(vertex_count)]
+        )
+        self._edges = [(s, t) for s, t in dict.fromkeys(edges) if s != t]
+        self._acyclic = self._remove_cycles()
+        self.layer_of = self._assign_layers()
+        # vertices beyond vertex_count are dummies on long edges
+        self._layer_of_all: typing.List[int] = list(self.layer_of)
+        self._routes: typing.List[typing.List[int]] = []
+        self._successors: typing.List[typing.List[int]] = [[] for _ in self.layer_of]
+        self._predecessors: typing.List[typing.List[int]] = [[] for _ in self.layer_of]
+        self._split_long_edges()
+        if previous is not None and not self._overlaps(previous):
+            previous = None
+        self.layers = self._initial_ordering(previous)
+        # a seeded ordering is close to its best, so sweeps stop once they stop
+        # improving it
+        self.crossings = self._minimise_crossings(
+            ORDERING_ITERATIONS, previous is not None
+        )
+
+    @property
+    def positions_by_key(self) -> typing.Dict[str, float]:
+        """Get the relative position of each vertex within its layer."""
+        positions: typing.Dict[str, float] = {}
+        for layer in self.layers:
+            for index, vertex in enumerate(layer):
+                if vertex < self.vertex_count:
+                    positions[self.keys[vertex]] = index / max(len(layer), 1)
+        return positions
+
+    def _overlaps(self, previous: LayeredLayout) -> bool:
+        previous_keys = set(previous.keys)
+        shared = sum(1 for key in self.keys if key in previous_keys)
+        return shared >= MINIMUM_SEED_OVERLAP * self.vertex_count
+
+    def _remove_cycles(self) -> typing.List[typing.Tuple[int, int]]:
+        # iterative depth first search; edges to a vertex on the stack are reversed
+        adjacency: typing.List[typing.List[int]] = [
+            [] for _ in range(self.vertex_count)
+        ]
+        for source, target in self._edges:
+            adjacency[source].append(target)
+        state = bytearray(self.vertex_count)  # 0 unvisited, 1 on stack, 2 done
+        reversed_edges: typing.Set[typing.Tuple[int, int]] = set()
+        for start in range(self.vertex_count):
+            if state[start]:
+                continue
+            state[start] = 1
+            stack = [(start, 0)]
+            while stack:
+                vertex, index = stack[-1]
+                if index < len(adjacency[vertex]):
+                    stack[-1] = (vertex, index + 1)
+                    target = adjacency[vertex][index]
+                    if state[target] == 1:
+                        reversed_edges.add((vertex, target))
+                    elif not state[target]:
+                        state[target] = 1
+                        stack.append((target, 0))
+                    continue
+                state[vertex] = 2
+                stack.pop()
+        return [
+            (target, source) if (source, target) in reversed_edges else (source, target)
+            for source, target in self._edges
+        ]
+
+    def _assign_layers(self) -> typing.List[int]:
+        # longest path layering, in topological order
+        in_degree = [0] * self.vertex_count
+        adjacency: typing.List[typing.List[int]] = [
+            [] for _ in range(self.vertex_count)
+        ]
+        for source, target in self._acyclic:
+            adjacency[source].append(target)
+            in_degree[target] += 1
+        layer = [0] * self.vertex_count
+        ready = [vertex for vertex in range(self.vertex_count) if not in_degree[vertex]]
+        while ready:
+            vertex = ready.pop()
+            for target in adjacency[vertex]:
+                layer[target] = max(layer[target], layer[vertex] + 1)
+                in_degree[target] -= 1
+                if not in_degree[target]:
+                    ready.append(target)
+        return layer
+
+    def _split_long_edges(self) -> None:
+        for source, target in self._acyclic:
+            route = [source]
+            for layer in range(self.layer_of[source] + 1, self.layer_of[target]):
+                dummy = len(self._layer_of_all)
+                self._layer_of_all.append(layer)
+                self._successors.append([])
+                self._predecessors.append([])
+                route.append(dummy)
+            route.append(target)
+            for upper, lower in zip(route, route[1:]):
+                self._successors[upper].append(lower)
+                self._predecessors[lower].append(upper)
+            self._routes.append(route)
+
+    def _initial_ordering(
+        self, previous: typing.Optional[LayeredLayout]
+    ) -> typing.List[typing.List[int]]:
+        layer_count = max(self._layer_of_all, default=-1) + 1
+        layers: typing.List[typing.List[int]] = [[] for _ in range(layer_count)]
+        # breadth first from the first layer, so that connected vertices are close
+        visited = bytearray(len(self._layer_of_all))
+        for start in range(self.vertex_count):
+            if visited[start] or self._predecessors[start]:
+                continue
+            visited[start] = 1
+            queue = collections.deque([start])
+            while queue:
+                vertex = queue.popleft()
+                layers[self._layer_of_all[vertex]].append(vertex)
+                for successor in self._successors[vertex]:
+                    if not visited[successor]:
+                        visited[successor] = 1
+                        queue.append(successor)
+        if previous is not None:
+            old_positions = previous.positions_by_key
+            for layer in layers:
+                seeded = {
+                    vertex: old_positions.get(self.keys[vertex])
+                    for vertex in layer
+                    if vertex < self.vertex_count
+                }
+                self._sort_by_weights(layer, seeded)
+        return layers
+
+    @staticmethod
+    def _sort_by_weights(
+        layer: typing.List[int], weights: typing.Dict[int, typing.Optional[float]]
+    ) -> None:
+        # vertices without weight stay where they are, relative to their neighbours
+        current: typing.List[float] = []
+        last = -1.0
+        for index, vertex in enumerate(layer):
+            weight = weights.get(vertex)
+            if weight is None:
+                weight = last if index else 0.0
+            current.append(weight)
+            last = weight
+        order = sorted(range(len(layer)), key=current.__getitem__)
+        layer[:] = [layer[index] for index in order]
+
+    def _minimise_crossings(self, iterations: int, stop_when_unimproved: bool) -> int:
+        best = [list(layer) for layer in self.layers]
+        best_crossings = self._count_crossings()
+        # sweeps since the crossings last reduced
+        unimproved = 0
+        for iteration in range(iterations):
+            # stop once neither a downward nor an upward sweep improves
+            if not best_crossings or (stop_when_unimproved and unimproved == 2):
+                break
+            downwards = not iteration % 2
+            layer_range = (
+                range(1, len(self.layers))
+                if downwards
+                else range(len(self.layers) - 2, -1, -1)
+            )
+            for layer_index in layer_range:
+                self._order_by_barycenter(layer_index, downwards)
+            crossings = self._count_crossings()
+            if crossings < best_crossings:
+                best_crossings = crossings
+                best = [list(layer) for layer in self.layers]
+                unimproved = 0
+            else:
+                unimproved += 1
+        self.layers = best
+        return best_crossings
+
+    def _order_by_barycenter(self, layer_index: int, downwards: bool) -> None:
+        fixed = self.layers[layer_index - 1 if downwards else layer_index + 1]
+        neighbours = self._predecessors if downwards else self._successors
+        position = {vertex: index for index, vertex in enumerate(fixed)}
+        weights: typing.Dict[int, typing.Optional[float]] = {}
+        for vertex in self.layers[layer_index]:
+            adjacent = neighbours[vertex]
+            weights[vertex] = (
+                sum(position[n] for n in adjacent) / len(adjacent) if adjacent else None
+            )
+        self._sort_by_weights(self.layers[layer_index], weights)
+
+    def _count_crossings(self) -> int:
+        # accumulator tree counting, per pair of adjacent layers
+        total = 0
+        for upper, lower in zip(self.layers, self.layers[1:]):
+            lower_position = {vertex: index for index, vertex in enumerate(lower)}
+            targets = [
+                lower_position[successor]
+                for vertex in upper
+                for successor in sorted(
+                    self._successors[vertex], key=lower_position.__getitem__
+                )
+            ]
+            size = 1
+            while size < len(lower):
+                size *= 2
+            tree = [0] * (2 * size)
+            for target in targets:
+                index = target + size
+                tree[index] += 1
+                while index > 1:
+                    if not index % 2:
+                        total += tree[index + 1]
+                    index //= 2
+                    tree[index] += 1
+        return total
+
+    def coordinates(
+        self,
+        sizes: typing.Sequence[typing.Tuple[float, float]],
+        rankdir: str = "TB",
+    ) -> typing.Tuple[typing.List[Point], typing.List[LayoutEdge]]:
+        """
+        Assign coordinates to the vertices, of the given (width, height) sizes.
+
+        Returns the centre of each vertex, and the routes of the edges. The
+        rank direction is "TB" (layers top to bottom) or "LR" (left to right).
+        """
+        # pylint: disable=too-many-locals
+        horizontal = rankdir == "LR"
+        # extent of each vertex along its layer, and across it
+        along = [size[1] if horizontal else size[0] for size in sizes]
+        across = [size[0] if horizontal else size[1] for size in sizes]
+        vertex_total = len(self._layer_of_all)
+        extent = along + [0.0] * (vertex_total - self.vertex_count)
+        in_layer = [0.0] * vertex_total
+        for layer in self.layers:
+            offset = 0.0
+            for vertex in layer:
+                in_layer[vertex] = offset + extent[vertex] / 2
+                offset += extent[vertex] + VERTEX_SEPARATION
+        for iteration in range(POSITIONING_ITERATIONS):
+            downwards = not iteration % 2
+            neighbours = self._predecessors if downwards else self._successors
+            for layer in self.layers if downwards else reversed(self.layers):
+                desired = []
+                for vertex in layer:
+                    adjacent = neighbours[vertex]
+                    if adjacent:
+                        desired.append(
+                            sum(in_layer[n] for n in adjacent) / len(adjacent)
+                        )
+                    else:
+                        desired.append(in_layer[vertex])
+                self._place_layer(layer, desired, extent, in_layer)
+        # normalise, so the smallest coordinate is zero
+        if vertex_total:
+            lowest = min(in_layer[v] - extent[v] / 2 for v in range(vertex_total))
+            in_layer = [value - lowest for value in in_layer]
+        layer_centre = []
+        offset = 0.0
+        for layer in self.layers:
+            thickness = max(
+                (across[v] for v in layer if v < self.vertex_count), default=0.0
+            )
+            layer_centre.append(offset + thickness / 2)
+            offset += thickness + LAYER_SEPARATION
+
+        def _point(vertex: int) -> Point:
+            layer_position = layer_centre[self._layer_of_all[vertex]]
+            if horizontal:
+                return (layer_position, in_layer[vertex])
+            return (in_layer[vertex], layer_position)
+
+        centres = [_point(vertex) for vertex in range(self.vertex_count)]
+        routes = []
+        for route, original in zip(self._routes, self._edges):
+            points = [_point(vertex) for vertex in route]
+            source, target = route[0], route[-1]
+            if (source, target) != original:
+                # a reversed edge is drawn in its original direction
+                points.reverse()
+                source, target = target, source
+            routes.append(LayoutEdge(source, target, points))
+        return centres, routes
+
+    @staticmethod
+    def _place_layer(
+        layer: typing.List[int],
+        desired: typing.List[float],
+        extent: typing.List[float],
+        in_layer: typing.List[float],
+    ) -> None:
+        # closest positions to those desired that respect the separation, found
+        # by averaging a left-to-right pass with a right-to-left pass
+        count = len(layer)
+        if not count:
+            return
+        left = list(desired)
+        for index in range(1, count):
+            gap = (
+                extent[layer[index - 1]] + extent[layer[index]]
+            ) / 2 + VERTEX_SEPARATION
+            left[index] = max(left[index], left[index - 1] + gap)
+        right = list(desired)
+        for index in range(count - 2, -1, -1):
+            gap = (
+                extent[layer[index]] + extent[layer[index + 1]]
+            ) / 2 + VERTEX_SEPARATION
+            right[index] = min(right[index], right[index + 1] - gap)
+        for index, vertex in enumerate(layer):
+            in_layer[vertex] = (left[index] + right[index]) / 2
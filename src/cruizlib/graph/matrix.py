@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+Dependency graphs across a matrix of configurations.
+
+A recipe is often validated against several profiles, and combinations of
+option values. Each configuration in the matrix has its own dependency graph,
+summarised by the package id of the root, the packages without a prebuilt
+binary, and the differences from the graph of the first configuration.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import typing
+
+from .diff import DependencyGraphDiff
+
+if typing.TYPE_CHECKING:
+    from cruizlib.interop.dependencygraph import DependencyGraph
+
+
+@dataclasses.dataclass(frozen=True)
+class MatrixConfiguration:
+    """A profile, and option values, to compute a dependency graph with."""
+
+    profile: str
+    options: typing.Tuple[typing.Tuple[str, str], ...] = ()
+
+    def __str__(self) -> str:
+        """Get a description of the configuration."""
+        if not self.options:
+            return self.profile
+        options = ", ".join(f"{key}={value}" for key, value in self.options)
+        return f"{self.profile} ({options})"
+
+
+def parse_option_values(text: str) -> typing.Dict[str, typing.List[str]]:
+    """
+    Parse the values of each option to combine, e.g. "shared=True,False; fPIC=True".
+
+    Raises ValueError if any option is malformed.
+    """
+    option_values: typing.Dict[str, typing.List[str]] = {}
+    for option in text.split(";"):
+        if not option.strip():
+            continue
+        key, separator, values = option.partition("=")
+        key = key.strip()
+        value_list = [value.strip() for value in values.split(",") if value.strip()]
+        if not separator or not key or not value_list:
+            raise ValueError(f"Expected option=value[,value...], not '{option}'")
+        option_values[key] = value_list
+    return option_values
+
+
+def matrix_configurations(
+    profiles: typing.Sequence[str],
+    option_values: typing.Mapping[str, typing.Sequence[str]],
+) -> typing.List[MatrixConfiguration]:
+    """Get every combination of the profiles and option values."""
+    keys = list(option_values)
+    combinations = list(itertools.product(*(option_values[key] for key in keys)))
+    return [
+        MatrixConfiguration(profile, tuple(zip(keys, combination)))
+        for profile in profiles
+        for combination in combinations
+    ]
+
+
+class ProfileMatrix:
+    """Dependency graphs of each configuration of a matrix, as they are computed."""
+
+    def __init__(self, configurations: typing.Sequence[MatrixConfiguration]) -> None:
+        """Initialise a ProfileMatrix, with no graphs computed yet."""
+        self.configurations = list(configurations)
+        self.graphs: typing.List[typing.Optional[DependencyGraph]] = [None] * len(
+            self.configurations
+        )
+        self.errors: typing.List[typing.Optional[str]] = [None] * len(
+            self.configurations
+        )
+        self._diffs: typing.Dict[int, DependencyGraphDiff] = {}
+
+    def __len__(self) -> int:
+        """Get the number of configurations."""
+        return len(self.configurations)
+
+    def _invalidate(self, index: int) -> None:
+        # every diff is from the first configuration
+        if index:
+            self._diffs.pop(index, None)
+        else:
+            self._diffs.clear()
+
+    def set_graph(self, index: int, graph: DependencyGraph) -> None:
+        """Set the computed graph of a configuration."""
+        self.graphs[index] = graph
+        self.errors[index] = None
+        self._invalidate(index)
+
+    def set_error(self, index: int, error: str) -> None:
+        """Set why the graph of a configuration could not be computed."""
+        self.graphs[index] = None
+        self.errors[index] = error
+        self._invalidate(index)
+
+    def package_id(self, index: int) -> typing.Optional[str]:
+        """Get the package id of the root of a configuration, if computed."""
+        graph = self.graphs[index]
+        return graph.root.package_id if graph is not None else None
+
+    def missing_binaries(self, index: int) -> typing.List[str]:
+        """Get the references of packages in a configuration without a binary."""
+        graph = self.graphs[index]
+        if graph is None:
+            return []
+        return [node.reference for node in graph.nodes if node.binary_missing]
+
+    def diff(self, index: int) -> typing.Optional[DependencyGraphDiff]:
+        """
+        Get the differences of a configuration from the first configuration.
+
+        None if either graph is not yet computed, or this is the first.
+        """
+        baseline = self.graphs[0]
+        graph = self.graphs[index]
+        if not index or baseline is None or graph is None:
+            return None
+        if index not in self._diffs:
+            self._diffs[index] = DependencyGraphDiff(baseline, graph)
+        return self._diffs[index]
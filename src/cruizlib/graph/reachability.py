@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+"""
+Reachability queries on dependency graphs.
+
+The transitive closure of the graph is precomputed as a bitset per node, in
+each direction, so that whether one node depends upon another is a single
+bit test, and the transitive dependencies or dependents of a node, and the
+nodes on any path between two nodes, are a few bitwise operations.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from cruizlib.interop.dependencygraph import DependencyGraphBuilder
+
+if typing.TYPE_CHECKING:
+    from cruizlib.interop.dependencygraph import DependencyGraph
+
+
+def _ids_of(bits: int) -> typing.List[int]:
+    ids = []
+    while bits:
+        lowest = bits & -bits
+        ids.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return ids
+
+
+class ReachabilityIndex:
+    """
+    Transitive closure of a dependency graph.
+
+    Dependency graphs are acyclic; nodes on a cycle are not indexed.
+    """
+
+    def __init__(self, graph: DependencyGraph) -> None:
+        """Initialise a ReachabilityIndex, computing the closure."""
+        self.graph = graph
+        order = self._topological_order()
+        self._dependencies = [0] * graph.node_count
+        for node_id in reversed(order):
+            bits = 0
+            for child in graph.child_ids(node_id):
+                bits |= self._dependencies[child] | (1 << child)
+            self._dependencies[node_id] = bits
+        self._dependents = [0] * graph.node_count
+        for node_id in order:
+            bits = 0
+            for parent in graph.parent_ids(node_id):
+                bits |= self._dependents[parent] | (1 << parent)
+            self._dependents[node_id] = bits
+
+    def _topological_order(self) -> typing.List[int]:
+        in_degree = [0] * self.graph.node_count
+        for node_id in range(self.graph.node_count):
+            for child in self.graph.child_ids(node_id):
+                in_degree[child] += 1
+        ready = [node_id for node_id, degree in enumerate(in_degree) if not degree]
+        order = []
+        while ready:
+            node_id = ready.pop()
+            order.append(node_id)
+            for child in self.graph.child_ids(node_id):
+                in_degree[child] -= 1
+                if not in_degree[child]:
+                    ready.append(child)
+        return order
+
+    def depends_on(self, node_id: int, other_id: int) -> bool:
+        """Whether the node depends upon the other node, directly or not."""
+        return bool(self._dependencies[node_id] >> other_id & 1)
+
+    def dependencies(self, node_id: int) -> typing.List[int]:
+        """Get the ids of all the transitive dependencies of the node."""
+        return _ids_of(self._dependencies[node_id])
+
+    def dependents(self, node_id: int) -> typing.List[int]:
+        """Get the ids of all the nodes transitively depending upon the node."""
+        return _ids_of(self._dependents[node_id])
+
+    def _between_bits(self, source_id: int, target_id: int) -> int:
+        if source_id != target_id and not self.depends_on(source_id, target_id):
+            return 0
+        return (self._dependencies[source_id] | 1 << source_id) & (
+            self._dependents[target_id] | 1 << target_id
+        )
+
+    def between(self, source_id: int, target_id: int) -> typing.List[int]:
+        """Get the ids of the nodes on any path from the source to the target."""
+        return _ids_of(self._between_bits(source_id, target_id))
+
+    def path_edges(
+        self, source_id: int, target_id: int
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """Get the (parent, child) edges on any path from the source to the target."""
+        bits = self._between_bits(source_id, target_id)
+        return [
+            (parent, child)
+            for parent in _ids_of(bits)
+            for child in dict.fromkeys(self.graph.child_ids(parent))
+            if bits >> child & 1
+        ]
+
+    def paths(
+        self, source_id: int, target_id: int
+    ) -> typing.Iterator[typing.List[int]]:
+        """
+        Generate every path from the source to the target, as lists of node ids.
+
+        Only children leading to the target are followed, so each step of the
+        search extends a path that will be generated. There may be
+        exponentially many paths, so consume only as many as are needed.
+        """
+        bits = self._between_bits(source_id, target_id)
+        if not bits:
+            return
+        path = [source_id]
+        stack = [iter(dict.fromkeys(self.graph.child_ids(source_id)))]
+        if source_id == target_id:
+            yield list(path)
+            return
+        while stack:
+            child = next((child for child in stack[-1] if bits >> child & 1), None)
+            if child is None:
+                stack.pop()
+                path.pop()
+                continue
+            path.append(child)
+            if child == target_id:
+                yield list(path)
+                path.pop()
+                continue
+            stack.append(iter(dict.fromkeys(self.graph.child_ids(child))))
+
+    def why(self, node_id: int) -> typing.Iterator[typing.List[int]]:
+        """Generate every path from the root of the graph to the node."""
+        return self.paths(self.graph.root_id, node_id)
+
+    def dependents_graph(self, node_id: int) -> DependencyGraph:
+        """
+        Generate a DependencyGraph of the node and all its transitive dependents.
+
+        The graph is inverted, so that the node is its root, and the children of
+        each node are those nodes that require it.
+        """
+        builder = DependencyGraphBuilder()
+        members = [node_id] + self.dependents(node_id)
+        new_id_of = {
+            member: builder.add_package_node(self.graph.node(member))
+            for member in members
+        }
+        for member in members:
+            for parent in dict.fromkeys(self.graph.parent_ids(member)):
+                builder.add_edge(new_id_of[member], new_id_of[parent])
+        return builder.build(new_id_of[node_id])
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+"""
+Persistent storage of dependency graphs, so that they survive between sessions.
+
+Each graph is stored alongside the cache key of the inputs it was computed
+from, so that a restored graph can be identified as stale.
+
+The on-disk format is a small header (magic number and format version)
+followed by zlib-compressed JSON of the arrays backing the DependencyGraph.
+Files with an unknown version are ignored, and will be regenerated.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import struct
+import typing
+import zlib
+from array import array
+
+from cruizlib.interop.dependencygraph import DependencyGraph
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CRZG"
+FORMAT_VERSION = 2
+_HEADER = struct.Struct("<4sH")
+_SUFFIX = ".cgraph"
+# name of the directory, beside the settings, of persisted dependency graphs
+STORE_DIRECTORY_NAME = "dependencygraphs"
+
+
+def dependency_graph_to_bytes(key: str, graph: DependencyGraph) -> bytes:
+    """Serialise a dependency graph, and the key of its inputs."""
+    document = {
+        "key": key,
+        "root": graph.root_id,
+        "strings": graph.strings,
+        "fields": [
+            list(graph.string_fields(node_id)) for node_id in range(graph.node_count)
+        ],
+        "flags": [graph.flags(node_id) for node_id in range(graph.node_count)],
+        "children": [
+            list(graph.child_ids(node_id)) for node_id in range(graph.node_count)
+        ],
+    }
+    payload = zlib.compress(
+        json.dumps(document, separators=(",", ":")).encode("utf-8")
+    )
+    return _HEADER.pack(MAGIC, FORMAT_VERSION) + payload
+
+
+def dependency_graph_from_bytes(
+    data: bytes,
+) -> typing.Optional[typing.Tuple[str, DependencyGraph]]:
+    """Deserialise a dependency graph and its key, or None if not understood."""
+    if len(data) < _HEADER.size:
+        return None
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    payload = data[_HEADER.size :]  # noqa: E203
+    document = json.loads(zlib.decompress(payload).decode("utf-8"))
+    node_count = len(document["flags"])
+    if (
+        len(document["fields"]) != node_count
+        or len(document["children"]) != node_count
+        or not 0 <= document["root"] < node_count
+    ):
+        raise ValueError("Inconsistent dependency graph arrays")
+    child_offsets = array("i", [0])
+    child_ids = array("i")
+    for children in document["children"]:
+        child_ids.extend(children)
+        child_offsets.append(len(child_ids))
+    graph = DependencyGraph(
+        document["strings"],
+        array("i", [index for fields in document["fields"] for index in fields]),
+        array("B", document["flags"]),
+        child_offsets,
+        child_ids,
+        document["root"],
+    )
+    return document["key"], graph
+
+
+class DependencyGraphStore:
+    """A directory of persisted dependency graphs, one per recipe."""
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        """Initialise a DependencyGraphStore."""
+        self._directory = directory
+
+    def _path(self, recipe_id: str) -> pathlib.Path:
+        return self._directory / f"{recipe_id}{_SUFFIX}"
+
+    def save(self, recipe_id: str, key: str, graph: DependencyGraph) -> None:
+        """Persist the dependency graph for the recipe."""
+        path = self._path(recipe_id)
+        temporary_path = path.with_suffix(".tmp")
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_bytes(dependency_graph_to_bytes(key, graph))
+            os.replace(temporary_path, path)
+        except OSError as exc:
+            logger.warning("Unable to persist dependency graph: %s", str(exc))
+
+    def load(
+        self, recipe_id: str
+    ) -> typing.Optional[typing.Tuple[str, DependencyGraph]]:
+        """Get the persisted dependency graph, and its key, for the recipe."""
+        try:
+            data = self._path(recipe_id).read_bytes()
+        except OSError:
+            return None
+        try:
+            return dependency_graph_from_bytes(data)
+        except (ValueError, KeyError, IndexError, TypeError, zlib.error) as exc:
+            logger.warning("Ignoring corrupt dependency graph: %s", str(exc))
+            return None
+
+    def remove(self, recipe_id: str) -> None:
+        """Remove any persisted dependency graph for the recipe."""
+        try:
+            self._path(recipe_id).unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Unable to remove dependency graph: %s", str(exc))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""Linear time traversals of dependency graphs."""
+
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from cruizlib.interop.dependencygraph import DependencyGraph
+
+
+# pylint: disable=too-few-public-methods
+
+
+class DepthFirstTraversal:
+    """
+    Depth first traversal of a dependency graph from its root.
+
+    Each node, and each distinct edge, is visited once, so the traversal is
+    linear in the size of the graph. Nodes are ordered as first visited, and
+    each edge (child, parent) once the subtree of the child has been visited.
+    """
+
+    def __init__(self, graph: DependencyGraph) -> None:
+        """Initialise a DepthFirstTraversal."""
+        self.node_ids: typing.List[int] = []
+        self.edges: typing.List[typing.Tuple[int, int]] = []
+        visited = bytearray(graph.node_count)
+        seen_edges: typing.Set[typing.Tuple[int, int]] = set()
+
+        def _add_edge(child: int, parent: int) -> None:
+            if (child, parent) not in seen_edges:
+                seen_edges.add((child, parent))
+                self.edges.append((child, parent))
+
+        root = graph.root_id
+        visited[root] = 1
+        self.node_ids.append(root)
+        # stack of (node id, index of next child to visit)
+        stack = [(root, 0)]
+        while stack:
+            node_id, child_index = stack[-1]
+            children = graph.child_ids(node_id)
+            if child_index < len(children):
+                stack[-1] = (node_id, child_index + 1)
+                child = children[child_index]
+                if visited[child]:
+                    _add_edge(child, node_id)
+                else:
+                    visited[child] = 1
+                    self.node_ids.append(child)
+                    stack.append((child, 0))
+                continue
+            stack.pop()
+            if stack:
+                _add_edge(node_id, stack[-1][0])
@@ -9,6 +9,7 @@ import typing
 from io import StringIO
 
 import cruizlib.globals
+from cruizlib.constants import GraphResolutionMode
 
 from .commonparameters import CommonParameters
 
@@ -60,9 +61,13 @@ class CommandParameters(CommonParameters):
         self._v2_omit_test_folder: typing.Optional[bool] = None
         self._v2_need_reference: typing.Optional[bool] = None
         self._extra_options: typing.Optional[str] = None
+        self._lockfile: typing.Optional[pathlib.PurePath] = None
+        self._lockfile_out: typing.Optional[pathlib.PurePath] = None
+        self._graph_resolution_mode: typing.Optional[GraphResolutionMode] = None
+        self._graph_structure_only: typing.Optional[bool] = None
 
     def to_args(self) -> typing.List[str]:
-        # pylint: disable=too-many-branches
+        # pylint: disable=too-many-branches, too-many-statements
         """Get the argument list corresponding to these command parameters."""
         components = [self.verb]
         if self.profile:
@@ -99,6 +104,14 @@ class CommandParameters(CommonParameters):
                 components.extend(["-tf", ""])
             if self.force:
                 components.append("-c")
+            if self.lockfile:
+                components.extend(["--lockfile", str(self.lockfile)])
+            if self.lockfile_out:
+                components.extend(["--lockfile-out", str(self.lockfile_out)])
+            if self.graph_resolution_mode == GraphResolutionMode.OFFLINE:
+                components.append("--no-remote")
+            elif self.graph_resolution_mode == GraphResolutionMode.ALWAYS_UPDATE:
+                components.append("--update")
             # no named args
             if self.recipe_path:
                 components.append(str(self.recipe_path))
@@ -525,3 +538,60 @@ class CommandParameters(CommonParameters):
     @extra_options.setter
     def extra_options(self, value: typing.Optional[str]) -> None:
         self._extra_options = value
+
+    @property
+    def lockfile(self) -> typing.Optional[pathlib.PurePath]:
+        """
+        Get the lockfile to resolve the dependency graph from, in Conan v2+.
+
+        --lockfile switch
+        May be None to omit
+        """
+        return self._lockfile
+
+    @lockfile.setter
+    def lockfile(self, value: typing.Optional[pathlib.PurePath]) -> None:
+        self._lockfile = value
+
+    @property
+    def lockfile_out(self) -> typing.Optional[pathlib.PurePath]:
+        """
+        Get the lockfile to write the resolved dependency graph to, in Conan v2+.
+
+        --lockfile-out switch
+        May be None to omit
+        """
+        return self._lockfile_out
+
+    @lockfile_out.setter
+    def lockfile_out(self, value: typing.Optional[pathlib.PurePath]) -> None:
+        self._lockfile_out = value
+
+    @property
+    def graph_resolution_mode(self) -> typing.Optional[GraphResolutionMode]:
+        """
+        Get how remotes are used when resolving the dependency graph, in Conan v2+.
+
+        --no-remote or --update switches
+        May be None to use the local cache first
+        """
+        return self._graph_resolution_mode
+
+    @graph_resolution_mode.setter
+    def graph_resolution_mode(
+        self, value: typing.Optional[GraphResolutionMode]
+    ) -> None:
+        self._graph_resolution_mode = value
+
+    @property
+    def graph_structure_only(self) -> typing.Optional[bool]:
+        """
+        Whether to only resolve the structure of the dependency graph, in Conan v2+.
+
+        Binaries are not analysed, so there are no package_ids.
+        """
+        return self._graph_structure_only
+
+    @graph_structure_only.setter
+    def graph_structure_only(self, value: typing.Optional[bool]) -> None:
+        self._graph_structure_only = value
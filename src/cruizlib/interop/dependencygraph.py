@@ -1,36 +1,363 @@
 #!/usr/bin/env python3
 
-"""Interop between Conan and cruiz."""
+"""
+Interop between Conan and cruiz.
+
+A dependency graph is stored compactly, so that large graphs are quick to
+transfer between processes, and to traverse:
+
+- strings are interned into a single table, and nodes refer to them by index
+- nodes are identified by integer ids, indexing into arrays of fields
+- forward (children) and reverse (parents) edges are stored as compressed
+  sparse rows; an offsets array per node into an array of node ids
+
+PackageNodeView presents a node with the same attributes as PackageNode,
+so consumers can continue to navigate via children and parents.
+"""
 
 from __future__ import annotations
 
 import typing
-from dataclasses import dataclass
+from array import array
+
+from .packagenode import PackageNode
+
+# string fields of each node, in storage order
+_NAME = 0
+_REFERENCE = 1
+_PACKAGE_ID = 2
+_RECIPE_REVISION = 3
+_INFO = 4
+_LAYOUT_BUILD_SUBDIR = 5
+_FIELD_COUNT = 6
+# string index representing None
+_NO_STRING = -1
+# bits in the flags of each node
+_SHORT_PATHS = 1
+_IS_RUNTIME = 2
+_BINARY_MISSING = 4
+
+PackageNodeLike = typing.Union[PackageNode, "PackageNodeView"]
+
+
+def _compressed_rows(
+    node_count: int, edges: typing.Sequence[typing.Tuple[int, int]]
+) -> typing.Tuple[array[int], array[int]]:
+    # stable counting sort of the edges by source
+    offsets = array("i", bytes(4 * (node_count + 1)))
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for node_id in range(node_count):
+        offsets[node_id + 1] += offsets[node_id]
+    targets = array("i", bytes(4 * len(edges)))
+    insert_at = offsets[:-1]
+    for source, target in edges:
+        targets[insert_at[source]] = target
+        insert_at[source] += 1
+    return offsets, targets
+
+
+class PackageNodeView:
+    """View of a node in a DependencyGraph, with the same API as PackageNode."""
+
+    __slots__ = ("_graph", "node_id")
+
+    def __init__(self, graph: DependencyGraph, node_id: int) -> None:
+        """Initialise a PackageNodeView."""
+        self._graph = graph
+        self.node_id = node_id
+
+    def __eq__(self, other: object) -> bool:
+        """Determine if the views are of the same node in the same graph."""
+        if not isinstance(other, PackageNodeView):
+            return NotImplemented
+        return self._graph is other._graph and self.node_id == other.node_id
+
+    def __hash__(self) -> int:
+        """Get the hash of the view."""
+        return hash((id(self._graph), self.node_id))
+
+    def __repr__(self) -> str:
+        """Get the representation of the view."""
+        return f"PackageNodeView({self.node_id}, {self.reference!r})"
+
+    @property
+    def graph(self) -> DependencyGraph:
+        """Get the graph containing the node."""
+        return self._graph
+
+    @property
+    def name(self) -> str:
+        """Get the name of the package."""
+        return typing.cast("str", self._graph.string_field(self.node_id, _NAME))
+
+    @property
+    def reference(self) -> str:
+        """Get the reference of the package."""
+        return typing.cast("str", self._graph.string_field(self.node_id, _REFERENCE))
+
+    @property
+    def package_id(self) -> str:
+        """Get the package id."""
+        return typing.cast("str", self._graph.string_field(self.node_id, _PACKAGE_ID))
+
+    @property
+    def recipe_revision(self) -> str:
+        """Get the recipe revision."""
+        return typing.cast(
+            "str", self._graph.string_field(self.node_id, _RECIPE_REVISION)
+        )
+
+    @property
+    def short_paths(self) -> bool:
+        """Get whether the package uses short paths."""
+        return bool(self._graph.flags(self.node_id) & _SHORT_PATHS)
+
+    @property
+    def info(self) -> typing.Optional[str]:
+        """Get the Conan info of the package."""
+        return self._graph.string_field(self.node_id, _INFO)
+
+    @property
+    def is_runtime(self) -> bool:
+        """Get whether the package is a runtime dependency."""
+        return bool(self._graph.flags(self.node_id) & _IS_RUNTIME)
+
+    @property
+    def binary_missing(self) -> bool:
+        """Get whether there is no prebuilt binary of the package available."""
+        return bool(self._graph.flags(self.node_id) & _BINARY_MISSING)
+
+    @property
+    def layout_build_subdir(self) -> str:
+        """Get the build subdirectory of the package layout."""
+        return typing.cast(
+            "str", self._graph.string_field(self.node_id, _LAYOUT_BUILD_SUBDIR)
+        )
 
-if typing.TYPE_CHECKING:
-    from .packagenode import PackageNode
+    @property
+    def children(self) -> typing.List[PackageNodeView]:
+        """Get the nodes that this node depends upon."""
+        return [
+            self._graph.node(child) for child in self._graph.child_ids(self.node_id)
+        ]
+
+    @property
+    def parents(self) -> typing.List[PackageNodeView]:
+        """Get the nodes that depend upon this node."""
+        return [
+            self._graph.node(parent) for parent in self._graph.parent_ids(self.node_id)
+        ]
+
+    def clone_standalone(self) -> PackageNode:
+        """Clone the node as a PackageNode but without children or parents."""
+        return PackageNode(
+            self.name,
+            self.reference,
+            self.package_id,
+            self.recipe_revision,
+            self.short_paths,
+            self.info,
+            self.is_runtime,
+            self.layout_build_subdir,
+            [],
+            [],
+            self.binary_missing,
+        )
 
 
-@dataclass
 class DependencyGraph:
     """Representation of Conan's dependency graph."""
 
-    nodes: typing.List[PackageNode]
-    root: PackageNode
-
-
-def dependencygraph_from_node_dependees(node: PackageNode) -> DependencyGraph:
-    """
-    Generate a DependencyGraph from the immediate parents.
-
-    Immediate parents (those nodes requiring the node specified) as an inverted
-    dependency graph.
-    """
-    new_root = node.clone_standalone()
-    for parent in node.parents:
-        new_root.children.append(parent.clone_standalone())
-    new_graph = DependencyGraph(
-        [new_root] + new_root.children,
-        new_root,
-    )
-    return new_graph
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        strings: typing.List[str],
+        fields: array[int],
+        flags: array[int],
+        child_offsets: array[int],
+        child_ids: array[int],
+        root_id: int,
+    ) -> None:
+        """Initialise a DependencyGraph. Prefer using DependencyGraphBuilder."""
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self._strings = strings
+        self._fields = fields
+        self._flags = flags
+        self._child_offsets = child_offsets
+        self._child_ids = child_ids
+        self.root_id = root_id
+        edges = [
+            (child, parent)
+            for parent in range(len(flags))
+            for child in self.child_ids(parent)
+        ]
+        self._parent_offsets, self._parent_ids = _compressed_rows(len(flags), edges)
+        self._views: typing.Optional[typing.List[PackageNodeView]] = None
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """Pickle only the compact state; reverse edges and views are rebuilt."""
+        return (
+            DependencyGraph,
+            (
+                self._strings,
+                self._fields,
+                self._flags,
+                self._child_offsets,
+                self._child_ids,
+                self.root_id,
+            ),
+        )
+
+    @classmethod
+    def from_package_nodes(
+        cls, nodes: typing.Sequence[PackageNode], root: PackageNode
+    ) -> DependencyGraph:
+        """Make a DependencyGraph from linked PackageNodes."""
+        builder = DependencyGraphBuilder()
+        node_ids = {id(node): builder.add_package_node(node) for node in nodes}
+        for node in nodes:
+            for child in node.children:
+                if id(child) in node_ids:
+                    builder.add_edge(node_ids[id(node)], node_ids[id(child)])
+        return builder.build(node_ids[id(root)])
+
+    @property
+    def node_count(self) -> int:
+        """Get the number of nodes in the graph."""
+        return len(self._flags)
+
+    @property
+    def strings(self) -> typing.List[str]:
+        """Get the table of interned strings."""
+        return self._strings
+
+    @property
+    def nodes(self) -> typing.List[PackageNodeView]:
+        """Get views of all nodes, in node id order."""
+        if self._views is None:
+            self._views = [PackageNodeView(self, i) for i in range(self.node_count)]
+        return self._views
+
+    @property
+    def root(self) -> PackageNodeView:
+        """Get the root node."""
+        return self.node(self.root_id)
+
+    def node(self, node_id: int) -> PackageNodeView:
+        """Get the view of the node with the id."""
+        return self.nodes[node_id]
+
+    def string_field(self, node_id: int, field: int) -> typing.Optional[str]:
+        """Get a string field of a node."""
+        index = self._fields[node_id * _FIELD_COUNT + field]
+        return None if index == _NO_STRING else self._strings[index]
+
+    def string_fields(self, node_id: int) -> array[int]:
+        """Get the indices into the string table of all string fields of a node."""
+        start = node_id * _FIELD_COUNT
+        return self._fields[start : start + _FIELD_COUNT]  # noqa: E203
+
+    def flags(self, node_id: int) -> int:
+        """Get the flags of a node."""
+        return self._flags[node_id]
+
+    def child_ids(self, node_id: int) -> array[int]:
+        """Get the ids of the nodes that the node depends upon."""
+        start, end = self._child_offsets[node_id], self._child_offsets[node_id + 1]
+        return self._child_ids[start:end]
+
+    def parent_ids(self, node_id: int) -> array[int]:
+        """Get the ids of the nodes that depend upon the node."""
+        start, end = self._parent_offsets[node_id], self._parent_offsets[node_id + 1]
+        return self._parent_ids[start:end]
+
+    def edges(self) -> typing.Iterator[typing.Tuple[int, int]]:
+        """Iterate over all (parent, child) edges by id."""
+        for parent in range(self.node_count):
+            for child in self.child_ids(parent):
+                yield parent, child
+
+
+class DependencyGraphBuilder:
+    """Incrementally build a DependencyGraph."""
+
+    def __init__(self) -> None:
+        """Initialise a DependencyGraphBuilder."""
+        self._strings: typing.List[str] = []
+        self._string_ids: typing.Dict[str, int] = {}
+        self._fields = array("i")
+        self._flags = array("B")
+        self._edges: typing.List[typing.Tuple[int, int]] = []
+
+    def _intern(self, value: typing.Optional[str]) -> int:
+        if value is None:
+            return _NO_STRING
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return index
+
+    def add_node(
+        self,
+        name: str,
+        reference: str,
+        package_id: str,
+        recipe_revision: str,
+        short_paths: bool,
+        info: typing.Optional[str],
+        is_runtime: bool,
+        layout_build_subdir: typing.Optional[str],
+        binary_missing: bool = False,
+    ) -> int:
+        """Add a node, returning its id. Arguments match those of PackageNode."""
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        node_id = len(self._flags)
+        self._fields.extend(
+            (
+                self._intern(name),
+                self._intern(reference),
+                self._intern(package_id),
+                self._intern(recipe_revision),
+                self._intern(info),
+                self._intern(layout_build_subdir),
+            )
+        )
+        self._flags.append(
+            (_SHORT_PATHS if short_paths else 0)
+            | (_IS_RUNTIME if is_runtime else 0)
+            | (_BINARY_MISSING if binary_missing else 0)
+        )
+        return node_id
+
+    def add_package_node(self, node: PackageNodeLike) -> int:
+        """Add a node copied from a PackageNode, or a view, returning its id."""
+        return self.add_node(
+            node.name,
+            node.reference,
+            node.package_id,
+            node.recipe_revision,
+            node.short_paths,
+            node.info,
+            node.is_runtime,
+            node.layout_build_subdir,
+            node.binary_missing,
+        )
+
+    def add_edge(self, parent_id: int, child_id: int) -> None:
+        """Add an edge where the parent depends upon the child."""
+        self._edges.append((parent_id, child_id))
+
+    def build(self, root_id: int) -> DependencyGraph:
+        """Build the DependencyGraph, rooted at the node id."""
+        child_offsets, child_ids = _compressed_rows(len(self._flags), self._edges)
+        return DependencyGraph(
+            self._strings,
+            self._fields,
+            self._flags,
+            child_offsets,
+            child_ids,
+            root_id,
+        )
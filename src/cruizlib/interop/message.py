@@ -73,6 +73,20 @@ class Success(Message):
         return self._data
 
 
+class PartialSuccess(Message):
+    """Message with an intermediate result payload, before successful completion."""
+
+    def __init__(self, data: typing.Any) -> None:
+        """Initialise a PartialSuccess message."""
+        super().__init__()
+        self._data = data
+
+    @property
+    def payload(self) -> typing.Any:
+        """Get the intermediate result."""
+        return self._data
+
+
 class Failure(Message):
     """Message with optional exception details for a failed command."""
 
@@ -23,6 +23,7 @@ class PackageNode:
     layout_build_subdir: str
     children: typing.List[PackageNode] = field(default_factory=list)
     parents: typing.List[PackageNode] = field(default_factory=list)
+    binary_missing: bool = False
 
     def clone_standalone(self) -> PackageNode:
         """Clone a PackageNode but without children or parents."""
@@ -37,4 +38,5 @@ class PackageNode:
             self.layout_build_subdir,
             [],
             [],
+            self.binary_missing,
         )
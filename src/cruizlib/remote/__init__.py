@@ -0,0 +1 @@
+"""Utilities for querying, and caching the responses of, Conan remotes."""
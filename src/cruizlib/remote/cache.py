@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+"""
+Persistent cache of the responses of remotes, so that they survive between sessions.
+
+Responses are stored in an SQLite database, keyed by the URL of the remote,
+the kind of query, and the query itself.
+Each kind of query has a time to live, after which a response is expired and
+should be fetched again.
+Expired responses are kept, so that they can still be browsed when the remote
+cannot be contacted.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+import typing
+from dataclasses import dataclass
+from enum import Enum
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+logger = logging.getLogger(__name__)
+
+# name of the directory, beside the settings, of the remote metadata cache
+CACHE_DIRECTORY_NAME = "remotecache"
+# name of the database in the remote metadata cache directory
+CACHE_DATABASE_NAME = "responses.sqlite"
+# databases with a different version are emptied
+FORMAT_VERSION = 1
+
+
+class RemoteQueryKind(Enum):
+    """The kinds of query made of a remote."""
+
+    SEARCH = "search"
+    RECIPE_REVISIONS = "recipe-revisions"
+    PACKAGE_IDS = "package-ids"
+    PACKAGE_REVISIONS = "package-revisions"
+    PACKAGE_BINARY = "package-binary"
+
+
+# seconds until a response expires, or None for responses that never expire
+# listings grow as revisions are uploaded, but the binary of a package revision
+# is immutable
+TIME_TO_LIVE: typing.Dict[RemoteQueryKind, typing.Optional[float]] = {
+    RemoteQueryKind.SEARCH: 10 * 60.0,
+    RemoteQueryKind.RECIPE_REVISIONS: 10 * 60.0,
+    RemoteQueryKind.PACKAGE_IDS: 60 * 60.0,
+    RemoteQueryKind.PACKAGE_REVISIONS: 10 * 60.0,
+    RemoteQueryKind.PACKAGE_BINARY: None,
+}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Plain old data class representing a cached response of a remote."""
+
+    payload: typing.Any
+    stored: float
+    expired: bool
+
+
+class RemoteMetadataCache:
+    """An SQLite database of the responses of remotes to queries."""
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        clock: typing.Callable[[], float] = time.time,
+    ) -> None:
+        """Initialise a RemoteMetadataCache."""
+        self._clock = clock
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(path))
+            self._create_schema()
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Unable to open remote metadata cache: %s", str(exc))
+            self.close()
+
+    def _create_schema(self) -> None:
+        assert self._connection is not None
+        with self._connection:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version != FORMAT_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS responses")
+                self._connection.execute(f"PRAGMA user_version = {FORMAT_VERSION}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "remote TEXT NOT NULL, "
+                "kind TEXT NOT NULL, "
+                "query TEXT NOT NULL, "
+                "stored REAL NOT NULL, "
+                "payload TEXT NOT NULL, "
+                "PRIMARY KEY (remote, kind, query))"
+            )
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get(
+        self, remote: str, kind: RemoteQueryKind, query: str
+    ) -> typing.Optional[CachedResponse]:
+        """Get the cached response to the query, whether expired or not."""
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                "SELECT stored, payload FROM responses "
+                "WHERE remote = ? AND kind = ? AND query = ?",
+                (remote, kind.value, query),
+            ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Unable to read remote metadata cache: %s", str(exc))
+            return None
+        if row is None:
+            return None
+        stored, payload = row
+        try:
+            decoded_payload = json.loads(payload)
+        except ValueError as exc:
+            logger.warning("Ignoring corrupt remote metadata: %s", str(exc))
+            return None
+        time_to_live = TIME_TO_LIVE[kind]
+        expired = time_to_live is not None and self._clock() - stored > time_to_live
+        return CachedResponse(decoded_payload, stored, expired)
+
+    def put(
+        self, remote: str, kind: RemoteQueryKind, query: str, payload: typing.Any
+    ) -> None:
+        """Cache the response to the query, replacing any earlier response."""
+        if self._connection is None:
+            return
+        try:
+            encoded_payload = json.dumps(payload, separators=(",", ":"))
+        except (TypeError, ValueError) as exc:
+            logger.warning("Unable to cache remote metadata: %s", str(exc))
+            return
+        try:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (remote, kind.value, query, self._clock(), encoded_payload),
+                )
+        except sqlite3.Error as exc:
+            logger.warning("Unable to write remote metadata cache: %s", str(exc))
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+"""
+Columnar storage of the package ids of a recipe revision, for viewing and filtering.
+
+Each setting and option is a dictionary encoded column; the distinct values are
+sorted into a dictionary, and each row stores the code of its value.
+Codes are ordered as the values are, so that rows sort by comparing codes.
+Filters are evaluated as bitsets of the rows with each value, which are
+combined with bitwise operations, rather than visiting each row.
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import typing
+
+from .packagequery import OPTIONS_PREFIX
+
+# code of rows without a value in a column
+MISSING_CODE = 0
+# displayed for rows without a value in a column
+MISSING_VALUE = "-"
+
+PackageIdDetails = typing.Dict[
+    str, typing.Union[str, bool, typing.Dict[str, str], typing.List[str]]
+]
+
+# each byte of a bitset, expanded to a byte per row
+_EXPANDED_BYTES = [bytes((byte >> bit) & 1 for bit in range(8)) for byte in range(256)]
+
+
+class _DictionaryColumn:
+    """A dictionary encoded column of values."""
+
+    def __init__(self, values: typing.Sequence[typing.Any]) -> None:
+        distinct = sorted({value for value in values if value is not None}, key=str)
+        # code 0 is reserved for rows without a value
+        self.dictionary: typing.List[typing.Any] = [MISSING_VALUE] + distinct
+        codes = {value: code for code, value in enumerate(distinct, start=1)}
+        self.codes = array.array(
+            "I", (codes.get(value, MISSING_CODE) for value in values)
+        )
+        # filters are chosen as text
+        self._codes_of_text = {str(value): code for value, code in codes.items()}
+        self._bitsets: typing.Dict[int, int] = {}
+
+    def code_of(self, value: str) -> typing.Optional[int]:
+        """Get the code of a value, compared as text, or None if no row has it."""
+        return self._codes_of_text.get(value)
+
+    def bitset(self, code: int) -> int:
+        """Get the bitset of rows with the code."""
+        try:
+            return self._bitsets[code]
+        except KeyError:
+            pass
+        packed = bytearray((len(self.codes) + 7) // 8)
+        for row, row_code in enumerate(self.codes):
+            if row_code == code:
+                packed[row >> 3] |= 1 << (row & 7)
+        bitset = int.from_bytes(packed, "little")
+        self._bitsets[code] = bitset
+        return bitset
+
+
+class PackageIdTable:
+    """
+    The package ids of a recipe revision, stored by column.
+
+    Column 0 is the package id, followed by a column for each setting, and
+    then each option, sorted by name, and finally the requirements, if any.
+    """
+
+    def __init__(self, package_ids: typing.Sequence[PackageIdDetails]) -> None:
+        """Initialise a PackageIdTable."""
+        self.package_ids: typing.List[str] = [
+            str(details["id"]) for details in package_ids
+        ]
+        self._rows_of_package_id = {
+            package_id: row for row, package_id in enumerate(self.package_ids)
+        }
+        self.settings = self._keys(package_ids, "settings")
+        self.options = self._keys(package_ids, "options")
+        self._columns = [
+            _DictionaryColumn(self._column_values(package_ids, "settings", setting))
+            for setting in self.settings
+        ] + [
+            _DictionaryColumn(self._column_values(package_ids, "options", option))
+            for option in self.options
+        ]
+        self.requires: typing.Optional[typing.List[str]] = None
+        if package_ids and "requires" in package_ids[0]:
+            self.requires = [
+                "\n".join(
+                    sorted(
+                        typing.cast("typing.List[str]", details.get("requires") or [])
+                    )
+                )
+                for details in package_ids
+            ]
+        self.headers = ["Package Id"] + self.settings + self.options
+        if self.requires is not None:
+            self.headers.append("Requires")
+
+    @staticmethod
+    def _keys(
+        package_ids: typing.Sequence[PackageIdDetails], kind: str
+    ) -> typing.List[str]:
+        keys: typing.Set[str] = set()
+        for details in package_ids:
+            values = details.get(kind)
+            if values:
+                assert isinstance(values, dict)
+                keys.update(values)
+        return sorted(keys)
+
+    @staticmethod
+    def _column_values(
+        package_ids: typing.Sequence[PackageIdDetails], kind: str, key: str
+    ) -> typing.List[typing.Any]:
+        return [
+            typing.cast("typing.Dict[str, str]", details.get(kind) or {}).get(key)
+            for details in package_ids
+        ]
+
+    def __len__(self) -> int:
+        """Get the number of package ids."""
+        return len(self.package_ids)
+
+    def _dictionary_column(self, column: int) -> typing.Optional[_DictionaryColumn]:
+        if 1 <= column <= len(self._columns):
+            return self._columns[column - 1]
+        return None
+
+    def name_of(self, column: int) -> typing.Optional[str]:
+        """Get the name of a setting or option column, or None for the package id."""
+        if not column:
+            return None
+        if column <= len(self.settings):
+            return self.settings[column - 1]
+        return f"{OPTIONS_PREFIX}{self.options[column - len(self.settings) - 1]}"
+
+    def column_of(self, name: typing.Optional[str]) -> typing.Optional[int]:
+        """Get the column of a name, or None if there is no such setting or option."""
+        if name is None:
+            return 0
+        # settings and options are sorted by name
+        if name.startswith(OPTIONS_PREFIX):
+            keys, offset = self.options, len(self.settings)
+            _, _, key = name.partition(OPTIONS_PREFIX)
+        else:
+            keys, offset, key = self.settings, 0, name
+        index = bisect.bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            return 1 + offset + index
+        return None
+
+    def value(self, row: int, column: int) -> typing.Any:
+        """Get the value displayed in a cell."""
+        if not column:
+            return self.package_ids[row]
+        dictionary_column = self._dictionary_column(column)
+        if dictionary_column is not None:
+            return dictionary_column.dictionary[dictionary_column.codes[row]]
+        assert self.requires is not None
+        return self.requires[row]
+
+    def sort_keys(self, column: int) -> typing.Sequence[typing.Any]:
+        """Get keys of each row of a column, that sort in the order of the values."""
+        if not column:
+            return self.package_ids
+        dictionary_column = self._dictionary_column(column)
+        if dictionary_column is not None:
+            return dictionary_column.codes
+        assert self.requires is not None
+        return self.requires
+
+    def distinct_values(self, column: int) -> typing.List[str]:
+        """Get the distinct values in a column, excluding missing values."""
+        if not column:
+            return list(self.package_ids)
+        dictionary_column = self._dictionary_column(column)
+        assert dictionary_column is not None
+        return [str(value) for value in dictionary_column.dictionary[1:]]
+
+    def matching_rows(
+        self, filters: typing.Iterable[typing.Tuple[typing.Optional[str], str]]
+    ) -> bytes:
+        """
+        Get whether each row matches all filters, of a column name and value.
+
+        Each byte of the result is non-zero for a row that matches.
+        No row matches a filter of a setting or option not in the table.
+        """
+        mask = (1 << len(self)) - 1
+        for name, value in filters:
+            column = self.column_of(name)
+            if column is None:
+                mask = 0
+                break
+            if not column:
+                row = self._rows_of_package_id.get(value)
+                mask &= 0 if row is None else 1 << row
+                continue
+            dictionary_column = self._dictionary_column(column)
+            assert dictionary_column is not None
+            code = dictionary_column.code_of(value)
+            mask &= 0 if code is None else dictionary_column.bitset(code)
+        packed = mask.to_bytes((len(self) + 7) // 8, "little")
+        return b"".join(_EXPANDED_BYTES[byte] for byte in packed)[: len(self)]
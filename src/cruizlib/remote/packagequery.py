@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+"""
+Package queries, in Conan's syntax, of the settings and options of package ids.
+
+e.g. os="Linux" AND options.shared="True"
+"""
+
+from __future__ import annotations
+
+import typing
+
+# prefix of the names of options in package queries; settings are unprefixed
+OPTIONS_PREFIX = "options."
+
+
+def can_query(value: str) -> bool:
+    """Can the value be matched by a package query?."""
+    # Conan's query parser has no escaping of quotes
+    return bool(value) and '"' not in value and "'" not in value
+
+
+def package_query(
+    filters: typing.Iterable[typing.Tuple[str, str]],
+) -> typing.Optional[str]:
+    """
+    Get the package query matching all filters, of a name and value.
+
+    Filters whose values cannot be queried are omitted, so the package ids
+    found must still be filtered by the client.
+    None is returned when there is nothing to query.
+    """
+    terms = [f'{name}="{value}"' for name, value in filters if can_query(value)]
+    return " AND ".join(terms) if terms else None
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""
+Refinement of the results of searching remotes, without contacting the remote again.
+
+A pattern matches a package reference as Conan does, case insensitively against
+the name, and each longer partial reference, e.g. name/version, name/version@user.
+A pattern ending in @ only matches package references without a user and channel.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+import time
+import typing
+
+from .cache import RemoteQueryKind, TIME_TO_LIVE
+
+# maximum number of complete searches remembered for each remote
+MAXIMUM_SEARCHES_PER_REMOTE = 16
+
+# separators between the tokens of a package reference
+_SEPARATORS = "/@#"
+# patterns with these cannot be compared for refinement
+_UNSUPPORTED_CHARACTERS = "[]#:"
+
+
+def _partial_references(reference: str) -> typing.Iterator[str]:
+    for index, character in enumerate(reference):
+        if character in _SEPARATORS:
+            yield reference[:index]
+            yield reference[: index + 1]
+    yield reference
+
+
+def reference_matcher(pattern: str) -> typing.Callable[[str], bool]:
+    """Get a predicate of whether a package reference matches the search pattern."""
+    without_user_channel = pattern.endswith("@")
+    regex = re.compile(fnmatch.translate(pattern.rstrip("@")), re.IGNORECASE)
+
+    def _matches(reference: str) -> bool:
+        if without_user_channel and "@" in reference:
+            return False
+        return any(regex.match(partial) for partial in _partial_references(reference))
+
+    return _matches
+
+
+def is_refinement(pattern: str, superset: str) -> bool:
+    """
+    Check whether every package reference matching the pattern matches the superset.
+
+    This is conservative, so some refinements are not identified, e.g. where the
+    superset pattern uses single character or character set wildcards.
+    """
+    if any(character in _UNSUPPORTED_CHARACTERS for character in pattern + superset):
+        return False
+    if "?" in superset:
+        return False
+    if superset.endswith("@") and not pattern.endswith("@"):
+        return False
+    # each wildcard in the pattern must be consumed by a wildcard in the superset
+    # and case sensitively, in case the remote is case sensitive
+    return fnmatch.fnmatchcase(pattern.rstrip("@"), superset.rstrip("@"))
+
+
+class SearchRefiner:
+    """
+    Remember the complete results of searches of remotes, to refine them locally.
+
+    Results are sequences whose first element is the package reference.
+    They expire with the same time to live as the remote metadata cache.
+    """
+
+    def __init__(self, clock: typing.Callable[[], float] = time.monotonic) -> None:
+        """Initialise a SearchRefiner."""
+        self._clock = clock
+        # remote -> pattern -> (time added, results)
+        self._searches: typing.Dict[
+            str, typing.Dict[str, typing.Tuple[float, typing.List[typing.Any]]]
+        ] = {}
+
+    def clear(self) -> None:
+        """Forget all searches."""
+        self._searches.clear()
+
+    def add(
+        self, remote: str, pattern: str, results: typing.Sequence[typing.Any]
+    ) -> None:
+        """Remember the complete results of a search of the remote."""
+        searches = self._searches.setdefault(remote, {})
+        searches.pop(pattern, None)
+        searches[pattern] = (self._clock(), list(results))
+        while len(searches) > MAXIMUM_SEARCHES_PER_REMOTE:
+            del searches[next(iter(searches))]
+
+    def refine(
+        self, remote: str, pattern: str
+    ) -> typing.Optional[typing.List[typing.Any]]:
+        """
+        Get the results of searching the remote for the pattern, from an earlier search.
+
+        None is returned when no earlier search has results that are a superset.
+        """
+        time_to_live = TIME_TO_LIVE[RemoteQueryKind.SEARCH]
+        now = self._clock()
+        supersets = [
+            results
+            for superset, (added, results) in self._searches.get(remote, {}).items()
+            if (time_to_live is None or now - added <= time_to_live)
+            and is_refinement(pattern, superset)
+        ]
+        if not supersets:
+            return None
+        matches = reference_matcher(pattern)
+        return [result for result in min(supersets, key=len) if matches(result[0])]
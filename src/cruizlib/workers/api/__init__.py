@@ -6,6 +6,7 @@ from .common import (
     endmessagethread,
     failuretest,
     messagingtest,
+    partialsuccesstest,
     successtest,
     unknownmessagetest,
 )
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+"""Test a partially Successful reply, before the Successful reply."""
+
+from __future__ import annotations
+
+import contextlib
+import typing
+
+from cruizlib.interop.message import End, PartialSuccess, Success
+
+if typing.TYPE_CHECKING:
+    from cruizlib.multiprocessingmessagequeuetype import MultiProcessingMessageQueueType
+
+
+def invoke(queue: MultiProcessingMessageQueueType) -> None:
+    """Return a partially successful message, then a successful message."""
+    queue.put(PartialSuccess("This was a partial success!"))
+    queue.put(Success("This was a success!"))
+    queue.put(End())
+    with contextlib.suppress(AttributeError):
+        # may throw exception if used with a queue.queue rather than multiprocessing
+        queue.close()
+        queue.join_thread()
@@ -7,9 +7,8 @@ from __future__ import annotations
 import contextlib
 import typing
 
-from cruizlib.interop.dependencygraph import DependencyGraph
+from cruizlib.interop.dependencygraph import DependencyGraphBuilder
 from cruizlib.interop.message import Success
-from cruizlib.interop.packagenode import PackageNode
 from cruizlib.workers.utils.formatoptions import format_options
 
 from . import worker
@@ -33,6 +32,7 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
         from conans.model.env_info import EnvValues
         from conans.client.recorder.action_recorder import ActionRecorder
         from conans.client.graph.graph import (
+            BINARY_MISSING,
             RECIPE_CONSUMER,
             RECIPE_VIRTUAL,
         )
@@ -124,6 +124,7 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
         except AttributeError:
             # no build time nodes in older Conans
             build_time_nodes = []
+        builder = DependencyGraphBuilder()
         nodes = {}
         for node in sorted(deps_graph.nodes):
             # ensure some attributes, otherwise ConanInfo.dumps() fails
@@ -149,7 +150,7 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
                     raise ValueError(node.conanfile.info.invalid)  # pragma: no cover
 
             if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                new_node = PackageNode(
+                new_node = builder.add_node(
                     node.name,
                     str(node.ref),
                     node.package_id,
@@ -164,7 +165,7 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
             # ignoring the return value from...
             PackageReference(node.ref, node.package_id, node.ref.revision)
             is_runtime = node not in build_time_nodes
-            new_node = PackageNode(
+            new_node = builder.add_node(
                 node.name,
                 str(node.ref),
                 node.package_id,
@@ -173,15 +174,15 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
                 info,
                 is_runtime,
                 build_folder,
+                node.binary == BINARY_MISSING,
             )
             nodes[node] = new_node
 
-        # connect nodes (two-way)
+        # connect nodes (the reverse edges are derived)
         for node, interop_node in nodes.items():
             for dep in node.dependencies:
-                interop_node.children.append(nodes[dep.dst])
-                nodes[dep.dst].parents.append(interop_node)
+                builder.add_edge(interop_node, nodes[dep.dst])
 
-        new_graph = DependencyGraph(list(nodes.values()), new_node)
+        new_graph = builder.build(new_node)
 
         queue.put(Success(new_graph))
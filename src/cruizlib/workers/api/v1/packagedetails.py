@@ -19,7 +19,9 @@ def invoke(queue: MultiProcessingMessageQueueType, params: PackageIdParameters)
     """
     Equivalent to.
 
-    'conan search -r <remote_name> <reference>'
+    'conan search -r <remote_name> <reference> [-q <package_query>]'
+
+    The optional package query is evaluated by the remote.
 
     PackageIdParameters has dynamic attributes.
     """
@@ -29,6 +31,7 @@ def invoke(queue: MultiProcessingMessageQueueType, params: PackageIdParameters)
 
         result = api.search_packages(
             params.reference,
+            query=getattr(params, "package_query", None),
             remote_name=params.remote_name,
         )
         results_list = result["results"][0]["items"][0]["packages"]
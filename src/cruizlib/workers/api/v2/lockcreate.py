@@ -1,20 +1,26 @@
 #!/usr/bin/env python3
 
-"""Create a lockfile but in memory."""
+"""
+Create a lockfile in memory, and optionally write it to disk.
+
+The structure of the dependency graph is replied first, as a partial result,
+followed by the graph with binaries analysed, unless only the structure is wanted.
+"""
 
 from __future__ import annotations
 
 import typing
 
-from cruizlib.interop.dependencygraph import DependencyGraph
-from cruizlib.interop.message import Success
-from cruizlib.interop.packagenode import PackageNode
+from cruizlib.constants import GraphResolutionMode
+from cruizlib.interop.dependencygraph import DependencyGraphBuilder
+from cruizlib.interop.message import PartialSuccess, Success
 from cruizlib.workers.utils.formatoptions import format_options_v2
 
 from . import worker
 
 if typing.TYPE_CHECKING:
     from cruizlib.interop.commandparameters import CommandParameters
+    from cruizlib.interop.dependencygraph import DependencyGraph
     from cruizlib.multiprocessingmessagequeuetype import MultiProcessingMessageQueueType
 
 
@@ -29,17 +35,35 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
 
             try:
                 from conan.internal.graph.graph import (
+                    BINARY_MISSING,
+                    CONTEXT_BUILD,
                     RECIPE_CONSUMER,
                     RECIPE_VIRTUAL,
                 )
             except ImportError:
                 # older than Conan 2.17.0
                 from conans.client.graph.graph import (
+                    BINARY_MISSING,
+                    CONTEXT_BUILD,
                     RECIPE_CONSUMER,
                     RECIPE_VIRTUAL,
                 )
 
-            remotes = api.remotes.list()
+            # the local cache is always used first, and remotes only for
+            # packages not in it, unless updating
+            offline = params.graph_resolution_mode == GraphResolutionMode.OFFLINE
+            remotes = [] if offline else api.remotes.list()
+
+            lockfile = None
+            if params.lockfile:
+                # avoid resolving version ranges again
+                try:
+                    lockfile = api.lockfile.get_lockfile(
+                        lockfile=os.fspath(params.lockfile), partial=True
+                    )
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    # e.g. a lockfile left incomplete, so resolve everything again
+                    print(f"Ignoring lockfile {params.lockfile}: {exc}")
 
             # fake command line arguments
             @dataclasses.dataclass
@@ -50,7 +74,11 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
                 user = params.user
                 channel = params.channel
                 build: None = None
-                update = True
+                # a lockfile has already resolved revisions
+                update = (
+                    params.graph_resolution_mode == GraphResolutionMode.ALWAYS_UPDATE
+                    and lockfile is None
+                )
                 build_require: None = None
                 profile_build: None = None
                 profile_host: None = None
@@ -65,7 +93,6 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
 
             profile_host, profile_build = api.profiles.get_profiles_from_args(args)
 
-            lockfile = None
             # first get enough information about recipes
             assert params.recipe_path
             deps_graph = api.graph.load_graph_consumer(
@@ -78,75 +105,90 @@ def invoke(queue: MultiProcessingMessageQueueType, params: CommandParameters) ->
                 profile_build,
                 lockfile,
                 remotes,
-                args.build,
                 args.update,
                 is_build_require=args.build_require,
             )
 
-            # then get binary information, e.g. package_ids
-            api.graph.analyze_binaries(
-                deps_graph,
-                args.build,
-                remotes=remotes,
-                update=args.update,
-                lockfile=lockfile,
-            )
-
             # create nodes (derived from conan.graph.printer.print_graph)
             # continuing to use this in Conan 2
 
-            # TODO there is a bug here, as build_time_nodes has been removed
-            # see https://github.com/markfinal/cruiz/issues/279
-            # pylint: disable=no-member
-            build_time_nodes = deps_graph.build_time_nodes()
-
-            nodes = {}
-            for node in sorted(deps_graph.nodes):
-                info = node.conanfile.original_info.dumps()
-                build_folder = node.conanfile.folders.build
-                # in Conan 2, there are no short paths
-                short_paths = False
-
-                if node.conanfile.info.invalid:
-                    raise ValueError(node.conanfile.info.invalid)  # pragma: no cover
-
-                if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                    new_node = PackageNode(
+            def _interop_graph(analysed: bool) -> DependencyGraph:
+                # before binaries are analysed, there are no package_ids or info
+                builder = DependencyGraphBuilder()
+                nodes = {}
+                for node in sorted(deps_graph.nodes):
+                    info = None
+                    if analysed:
+                        info = node.conanfile.original_info.dumps()
+                        if node.conanfile.info.invalid:
+                            raise ValueError(  # pragma: no cover
+                                node.conanfile.info.invalid
+                            )
+                    package_id = node.package_id if analysed else ""
+                    build_folder = node.conanfile.folders.build
+                    # in Conan 2, there are no short paths
+                    short_paths = False
+
+                    if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                        new_node = builder.add_node(
+                            node.name,
+                            str(node.ref),
+                            package_id,
+                            node.ref.revision,
+                            short_paths,
+                            info,
+                            True,
+                            build_folder,
+                        )
+                        root_node = nodes[node] = new_node
+                        continue
+                    # DepsGraph.build_time_nodes is missing from some Conan 2 versions
+                    is_runtime = node.context != CONTEXT_BUILD
+                    new_node = builder.add_node(
                         node.name,
                         str(node.ref),
-                        node.package_id,
+                        package_id,
                         node.ref.revision,
                         short_paths,
                         info,
-                        True,
+                        is_runtime,
                         build_folder,
+                        analysed and node.binary == BINARY_MISSING,
                     )
-                    root_node = nodes[node] = new_node
-                    continue
-                is_runtime = node not in build_time_nodes
-                new_node = PackageNode(
-                    node.name,
-                    str(node.ref),
-                    node.package_id,
-                    node.ref.revision,
-                    short_paths,
-                    info,
-                    is_runtime,
-                    build_folder,
+                    nodes[node] = new_node
+
+                # connect nodes (the reverse edges are derived)
+                for node, interop_node in nodes.items():
+                    for dep in node.dependencies:
+                        builder.add_edge(interop_node, nodes[dep.dst])
+
+                # pylint: disable=possibly-used-before-assignment
+                # if root_node is not defined, I would expect an exception to be raised
+                return builder.build(root_node)
+
+            analyse_binaries = not params.graph_structure_only
+            if analyse_binaries:
+                # the structure of the graph is shown while binaries are analysed
+                queue.put(PartialSuccess(_interop_graph(False)))
+
+                # then get binary information, e.g. package_ids
+                api.graph.analyze_binaries(
+                    deps_graph,
+                    args.build,
+                    remotes=remotes,
+                    update=args.update,
+                    lockfile=lockfile,
                 )
-                nodes[node] = new_node
-
-            # connect nodes (two-way)
-            for node, interop_node in nodes.items():
-                for dep in node.dependencies:
-                    interop_node.children.append(nodes[dep.dst])
-                    nodes[dep.dst].parents.append(interop_node)
 
-            # pylint: disable=possibly-used-before-assignment
-            # if root_node is not defined, I would expect an exception to be raised
-            new_graph = DependencyGraph(list(nodes.values()), root_node)
+            if params.lockfile_out:
+                # locking only needs the resolved revisions
+                lockfile = api.lockfile.update_lockfile(lockfile, deps_graph)
+                # replaced whole, so that a cancelled command leaves no partial file
+                temporary_path = f"{os.fspath(params.lockfile_out)}.tmp"
+                api.lockfile.save_lockfile(lockfile, temporary_path)
+                os.replace(temporary_path, params.lockfile_out)
 
-            queue.put(Success(new_graph))
+            queue.put(Success(_interop_graph(analyse_binaries)))
         except Exception as exc:
             print(exc)
             raise
@@ -21,6 +21,11 @@ def invoke(queue: MultiProcessingMessageQueueType, params: PackageIdParameters)
 
     'conan search -r <remote_name> <reference>'
 
+    optionally filtered, as 'conan list -p <package_query>' does.
+    The remote protocol of Conan 2 cannot query package ids, so all are
+    downloaded, and those not matching the package query are removed before
+    sending the results.
+
     PackageIdParameters has dynamic attributes.
     """
     with worker.ConanWorker(queue, params) as api:
@@ -50,6 +55,17 @@ def invoke(queue: MultiProcessingMessageQueueType, params: PackageIdParameters)
             ref=ref,
         )
 
+        query = getattr(params, "package_query", None)
+        if query:
+            try:
+                results_dict = api.list.filter_packages_configurations(
+                    results_dict, query
+                )
+            except AttributeError:
+                # not available in older Conan versions, in which case the client
+                # filters all package ids
+                pass
+
         results_list: typing.List[typing.Dict[str, str]] = []
         for ref_pkgid, value in results_dict.items():
             entry = {"id": ref_pkgid.package_id}
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import typing
 
-from cruizlib.interop.message import Success
+from cruizlib.interop.message import PartialSuccess, Success
 
 from . import worker
 
@@ -15,6 +15,29 @@ if typing.TYPE_CHECKING:
     from cruizlib.multiprocessingmessagequeuetype import MultiProcessingMessageQueueType
 
 
+# number of package references sent in each message, so that the results of broad
+# patterns are inserted into the GUI incrementally
+SEARCH_CHUNK_SIZE = 200
+
+
+def put_in_chunks(
+    queue: MultiProcessingMessageQueueType, references: typing.Iterable[str]
+) -> None:
+    """
+    Put package references on the queue in chunks of SEARCH_CHUNK_SIZE.
+
+    All but the last chunk are PartialSuccess messages, and the last is the Success
+    message, so that its payload is only None when there are no references.
+    """
+    chunk: typing.List[typing.Tuple[str, typing.Optional[str]]] = []
+    for reference in references:
+        if len(chunk) == SEARCH_CHUNK_SIZE:
+            queue.put(PartialSuccess(chunk))
+            chunk = []
+        chunk.append((reference, None))
+    queue.put(Success(chunk or None))
+
+
 def invoke(
     queue: MultiProcessingMessageQueueType, params: SearchRecipesParameters
 ) -> None:
@@ -25,6 +48,13 @@ def invoke(
 
     with optional extra processing when aliases are detected.
 
+    Package references are sent in chunks of SEARCH_CHUNK_SIZE; all but the last
+    as PartialSuccess messages, and the last as the Success message.
+    Conan asks the remote for all references matching the pattern in a single
+    request, which cannot be paged, so the first chunk is only sent once that
+    request has completed. Chunking spreads the transfer to the GUI, and the
+    insertion of rows, rather than shortening the time to the first result.
+
     SearchRecipesParameters has dynamic attributes.
     """
     with worker.ConanWorker(queue, params) as api:
@@ -33,7 +63,6 @@ def invoke(
 
         remote_name = params.remote_name  # type: ignore
         remote = api.remotes.get(remote_name)
-        refs: typing.List[typing.Tuple[str, typing.Optional[str]]] = []
 
         assert hasattr(params, "pattern")
 
@@ -45,16 +74,14 @@ def invoke(
             pattern=ListPattern(params.pattern), remote=remote
         )
         try:
-            for first, _ in package_list.items():
-                refs.append((str(first), None))
+            recipes = package_list.items()
         except AttributeError:
             # in Conan 2.21.0, the items() method was added, but in older,
             # need to use the instance attribute recipes
-            for first, _ in package_list.recipes.items():  # pylint: disable=no-member
-                refs.append((str(first), None))
+            recipes = package_list.recipes.items()  # pylint: disable=no-member
 
         # TODO: alias aware
         # Conan 2 still allows aliases, but not recommended and may be removed in future
         # https://docs.conan.io/2/reference/conanfile/attributes.html#alias
 
-        queue.put(Success(refs or None))
+        put_in_chunks(queue, (str(first) for first, _ in recipes))
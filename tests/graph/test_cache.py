@@ -0,0 +1,137 @@
+"""Tests for the dependency graph cache."""
+
+from __future__ import annotations
+
+import typing
+
+from cruizlib.constants import GraphResolutionMode
+from cruizlib.graph.cache import (
+    DependencyGraphCache,
+    dependency_graph_cache_key,
+    dependency_graph_hash,
+)
+from cruizlib.interop.commandparameters import CommandParameters
+from cruizlib.interop.dependencygraph import DependencyGraph, DependencyGraphBuilder
+from cruizlib.interop.packagenode import PackageNode
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+def _make_params(recipe_path: pathlib.Path) -> CommandParameters:
+    params = CommandParameters("lock create", print)
+    params.recipe_path = recipe_path
+    params.name = "pkg"
+    params.version = "1.0"
+    params.profile = "default"
+    params.add_option("pkg", "shared", "True")
+    return params
+
+
+def test_cache_key(tmp_path: pathlib.Path) -> None:
+    """Test that the cache key changes whenever an input changes."""
+    recipe = tmp_path / "conanfile.py"
+    recipe.write_text("# recipe")
+    profile = tmp_path / "default"
+    profile.write_text("[settings]\n")
+
+    def _key() -> str:
+        return dependency_graph_cache_key(
+            _make_params(recipe), profile, {}, "2.0.0", "Default"
+        )
+
+    original = _key()
+    assert original == _key()
+
+    (tmp_path / "conandata.yml").write_text("sources: {}")
+    with_conandata = _key()
+    assert with_conandata != original
+
+    profile.write_text("[settings]\nos=Linux\n")
+    with_profile = _key()
+    assert with_profile != with_conandata
+
+    recipe.write_text("# changed recipe")
+    with_recipe = _key()
+    assert with_recipe != with_profile
+
+    params = _make_params(recipe)
+    params.add_option("pkg", "shared", "False")
+    assert (
+        dependency_graph_cache_key(params, profile, {}, "2.0.0", "Default")
+        != with_recipe
+    )
+    assert (
+        dependency_graph_cache_key(
+            _make_params(recipe), profile, {"name": "other"}, "2.0.0", "Default"
+        )
+        != with_recipe
+    )
+    assert (
+        dependency_graph_cache_key(
+            _make_params(recipe), profile, {}, "2.1.0", "Default"
+        )
+        != with_recipe
+    )
+
+    params = _make_params(recipe)
+    lockfile = tmp_path / "conan.lock"
+    lockfile.write_text("{}")
+    params.lockfile = lockfile
+    locked = dependency_graph_cache_key(params, profile, {}, "2.0.0", "Default")
+    assert locked != with_recipe
+    lockfile.write_text('{"requires": []}')
+    assert dependency_graph_cache_key(params, profile, {}, "2.0.0", "Default") != locked
+
+    params = _make_params(recipe)
+    params.graph_resolution_mode = GraphResolutionMode.OFFLINE
+    assert (
+        dependency_graph_cache_key(params, profile, {}, "2.0.0", "Default")
+        == with_recipe
+    )
+    params.graph_resolution_mode = GraphResolutionMode.ALWAYS_UPDATE
+    assert (
+        dependency_graph_cache_key(params, profile, {}, "2.0.0", "Default")
+        != with_recipe
+    )
+
+    params = _make_params(recipe)
+    params.graph_structure_only = True
+    assert (
+        dependency_graph_cache_key(params, profile, {}, "2.0.0", "Default")
+        != with_recipe
+    )
+
+
+def test_cache_lru() -> None:
+    """Test the least recently used eviction of the cache."""
+    node = PackageNode("Pkg", "Pkg/1.0", "1234", "ABCD", False, None, True, "")
+    graph = DependencyGraph.from_package_nodes([node], node)
+    cache = DependencyGraphCache(capacity=2)
+    cache.put("a", graph)
+    cache.put("b", graph)
+    assert cache.get("a") is graph
+    cache.put("c", graph)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is graph
+    cache.discard("a")
+    assert cache.get("a") is None
+
+
+def test_graph_hash() -> None:
+    """Test that the hash of a graph depends only upon its content."""
+
+    def _make_graph(is_runtime: bool) -> DependencyGraph:
+        builder = DependencyGraphBuilder()
+        root = builder.add_node("App", "App/1.0", "1", "R", False, None, True, "")
+        lib = builder.add_node("Lib", "Lib/1.0", "2", "R", False, None, is_runtime, "")
+        builder.add_edge(root, lib)
+        return builder.build(root)
+
+    assert dependency_graph_hash(_make_graph(True)) == dependency_graph_hash(
+        _make_graph(True)
+    )
+    assert dependency_graph_hash(_make_graph(True)) != dependency_graph_hash(
+        _make_graph(False)
+    )
@@ -0,0 +1,76 @@
+"""Tests for reducing the detail of dependency graphs."""
+
+from __future__ import annotations
+
+import typing
+
+from cruizlib.graph.detail import reduce_graph
+from cruizlib.interop.dependencygraph import DependencyGraphBuilder
+
+if typing.TYPE_CHECKING:
+    from cruizlib.interop.dependencygraph import DependencyGraph
+
+
+def _make_graph() -> DependencyGraph:
+    # app -> liba -> zlib
+    # app -> libb -> zlib, libb -> bzip2
+    # app -> cmake, liba -> ninja (build requirements)
+    builder = DependencyGraphBuilder()
+    nodes = {
+        name: builder.add_node(
+            name, f"{name}/1.0", "id", "rev", False, None, is_runtime, ""
+        )
+        for name, is_runtime in (
+            ("app", True),
+            ("liba", True),
+            ("libb", True),
+            ("zlib", True),
+            ("bzip2", True),
+            ("cmake", False),
+            ("ninja", False),
+        )
+    }
+    for parent, child in (
+        ("app", "liba"),
+        ("app", "libb"),
+        ("liba", "zlib"),
+        ("libb", "zlib"),
+        ("libb", "bzip2"),
+        ("app", "cmake"),
+        ("liba", "ninja"),
+    ):
+        builder.add_edge(nodes[parent], nodes[child])
+    return builder.build(nodes["app"])
+
+
+def _names(graph: DependencyGraph) -> typing.List[str]:
+    return [node.name for node in graph.nodes]
+
+
+def test_collapse() -> None:
+    """Test collapsing a subtree, keeping shared dependencies visible."""
+    graph = _make_graph()
+    libb = _names(graph).index("libb")
+    reduced = reduce_graph(graph, {libb})
+    # zlib remains, as it is also used by liba; bzip2 is hidden
+    assert sorted(_names(reduced.graph)) == sorted(
+        ["app", "liba", "libb", "zlib", "cmake", "ninja"]
+    )
+    new_libb = _names(reduced.graph).index("libb")
+    assert reduced.hidden_counts == {new_libb: 1}
+    assert not reduced.graph.node(new_libb).children
+    assert reduced.members[new_libb] == [libb]
+
+
+def test_group_build_requirements() -> None:
+    """Test grouping build requirements into a single node."""
+    graph = _make_graph()
+    reduced = reduce_graph(graph, set(), group_build_requirements=True)
+    assert reduced.group_id is not None
+    group = reduced.graph.node(reduced.group_id)
+    assert group.reference == "2 build requirements"
+    assert not group.is_runtime
+    members = reduced.members[group.node_id]
+    assert sorted(graph.node(member).name for member in members) == ["cmake", "ninja"]
+    assert sorted(parent.name for parent in group.parents) == ["app", "liba"]
+    assert reduced.graph.node_count == graph.node_count - 1
@@ -0,0 +1,73 @@
+"""Tests for differences between dependency graphs."""
+
+from __future__ import annotations
+
+import typing
+
+from cruizlib.graph.diff import ChangeKind, DependencyGraphDiff
+from cruizlib.interop.dependencygraph import DependencyGraph, DependencyGraphBuilder
+
+
+def _graph(packages: typing.Sequence[typing.Tuple[str, str, bool]]) -> DependencyGraph:
+    # the first (reference, package_id, is_runtime) is the root, requiring the rest
+    builder = DependencyGraphBuilder()
+    for reference, package_id, is_runtime in packages:
+        builder.add_node(
+            reference.split("/")[0],
+            reference,
+            package_id,
+            "rev",
+            False,
+            None,
+            is_runtime,
+            "",
+        )
+    for child in range(1, len(packages)):
+        builder.add_edge(0, child)
+    return builder.build(0)
+
+
+def test_diff() -> None:
+    """Test each kind of change, and that unchanged packages are matched."""
+    old = _graph(
+        [
+            ("app/1.0", "a1", True),
+            ("zlib/1.2", "z1", True),
+            ("openssl/3.0", "o1", True),
+            ("cmake/3.25", "c1", False),
+            ("boost/1.80", "b1", True),
+        ]
+    )
+    new = _graph(
+        [
+            ("app/1.0", "a2", True),
+            ("zlib/1.2", "z1", True),
+            ("openssl/3.1", "o2", True),
+            ("cmake/3.25", "c1", False),
+            ("fmt/10.0", "f1", True),
+        ]
+    )
+    diff = DependencyGraphDiff(old, new)
+    assert diff
+    assert diff.unchanged == 2
+    assert [(change.kind, change.name) for change in diff.changes] == [
+        (ChangeKind.ADDED, "fmt"),
+        (ChangeKind.REMOVED, "boost"),
+        (ChangeKind.VERSION_CHANGED, "openssl"),
+        (ChangeKind.PACKAGE_ID_CHANGED, "app"),
+    ]
+    version_change = diff.changes[2]
+    assert diff.before(version_change) == "openssl/3.0"
+    assert diff.after(version_change) == "openssl/3.1"
+    package_id_change = diff.changes[3]
+    assert diff.before(package_id_change) == "a1"
+    assert diff.after(package_id_change) == "a2"
+    assert not diff.before(diff.changes[0])
+
+
+def test_diff_identical() -> None:
+    """Test that identical graphs have no changes."""
+    packages = [("app/1.0", "a1", True), ("cmake/3.25", "c1", False)]
+    diff = DependencyGraphDiff(_graph(packages), _graph(packages))
+    assert not diff
+    assert diff.unchanged == 2
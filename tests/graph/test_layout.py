@@ -0,0 +1,80 @@
+"""Tests for the layered layout of graphs."""
+
+from __future__ import annotations
+
+from cruizlib.graph.layout import LayeredLayout, VERTEX_SEPARATION
+
+SIZE = (40.0, 20.0)
+
+
+def test_layering() -> None:
+    """Test that every edge points to a later layer, with long edges split."""
+    # 0 -> 1 -> 2, and 0 -> 2 spanning two layers
+    layout = LayeredLayout(3, [(0, 1), (1, 2), (0, 2)])
+    assert layout.layer_of == [0, 1, 2]
+    centres, edges = layout.coordinates([SIZE] * 3)
+    assert [(edge.source, edge.target) for edge in edges] == [(0, 1), (1, 2), (0, 2)]
+    # the long edge bends through a dummy vertex
+    assert len(edges[2].points) == len(("source", "dummy", "target"))
+    # top to bottom
+    assert centres[0][1] < centres[1][1] < centres[2][1]
+
+
+def test_cycles() -> None:
+    """Test that cycles are broken, but edges keep their direction."""
+    layout = LayeredLayout(3, [(0, 1), (1, 2), (2, 0), (1, 1)])
+    _, edges = layout.coordinates([SIZE] * 3)
+    assert [(edge.source, edge.target) for edge in edges] == [(0, 1), (1, 2), (2, 0)]
+    for edge in edges:
+        assert len(edge.points) >= len(("source", "target"))
+
+
+def test_crossing_minimisation() -> None:
+    """Test that crossings that can be avoided are removed."""
+    # two independent pairs given in an order that crosses
+    layout = LayeredLayout(4, [(0, 3), (1, 2)], keys=["a", "b", "c", "d"])
+    assert not layout.crossings
+
+
+def test_separation_and_rankdir() -> None:
+    """Test that vertices in a layer do not overlap, in both rank directions."""
+    edges = [(0, index) for index in range(1, 6)]
+    layout = LayeredLayout(6, edges)
+    centres, _ = layout.coordinates([SIZE] * 6, "TB")
+    xs = sorted(centres[index][0] for index in range(1, 6))
+    for left, right in zip(xs, xs[1:]):
+        assert right - left >= SIZE[0] + VERTEX_SEPARATION - 1e-6
+    centres, _ = layout.coordinates([SIZE] * 6, "LR")
+    assert all(centres[0][0] < centres[index][0] for index in range(1, 6))
+    ys = sorted(centres[index][1] for index in range(1, 6))
+    for top, bottom in zip(ys, ys[1:]):
+        assert bottom - top >= SIZE[1] + VERTEX_SEPARATION - 1e-6
+
+
+def test_incremental_relayout() -> None:
+    """Test that a relayout keeps the previous ordering of vertices."""
+    edges = [(0, 1), (0, 2), (0, 3)]
+    first = LayeredLayout(4, edges, keys=["root", "b", "c", "a"])
+    first.layers[1].reverse()
+    # a vertex is added, and the others are renumbered
+    second = LayeredLayout(
+        5,
+        [(0, 1), (0, 2), (0, 3), (0, 4)],
+        keys=["root", "a", "c", "b", "new"],
+        previous=first,
+    )
+    keys = [second.keys[vertex] for vertex in second.layers[1]]
+    assert keys[:3] == ["a", "c", "b"]
+
+
+def test_unrelated_previous_layout_is_not_a_seed() -> None:
+    """Test that a previous layout of a different graph does not affect ordering."""
+    edges = [(0, 2), (0, 3), (1, 2), (1, 4), (2, 5), (3, 5), (4, 6)]
+    keys = [f"new{vertex}" for vertex in range(7)]
+    unrelated = LayeredLayout(7, edges, keys=[f"old{vertex}" for vertex in range(7)])
+    for layer in unrelated.layers:
+        layer.reverse()
+    fresh = LayeredLayout(7, edges, keys=keys)
+    seeded = LayeredLayout(7, edges, keys=keys, previous=unrelated)
+    assert seeded.layers == fresh.layers
+    assert seeded.crossings == fresh.crossings
@@ -0,0 +1,70 @@
+"""Tests for dependency graphs across a matrix of configurations."""
+
+from __future__ import annotations
+
+from cruizlib.graph.matrix import (
+    MatrixConfiguration,
+    ProfileMatrix,
+    matrix_configurations,
+    parse_option_values,
+)
+from cruizlib.interop.dependencygraph import DependencyGraph, DependencyGraphBuilder
+
+import pytest  # pylint: disable=wrong-import-order
+
+
+def _graph(package_id: str, zlib_version: str, zlib_missing: bool) -> DependencyGraph:
+    builder = DependencyGraphBuilder()
+    root = builder.add_node("app", "app/1.0", package_id, "rev", False, None, True, "")
+    zlib = builder.add_node(
+        "zlib",
+        f"zlib/{zlib_version}",
+        "z1",
+        "rev",
+        False,
+        None,
+        True,
+        "",
+        binary_missing=zlib_missing,
+    )
+    builder.add_edge(root, zlib)
+    return builder.build(root)
+
+
+def test_configurations() -> None:
+    """Test parsing option values, and combining them with profiles."""
+    option_values = parse_option_values("shared=True,False; fPIC = True ;")
+    assert option_values == {"shared": ["True", "False"], "fPIC": ["True"]}
+    configurations = matrix_configurations(["gcc", "clang"], option_values)
+    assert [str(configuration) for configuration in configurations] == [
+        "gcc (shared=True, fPIC=True)",
+        "gcc (shared=False, fPIC=True)",
+        "clang (shared=True, fPIC=True)",
+        "clang (shared=False, fPIC=True)",
+    ]
+    assert matrix_configurations(["gcc"], {}) == [MatrixConfiguration("gcc")]
+    with pytest.raises(ValueError):
+        parse_option_values("shared")
+    with pytest.raises(ValueError):
+        parse_option_values("shared=")
+
+
+def test_profile_matrix() -> None:
+    """Test summarising the graphs of each configuration, as they arrive."""
+    matrix = ProfileMatrix(matrix_configurations(["gcc", "clang", "msvc"], {}))
+    assert len(matrix) == 3
+    matrix.set_graph(1, _graph("a2", "1.3", True))
+    assert matrix.package_id(1) == "a2"
+    assert matrix.missing_binaries(1) == ["zlib/1.3"]
+    # no diff until the first configuration is computed
+    assert matrix.diff(1) is None
+    matrix.set_graph(0, _graph("a1", "1.2", False))
+    assert matrix.diff(0) is None
+    assert not matrix.missing_binaries(0)
+    diff = matrix.diff(1)
+    assert diff is not None
+    assert [change.name for change in diff.changes] == ["zlib", "app"]
+    matrix.set_error(2, "Invalid configuration")
+    assert matrix.package_id(2) is None
+    assert matrix.errors[2] == "Invalid configuration"
+    assert matrix.diff(2) is None
@@ -0,0 +1,51 @@
+"""Tests for reachability queries on dependency graphs."""
+
+from __future__ import annotations
+
+from cruizlib.graph.reachability import ReachabilityIndex
+from cruizlib.interop.dependencygraph import DependencyGraphBuilder
+
+
+def _diamond() -> ReachabilityIndex:
+    builder = DependencyGraphBuilder()
+    for name in ("app", "liba", "libb", "zlib", "cmake"):
+        builder.add_node(name, f"{name}/1.0", "id", "rev", False, None, True, "")
+    # app -> liba -> zlib, app -> libb -> zlib, libb -> cmake
+    for parent, child in ((0, 1), (0, 2), (1, 3), (2, 3), (2, 3), (2, 4)):
+        builder.add_edge(parent, child)
+    return ReachabilityIndex(builder.build(0))
+
+
+def test_transitive_queries() -> None:
+    """Test transitive dependencies and dependents."""
+    index = _diamond()
+    assert index.depends_on(0, 3)
+    assert not index.depends_on(3, 0)
+    assert not index.depends_on(1, 4)
+    assert index.dependencies(0) == [1, 2, 3, 4]
+    assert index.dependencies(1) == [3]
+    assert index.dependents(3) == [0, 1, 2]
+    assert not index.dependents(0)
+
+
+def test_paths() -> None:
+    """Test the paths between nodes, ignoring duplicate edges."""
+    index = _diamond()
+    assert sorted(index.paths(0, 3)) == [[0, 1, 3], [0, 2, 3]]
+    assert list(index.why(4)) == [[0, 2, 4]]
+    assert list(index.why(0)) == [[0]]
+    assert not list(index.paths(1, 4))
+    assert index.between(0, 3) == [0, 1, 2, 3]
+    assert not index.between(1, 4)
+    assert sorted(index.path_edges(0, 3)) == [(0, 1), (0, 2), (1, 3), (2, 3)]
+
+
+def test_dependents_graph() -> None:
+    """Test the inverted graph of all transitive dependents."""
+    index = _diamond()
+    inverse = index.dependents_graph(3)
+    assert inverse.root.reference == "zlib/1.0"
+    assert sorted(
+        (inverse.node(parent).name, inverse.node(child).name)
+        for parent, child in inverse.edges()
+    ) == [("liba", "app"), ("libb", "app"), ("zlib", "liba"), ("zlib", "libb")]
@@ -0,0 +1,76 @@
+"""Tests for persisting dependency graphs."""
+
+from __future__ import annotations
+
+import typing
+
+from cruizlib.graph.store import (
+    DependencyGraphStore,
+    dependency_graph_from_bytes,
+    dependency_graph_to_bytes,
+)
+from cruizlib.interop.dependencygraph import DependencyGraph
+from cruizlib.interop.packagenode import PackageNode
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+def _make_graph() -> DependencyGraph:
+    pkg_a = PackageNode(
+        "PkgA", "PkgA/1.0", "1234", "ABCD", True, "InfoA", True, "LayoutA"
+    )
+    pkg_b = PackageNode("PkgB", "PkgB/2.0", "5678", "EFGH", False, None, False, "")
+    pkg_c = PackageNode(
+        "PkgC", "PkgC/3.0", "91011", "IJKL", True, "InfoC", True, "LayoutC"
+    )
+    # C depends on B and A, B depends on A
+    pkg_c.children = [pkg_b, pkg_a]
+    pkg_b.parents = [pkg_c]
+    pkg_b.children = [pkg_a]
+    pkg_a.parents = [pkg_c, pkg_b]
+    return DependencyGraph.from_package_nodes([pkg_c, pkg_b, pkg_a], pkg_c)
+
+
+def test_round_trip() -> None:
+    """Test serialising and deserialising a dependency graph."""
+    graph = _make_graph()
+    restored = dependency_graph_from_bytes(dependency_graph_to_bytes("key", graph))
+    assert restored
+    key, restored_graph = restored
+    assert key == "key"
+    assert restored_graph.root.reference == "PkgC/3.0"
+    assert [node.reference for node in restored_graph.nodes] == [
+        "PkgC/3.0",
+        "PkgB/2.0",
+        "PkgA/1.0",
+    ]
+    assert [child.name for child in restored_graph.root.children] == ["PkgB", "PkgA"]
+    pkg_a = restored_graph.nodes[2]
+    assert [parent.name for parent in pkg_a.parents] == ["PkgC", "PkgB"]
+    assert pkg_a.info == "InfoA"
+    assert restored_graph.nodes[1].info is None
+    assert not restored_graph.nodes[1].is_runtime
+
+
+def test_unknown_format() -> None:
+    """Test that data in an unknown format is ignored."""
+    data = bytearray(dependency_graph_to_bytes("key", _make_graph()))
+    data[4] = 0xFF  # version
+    assert dependency_graph_from_bytes(bytes(data)) is None
+    assert dependency_graph_from_bytes(b"") is None
+
+
+def test_store(tmp_path: pathlib.Path) -> None:
+    """Test saving, loading and removing persisted dependency graphs."""
+    store = DependencyGraphStore(tmp_path / "graphs")
+    assert store.load("recipe") is None
+    store.save("recipe", "key", _make_graph())
+    loaded = store.load("recipe")
+    assert loaded
+    assert loaded[0] == "key"
+    assert len(loaded[1].nodes) == 3
+    (tmp_path / "graphs" / "corrupt.cgraph").write_bytes(b"CRZG\x01\x00garbage")
+    assert store.load("corrupt") is None
+    store.remove("recipe")
+    assert store.load("recipe") is None
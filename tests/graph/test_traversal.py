@@ -0,0 +1,46 @@
+"""Tests for traversing dependency graphs."""
+
+from __future__ import annotations
+
+from cruizlib.graph.traversal import DepthFirstTraversal
+from cruizlib.interop.dependencygraph import DependencyGraphBuilder
+
+
+def test_depth_first_traversal() -> None:
+    """Test that shared nodes and duplicate edges are only visited once."""
+    builder = DependencyGraphBuilder()
+    app, lib_a, lib_b, zlib = (
+        builder.add_node(name, f"{name}/1.0", "id", "rev", False, None, True, "")
+        for name in ("app", "liba", "libb", "zlib")
+    )
+    # diamond, with a duplicated edge
+    builder.add_edge(app, lib_a)
+    builder.add_edge(app, lib_b)
+    builder.add_edge(lib_a, zlib)
+    builder.add_edge(lib_b, zlib)
+    builder.add_edge(lib_b, zlib)
+    traversal = DepthFirstTraversal(builder.build(app))
+    assert traversal.node_ids == [app, lib_a, zlib, lib_b]
+    assert traversal.edges == [
+        (zlib, lib_a),
+        (lib_a, app),
+        (zlib, lib_b),
+        (lib_b, app),
+    ]
+
+
+def test_depth_first_traversal_deep() -> None:
+    """Test that a deep chain does not exhaust the recursion limit."""
+    builder = DependencyGraphBuilder()
+    previous = builder.add_node("n0", "n0/1.0", "id", "rev", False, None, True, "")
+    root = previous
+    depth = 5000
+    for index in range(1, depth):
+        node = builder.add_node(
+            f"n{index}", f"n{index}/1.0", "id", "rev", False, None, True, ""
+        )
+        builder.add_edge(previous, node)
+        previous = node
+    traversal = DepthFirstTraversal(builder.build(root))
+    assert len(traversal.node_ids) == depth
+    assert len(traversal.edges) == depth - 1
@@ -5,7 +5,7 @@ import pathlib
 import typing
 
 import cruizlib.globals
-from cruizlib.constants import BuildFeatureConstants
+from cruizlib.constants import BuildFeatureConstants, GraphResolutionMode
 from cruizlib.interop.commandparameters import CommandParameters
 
 
@@ -272,3 +272,46 @@ def test_cmdparams_extra_options() -> None:
     cp = CommandParameters(MOCKED_VERB, _mocked_worker)
     cp.extra_options = "extra_options"
     assert cp.extra_options == "extra_options"
+
+
+def test_cmdparams_lockfile(tmp_path: pathlib.Path) -> None:
+    """Set the lockfiles to read from and write to."""
+    cp = CommandParameters(MOCKED_VERB, _mocked_worker)
+    cp.lockfile = tmp_path / "in.lock"
+    cp.lockfile_out = tmp_path / "out.lock"
+    assert cp.lockfile == tmp_path / "in.lock"
+    if cruizlib.globals.CONAN_MAJOR_VERSION == 1:
+        assert "--lockfile" not in cp.to_args()
+    else:
+        assert cp.to_args()[-4:] == [
+            "--lockfile",
+            str(tmp_path / "in.lock"),
+            "--lockfile-out",
+            str(tmp_path / "out.lock"),
+        ]
+
+
+def test_cmdparams_graph_resolution_mode() -> None:
+    """Set how remotes are used when resolving the dependency graph."""
+    cp = CommandParameters(MOCKED_VERB, _mocked_worker)
+    assert cp.graph_resolution_mode is None
+    cp.graph_resolution_mode = GraphResolutionMode.CACHE_FIRST
+    assert cp.to_args() == [MOCKED_VERB]
+    for mode, switch in (
+        (GraphResolutionMode.OFFLINE, "--no-remote"),
+        (GraphResolutionMode.ALWAYS_UPDATE, "--update"),
+    ):
+        cp.graph_resolution_mode = mode
+        if cruizlib.globals.CONAN_MAJOR_VERSION == 1:
+            assert switch not in cp.to_args()
+        else:
+            assert cp.to_args()[-1] == switch
+
+
+def test_cmdparams_graph_structure_only() -> None:
+    """Only resolve the structure of the dependency graph."""
+    cp = CommandParameters(MOCKED_VERB, _mocked_worker)
+    assert cp.graph_structure_only is None
+    cp.graph_structure_only = True
+    assert cp.graph_structure_only
+    assert cp.to_args() == [MOCKED_VERB]
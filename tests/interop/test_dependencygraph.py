@@ -1,33 +1,53 @@
 """Tests for DependencyGraph."""
 
-from cruizlib.interop.dependencygraph import dependencygraph_from_node_dependees
+import pickle
+
+from cruizlib.interop.dependencygraph import DependencyGraph, DependencyGraphBuilder
 from cruizlib.interop.packagenode import PackageNode
 
-NON_RECURSIVE_NODE_DEPTH = 2
 
+def test_dependencygraph_builder() -> None:
+    """Test building a dependency graph, and navigating it through views."""
+    builder = DependencyGraphBuilder()
+    root = builder.add_node("App", "App/1.0", "1", "R1", False, None, True, "build")
+    lib = builder.add_node("Lib", "Lib/1.0", "2", "R2", True, "Info", True, "build")
+    tool = builder.add_node(
+        "Tool", "Tool/1.0", "3", "R3", False, None, False, "", binary_missing=True
+    )
+    builder.add_edge(root, lib)
+    builder.add_edge(root, tool)
+    builder.add_edge(lib, tool)
+    graph = builder.build(root)
 
-def test_dependencygraph() -> None:
-    """
-    Test manipulating a dependency graph.
+    assert graph.node_count == len(graph.nodes) == 3
+    # identical strings are interned once
+    assert graph.strings.count("build") == 1
+    assert graph.root.reference == "App/1.0"
+    assert [child.name for child in graph.root.children] == ["Lib", "Tool"]
+    tool_node = graph.node(tool)
+    assert [parent.name for parent in tool_node.parents] == ["App", "Lib"]
+    assert not tool_node.is_runtime
+    assert tool_node.binary_missing
+    assert not graph.root.binary_missing
+    assert graph.node(lib).short_paths
+    assert graph.node(lib).info == "Info"
+    assert graph.root.info is None
+    assert graph.root.children[0] == graph.node(lib)
+    assert list(graph.edges()) == [(root, lib), (root, tool), (lib, tool)]
+
+    restored = pickle.loads(pickle.dumps(graph))
+    assert isinstance(restored, DependencyGraph)
+    assert [parent.name for parent in restored.node(tool).parents] == ["App", "Lib"]
+    assert restored.node(tool).binary_missing
 
-    The reason the number of nodes tested is 2 instead of 3 is because
-    the function does not recursively walk the dependency graph.
-    """
-    pkg_a = PackageNode(
-        "PkgA", "PkgA/1.0", "1234", "ABCD", True, "InfoA", True, "LayoutA"
-    )
-    pkg_b = PackageNode(
-        "PkgB", "PkgB/2.0", "5678", "EFGH", True, "InfoB", True, "LayoutB"
-    )
-    pkg_c = PackageNode(
-        "PkgC", "PkgC/3.0", "91011", "IJKL", True, "InfoC", True, "LayoutC"
-    )
 
-    # C depends on B depends on A
-    pkg_c.children = [pkg_b]
-    pkg_b.parents = [pkg_c]
+def test_dependencygraph_from_package_nodes() -> None:
+    """Test converting linked PackageNodes into a dependency graph."""
+    pkg_a = PackageNode("PkgA", "PkgA/1.0", "1234", "ABCD", True, None, True, "")
+    pkg_b = PackageNode("PkgB", "PkgB/2.0", "5678", "EFGH", True, None, True, "")
     pkg_b.children = [pkg_a]
     pkg_a.parents = [pkg_b]
 
-    inverted = dependencygraph_from_node_dependees(pkg_a)
-    assert len(inverted.nodes) == NON_RECURSIVE_NODE_DEPTH
+    graph = DependencyGraph.from_package_nodes([pkg_a, pkg_b], pkg_b)
+    assert graph.root.name == "PkgB"
+    assert graph.root.children[0].clone_standalone() == pkg_a.clone_standalone()
@@ -20,6 +20,9 @@ def test_message_extraction() -> None:
     assert isinstance(success.payload, int)
     assert success.payload == 1
 
+    partial = cruizlib.interop.message.PartialSuccess(2)
+    assert partial.payload == 2
+
     try:
         raise RuntimeError("This Failed")
     except RuntimeError as exc:
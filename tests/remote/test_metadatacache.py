@@ -0,0 +1,140 @@
+"""Tests for caching the responses of remotes."""
+
+from __future__ import annotations
+
+import sqlite3
+import typing
+
+from cruizlib.remote.cache import (
+    RemoteMetadataCache,
+    RemoteQueryKind,
+    TIME_TO_LIVE,
+)
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+# pylint: disable=too-few-public-methods
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_missing_response(tmp_path: pathlib.Path) -> None:
+    """Test that an uncached query has no response."""
+    cache = RemoteMetadataCache(tmp_path / "cache.sqlite")
+    assert cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib*") is None
+    cache.close()
+
+
+def test_round_trip(tmp_path: pathlib.Path) -> None:
+    """Test that a cached response is returned, and survives reopening."""
+    path = tmp_path / "nested" / "cache.sqlite"
+    payload = [["zlib/1.2.13", None], ["zlib/1.3", None]]
+    cache = RemoteMetadataCache(path)
+    cache.put("https://remote", RemoteQueryKind.SEARCH, "zlib*", payload)
+    cache.close()
+    cache = RemoteMetadataCache(path)
+    cached = cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib*")
+    assert cached
+    assert cached.payload == payload
+    assert not cached.expired
+    cache.close()
+
+
+def test_keyed_by_remote_kind_and_query(tmp_path: pathlib.Path) -> None:
+    """Test that responses are distinct per remote, kind of query, and query."""
+    cache = RemoteMetadataCache(tmp_path / "cache.sqlite")
+    cache.put("https://remote", RemoteQueryKind.SEARCH, "zlib*", ["first"])
+    cache.put("https://other", RemoteQueryKind.SEARCH, "zlib*", ["second"])
+    cache.put("https://remote", RemoteQueryKind.PACKAGE_IDS, "zlib*", ["third"])
+    cache.put("https://remote", RemoteQueryKind.SEARCH, "zlib*", ["fourth"])
+    first = cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib*")
+    second = cache.get("https://other", RemoteQueryKind.SEARCH, "zlib*")
+    third = cache.get("https://remote", RemoteQueryKind.PACKAGE_IDS, "zlib*")
+    assert first and first.payload == ["fourth"]
+    assert second and second.payload == ["second"]
+    assert third and third.payload == ["third"]
+    assert cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib") is None
+    cache.close()
+
+
+def test_expiry(tmp_path: pathlib.Path) -> None:
+    """Test that responses expire after the time to live of their kind."""
+    clock = _Clock()
+    cache = RemoteMetadataCache(tmp_path / "cache.sqlite", clock)
+    cache.put("https://remote", RemoteQueryKind.SEARCH, "zlib*", None)
+    time_to_live = TIME_TO_LIVE[RemoteQueryKind.SEARCH]
+    assert time_to_live is not None
+    clock.now += time_to_live
+    cached = cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib*")
+    assert cached and not cached.expired
+    clock.now += 1
+    # expired responses are still available, e.g. for browsing offline
+    cached = cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib*")
+    assert cached
+    assert cached.expired
+    assert cached.payload is None
+    assert cached.stored == 1000.0
+    cache.close()
+
+
+def test_revisions_expire(tmp_path: pathlib.Path) -> None:
+    """Test that responses listing revisions expire, as new ones are uploaded."""
+    clock = _Clock()
+    cache = RemoteMetadataCache(tmp_path / "cache.sqlite", clock)
+    for kind in (RemoteQueryKind.RECIPE_REVISIONS, RemoteQueryKind.PACKAGE_REVISIONS):
+        cache.put("https://remote", kind, "zlib/1.3", [{"revision": "abc"}])
+    clock.now += 24 * 60 * 60
+    for kind in (RemoteQueryKind.RECIPE_REVISIONS, RemoteQueryKind.PACKAGE_REVISIONS):
+        cached = cache.get("https://remote", kind, "zlib/1.3")
+        assert cached and cached.expired
+    cache.close()
+
+
+def test_package_binaries_never_expire(tmp_path: pathlib.Path) -> None:
+    """Test that the binary of a package revision never expires."""
+    clock = _Clock()
+    cache = RemoteMetadataCache(tmp_path / "cache.sqlite", clock)
+    pref = "zlib/1.3#abc:1234#def"
+    cache.put("https://remote", RemoteQueryKind.PACKAGE_BINARY, pref, {"files": []})
+    clock.now += 10 * 365 * 24 * 60 * 60
+    cached = cache.get("https://remote", RemoteQueryKind.PACKAGE_BINARY, pref)
+    assert cached and not cached.expired
+    cache.close()
+
+
+def test_unserialisable_payload(tmp_path: pathlib.Path) -> None:
+    """Test that a response that cannot be serialised is not cached."""
+    cache = RemoteMetadataCache(tmp_path / "cache.sqlite")
+    cache.put("https://remote", RemoteQueryKind.SEARCH, "zlib*", object())
+    assert cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib*") is None
+    cache.close()
+
+
+def test_other_format_version_emptied(tmp_path: pathlib.Path) -> None:
+    """Test that a database of another format version is emptied."""
+    path = tmp_path / "cache.sqlite"
+    cache = RemoteMetadataCache(path)
+    cache.put("https://remote", RemoteQueryKind.SEARCH, "zlib*", ["zlib/1.3"])
+    cache.close()
+    connection = sqlite3.connect(str(path))
+    connection.execute("PRAGMA user_version = 0")
+    connection.close()
+    cache = RemoteMetadataCache(path)
+    assert cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib*") is None
+    cache.close()
+
+
+def test_unusable_location(tmp_path: pathlib.Path) -> None:
+    """Test that a cache that cannot be opened behaves as if empty."""
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory", encoding="utf-8")
+    cache = RemoteMetadataCache(blocker / "cache.sqlite")
+    cache.put("https://remote", RemoteQueryKind.SEARCH, "zlib*", ["zlib/1.3"])
+    assert cache.get("https://remote", RemoteQueryKind.SEARCH, "zlib*") is None
+    cache.close()
@@ -0,0 +1,135 @@
+"""Tests for the columnar storage of package ids."""
+
+from __future__ import annotations
+
+import typing
+
+from cruizlib.remote.packageidtable import MISSING_VALUE, PackageIdTable
+
+if typing.TYPE_CHECKING:
+    from cruizlib.remote.packageidtable import PackageIdDetails
+
+
+def _package_ids() -> typing.List[PackageIdDetails]:
+    return [
+        {
+            "id": "aaa",
+            "settings": {"os": "Windows", "build_type": "Release"},
+            "options": {"shared": "True"},
+            "requires": ["zlib/1.3", "bzip2/1.0"],
+        },
+        {
+            "id": "bbb",
+            "settings": {"os": "Linux", "build_type": "Release"},
+            "options": {"shared": "False", "fPIC": "True"},
+            "requires": [],
+        },
+        {
+            "id": "ccc",
+            "settings": {"os": "Linux", "build_type": "Debug"},
+            "options": {"shared": "True", "fPIC": "True"},
+            "requires": ["zlib/1.3"],
+        },
+    ]
+
+
+def test_columns() -> None:
+    """Test that settings, then options, are columns sorted by name."""
+    table = PackageIdTable(_package_ids())
+    assert len(table) == 3
+    assert table.settings == ["build_type", "os"]
+    assert table.options == ["fPIC", "shared"]
+    assert table.headers == [
+        "Package Id",
+        "build_type",
+        "os",
+        "fPIC",
+        "shared",
+        "Requires",
+    ]
+
+
+def test_values() -> None:
+    """Test that cells decode to their values, and missing values are marked."""
+    table = PackageIdTable(_package_ids())
+    assert table.value(1, 0) == "bbb"
+    assert table.value(0, 2) == "Windows"
+    assert table.value(2, 1) == "Debug"
+    assert table.value(0, 3) == MISSING_VALUE
+    assert table.value(1, 4) == "False"
+    assert table.value(0, 5) == "bzip2/1.0\nzlib/1.3"
+    assert not table.value(1, 5)
+
+
+def test_without_requires() -> None:
+    """Test that there is no requires column when package ids have no requires."""
+    package_ids = _package_ids()
+    for details in package_ids:
+        del details["requires"]
+    table = PackageIdTable(package_ids)
+    assert table.requires is None
+    assert table.headers[-1] == "shared"
+
+
+def test_distinct_values() -> None:
+    """Test that the distinct values of columns are sorted, excluding missing."""
+    table = PackageIdTable(_package_ids())
+    assert table.distinct_values(0) == ["aaa", "bbb", "ccc"]
+    assert table.distinct_values(2) == ["Linux", "Windows"]
+    assert table.distinct_values(3) == ["True"]
+
+
+def test_sort_keys_order_as_values() -> None:
+    """Test that the sort keys of a column are in the order of its values."""
+    table = PackageIdTable(_package_ids())
+    for column in range(len(table.headers)):
+        keys = table.sort_keys(column)
+        values = [table.value(row, column) for row in range(len(table))]
+        by_key = sorted(range(len(table)), key=keys.__getitem__)
+        assert [values[row] for row in by_key] == sorted(values)
+
+
+def test_column_names() -> None:
+    """Test that columns are named as in package queries."""
+    table = PackageIdTable(_package_ids())
+    assert [table.name_of(column) for column in range(5)] == [
+        None,
+        "build_type",
+        "os",
+        "options.fPIC",
+        "options.shared",
+    ]
+    assert not table.column_of(None)
+    assert table.column_of(None) is not None
+    assert table.column_of("options.shared") == 4
+    assert table.column_of("shared") is None
+
+
+def test_matching_rows() -> None:
+    """Test that rows match all filters, on package ids, settings and options."""
+    table = PackageIdTable(_package_ids())
+    assert list(table.matching_rows([])) == [1, 1, 1]
+    assert list(table.matching_rows([("os", "Linux")])) == [0, 1, 1]
+    assert list(table.matching_rows([("os", "Linux"), ("options.shared", "True")])) == [
+        0,
+        0,
+        1,
+    ]
+    assert list(table.matching_rows([(None, "bbb")])) == [0, 1, 0]
+    assert list(table.matching_rows([("os", "macOS")])) == [0, 0, 0]
+    assert list(table.matching_rows([(None, "zzz")])) == [0, 0, 0]
+    assert list(table.matching_rows([("compiler", "gcc")])) == [0, 0, 0]
+
+
+def test_matching_rows_of_many_package_ids() -> None:
+    """Test that filters are evaluated across bitsets wider than a byte."""
+    package_ids: typing.List[PackageIdDetails] = [
+        {"id": f"{row:05}", "settings": {"arch": ("x86", "x86_64", "armv8")[row % 3]}}
+        for row in range(10001)
+    ]
+    table = PackageIdTable(package_ids)
+    matching = table.matching_rows([("arch", "armv8")])
+    assert len(matching) == len(table)
+    assert [row for row, match in enumerate(matching) if match] == list(
+        range(2, 10001, 3)
+    )
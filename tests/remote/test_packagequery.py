@@ -0,0 +1,34 @@
+"""Tests for package queries of the settings and options of package ids."""
+
+from __future__ import annotations
+
+from cruizlib.remote.packagequery import OPTIONS_PREFIX, can_query, package_query
+
+
+def test_no_filters() -> None:
+    """Test that there is no query without filters."""
+    assert package_query([]) is None
+
+
+def test_settings_and_options() -> None:
+    """Test that all filters must match, with quoted values."""
+    query = package_query(
+        [
+            ("compiler", "Visual Studio"),
+            ("compiler.version", "17"),
+            (f"{OPTIONS_PREFIX}shared", "True"),
+        ]
+    )
+    assert query == (
+        'compiler="Visual Studio" AND compiler.version="17" AND options.shared="True"'
+    )
+
+
+def test_unqueryable_values_are_omitted() -> None:
+    """Test that values that cannot be quoted are omitted from the query."""
+    assert not can_query('say "hi"')
+    assert not can_query("")
+    assert package_query([("os", "Linux"), ("options.greeting", "it's")]) == (
+        'os="Linux"'
+    )
+    assert package_query([("options.greeting", "it's")]) is None
@@ -0,0 +1,109 @@
+"""Tests for refining the results of searching remotes."""
+
+from __future__ import annotations
+
+from cruizlib.remote.cache import RemoteQueryKind, TIME_TO_LIVE
+from cruizlib.remote.search import (
+    MAXIMUM_SEARCHES_PER_REMOTE,
+    SearchRefiner,
+    is_refinement,
+    reference_matcher,
+)
+
+# pylint: disable=wrong-import-order
+import pytest
+
+
+# pylint: disable=too-few-public-methods
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize(
+    "pattern,reference,expected",
+    [
+        ("zlib", "zlib/1.3", True),
+        ("ZLIB", "zlib/1.3", True),
+        ("zlib", "zlibng/1.3", False),
+        ("zlib*", "zlib-ng/2.0", True),
+        ("zlib/1.*", "zlib/1.3", True),
+        ("zlib/2.*", "zlib/1.3", False),
+        ("zlib/1.3@", "zlib/1.3", True),
+        ("zlib/1.3@", "zlib/1.3@user/channel", False),
+        ("zlib/1.3@user", "zlib/1.3@user/channel", True),
+        ("*/1.3", "zstd/1.3", True),
+    ],
+)
+def test_reference_matcher(pattern: str, reference: str, expected: bool) -> None:
+    """Test that package references are matched against patterns as Conan does."""
+    assert reference_matcher(pattern)(reference) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern,superset,expected",
+    [
+        ("zlib*", "z*", True),
+        ("zlib", "z*", True),
+        ("zlib*", "zlib*", True),
+        ("*zlib*", "*lib*", True),
+        ("z?ib", "z*", True),
+        ("z*", "zlib*", False),
+        ("Zlib*", "z*", False),
+        ("zlib", "z?ib", False),
+        ("zlib/[>1.0]", "z*", False),
+        ("zlib/1.3@", "zlib*", True),
+        ("zlib*", "zlib*@", False),
+        ("zlib/1.3@", "zlib*@", True),
+    ],
+)
+def test_is_refinement(pattern: str, superset: str, expected: bool) -> None:
+    """Test that only patterns matching a subset of the superset are refinements."""
+    assert is_refinement(pattern, superset) == expected
+
+
+def test_refine_without_earlier_search() -> None:
+    """Test that nothing is refined without an earlier search."""
+    refiner = SearchRefiner()
+    assert refiner.refine("https://remote", "zlib*") is None
+
+
+def test_refine_filters_the_smallest_superset() -> None:
+    """Test that the smallest superset of results is filtered by the pattern."""
+    refiner = SearchRefiner()
+    refiner.add(
+        "https://remote",
+        "*",
+        [("zlib/1.3", None), ("zstd/1.5", None), ("boost/1.86", None)],
+    )
+    refiner.add("https://remote", "z*", [("zlib/1.3", None), ("zstd/1.5", None)])
+    refiner.add("https://other", "zlib*", [("zlib/1.2", None)])
+    assert refiner.refine("https://remote", "zlib*") == [("zlib/1.3", None)]
+    assert refiner.refine("https://remote", "b*") == [("boost/1.86", None)]
+    assert refiner.refine("https://remote", "x*") == []
+    assert refiner.refine("https://nowhere", "zlib*") is None
+
+
+def test_refine_ignores_expired_searches() -> None:
+    """Test that searches older than the time to live are not refined."""
+    clock = _Clock()
+    refiner = SearchRefiner(clock)
+    refiner.add("https://remote", "z*", [("zlib/1.3", None)])
+    time_to_live = TIME_TO_LIVE[RemoteQueryKind.SEARCH]
+    assert time_to_live is not None
+    clock.now += time_to_live + 1
+    assert refiner.refine("https://remote", "zlib*") is None
+
+
+def test_searches_are_bounded() -> None:
+    """Test that the oldest searches of a remote are forgotten."""
+    refiner = SearchRefiner()
+    refiner.add("https://remote", "a*", [("abseil/1.0", None)])
+    for index in range(MAXIMUM_SEARCHES_PER_REMOTE):
+        refiner.add("https://remote", f"b{index}*", [])
+    assert refiner.refine("https://remote", "abseil") is None
+    refiner.clear()
+    assert refiner.refine("https://remote", "b1*") is None
@@ -0,0 +1,134 @@
+"""
+Test the remote browser dock, and the remote metadata cache it uses.
+
+The Conan context and prefetcher are replaced, so that no Conan commands are run.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import queue
+import typing
+from unittest.mock import MagicMock
+
+from PySide6 import QtCore
+
+from cruizlib.interop.message import Message, PartialSuccess, Success
+from cruizlib.interop.reciperevisionsparameters import RecipeRevisionsParameters
+from cruizlib.interop.searchrecipesparameters import SearchRecipesParameters
+from cruizlib.remote.cache import RemoteQueryKind
+from cruizlib.workers.api.v2 import remotesearch
+
+# pylint: disable=wrong-import-order
+import pytest
+
+if typing.TYPE_CHECKING:
+    from cruiz.remote_browser.remotebrowser import RemoteBrowserDock
+
+REMOTE_URL = "https://remote"
+REFERENCE = "zlib/1.3"
+
+
+@pytest.fixture(name="remote_browser")
+def fixture_remote_browser(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> typing.Iterator[RemoteBrowserDock]:
+    """Fixture for a remote browser, without a Conan context or prefetcher."""
+    # imported here, rather than when collected, so that the GUI modules are not
+    # loaded before the test that cruizlib does not import them
+    # pylint: disable=import-outside-toplevel, c-extension-no-member
+    from PySide6 import QtWidgets
+
+    from cruiz.remote_browser import remotebrowser
+
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    _ = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    # settings, and the remote metadata cache beside them, are isolated
+    QtCore.QSettings.setPath(
+        QtCore.QSettings.Format.IniFormat,
+        QtCore.QSettings.Scope.UserScope,
+        str(tmp_path),
+    )
+    context = MagicMock()
+    context.is_busy = False
+    monkeypatch.setattr(remotebrowser, "ConanContext", MagicMock(return_value=context))
+    monkeypatch.setattr(remotebrowser, "RemotePrefetcher", MagicMock())
+    dock = remotebrowser.RemoteBrowserDock()
+    yield dock
+    dock.cleanup()
+
+
+def _fetch_recipe_revisions(
+    dock: RemoteBrowserDock,
+) -> typing.List[typing.Any]:
+    """Fetch the recipe revisions of the reference, returning the responses."""
+    responses: typing.List[typing.Any] = []
+    params = RecipeRevisionsParameters(reference=REFERENCE, remote_name=REMOTE_URL)
+    # pylint: disable=protected-access
+    dock._ui.rrev._fetch(
+        RemoteQueryKind.RECIPE_REVISIONS,
+        REFERENCE,
+        params,
+        lambda results, exception: responses.append(results),
+    )
+    return responses
+
+
+def test_cache_survives_reshowing(
+    remote_browser: RemoteBrowserDock,
+) -> None:
+    """Test that the remote metadata cache is still used after closing the dock."""
+    remote_browser.show()
+    assert remote_browser.close()
+    remote_browser.show()
+    # pylint: disable=protected-access
+    remote_browser._remote_cache.put(
+        REMOTE_URL, RemoteQueryKind.RECIPE_REVISIONS, REFERENCE, ["abc"]
+    )
+    assert _fetch_recipe_revisions(remote_browser) == [["abc"]]
+    context = typing.cast("MagicMock", remote_browser._context)
+    context.get_package_details.assert_not_called()
+
+
+def test_search_chunks_accumulated(
+    remote_browser: RemoteBrowserDock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that chunks of search results are passed on, and cached whole, in order."""
+    monkeypatch.setattr(remotesearch, "SEARCH_CHUNK_SIZE", 2)
+    references = [f"pkg{index}/1.0" for index in range(5)]
+    reply_queue: queue.Queue[Message] = queue.Queue()
+    remotesearch.put_in_chunks(reply_queue, references)  # type: ignore[arg-type]
+    replies = list(reply_queue.queue)
+    assert len(replies) == 3
+
+    partial_responses: typing.List[typing.Any] = []
+    responses: typing.List[typing.Any] = []
+    params = SearchRecipesParameters(remote_name=REMOTE_URL, pattern="pkg*")
+    # pylint: disable=protected-access
+    remote_browser._ui.pkgref._fetch(
+        RemoteQueryKind.SEARCH,
+        "pkg*",
+        params,
+        lambda results, exception: responses.append(results),
+        partial_continuation=partial_responses.append,
+    )
+    context = typing.cast("MagicMock", remote_browser._context)
+    _, continuation, partial_continuation = context.get_package_details.call_args.args
+    # replies are delivered as the context would
+    for reply in replies:
+        if isinstance(reply, PartialSuccess):
+            partial_continuation(reply.payload)
+        else:
+            assert isinstance(reply, Success)
+            continuation(reply.payload, None)
+
+    assert partial_responses == [
+        [(references[0], None), (references[1], None)],
+        [(references[2], None), (references[3], None)],
+    ]
+    assert responses == [[(references[4], None)]]
+    cached = remote_browser._remote_cache.get(
+        REMOTE_URL, RemoteQueryKind.SEARCH, "pkg*"
+    )
+    assert cached
+    assert [reference for reference, _ in cached.payload] == references
@@ -26,6 +26,7 @@ from cruizlib.interop.message import (
     End,
     Failure,
     Message,
+    PartialSuccess,
     Stderr,
     Stdout,
     Success,
@@ -297,6 +298,8 @@ def multiprocess_reply_queue_fixture() -> MultiprocessReplyQueueFixture:
                         )
                     elif isinstance(reply, (ConanLogMessage, Stdout, Stderr)):
                         LOGGER.info(reply.message)
+                    elif isinstance(reply, PartialSuccess):
+                        LOGGER.info("Partial result: %s", reply.payload)
                     else:
                         raise ValueError(f"Unknown reply of type '{type(reply)}'")
             finally:
@@ -0,0 +1,83 @@
+"""Test tracking build progress from command output."""
+
+from __future__ import annotations
+
+from cruizlib.commands.buildprogress import (
+    BuildProgressTracker,
+    format_duration,
+    parse_progress,
+)
+from cruizlib.workers.utils.text2html import text_to_html
+
+
+def test_parse_progress() -> None:
+    """Test recognising Ninja and Makefile progress lines."""
+    assert parse_progress("[3/120] Building CXX object foo.o") == (3, 120, False)
+    assert parse_progress(text_to_html("[ 42%] Building CXX object foo.o")) == (
+        42,
+        100,
+        True,
+    )
+    assert parse_progress("<font color='green'>[100%] Built target foo</font>") == (
+        100,
+        100,
+        True,
+    )
+    assert parse_progress("-- Configuring done") is None
+    assert parse_progress("[settings]") is None
+
+
+def test_tracker_rate_and_eta() -> None:
+    """Test the rate and ETA of a build, and detecting a new build."""
+    now = [0.0]
+    tracker = BuildProgressTracker(lambda: now[0])
+    first = tracker.feed("[1/10] a")
+    assert first
+    assert first.rate is None
+    assert first.eta is None
+    now[0] = 2.0
+    second = tracker.feed("[5/10] b")
+    assert second
+    assert second.rate == 2.0
+    assert second.eta == 2.5
+    assert second.recent_rates == (2.0,)
+    assert tracker.feed("not progress") is None
+    # a new build restarts tracking
+    now[0] = 3.0
+    restarted = tracker.feed("[1/4] c")
+    assert restarted
+    assert restarted.total == 4
+    assert restarted.rate is None
+    assert not tracker.history
+
+
+def test_tracker_out_of_order_progress() -> None:
+    """Test that parallel builds reporting progress out of order are not restarted."""
+    now = [0.0]
+    tracker = BuildProgressTracker(lambda: now[0])
+    progresses = []
+    for seconds, percent in ((0.0, 10), (1.0, 14), (2.0, 12), (3.0, 18), (4.0, 16)):
+        now[0] = seconds
+        progress = tracker.feed(text_to_html(f"[ {percent}%] Building CXX object"))
+        assert progress
+        progresses.append(progress)
+    progress = progresses[-1]
+    # the fall from 18% to 16% is no progress
+    assert progress.completed == 18
+    assert progress.rate == 2.0
+    assert progress.eta == 41.0
+    assert len(tracker.history) == 4
+    # falling back towards the start is a new build
+    now[0] = 5.0
+    restarted = tracker.feed(text_to_html("[  2%] Building CXX object"))
+    assert restarted
+    assert restarted.completed == 2
+    assert restarted.rate is None
+    assert not tracker.history
+
+
+def test_format_duration() -> None:
+    """Test formatting durations."""
+    assert format_duration(5.4) == "5s"
+    assert format_duration(65) == "1m05s"
+    assert format_duration(3725) == "1h02m"
@@ -8,6 +8,7 @@ added complexity.
 
 from __future__ import annotations
 
+import json
 import logging
 import pathlib
 import typing
@@ -21,8 +22,6 @@ from cruizlib.interop.message import Success
 # pylint: disable=wrong-import-order
 import pytest
 
-import texceptions
-
 if typing.TYPE_CHECKING:
     from ttypes import MultiprocessReplyQueueFixture, RunWorkerFixture
 
@@ -35,15 +34,9 @@ LOGGER = logging.getLogger(__name__)
     [
         (None, None),
         ("options", {"shared": "True"}),
+        ("graph_structure_only", True),
     ],
 )
-# "'DepsGraph' object has no attribute 'build_time_nodes'" from v2.0.15
-@pytest.mark.xfail(
-    CONAN_VERSION_COMPONENTS >= (2, 0, 15),
-    reason="build_time_nodes removed in Conan 2.0.15",
-    raises=texceptions.FailedMessageTestError,
-    strict=True,
-)
 # pylint: disable=too-many-arguments, too-many-positional-arguments
 def test_conan_lock_create(
     multiprocess_reply_queue_fixture: MultiprocessReplyQueueFixture,
@@ -52,7 +45,9 @@ def test_conan_lock_create(
     conan_recipe: pathlib.Path,
     conan_local_cache: typing.Dict[str, str],
     arg: typing.Optional[str],
-    value: typing.Union[typing.Optional[str], typing.List[str], typing.Dict[str, str]],
+    value: typing.Union[
+        typing.Optional[str], bool, typing.List[str], typing.Dict[str, str]
+    ],
 ) -> None:
     """Test: running conan lock create."""
     worker = workers_api.lockcreate.invoke
@@ -65,6 +60,9 @@ def test_conan_lock_create(
         assert isinstance(value, dict)
         for key, val in value.items():
             params.add_option("test", key, val)
+    elif arg == "graph_structure_only":
+        assert isinstance(value, bool)
+        params.graph_structure_only = value
 
     reply_queue, replies, watcher_thread, context = multiprocess_reply_queue_fixture()
     run_worker(worker, reply_queue, params, watcher_thread, context)
@@ -74,15 +72,43 @@ def test_conan_lock_create(
     assert isinstance(replies[0].payload, DependencyGraph)
     assert len(replies[0].payload.nodes) == 1
     assert replies[0].payload.root.name == conan_recipe_name
+    if arg == "graph_structure_only":
+        # binaries were not analysed
+        assert not replies[0].payload.root.package_id
 
 
-# "'DepsGraph' object has no attribute 'build_time_nodes'" from v2.0.15
-@pytest.mark.xfail(
-    CONAN_VERSION_COMPONENTS >= (2, 0, 15),
-    reason="build_time_nodes removed in Conan 2.0.15",
-    raises=texceptions.FailedMessageTestError,
-    strict=True,
+@pytest.mark.skipif(
+    CONAN_VERSION_COMPONENTS < (2,), reason="lockfiles are only written by Conan 2"
 )
+def test_conan_lock_create_incomplete_lockfile(
+    multiprocess_reply_queue_fixture: MultiprocessReplyQueueFixture,
+    run_worker: RunWorkerFixture,
+    conan_recipe: pathlib.Path,
+    conan_local_cache: typing.Dict[str, str],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test: an incomplete lockfile is ignored, and replaced whole."""
+    lockfile = tmp_path / "locks" / "conan.lock"
+    lockfile.parent.mkdir()
+    lockfile.write_text('{"version": "0.5", "requi')
+    worker = workers_api.lockcreate.invoke
+    params = CommandParameters("lock create", worker)
+    params.added_environment = conan_local_cache
+    params.recipe_path = conan_recipe
+    params.cwd = conan_recipe.parent
+    params.profile = "default"
+    params.lockfile = lockfile
+    params.lockfile_out = lockfile
+
+    reply_queue, replies, watcher_thread, context = multiprocess_reply_queue_fixture()
+    run_worker(worker, reply_queue, params, watcher_thread, context)
+
+    assert replies
+    assert isinstance(replies[0], Success)
+    assert "requires" in json.loads(lockfile.read_text())
+    assert list(lockfile.parent.iterdir()) == [lockfile]
+
+
 def test_conan_lock_create_dependent_recipes(
     multiprocess_reply_queue_fixture: MultiprocessReplyQueueFixture,
     run_worker: RunWorkerFixture,
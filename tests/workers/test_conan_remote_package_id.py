@@ -83,3 +83,33 @@ def test_conan_remote_package_id_search(
         else:
             # I suspect Conan 2 trims empty lists as zlib has no dependencies
             pass
+
+
+@pytest.mark.xfail(
+    CONAN_VERSION_COMPONENTS == (1, 17, 1),
+    reason="Conan 1.17.1 cannot connect",
+    strict=True,
+)
+def test_conan_remote_package_id_search_with_query(
+    multiprocess_reply_queue_fixture: MultiprocessReplyQueueFixture,
+    run_worker: RunWorkerFixture,
+    conan_local_cache: typing.Dict[str, str],
+) -> None:
+    """Test: running conan remote package_id searches, filtered by a package query."""
+    worker = workers_api.packagedetails.invoke
+    params = PackageIdParameters(
+        reference="zlib/1.3.1#f52e03ae3d251dec704634230cd806a2",
+        remote_name="conancenter",
+        package_query='os="Linux" AND options.shared="True"',
+    )
+    params.added_environment = conan_local_cache
+    reply_queue, replies, watcher_thread, context = multiprocess_reply_queue_fixture()
+    run_worker(worker, reply_queue, params, watcher_thread, context)
+
+    assert replies
+    assert isinstance(replies[0], Success)
+    assert isinstance(replies[0].payload, list)
+    assert replies[0].payload
+    for package_id in replies[0].payload:
+        assert package_id["settings"]["os"] == "Linux"
+        assert package_id["options"]["shared"] == "True"
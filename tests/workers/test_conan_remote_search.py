@@ -9,12 +9,14 @@ added complexity.
 from __future__ import annotations
 
 import logging
+import queue
 import typing
 
 import cruizlib.workers.api as workers_api
 from cruizlib.globals import CONAN_MAJOR_VERSION, CONAN_VERSION_COMPONENTS
-from cruizlib.interop.message import Success
+from cruizlib.interop.message import Message, PartialSuccess, Success
 from cruizlib.interop.searchrecipesparameters import SearchRecipesParameters
+from cruizlib.workers.api.v2 import remotesearch
 
 # pylint: disable=wrong-import-order
 import pytest
@@ -105,3 +107,38 @@ def test_conan_remote_search_pkg_not_exists(
         else:
             assert exc_info.value.exception_type_name == "NotFoundException"
         assert str(exc_info.value).startswith("(\"Recipe 'doesnotexist' not found")
+
+
+@pytest.mark.parametrize(
+    "count,chunk_sizes",
+    [
+        (0, []),
+        (3, [3]),
+        (7, [3, 3, 1]),
+        (6, [3, 3]),
+    ],
+)
+def test_remote_search_chunks(
+    monkeypatch: pytest.MonkeyPatch, count: int, chunk_sizes: typing.List[int]
+) -> None:
+    """Test: package references found are sent in chunks, the last as the Success."""
+    monkeypatch.setattr(remotesearch, "SEARCH_CHUNK_SIZE", 3)
+    references = [f"pkg{index}/1.0" for index in range(count)]
+    reply_queue: queue.Queue[Message] = queue.Queue()
+    # abusing the type system, as the API used for queue.Queue is the same
+    # as for multiprocessing.Queue
+    remotesearch.put_in_chunks(reply_queue, references)  # type: ignore[arg-type]
+
+    replies = list(reply_queue.queue)
+    assert all(isinstance(reply, PartialSuccess) for reply in replies[:-1])
+    assert isinstance(replies[-1], Success)
+    if not count:
+        assert replies[-1].payload is None
+        return
+    assert [len(reply.payload) for reply in replies] == chunk_sizes
+    assert [
+        reference
+        for reply in replies
+        for reference, alias in reply.payload
+        if alias is None
+    ] == references
@@ -0,0 +1,166 @@
+"""Test extracting diagnostics from command output."""
+
+from __future__ import annotations
+
+import typing
+
+from cruizlib.commands.diagnostics import (
+    DiagnosticSeverity,
+    DiagnosticsExtractor,
+    parse_diagnostic,
+)
+from cruizlib.workers.utils.text2html import text_to_html
+
+# pylint: disable=wrong-import-order
+import pytest
+
+
+@pytest.mark.parametrize(
+    "line,severity,tool,file,line_number,column",
+    [
+        (
+            "src/main.cpp:12:5: error: 'foo' was not declared in this scope",
+            DiagnosticSeverity.ERROR,
+            "GCC/Clang",
+            "src/main.cpp",
+            12,
+            5,
+        ),
+        (
+            "/tmp/x.c:3: warning: implicit declaration of function 'bar'",
+            DiagnosticSeverity.WARNING,
+            "GCC/Clang",
+            "/tmp/x.c",
+            3,
+            None,
+        ),
+        (
+            "C:\\src\\main.cpp(12,5): error C2065: 'foo': undeclared identifier",
+            DiagnosticSeverity.ERROR,
+            "MSVC",
+            "C:\\src\\main.cpp",
+            12,
+            5,
+        ),
+        (
+            "main.obj : error LNK2019: unresolved external symbol foo",
+            DiagnosticSeverity.ERROR,
+            "Linker",
+            "main.obj",
+            None,
+            None,
+        ),
+        (
+            "main.cpp:(.text+0xa): undefined reference to `foo()'",
+            DiagnosticSeverity.ERROR,
+            "Linker",
+            "main.cpp",
+            None,
+            None,
+        ),
+        (
+            "/usr/bin/ld: cannot find -lfoo",
+            DiagnosticSeverity.ERROR,
+            "Linker",
+            None,
+            None,
+            None,
+        ),
+        (
+            "CMake Warning (dev) at CMakeLists.txt:4 (project):",
+            DiagnosticSeverity.WARNING,
+            "CMake",
+            "CMakeLists.txt",
+            4,
+            None,
+        ),
+    ],
+)
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def test_parse_diagnostic(
+    line: str,
+    severity: DiagnosticSeverity,
+    tool: str,
+    file: typing.Optional[str],
+    line_number: typing.Optional[int],
+    column: typing.Optional[int],
+) -> None:
+    """Test recognising diagnostics from different tools."""
+    diagnostic = parse_diagnostic(line)
+    assert diagnostic
+    assert diagnostic.severity == severity
+    assert diagnostic.tool == tool
+    assert diagnostic.file == file
+    assert diagnostic.line == line_number
+    assert diagnostic.column == column
+    assert diagnostic.text == line
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "-- Configuring done",
+        "[ 50%] Building CXX object CMakeFiles/foo.dir/error.cpp.o",
+        "/usr/bin/ld: main.o: in function `main':",
+    ],
+)
+def test_parse_not_diagnostic(line: str) -> None:
+    """Test that ordinary output is not mistaken for diagnostics."""
+    assert parse_diagnostic(line) is None
+
+
+def test_extractor_from_html() -> None:
+    """Test extracting diagnostics from HTML lines, including multi-line CMake."""
+    extractor = DiagnosticsExtractor()
+    assert not extractor.feed(text_to_html("-- The CXX compiler"), False)
+    assert not extractor.feed(
+        "<font color='red'>"
+        + text_to_html("CMake Error at CMakeLists.txt:12 (find_package):")
+        + "</font>",
+        True,
+    )
+    assert not extractor.feed(text_to_html("  Could not find zlib"), True)
+    assert not extractor.feed(text_to_html("  in the path"), True)
+    found = extractor.feed(text_to_html("a.c:1:2: warning: unused <int> x"), False)
+    assert len(found) == 2
+    assert found[0].tool == "CMake"
+    assert found[0].message == "Could not find zlib in the path"
+    assert found[0].is_stderr
+    assert found[1].message == "unused <int> x"
+    assert not found[1].is_stderr
+    assert not extractor.flush()
+
+
+def test_extractor_multiple_paragraph_cmake() -> None:
+    """Test that a CMake message continues across blank lines and its call stack."""
+    extractor = DiagnosticsExtractor()
+    lines = [
+        "CMake Error at cmake/deps.cmake:7 (find_package):",
+        "  By not providing FindZLIB.cmake this project asked CMake",
+        "",
+        "  Could not find a package configuration file provided by ZLIB",
+        "Call Stack (most recent call first):",
+        "  CMakeLists.txt:3 (include)",
+        "",
+        "",
+    ]
+    for line in lines:
+        assert not extractor.feed(text_to_html(line), True)
+    found = extractor.feed(text_to_html("-- Configuring incomplete"), False)
+    assert len(found) == 1
+    assert found[0].file == "cmake/deps.cmake"
+    assert found[0].line == 7
+    assert found[0].message == (
+        "By not providing FindZLIB.cmake this project asked CMake "
+        "Could not find a package configuration file provided by ZLIB "
+        "Call Stack (most recent call first): CMakeLists.txt:3 (include)"
+    )
+    assert not extractor.flush()
+
+    # the end of output completes the message too
+    assert not extractor.feed(text_to_html("CMake Warning:"), False)
+    assert not extractor.feed(text_to_html(""), False)
+    assert not extractor.feed(text_to_html("  Manually-specified variables"), False)
+    found = extractor.flush()
+    assert len(found) == 1
+    assert found[0].message == "Manually-specified variables"
@@ -72,6 +72,35 @@ def test_message_reply_processor_success(
     assert replies[0] == "This was a success!"
 
 
+def test_message_reply_processor_partial_success(
+    messagereplyprocessor_fixture: MessageReplyProcessorFixture,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Exercise partially Successful replies in the message reply processor."""
+    caplog.set_level(logging.INFO)
+    worker = workers_api.partialsuccesstest.invoke
+    reply_queue, replies, watcher_thread, processor, context = (
+        messagereplyprocessor_fixture()
+    )
+    partial_replies: typing.List[typing.Any] = []
+    processor.partial_result.connect(partial_replies.append)
+
+    process = context.Process(target=worker, args=(reply_queue,))
+    process.start()
+    process.join()
+
+    processor.stop()
+
+    watcher_thread.wait(5)
+    if not watcher_thread.isFinished():
+        raise texceptions.WatcherThreadTimeoutError()
+
+    assert partial_replies == ["This was a partial success!"]
+    assert len(replies) == 1
+    assert isinstance(replies[0], str)
+    assert replies[0] == "This was a success!"
+
+
 @pytest.mark.parametrize("html", [None, "<p>A failure</p>"])
 def test_message_reply_processor_failure(
     messagereplyprocessor_fixture: MessageReplyProcessorFixture,